@@ -1,3 +1,9 @@
+import ast
+import json
+from collections.abc import Mapping
+from functools import lru_cache
+from keyword import iskeyword
+
 names_of_dimensions = (
     'luminous_intensity',
     'time',
@@ -22,3 +28,102 @@ def find_matching_parenthesis(string, index, delimiters=None):
             if depth == 0:
                 return k
     return -1
+
+
+def split_quantities_string(quantities_string):
+    # Legacy form "('q_1','dimension_1') ... ('q_n','dimension_n')", each tuple is
+    # read as a python literal, i.e. without evaluating any code. As before, text
+    # between and around the tuples is ignored, e.g. separators such as "," or ";"
+    # and the brackets of a python list "[('q_1','dimension_1'), ...]"
+    quantities = []
+    index = quantities_string.find("(")
+    while index > -1:
+        index_match = find_matching_parenthesis(quantities_string, index)
+        if index_match < 0:
+            raise ValueError("Unmatched parenthesis in quantities")
+        quantity = ast.literal_eval(quantities_string[index:index_match+1])
+        if not isinstance(quantity, tuple) or len(quantity) != 2:
+            raise ValueError("Each quantity must be a pair of a name and a dimension")
+        quantities.append(quantity)
+        quantities_string = quantities_string[index_match+1:]
+        index = quantities_string.find("(")
+    return quantities
+
+
+def quantities_to_pairs(quantities):
+    # Structured form, either {name: dimension, ...} or a list where each
+    # entry is a pair [name, dimension] or a dictionary {"name": name, "dimension": dimension}
+    if isinstance(quantities, Mapping):
+        return list(quantities.items())
+    if not isinstance(quantities, (list, tuple)):
+        raise ValueError("Quantities must be given as a string, a list or a dictionary")
+    pairs = []
+    for quantity in quantities:
+        if isinstance(quantity, Mapping):
+            if set(quantity.keys()) != {"name", "dimension"}:
+                raise ValueError("Each quantity must have a name and a dimension")
+            quantity = (quantity["name"], quantity["dimension"])
+        if not isinstance(quantity, (list, tuple)) or len(quantity) != 2:
+            raise ValueError("Each quantity must be a pair of a name and a dimension")
+        pairs.append(tuple(quantity))
+    return pairs
+
+
+def validate_quantities(pairs):
+    names = set()
+    for (name, dimension) in pairs:
+        if not isinstance(name, str) or not name.isidentifier() or iskeyword(name):
+            raise ValueError(f"Invalid quantity name {name!r}")
+        if name in names:
+            raise ValueError(f"Quantity {name} is defined more than once")
+        names.add(name)
+        if not isinstance(dimension, str) or len(dimension.strip()) == 0:
+            raise ValueError(f"Invalid dimension for quantity {name}")
+    return tuple((name, dimension) for (name, dimension) in pairs)
+
+
+@lru_cache(maxsize=256)
+def split_quantities_text(quantities_string):
+    stripped = quantities_string.strip()
+    if stripped.startswith("[") or stripped.startswith("{"):
+        try:
+            return validate_quantities(quantities_to_pairs(json.loads(stripped)))
+        except json.JSONDecodeError:
+            # Legacy tuples in a python list, e.g. "[('q_1','dimension_1'), ...]"
+            if "(" not in stripped:
+                raise
+    return validate_quantities(split_quantities_string(quantities_string))
+
+
+def split_quantities(quantities):
+    '''
+    Input:
+        quantities : one of
+                     - a string of the form "('q_1','dimension_1') ... ('q_n','dimension_n')"
+                     - a list of pairs [name, dimension] or of dictionaries {"name": name, "dimension": dimension}
+                     - a dictionary {name: dimension, ...}
+                     - a string with a JSON encoded list or dictionary of the forms above
+    Output:
+        Tuple of pairs of strings (name, dimension) as written in the input.
+        Raises ValueError if the quantities are not written in one of the
+        expected forms, if a name is not a valid symbol name or is repeated,
+        or if a dimension is empty.
+    Remark:
+        Strings are never evaluated as code, and the result for each
+        string is cached.
+    '''
+    if isinstance(quantities, str):
+        return split_quantities_text(quantities)
+    return validate_quantities(quantities_to_pairs(quantities))
+
+
+def has_quantities(quantities):
+    '''
+    Returns True if quantities (in any of the forms accepted by
+    `split_quantities`) is not empty or blank.
+    '''
+    if quantities is None:
+        return False
+    if isinstance(quantities, str):
+        return len(quantities.strip()) > 0
+    return len(quantities) > 0
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    '''
+    Size-bounded mapping that evicts the least recently used entry when full.
+    Keeps count of hits, misses and evictions, access is guarded by a lock so
+    that the cache can be shared between threads.
+    '''
+
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_create(self, key, create):
+        '''
+        Returns the value stored for key, if there is no such value it is created
+        by calling `create()` and stored. Note that `create` is called without
+        holding the lock, so if it raises an exception nothing is stored.
+        '''
+        sentinel = _missing
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = create()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def statistics(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+_missing = object()
+
+
+def fingerprint(*values):
+    '''
+    Input:
+        values : JSON-like data, e.g. the answer and params given to the evaluation function
+    Output:
+        A string that only depends on the content of the input, dictionaries
+        are compared independently of key order.
+    '''
+    serialised = json.dumps(values, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
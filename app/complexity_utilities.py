@@ -0,0 +1,190 @@
+import re
+import signal
+import threading
+import time
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+
+# Limits for responses, None means that there is no limit. The size limits are
+# checked before the response is parsed, the time limits while it is evaluated.
+default_complexity_limits = {
+    "tokens": 1000,         # number of tokens in the response
+    "depth": 50,            # nesting depth of parentheses in a group
+    "exponent": 100,        # magnitude of numerical exponents
+    "terms": 20,            # number of terms in a group
+    "simplify_time": 5,     # seconds spent parsing and simplifying a group with sympy
+}
+
+complexity_token_re = re.compile(r"\s*(?:(?P<number>\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)|(?P<name>[^\W\d]\w*)|(?P<operator>\*\*|\S))")
+
+# An estimate of how expensive a string is to parse and simplify
+Complexity = namedtuple("Complexity", ["tokens", "depth", "exponent", "terms"])
+
+
+def power_magnitude(base, exponent):
+    try:
+        return base**exponent
+    except OverflowError:
+        return float("inf")
+
+
+def estimate_complexity(expr):
+    '''
+    Input:
+        expr : string for a single group
+    Output:
+        Complexity with the number of tokens, the largest nesting depth of
+        parentheses, the largest magnitude of a numerical exponent and the
+        number of terms (i.e. one more than the number of binary + and -).
+    Remarks:
+        Only tokenizes the string, so it is cheap compared to parsing it.
+        The magnitude of chained numerical exponents, e.g. 9**9**9, is the value
+        of the whole chain.
+    '''
+    tokens = [(match.lastgroup, match.group(match.lastgroup)) for match in complexity_token_re.finditer(expr) if match.lastgroup is not None]
+    depth = 0
+    max_depth = 0
+    terms = 1
+    for (k, (kind, value)) in enumerate(tokens):
+        if value in "([{" and kind == "operator":
+            depth += 1
+            max_depth = max(max_depth, depth)
+        elif value in ")]}" and kind == "operator":
+            depth = max(0, depth-1)
+        elif value in "+-" and kind == "operator" and k > 0:
+            previous_kind, previous_value = tokens[k-1]
+            if previous_kind != "operator" or previous_value in ")]}":
+                terms += 1
+
+    if "**" not in expr and "^" not in expr:
+        # No exponents
+        return Complexity(len(tokens), max_depth, 0, terms)
+
+    # Magnitudes of numbers, where a number that is raised to a number has the value of the power
+    magnitudes = {}
+    for k in reversed(range(len(tokens))):
+        kind, value = tokens[k]
+        if kind != "number":
+            continue
+        magnitude = abs(float(value))
+        if k+2 < len(tokens) and tokens[k+1][1] in ("**", "^") and (k+2) in magnitudes:
+            magnitude = power_magnitude(magnitude, magnitudes[k+2])
+        magnitudes[k] = magnitude
+
+    # Numerical exponents, possibly with signs and in parentheses, e.g. x**(-3)
+    max_exponent = 0
+    for (k, (kind, value)) in enumerate(tokens):
+        if value not in ("**", "^"):
+            continue
+        j = k+1
+        while j < len(tokens) and tokens[j][1] in ("(", "-", "+"):
+            j += 1
+        if j in magnitudes:
+            max_exponent = max(max_exponent, magnitudes[j])
+
+    return Complexity(len(tokens), max_depth, max_exponent, terms)
+
+
+def get_complexity_limits(params):
+    '''
+    Returns `default_complexity_limits` updated with the limits given
+    in the `complexity_limits` parameter.
+    '''
+    limits = dict(default_complexity_limits)
+    limits.update(params.get("complexity_limits", {}))
+    return limits
+
+
+def exceeded_complexity_limit(expr_strings, limits):
+    '''
+    Input:
+        expr_strings : list of strings, one for each group
+        limits       : dictionary with limits, see `default_complexity_limits`
+    Output:
+        The name of the first size limit that is exceeded, or None if the
+        groups are within all limits.
+    '''
+    tokens = 0
+    for expr in expr_strings:
+        complexity = estimate_complexity(expr)
+        tokens += complexity.tokens
+        for name in ["depth", "exponent", "terms"]:
+            if limits[name] is not None and getattr(complexity, name) > limits[name]:
+                return name
+    if limits["tokens"] is not None and tokens > limits["tokens"]:
+        return "tokens"
+    return None
+
+
+class ComplexityLimitExceeded(BaseException):
+    # Not an Exception subclass since sympy catches and ignores those in places
+    pass
+
+
+# Number of time limits enforced with a signal and by checking the deadline between stages respectively
+time_limit_statistics = Counter(signal=0, deadline=0)
+
+
+class Deadline:
+    '''
+    Yielded by `time_limit`. `check` raises the exception of the time limit if the
+    deadline has passed, so that a with block that cannot be interrupted by a
+    signal can stop between stages.
+    '''
+
+    __slots__ = ("deadline", "exception", "interrupts")
+
+    def __init__(self, seconds, exception, interrupts):
+        self.deadline = None if seconds is None else time.monotonic()+seconds
+        self.exception = exception
+        # True if the with block is interrupted when the time runs out
+        self.interrupts = interrupts
+
+    def check(self):
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise self.exception()
+
+
+@contextmanager
+def time_limit(seconds, exception=ComplexityLimitExceeded):
+    '''
+    Raises the given exception if the with block takes more than the given number
+    of seconds, does nothing if seconds is None. Yields a Deadline.
+    Remarks:
+        Signals are only delivered to the main thread, in other threads the with
+        block is not interrupted and the limit only applies where the block calls
+        `check` on the Deadline. These limits are counted in `time_limit_statistics`.
+        Time limits can be nested, an enclosing limit that runs out first
+        raises its own exception.
+    '''
+    if seconds is None:
+        yield Deadline(None, exception, False)
+        return
+    if threading.current_thread() is not threading.main_thread():
+        time_limit_statistics["deadline"] += 1
+        yield Deadline(seconds, exception, False)
+        return
+    time_limit_statistics["signal"] += 1
+    start = time.monotonic()
+    deadline = start+seconds
+    enclosing_remaining, _ = signal.getitimer(signal.ITIMER_REAL)
+
+    def raise_timeout(signum, frame):
+        # Allow for timers that fire marginally early
+        if time.monotonic() >= deadline-1e-3 or not callable(enclosing_handler):
+            raise exception()
+        enclosing_handler(signum, frame)
+
+    enclosing_handler = signal.signal(signal.SIGALRM, raise_timeout)
+    if enclosing_remaining > 0:
+        signal.setitimer(signal.ITIMER_REAL, min(seconds, enclosing_remaining))
+    else:
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield Deadline(seconds, exception, True)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, enclosing_handler)
+        if enclosing_remaining > 0:
+            # Restart the enclosing timer with the time it has left
+            signal.setitimer(signal.ITIMER_REAL, max(enclosing_remaining-(time.monotonic()-start), 1e-6))
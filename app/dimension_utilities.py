@@ -0,0 +1,158 @@
+from types import MappingProxyType
+
+from .buckingham_pi_utilities import names_of_dimensions
+from .group_utilities import get_power_product_exponents
+from .matrix_utilities import to_fraction
+
+dimension_index = {name: index for (index, name) in enumerate(names_of_dimensions)}
+
+
+def exact_exponent(value):
+    '''
+    Returns value as an int if it is an integer and as a Fraction if it is
+    another rational number (python or sympy), otherwise returns None.
+    Remarks:
+        Most exponents are integers and arithmetic with int is much faster than with Fraction.
+    '''
+    if isinstance(value, int):
+        return value
+    value = to_fraction(value)
+    if value is None:
+        return None
+    if value.denominator == 1:
+        return value.numerator
+    return value
+
+
+class Dimension:
+    '''
+    Dimension written as the exponents (int or Fraction) of the SI base dimensions, in the
+    same order as `names_of_dimensions`, e.g. the dimension of a velocity is
+    Dimension(length=1, time=-1).
+    Remarks:
+        Dimensions are immutable and can be multiplied, divided and raised to
+        rational powers. Two dimensions are equal if all exponents are equal.
+    '''
+
+    __slots__ = ("exponents",)
+
+    def __init__(self, exponents=None, **named_exponents):
+        if exponents is None:
+            exponents = [0]*len(names_of_dimensions)
+        else:
+            exponents = list(exponents)
+            if len(exponents) != len(names_of_dimensions):
+                raise ValueError(f"A dimension has {len(names_of_dimensions)} exponents, got {len(exponents)}.")
+        for (name, exponent) in named_exponents.items():
+            if name not in dimension_index:
+                raise ValueError(f"Unknown dimension `{name}`.")
+            exponents[dimension_index[name]] += exponent
+        exact_exponents = tuple(exact_exponent(exponent) for exponent in exponents)
+        if None in exact_exponents:
+            raise ValueError("Exponents of dimensions must be rational numbers.")
+        object.__setattr__(self, "exponents", exact_exponents)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Dimension objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Dimension objects are immutable")
+
+    def __mul__(self, other):
+        if not isinstance(other, Dimension):
+            return NotImplemented
+        return Dimension([a+b for (a, b) in zip(self.exponents, other.exponents)])
+
+    def __truediv__(self, other):
+        if not isinstance(other, Dimension):
+            return NotImplemented
+        return Dimension([a-b for (a, b) in zip(self.exponents, other.exponents)])
+
+    def __pow__(self, exponent):
+        exponent = exact_exponent(exponent)
+        if exponent is None:
+            return NotImplemented
+        return Dimension([a*exponent for a in self.exponents])
+
+    def __eq__(self, other):
+        if not isinstance(other, Dimension):
+            return NotImplemented
+        return self.exponents == other.exponents
+
+    def __hash__(self):
+        return hash(self.exponents)
+
+    def __repr__(self):
+        exponents = ", ".join(f"{name}={exponent}" for (name, exponent) in zip(names_of_dimensions, self.exponents) if exponent != 0)
+        return "Dimension("+exponents+")"
+
+    @property
+    def is_dimensionless(self):
+        return not any(self.exponents)
+
+
+dimensionless = Dimension()
+
+
+def dimension_from_expression(expression):
+    '''
+    Input:
+        expression : sympy expression for a dimension, e.g. length/time**2
+    Output:
+        The corresponding Dimension, or None if the expression is not a power
+        product of the SI base dimensions.
+    Remarks:
+        Constant factors, e.g. from converting kilometres to metres, are ignored.
+    '''
+    exponents = get_power_product_exponents(expression)
+    if exponents is None:
+        return None
+    dimension = [0]*len(names_of_dimensions)
+    for (symbol, exponent) in exponents.items():
+        index = dimension_index.get(symbol.name, None)
+        exponent = exact_exponent(exponent)
+        if index is None or exponent is None:
+            return None
+        dimension[index] += exponent
+    return Dimension(dimension)
+
+
+def create_dimension_table(quantities):
+    '''
+    Input:
+        quantities : list of pairs of sympy expressions (symbol, dimension)
+    Output:
+        Read-only dictionary from each symbol to its Dimension, or None if some
+        dimension is not a power product of the SI base dimensions.
+    '''
+    table = {}
+    for (symbol, expression) in quantities:
+        dimension = dimension_from_expression(expression)
+        if dimension is None:
+            return None
+        table[symbol] = dimension
+    return MappingProxyType(table)
+
+
+def group_dimension(exponents, dimension_table):
+    '''
+    Input:
+        exponents       : dictionary with the exponent of each symbol in a power
+                          product, see `get_power_product_exponents`
+        dimension_table : dictionary from symbols to Dimension
+    Output:
+        The Dimension of the power product, or None if some symbol in the power
+        product has no dimension in the table.
+    Remarks:
+        Each exponent of the result is the dot product of the exponents of the
+        power product with the corresponding exponents of the quantities.
+    '''
+    result = [0]*len(names_of_dimensions)
+    for (symbol, exponent) in exponents.items():
+        dimension = dimension_table.get(symbol, None)
+        exponent = exact_exponent(exponent)
+        if dimension is None or exponent is None:
+            return None
+        for (index, dimension_exponent) in enumerate(dimension.exponents):
+            result[index] += exponent*dimension_exponent
+    return Dimension(result)
@@ -1,10 +1,19 @@
-from typing import Any, TypedDict
-from sympy import latex, Matrix, Integer, Add, posify, prod
-
-from .buckingham_pi_utilities import names_of_dimensions, find_matching_parenthesis
-from .static_unit_conversion_arrays import convert_SI_base_units_to_dimensions
-from .expression_utilities import preprocess_expression, parse_expression, create_sympy_parsing_params, substitute
-from .preview import preview_function
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any, List, TypedDict
+from sympy import latex, Matrix, Integer, Rational, Add, prod
+
+from .buckingham_pi_utilities import names_of_dimensions, split_quantities, has_quantities
+from .unit_tables import convert_units_to_dimensions
+from .cache_utilities import LRUCache, fingerprint
+from .dimension_utilities import create_dimension_table, group_dimension
+from .complexity_utilities import ComplexityLimitExceeded, exceeded_complexity_limit, get_complexity_limits
+from .instrumentation import create_instrumentation, null_instrumentation, publish
+from .matrix_utilities import matrix_rank, create_row_space, integer_rows, integer_nullspace, reduced_row_echelon_form
+from .parameter_utilities import get_flag, get_task_parameters
+from .expression_utilities import preprocess_expression, parse_expression, create_sympy_parsing_params
+from .group_utilities import get_power_product_exponents, normalize_group, parsing_params_fingerprint
+from .preview import preview_function, prewarm_latex_parser
 
 
 class Params(TypedDict):
@@ -26,6 +35,7 @@ internal_feedback_messages = {
 default_parsing_feedback_messages = {
     "PARSE_ERROR_WARNING": lambda x: f"`{x}` could not be parsed as a valid mathematical expression. Ensure that correct notation is used, that the expression is unambiguous and that all parentheses are closed.",
     "STRICT_SYNTAX_EXPONENTIATION": "Note that `^` cannot be used to denote exponentiation, use `**` instead.",
+    "RESPONSE_TOO_COMPLEX": "The response is too complex to be evaluated. Write it as a comma-separated list of groups of the form "+r"$q_1^{c_1} q_2^{c_2}\ldots q_n^{c_n}$.",
 }
 
 
@@ -44,7 +54,19 @@ def convert_to_latex(expr):
     if isinstance(expr, str):
         return expr
     else:
-        return "$"+latex(expr)+"$"
+        return "$"+render_latex(expr)+"$"
+
+
+# LaTeX for expressions in responses and feedback, keyed by the type and the expression
+# since e.g. the numbers 2 and 2.0 are equal in sympy but are printed differently
+latex_cache = LRUCache(maxsize=4096)
+
+
+def render_latex(expr):
+    '''
+    Returns `latex(expr)`, each expression is only printed once while it is in `latex_cache`.
+    '''
+    return latex_cache.get_or_create((type(expr), expr), lambda: latex(expr))
 
 
 default_buckingham_pi_feedback_messages = {
@@ -59,6 +81,7 @@ default_buckingham_pi_feedback_messages = {
 
 line_break = "<br>"
 
+
 def create_result_from_feedback_data(is_correct, response_latex=None, feedback_data=None, custom_feedback=None):
     """
     NOTE: It is assumed that the feedback_data input is in the form
@@ -96,36 +119,62 @@ def create_result_from_feedback_data(is_correct, response_latex=None, feedback_d
         feedback=line_break.join(feedback_string_list)
     )
 
-def get_exponent_matrix(expressions, symbols):
-    exponents_list = []
-    for expression in expressions:
-        exponents = []
-        for symbol in symbols:
-            exponent = expression.as_coeff_exponent(symbol)[1].simplify()
-            if exponent == 0:
-                exponent = -expression.subs(symbol, 1/symbol).as_coeff_exponent(symbol)[1]
-            exponents.append(exponent)
-        exponents_list.append(exponents)
-    return Matrix(exponents_list)
+def get_exponent_row(expression, symbols, exponents=None):
+    if exponents is None:
+        exponents = get_power_product_exponents(expression)
+    if exponents is not None:
+        return [exponents.get(symbol, Integer(0)) for symbol in symbols]
+    # Expression is not a power product, fall back on finding exponents symbol by symbol
+    row = []
+    for symbol in symbols:
+        exponent = expression.as_coeff_exponent(symbol)[1].simplify()
+        if exponent == 0:
+            exponent = -expression.subs(symbol, 1/symbol).as_coeff_exponent(symbol)[1]
+        row.append(exponent)
+    return row
+
+
+def get_exponent_matrix(expressions, symbols, known_exponents=None):
+    '''
+    Returns the matrix where each row contains the exponents of the given symbols in one of
+    the expressions. Exponents of power products that have already been computed, e.g. by
+    `normalize_group`, can be given as a dictionary known_exponents from expressions to exponents.
+    '''
+    symbols = list(symbols)
+    if known_exponents is None:
+        known_exponents = {}
+    return Matrix([get_exponent_row(expression, symbols, known_exponents.get(expression, None)) for expression in expressions])
 
 
 def create_power_product(exponents, symbols):
     return prod([s**i for (s, i) in zip(symbols, exponents)])
 
 
-def determine_validity(reference_set, reference_symbols, reference_original_number_of_groups, candidate_set, candidate_symbols, candidate_original_number_of_groups, feedback_messages):
+def determine_validity(reference_set, reference_symbols, reference_original_number_of_groups, candidate_set, candidate_symbols, candidate_original_number_of_groups, feedback_messages, instrumentation=null_instrumentation, known_exponents=None):
     '''
     Analyses if the given candidate set satisfies the Buckingham Pi theorem assuming that the given reference set does.
     '''
-    symbols = set(reference_symbols).union(set(candidate_symbols))
-    R = get_exponent_matrix(reference_set, symbols)
-    C = get_exponent_matrix(candidate_set, symbols)
-    D = R.col_join(C)
+    # Sorted so that the matrices, and the groups in the feedback, do not depend on the order of a set
+    symbols = sorted(set(reference_symbols).union(set(candidate_symbols)), key=str)
+    with instrumentation.stage("exponent_matrix"):
+        R = get_exponent_matrix(reference_set, symbols, known_exponents)
+        C = get_exponent_matrix(candidate_set, symbols, known_exponents)
+    instrumentation.metric("reference_matrix_shape", [R.rows, R.cols])
+    instrumentation.metric("candidate_matrix_shape", [C.rows, C.cols])
     feedback = []
     more_groups_than_reference_set = reference_original_number_of_groups < candidate_original_number_of_groups
-    candidate_groups_independent = C.rank() == candidate_original_number_of_groups
-    rank_R_equal_to_rank_D = R.rank() == D.rank()
-    rank_C_equal_to_rank_D = C.rank() == D.rank()
+    with instrumentation.stage("rank"):
+        # The reference set is reduced once and then reused for all comparisons with the candidate set
+        reference_space = create_row_space(R.tolist())
+        combined_space = reference_space.copy()
+        for row in C.tolist():
+            combined_space.add(row)
+        rank_R = reference_space.rank
+        rank_C = matrix_rank(C)
+        rank_D = combined_space.rank
+    candidate_groups_independent = rank_C == candidate_original_number_of_groups
+    rank_R_equal_to_rank_D = rank_R == rank_D
+    rank_C_equal_to_rank_D = rank_C == rank_D
     if candidate_symbols.issubset(reference_symbols):
         valid = not more_groups_than_reference_set
         if more_groups_than_reference_set:
@@ -140,7 +189,7 @@ def determine_validity(reference_set, reference_symbols, reference_original_numb
             feedback.append(
                 (
                     "CANDIDATE_GROUPS_NOT_INDEPENDENT",
-                    feedback_messages["CANDIDATE_GROUPS_NOT_INDEPENDENT"](C.rank(), len(candidate_set))
+                    feedback_messages["CANDIDATE_GROUPS_NOT_INDEPENDENT"](rank_C, len(candidate_set))
                 )
             )
         if rank_R_equal_to_rank_D:
@@ -156,53 +205,125 @@ def determine_validity(reference_set, reference_symbols, reference_original_numb
                 feedback.append(
                     (
                         "TOO_FEW_INDEPENDENT_GROUPS",
-                        feedback_messages["TOO_FEW_INDEPENDENT_GROUPS"]("Response", C.rank(), D.rank())
+                        feedback_messages["TOO_FEW_INDEPENDENT_GROUPS"]("Response", rank_C, rank_D)
                     )
                 )
         else:
             valid = False
-            if len(candidate_set) == 1:
-                dimensionless_groups = candidate_set
-            else:
-                dimensionless_groups = set()
-                for i in range(len(candidate_set)):
-                    exponents = C.row(i)
-                    Di = R.col_join(exponents)
-                    if R.rank() != Di.rank():
-                        dimensionless_groups.add(create_power_product(exponents, symbols))
-            feedback.append(
-                (
-                    "NOT_DIMENSIONLESS",
-                    feedback_messages["NOT_DIMENSIONLESS"](dimensionless_groups)
+            with instrumentation.stage("not_dimensionless_feedback"):
+                if len(candidate_set) == 1:
+                    dimensionless_groups = candidate_set
+                else:
+                    dimensionless_groups = set()
+                    for exponents in C.tolist():
+                        if not reference_space.contains(exponents):
+                            dimensionless_groups.add(create_power_product(exponents, symbols))
+                feedback.append(
+                    (
+                        "NOT_DIMENSIONLESS",
+                        feedback_messages["NOT_DIMENSIONLESS"](sorted(dimensionless_groups, key=str))
+                    )
                 )
-            )
     else:
         feedback.append(
             (
                 "UNKNOWN_SYMBOL",
-                feedback_messages["UNKNOWN_SYMBOL"](candidate_symbols.difference(reference_symbols))
+                feedback_messages["UNKNOWN_SYMBOL"](sorted(candidate_symbols.difference(reference_symbols), key=str))
             )
         )
         valid = False
     return valid, feedback
 
 
-def evaluation_function(response: Any, answer: Any, params: Params) -> Result:
-    """
-    Function used to evaluate a student response.
-    ---
-    The handler function passes three arguments to evaluation_function():
+def canonical_response_form(response_groups, response_original_number_of_groups, known_exponents):
+    '''
+    Input:
+        response_groups                    : list of sympy expressions, one for each group (sums split into terms)
+        response_original_number_of_groups : number of comma-separated groups in the response
+        known_exponents                    : dictionary from expressions to exponents, see `get_exponent_matrix`
+    Output:
+        Tuple with the names of the symbols in sorted order, the reduced row echelon
+        form of the exponent matrix with columns in that order, the number of
+        comma-separated groups and the number of distinct groups. Returns None if
+        some group is not a power product with rational exponents.
+    Remarks:
+        Everything that the verdict and the feedback from `determine_validity` depend on,
+        except the groups written in NOT_DIMENSIONLESS feedback, is determined by the
+        canonical form. Responses with the groups reordered, inverted, multiplied by
+        constants or raised to (nonzero) powers have the same canonical form.
+    '''
+    symbols = set()
+    group_exponents = []
+    for group in response_groups:
+        exponents = known_exponents.get(group, None)
+        if exponents is None:
+            exponents = get_power_product_exponents(group)
+        if exponents is None:
+            return None
+        group_exponents.append(exponents)
+        symbols.update(group.free_symbols)
+    symbols = sorted(symbols, key=str)
+    reduced = reduced_row_echelon_form([[exponents.get(symbol, 0) for symbol in symbols] for exponents in group_exponents])
+    if reduced is None:
+        return None
+    return (tuple(str(symbol) for symbol in symbols), reduced, response_original_number_of_groups, len(set(response_groups)))
+
+
+# Verdicts and feedback for responses, keyed by the task fingerprint and the canonical form of the response
+validity_cache = LRUCache(maxsize=4096)
+
+
+def determine_response_validity(task, response_groups, response_symbols, response_original_number_of_groups, known_exponents, instrumentation=null_instrumentation):
+    '''
+    Returns whether the response groups are a valid set of groups for the task, and
+    a list of (tag, feedback string) pairs, see `determine_validity`. Responses with
+    the same canonical form (see `canonical_response_form`) share one result from
+    `validity_cache` unless the feedback lists groups that are not dimensionless.
+    '''
+    with instrumentation.stage("canonical_form"):
+        canonical_form = canonical_response_form(response_groups, response_original_number_of_groups, known_exponents)
+    if canonical_form is not None:
+        key = (task.fingerprint, canonical_form)
+        cached = validity_cache.get(key, None)
+        if cached is not None:
+            instrumentation.metric("reused_validity", True)
+            is_correct, feedback = cached
+            return is_correct, list(feedback)
 
-    - `response` which are the answers provided by the student.
-    - `answer` which are the correct answers to compare against.
-    - `params` which are any extra parameters that may be useful,
-        e.g., error tolerances.
-    """
+    # Checking if the given response is a valid set of groups
+    answer_symbols = sorted(task.answer_symbols, key=str)
+    is_correct, feedback = determine_validity(
+        set(task.answer_groups),
+        set(answer_symbols),
+        task.answer_original_number_of_groups,
+        set(response_groups),
+        set(response_symbols),
+        response_original_number_of_groups,
+        task.feedback_messages,
+        instrumentation,
+        known_exponents
+    )
+
+    # Check the special case where one groups expression contains several power products
+    with instrumentation.stage("exponent_matrix"):
+        response_matrix = get_exponent_matrix(response_groups, answer_symbols, known_exponents)
+    with instrumentation.stage("rank"):
+        response_rank = matrix_rank(response_matrix)
+    if response_rank > response_original_number_of_groups:
+        is_correct = False
+        feedback.append(
+            (
+                "SUM_WITH_INDEPENDENT_TERMS",
+                task.feedback_messages["SUM_WITH_INDEPENDENT_TERMS"]("response")
+            )
+        )
+
+    if canonical_form is not None and all(tag != "NOT_DIMENSIONLESS" for (tag, string) in feedback):
+        validity_cache.put(key, (is_correct, tuple(feedback)))
+    return is_correct, feedback
 
-    """
-    Function that provides some basic dimensional analysis functionality.
-    """
 
+def create_feedback_messages(params):
     # Utility function that wraps a string in a function that takes an
     # arbitrary number of arguments
     def wrap_feedback_function(output):
@@ -225,7 +346,10 @@ def evaluation_function(response: Any, answer: Any, params: Params) -> Result:
                     feedback_messages[key] = wrap_feedback_function(custom_feedback[key])
                 else:
                     raise Exception("Cannot handle given custom feedback for "+key)
+    return feedback_messages
 
+
+def create_custom_feedback_data(params):
     # Transforming the `custom_feedback` and `custom_feedback_combinations`
     # parameters into the format expected by`create_result_from_feedback_data`
     custom_feedback = params.get("custom_feedback", {})
@@ -237,72 +361,281 @@ def evaluation_function(response: Any, answer: Any, params: Params) -> Result:
     def custom_feedback_data_sort(e):
         return len(e[0]) # Sort by number of elements in tag set
     custom_feedback_data.sort(reverse=True, key=custom_feedback_data_sort)
+    return custom_feedback_data
 
-    # Uses the preview function to translate latex input to  a
-    # sympy compatible representation
-    if params.get("is_latex", False):
-        response = preview_function(response, params)["preview"]["sympy"]
 
-    # Set default parameters if not already set
-    parameters = {"comparison": "expression", "strict_syntax": True}
-    parameters.update(params)
+@lru_cache(maxsize=256)
+def convert_quantities_to_dimensions(quantities):
+    return tuple((name, convert_units_to_dimensions(dimension)) for (name, dimension) in quantities)
 
-    # Create feedback_data list used to keep track of added feedback
-    feedback_data = []
 
-    # Raise exceptions when answer or response is missing from input
-    if not isinstance(answer, str):
-        raise Exception(feedback=internal_feedback_messages["NO_ANSWER"])
-    if not isinstance(response, str):
-        feedback_data.append(("NO_RESPONSE", internal_feedback_messages["NO_RESPONSE"]))
-        return create_result_from_feedback_data(
-            is_correct=False,
-            feedback_data=feedback_data,
-            custom_feedback_data=custom_feedback_data
-        )
+def parse_quantities(quantities):
+    '''
+    Input:
+        quantities : quantities in one of the forms accepted by `split_quantities`, e.g.
+                     a string of the form "('q_1','dimension_1') ... ('q_n','dimension_n')"
+    Output:
+        Tuple of pairs of strings (name, dimension) where all units in the
+        dimensions have been replaced by the corresponding SI base dimensions.
+    '''
+    try:
+        return convert_quantities_to_dimensions(split_quantities(quantities))
+    except Exception:
+        raise Exception(internal_feedback_messages["QUANTITIES_NOT_WRITTEN_CORRECTLY"])
+
+
+@lru_cache(maxsize=256)
+def parse_quantity_table(quantities, parsing_params):
+    '''
+    Input:
+        quantities     : tuple of pairs of strings (name, dimension), see `parse_quantities`
+        parsing_params : ParsingParams used to parse names and dimensions
+    Output:
+        Tuple of pairs of sympy expressions (symbol, dimension) and the
+        dimension table for the quantities, see `create_dimension_table`.
+    '''
+    quantities = tuple(tuple(parse_expression(x, parsing_params) for x in quantity) for quantity in quantities)
+    return quantities, create_dimension_table(quantities)
+
+
+def generate_group_exponents(quantity_matrix):
+    '''
+    Input:
+        quantity_matrix : matrix where each row contains the dimension exponents of a quantity
+    Output:
+        List with the exponents of the quantities in each group of a set of
+        independent dimensionless groups that all dimensionless groups of the
+        quantities are products of.
+    Remarks:
+        If all dimension exponents are rational the groups are the canonical
+        basis with small integer exponents from `integer_nullspace`, which is
+        cached, otherwise the nullspace is computed with sympy and each basis
+        vector is rescaled to integer exponents where possible.
+    '''
+    rows = integer_rows(quantity_matrix.T.tolist())
+    if rows is not None:
+        return [list(exponents) for exponents in integer_nullspace(rows)]
+    nullspace_basis = quantity_matrix.T.nullspace()
+    for basis_vector in nullspace_basis:
+        multiplier = 1
+        for i in range(0, basis_vector.rows):
+            if not isinstance(basis_vector[i, 0], Integer):
+                multiplier *= 1/basis_vector[i, 0]
+        if multiplier != 1:
+            for i in range(0, basis_vector.rows):
+                basis_vector[i, 0] = round(basis_vector[i, 0]*multiplier)
+    return [list(basis_vector) for basis_vector in nullspace_basis]
+
+
+def is_dimensionless(group, quantities, dimension_table, exponents=None):
+    '''
+    Input:
+        group           : sympy expression for a group
+        quantities      : list of pairs of sympy expressions (symbol, dimension)
+        dimension_table : dictionary from symbols to Dimension, see `create_dimension_table`, or None
+        exponents       : exponents of the group if they are already known
+    Output:
+        True if the group is dimensionless, otherwise False.
+    Remarks:
+        If the group is a power product of quantities in the dimension table its
+        dimension is computed from the exponents, otherwise the dimensions of the
+        quantities are substituted into the group and the result is simplified.
+    '''
+    if dimension_table is not None:
+        if exponents is None:
+            exponents = get_power_product_exponents(group)
+        if exponents is not None:
+            dimension = group_dimension(exponents, dimension_table)
+            if dimension is not None:
+                return dimension.is_dimensionless
+    dimension = group
+    for quantity in quantities:
+        dimension = dimension.subs(quantity[0], quantity[1])
+    return dimension.simplify().is_constant()
+
+
+class CompiledTask:
+    '''
+    Contains everything needed to evaluate a response that only depends on the
+    answer and the parameters, i.e. the parsed quantities, the parsing parameters,
+    the feedback messages and the analysed answer groups. Compiling a task raises
+    an exception if the answer or the parameters are not valid.
+    '''
+
+    def __init__(self, answer, params):
+        # Validated read-only copy of the parameters with default values set
+        parameters = get_task_parameters(params)
+        self.parameters = parameters
+        # Same key as in `compiled_task_cache`
+        self.fingerprint = fingerprint(answer, parameters.fingerprint)
+        self.feedback_messages = create_feedback_messages(parameters)
+        self.custom_feedback_data = create_custom_feedback_data(parameters)
+        self.complexity_limits = get_complexity_limits(parameters)
+
+        # Raise exceptions when answer is missing from input
+        if not isinstance(answer, str):
+            raise Exception(internal_feedback_messages["NO_ANSWER"])
+        answer = answer.strip()
+        if len(answer) == 0:
+            raise Exception(internal_feedback_messages["NO_ANSWER"])
+
+        # Find what different symbols for quantities there are
+        unsplittable_symbols = names_of_dimensions
+        task_has_quantities = has_quantities(parameters.get("quantities", None))
+        if task_has_quantities:
+            quantities = parse_quantities(parameters["quantities"])
+            unsplittable_symbols += tuple(quantity[0] for quantity in quantities)
+
+        # Preprocess answer to prepare for parsing by sympy
+        answer = preprocess_expression([answer], parameters)[0]
+        self.answer = answer
+        self.parsing_params = create_sympy_parsing_params(parameters, unsplittable_symbols=unsplittable_symbols)
+        self.parsing_fingerprint = parsing_params_fingerprint(self.parsing_params)
+
+        if parameters["strict_syntax"] and "^" in answer:
+            raise Exception(self.feedback_messages["STRICT_SYNTAX_EXPONENTIATION"])
+
+        if answer == "-":
+            answer_strings = []
+        else:
+            answer_strings = answer.split(',')
+        answer_groups = []
+        answer_number_of_groups = 0
+        answer_original_number_of_groups = 0
+        self.answer_exponents = {}
+        for ans in answer_strings:
+            try:
+                group = normalize_group(ans, self.parsing_params, self.parsing_fingerprint)
+            except Exception as e:
+                raise Exception(self.feedback_messages["PARSE_ERROR_WARNING"]("The answer")) from e
+            expr = group.expression
+            if group.exponents is not None:
+                self.answer_exponents[expr] = group.exponents
+            if isinstance(expr, Add):
+                answer_groups += list(expr.args)
+                answer_number_of_groups += len(list(expr.args))
+            else:
+                answer_groups.append(expr)
+                answer_number_of_groups += 1
+            answer_original_number_of_groups += 1
+
+        if task_has_quantities:
+            quantities, dimension_table = parse_quantity_table(quantities, self.parsing_params)
+            answer_symbols = list(map(lambda x: x[0], quantities))
+
+            # Check how many dimensionless groups are needed
+            if dimension_table is not None:
+                quantity_matrix = Matrix([[Rational(e.numerator, e.denominator) for e in dimension_table[q[0]].exponents] for q in quantities])
+            else:
+                # Some dimension is not a power product of the SI base dimensions, e.g. an unknown unit
+                dimension_symbols = set()
+                for quantity in quantities:
+                    dimension_symbols = dimension_symbols.union(quantity[1].free_symbols)
+                quantity_matrix = get_exponent_matrix([q[1] for q in quantities], dimension_symbols)
+            number_of_groups = len(quantities)-matrix_rank(quantity_matrix)
+
+            # If answer groups are not given, generate a valid set of groups to use as answer
+            if answer_groups == []:
+                # Compute answer groups from defined quantities
+                answer_groups = [create_power_product(exponents, answer_symbols) for exponents in generate_group_exponents(quantity_matrix)]
 
-    answer = answer.strip()
+            if answer == "-":
+                answer_number_of_groups = number_of_groups
+                answer_original_number_of_groups = number_of_groups
+
+            # Check that answers are dimensionless
+            for group in answer_groups:
+                if not is_dimensionless(group, quantities, dimension_table, self.answer_exponents.get(group, None)):
+                    raise Exception(self.feedback_messages["NOT_DIMENSIONLESS"](group))
+
+            # Check that there is a sufficient number of independent groups in the answer
+            answer_matrix = get_exponent_matrix(answer_groups, answer_symbols)
+            answer_rank = matrix_rank(answer_matrix)
+            if answer_rank < number_of_groups:
+                raise Exception(self.feedback_messages["TOO_FEW_INDEPENDENT_GROUPS"]("Answer", answer_rank, number_of_groups))
+
+        answer_symbols = set()
+        for ans in answer_groups:
+            answer_symbols = answer_symbols.union(ans.free_symbols)
+
+        # Check the special case where one groups expression contains several power products
+        answer_matrix = get_exponent_matrix(answer_groups, sorted(answer_symbols, key=str))
+        if matrix_rank(answer_matrix) > answer_number_of_groups:
+            raise Exception(self.feedback_messages["SUM_WITH_INDEPENDENT_TERMS"]("answer"))
+
+        self.answer_groups = answer_groups
+        self.answer_symbols = answer_symbols
+        self.answer_number_of_groups = answer_number_of_groups
+        self.answer_original_number_of_groups = answer_original_number_of_groups
+
+
+compiled_task_cache = LRUCache(maxsize=64)
+
+
+def get_compiled_task(answer, params):
+    '''
+    Returns the compiled task for the given answer and parameters, reusing
+    a previously compiled task if one with identical input is cached.
+    Statistics for the cache can be found via `compiled_task_cache.statistics()`.
+    '''
+    # Parameters that only affect how the evaluation is reported are not part of the key
+    parameters = get_task_parameters(params)
+    key = fingerprint(answer, parameters.fingerprint)
+    return compiled_task_cache.get_or_create(key, lambda: CompiledTask(answer, parameters))
+
+
+def normalize_response(response, task):
+    '''
+    Returns the response as it will be parsed, i.e. stripped and with aliases
+    replaced by the corresponding symbols, or None if no response was given.
+    Responses with the same normalized form get the same result.
+    '''
+    if not isinstance(response, str):
+        return None
     response = response.strip()
-    if len(answer) == 0:
-        raise Exception(feedback=internal_feedback_messages["NO_ANSWER"])
     if len(response) == 0:
+        return None
+    # Preprocess response to prepare for parsing by sympy
+    return preprocess_expression([response], task.parameters)[0]
+
+
+def evaluate_response(response, task, instrumentation=null_instrumentation, include_response_latex=True):
+    '''
+    Evaluates a response against a compiled task, see `evaluation_function`.
+    '''
+    with instrumentation.stage("preprocess"):
+        response = normalize_response(response, task)
+    return evaluate_normalized_response(response, task, instrumentation, include_response_latex)
+
+
+def response_too_complex(feedback_data, task):
+    feedback_data.append(("RESPONSE_TOO_COMPLEX", task.feedback_messages["RESPONSE_TOO_COMPLEX"]))
+    return create_result_from_feedback_data(
+        is_correct=False,
+        feedback_data=feedback_data,
+        custom_feedback=task.custom_feedback_data
+    )
+
+
+def evaluate_normalized_response(response, task, instrumentation=null_instrumentation, include_response_latex=True):
+    feedback_messages = task.feedback_messages
+    custom_feedback_data = task.custom_feedback_data
+    parameters = task.parameters
+
+    # Create feedback_data list used to keep track of added feedback
+    feedback_data = []
+
+    # Return feedback when response is missing from input
+    if response is None:
         feedback_data.append(("NO_RESPONSE", internal_feedback_messages["NO_RESPONSE"]))
         return create_result_from_feedback_data(
             is_correct=False,
             feedback_data=feedback_data,
-            custom_feedback_data=custom_feedback_data
+            custom_feedback=custom_feedback_data
         )
 
-    # Find what different symbols for quantities there are
-    unsplittable_symbols = names_of_dimensions
-    if len(parameters.get("quantities", "").strip()) > 0:
-        quantities_strings = parameters["quantities"]
-        substitutions = convert_SI_base_units_to_dimensions
-        quantities = []
-        index = quantities_strings.find("(")
-        while index > -1:
-            index_match = find_matching_parenthesis(quantities_strings, index)
-            try:
-                quantity_strings = eval(quantities_strings[index+1:index_match])
-                for sub in substitutions:
-                    quantity_strings = (quantity_strings[0], substitute(quantity_strings[1], sub))
-                quantities.append(quantity_strings)
-            except Exception:
-                raise Exception(internal_feedback_messages["QUANTITIES_NOT_WRITTEN_CORRECTLY"])
-            index = quantities_strings.find('(', index_match+1)
-        unsplittable_symbols += tuple(quantity[0] for quantity in quantities)
-
-    # Preprocess answer and response to prepare for parsing by sympy
-    answer, response = preprocess_expression([answer, response], parameters)
-    parsing_params = create_sympy_parsing_params(parameters, unsplittable_symbols=unsplittable_symbols)
-
-    # Create list of feedback tags with corresponding lists of input
-    feedback_data = []
-
     # Remark on syntax if necessary
     if parameters["strict_syntax"]:
-        if "^" in answer:
-            raise Exception(feedback_messages["STRICT_SYNTAX_EXPONENTIATION"])
         if "^" in response:
             feedback_data.append(
                 (
@@ -311,20 +644,25 @@ def evaluation_function(response: Any, answer: Any, params: Params) -> Result:
                 )
             )
 
-    # Parse expressions for groups in response and answer
-    def parse_posify_simplify_and_expand(expr_string):
-        expr = parse_expression(expr_string, parsing_params)
-        pos_expr, pos_substitution_dict = posify(expr)
-        expr = pos_expr.simplify(rational=True).subs(pos_substitution_dict)
-        expr = expr.expand(power_base=True, force=True)
-        return expr
+    instrumentation.metric("response_length", len(response))
     response_strings = response.split(',')
+
+    # Responses that could take too long to parse and simplify are rejected before sympy is used
+    exceeded_limit = exceeded_complexity_limit(response_strings, task.complexity_limits)
+    if exceeded_limit is not None:
+        instrumentation.metric("exceeded_complexity_limit", exceeded_limit)
+        return response_too_complex(feedback_data, task)
+
     response_number_of_groups = len(response_strings)
     response_original_number_of_groups = len(response_strings)
     response_groups = []
+    known_exponents = dict(task.answer_exponents)
     for res in response_strings:
         try:
-            expr = parse_posify_simplify_and_expand(res)
+            group = normalize_group(res, task.parsing_params, task.parsing_fingerprint, instrumentation, time_budget=task.complexity_limits["simplify_time"])
+        except ComplexityLimitExceeded:
+            instrumentation.metric("exceeded_complexity_limit", "simplify_time")
+            return response_too_complex(feedback_data, task)
         except Exception:
             feedback_data.append(
                 (
@@ -337,118 +675,36 @@ def evaluation_function(response: Any, answer: Any, params: Params) -> Result:
                 feedback_data=feedback_data,
                 custom_feedback=custom_feedback_data
             )
+        expr = group.expression
+        if group.exponents is not None:
+            known_exponents[expr] = group.exponents
         if isinstance(expr, Add):
             response_groups += list(expr.args)
             response_number_of_groups += len(list(expr.args))
         else:
             response_groups.append(expr)
             response_number_of_groups += 1
-    response_latex = [latex(expr) for expr in response_groups]
+    instrumentation.metric("response_groups", len(response_groups))
+    # Only printed if it is part of the result, see the `response_latex` parameter
+    response_latex = None
+    if include_response_latex:
+        with instrumentation.stage("response_latex"):
+            response_latex = [render_latex(expr) for expr in response_groups]
 
     is_correct = True
 
-    if answer == "-":
-        answer_strings = []
-    else:
-        answer_strings = answer.split(',')
-    answer_groups = []
-    answer_number_of_groups = 0
-    answer_original_number_of_groups = 0
-    for ans in answer_strings:
-        try:
-            expr = parse_posify_simplify_and_expand(ans)
-        except Exception as e:
-            raise Exception(feedback_messages["PARSE_ERROR_WARNING"]("The answer")) from e
-        if isinstance(expr, Add):
-            answer_groups += list(expr.args)
-            answer_number_of_groups += len(list(expr.args))
-        else:
-            answer_groups.append(expr)
-            answer_number_of_groups += 1
-        answer_original_number_of_groups += 1
-
-    # Find what different symbols for quantities there are
-    if len(parameters.get("quantities", "").strip()) > 0:
-#        quantities_strings = parameters["quantities"]
-#        substitutions = convert_SI_base_units_to_dimensions
-#        quantities = []
-#        index = quantities_strings.find("(")
-#        while index > -1:
-#            index_match = find_matching_parenthesis(quantities_strings, index)
-#            try:
-#                quantity_strings = eval(quantities_strings[index+1:index_match])
-#                for sub in substitutions:
-#                    quantity_strings = (quantity_strings[0], substitute(quantity_strings[1], sub))
-#                quantity = tuple(map(lambda x: parse_expression(x, parsing_params), quantity_strings))
-#                quantities.append(quantity)
-#            except Exception:
-#                raise Exception(internal_feedback_messages["QUANTITIES_NOT_WRITTEN_CORRECTLY"])
-#            index = quantities_strings.find('(', index_match+1)
-#        response_symbols = list(map(lambda x: x[0], quantities))
-#        answer_symbols = response_symbols
-        quantities = [tuple(map(lambda x: parse_expression(x, parsing_params), quantity)) for quantity in quantities]
-        response_symbols = list(map(lambda x: x[0], quantities))
-        answer_symbols = response_symbols
-
-        # Check how many dimensionless groups are needed
-        dimension_symbols = set()
-        for quantity in quantities:
-            dimension_symbols = dimension_symbols.union(quantity[1].free_symbols)
-        quantity_matrix = get_exponent_matrix([q[1] for q in quantities], dimension_symbols)
-        number_of_groups = len(quantities)-quantity_matrix.rank()
-
-        # If answer groups are not given, generate a valid set of groups to use as answer
-        if answer_groups == []:
-            # Compute answer groups from defined quantities
-            nullspace_basis = quantity_matrix.T.nullspace()
-            for basis_vector in nullspace_basis:
-                multiplier = 1
-                for i in range(0, basis_vector.rows):
-                    if not isinstance(basis_vector[i, 0], Integer):
-                        multiplier *= 1/basis_vector[i, 0]
-                if multiplier != 1:
-                    for i in range(0, basis_vector.rows):
-                        basis_vector[i, 0] = round(basis_vector[i, 0]*multiplier)
-            answer_groups = [1]*number_of_groups
-            for i in range(0, len(answer_groups)):
-                for j in range(0, len(quantities)):
-                    answer_groups[i] *= quantities[j][0]**nullspace_basis[i][j]
-
-        if answer == "-":
-            answer_number_of_groups = number_of_groups
-            answer_original_number_of_groups = number_of_groups
-
-        # Analyse dimensions of answers and responses
-        answer_dimensions = []
-        for group in answer_groups:
-            dimension = group
-            for quantity in quantities:
-                dimension = dimension.subs(quantity[0], quantity[1])
-            answer_dimensions.append(dimension.simplify())
-
-        # Check that answers are dimensionless
-        for k, dimension in enumerate(answer_dimensions):
-            if not dimension.is_constant():
-                raise Exception(feedback_messages["NOT_DIMENSIONLESS"](answer_groups[k]))
-
-        # Check that there is a sufficient number of independent groups in the answer
-        answer_matrix = get_exponent_matrix(answer_groups, answer_symbols)
-        if answer_matrix.rank() < number_of_groups:
-            raise Exception(feedback_messages["TOO_FEW_INDEPENDENT_GROUPS"]("Answer", answer_matrix.rank(), number_of_groups))
-
     # Compare symbols used in answer and response
     response_symbols = set()
     for res in response_groups:
         response_symbols = response_symbols.union(res.free_symbols)
-    answer_symbols = set()
-    for ans in answer_groups:
-        answer_symbols = answer_symbols.union(ans.free_symbols)
+    instrumentation.metric("response_symbols", len(response_symbols))
+    answer_symbols = task.answer_symbols
     if not response_symbols.issubset(answer_symbols):
         is_correct = False
         feedback_data.append(
             (
                 "UNKNOWN_SYMBOL",
-                feedback_messages["UNKNOWN_SYMBOL"](response_symbols.difference(answer_symbols))
+                feedback_messages["UNKNOWN_SYMBOL"](sorted(response_symbols.difference(answer_symbols), key=str))
             )
         )
         return create_result_from_feedback_data(
@@ -457,38 +713,17 @@ def evaluation_function(response: Any, answer: Any, params: Params) -> Result:
             feedback_data=feedback_data,
             custom_feedback=custom_feedback_data
         )
-    answer_symbols = list(answer_symbols)
 
-    # Checking if the given response is a valid set of groups
-    reference_set = set(answer_groups)
-    reference_symbols = set(answer_symbols)
-    candidate_set = set(response_groups)
-    candidate_symbols = set(response_symbols)
-    is_correct, validity_feedback = determine_validity(
-        reference_set,
-        reference_symbols,
-        answer_original_number_of_groups,
-        candidate_set,
-        candidate_symbols,
+    is_correct, validity_feedback = determine_response_validity(
+        task,
+        response_groups,
+        response_symbols,
         response_original_number_of_groups,
-        feedback_messages
+        known_exponents,
+        instrumentation
     )
     feedback_data += validity_feedback
 
-    # Check the special case where one groups expression contains several power products
-    answer_matrix = get_exponent_matrix(answer_groups, answer_symbols)
-    if answer_matrix.rank() > answer_number_of_groups:
-        raise Exception(feedback_messages["SUM_WITH_INDEPENDENT_TERMS"]("answer"))
-    response_matrix = get_exponent_matrix(response_groups, answer_symbols)
-    if response_matrix.rank() > response_original_number_of_groups:
-        is_correct = False
-        feedback_data.append(
-            (
-                "SUM_WITH_INDEPENDENT_TERMS",
-                feedback_messages["SUM_WITH_INDEPENDENT_TERMS"]("response")
-            )
-        )
-
     result = create_result_from_feedback_data(
         is_correct=is_correct,
         response_latex=response_latex,
@@ -496,3 +731,68 @@ def evaluation_function(response: Any, answer: Any, params: Params) -> Result:
         custom_feedback=custom_feedback_data
     )
     return result
+
+
+def evaluation_function(response: Any, answer: Any, params: Params) -> Result:
+    """
+    Function used to evaluate a student response.
+    ---
+    The handler function passes three arguments to evaluation_function():
+
+    - `response` which are the answers provided by the student.
+    - `answer` which are the correct answers to compare against.
+    - `params` which are any extra parameters that may be useful,
+        e.g., error tolerances.
+    """
+
+    """
+    Function that provides some basic dimensional analysis functionality.
+    The work that only depends on `answer` and `params` is done once per task
+    and cached, see `CompiledTask`.
+    """
+
+    # Optional timing of each stage, see `instrumentation.py`
+    instrumentation = create_instrumentation(params)
+
+    # Uses the preview function to translate latex input to  a
+    # sympy compatible representation
+    if get_flag(params, "is_latex"):
+        with instrumentation.stage("preview"):
+            response = preview_function(response, params)["preview"]["sympy"]
+
+    with instrumentation.stage("compile_task"):
+        task = get_compiled_task(answer, params)
+    result = evaluate_response(response, task, instrumentation, get_flag(params, "response_latex", True))
+    return publish(instrumentation, result, params)
+
+
+def evaluate_batch(responses, answer: Any, params: Params) -> List[Result]:
+    """
+    Evaluates a list of responses against the same answer and parameters.
+    ---
+    Gives the same results as calling `evaluation_function(response, answer, params)`
+    for each response in turn, but the task is only compiled once and responses
+    that are identical after normalization (see `normalize_response`) are only
+    evaluated once. Each response gets its own copy of the result.
+    """
+    if get_flag(params, "is_latex"):
+        # All responses need the LaTeX parser, start loading it while the task is compiled
+        prewarm_latex_parser()
+    task = get_compiled_task(answer, params)
+    results_by_normalized_response = {}
+    results = []
+    for response in responses:
+        instrumentation = create_instrumentation(params)
+        if get_flag(params, "is_latex"):
+            with instrumentation.stage("preview"):
+                response = preview_function(response, params)["preview"]["sympy"]
+        with instrumentation.stage("preprocess"):
+            normalized_response = normalize_response(response, task)
+        result = results_by_normalized_response.get(normalized_response, None)
+        if result is None:
+            result = evaluate_normalized_response(normalized_response, task, instrumentation, get_flag(params, "response_latex", True))
+            results_by_normalized_response[normalized_response] = result
+        else:
+            instrumentation.metric("reused_result", True)
+        results.append(publish(instrumentation, deepcopy(result), params))
+    return results
@@ -1,10 +1,33 @@
 import unittest
 
+import io
+import json
+import os
+import subprocess
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+from sympy import symbols, sin, Float, Rational
+
 from .evaluation import (
+    get_exponent_matrix,
     evaluation_function,
+    evaluate_batch,
+    compiled_task_cache,
+    validity_cache,
+    canonical_response_form,
+    latex_cache,
     default_buckingham_pi_feedback_messages,
     default_parsing_feedback_messages
 )
+from .group_utilities import normalized_group_cache
+from .complexity_utilities import default_complexity_limits, estimate_complexity, time_limit_statistics
+from .preview import preview_function
+from .server import Server
+from .parallel_grading import grade_in_parallel
+from . import instrumentation
 
 
 class TestEvaluationFunction(unittest.TestCase):
@@ -713,5 +736,396 @@ class TestEvaluationFunction(unittest.TestCase):
         result = evaluation_function(response, answer, params)
         self.assertEqual(result["is_correct"], True)
 
+    def test_compiled_task_is_reused_between_responses(self):
+        params = {
+            "strict_syntax": False,
+            "quantities": "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)') ('f', '(1/time)')",
+        }
+        answer = "-"
+        compiled_task_cache.clear()
+        result = evaluation_function("U*L/nu, f*L/U", answer, params)
+        self.assertEqual(result["is_correct"], True)
+        result = evaluation_function("U*L/nu, f/U", answer, params)
+        self.assertEqual(result["is_correct"], False)
+        result = evaluation_function("U*L/nu, f*L/U", answer, dict(reversed(list(params.items()))))
+        self.assertEqual(result["is_correct"], True)
+        statistics = compiled_task_cache.statistics()
+        self.assertEqual((statistics["misses"], statistics["hits"]), (1, 2))
+        evaluation_function("U*L/nu, f*L/U", "U*L/nu, f*L/U", params)
+        self.assertEqual(compiled_task_cache.statistics()["misses"], 2)
+
+    def test_evaluate_batch_gives_same_results_as_evaluation_function(self):
+        params = {
+            "strict_syntax": False,
+            "quantities": "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)') ('f', '(1/time)')",
+            "symbols": {
+                "U": {"latex": r"\(U\)", "aliases": ["u"]},
+                "L": {"latex": r"\(L\)", "aliases": []},
+                "nu": {"latex": r"\(\nu\)", "aliases": []},
+                "f": {"latex": r"\(f\)", "aliases": []},
+            },
+        }
+        answer = "-"
+        responses = [
+            "U*L/nu, f*L/U",
+            " U*L/nu, f*L/U ",
+            "u*L/nu, f*L/U",
+            "U*L/nu, f/U",
+            "U*L/nu",
+            "q*U*L/nu, f*L/U",
+            "U*L/nu+f*L/U",
+            "U*L/(nu",
+            "",
+            None,
+            "U*L/nu, f/U",
+        ]
+        results = evaluate_batch(responses, answer, params)
+        self.assertEqual(len(results), len(responses))
+        for response, result in zip(responses, results):
+            with self.subTest(response=response):
+                self.assertEqual(result, evaluation_function(response, answer, params))
+        self.assertIsNot(results[3], results[10])
+
+    def test_timings(self):
+        params = {
+            "strict_syntax": False,
+            "quantities": "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)') ('f', '(1/time)')",
+        }
+        answer = "-"
+        normalized_group_cache.clear()
+        result = evaluation_function("U*L/nu, f*L/U", answer, params)
+        self.assertNotIn("timings", result)
+        # Read like the other flags, see `get_flag`
+        self.assertIn("timings", evaluation_function("U*L/nu, f*L/U", answer, {**params, "timings": 1}))
+        self.assertNotIn("timings", evaluation_function("U*L/nu, f*L/U", answer, {**params, "timings": None}))
+        validity_cache.clear()
+        result = evaluation_function("U*L/nu, f*L/U", answer, {**params, "timings": True})
+        self.assertEqual(result["is_correct"], True)
+        for stage in ["compile_task", "preprocess", "response_latex", "exponent_matrix", "rank"]:
+            self.assertIn(stage, result["timings"]["stages"])
+        self.assertEqual(result["timings"]["metrics"]["normalized_group_cache_hits"], 2)
+        self.assertEqual(result["timings"]["metrics"]["response_groups"], 2)
+        self.assertEqual(result["timings"]["metrics"]["candidate_matrix_shape"], [2, 4])
+        reports = []
+        previous_sink = instrumentation.set_sink(reports.append)
+        try:
+            result = evaluation_function("U*L/nu, f*L/U+nu", answer, params)
+        finally:
+            instrumentation.set_sink(previous_sink)
+        self.assertNotIn("timings", result)
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0]["metrics"]["groups_parsed_by_sympy"], 1)
+        self.assertIn("parse_expr", reports[0]["stages"])
+        validity_cache.clear()
+        results = evaluate_batch(["U*L/nu, f*L/U", "U*L/nu, f*L/U"], answer, {**params, "timings": True})
+        self.assertIn("rank", results[0]["timings"]["stages"])
+        self.assertEqual(results[1]["timings"]["metrics"], {"reused_result": True})
+
+    def test_params_are_not_modified(self):
+        params = {
+            "strict_syntax": False,
+            "symbols": {
+                "U": {"latex": r"\(U\)", "aliases": ["u", ""]},
+                "L": {"latex": r"\(L\)", "aliases": []},
+                "nu": {"latex": r"\(\nu\)", "aliases": []},
+                "f": {"latex": r"\(f\)", "aliases": []},
+                " ": {"latex": "", "aliases": []},
+            },
+            "input_symbols": [["", ["x"]], ["f", ["freq", ""]]],
+        }
+        original_params = deepcopy(params)
+        result = evaluation_function("u*L/nu, freq*L/u", "U*L/nu, f*L/U", params)
+        self.assertEqual(result["is_correct"], True)
+        preview_function("u*L/nu", params)
+        self.assertEqual(params, original_params)
+        # Changing the parameters afterwards does not change the cached task
+        params["symbols"]["U"]["aliases"] = []
+        result = evaluation_function("u*L/nu, freq*L/u", "U*L/nu, f*L/U", params)
+        self.assertEqual(result["is_correct"], False)
+
+    def test_invalid_params(self):
+        for params in [{"strict_syntax": "false"}, {"symbols": {"U": {"aliases": "u"}}}, {"input_symbols": [["U"]]}]:
+            with self.subTest(params=params):
+                self.assertRaises(Exception, evaluation_function, "U*L/nu", "U*L/nu", params)
+        # Flags given as 0 or 1 are read as false and true, and null as the default value
+        params = {"symbols": {"nu": {"latex": r"\(\nu\)", "aliases": []}}}
+        for (flag, value) in [(0, False), (1, True), (None, True)]:
+            with self.subTest(strict_syntax=flag):
+                for response in ["U*L/nu", "UL/nu", "U^2*L^2/nu^2"]:
+                    self.assertEqual(
+                        evaluation_function(response, "U*L/nu", {**params, "strict_syntax": flag}),
+                        evaluation_function(response, "U*L/nu", {**params, "strict_syntax": value})
+                    )
+        self.assertRaises(Exception, evaluation_function, "U*L/nu", "U*L/nu", {"strict_syntax": 2})
+        for name in ["strict_syntax", "elementary_functions", "specialFunctions", "complexNumbers", "is_latex", "timings", "response_latex"]:
+            with self.subTest(flag=name):
+                result = evaluation_function("U*L/nu", "U*L/nu", {**params, name: None})
+                self.assertEqual(result["is_correct"], True)
+                self.assertNotEqual(result["response_latex"], "")
+                # The same rule applies to every flag, also when the task is already compiled
+                self.assertRaises(Exception, evaluation_function, "U*L/nu", "U*L/nu", {**params, name: "yes"})
+
+    def test_concurrent_evaluations_are_deterministic(self):
+        symbols = {
+            "U": {"latex": r"\(U\)", "aliases": ["u"]},
+            "L": {"latex": r"\(L\)", "aliases": []},
+            "nu": {"latex": r"\(\nu\)", "aliases": []},
+            "f": {"latex": r"\(f\)", "aliases": []},
+        }
+        quantities = "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)') ('f', '(1/time)')"
+        tasks = [
+            ("U*L/nu, f*L/U", {"strict_syntax": False, "symbols": symbols}),
+            ("U*L/nu, f*L/U", {"strict_syntax": False, "symbols": symbols, "quantities": quantities}),
+            ("-", {"strict_syntax": False, "symbols": symbols, "quantities": quantities}),
+            ("U*L/nu, f*L/U", {"strict_syntax": True, "symbols": symbols, "elementary_functions": True}),
+        ]
+        responses = ["u*L/nu, f*L/u", "U L/nu, (f*L/U)**2", "U*L/nu + f*L/U", "nu/(f*L**2), U/(L*f)", "U*L/nu", "sin(U)*L/nu, f*L/U", "U*L/nu, nu/(f*L**2)*(", "u*L/nu, f*L/U^2"]
+        cases = [(response, answer, params) for (answer, params) in tasks for response in responses]
+        original_tasks = deepcopy(tasks)
+
+        def run(case):
+            response, answer, params = case
+            try:
+                return evaluation_function(response, answer, params)
+            except Exception as exception:
+                return str(exception)
+
+        expected = [run(case) for case in cases]
+        for _ in range(3):
+            compiled_task_cache.clear()
+            normalized_group_cache.clear()
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(run, cases*4))
+            self.assertEqual(results, expected*4)
+        self.assertEqual(tasks, original_tasks)
+
+    def test_server(self):
+        params = {"strict_syntax": False, "quantities": "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)')"}
+        requests = [
+            {"id": 1, "command": "eval", "response": "U*L/nu", "answer": "-", "params": params},
+            {"id": "b", "command": "preview", "response": "U*L/nu", "params": params},
+            {"id": 3, "command": "eval", "response": "U*L", "answer": "-", "params": params},
+            {"id": 4, "command": "unknown"},
+            {"id": 5, "command": "statistics"},
+        ]
+        input_stream = io.StringIO("\n".join(json.dumps(request) for request in requests)+"\n\nnot json\n")
+        output_stream = io.StringIO()
+        Server().serve(input_stream, output_stream)
+        responses = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+        self.assertEqual([response["id"] for response in responses], [1, "b", 3, 4, 5, None])
+        self.assertTrue(all(response["latency"] >= 0 for response in responses))
+        for k in [0, 2]:
+            result = evaluation_function(requests[k]["response"], "-", params)
+            self.assertEqual(responses[k]["result"], {**result, "tags": sorted(result["tags"])})
+        self.assertEqual(responses[1]["result"], preview_function("U*L/nu", params))
+        self.assertIn("message", responses[3]["error"])
+        self.assertEqual(responses[4]["result"]["requests"], 4)
+        self.assertIn("compiled_tasks", responses[4]["result"]["caches"])
+        self.assertIn("deadline", responses[4]["result"]["time_limits"])
+        self.assertIn("error", responses[5])
+
+    def test_grade_in_parallel(self):
+        params = {"strict_syntax": False}
+        quantities_params = {"strict_syntax": False, "quantities": "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)')"}
+        submissions = [
+            ("U*L/nu", "U*L/nu", params),
+            ("U*L/nu", "-", quantities_params),
+            ("U*L", "U*L/nu", params),
+            ("U*L", "-", quantities_params),
+            ("U*L/nu", "", params),
+        ]*3+[("(U+L)**100000*nu", "U*L/nu", {**params, "complexity_limits": {"exponent": None, "simplify_time": None}})]
+        results = grade_in_parallel(submissions, processes=2, chunk_size=2, seconds=2)
+        for (k, (response, answer, params)) in enumerate(submissions[0:4]):
+            self.assertEqual(results[k], evaluation_function(response, answer, params))
+        self.assertEqual(results[0:5]*3, results[0:15])
+        self.assertEqual(results[4]["error"]["message"], "No answer was given.")
+        self.assertTrue(results[15]["error"]["timeout"])
+
+    def test_response_complexity_limits(self):
+        params = {"strict_syntax": False, "timings": True}
+        answer = "U*L/nu, f*L/U"
+        responses = {
+            "tokens": ", ".join(["U*L/nu"]*250),
+            "depth": "("*60+"U*L/nu"+")"*60,
+            "exponent": "(U+L)**1000/nu",
+            "terms": "+".join(f"U**{k}*L" for k in range(1, 30)),
+        }
+        for (limit, response) in responses.items():
+            with self.subTest(limit=limit):
+                result = evaluation_function(response, answer, params)
+                self.assertEqual(result["is_correct"], False)
+                self.assertEqual(result["tags"], {"RESPONSE_TOO_COMPLEX"})
+                self.assertEqual(result["timings"]["metrics"]["exceeded_complexity_limit"], limit)
+                self.assertNotIn("parse_expr", result["timings"]["stages"])
+        with self.subTest(limit="exponent chain"):
+            result = evaluation_function("U*L/nu*9**9**9", answer, params)
+            self.assertEqual(result["timings"]["metrics"]["exceeded_complexity_limit"], "exponent")
+        with self.subTest(limit="simplify_time"):
+            response = "+".join(f"U**{k}*L" for k in range(1, 30))
+            result = evaluation_function(response, answer, {**params, "complexity_limits": {"terms": None, "simplify_time": 0.1}})
+            self.assertEqual(result["tags"], {"RESPONSE_TOO_COMPLEX"})
+            self.assertEqual(result["timings"]["metrics"]["exceeded_complexity_limit"], "simplify_time")
+        with self.subTest(limit="simplify_time outside the main thread"):
+            # The time limit cannot interrupt sympy here, it is checked between stages instead
+            response = "+".join(f"U**{k}*L" for k in range(1, 16))
+            checked = time_limit_statistics["deadline"]
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(evaluation_function, response, answer, {**params, "complexity_limits": {"simplify_time": 0.05}}).result()
+            self.assertEqual(result["tags"], {"RESPONSE_TOO_COMPLEX"})
+            self.assertEqual(result["timings"]["metrics"]["exceeded_complexity_limit"], "simplify_time")
+            self.assertEqual(result["timings"]["metrics"]["time_limits_checked_between_stages"], 1)
+            self.assertEqual(time_limit_statistics["deadline"], checked+1)
+        with self.subTest(limit="custom limits"):
+            result = evaluation_function("U**200*L/nu, f*L/U", answer, {**params, "complexity_limits": {"exponent": 1000}})
+            self.assertNotIn("RESPONSE_TOO_COMPLEX", result["tags"])
+            self.assertRaises(Exception, evaluation_function, "U*L/nu", answer, {"complexity_limits": {"size": 10}})
+
+    def test_responses_close_to_default_complexity_limits(self):
+        # Responses that are accepted without limits are still accepted if they are just within the default limits
+        answer = "U*L/nu, f*L/U"
+        responses = {
+            "tokens": "*".join(["U*L/nu"]*165)+", f*L/U",
+            "depth": "("*50+"U*L/nu"+")"*50+", f*L/U",
+            "exponent": "(U*L/nu)**100, f*L/U",
+            "terms": "+".join(f"{k}*U*L/nu" for k in range(1, 21))+", f*L/U",
+        }
+        for (limit, response) in responses.items():
+            with self.subTest(limit=limit):
+                complexity = [estimate_complexity(group) for group in response.split(",")]
+                if limit == "tokens":
+                    self.assertGreater(sum(c.tokens for c in complexity), 0.95*default_complexity_limits["tokens"])
+                else:
+                    self.assertEqual(max(getattr(c, limit) for c in complexity), default_complexity_limits[limit])
+                result = evaluation_function(response, answer, {"strict_syntax": False})
+                self.assertEqual(result["is_correct"], True)
+                self.assertEqual(result["tags"], {"VALID_CANDIDATE_SET"})
+
+    def test_quantities_as_json(self):
+        legacy_params = {"strict_syntax": False, "quantities": "('U', '(metre/second)') ('L', '(metre)') ('nu', '(metre**2/second)') ('f', '(1/second)')"}
+        for quantities in [
+            [["U", "metre/second"], ["L", "metre"], ["nu", "metre**2/second"], ["f", "1/second"]],
+            {"U": "metre/second", "L": "metre", "nu": "metre**2/second", "f": "1/second"},
+            '[{"name": "U", "dimension": "metre/second"}, {"name": "L", "dimension": "metre"}, {"name": "nu", "dimension": "metre**2/second"}, {"name": "f", "dimension": "1/second"}]',
+            # Legacy strings where the tuples are in a python list or separated by other text
+            "[('U', 'metre/second'), ('L', 'metre'), ('nu', 'metre**2/second'), ('f', '1/second')]",
+            "('U', 'metre/second'); ('L', 'metre'); ('nu', 'metre**2/second'); ('f', '1/second')",
+        ]:
+            params = {"strict_syntax": False, "quantities": quantities}
+            for response in ["U*L/nu, f*L/U", "U*L/nu", "U*L, f*L/U"]:
+                with self.subTest(quantities=quantities, response=response):
+                    self.assertEqual(evaluation_function(response, "-", params), evaluation_function(response, "-", legacy_params))
+        self.assertRaises(Exception, evaluation_function, "U*L/nu", "-", {"quantities": "('U', 'metre') __import__('os')"})
+
+    def test_answer_dimensions(self):
+        # Dimensions that are power products of the SI base dimensions are checked with dimension vectors,
+        # other dimensions, e.g. with unknown names, by substituting them into the groups
+        for dimension in ["length", "foo", "foo*length"]:
+            params = {"strict_syntax": False, "quantities": f"('U', '({dimension}/time)') ('L', '({dimension})') ('nu', '({dimension}**2/time)') ('f', '(1/time)')"}
+            with self.subTest(dimension=dimension):
+                self.assertEqual(evaluation_function("U*L/nu", "U*L/nu, f**2*L**2/U**2", params)["is_correct"], False)
+                self.assertEqual(evaluation_function("nu/(U*L), f*L/U", "U*L/nu, f**2*L**2/U**2", params)["is_correct"], True)
+                self.assertRaises(Exception, evaluation_function, "U*L", "U*L", params)
+                self.assertRaises(Exception, evaluation_function, "U*L", "sin(U*L)", params)
+
+    def test_get_exponent_matrix(self):
+        U, L, nu = symbols("U L nu")
+        with self.subTest(tag="power products"):
+            matrix = get_exponent_matrix([2*U*L/nu, sin(10)*nu**2/L], [U, L, nu])
+            self.assertEqual(matrix.tolist(), [[1, 1, -1], [0, -1, 2]])
+        with self.subTest(tag="float exponents are converted to rational numbers"):
+            matrix = get_exponent_matrix([U**Float(0.5)*L**Float(1/3)], [U, L])
+            self.assertEqual(matrix.tolist(), [[Rational(1, 2), Rational(1, 3)]])
+        with self.subTest(tag="expressions that are not power products"):
+            matrix = get_exponent_matrix([U*sin(L)], [U, L])
+            self.assertEqual(matrix.tolist(), [[1, 0]])
+
+    def test_equivalent_responses_reuse_validity(self):
+        U, L, nu, f = symbols("U L nu f")
+        self.assertEqual(
+            canonical_response_form([U*L/nu, f*L/U], 2, {}),
+            canonical_response_form([f**2*L**2/U**2, nu/(2*U*L)], 2, {})
+        )
+        self.assertNotEqual(canonical_response_form([U*L/nu, f*L/U], 2, {}), canonical_response_form([U*L/nu], 1, {}))
+        self.assertEqual(canonical_response_form([U*sin(L)], 1, {}), None)
+        params = {
+            "strict_syntax": False,
+            "quantities": "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)') ('f', '(1/time)')",
+            "timings": True,
+        }
+        equivalent_responses = [
+            ["U*L/nu, f*L/U", "f*L/U, U*L/nu", "nu/(U*L), 2*f**2*L**2/U**2", "(U*L/nu)**3, U/(f*L)"],
+            ["U*L/nu, U*L/nu", "nu/(U*L), nu/(U*L)"],
+            ["U*L/nu, 3*U*L/nu", "nu/(U*L), (U*L/nu)**2"],
+            ["U*L/nu, f*L/U, f*L**2/nu", "U*L/nu, U/(f*L), nu/(f*L**2)"],
+            ["U*L/nu", "nu/(L*U)"],
+            ["U*L/nu+f*L/U", "U*L/nu-2*U/(f*L)"],
+        ]
+        for responses in equivalent_responses:
+            validity_cache.clear()
+            expected = [evaluation_function(response, "-", params) for response in responses]
+            validity_cache.clear()
+            first_result = evaluation_function(responses[0], "-", params)
+            for (response, expected_result) in zip(responses[1:], expected[1:]):
+                with self.subTest(response=response):
+                    result = evaluation_function(response, "-", params)
+                    self.assertEqual(result["timings"]["metrics"].get("reused_validity", False), True)
+                    self.assertEqual(result["is_correct"], first_result["is_correct"])
+                    self.assertEqual(result["feedback"], first_result["feedback"])
+                    self.assertEqual(result["tags"], first_result["tags"])
+                    self.assertEqual(result["response_latex"], expected_result["response_latex"])
+        # Feedback that lists the groups that are not dimensionless is not shared
+        validity_cache.clear()
+        for response in ["U*L, f*L/U", "U*L**2, f*L/U"]:
+            result = evaluation_function(response, "-", params)
+            self.assertNotIn("reused_validity", result["timings"]["metrics"])
+            self.assertIn("NOT_DIMENSIONLESS", result["tags"])
+
+    def test_feedback_does_not_depend_on_hash_seed(self):
+        # Symbols and groups in feedback are sorted, so the feedback is the same in every
+        # process, and the feedback that is stored in `validity_cache` does not depend on it
+        params = {
+            "strict_syntax": False,
+            "quantities": "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)') ('f', '(1/time)')",
+        }
+        responses = ["U*L/nu*p*q*r*s", "U*L, f*L, U/L", "U*L/nu, U*L*f, U*nu, f*L/U"]
+        check = (
+            f"import json; from {__package__}.evaluation import evaluation_function;"
+            f"print(json.dumps([evaluation_function(r, '-', {params!r})['feedback'] for r in {responses!r}]))"
+        )
+        package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        feedback = [evaluation_function(response, "-", params)["feedback"] for response in responses]
+        self.assertIn("Unknown symbol(s): $p$, $q$, $r$, $s$.", feedback[0])
+        for seed in ["1", "2"]:
+            with self.subTest(seed=seed):
+                output = subprocess.run(
+                    [sys.executable, "-c", check],
+                    cwd=package_parent,
+                    env={**os.environ, "PYTHONHASHSEED": seed},
+                    check=True,
+                    capture_output=True,
+                    text=True
+                ).stdout
+                self.assertEqual(json.loads(output), feedback)
+
+    def test_response_latex_is_optional(self):
+        params = {
+            "strict_syntax": False,
+            "quantities": "('U', '(length/time)') ('L', '(length)') ('nu', '(length**2/time)') ('f', '(1/time)')",
+        }
+        for response in ["U*L/nu, f*L/U", "U*L, f*L/U", "U*L/nu, f*L/U, q", "U*L/nu+f*L/U+U/(f*L)"]:
+            with self.subTest(response=response):
+                latex_cache.clear()
+                result = evaluation_function(response, "-", params)
+                self.assertEqual(len(result["response_latex"]), len(response.split(","))+response.count("+"))
+                printed = latex_cache.statistics()["misses"]
+                self.assertEqual(evaluation_function(response, "-", params), result)
+                self.assertEqual(latex_cache.statistics()["misses"], printed)
+                result_without_latex = evaluation_function(response, "-", {**params, "response_latex": False, "timings": True})
+                self.assertEqual(result_without_latex["response_latex"], "")
+                self.assertEqual(evaluation_function(response, "-", {**params, "response_latex": 0}), {**result, "response_latex": ""})
+                self.assertNotIn("response_latex", result_without_latex["timings"]["stages"])
+                for key in ["is_correct", "feedback", "tags"]:
+                    self.assertEqual(result_without_latex[key], result[key])
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,16 @@
+import builtins
+import re
+import types
+from collections.abc import Mapping
+from functools import lru_cache
+from keyword import iskeyword
 from sympy.parsing.sympy_parser import parse_expr, split_symbols_custom, _token_splittable
 from sympy.parsing.sympy_parser import T as parser_transformations
-from sympy import Symbol, I, E
+from sympy import Symbol, I, E, Integer, Mul, Max, Min, srepr
+from sympy import __all__ as sympy_names
+
+from .cache_utilities import fingerprint
+from .parameter_utilities import get_flag
 
 elementary_functions_names = [
     ('sin', []), ('sinc', []), ('csc', ['cosec']), ('cos', []), ('sec', []), ('tan', []), ('cot', ['cotan']),
@@ -34,6 +44,39 @@ elementary_functions_names.sort(key=lambda x: -len(x))
 
 
 # -------- String Manipulation Utilities
+def input_symbol_substitutions(params):
+    '''
+    Input:
+        params : Evaluation function parameter dictionary
+    Output:
+        List of substitutions that replace each input symbol code and each of its
+        aliases with the code, sorted so that longer alternatives take precedence.
+        Codes that are empty or only contain whitespace and empty aliases are ignored.
+    '''
+    substitutions = []
+
+    for (code, symbol_data) in params.get("symbols", {}).items():
+        if len(code.strip()) == 0:
+            continue
+        substitutions.append((code, code))
+        for alias in symbol_data.get("aliases", ()):
+            if len(alias) > 0:
+                substitutions.append((alias, code))
+
+    # REMARK: This is to ensure capability with response areas that use the old formatting
+    # for input_symbols. Should be removed when all response areas are updated.
+    for input_symbol in params.get("input_symbols", ()):
+        if len(input_symbol[0]) == 0:
+            continue
+        substitutions.append((input_symbol[0], input_symbol[0]))
+        for alternative in input_symbol[1]:
+            if len(alternative) > 0:
+                substitutions.append((alternative, input_symbol[0]))
+
+    substitutions.sort(key=lambda x: -len(x[0]))
+    return substitutions
+
+
 def preprocess_expression(exprs, params):
     '''
     Input:
@@ -44,72 +87,110 @@ def preprocess_expression(exprs, params):
         their corresponsing input symbol code.
     Remark:
         Alternatives are sorted before substitution so that longer alternatives takes precedence.
+        Neither exprs nor params are modified.
     '''
     if isinstance(exprs, str):
         exprs = [exprs]
 
-    substitutions = []
+    substitutions = input_symbol_substitutions(params)
 
-    if "symbols" in params.keys():
-        input_symbols = params["symbols"]
-        input_symbols_to_remove = []
-        aliases_to_remove = []
-        for (code, symbol_data) in input_symbols.items():
-            if len(code) == 0:
-                input_symbols_to_remove += [code]
-            else:
-                if len(code.strip()) == 0:
-                    input_symbols_to_remove += [code]
-                else:
-                    aliases = symbol_data["aliases"]
-                    for i in range(0, len(aliases)):
-                        if len(aliases[i]) > 0:
-                            aliases[i].strip()
-                        if len(aliases[i]) == 0:
-                            aliases_to_remove += [(code, i)]
-        for (code, i) in aliases_to_remove:
-            del input_symbols[code]["aliases"][i]
-        for code in input_symbols_to_remove:
-            del input_symbols[code]
-        for (code, symbol_data) in input_symbols.items():
-            substitutions.append((code, code))
-            for alias in symbol_data["aliases"]:
-                if len(alias) > 0:
-                    substitutions.append((alias, code))
+    if len(substitutions) > 0:
+        return [substitute(expr, substitutions) for expr in exprs]
 
-    # REMARK: This is to ensure capability with response areas that use the old formatting
-    # for input_symbols. Should be removed when all response areas are updated.
-    if "input_symbols" in params.keys():
-        input_symbols = params["input_symbols"]
-        input_symbols_to_remove = []
-        alternatives_to_remove = []
-        for k in range(0, len(input_symbols)):
-            if len(input_symbols[k]) > 0:
-                input_symbols[k][0].strip()
-                if len(input_symbols[k][0]) == 0:
-                    input_symbols_to_remove += [k]
+    return list(exprs)
+
+
+class SubstitutionMatcher:
+    '''
+    Compiled form of a list of substitutions that can be passed to `substitute`.
+    The left elements of the substitutions are stored in a trie so that all
+    substitutions that match at a given position in a string are found in a
+    single walk instead of trying each substitution in turn.
+    Remarks:
+        For substitutions of the form ((string,list of strings),string) the
+        left string followed by each look-ahead string is added to the trie,
+        but only the length of the left string is consumed when matching.
+        Matches that would consume nothing are ignored.
+        Among the substitutions that match at a given position the one that
+        comes first in the input order is used, i.e. precedence is the same as
+        when trying each substitution in turn.
+    '''
+
+    __slots__ = ("substitutions", "_trie")
+
+    def __init__(self, substitutions):
+        self.substitutions = tuple(substitutions)
+        self._trie = {}
+        for k, pair in enumerate(self.substitutions):
+            if isinstance(pair[0], tuple):
+                patterns = [pair[0][0]+look_ahead for look_ahead in pair[0][1]]
+                substitution_length = len(pair[0][0])
             else:
-                for i in range(0, len(input_symbols[k][1])):
-                    if len(input_symbols[k][1][i]) > 0:
-                        input_symbols[k][1][i].strip()
-                    if len(input_symbols[k][1][i]) == 0:
-                        alternatives_to_remove += [(k, i)]
-        for (k, i) in alternatives_to_remove:
-            del input_symbols[k][1][i]
-        for k in input_symbols_to_remove:
-            del input_symbols[k]
-        for input_symbol in params["input_symbols"]:
-            substitutions.append((input_symbol[0], input_symbol[0]))
-            for alternative in input_symbol[1]:
-                if len(alternative) > 0:
-                    substitutions.append((alternative, input_symbol[0]))
+                patterns = [pair[0]]
+                substitution_length = len(pair[0])
+            if substitution_length == 0:
+                continue
+            for pattern in patterns:
+                node = self._trie
+                for char in pattern:
+                    node = node.setdefault(char, {})
+                # Substitutions are inserted in input order so the first
+                # match stored in a node is the one with highest precedence
+                node.setdefault(None, (k, substitution_length))
 
-    if len(substitutions) > 0:
-        substitutions.sort(key=lambda x: -len(x[0]))
-        for k in range(0, len(exprs)):
-            exprs[k] = substitute(exprs[k], substitutions)
+    def apply(self, string):
+        trie = self._trie
+        substitutions = self.substitutions
+        length = len(string)
+        new_string = []
+        unmatched_start = 0
+        index = 0
+        while index < length:
+            node = trie.get(string[index])
+            if node is None:
+                index += 1
+                continue
+            best_match = node.get(None)
+            # Walk by index so that each step only costs the length of the match
+            for j in range(index+1, length):
+                node = node.get(string[j])
+                if node is None:
+                    break
+                match = node.get(None)
+                if match is not None and (best_match is None or match[0] < best_match[0]):
+                    best_match = match
+            if best_match is None:
+                index += 1
+                continue
+            new_string.append(string[unmatched_start:index])
+            new_string.append(substitutions[best_match[0]][1])
+            index += best_match[1]
+            unmatched_start = index
+        new_string.append(string[unmatched_start:])
+        return "".join(new_string)
+
+
+@lru_cache(maxsize=128)
+def _compile_hashable_substitutions(substitutions):
+    return SubstitutionMatcher(substitutions)
 
-    return exprs
+
+def compile_substitutions(substitutions):
+    '''
+    Input:
+        substitutions : a list of substitutions in the format accepted by `substitute`
+    Output:
+        A SubstitutionMatcher for the given substitutions, compiled matchers are
+        cached so that each list of substitutions is only compiled once.
+    '''
+    if isinstance(substitutions, SubstitutionMatcher):
+        return substitutions
+    hashable_substitutions = []
+    for (left, right) in substitutions:
+        if isinstance(left, tuple):
+            left = (left[0], tuple(left[1]))
+        hashable_substitutions.append((left, right))
+    return _compile_hashable_substitutions(tuple(hashable_substitutions))
 
 
 def substitute(string, substitutions):
@@ -117,7 +198,8 @@ def substitute(string, substitutions):
     Input:
         string        (required) : a string or a list of strings
         substitutions (required) : a list with elements of the form (string,string)
-                                   or ((string,list of strings),string)
+                                   or ((string,list of strings),string), or a
+                                   SubstitutionMatcher created by compile_substitutions
     Output:
         A string that is the input string where any occurence of the left element
         of each pair in substitutions have been replaced with the corresponding right element.
@@ -125,102 +207,244 @@ def substitute(string, substitutions):
         the substitution will only happen if the first element followed by one of the strings
         in the list in the second element.
     Remarks:
-        Substitutions are made in the input order but if a substitutions left element is a
-        substring of a preceding substitutions right element there will be no substitution.
+        The string is scanned from left to right, if several substitutions match at the same
+        position the one that comes first in the input order is used. Substituted text is not
+        scanned again, so if a substitutions left element is a substring of a preceding
+        substitutions right element there will be no substitution.
         In most cases it is good practice to sort the substitutions by the length of the left
         element in descending order.
         Examples:
             substitute("abc bc c", [("abc","p"), ("bc","q"), ("c","r")])
             returns: "p q r"
-            substitute("abc bc c", [("c","r"), ("bc","q"), ("abc","p")])
-            returns: "abr br r"
+            substitute("abc bc c", [("ab","s"), ("abc","p"), ("bc","q")])
+            returns: "sc q c"
             substitute("p bc c", [("p","abc"), ("bc","q"), ("c","r")])
-            returns: "abc q c"
-            substitute("p bc c", [("c","r"), ("bc","q"), ("p","abc")])
-            returns: "abc br r"
+            returns: "abc q r"
     '''
     if isinstance(string, str):
         string = [string]
 
+    matcher = compile_substitutions(substitutions)
+
     # Perform substitutions
     new_string = []
     for part in string:
         if not isinstance(part, str):
             new_string.append(part)
         else:
-            index = 0
-            string_buffer = ""
-            while index < len(part):
-                matched_start = False
-                for k, pair in enumerate(substitutions):
-                    if isinstance(pair[0], tuple):
-                        match = False
-                        for look_ahead in pair[0][1]:
-                            if part.startswith(pair[0][0]+look_ahead, index):
-                                match = True
-                                break
-                        substitution_length = len(pair[0][0])
-                    else:
-                        match = part.startswith(pair[0], index)
-                        substitution_length = len(pair[0])
-                    if match:
-                        matched_start = True
-                        if len(string_buffer) > 0:
-                            new_string.append(string_buffer)
-                            string_buffer = ""
-                        new_string.append(k)
-                        index += substitution_length
-                        break
-                if not matched_start:
-                    string_buffer += part[index]
-                    index += 1
-            if len(string_buffer) > 0:
-                new_string.append(string_buffer)
-
-    for k, elem in enumerate(new_string):
-        if isinstance(elem, int):
-            new_string[k] = substitutions[elem][1]
+            new_string.append(matcher.apply(part))
 
     return "".join(new_string)
 
 
 # -------- (Sympy) Expression Parsing Utilities
-def create_sympy_parsing_params(params, unsplittable_symbols=tuple()):
+def noncommutative_symbol(name, **assumptions):
+    return Symbol(name, commutative=False, **assumptions)
+
+
+def noncommutative_local_value(name, value):
+    # Aliases for symbols with a different name, e.g. "e" for "E", give
+    # commutative symbols with the alias as name (as parsing them without
+    # the alias in the local dictionary would)
+    if isinstance(value, Symbol):
+        if value.name == name:
+            return noncommutative_symbol(name)
+        return Symbol(name)
+    return value
+
+
+@lru_cache(maxsize=None)
+def sympy_global_dict(noncommutative_symbols=False):
     '''
-    Input:
-        params               : evaluation function parameter dictionary
-        unsplittable_symbols : list of strings that will not be split when parsing
-                               even if implicit multiplication is used.
-    Output:
-        parsing_params: A dictionary that contains necessary info for the
-                        parse_expression function.
+    Returns the namespace that sympy's parser uses by default. If
+    noncommutative_symbols is True names are turned into non-commutative
+    symbols instead. The dictionary is shared and must not be modified.
     '''
+    global_dict = {}
+    exec("from sympy import *", global_dict)
+    for (name, value) in vars(builtins).items():
+        if isinstance(value, types.BuiltinFunctionType):
+            global_dict[name] = value
+    global_dict["max"] = Max
+    global_dict["min"] = Min
+    if noncommutative_symbols:
+        global_dict["Symbol"] = noncommutative_symbol
+    return global_dict
 
-    if "symbols" in params.keys():
-        to_keep = []
-        for symbol in params["symbols"].keys():
-            if len(symbol) > 1:
-                to_keep.append(symbol)
-        unsplittable_symbols += tuple(to_keep)
 
-    if "input_symbols" in params.keys():
-        to_keep = []
-        for symbol in [x[0] for x in params["input_symbols"]]:
-            if len(symbol) > 1:
-                to_keep.append(symbol)
-        unsplittable_symbols += tuple(to_keep)
+@lru_cache(maxsize=None)
+def elementary_functions_substitutions():
+    '''
+    Returns the substitutions that replace aliases for elementary functions
+    with their names and the substitutions that put a space before each name,
+    both sorted so that longer names take precedence.
+    '''
+    alias_substitutions = []
+    for (name, alias) in elementary_functions_names:
+        alias_substitutions += [(name, name)] + [(x, name) for x in alias]
+    alias_substitutions.sort(key=lambda x: -len(x[0]))
+    separate_names = [(x[0], " "+x[0]) for x in elementary_functions_names]
+    return tuple(alias_substitutions), tuple(separate_names)
+
+
+class ParsingParams(Mapping):
+    '''
+    Immutable and hashable set of parameters for `parse_expression` and
+    `parse_power_product`. Everything that only depends on the parameters,
+    i.e. the substitutions done before tokenization, the set of unsplittable
+    symbols and the chain of transformations used by sympy's parser, is computed
+    once when the object is created.
+    Remarks:
+        The parameters can also be read as a dictionary, e.g.
+        parsing_params["strict_syntax"] or parsing_params.get("symbol_dict", {}),
+        and `replace` returns a copy with some of the parameters changed.
+        Objects created by `create_sympy_parsing_params` are cached, so the same
+        object is returned for tasks with the same parameters.
+    '''
+
+    __slots__ = (
+        "unsplittable_symbols", "strict_syntax", "symbol_dict", "extra_transformations",
+        "elementary_functions", "noncommutative_symbols",
+        "unsplittable_symbols_set", "alias_substitutions", "separation_substitutions",
+        "can_split", "transformations", "global_dict", "fingerprint", "_key", "_variants",
+    )
+
+    parameter_names = (
+        "unsplittable_symbols", "strict_syntax", "symbol_dict",
+        "extra_transformations", "elementary_functions", "noncommutative_symbols",
+    )
+
+    def __init__(self, unsplittable_symbols=tuple(), strict_syntax=False, symbol_dict=None, extra_transformations=tuple(), elementary_functions=False, noncommutative_symbols=False):
+        set_value = lambda name, value: object.__setattr__(self, name, value)
+        unsplittable_symbols = tuple(unsplittable_symbols)
+        symbol_dict = dict(symbol_dict) if symbol_dict is not None else {}
+        extra_transformations = tuple(extra_transformations)
+        strict_syntax = bool(strict_syntax)
+        elementary_functions = elementary_functions is True
+        noncommutative_symbols = noncommutative_symbols is True
+        set_value("unsplittable_symbols", unsplittable_symbols)
+        set_value("strict_syntax", strict_syntax)
+        set_value("symbol_dict", types.MappingProxyType(symbol_dict))
+        set_value("extra_transformations", extra_transformations)
+        set_value("elementary_functions", elementary_functions)
+        set_value("noncommutative_symbols", noncommutative_symbols)
+
+        # srepr distinguishes e.g. the function beta from the symbol beta
+        symbol_dict_representation = tuple((name, srepr(value)) for (name, value) in symbol_dict.items())
+        set_value("_key", (
+            unsplittable_symbols,
+            strict_syntax,
+            symbol_dict_representation,
+            tuple(repr(transformation) for transformation in extra_transformations),
+            elementary_functions,
+            noncommutative_symbols,
+        ))
+        set_value("fingerprint", fingerprint(*self._key))
+        set_value("_variants", {})
+
+        unsplittable_symbols_set = frozenset(unsplittable_symbols)
+        set_value("unsplittable_symbols_set", unsplittable_symbols_set)
+        separate_unsplittable_symbols = [(x, " "+x+" ") for x in unsplittable_symbols]
+        alias_substitutions = None
+        if elementary_functions:
+            alias_substitutions, separate_names = elementary_functions_substitutions()
+            alias_substitutions = compile_substitutions(alias_substitutions)
+            separate_unsplittable_symbols = list(separate_names) + separate_unsplittable_symbols
+            separate_unsplittable_symbols.sort(key=lambda x: -len(x[0]))
+        set_value("alias_substitutions", alias_substitutions)
+        set_value("separation_substitutions", SubstitutionMatcher(separate_unsplittable_symbols))
+
+        can_split = lambda x: False if x in unsplittable_symbols_set else _token_splittable(x)
+        set_value("can_split", can_split)
+        if strict_syntax:
+            transformations = parser_transformations[0:4]+extra_transformations
+        else:
+            transformations = parser_transformations[0:4, 6]+extra_transformations+(split_symbols_custom(can_split),)+parser_transformations[8]
+        set_value("transformations", transformations)
+        set_value("global_dict", sympy_global_dict(noncommutative_symbols))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ParsingParams objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ParsingParams objects are immutable")
+
+    def __getitem__(self, key):
+        if key not in self.parameter_names:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.parameter_names)
+
+    def __len__(self):
+        return len(self.parameter_names)
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __eq__(self, other):
+        if isinstance(other, ParsingParams):
+            return self._key == other._key
+        return Mapping.__eq__(self, other)
 
-    if params.get("specialFunctions", False) is True:
+    def __repr__(self):
+        return "ParsingParams("+", ".join(name+"="+repr(self[name]) for name in self.parameter_names)+")"
+
+    def local_dict(self):
+        '''
+        Returns the dictionary that is passed to sympy's parser as local_dict.
+        If noncommutative_symbols is True the symbols are replaced by
+        non-commutative symbols with the same names.
+        '''
+        if self.noncommutative_symbols:
+            return {name: noncommutative_local_value(name, value) for (name, value) in self.symbol_dict.items()}
+        return dict(self.symbol_dict)
+
+    def replace(self, **changes):
+        '''
+        Returns parsing parameters where the given parameters have been changed,
+        e.g. parsing_params.replace(noncommutative_symbols=True). The result is
+        kept so that it is only created once for each set of changes.
+        '''
+        key = tuple(sorted(changes.items(), key=lambda item: item[0]))
+        try:
+            return self._variants[key]
+        except (KeyError, TypeError):
+            pass
+        parameters = {name: self[name] for name in self.parameter_names}
+        parameters.update(changes)
+        variant = ParsingParams(**parameters)
+        try:
+            self._variants[key] = variant
+        except TypeError:
+            pass
+        return variant
+
+
+def as_parsing_params(parsing_params):
+    '''
+    Returns parsing_params if it is a ParsingParams object, otherwise creates
+    one from the entries in the dictionary.
+    '''
+    if isinstance(parsing_params, ParsingParams):
+        return parsing_params
+    return ParsingParams(**{name: parsing_params[name] for name in ParsingParams.parameter_names if name in parsing_params})
+
+
+@lru_cache(maxsize=256)
+def cached_parsing_params(unsplittable_symbols, strict_syntax, elementary_functions, special_functions, complex_numbers):
+    if special_functions:
         from sympy import beta, gamma, zeta
     else:
         beta = Symbol("beta")
         gamma = Symbol("gamma")
         zeta = Symbol("zeta")
-    if params.get("complexNumbers", False) is True:
+    if complex_numbers:
         symbol_I = I
     else:
         symbol_I = Symbol("I")
-    if params.get("elementary_functions", False) is True:
+    if elementary_functions:
         symbol_E = E
     else:
         symbol_E = Symbol("E")
@@ -245,41 +469,305 @@ def create_sympy_parsing_params(params, unsplittable_symbols=tuple()):
     for symbol in unsplittable_symbols:
         symbol_dict.update({symbol: Symbol(symbol)})
 
-    strict_syntax = params.get("strict_syntax", True)
+    return ParsingParams(
+        unsplittable_symbols=unsplittable_symbols,
+        strict_syntax=strict_syntax,
+        symbol_dict=symbol_dict,
+        extra_transformations=tuple(),
+        elementary_functions=elementary_functions,
+    )
 
-    parsing_params = {"unsplittable_symbols": unsplittable_symbols, "strict_syntax": strict_syntax, "symbol_dict": symbol_dict, "extra_transformations": tuple(), "elementary_functions": params.get("elementary_functions", False)}
 
-    return parsing_params
+def create_sympy_parsing_params(params, unsplittable_symbols=tuple()):
+    '''
+    Input:
+        params               : evaluation function parameter dictionary
+        unsplittable_symbols : list of strings that will not be split when parsing
+                               even if implicit multiplication is used.
+    Output:
+        parsing_params: A ParsingParams object that contains necessary info for the
+                        parse_expression function.
+    Remarks:
+        The result only depends on the unsplittable symbols and the parameters
+        that affect parsing, and is cached, so calling this function again with
+        the same parameters returns the same object.
+    '''
+
+    unsplittable_symbols = tuple(unsplittable_symbols)
+
+    if "symbols" in params.keys():
+        to_keep = []
+        for symbol in params["symbols"].keys():
+            if len(symbol) > 1 and len(symbol.strip()) > 0:
+                to_keep.append(symbol)
+        unsplittable_symbols += tuple(to_keep)
+
+    if "input_symbols" in params.keys():
+        to_keep = []
+        for symbol in [x[0] for x in params["input_symbols"]]:
+            if len(symbol) > 1:
+                to_keep.append(symbol)
+        unsplittable_symbols += tuple(to_keep)
+
+    return cached_parsing_params(
+        unsplittable_symbols,
+        get_flag(params, "strict_syntax", True),
+        get_flag(params, "elementary_functions"),
+        get_flag(params, "specialFunctions"),
+        get_flag(params, "complexNumbers"),
+    )
+
+
+def prepare_for_tokenization(expr, parsing_params):
+    '''
+    Input:
+        expr           : string to be parsed into a sympy expression
+        parsing_params : ParsingParams object (or dictionary) that contains parsing parameters
+    Output:
+        The string that is tokenized when expr is parsed, i.e. with aliases for
+        elementary functions replaced (if enabled) and with spaces around the
+        unsplittable symbols so that they are not merged with adjacent names.
+    '''
+    parsing_params = as_parsing_params(parsing_params)
+    if parsing_params.alias_substitutions is not None:
+        expr = parsing_params.alias_substitutions.apply(expr)
+    return parsing_params.separation_substitutions.apply(expr)
 
 
 def parse_expression(expr, parsing_params):
     '''
     Input:
         expr           : string to be parsed into a sympy expression
-        parsing_params : dictionary that contains parsing parameters
+        parsing_params : ParsingParams object (or dictionary) that contains parsing parameters
     Output:
         sympy expression created by parsing expr configured according
         to the parameters in parsing_params
+    Remark:
+        If parsing_params["noncommutative_symbols"] is True all symbols are
+        created as non-commutative symbols, so that products keep the order
+        in which the factors are written.
     '''
 
-    strict_syntax = parsing_params.get("strict_syntax", False)
-    extra_transformations = parsing_params.get("extra_transformations", ())
-    unsplittable_symbols = parsing_params.get("unsplittable_symbols", ())
-    symbol_dict = parsing_params.get("symbol_dict", {})
-    separate_unsplittable_symbols = [(x, " "+x+" ") for x in unsplittable_symbols]
-    if parsing_params["elementary_functions"] is True:
-        alias_substitutions = []
-        for (name, alias) in elementary_functions_names:
-            alias_substitutions += [(name, name)] + [(x, name) for x in alias]
-        alias_substitutions.sort(key=lambda x: -len(x[0]))
-        expr = substitute(expr, alias_substitutions)
-        separate_unsplittable_symbols = [(x[0], " "+x[0]) for x in elementary_functions_names] + separate_unsplittable_symbols
-        separate_unsplittable_symbols.sort(key=lambda x: -len(x[0]))
-    expr = substitute(expr, separate_unsplittable_symbols)
-    can_split = lambda x: False if x in unsplittable_symbols else _token_splittable(x)
-    if strict_syntax:
-        transformations = parser_transformations[0:4]+extra_transformations
-    else:
-        transformations = parser_transformations[0:4, 6]+extra_transformations+(split_symbols_custom(can_split),)+parser_transformations[8]
-    parsed_expr = parse_expr(expr, transformations=transformations, local_dict=symbol_dict)
+    parsing_params = as_parsing_params(parsing_params)
+    expr = prepare_for_tokenization(expr, parsing_params)
+    parsed_expr = parse_expr(expr, transformations=parsing_params.transformations, local_dict=parsing_params.local_dict(), global_dict=parsing_params.global_dict)
     return parsed_expr
+
+
+# -------- Power Product Parsing Utilities
+power_product_token_re = re.compile(r"[ \t]*(?:(?P<number>\d+\.\d*|\.\d+|\d+)|(?P<name>[A-Za-z_]\w*)|(?P<operator>\*\*|[*/^()+-]))", re.ASCII)
+
+# Sympy parses a number directly followed by one of these characters as a single
+# (hexadecimal, binary, octal, scientific or imaginary) number, or not at all
+number_suffix_characters = set("0123456789._eEjJxXoObB")
+
+# Largest exponent a numerical coefficient is raised to
+max_coefficient_exponent = 1000
+
+
+class NotPowerProduct(Exception):
+    pass
+
+
+@lru_cache(maxsize=None)
+def sympy_namespace_names():
+    # Names that sympy's parser resolves to objects instead of creating symbols
+    return frozenset(sympy_names) | frozenset(vars(builtins)) | frozenset(["max", "min"])
+
+
+def power_product_tokens(expr, parsing_params):
+    '''
+    Splits the string into tokens of the form ("number", Integer), ("symbol", Symbol)
+    and ("operator", string). Names are resolved, and split into single character symbols if
+    implicit multiplication is used, the same way as when the string is parsed by sympy.
+    Raises NotPowerProduct if the string contains anything that the power product parser
+    does not handle.
+    '''
+    strict_syntax = parsing_params.strict_syntax
+    can_split = parsing_params.can_split
+    symbol_dict = parsing_params.symbol_dict
+    namespace_names = sympy_namespace_names()
+
+    def resolve(name):
+        if name in symbol_dict:
+            if not isinstance(symbol_dict[name], Symbol):
+                raise NotPowerProduct(name)
+            return symbol_dict[name]
+        if name in namespace_names or name.isdigit():
+            raise NotPowerProduct(name)
+        return Symbol(name)
+
+    tokens = []
+    index = 0
+    length = len(expr.rstrip(" \t"))
+    while index < length:
+        match = power_product_token_re.match(expr, index)
+        if match is None:
+            raise NotPowerProduct(expr[index:])
+        index = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "number":
+            if index < len(expr) and expr[index] in number_suffix_characters:
+                raise NotPowerProduct(value)
+            if "." in value:
+                # Whether sympy keeps floats or converts them to rational numbers
+                # when simplifying depends on the rest of the expression
+                raise NotPowerProduct(value)
+            if len(value) > 1 and value[0] == "0":
+                raise NotPowerProduct(value)
+            tokens.append(("number", Integer(value)))
+        elif kind == "name":
+            if iskeyword(value) or expr[index:].lstrip(" \t").startswith("("):
+                # Keywords and function calls
+                raise NotPowerProduct(value)
+            if value in symbol_dict or value in namespace_names or strict_syntax or not can_split(value):
+                tokens.append(("symbol", resolve(value)))
+            else:
+                for char in value:
+                    tokens.append(("symbol", resolve(char)))
+        else:
+            tokens.append(("operator", value))
+    return tokens
+
+
+class PowerProductParser:
+    '''
+    Recursive descent parser for expressions of the form a*q_1**c_1*...*q_n**c_n,
+    see `parse_power_product`. Each (sub)expression is represented as a pair
+    (coefficient, exponents) where exponents is a dictionary with the exponent
+    of each symbol.
+    '''
+
+    def __init__(self, tokens, strict_syntax):
+        self.tokens = tokens
+        self.position = 0
+        self.strict_syntax = strict_syntax
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def next(self):
+        token = self.peek()
+        if token[0] is None:
+            raise NotPowerProduct("unexpected end of expression")
+        self.position += 1
+        return token
+
+    def is_power_operator(self, token):
+        return token == ("operator", "**") or (token == ("operator", "^") and not self.strict_syntax)
+
+    def parse(self):
+        result = self.parse_product()
+        if self.position < len(self.tokens):
+            raise NotPowerProduct("unexpected "+str(self.peek()[1]))
+        return result
+
+    def parse_product(self):
+        coefficient, exponents = self.parse_factor()
+        while True:
+            token = self.peek()
+            if token in [("operator", "*"), ("operator", "/")]:
+                self.next()
+                factor_coefficient, factor_exponents = self.parse_factor()
+            elif token[0] == "symbol" or token == ("operator", "("):
+                # Implicit multiplication
+                if self.strict_syntax:
+                    raise NotPowerProduct("implicit multiplication")
+                factor_coefficient, factor_exponents = self.parse_factor()
+            else:
+                return coefficient, exponents
+            if token == ("operator", "/"):
+                if factor_coefficient == 0:
+                    raise NotPowerProduct("division by zero")
+                factor_coefficient = 1/factor_coefficient
+                factor_exponents = {symbol: -exponent for (symbol, exponent) in factor_exponents.items()}
+            coefficient = coefficient*factor_coefficient
+            for (symbol, exponent) in factor_exponents.items():
+                exponents[symbol] = exponents.get(symbol, 0)+exponent
+
+    def parse_factor(self):
+        coefficient, exponents = self.parse_atom()
+        if self.is_power_operator(self.peek()):
+            self.next()
+            exponent = self.parse_exponent()
+            if self.is_power_operator(self.peek()):
+                raise NotPowerProduct("repeated exponentiation")
+            if coefficient != 1:
+                if not exponent.is_Integer or abs(exponent) > max_coefficient_exponent or (coefficient == 0 and exponent < 0):
+                    raise NotPowerProduct("coefficient cannot be raised to exponent")
+                coefficient = coefficient**exponent
+            exponents = {symbol: value*exponent for (symbol, value) in exponents.items()}
+        return coefficient, exponents
+
+    def parse_atom(self):
+        token = self.next()
+        if token[0] == "number":
+            return token[1], {}
+        if token[0] == "symbol":
+            return Integer(1), {token[1]: Integer(1)}
+        if token == ("operator", "("):
+            result = self.parse_product()
+            if self.next() != ("operator", ")"):
+                raise NotPowerProduct("unmatched parenthesis")
+            return result
+        raise NotPowerProduct("unexpected "+str(token[1]))
+
+    def parse_signed_integer(self):
+        sign = 1
+        if self.peek() in [("operator", "-"), ("operator", "+")]:
+            if self.next()[1] == "-":
+                sign = -1
+        token = self.next()
+        if token[0] != "number":
+            raise NotPowerProduct("exponent is not a number")
+        return sign*token[1]
+
+    def parse_exponent(self):
+        # Exponents are integers, optionally in parentheses, or fractions of
+        # integers in parentheses, e.g. 2, -1, (-1/3)
+        if self.peek() != ("operator", "("):
+            return self.parse_signed_integer()
+        self.next()
+        exponent = self.parse_signed_integer()
+        if self.peek() == ("operator", "/"):
+            self.next()
+            denominator = self.parse_signed_integer()
+            if denominator == 0:
+                raise NotPowerProduct("division by zero")
+            exponent = exponent/denominator
+        if self.next() != ("operator", ")"):
+            raise NotPowerProduct("unmatched parenthesis")
+        return exponent
+
+
+def parse_power_product(expr, parsing_params):
+    '''
+    Input:
+        expr           : string to be parsed into a sympy expression
+        parsing_params : ParsingParams object (or dictionary) that contains parsing parameters
+    Output:
+        If expr is a product of numbers and symbols raised to numerical powers,
+        the sympy expression coefficient*q_1**c_1*...*q_n**c_n where coefficient
+        and c_1, ..., c_n are rational numbers and q_1, ..., q_n are distinct symbols.
+        The numbers in expr must be integers, exponents can also be fractions of integers.
+        Otherwise None is returned.
+    Remarks:
+        This is the same expression as the one computed by parsing expr with
+        `parse_expression` followed by posify, simplify(rational=True) and
+        expand(power_base=True, force=True), but without using sympy to parse and
+        simplify. Anything that the power product parser does not handle, e.g.
+        sums, floats, unary minus outside of exponents, function calls and names
+        that sympy would not parse as symbols, gives None so that sympy can be used instead.
+    '''
+    parsing_params = as_parsing_params(parsing_params)
+    if len(parsing_params.extra_transformations) > 0:
+        return None
+    try:
+        tokens = power_product_tokens(prepare_for_tokenization(expr, parsing_params), parsing_params)
+        coefficient, exponents = PowerProductParser(tokens, parsing_params.strict_syntax).parse()
+    except NotPowerProduct:
+        return None
+    return Mul(coefficient, *[symbol**exponent for (symbol, exponent) in exponents.items() if exponent != 0])
@@ -0,0 +1,266 @@
+import unittest
+
+from fractions import Fraction
+
+from sympy import Matrix, Rational, Float, sqrt, Symbol, posify, sympify, prod
+
+from .expression_utilities import substitute, compile_substitutions, parse_expression, parse_power_product, create_sympy_parsing_params, ParsingParams
+from .buckingham_pi_utilities import names_of_dimensions, split_quantities
+from .dimension_utilities import Dimension, dimensionless, dimension_from_expression, create_dimension_table, group_dimension
+from .matrix_utilities import matrix_rank, create_row_space, RowSpace, SympyRowSpace, hermite_normal_form, integer_nullspace, lll_reduce
+from .unit_tables import get_unit_table, get_unit_index, load_unit_tables, convert_units_to_dimensions, resolve_short_form
+from . import unit_system_conversions
+
+
+class TestExpressionUtilities(unittest.TestCase):
+    """
+    TestCase Class used to test the string, expression and matrix
+    utilities that the evaluation and preview functions are built on.
+    """
+
+    def test_substitute_precedence(self):
+        self.assertEqual(substitute("abc bc c", [("abc", "p"), ("bc", "q"), ("c", "r")]), "p q r")
+        self.assertEqual(substitute("abc bc c", [("ab", "s"), ("abc", "p"), ("bc", "q")]), "sc q c")
+        self.assertEqual(substitute("p bc c", [("p", "abc"), ("bc", "q"), ("c", "r")]), "abc q r")
+        self.assertEqual(substitute("p bc c", [("c", "r"), ("bc", "q"), ("p", "abc")]), "abc q r")
+
+    def test_substitute_look_ahead(self):
+        substitutions = [(("metres", [" ", "*", "/"]), "metre"), ("metre", "length")]
+        self.assertEqual(substitute("metres*metres/metres", substitutions), "metre*metre/lengths")
+        self.assertEqual(substitute("metres metresx", substitutions), "metre lengthsx")
+
+    def test_substitute_with_compiled_substitutions(self):
+        substitutions = [("abc", "p"), ("bc", "q"), ("c", "r")]
+        matcher = compile_substitutions(substitutions)
+        self.assertIs(compile_substitutions(list(substitutions)), matcher)
+        self.assertEqual(substitute("abc bc c", matcher), "p q r")
+
+    def test_substitute_unit_conversions(self):
+        dimension = "(newton*metre/second)"
+        for substitutions in get_unit_table("convert_SI_base_units_to_dimensions"):
+            dimension = substitute(dimension, substitutions)
+        self.assertEqual(dimension, "((length*(10**3) *mass*time**(-2))*length/time)")
+
+    def test_unit_index_matches_unit_conversions(self):
+        # Names that the unit conversion tables convert to SI base dimensions have the same scale and dimension in the unit indices
+        parsing_params = create_sympy_parsing_params({"strict_syntax": False}, unsplittable_symbols=names_of_dimensions)
+        dimension_symbols = [Symbol(name) for name in names_of_dimensions]
+        prefixes = unit_system_conversions.list_of_SI_prefixes()
+        unit_index = get_unit_index()
+        names = [name for name in unit_index.keys() if not any(name.startswith(prefix[0]) and name != prefix[0] for prefix in prefixes)]
+        names += [prefix[0]+unit for prefix in prefixes for unit in ["metre", "gram", "newton", "hour"]]
+        short_forms = [prefix[1]+unit[1] for prefix in prefixes[:6] for unit in unit_system_conversions.list_of_SI_base_unit_dimensions()]
+        short_forms += list(get_unit_table("short_form_unit_index").keys())
+        compared = 0
+        for (resolve, table, names) in [
+            (unit_index.get, unit_system_conversions.convert_SI_base_units_to_dimensions(), names),
+            (resolve_short_form, unit_system_conversions.convert_SI_base_units_to_dimensions_short_form(), short_forms),
+        ]:
+            for name in names:
+                dimension = name
+                for substitutions in table:
+                    dimension = substitute(dimension, substitutions)
+                try:
+                    expression = parse_expression(dimension, parsing_params)
+                except Exception:
+                    continue
+                if not expression.free_symbols.issubset(dimension_symbols):
+                    continue
+                scale, dimension = expression.as_independent(*dimension_symbols, as_Add=False)
+                with self.subTest(name=name):
+                    self.assertEqual(dimension_from_expression(dimension), Dimension(resolve(name)[1]))
+                    self.assertAlmostEqual(float(scale/sympify(resolve(name)[0])), 1, places=12)
+                compared += 1
+        self.assertGreater(compared, 200)
+
+    def test_resolve_short_form(self):
+        # The same short forms as the enumerated substitutions in convert_short_forms, where the first match is used
+        unit_index = get_unit_index()
+        expected = {}
+        for (short_form, name) in unit_system_conversions.convert_short_forms():
+            if short_form != name and "*" not in short_form and " " not in short_form:
+                expected.setdefault(short_form, name)
+        scales = {}
+        def to_sympy(scale):
+            if scale not in scales:
+                scales[scale] = sympify(scale)
+            return scales[scale]
+        for (short_form, name) in expected.items():
+            factors = name.replace("(", "").replace(")", "").split("*")
+            with self.subTest(short_form=short_form, name=name):
+                scale, exponents = resolve_short_form(short_form)
+                self.assertEqual(exponents, unit_index[factors[-1]][1])
+                # Scales of prefixed short forms are written as (prefix scale)*(unit scale)
+                scale_factors = scale[1:-1].split(")*(") if scale.startswith("(") else [scale]
+                expected_scale = prod(to_sympy(unit_index[factor][0]) for factor in factors)
+                self.assertEqual(prod(to_sympy(factor) for factor in scale_factors), expected_scale)
+        self.assertIsNone(resolve_short_form("kfoo"))
+        self.assertEqual(convert_units_to_dimensions("km/h", short_forms=True), "((1000)*length)/((3600)*time)")
+
+    def test_unit_tables_are_up_to_date(self):
+        unit_tables = load_unit_tables()
+        for table in unit_system_conversions.static_unit_conversion_arrays:
+            with self.subTest(table=table.__name__):
+                self.assertEqual(unit_tables[table.__name__], table())
+
+    def test_matrix_rank(self):
+        matrices = [
+            Matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]]),
+            Matrix([[Rational(1, 2), Rational(-1, 3)], [Rational(3, 2), -1]]),
+            Matrix([[0, 0], [0, 0]]),
+            Matrix([[1, 0, 0, 2], [0, 1, 0, 3], [0, 0, 1, 4], [1, 1, 1, 9]]),
+            Matrix([[1, 1], [1, 2], [2, 3]]).T,
+            Matrix([[Float(0.5), 1], [1, 2]]),
+            Matrix([[sqrt(2), 1], [2, sqrt(2)]]),
+        ]
+        for matrix in matrices:
+            with self.subTest(matrix=matrix):
+                self.assertEqual(matrix_rank(matrix), matrix.rank())
+        self.assertEqual(matrix_rank([[Fraction(1, 2), 1], [1, 2]]), 1)
+        self.assertEqual(matrix_rank([]), 0)
+
+    def test_row_space(self):
+        rows = [[1, 1, -1, 0], [0, 1, -2, 1], [1, 2, -3, 1]]
+        row_space = create_row_space(rows)
+        self.assertIsInstance(row_space, RowSpace)
+        self.assertEqual(row_space.rank, matrix_rank(rows))
+        self.assertTrue(row_space.contains([2, 3, -4, 1]))
+        self.assertTrue(row_space.contains([Rational(1, 2), Rational(1, 2), Rational(-1, 2), 0]))
+        self.assertFalse(row_space.contains([1, 0, 0, 0]))
+        extended_space = row_space.copy()
+        self.assertTrue(extended_space.add([1, 0, 0, 0]))
+        self.assertFalse(extended_space.add([2, 1, -1, 0]))
+        self.assertEqual((row_space.rank, extended_space.rank), (2, 3))
+        symbolic_space = create_row_space([[1, Symbol("a")], [2, 2*Symbol("a")]])
+        self.assertIsInstance(symbolic_space, SympyRowSpace)
+        self.assertEqual(symbolic_space.rank, 1)
+        self.assertTrue(symbolic_space.contains([3, 3*Symbol("a")]))
+
+    def test_integer_nullspace(self):
+        self.assertEqual(hermite_normal_form([[2, 4, 4], [-6, -6, 3], [4, 8, 8]]), [[2, 4, 4], [0, 6, 15]])
+        # Dimensions (length, time) of U, L, nu and f
+        rows = ((1, 1, 2, 0), (-1, 0, -1, -1))
+        self.assertEqual(integer_nullspace(rows, reduce=False), ((1, 1, -1, 0), (0, 2, -1, 1)))
+        self.assertEqual(integer_nullspace(rows), ((1, 1, -1, 0), (1, -1, 0, -1)))
+        # Rows that span the same space give the same basis
+        self.assertEqual(integer_nullspace(((1, 1, 2, 0), (0, 1, 1, -1))), integer_nullspace(rows))
+        for rows in [((1, 2, 3), (4, 5, 6)), ((2, 0, 0, 4), (0, 3, 6, 0), (1, 1, 2, 2)), ((1, -1, 0, 0, 0),), ((0, 0),)]:
+            with self.subTest(rows=rows):
+                basis = integer_nullspace(rows)
+                self.assertEqual(len(basis), len(rows[0])-matrix_rank(rows))
+                for vector in basis:
+                    self.assertEqual(Matrix(rows)*Matrix(vector), Matrix([0]*len(rows)))
+                self.assertEqual([tuple(row) for row in hermite_normal_form(basis)], list(integer_nullspace(rows, reduce=False)))
+        self.assertEqual(lll_reduce([[1, 0, 0], [7, 1, 0], [23, 5, 1]]), [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+    def test_parse_power_product_matches_sympy(self):
+        def parse_with_sympy(expr, parsing_params):
+            pos_expr, pos_substitution_dict = posify(parse_expression(expr, parsing_params))
+            pos_expr = pos_expr.simplify(rational=True).subs(pos_substitution_dict)
+            return pos_expr.expand(power_base=True, force=True)
+        power_products = [
+            "U*L/nu", "F/(rho*D**4*omega**2)", "x**(1/2)*y", "(x*y)**(-3/2)/x", "2*x/4",
+            "(2*x)**2/y**-1", "x/x", "0*x", "x**0", "e*E*N*S", "length*mass**2/time", "xy/z",
+        ]
+        implicit_multiplication = ["U L/nu", "F/(rho D^4 omega^2)", "ab^2 c", "2y x", "nux", "(x)(y)/2(z)"]
+        not_power_products = ["x+y", "-x", "sin(x)", "pi*x", "0.5*x", "x**0.5", "x**y", "x**2**2", "2**(1/2)*x", "x/0", "x,y", "", "(x", "x(y)", "lambda"]
+        unsplittable_symbols = names_of_dimensions+("U", "L", "nu", "F", "rho", "D", "omega")
+        for strict_syntax in [True, False]:
+            parsing_params = create_sympy_parsing_params({"strict_syntax": strict_syntax}, unsplittable_symbols=unsplittable_symbols)
+            for expr in power_products+implicit_multiplication:
+                with self.subTest(expr=expr, strict_syntax=strict_syntax):
+                    result = parse_power_product(expr, parsing_params)
+                    if strict_syntax and expr in implicit_multiplication:
+                        self.assertIsNone(result)
+                    else:
+                        self.assertEqual(result, parse_with_sympy(expr, parsing_params))
+            for expr in not_power_products:
+                with self.subTest(expr=expr, strict_syntax=strict_syntax):
+                    self.assertIsNone(parse_power_product(expr, parsing_params))
+
+    def test_parsing_params_are_cached_and_immutable(self):
+        params = {"strict_syntax": False, "elementary_functions": True, "symbols": {"Ux": {"aliases": []}}}
+        parsing_params = create_sympy_parsing_params(params, unsplittable_symbols=("U", "nu"))
+        self.assertIsInstance(parsing_params, ParsingParams)
+        self.assertIs(parsing_params, create_sympy_parsing_params(dict(params), unsplittable_symbols=("U", "nu")))
+        self.assertIsNot(parsing_params, create_sympy_parsing_params(params, unsplittable_symbols=("U",)))
+        self.assertEqual(parsing_params["unsplittable_symbols"], ("U", "nu", "Ux"))
+        self.assertEqual(parsing_params.get("strict_syntax"), False)
+        self.assertEqual(len({parsing_params: 1, ParsingParams(**parsing_params): 2}), 1)
+        with self.assertRaises(AttributeError):
+            parsing_params.strict_syntax = True
+        with self.assertRaises(TypeError):
+            parsing_params.symbol_dict["x"] = Symbol("y")
+        noncommutative_params = parsing_params.replace(noncommutative_symbols=True)
+        self.assertIs(noncommutative_params, parsing_params.replace(noncommutative_symbols=True))
+        self.assertNotEqual(noncommutative_params.fingerprint, parsing_params.fingerprint)
+        self.assertEqual(parse_expression("Ux nu U", noncommutative_params).args[0], Symbol("Ux", commutative=False))
+        self.assertEqual(parse_expression("Ux nu U", parsing_params), Symbol("Ux")*Symbol("nu")*Symbol("U"))
+        self.assertEqual(parse_expression("arcsin(x)", parsing_params), parse_expression("asin(x)", dict(parsing_params)))
+
+    def test_split_quantities(self):
+        expected = (("U", "(length/time)"), ("L", "length"))
+        for quantities in [
+            "('U', '(length/time)') ('L', 'length')",
+            "('U','(length/time)'), ('L','length')",
+            "[('U','(length/time)'), ('L','length')]",
+            "('U','(length/time)'); ('L','length')",
+            '[["U", "(length/time)"], ["L", "length"]]',
+            '{"U": "(length/time)", "L": "length"}',
+            [["U", "(length/time)"], {"name": "L", "dimension": "length"}],
+            {"U": "(length/time)", "L": "length"},
+        ]:
+            with self.subTest(quantities=quantities):
+                self.assertEqual(split_quantities(quantities), expected)
+        for quantities in [
+            "('U', 'length') __import__('os').getcwd()",
+            "('U', 'length') ('L')",
+            "('U', 'length'",
+            "('U', 'length') ('U', 'time')",
+            "('2U', 'length')",
+            "('U', '')",
+            '[["U", "length", "time"]]',
+            [{"name": "U"}],
+        ]:
+            with self.subTest(quantities=quantities):
+                self.assertRaises(ValueError, split_quantities, quantities)
+
+    def test_dimension_algebra(self):
+        length = Dimension(length=1)
+        time = Dimension(time=1)
+        velocity = length/time
+        self.assertEqual(velocity, Dimension(length=1, time=-1))
+        self.assertEqual(velocity.exponents[names_of_dimensions.index("time")], -1)
+        self.assertEqual(velocity*time, length)
+        self.assertEqual(hash(velocity*time), hash(length))
+        self.assertEqual((length**2)**Rational(1, 2), length)
+        self.assertEqual(length**Fraction(1, 3), Dimension(length=Fraction(1, 3)))
+        self.assertTrue((velocity/velocity).is_dimensionless)
+        self.assertEqual(velocity/velocity, dimensionless)
+        self.assertFalse(velocity.is_dimensionless)
+        with self.assertRaises(AttributeError):
+            velocity.exponents = dimensionless.exponents
+        self.assertRaises(ValueError, Dimension, speed=1)
+        self.assertRaises(ValueError, Dimension, [1, 2])
+
+    def test_dimension_table(self):
+        parsing_params = create_sympy_parsing_params({"strict_syntax": False}, unsplittable_symbols=names_of_dimensions+("U", "L", "nu"))
+        def parse(expr):
+            return parse_expression(expr, parsing_params)
+        self.assertEqual(dimension_from_expression(parse("(10**3)*length/(3600*time)")), Dimension(length=1, time=-1))
+        self.assertEqual(dimension_from_expression(parse("length**0.5")), Dimension(length=Fraction(1, 2)))
+        self.assertEqual(dimension_from_expression(parse("1")), dimensionless)
+        self.assertIsNone(dimension_from_expression(parse("foo*length")))
+        self.assertIsNone(dimension_from_expression(parse("length+time")))
+        quantities = [(parse(q), parse(d)) for (q, d) in [("U", "length/time"), ("L", "length"), ("nu", "length**2/time")]]
+        table = create_dimension_table(quantities)
+        U, L, nu = [q for (q, d) in quantities]
+        self.assertEqual(table[nu], Dimension(length=2, time=-1))
+        self.assertEqual(group_dimension({U: 1, L: 1, nu: -1}, table), dimensionless)
+        self.assertEqual(group_dimension({U: 1, L: Rational(1, 2)}, table), Dimension(length=Fraction(3, 2), time=-1))
+        self.assertIsNone(group_dimension({U: 1, Symbol("f"): 1}, table))
+        self.assertIsNone(create_dimension_table(quantities+[(parse("f"), parse("foo/time"))]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+from collections import Counter, namedtuple
+from types import MappingProxyType
+
+from sympy import Rational, Mul, posify
+
+from .cache_utilities import LRUCache
+from .complexity_utilities import time_limit
+from .expression_utilities import as_parsing_params, parse_expression, parse_power_product
+from .instrumentation import null_instrumentation
+
+# Largest denominator used when float exponents are converted to rational numbers
+max_exponent_denominator = 10**6
+float_exponent_tolerance = 1e-12
+
+
+def rational_exponent(exponent):
+    '''
+    Returns the exponent as an exact rational number, or None if it is not a number.
+    Floats, e.g. 0.5 or 0.333333333333333, are replaced by the closest rational number
+    with denominator at most `max_exponent_denominator` if that is within
+    `float_exponent_tolerance`, otherwise by the exact value of its decimal representation.
+    '''
+    if exponent.is_Rational:
+        return exponent
+    if exponent.is_Float:
+        exact = Rational(str(exponent))
+        approximation = exact.limit_denominator(max_exponent_denominator)
+        if abs(approximation-exact) <= float_exponent_tolerance*max(1, abs(exact)):
+            return approximation
+        return exact
+    return None
+
+
+def get_power_product_exponents(expression):
+    '''
+    Returns a dictionary with the exponent of each symbol in the expression if it
+    is a power product, i.e. of the form a*q_1**c_1*...*q_n**c_n where a is a
+    constant and c_1, ..., c_n are numbers, otherwise returns None.
+    '''
+    exponents = {}
+    for factor in Mul.make_args(expression):
+        if not factor.free_symbols:
+            continue
+        base, exponent = factor.as_base_exp()
+        if not base.is_Symbol:
+            return None
+        exponent = rational_exponent(exponent)
+        if exponent is None:
+            return None
+        exponents[base] = exponents.get(base, 0)+exponent
+    return exponents
+
+
+# Number of group expressions parsed by `parse_power_product` and by sympy respectively
+parsing_path_statistics = Counter(power_product=0, sympy=0)
+
+
+# Parse expressions for groups in response and answer
+def parse_posify_simplify_and_expand(expr_string, parsing_params, instrumentation=null_instrumentation, use_sympy=True, time_budget=None):
+    with instrumentation.stage("parse_power_product"):
+        expr = parse_power_product(expr_string, parsing_params)
+    if expr is not None:
+        parsing_path_statistics["power_product"] += 1
+        instrumentation.count("groups_parsed_as_power_products")
+        return expr
+    if not use_sympy:
+        return None
+    parsing_path_statistics["sympy"] += 1
+    instrumentation.count("groups_parsed_by_sympy")
+    # Raises ComplexityLimitExceeded if sympy takes longer than time_budget seconds, outside
+    # the main thread this is only noticed between the stages below
+    with time_limit(time_budget) as deadline:
+        if not deadline.interrupts and deadline.deadline is not None:
+            instrumentation.count("time_limits_checked_between_stages")
+        with instrumentation.stage("parse_expr"):
+            expr = parse_expression(expr_string, parsing_params)
+        deadline.check()
+        with instrumentation.stage("simplify"):
+            pos_expr, pos_substitution_dict = posify(expr)
+            expr = pos_expr.simplify(rational=True).subs(pos_substitution_dict)
+            deadline.check()
+            expr = expr.expand(power_base=True, force=True)
+        deadline.check()
+    return expr
+
+
+def parsing_params_fingerprint(parsing_params):
+    '''
+    Returns a string that identifies the parsing parameters, i.e. two group
+    strings that are identical and are parsed with parameters with the same
+    fingerprint give the same expression.
+    '''
+    return as_parsing_params(parsing_params).fingerprint
+
+
+# The normalized form of a group expression together with the exponents of
+# its symbols (None if the expression is not a power product)
+NormalizedGroup = namedtuple("NormalizedGroup", ["expression", "exponents"])
+
+# Shared by evaluation and preview, keyed by group string and parsing parameters fingerprint
+normalized_group_cache = LRUCache(maxsize=4096)
+
+
+def normalize_group(expr_string, parsing_params, parsing_fingerprint=None, instrumentation=null_instrumentation, use_sympy=True, time_budget=None):
+    '''
+    Input:
+        expr_string         : string for a single group
+        parsing_params      : ParsingParams object that contains parsing parameters
+        parsing_fingerprint : `parsing_params_fingerprint(parsing_params)`, computed if not given
+        use_sympy           : if False only the power product parser is used and None
+                              is returned for groups it does not handle
+        time_budget         : largest number of seconds sympy may spend on the group,
+                              ComplexityLimitExceeded is raised if it takes longer
+    Output:
+        NormalizedGroup with the group expression in the form given by
+        `parse_posify_simplify_and_expand` and its exponents. Results are
+        cached in `normalized_group_cache`.
+    '''
+    if parsing_fingerprint is None:
+        parsing_fingerprint = parsing_params_fingerprint(parsing_params)
+    # Surrounding whitespace does not change the expression, e.g. " f*L/U" and "f*L/U"
+    expr_string = expr_string.strip()
+    key = (expr_string, parsing_fingerprint)
+    group = normalized_group_cache.get(key)
+    if group is not None:
+        instrumentation.count("normalized_group_cache_hits")
+        return group
+    expression = parse_posify_simplify_and_expand(expr_string, parsing_params, instrumentation, use_sympy, time_budget)
+    if expression is None:
+        return None
+    exponents = get_power_product_exponents(expression)
+    if exponents is not None:
+        # The exponents are shared between all users of the cache
+        exponents = MappingProxyType(exponents)
+    group = NormalizedGroup(expression, exponents)
+    normalized_group_cache.put(key, group)
+    return group
@@ -0,0 +1,165 @@
+import threading
+import time
+
+from .parameter_utilities import get_flag
+
+
+class Stage:
+    '''
+    Context manager that adds the wall time and CPU time (of the current thread)
+    spent inside the with block to the given stage of an Instrumentation.
+    '''
+
+    __slots__ = ("instrumentation", "name", "wall_start", "cpu_start")
+
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        wall_time = time.perf_counter()-self.wall_start
+        cpu_time = time.thread_time()-self.cpu_start
+        self.instrumentation.add_time(self.name, wall_time, cpu_time)
+        return False
+
+
+class Instrumentation:
+    '''
+    Records the time spent in each stage of an evaluation together with size
+    metrics, e.g. the number of groups or the dimensions of exponent matrices.
+    Usage:
+        with instrumentation.stage("parse"):
+            ...
+        instrumentation.metric("response_groups", 3)
+    Remarks:
+        Stages that are entered several times accumulate their time and count
+        the number of calls. Stages can be nested, the time of an inner stage is
+        also included in the time of the outer stage.
+    '''
+
+    enabled = True
+
+    def __init__(self):
+        self.stages = {}
+        self.metrics = {}
+
+    def stage(self, name):
+        return Stage(self, name)
+
+    def add_time(self, name, wall_time, cpu_time):
+        data = self.stages.get(name, None)
+        if data is None:
+            self.stages[name] = {"wall_time": wall_time, "cpu_time": cpu_time, "calls": 1}
+        else:
+            data["wall_time"] += wall_time
+            data["cpu_time"] += cpu_time
+            data["calls"] += 1
+
+    def metric(self, name, value):
+        self.metrics[name] = value
+
+    def count(self, name, increment=1):
+        self.metrics[name] = self.metrics.get(name, 0)+increment
+
+    def report(self):
+        '''
+        Returns the recorded data as a JSON serialisable dictionary of the form
+        {"stages": {name: {"wall_time": seconds, "cpu_time": seconds, "calls": n}, ...}, "metrics": {name: value, ...}}
+        '''
+        return {
+            "stages": {name: dict(data) for (name, data) in self.stages.items()},
+            "metrics": dict(self.metrics),
+        }
+
+
+class NullStage:
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        return False
+
+
+class NullInstrumentation:
+    '''
+    Same interface as Instrumentation but does nothing, used when
+    instrumentation is disabled so that it costs next to nothing.
+    '''
+
+    __slots__ = ()
+
+    enabled = False
+
+    def stage(self, name):
+        return null_stage
+
+    def add_time(self, name, wall_time, cpu_time):
+        pass
+
+    def metric(self, name, value):
+        pass
+
+    def count(self, name, increment=1):
+        pass
+
+    def report(self):
+        return None
+
+
+null_stage = NullStage()
+null_instrumentation = NullInstrumentation()
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def set_sink(sink):
+    '''
+    Input:
+        sink : function that takes a dictionary, or None
+    Output:
+        The previous sink.
+    Remarks:
+        When a sink is set every evaluation is instrumented and the report
+        (see `Instrumentation.report`) is passed to the sink, whether or not
+        the `timings` parameter is set.
+    '''
+    global _sink
+    with _sink_lock:
+        previous_sink = _sink
+        _sink = sink
+    return previous_sink
+
+
+def create_instrumentation(params):
+    '''
+    Returns an Instrumentation if the `timings` parameter is true or a sink
+    has been set, otherwise `null_instrumentation`.
+    '''
+    if _sink is not None or get_flag(params, "timings"):
+        return Instrumentation()
+    return null_instrumentation
+
+
+def publish(instrumentation, result, params):
+    '''
+    Adds the report from the instrumentation to the result, as `timings`, if the
+    `timings` parameter is true and passes it to the sink if one has been set.
+    '''
+    if not instrumentation.enabled:
+        return result
+    report = instrumentation.report()
+    if get_flag(params, "timings"):
+        result["timings"] = report
+    sink = _sink
+    if sink is not None:
+        sink(report)
+    return result
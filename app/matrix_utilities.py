@@ -0,0 +1,357 @@
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd
+
+from sympy import Matrix, Rational
+
+
+def to_fraction(value):
+    '''
+    Returns value as a Fraction if it is an integer or a rational number
+    (python or sympy), otherwise returns None.
+    '''
+    ratio = numerator_and_denominator(value)
+    if ratio is None:
+        return None
+    return Fraction(*ratio)
+
+
+def numerator_and_denominator(value):
+    if isinstance(value, Rational):
+        return (int(value.p), int(value.q))
+    if isinstance(value, int):
+        return (value, 1)
+    if isinstance(value, Fraction):
+        return (value.numerator, value.denominator)
+    return None
+
+
+def lcm(values):
+    result = 1
+    for value in values:
+        result = result*value//gcd(result, value)
+    return result
+
+
+def integer_rows(rows):
+    '''
+    Input:
+        rows : list of rows with rational entries
+    Output:
+        Tuple of rows of python integers where each row is the corresponding input row
+        multiplied by the least common multiple of the denominators of its entries.
+        The integer rows span the same space as the input rows.
+        If some entry is not rational then None is returned.
+    '''
+    result = []
+    for row in rows:
+        ratios = []
+        for value in row:
+            ratio = numerator_and_denominator(value)
+            if ratio is None:
+                return None
+            ratios.append(ratio)
+        multiplier = lcm(q for (p, q) in ratios)
+        result.append(tuple(p*(multiplier//q) for (p, q) in ratios))
+    return tuple(result)
+
+
+def bareiss_rank(rows):
+    '''
+    Computes the rank of a matrix with integer entries using fraction-free
+    (Bareiss) Gaussian elimination. All intermediate values are integers
+    and all divisions are exact.
+    '''
+    matrix = [list(row) for row in rows if any(row)]
+    if len(matrix) == 0:
+        return 0
+    number_of_rows = len(matrix)
+    number_of_columns = len(matrix[0])
+    rank = 0
+    previous_pivot = 1
+    for column in range(number_of_columns):
+        pivot_row = None
+        for i in range(rank, number_of_rows):
+            if matrix[i][column] != 0:
+                pivot_row = i
+                break
+        if pivot_row is None:
+            continue
+        matrix[rank], matrix[pivot_row] = matrix[pivot_row], matrix[rank]
+        pivot = matrix[rank][column]
+        pivot_values = matrix[rank]
+        for i in range(rank+1, number_of_rows):
+            row = matrix[i]
+            factor = row[column]
+            for j in range(column+1, number_of_columns):
+                row[j] = (pivot*row[j]-factor*pivot_values[j])//previous_pivot
+            row[column] = 0
+        previous_pivot = pivot
+        rank += 1
+        if rank == number_of_rows:
+            break
+    return rank
+
+
+@lru_cache(maxsize=1024)
+def cached_bareiss_rank(rows):
+    return bareiss_rank(rows)
+
+
+def matrix_rank(matrix):
+    '''
+    Input:
+        matrix : sympy Matrix or list of rows
+    Output:
+        The rank of the matrix. If all entries are rational the rank is computed
+        exactly with `bareiss_rank` and memoized, otherwise sympy is used.
+    '''
+    if isinstance(matrix, Matrix):
+        rows = matrix.tolist()
+    else:
+        rows = matrix
+    rows = list(rows)
+    converted_rows = integer_rows(rows)
+    if converted_rows is None:
+        return Matrix(rows).rank()
+    return cached_bareiss_rank(converted_rows)
+
+
+def hermite_normal_form(rows):
+    '''
+    Input:
+        rows : list of rows of python integers
+    Output:
+        List with the nonzero rows of the Hermite normal form of the matrix, i.e.
+        a basis for the lattice spanned by the rows where the first nonzero entry
+        (the pivot) of each row is positive and to the right of the pivot of the
+        row before, and the entries above each pivot are non-negative and smaller
+        than the pivot. The Hermite normal form is the same for all matrices whose
+        rows span the same lattice.
+    '''
+    matrix = [list(row) for row in rows if any(row)]
+    if len(matrix) == 0:
+        return []
+    number_of_columns = len(matrix[0])
+    rank = 0
+    for column in range(number_of_columns):
+        # Euclid's algorithm on the entries in the column below the pivots found so far
+        while True:
+            nonzero = [i for i in range(rank, len(matrix)) if matrix[i][column] != 0]
+            if len(nonzero) <= 1:
+                break
+            smallest = min(nonzero, key=lambda i: abs(matrix[i][column]))
+            matrix[rank], matrix[smallest] = matrix[smallest], matrix[rank]
+            pivot_values = matrix[rank]
+            for i in range(rank+1, len(matrix)):
+                quotient = matrix[i][column]//pivot_values[column]
+                if quotient != 0:
+                    matrix[i] = [a-quotient*b for (a, b) in zip(matrix[i], pivot_values)]
+        if len(nonzero) == 0:
+            continue
+        matrix[rank], matrix[nonzero[0]] = matrix[nonzero[0]], matrix[rank]
+        if matrix[rank][column] < 0:
+            matrix[rank] = [-a for a in matrix[rank]]
+        pivot_values = matrix[rank]
+        for i in range(rank):
+            quotient = matrix[i][column]//pivot_values[column]
+            if quotient != 0:
+                matrix[i] = [a-quotient*b for (a, b) in zip(matrix[i], pivot_values)]
+        rank += 1
+        if rank == len(matrix):
+            break
+    return matrix[:rank]
+
+
+def lll_reduce(basis, delta=Fraction(3, 4)):
+    '''
+    Input:
+        basis : list of linearly independent rows of python integers
+        delta : reduction parameter, 1/4 < delta <= 1
+    Output:
+        List with a basis for the same lattice that is LLL-reduced, i.e. the
+        rows are short and close to orthogonal.
+    Remarks:
+        Uses exact arithmetic and recomputes the Gram-Schmidt orthogonalisation
+        after each change, which is fine for the small bases of dimensionless
+        groups but slow for large bases.
+    '''
+    basis = [list(row) for row in basis]
+
+    def dot(u, v):
+        return sum(a*b for (a, b) in zip(u, v))
+
+    def gram_schmidt():
+        orthogonal = []
+        mu = [[Fraction(0)]*len(basis) for _ in basis]
+        for i, row in enumerate(basis):
+            vector = [Fraction(a) for a in row]
+            for j in range(i):
+                mu[i][j] = dot(row, orthogonal[j])/dot(orthogonal[j], orthogonal[j])
+                vector = [a-mu[i][j]*b for (a, b) in zip(vector, orthogonal[j])]
+            orthogonal.append(vector)
+        return orthogonal, mu
+
+    orthogonal, mu = gram_schmidt()
+    k = 1
+    while k < len(basis):
+        for j in reversed(range(k)):
+            quotient = round(mu[k][j])
+            if quotient != 0:
+                basis[k] = [a-quotient*b for (a, b) in zip(basis[k], basis[j])]
+                orthogonal, mu = gram_schmidt()
+        if dot(orthogonal[k], orthogonal[k]) >= (delta-mu[k][k-1]**2)*dot(orthogonal[k-1], orthogonal[k-1]):
+            k += 1
+        else:
+            basis[k], basis[k-1] = basis[k-1], basis[k]
+            orthogonal, mu = gram_schmidt()
+            k = max(k-1, 1)
+    return basis
+
+
+@lru_cache(maxsize=256)
+def integer_nullspace(rows, reduce=True):
+    '''
+    Input:
+        rows   : tuple of rows of python integers, see `integer_rows`
+        reduce : if True the basis is LLL-reduced so that the entries are small
+    Output:
+        Tuple with a basis, as tuples of python integers, for the integer vectors
+        x such that the product of the matrix and x is zero.
+    Remarks:
+        The basis is the Hermite normal form of the lattice of such vectors, which
+        only depends on the lattice. If reduce is True this basis is LLL-reduced
+        and the first nonzero entry of each vector is made positive, which also
+        gives the same basis for matrices with the same integer nullspace.
+        The lattice is found from the Hermite normal form of the transpose of the
+        matrix next to an identity matrix: the rows where the transpose part is
+        zero contain a basis for the lattice in the identity part.
+    '''
+    if len(rows) == 0:
+        return tuple()
+    number_of_rows = len(rows)
+    number_of_columns = len(rows[0])
+    augmented = [[row[j] for row in rows]+[int(i == j) for i in range(number_of_columns)] for j in range(number_of_columns)]
+    basis = [row[number_of_rows:] for row in hermite_normal_form(augmented) if not any(row[:number_of_rows])]
+    if reduce and len(basis) > 1:
+        basis = lll_reduce(basis)
+        basis = [[-a for a in row] if next(a for a in row if a != 0) < 0 else row for row in basis]
+    return tuple(tuple(row) for row in basis)
+
+
+class RowSpace:
+    '''
+    Echelon basis for the space spanned by a set of rows with rational entries.
+    Once the basis has been computed, checking if a row lies in the space only
+    requires one pass over the basis rows.
+    Remarks:
+        Each basis row is stored together with the index of its pivot. The pivot
+        entry of a basis row is 1 and every basis row is zero at the pivots of
+        the basis rows added before it, so a row can be reduced by subtracting
+        the basis rows in the order they were added.
+    '''
+
+    def __init__(self, rows=tuple()):
+        self.basis = []
+        for row in rows:
+            self.add(row)
+
+    @property
+    def rank(self):
+        return len(self.basis)
+
+    def copy(self):
+        row_space = RowSpace()
+        row_space.basis = list(self.basis)
+        return row_space
+
+    def reduce(self, row):
+        '''
+        Returns the remainder (as a list of Fractions) of the row after the
+        components that lie in the row space have been removed.
+        '''
+        remainder = [to_fraction(value) for value in row]
+        if None in remainder:
+            raise ValueError("RowSpace only supports rows with rational entries")
+        for (pivot, basis_row) in self.basis:
+            factor = remainder[pivot]
+            if factor != 0:
+                for j, value in enumerate(basis_row):
+                    if value != 0:
+                        remainder[j] -= factor*value
+        return remainder
+
+    def contains(self, row):
+        return not any(self.reduce(row))
+
+    def add(self, row):
+        '''
+        Adds the row to the set that spans the row space,
+        returns True if this increased the rank.
+        '''
+        remainder = self.reduce(row)
+        for pivot, value in enumerate(remainder):
+            if value != 0:
+                self.basis.append((pivot, [x/value for x in remainder]))
+                return True
+        return False
+
+
+class SympyRowSpace:
+    '''
+    Same interface as RowSpace, for rows with entries that are not rational
+    numbers. Uses sympy to compute ranks.
+    '''
+
+    def __init__(self, rows=tuple()):
+        self.rows = [list(row) for row in rows]
+        self.rank = Matrix(self.rows).rank() if len(self.rows) > 0 else 0
+
+    def copy(self):
+        return SympyRowSpace(self.rows)
+
+    def contains(self, row):
+        return Matrix(self.rows+[list(row)]).rank() == self.rank
+
+    def add(self, row):
+        self.rows.append(list(row))
+        rank = Matrix(self.rows).rank()
+        increased = rank > self.rank
+        self.rank = rank
+        return increased
+
+
+def reduced_row_echelon_form(rows):
+    '''
+    Input:
+        rows : list of rows with rational entries
+    Output:
+        Tuple with the nonzero rows (as tuples of Fractions) of the reduced row echelon
+        form of the matrix with the given rows, or None if some entry is not rational.
+    Remarks:
+        Two lists of rows span the same space if and only if they have the same
+        reduced row echelon form, so the result can be used as a key for the space.
+    '''
+    rows = list(rows)
+    if integer_rows(rows) is None:
+        return None
+    # Basis rows are zero before their pivot, so sorting by pivot gives an echelon form
+    basis = sorted(RowSpace(rows).basis, key=lambda pivot_and_row: pivot_and_row[0])
+    reduced = [row for (pivot, row) in basis]
+    for (i, (pivot, row)) in enumerate(basis):
+        for j in range(i):
+            factor = reduced[j][pivot]
+            if factor != 0:
+                reduced[j] = [a-factor*b for (a, b) in zip(reduced[j], reduced[i])]
+    return tuple(tuple(row) for row in reduced)
+
+
+def create_row_space(rows):
+    '''
+    Returns a RowSpace for the given rows if all entries are rational,
+    otherwise a SympyRowSpace.
+    '''
+    rows = list(rows)
+    if integer_rows(rows) is None:
+        return SympyRowSpace(rows)
+    return RowSpace(rows)
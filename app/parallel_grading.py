@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache_utilities import fingerprint
+from .complexity_utilities import time_limit
+from .evaluation import evaluation_function
+from .server import warm_up
+
+# Default time limit, in seconds, for evaluating a single response
+default_time_limit = 10
+
+# Default number of responses sent to a worker at a time
+default_chunk_size = 16
+
+
+class EvaluationTimeout(BaseException):
+    # Not an Exception subclass since sympy catches and ignores those in places
+    pass
+
+
+def grade_submission(response, answer, params, seconds=default_time_limit):
+    '''
+    Input:
+        response, answer, params : as for `evaluation_function`
+        seconds                  : time limit for the evaluation, or None
+    Output:
+        The result from `evaluation_function`, or a dictionary of the form
+        {"error": {"message": string}} if the evaluation raised an exception or
+        took too long (then the error also contains "timeout": True).
+    '''
+    try:
+        with time_limit(seconds, EvaluationTimeout):
+            return evaluation_function(response, answer, params)
+    except EvaluationTimeout:
+        return {"error": {"message": f"Evaluation took longer than the time limit of {seconds} s.", "timeout": True}}
+    except Exception as e:
+        return {"error": {"message": str(e)}}
+
+
+def grade_chunk(chunk, seconds):
+    # Runs in a worker process, the responses in a chunk have the same task so
+    # the compiled task is reused from the worker's cache
+    return [(index, grade_submission(response, answer, params, seconds)) for (index, response, answer, params) in chunk]
+
+
+def create_chunks(submissions, chunk_size):
+    '''
+    Input:
+        submissions : list of (response, answer, params) tuples
+        chunk_size  : largest number of submissions in a chunk
+    Output:
+        List of chunks, each a list of (index, response, answer, params) tuples
+        where index is the position of the submission in the input. All
+        submissions in a chunk have the same answer and parameters.
+    '''
+    submissions_by_task = {}
+    for (index, (response, answer, params)) in enumerate(submissions):
+        key = fingerprint(answer, params)
+        submissions_by_task.setdefault(key, []).append((index, response, answer, params))
+    chunks = []
+    for task_submissions in submissions_by_task.values():
+        for start in range(0, len(task_submissions), chunk_size):
+            chunks.append(task_submissions[start:start+chunk_size])
+    return chunks
+
+
+def grade_in_parallel(submissions, processes=None, chunk_size=default_chunk_size, seconds=default_time_limit):
+    '''
+    Input:
+        submissions : list of (response, answer, params) tuples
+        processes   : number of worker processes, defaults to the number of CPUs
+        chunk_size  : largest number of submissions sent to a worker at a time
+        seconds     : time limit for evaluating each submission, or None
+    Output:
+        List with the result of `grade_submission` for each submission,
+        in the same order as the submissions.
+    Remarks:
+        Submissions are grouped by answer and parameters before they are split
+        into chunks, so that each worker grades runs of responses to the same
+        task and reuses the compiled task. Each worker has its own caches and is
+        warmed up before it gets any submissions, so that the time limit is not
+        used up by loading sympy.
+    '''
+    submissions = list(submissions)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    results = [None]*len(submissions)
+    chunks = create_chunks(submissions, chunk_size)
+    with ProcessPoolExecutor(max_workers=processes, initializer=warm_up) as executor:
+        for graded_chunk in executor.map(grade_chunk, chunks, [seconds]*len(chunks)):
+            for (index, result) in graded_chunk:
+                results[index] = result
+    return results
@@ -0,0 +1,159 @@
+import types
+from collections.abc import Mapping
+
+from .cache_utilities import LRUCache, fingerprint
+from .complexity_utilities import default_complexity_limits
+
+# Set for every task unless given in the parameters
+default_parameters = {"comparison": "expression", "strict_syntax": True}
+
+# Parameters that only affect how the evaluation is reported, i.e. not the result
+reporting_parameters = ("timings", "response_latex")
+
+# Flags are true or false (or 1 and 0), null means that the default value is used, see `get_flag`
+boolean_parameters = ("strict_syntax", "elementary_functions", "specialFunctions", "complexNumbers", "is_latex", "timings", "response_latex")
+
+
+def freeze(value):
+    '''
+    Returns a read-only copy of JSON-like data, dictionaries are replaced by
+    read-only mappings and lists by tuples.
+    '''
+    if isinstance(value, Mapping):
+        return types.MappingProxyType({key: freeze(item) for (key, item) in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def is_list_of_strings(value):
+    return isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value)
+
+
+def is_boolean(value):
+    return value is None or isinstance(value, bool) or (isinstance(value, int) and value in (0, 1))
+
+
+def get_flag(params, name, default=False):
+    '''
+    Returns the value of the boolean parameter with the given name as True or False.
+    Parameters that are not given or are null (None) have the default value.
+    '''
+    value = params.get(name, None)
+    if value is None:
+        return default
+    return bool(value)
+
+
+def validate_flags(params, names):
+    for name in names:
+        if name in params and not is_boolean(params[name]):
+            raise Exception(f"Parameter `{name}` must be true or false.")
+
+
+def validate_parameters(params):
+    '''
+    Raises an exception that describes the problem if the parameters do not
+    have the expected types, e.g. if an entry in `symbols` has no list of aliases.
+    '''
+    if not isinstance(params, Mapping):
+        raise Exception("Parameters must be given as a dictionary.")
+    validate_flags(params, boolean_parameters)
+    if not isinstance(params.get("comparison", ""), str):
+        raise Exception("Parameter `comparison` must be a string.")
+    if not isinstance(params.get("quantities", ""), (str, list, tuple, Mapping)):
+        raise Exception("Parameter `quantities` must be a string, a list or a dictionary.")
+    symbols = params.get("symbols", {})
+    if not isinstance(symbols, Mapping):
+        raise Exception("Parameter `symbols` must be a dictionary.")
+    for (code, symbol_data) in symbols.items():
+        if not isinstance(code, str) or not isinstance(symbol_data, Mapping):
+            raise Exception("Each entry in `symbols` must be a dictionary.")
+        if not is_list_of_strings(symbol_data.get("aliases", [])):
+            raise Exception(f"Aliases for symbol `{code}` must be a list of strings.")
+        if not isinstance(symbol_data.get("latex", ""), str):
+            raise Exception(f"LaTeX for symbol `{code}` must be a string.")
+    for input_symbol in params.get("input_symbols", []):
+        if not isinstance(input_symbol, (list, tuple)) or len(input_symbol) != 2 or not isinstance(input_symbol[0], str) or not is_list_of_strings(input_symbol[1]):
+            raise Exception("Each entry in `input_symbols` must be a pair of a string and a list of strings.")
+    custom_feedback = params.get("custom_feedback", {})
+    if not isinstance(custom_feedback, Mapping):
+        raise Exception("Parameter `custom_feedback` must be a dictionary.")
+    if not isinstance(params.get("custom_feedback_combinations", {}), Mapping):
+        raise Exception("Parameter `custom_feedback_combinations` must be a dictionary.")
+    complexity_limits = params.get("complexity_limits", {})
+    if not isinstance(complexity_limits, Mapping):
+        raise Exception("Parameter `complexity_limits` must be a dictionary.")
+    for (name, limit) in complexity_limits.items():
+        if name not in default_complexity_limits:
+            raise Exception(f"Unknown complexity limit `{name}`.")
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, (int, float)) or limit <= 0):
+            raise Exception(f"Complexity limit `{name}` must be a positive number or null.")
+
+
+class TaskParameters(Mapping):
+    '''
+    Validated, read-only copy of the parameters given to the evaluation and
+    preview functions, with default values filled in. Changing the dictionary
+    that it was created from afterwards does not change it, so it can be shared
+    between requests (and threads) and cached.
+    Remarks:
+        Parameters that only affect how results are reported, see
+        `reporting_parameters`, are left out since they do not change results.
+        Nested dictionaries and lists are replaced by read-only mappings and tuples.
+        Two objects with the same fingerprint have the same content.
+    '''
+
+    __slots__ = ("_parameters", "fingerprint")
+
+    def __init__(self, params):
+        validate_parameters(params)
+        parameters = dict(default_parameters)
+        # Flags that are null have their default value
+        parameters.update((key, value) for (key, value) in params.items() if key not in reporting_parameters and not (key in boolean_parameters and value is None))
+        object.__setattr__(self, "fingerprint", fingerprint(parameters))
+        object.__setattr__(self, "_parameters", freeze(parameters))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TaskParameters objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("TaskParameters objects are immutable")
+
+    def __getitem__(self, key):
+        return self._parameters[key]
+
+    def __iter__(self):
+        return iter(self._parameters)
+
+    def __len__(self):
+        return len(self._parameters)
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __eq__(self, other):
+        if isinstance(other, TaskParameters):
+            return self.fingerprint == other.fingerprint
+        return Mapping.__eq__(self, other)
+
+    def __repr__(self):
+        return "TaskParameters("+repr(dict(self._parameters))+")"
+
+
+task_parameters_cache = LRUCache(maxsize=256)
+
+
+def get_task_parameters(params):
+    '''
+    Returns the TaskParameters for the given parameter dictionary, reusing
+    a previously created object if the content of the dictionary is the same.
+    '''
+    if isinstance(params, TaskParameters):
+        return params
+    if not isinstance(params, Mapping):
+        validate_parameters(params)
+    # Reporting parameters are not part of the key, so they are checked for every call
+    validate_flags(params, reporting_parameters)
+    key = fingerprint({key: value for (key, value) in params.items() if key not in reporting_parameters})
+    return task_parameters_cache.get_or_create(key, lambda: TaskParameters(params))
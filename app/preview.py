@@ -1,13 +1,19 @@
 import re
+import threading
+from functools import lru_cache
 from typing import Any, Dict, TypedDict, List
-from latex2sympy2 import latex2sympy
 from sympy import latex, Symbol
 
 from .buckingham_pi_utilities import (
     names_of_dimensions,
-    find_matching_parenthesis
+    find_matching_parenthesis,
+    split_quantities,
+    has_quantities
 )
 from .expression_utilities import preprocess_expression, parse_expression, create_sympy_parsing_params
+from .cache_utilities import LRUCache, fingerprint
+from .group_utilities import normalize_group, parsing_params_fingerprint
+from .parameter_utilities import get_flag, get_task_parameters
 
 
 class Params(TypedDict):
@@ -53,20 +59,55 @@ def extract_latex(symbol):
     return match.group("latex")
 
 
-def parse_latex(response: str, symbols: SymbolDict) -> str:
-    """Parse a LaTeX string to a sympy string while preserving custom symbols.
+@lru_cache(maxsize=None)
+def load_latex_parser():
+    """Imports the LaTeX parser on first use.
+
+    Importing latex2sympy2 (and the ANTLR runtime it depends on) is a
+    noticeable part of the cold start time, so it is only done for tasks
+    that use LaTeX input.
+
+    Returns:
+        The latex2sympy function.
+    """
+    from latex2sympy2 import latex2sympy
+    return latex2sympy
+
+
+def prewarm_latex_parser():
+    """Starts importing the LaTeX parser in a background thread.
+
+    Returns:
+        threading.Thread: The thread doing the import.
+    """
+    thread = threading.Thread(target=load_latex_parser, daemon=True)
+    thread.start()
+    return thread
+
+
+# latex2sympy keeps the substitutions for the current call in a module level
+# variable, so calls from different threads must not overlap
+latex_parser_lock = threading.Lock()
+
+# Substitutions for the LaTeX of the symbols, keyed by a fingerprint of the LaTeX
+latex_symbol_substitutions_cache = LRUCache(maxsize=256)
+
+
+def create_latex_symbol_substitutions(symbols: SymbolDict) -> Dict[Any, Symbol]:
+    """Parses the LaTeX of each symbol.
 
     Args:
-        response (str): The LaTeX expression to parse.
         symbols (SymbolDict): A mapping of sympy symbol strings and LaTeX
         symbol strings.
 
     Raises:
-        ValueError: If the LaTeX string or symbol couldn't be parsed.
+        ValueError: If the LaTeX of a symbol couldn't be parsed.
 
     Returns:
-        str: The expression in sympy syntax.
+        Dict[Any, Symbol]: The parsed LaTeX of each symbol mapped to the
+        corresponding sympy symbol.
     """
+    latex2sympy = load_latex_parser()
     substitutions = {}
 
     for sympy_symbol_str in symbols:
@@ -74,7 +115,8 @@ def parse_latex(response: str, symbols: SymbolDict) -> str:
         latex_symbol_str = extract_latex(symbol_str)
 
         try:
-            latex_symbol = latex2sympy(latex_symbol_str)
+            with latex_parser_lock:
+                latex_symbol = latex2sympy(latex_symbol_str)
         except Exception:
             raise ValueError(
                 f"Couldn't parse latex symbol {latex_symbol_str} "
@@ -83,8 +125,52 @@ def parse_latex(response: str, symbols: SymbolDict) -> str:
 
         substitutions[latex_symbol] = Symbol(sympy_symbol_str)
 
+    return substitutions
+
+
+def latex_symbol_substitutions(symbols: SymbolDict) -> Dict[Any, Symbol]:
+    """Returns the substitutions for the symbols, see
+    `create_latex_symbol_substitutions`.
+
+    The substitutions only depend on the LaTeX of each symbol, so they are
+    computed once and reused for all groups and requests with the same
+    symbols. The returned dictionary is shared and must not be modified.
+
+    Args:
+        symbols (SymbolDict): A mapping of sympy symbol strings and LaTeX
+        symbol strings.
+
+    Returns:
+        Dict[Any, Symbol]: The parsed LaTeX of each symbol mapped to the
+        corresponding sympy symbol.
+    """
+    key = fingerprint([(name, symbols[name]["latex"]) for name in symbols])
+    return latex_symbol_substitutions_cache.get_or_create(
+        key,
+        lambda: create_latex_symbol_substitutions(symbols)
+    )
+
+
+def parse_latex(response: str, symbols: SymbolDict) -> str:
+    """Parse a LaTeX string to a sympy string while preserving custom symbols.
+
+    Args:
+        response (str): The LaTeX expression to parse.
+        symbols (SymbolDict): A mapping of sympy symbol strings and LaTeX
+        symbol strings.
+
+    Raises:
+        ValueError: If the LaTeX string or symbol couldn't be parsed.
+
+    Returns:
+        str: The expression in sympy syntax.
+    """
+    latex2sympy = load_latex_parser()
+    substitutions = latex_symbol_substitutions(symbols)
+
     try:
-        expression = latex2sympy(response, substitutions)
+        with latex_parser_lock:
+            expression = latex2sympy(response, substitutions)
 
         if isinstance(expression, list):
             expression = expression.pop()
@@ -96,8 +182,11 @@ def parse_latex(response: str, symbols: SymbolDict) -> str:
 
 
 def expression_to_latex(expression, parameters, parsing_params):
-    unsplittable_symbols = parsing_params.get("unsplittable_symbols", ())
-    symbol_dict = parsing_params.get("symbol_dict", {})
+    # Without quantities the symbols are written in the order they are
+    # given in, which requires parsing with non-commutative symbols
+    ordered_symbols = not has_quantities(parameters.get("quantities", None))
+    if ordered_symbols:
+        parsing_params = parsing_params.replace(noncommutative_symbols=True)
 
     try:
         expression_preview = parse_expression(expression, parsing_params)
@@ -106,23 +195,19 @@ def expression_to_latex(expression, parameters, parsing_params):
 
     symbs_dic = {}
     symbol_names = {}
-    if not len(parameters.get("quantities", [])) > 0:
-        symbs = expression_preview.atoms(Symbol)
-        symbs_dic = {str(x): Symbol(str(x), commutative=False) for x in symbs}
-        parsing_params_latex = parsing_params.copy()
-        parsing_params_latex["symbol_dict"] = symbs_dic
-        expression_preview = parse_expression(expression, parsing_params_latex)
+    if ordered_symbols:
+        symbs_dic = {str(x): x for x in expression_preview.atoms(Symbol) if not x.is_commutative}
         for x in symbs_dic.values():
             symbol_names.update({x: "~\\mathrm{"+str(x)+"}"})
     latex_str = latex(expression_preview, symbol_names=symbol_names)
     sympy_str = str(expression_preview)
-    for symbol in symbs_dic.keys():
-        if symbol not in symbol_dict.keys() and symbol not in unsplittable_symbols:
-            if symbol in globals():
-                del globals()[symbol]
     return latex_str, sympy_str
 
 
+# Rendered groups, keyed by group string and a fingerprint of the parameters
+preview_latex_cache = LRUCache(maxsize=1024)
+
+
 def sanitise_latex(response):
     response = response.replace('~', ' ')
     response = "".join(response.split())
@@ -168,8 +253,11 @@ def preview_function(response: Any, params: Params) -> Result:
 
     response = sanitise_latex(response)
 
-    symbols = params.get("symbols", {})
-    if params.get("is_latex", False):
+    # Validated read-only copy of the parameters with default values set
+    parameters = get_task_parameters(params)
+
+    symbols = parameters.get("symbols", {})
+    if get_flag(parameters, "is_latex"):
         if ',' in response:
             responses = response.split(',')
             resp_list = []
@@ -179,24 +267,39 @@ def preview_function(response: Any, params: Params) -> Result:
         else:
             response = parse_latex(response, symbols)
 
+    # Quantity names are not split, the same as when the response is evaluated
     unsplittable_symbols = names_of_dimensions
-
-    parameters = {"comparison": "expression", "strict_syntax": True}
-    parameters.update(params)
+    if has_quantities(parameters.get("quantities", None)):
+        try:
+            unsplittable_symbols += tuple(name for (name, _) in split_quantities(parameters["quantities"]))
+        except Exception:
+            # Invalid quantities are reported when the response is evaluated
+            pass
 
     response = preprocess_expression([response], parameters)[0]
     parsing_params = create_sympy_parsing_params(parameters, unsplittable_symbols=unsplittable_symbols)
-    parsing_params.update({"comparison": parameters["comparison"]})
 
     try:
         preview_latex = []
         response_strings = response.split(',')
+        # Groups that have not changed since the last preview are not parsed again
+        configuration = parameters.fingerprint
         for current_response in response_strings:
-            latex, _ = expression_to_latex(current_response, parameters, parsing_params)
+            latex, _ = preview_latex_cache.get_or_create(
+                (current_response, configuration),
+                lambda: expression_to_latex(current_response, parameters, parsing_params)
+            )
             preview_latex.append(latex)
         preview_latex = ",~".join(preview_latex)
         preview_sympy = response
     except Exception as exc:
         raise ValueError("Cannot parse response") from exc
 
+    # Normalize the groups so that they are cached when the response is submitted,
+    # only groups that can be normalized without sympy are normalized here since
+    # previews should be quick
+    parsing_fingerprint = parsing_params_fingerprint(parsing_params)
+    for current_response in response_strings:
+        normalize_group(current_response, parsing_params, parsing_fingerprint, use_sympy=False)
+
     return Result(preview=Preview(latex=preview_latex, sympy=preview_sympy))
@@ -1,6 +1,11 @@
+import os
+import subprocess
+import sys
 import unittest
 
-from .preview import preview_function
+from .preview import preview_function, preview_latex_cache, latex_symbol_substitutions_cache
+from .evaluation import evaluation_function
+from .group_utilities import normalized_group_cache
 
 
 class TestPreviewFunction(unittest.TestCase):
@@ -37,6 +42,63 @@ class TestPreviewFunction(unittest.TestCase):
         result = preview_function(response, params)
         self.assertEqual(result["preview"]["latex"], "\\frac{L U}{\\nu},~\\frac{L f}{U}")
 
+    def test_only_changed_groups_are_rendered(self):
+        params = {"strict_syntax": False}
+        preview_latex_cache.clear()
+        result = preview_function("U*L/nu, f*L/U, N**0*x", params)
+        self.assertEqual(result["preview"]["latex"], r"~\mathrm{U} ~\mathrm{L} ~\mathrm{nu}^{-1},~~\mathrm{f} ~\mathrm{L} ~\mathrm{U}^{-1},~~\mathrm{x}")
+        result = preview_function("U*L/nu, f/U, N**0*x", params)
+        self.assertEqual(result["preview"]["latex"], r"~\mathrm{U} ~\mathrm{L} ~\mathrm{nu}^{-1},~~\mathrm{f} ~\mathrm{U}^{-1},~~\mathrm{x}")
+        statistics = preview_latex_cache.statistics()
+        self.assertEqual((statistics["misses"], statistics["hits"]), (4, 2))
+        preview_function("U*L/nu, f/U, N**0*x", {"strict_syntax": True})
+        self.assertEqual(preview_latex_cache.statistics()["misses"], 7)
+
+    def test_quantity_names_are_not_split(self):
+        params = {"strict_syntax": False, "quantities": "('Dh', '(length)') ('L', '(length)')"}
+        result = preview_function("Dh/L", params)
+        self.assertEqual(result["preview"]["latex"], r"\frac{Dh}{L}")
+
+    def test_latex_symbols_are_parsed_once(self):
+        symbols = {
+            "U": {"latex": r"\(U\)", "aliases": []},
+            "L": {"latex": r"\(L\)", "aliases": []},
+            "nu": {"latex": r"\(\nu\)", "aliases": []},
+            "f": {"latex": r"\(f\)", "aliases": []},
+        }
+        params = {"is_latex": True, "strict_syntax": False, "symbols": symbols}
+        latex_symbol_substitutions_cache.clear()
+        result = preview_function(r"\frac{U L}{\nu}, \frac{f L}{U}", params)
+        self.assertEqual(result["preview"]["sympy"], "L*U/nu,L*f/U")
+        preview_function(r"\frac{U L}{\nu}", {**params, "strict_syntax": True})
+        statistics = latex_symbol_substitutions_cache.statistics()
+        self.assertEqual((statistics["misses"], statistics["hits"]), (1, 2))
+        preview_function(r"\frac{U L}{\nu}", {**params, "symbols": {**symbols, "nu": {"latex": r"\(\mu\)", "aliases": []}}})
+        self.assertEqual(latex_symbol_substitutions_cache.statistics()["misses"], 2)
+
+    def test_preview_normalizes_groups_for_evaluation(self):
+        params = {
+            "strict_syntax": False,
+            "quantities": "('U','(length/time)') ('L','(length)') ('nu','(length**2/time)') ('f','(1/time)')",
+        }
+        normalized_group_cache.clear()
+        preview_function("U*L/nu, f*L/U", params)
+        self.assertEqual(normalized_group_cache.statistics()["size"], 2)
+        result = evaluation_function("U*L/nu, f*L/U", "-", {**params, "timings": True})
+        self.assertEqual(result["is_correct"], True)
+        self.assertEqual(result["timings"]["metrics"]["normalized_group_cache_hits"], 2)
+
+    def test_latex_parser_is_imported_on_demand(self):
+        # A fresh interpreter is needed since other tests have already loaded the parser
+        check = (
+            f"import sys; from {__package__}.evaluation import evaluation_function;"
+            "assert 'latex2sympy2' not in sys.modules;"
+            "evaluation_function('x', 'x', {'is_latex': True});"
+            "assert 'latex2sympy2' in sys.modules"
+        )
+        package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", check], cwd=package_parent, check=True)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,137 @@
+"""
+Keeps the evaluation and preview functions loaded in one long running process
+so that graders that do not run on AWS Lambda only pay the import and warm up
+cost once, and the caches (compiled tasks, normalized groups, previews, ...)
+are shared by all requests.
+
+Run from the repository root with:
+    python -m app.server [--latex]
+
+Requests are read from stdin and responses written to stdout, one JSON object
+per line, responses are written in the order the requests are read:
+    {"id": 1, "command": "eval", "response": "U*L/nu", "answer": "U*L/nu", "params": {...}}
+    {"id": 1, "command": "eval", "result": {...}, "latency": 0.0012}
+
+    {"id": 2, "command": "preview", "response": "U*L/nu", "params": {...}}
+    {"id": 2, "command": "preview", "result": {"preview": {...}}, "latency": 0.0009}
+
+    {"id": 3, "command": "statistics"}
+    {"id": 3, "command": "statistics", "result": {"requests": 2, "caches": {...}, "time_limits": {...}}, "latency": 0.0}
+
+`result` is what `evaluation_function` and `preview_function` return (sets,
+e.g. the tags, are written as sorted lists), `latency` is the wall time in
+seconds spent handling the request and `id` is copied from the request. If the
+request cannot be handled `result` is replaced by {"error": {"message": "..."}}.
+"""
+import json
+import sys
+import time
+
+from .complexity_utilities import time_limit_statistics
+from .evaluation import evaluation_function, compiled_task_cache, validity_cache, latex_cache
+from .group_utilities import normalized_group_cache
+from .parameter_utilities import task_parameters_cache
+from .preview import preview_function, preview_latex_cache, latex_symbol_substitutions_cache, load_latex_parser
+from .unit_tables import get_unit_index
+
+caches = {
+    "compiled_tasks": compiled_task_cache,
+    "validity": validity_cache,
+    "latex": latex_cache,
+    "normalized_groups": normalized_group_cache,
+    "task_parameters": task_parameters_cache,
+    "preview_latex": preview_latex_cache,
+    "latex_symbol_substitutions": latex_symbol_substitutions_cache,
+}
+
+
+def warm_up(latex=False):
+    '''
+    Loads everything that is otherwise loaded by the first request, i.e. the unit
+    tables and the parts of sympy used to simplify groups. If latex is True the
+    LaTeX parser is loaded as well.
+    '''
+    get_unit_index()
+    evaluation_function("x*y", "x*y", {"strict_syntax": False})
+    if latex:
+        load_latex_parser()
+
+
+def json_default(value):
+    # Tags are returned as a set by the evaluation function
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def cache_statistics():
+    return {name: cache.statistics() for (name, cache) in caches.items()}
+
+
+class Server:
+    '''
+    Handles requests in the format described in the module documentation and
+    keeps count of the number of requests handled.
+    '''
+
+    def __init__(self):
+        self.requests = 0
+
+    def handle(self, request):
+        '''
+        Input:
+            request : dictionary with the request
+        Output:
+            Dictionary with the response, without `latency`.
+        '''
+        command = request.get("command", None)
+        if command == "eval":
+            return {"result": evaluation_function(request.get("response", None), request.get("answer", None), request.get("params", {}))}
+        if command == "preview":
+            return {"result": preview_function(request.get("response", None), request.get("params", {}))}
+        if command == "statistics":
+            return {"result": {"requests": self.requests, "caches": cache_statistics(), "time_limits": dict(time_limit_statistics)}}
+        raise Exception(f"Unknown command `{command}`.")
+
+    def handle_line(self, line):
+        '''
+        Input:
+            line : string with one JSON request
+        Output:
+            String with the JSON response, not terminated by a newline.
+        '''
+        start = time.perf_counter()
+        response = {"id": None, "command": None}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise Exception("Request must be a JSON object.")
+            response["id"] = request.get("id", None)
+            response["command"] = request.get("command", None)
+            response.update(self.handle(request))
+        except Exception as e:
+            response["error"] = {"message": str(e)}
+        self.requests += 1
+        response["latency"] = time.perf_counter()-start
+        return json.dumps(response, default=json_default)
+
+    def serve(self, input_stream, output_stream):
+        '''
+        Handles one request per line of input_stream until it is closed,
+        blank lines are ignored.
+        '''
+        for line in input_stream:
+            if len(line.strip()) == 0:
+                continue
+            output_stream.write(self.handle_line(line)+"\n")
+            output_stream.flush()
+
+
+def main(arguments):
+    warm_up(latex="--latex" in arguments)
+    print("ready", file=sys.stderr, flush=True)
+    Server().serve(sys.stdin, sys.stdout)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,15 +1,15 @@
 # This is a generated file, do not edit. Changes to the unit conversion system should be done in unit_system_conversion.py
 convert_SI_base_units_to_dimensions=[[('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('becquerel', '(second**(-1))'), ('coulomb', '(second*ampere)'), ('siemens', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)'), ('sievert', '(metre**2*second**(-2))'), ('newton', '(metre*kilo*gram*second**(-2))'), ('pascal', '(metre**(-1)*kilogram*second**(-2))'), ('hertz', '(second**(-1))'), ('joule', '(metre**2*kilo*gram*second**(-2))'), ('farad', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)'), ('weber', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))'), ('tesla', '(kilo*gram*second**(-2)*ampere**(-1))'), ('henry', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))'), ('lumen', '(candela)'), ('katal', '(second**(-1)*mole)'), ('watt', '(metre**2*kilo*gram*second**(-3))'), ('volt', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))'), ('gray', '(metre**2*second**(-2))'), ('ohm', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))'), ('lux', '(metre**(-2)*candela)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('fluid ounce', '(28.4130625*milli*litre)'), ('gallon', '(4546.09*litre)'), ('quart', '(1.1365225*litre)'), ('ounce', '(28.349523125*gram)'), ('pound', '(0.45359237*kilo*gram)'), ('stone', '(6.35029318*kilo*gram)'), ('inch', '(0.0254*metre)'), ('foot', '(0.3048*metre)'), ('yard', '(0.9144*metre)'), ('mile', '(1609.344*metre)'), ('gill', '(142.0653125*milli*litre)'), ('pint', '(568.26125*milli*litre)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('astronomicalunit', '(149597870700*metre)'), ('atomicmassunit', '(1.66054*10**(-27)*kilo*gram)'), ('nauticalmile', '(1852*metre)'), ('electronvolt', '(1.60218*10**(-19)*joule)'), ('angleminute', '(pi/10800)'), ('anglesecond', '(pi/648000)'), ('steradian', '(1)'), ('metricton', '(10**3*kilo*gram)'), ('roentgen', '(2.58*10**(-4)*kelvin/(kilo*gram))'), ('angstrom', '(10**(-10)*metre)'), ('hectare', '(10**4*metre**2)'), ('radian', '(1)'), ('minute', '(60*second)'), ('degree', '(pi/180)'), ('curie', '(3.7*10**10*becquerel)'), ('liter', '(10**(-3)*metre**3)'), ('neper', '(1)'), ('knot', '((1852/3600)*metre/second)'), ('barn', '(10**(-28)*metre**2)'), ('hour', '(3600*second)'), ('day', '(86400*second)'), ('are', '(10**2*metre**2)'), ('bar', '(10**5*pascal)'), ('rad', '(10**(-2)*gray)'), ('rem', '(10**(-2)*sievert)'), ('bel', '((1/2)*log(10))')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('becquerel', '(second**(-1))'), ('coulomb', '(second*ampere)'), ('siemens', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)'), ('sievert', '(metre**2*second**(-2))'), ('newton', '(metre*kilo*gram*second**(-2))'), ('pascal', '(metre**(-1)*kilogram*second**(-2))'), ('hertz', '(second**(-1))'), ('joule', '(metre**2*kilo*gram*second**(-2))'), ('farad', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)'), ('weber', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))'), ('tesla', '(kilo*gram*second**(-2)*ampere**(-1))'), ('henry', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))'), ('lumen', '(candela)'), ('katal', '(second**(-1)*mole)'), ('watt', '(metre**2*kilo*gram*second**(-3))'), ('volt', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))'), ('gray', '(metre**2*second**(-2))'), ('ohm', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))'), ('lux', '(metre**(-2)*candela)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('yotta', '(10**24)'), ('zetta', '(10**21)'), ('hecto', '(10**2) '), ('centi', '(10**(-2)) '), ('milli', '(10**(-3)) '), ('micro', '(10**(-6)) '), ('femto', '(10**(-15))'), ('zepto', '(10**(-21))'), ('yocto', '(10**(-24))'), ('peta', '(10**15)'), ('tera', '(10**12)'), ('giga', '(10**9) '), ('mega', '(10**6) '), ('kilo', '(10**3) '), ('deka', '(10**1) '), ('deci', '(10**(-1)) '), ('nano', '(10**(-9)) '), ('pico', '(10**(-12))'), ('atto', '(10**(-18))'), ('exa', '(10**18)')], [('candela', 'luminous_intensity'), ('second', 'time'), ('ampere', 'electric_current'), ('kelvin', 'temperature'), ('metre', 'length'), ('gram', 'mass'), ('mole', 'amount_of_substance')]]
-convert_SI_base_units_to_dimensions_short_form=[[('amount_of_substance', 'amount_of_substance'), ('luminous_intensity', 'luminous_intensity'), ('astronomicalunit', 'astronomicalunit'), ('electric_current', 'electric_current'), ('atomicmassunit', 'atomicmassunit'), ('atomicmassunit', 'atomicmassunit'), ('electronvolt', 'electronvolt'), ('nauticalmile', 'nauticalmile'), ('electronvolt', 'electronvolt'), ('fluid ounce', 'fluid ounce'), ('angleminute', 'angleminute'), ('anglesecond', 'anglesecond'), ('fluid ounce', 'fluid ounce'), ('temperature', 'temperature'), ('becquerel', 'becquerel'), ('steradian', 'steradian'), ('metricton', 'metricton'), ('steradian', 'steradian'), ('metricton', 'metricton'), ('angstrom', 'angstrom'), ('roentgen', 'roentgen'), ('angstrom', 'angstrom'), ('candela', 'candela'), ('coulomb', 'coulomb'), ('siemens', 'siemens'), ('sievert', 'sievert'), ('hectare', 'hectare'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('newton', 'newton'), ('pascal', 'pascal'), ('radian', 'radian'), ('minute', 'minute'), ('degree', 'degree'), ('gallon', 'gallon'), ('radian', 'radian'), ('minute', 'minute'), ('degree', 'degree'), ('gallon', 'gallon'), ('length', 'length'), ('metre', 'metre'), ('hertz', 'hertz'), ('joule', 'joule'), ('farad', 'farad'), ('weber', 'weber'), ('tesla', 'tesla'), ('henry', 'henry'), ('lumen', 'lumen'), ('katal', 'katal'), ('liter', 'liter'), ('neper', 'neper'), ('quart', 'quart'), ('ounce', 'ounce'), ('pound', 'pound'), ('stone', 'stone'), ('curie', 'curie'), ('liter', 'liter'), ('neper', 'neper'), ('quart', 'quart'), ('ounce', 'ounce'), ('pound', 'pound'), ('stone', 'stone'), ('yotta', 'yotta'), ('zetta', 'zetta'), ('hecto', 'hecto'), ('centi', 'centi'), ('milli', 'milli'), ('micro', 'micro'), ('femto', 'femto'), ('zepto', 'zepto'), ('yocto', 'yocto'), ('gram', 'gram'), ('mole', 'mole'), ('watt', 'watt'), ('volt', 'volt'), ('gray', 'gray'), ('hour', 'hour'), ('inch', 'inch'), ('foot', 'foot'), ('yard', 'yard'), ('mile', 'mile'), ('gill', 'gill'), ('pint', 'pint'), ('knot', 'knot'), ('barn', 'barn'), ('hour', 'hour'), ('inch', 'inch'), ('foot', 'foot'), ('yard', 'yard'), ('mile', 'mile'), ('gill', 'gill'), ('pint', 'pint'), ('time', 'time'), ('mass', 'mass'), ('peta', 'peta'), ('tera', 'tera'), ('giga', 'giga'), ('mega', 'mega'), ('kilo', 'kilo'), ('deka', 'deka'), ('deci', 'deci'), ('nano', 'nano'), ('pico', 'pico'), ('atto', 'atto'), ('ohm', 'ohm'), ('lux', 'lux'), ('bel', 'bel'), ('day', 'day'), ('are', 'are'), ('bar', 'bar'), ('rad', 'rad'), ('rem', 'rem'), ('bel', 'bel'), ('exa', 'exa'), ('mu*fl oz', 'micro*(fluid ounce)'), ('mu fl oz', 'micro*(fluid ounce)'), ('da*fl oz', 'deka*(fluid ounce)'), ('da fl oz', 'deka*(fluid ounce)'), ('Y*fl oz', 'yotta*(fluid ounce)'), ('Y fl oz', 'yotta*(fluid ounce)'), ('Z*fl oz', 'zetta*(fluid ounce)'), ('Z fl oz', 'zetta*(fluid ounce)'), ('h*fl oz', 'hecto*(fluid ounce)'), ('h fl oz', 'hecto*(fluid ounce)'), ('c*fl oz', 'centi*(fluid ounce)'), ('c fl oz', 'centi*(fluid ounce)'), ('m*fl oz', 'milli*(fluid ounce)'), ('m fl oz', 'milli*(fluid ounce)'), ('mufl oz', 'micro*(fluid ounce)'), ('f*fl oz', 'femto*(fluid ounce)'), ('f fl oz', 'femto*(fluid ounce)'), ('z*fl oz', 'zepto*(fluid ounce)'), ('z fl oz', 'zepto*(fluid ounce)'), ('y*fl oz', 'yocto*(fluid ounce)'), ('y fl oz', 'yocto*(fluid ounce)'), ('P*fl oz', 'peta*(fluid ounce)'), ('P fl oz', 'peta*(fluid ounce)'), ('T*fl oz', 'tera*(fluid ounce)'), ('T fl oz', 'tera*(fluid ounce)'), ('G*fl oz', 'giga*(fluid ounce)'), ('G fl oz', 'giga*(fluid ounce)'), ('M*fl oz', 'mega*(fluid ounce)'), ('M fl oz', 'mega*(fluid ounce)'), ('k*fl oz', 'kilo*(fluid ounce)'), ('k fl oz', 'kilo*(fluid ounce)'), ('dafl oz', 'deka*(fluid ounce)'), ('d*fl oz', 'deci*(fluid ounce)'), ('d fl oz', 'deci*(fluid ounce)'), ('n*fl oz', 'nano*(fluid ounce)'), ('n fl oz', 'nano*(fluid ounce)'), ('p*fl oz', 'pico*(fluid ounce)'), ('p fl oz', 'pico*(fluid ounce)'), ('a*fl oz', 'atto*(fluid ounce)'), ('a fl oz', 'atto*(fluid ounce)'), ('E*fl oz', 'exa*(fluid ounce)'), ('E fl oz', 'exa*(fluid ounce)'), ('Yfl oz', 'yotta*(fluid ounce)'), ('Zfl oz', 'zetta*(fluid ounce)'), ('hfl oz', 'hecto*(fluid ounce)'), ('cfl oz', 'centi*(fluid ounce)'), ('mfl oz', 'milli*(fluid ounce)'), ('mu*mol', 'micro*(mole)'), ('mu mol', 'micro*(mole)'), ('mu*kat', 'micro*(katal)'), ('mu kat', 'micro*(katal)'), ('mu*min', 'micro*(minute)'), ('mu min', 'micro*(minute)'), ('mu*deg', 'micro*(degree)'), ('mu deg', 'micro*(degree)'), ('mu*gal', 'micro*(gallon)'), ('mu gal', 'micro*(gallon)'), ('ffl oz', 'femto*(fluid ounce)'), ('zfl oz', 'zepto*(fluid ounce)'), ('yfl oz', 'yocto*(fluid ounce)'), ('Pfl oz', 'peta*(fluid ounce)'), ('Tfl oz', 'tera*(fluid ounce)'), ('Gfl oz', 'giga*(fluid ounce)'), ('Mfl oz', 'mega*(fluid ounce)'), ('kfl oz', 'kilo*(fluid ounce)'), ('da*mol', 'deka*(mole)'), ('da mol', 'deka*(mole)'), ('da*kat', 'deka*(katal)'), ('da kat', 'deka*(katal)'), ('da*min', 'deka*(minute)'), ('da min', 'deka*(minute)'), ('da*deg', 'deka*(degree)'), ('da deg', 'deka*(degree)'), ('da*gal', 'deka*(gallon)'), ('da gal', 'deka*(gallon)'), ('dfl oz', 'deci*(fluid ounce)'), ('nfl oz', 'nano*(fluid ounce)'), ('pfl oz', 'pico*(fluid ounce)'), ('afl oz', 'atto*(fluid ounce)'), ('Efl oz', 'exa*(fluid ounce)'), ('Y*mol', 'yotta*(mole)'), ('Y mol', 'yotta*(mole)'), ('Y*kat', 'yotta*(katal)'), ('Y kat', 'yotta*(katal)'), ('Y*min', 'yotta*(minute)'), ('Y min', 'yotta*(minute)'), ('Y*deg', 'yotta*(degree)'), ('Y deg', 'yotta*(degree)'), ('Y*gal', 'yotta*(gallon)'), ('Y gal', 'yotta*(gallon)'), ('Z*mol', 'zetta*(mole)'), ('Z mol', 'zetta*(mole)'), ('Z*kat', 'zetta*(katal)'), ('Z kat', 'zetta*(katal)'), ('Z*min', 'zetta*(minute)'), ('Z min', 'zetta*(minute)'), ('Z*deg', 'zetta*(degree)'), ('Z deg', 'zetta*(degree)'), ('Z*gal', 'zetta*(gallon)'), ('Z gal', 'zetta*(gallon)'), ('h*mol', 'hecto*(mole)'), ('h mol', 'hecto*(mole)'), ('h*kat', 'hecto*(katal)'), ('h kat', 'hecto*(katal)'), ('h*min', 'hecto*(minute)'), ('h min', 'hecto*(minute)'), ('h*deg', 'hecto*(degree)'), ('h deg', 'hecto*(degree)'), ('h*gal', 'hecto*(gallon)'), ('h gal', 'hecto*(gallon)'), ('c*mol', 'centi*(mole)'), ('c mol', 'centi*(mole)'), ('c*kat', 'centi*(katal)'), ('c kat', 'centi*(katal)'), ('c*min', 'centi*(minute)'), ('c min', 'centi*(minute)'), ('c*deg', 'centi*(degree)'), ('c deg', 'centi*(degree)'), ('c*gal', 'centi*(gallon)'), ('c gal', 'centi*(gallon)'), ('m*mol', 'milli*(mole)'), ('m mol', 'milli*(mole)'), ('m*kat', 'milli*(katal)'), ('m kat', 'milli*(katal)'), ('m*min', 'milli*(minute)'), ('m min', 'milli*(minute)'), ('m*deg', 'milli*(degree)'), ('m deg', 'milli*(degree)'), ('m*gal', 'milli*(gallon)'), ('m gal', 'milli*(gallon)'), ('mu*cd', 'micro*(candela)'), ('mu cd', 'micro*(candela)'), ('mumol', 'micro*(mole)'), ('mu*Bq', 'micro*(becquerel)'), ('mu Bq', 'micro*(becquerel)'), ('mu*Sv', 'micro*(sievert)'), ('mu Sv', 'micro*(sievert)'), ('mu*Pa', 'micro*(pascal)'), ('mu Pa', 'micro*(pascal)'), ('mu*Hz', 'micro*(hertz)'), ('mu Hz', 'micro*(hertz)'), ('mu*Wb', 'micro*(weber)'), ('mu Wb', 'micro*(weber)'), ('mu*lm', 'micro*(lumen)'), ('mu lm', 'micro*(lumen)'), ('mukat', 'micro*(katal)'), ('mu*Gy', 'micro*(gray)'), ('mu Gy', 'micro*(gray)'), ('mu*lx', 'micro*(lux)'), ('mu lx', 'micro*(lux)'), ('mu*eV', 'micro*(electronvolt)'), ('mu eV', 'micro*(electronvolt)'), ('mu*sr', 'micro*(steradian)'), ('mu sr', 'micro*(steradian)'), ('mumin', 'micro*(minute)'), ('mudeg', 'micro*(degree)'), ('mu*Np', 'micro*(neper)'), ('mu Np', 'micro*(neper)'), ('mugal', 'micro*(gallon)'), ('mu*qt', 'micro*(quart)'), ('mu qt', 'micro*(quart)'), ('mu*oz', 'micro*(ounce)'), ('mu oz', 'micro*(ounce)'), ('mu*lb', 'micro*(pound)'), ('mu lb', 'micro*(pound)'), ('mu*st', 'micro*(stone)'), ('mu st', 'micro*(stone)'), ('mu*in', 'micro*(inch)'), ('mu in', 'micro*(inch)'), ('mu*ft', 'micro*(foot)'), ('mu ft', 'micro*(foot)'), ('mu*yd', 'micro*(yard)'), ('mu yd', 'micro*(yard)'), ('mu*mi', 'micro*(mile)'), ('mu mi', 'micro*(mile)'), ('mu*gi', 'micro*(gill)'), ('mu gi', 'micro*(gill)'), ('mu*pt', 'micro*(pint)'), ('mu pt', 'micro*(pint)'), ('f*mol', 'femto*(mole)'), ('f mol', 'femto*(mole)'), ('f*kat', 'femto*(katal)'), ('f kat', 'femto*(katal)'), ('f*min', 'femto*(minute)'), ('f min', 'femto*(minute)'), ('f*deg', 'femto*(degree)'), ('f deg', 'femto*(degree)'), ('f*gal', 'femto*(gallon)'), ('f gal', 'femto*(gallon)'), ('z*mol', 'zepto*(mole)'), ('z mol', 'zepto*(mole)'), ('z*kat', 'zepto*(katal)'), ('z kat', 'zepto*(katal)'), ('z*min', 'zepto*(minute)'), ('z min', 'zepto*(minute)'), ('z*deg', 'zepto*(degree)'), ('z deg', 'zepto*(degree)'), ('z*gal', 'zepto*(gallon)'), ('z gal', 'zepto*(gallon)'), ('y*mol', 'yocto*(mole)'), ('y mol', 'yocto*(mole)'), ('y*kat', 'yocto*(katal)'), ('y kat', 'yocto*(katal)'), ('y*min', 'yocto*(minute)'), ('y min', 'yocto*(minute)'), ('y*deg', 'yocto*(degree)'), ('y deg', 'yocto*(degree)'), ('y*gal', 'yocto*(gallon)'), ('y gal', 'yocto*(gallon)'), ('P*mol', 'peta*(mole)'), ('P mol', 'peta*(mole)'), ('P*kat', 'peta*(katal)'), ('P kat', 'peta*(katal)'), ('P*min', 'peta*(minute)'), ('P min', 'peta*(minute)'), ('P*deg', 'peta*(degree)'), ('P deg', 'peta*(degree)'), ('P*gal', 'peta*(gallon)'), ('P gal', 'peta*(gallon)'), ('T*mol', 'tera*(mole)'), ('T mol', 'tera*(mole)'), ('T*kat', 'tera*(katal)'), ('T kat', 'tera*(katal)'), ('T*min', 'tera*(minute)'), ('T min', 'tera*(minute)'), ('T*deg', 'tera*(degree)'), ('T deg', 'tera*(degree)'), ('T*gal', 'tera*(gallon)'), ('T gal', 'tera*(gallon)'), ('G*mol', 'giga*(mole)'), ('G mol', 'giga*(mole)'), ('G*kat', 'giga*(katal)'), ('G kat', 'giga*(katal)'), ('G*min', 'giga*(minute)'), ('G min', 'giga*(minute)'), ('G*deg', 'giga*(degree)'), ('G deg', 'giga*(degree)'), ('G*gal', 'giga*(gallon)'), ('G gal', 'giga*(gallon)'), ('M*mol', 'mega*(mole)'), ('M mol', 'mega*(mole)'), ('M*kat', 'mega*(katal)'), ('M kat', 'mega*(katal)'), ('M*min', 'mega*(minute)'), ('M min', 'mega*(minute)'), ('M*deg', 'mega*(degree)'), ('M deg', 'mega*(degree)'), ('M*gal', 'mega*(gallon)'), ('M gal', 'mega*(gallon)'), ('k*mol', 'kilo*(mole)'), ('k mol', 'kilo*(mole)'), ('k*kat', 'kilo*(katal)'), ('k kat', 'kilo*(katal)'), ('k*min', 'kilo*(minute)'), ('k min', 'kilo*(minute)'), ('k*deg', 'kilo*(degree)'), ('k deg', 'kilo*(degree)'), ('k*gal', 'kilo*(gallon)'), ('k gal', 'kilo*(gallon)'), ('da*cd', 'deka*(candela)'), ('da cd', 'deka*(candela)'), ('damol', 'deka*(mole)'), ('da*Bq', 'deka*(becquerel)'), ('da Bq', 'deka*(becquerel)'), ('da*Sv', 'deka*(sievert)'), ('da Sv', 'deka*(sievert)'), ('da*Pa', 'deka*(pascal)'), ('da Pa', 'deka*(pascal)'), ('da*Hz', 'deka*(hertz)'), ('da Hz', 'deka*(hertz)'), ('da*Wb', 'deka*(weber)'), ('da Wb', 'deka*(weber)'), ('da*lm', 'deka*(lumen)'), ('da lm', 'deka*(lumen)'), ('dakat', 'deka*(katal)'), ('da*Gy', 'deka*(gray)'), ('da Gy', 'deka*(gray)'), ('da*lx', 'deka*(lux)'), ('da lx', 'deka*(lux)'), ('da*eV', 'deka*(electronvolt)'), ('da eV', 'deka*(electronvolt)'), ('da*sr', 'deka*(steradian)'), ('da sr', 'deka*(steradian)'), ('damin', 'deka*(minute)'), ('dadeg', 'deka*(degree)'), ('da*Np', 'deka*(neper)'), ('da Np', 'deka*(neper)'), ('dagal', 'deka*(gallon)'), ('da*qt', 'deka*(quart)'), ('da qt', 'deka*(quart)'), ('da*oz', 'deka*(ounce)'), ('da oz', 'deka*(ounce)'), ('da*lb', 'deka*(pound)'), ('da lb', 'deka*(pound)'), ('da*st', 'deka*(stone)'), ('da st', 'deka*(stone)'), ('da*in', 'deka*(inch)'), ('da in', 'deka*(inch)'), ('da*ft', 'deka*(foot)'), ('da ft', 'deka*(foot)'), ('da*yd', 'deka*(yard)'), ('da yd', 'deka*(yard)'), ('da*mi', 'deka*(mile)'), ('da mi', 'deka*(mile)'), ('da*gi', 'deka*(gill)'), ('da gi', 'deka*(gill)'), ('da*pt', 'deka*(pint)'), ('da pt', 'deka*(pint)'), ('d*mol', 'deci*(mole)'), ('d mol', 'deci*(mole)'), ('d*kat', 'deci*(katal)'), ('d kat', 'deci*(katal)'), ('d*min', 'deci*(minute)'), ('d min', 'deci*(minute)'), ('d*deg', 'deci*(degree)'), ('d deg', 'deci*(degree)'), ('d*gal', 'deci*(gallon)'), ('d gal', 'deci*(gallon)'), ('n*mol', 'nano*(mole)'), ('n mol', 'nano*(mole)'), ('n*kat', 'nano*(katal)'), ('n kat', 'nano*(katal)'), ('n*min', 'nano*(minute)'), ('n min', 'nano*(minute)'), ('n*deg', 'nano*(degree)'), ('n deg', 'nano*(degree)'), ('n*gal', 'nano*(gallon)'), ('n gal', 'nano*(gallon)'), ('p*mol', 'pico*(mole)'), ('p mol', 'pico*(mole)'), ('p*kat', 'pico*(katal)'), ('p kat', 'pico*(katal)'), ('p*min', 'pico*(minute)'), ('p min', 'pico*(minute)'), ('p*deg', 'pico*(degree)'), ('p deg', 'pico*(degree)'), ('p*gal', 'pico*(gallon)'), ('p gal', 'pico*(gallon)'), ('a*mol', 'atto*(mole)'), ('a mol', 'atto*(mole)'), ('a*kat', 'atto*(katal)'), ('a kat', 'atto*(katal)'), ('a*min', 'atto*(minute)'), ('a min', 'atto*(minute)'), ('a*deg', 'atto*(degree)'), ('a deg', 'atto*(degree)'), ('a*gal', 'atto*(gallon)'), ('a gal', 'atto*(gallon)'), ('E*mol', 'exa*(mole)'), ('E mol', 'exa*(mole)'), ('E*kat', 'exa*(katal)'), ('E kat', 'exa*(katal)'), ('E*min', 'exa*(minute)'), ('E min', 'exa*(minute)'), ('E*deg', 'exa*(degree)'), ('E deg', 'exa*(degree)'), ('E*gal', 'exa*(gallon)'), ('E gal', 'exa*(gallon)'), ('Y*cd', 'yotta*(candela)'), ('Y cd', 'yotta*(candela)'), ('Ymol', 'yotta*(mole)'), ('Y*Bq', 'yotta*(becquerel)'), ('Y Bq', 'yotta*(becquerel)'), ('Y*Sv', 'yotta*(sievert)'), ('Y Sv', 'yotta*(sievert)'), ('Y*Pa', 'yotta*(pascal)'), ('Y Pa', 'yotta*(pascal)'), ('Y*Hz', 'yotta*(hertz)'), ('Y Hz', 'yotta*(hertz)'), ('Y*Wb', 'yotta*(weber)'), ('Y Wb', 'yotta*(weber)'), ('Y*lm', 'yotta*(lumen)'), ('Y lm', 'yotta*(lumen)'), ('Ykat', 'yotta*(katal)'), ('Y*Gy', 'yotta*(gray)'), ('Y Gy', 'yotta*(gray)'), ('Y*lx', 'yotta*(lux)'), ('Y lx', 'yotta*(lux)'), ('Y*eV', 'yotta*(electronvolt)'), ('Y eV', 'yotta*(electronvolt)'), ('Y*sr', 'yotta*(steradian)'), ('Y sr', 'yotta*(steradian)'), ('Ymin', 'yotta*(minute)'), ('Ydeg', 'yotta*(degree)'), ('Y*Np', 'yotta*(neper)'), ('Y Np', 'yotta*(neper)'), ('Ygal', 'yotta*(gallon)'), ('Y*qt', 'yotta*(quart)'), ('Y qt', 'yotta*(quart)'), ('Y*oz', 'yotta*(ounce)'), ('Y oz', 'yotta*(ounce)'), ('Y*lb', 'yotta*(pound)'), ('Y lb', 'yotta*(pound)'), ('Y*st', 'yotta*(stone)'), ('Y st', 'yotta*(stone)'), ('Y*in', 'yotta*(inch)'), ('Y in', 'yotta*(inch)'), ('Y*ft', 'yotta*(foot)'), ('Y ft', 'yotta*(foot)'), ('Y*yd', 'yotta*(yard)'), ('Y yd', 'yotta*(yard)'), ('Y*mi', 'yotta*(mile)'), ('Y mi', 'yotta*(mile)'), ('Y*gi', 'yotta*(gill)'), ('Y gi', 'yotta*(gill)'), ('Y*pt', 'yotta*(pint)'), ('Y pt', 'yotta*(pint)'), ('Z*cd', 'zetta*(candela)'), ('Z cd', 'zetta*(candela)'), ('Zmol', 'zetta*(mole)'), ('Z*Bq', 'zetta*(becquerel)'), ('Z Bq', 'zetta*(becquerel)'), ('Z*Sv', 'zetta*(sievert)'), ('Z Sv', 'zetta*(sievert)'), ('Z*Pa', 'zetta*(pascal)'), ('Z Pa', 'zetta*(pascal)'), ('Z*Hz', 'zetta*(hertz)'), ('Z Hz', 'zetta*(hertz)'), ('Z*Wb', 'zetta*(weber)'), ('Z Wb', 'zetta*(weber)'), ('Z*lm', 'zetta*(lumen)'), ('Z lm', 'zetta*(lumen)'), ('Zkat', 'zetta*(katal)'), ('Z*Gy', 'zetta*(gray)'), ('Z Gy', 'zetta*(gray)'), ('Z*lx', 'zetta*(lux)'), ('Z lx', 'zetta*(lux)'), ('Z*eV', 'zetta*(electronvolt)'), ('Z eV', 'zetta*(electronvolt)'), ('Z*sr', 'zetta*(steradian)'), ('Z sr', 'zetta*(steradian)'), ('Zmin', 'zetta*(minute)'), ('Zdeg', 'zetta*(degree)'), ('Z*Np', 'zetta*(neper)'), ('Z Np', 'zetta*(neper)'), ('Zgal', 'zetta*(gallon)'), ('Z*qt', 'zetta*(quart)'), ('Z qt', 'zetta*(quart)'), ('Z*oz', 'zetta*(ounce)'), ('Z oz', 'zetta*(ounce)'), ('Z*lb', 'zetta*(pound)'), ('Z lb', 'zetta*(pound)'), ('Z*st', 'zetta*(stone)'), ('Z st', 'zetta*(stone)'), ('Z*in', 'zetta*(inch)'), ('Z in', 'zetta*(inch)'), ('Z*ft', 'zetta*(foot)'), ('Z ft', 'zetta*(foot)'), ('Z*yd', 'zetta*(yard)'), ('Z yd', 'zetta*(yard)'), ('Z*mi', 'zetta*(mile)'), ('Z mi', 'zetta*(mile)'), ('Z*gi', 'zetta*(gill)'), ('Z gi', 'zetta*(gill)'), ('Z*pt', 'zetta*(pint)'), ('Z pt', 'zetta*(pint)'), ('h*cd', 'hecto*(candela)'), ('h cd', 'hecto*(candela)'), ('hmol', 'hecto*(mole)'), ('h*Bq', 'hecto*(becquerel)'), ('h Bq', 'hecto*(becquerel)'), ('h*Sv', 'hecto*(sievert)'), ('h Sv', 'hecto*(sievert)'), ('h*Pa', 'hecto*(pascal)'), ('h Pa', 'hecto*(pascal)'), ('h*Hz', 'hecto*(hertz)'), ('h Hz', 'hecto*(hertz)'), ('h*Wb', 'hecto*(weber)'), ('h Wb', 'hecto*(weber)'), ('h*lm', 'hecto*(lumen)'), ('h lm', 'hecto*(lumen)'), ('hkat', 'hecto*(katal)'), ('h*Gy', 'hecto*(gray)'), ('h Gy', 'hecto*(gray)'), ('h*lx', 'hecto*(lux)'), ('h lx', 'hecto*(lux)'), ('h*eV', 'hecto*(electronvolt)'), ('h eV', 'hecto*(electronvolt)'), ('h*sr', 'hecto*(steradian)'), ('h sr', 'hecto*(steradian)'), ('hmin', 'hecto*(minute)'), ('hdeg', 'hecto*(degree)'), ('h*Np', 'hecto*(neper)'), ('h Np', 'hecto*(neper)'), ('hgal', 'hecto*(gallon)'), ('h*qt', 'hecto*(quart)'), ('h qt', 'hecto*(quart)'), ('h*oz', 'hecto*(ounce)'), ('h oz', 'hecto*(ounce)'), ('h*lb', 'hecto*(pound)'), ('h lb', 'hecto*(pound)'), ('h*st', 'hecto*(stone)'), ('h st', 'hecto*(stone)'), ('h*in', 'hecto*(inch)'), ('h in', 'hecto*(inch)'), ('h*ft', 'hecto*(foot)'), ('h ft', 'hecto*(foot)'), ('h*yd', 'hecto*(yard)'), ('h yd', 'hecto*(yard)'), ('h*mi', 'hecto*(mile)'), ('h mi', 'hecto*(mile)'), ('h*gi', 'hecto*(gill)'), ('h gi', 'hecto*(gill)'), ('h*pt', 'hecto*(pint)'), ('h pt', 'hecto*(pint)'), ('c*cd', 'centi*(candela)'), ('c cd', 'centi*(candela)'), ('cmol', 'centi*(mole)'), ('c*Bq', 'centi*(becquerel)'), ('c Bq', 'centi*(becquerel)'), ('c*Sv', 'centi*(sievert)'), ('c Sv', 'centi*(sievert)'), ('c*Pa', 'centi*(pascal)'), ('c Pa', 'centi*(pascal)'), ('c*Hz', 'centi*(hertz)'), ('c Hz', 'centi*(hertz)'), ('c*Wb', 'centi*(weber)'), ('c Wb', 'centi*(weber)'), ('c*lm', 'centi*(lumen)'), ('c lm', 'centi*(lumen)'), ('ckat', 'centi*(katal)'), ('c*Gy', 'centi*(gray)'), ('c Gy', 'centi*(gray)'), ('c*lx', 'centi*(lux)'), ('c lx', 'centi*(lux)'), ('c*eV', 'centi*(electronvolt)'), ('c eV', 'centi*(electronvolt)'), ('c*sr', 'centi*(steradian)'), ('c sr', 'centi*(steradian)'), ('cmin', 'centi*(minute)'), ('cdeg', 'centi*(degree)'), ('c*Np', 'centi*(neper)'), ('c Np', 'centi*(neper)'), ('cgal', 'centi*(gallon)'), ('c*qt', 'centi*(quart)'), ('c qt', 'centi*(quart)'), ('c*oz', 'centi*(ounce)'), ('c oz', 'centi*(ounce)'), ('c*lb', 'centi*(pound)'), ('c lb', 'centi*(pound)'), ('c*st', 'centi*(stone)'), ('c st', 'centi*(stone)'), ('c*in', 'centi*(inch)'), ('c in', 'centi*(inch)'), ('c*ft', 'centi*(foot)'), ('c ft', 'centi*(foot)'), ('c*yd', 'centi*(yard)'), ('c yd', 'centi*(yard)'), ('c*mi', 'centi*(mile)'), ('c mi', 'centi*(mile)'), ('c*gi', 'centi*(gill)'), ('c gi', 'centi*(gill)'), ('c*pt', 'centi*(pint)'), ('c pt', 'centi*(pint)'), ('m*cd', 'milli*(candela)'), ('m cd', 'milli*(candela)'), ('mmol', 'milli*(mole)'), ('m*Bq', 'milli*(becquerel)'), ('m Bq', 'milli*(becquerel)'), ('m*Sv', 'milli*(sievert)'), ('m Sv', 'milli*(sievert)'), ('m*Pa', 'milli*(pascal)'), ('m Pa', 'milli*(pascal)'), ('m*Hz', 'milli*(hertz)'), ('m Hz', 'milli*(hertz)'), ('m*Wb', 'milli*(weber)'), ('m Wb', 'milli*(weber)'), ('m*lm', 'milli*(lumen)'), ('m lm', 'milli*(lumen)'), ('mkat', 'milli*(katal)'), ('m*Gy', 'milli*(gray)'), ('m Gy', 'milli*(gray)'), ('m*lx', 'milli*(lux)'), ('m lx', 'milli*(lux)'), ('m*eV', 'milli*(electronvolt)'), ('m eV', 'milli*(electronvolt)'), ('m*sr', 'milli*(steradian)'), ('m sr', 'milli*(steradian)'), ('mmin', 'milli*(minute)'), ('mdeg', 'milli*(degree)'), ('m*Np', 'milli*(neper)'), ('m Np', 'milli*(neper)'), ('mgal', 'milli*(gallon)'), ('m*qt', 'milli*(quart)'), ('m qt', 'milli*(quart)'), ('m*oz', 'milli*(ounce)'), ('m oz', 'milli*(ounce)'), ('m*lb', 'milli*(pound)'), ('m lb', 'milli*(pound)'), ('m*st', 'milli*(stone)'), ('m st', 'milli*(stone)'), ('m*in', 'milli*(inch)'), ('m in', 'milli*(inch)'), ('m*ft', 'milli*(foot)'), ('m ft', 'milli*(foot)'), ('m*yd', 'milli*(yard)'), ('m yd', 'milli*(yard)'), ('m*mi', 'milli*(mile)'), ('m mi', 'milli*(mile)'), ('m*gi', 'milli*(gill)'), ('m gi', 'milli*(gill)'), ('m*pt', 'milli*(pint)'), ('m pt', 'milli*(pint)'), ('mucd', 'micro*(candela)'), ('mu*s', 'micro*(second)'), ('mu s', 'micro*(second)'), ('mu*A', 'micro*(ampere)'), ('mu A', 'micro*(ampere)'), ('mu*K', 'micro*(kelvin)'), ('mu K', 'micro*(kelvin)'), ('mu*m', 'micro*(metre)'), ('mu m', 'micro*(metre)'), ('mu*g', 'micro*(gram)'), ('mu g', 'micro*(gram)'), ('muBq', 'micro*(becquerel)'), ('mu*C', 'micro*(coulomb)'), ('mu C', 'micro*(coulomb)'), ('mu*S', 'micro*(siemens)'), ('mu S', 'micro*(siemens)'), ('muSv', 'micro*(sievert)'), ('mu*N', 'micro*(newton)'), ('mu N', 'micro*(newton)'), ('muPa', 'micro*(pascal)'), ('muHz', 'micro*(hertz)'), ('mu*J', 'micro*(joule)'), ('mu J', 'micro*(joule)'), ('mu*F', 'micro*(farad)'), ('mu F', 'micro*(farad)'), ('muWb', 'micro*(weber)'), ('mu*T', 'micro*(tesla)'), ('mu T', 'micro*(tesla)'), ('mu*H', 'micro*(henry)'), ('mu H', 'micro*(henry)'), ('mulm', 'micro*(lumen)'), ('mu*W', 'micro*(watt)'), ('mu W', 'micro*(watt)'), ('mu*V', 'micro*(volt)'), ('mu V', 'micro*(volt)'), ('muGy', 'micro*(gray)'), ('mu*O', 'micro*(ohm)'), ('mu O', 'micro*(ohm)'), ('mulx', 'micro*(lux)'), ('mu*u', 'micro*(atomicmassunit)'), ('mu u', 'micro*(atomicmassunit)'), ('mueV', 'micro*(electronvolt)'), ('musr', 'micro*(steradian)'), ('mu*t', 'micro*(metricton)'), ('mu t', 'micro*(metricton)'), ('mu*Å', 'micro*(angstrom)'), ('mu Å', 'micro*(angstrom)'), ('mu*r', 'micro*(radian)'), ('mu r', 'micro*(radian)'), ('mu*L', 'micro*(liter)'), ('mu L', 'micro*(liter)'), ('muNp', 'micro*(neper)'), ('mu*h', 'micro*(hour)'), ('mu h', 'micro*(hour)'), ('mu*B', 'micro*(bel)'), ('mu B', 'micro*(bel)'), ('muqt', 'micro*(quart)'), ('muoz', 'micro*(ounce)'), ('mulb', 'micro*(pound)'), ('must', 'micro*(stone)'), ('muin', 'micro*(inch)'), ('muft', 'micro*(foot)'), ('muyd', 'micro*(yard)'), ('mumi', 'micro*(mile)'), ('mugi', 'micro*(gill)'), ('mupt', 'micro*(pint)'), ('f*cd', 'femto*(candela)'), ('f cd', 'femto*(candela)'), ('fmol', 'femto*(mole)'), ('f*Bq', 'femto*(becquerel)'), ('f Bq', 'femto*(becquerel)'), ('f*Sv', 'femto*(sievert)'), ('f Sv', 'femto*(sievert)'), ('f*Pa', 'femto*(pascal)'), ('f Pa', 'femto*(pascal)'), ('f*Hz', 'femto*(hertz)'), ('f Hz', 'femto*(hertz)'), ('f*Wb', 'femto*(weber)'), ('f Wb', 'femto*(weber)'), ('f*lm', 'femto*(lumen)'), ('f lm', 'femto*(lumen)'), ('fkat', 'femto*(katal)'), ('f*Gy', 'femto*(gray)'), ('f Gy', 'femto*(gray)'), ('f*lx', 'femto*(lux)'), ('f lx', 'femto*(lux)'), ('f*eV', 'femto*(electronvolt)'), ('f eV', 'femto*(electronvolt)'), ('f*sr', 'femto*(steradian)'), ('f sr', 'femto*(steradian)'), ('fmin', 'femto*(minute)'), ('fdeg', 'femto*(degree)'), ('f*Np', 'femto*(neper)'), ('f Np', 'femto*(neper)'), ('fgal', 'femto*(gallon)'), ('f*qt', 'femto*(quart)'), ('f qt', 'femto*(quart)'), ('f*oz', 'femto*(ounce)'), ('f oz', 'femto*(ounce)'), ('f*lb', 'femto*(pound)'), ('f lb', 'femto*(pound)'), ('f*st', 'femto*(stone)'), ('f st', 'femto*(stone)'), ('f*in', 'femto*(inch)'), ('f in', 'femto*(inch)'), ('f*ft', 'femto*(foot)'), ('f ft', 'femto*(foot)'), ('f*yd', 'femto*(yard)'), ('f yd', 'femto*(yard)'), ('f*mi', 'femto*(mile)'), ('f mi', 'femto*(mile)'), ('f*gi', 'femto*(gill)'), ('f gi', 'femto*(gill)'), ('f*pt', 'femto*(pint)'), ('f pt', 'femto*(pint)'), ('z*cd', 'zepto*(candela)'), ('z cd', 'zepto*(candela)'), ('zmol', 'zepto*(mole)'), ('z*Bq', 'zepto*(becquerel)'), ('z Bq', 'zepto*(becquerel)'), ('z*Sv', 'zepto*(sievert)'), ('z Sv', 'zepto*(sievert)'), ('z*Pa', 'zepto*(pascal)'), ('z Pa', 'zepto*(pascal)'), ('z*Hz', 'zepto*(hertz)'), ('z Hz', 'zepto*(hertz)'), ('z*Wb', 'zepto*(weber)'), ('z Wb', 'zepto*(weber)'), ('z*lm', 'zepto*(lumen)'), ('z lm', 'zepto*(lumen)'), ('zkat', 'zepto*(katal)'), ('z*Gy', 'zepto*(gray)'), ('z Gy', 'zepto*(gray)'), ('z*lx', 'zepto*(lux)'), ('z lx', 'zepto*(lux)'), ('z*eV', 'zepto*(electronvolt)'), ('z eV', 'zepto*(electronvolt)'), ('z*sr', 'zepto*(steradian)'), ('z sr', 'zepto*(steradian)'), ('zmin', 'zepto*(minute)'), ('zdeg', 'zepto*(degree)'), ('z*Np', 'zepto*(neper)'), ('z Np', 'zepto*(neper)'), ('zgal', 'zepto*(gallon)'), ('z*qt', 'zepto*(quart)'), ('z qt', 'zepto*(quart)'), ('z*oz', 'zepto*(ounce)'), ('z oz', 'zepto*(ounce)'), ('z*lb', 'zepto*(pound)'), ('z lb', 'zepto*(pound)'), ('z*st', 'zepto*(stone)'), ('z st', 'zepto*(stone)'), ('z*in', 'zepto*(inch)'), ('z in', 'zepto*(inch)'), ('z*ft', 'zepto*(foot)'), ('z ft', 'zepto*(foot)'), ('z*yd', 'zepto*(yard)'), ('z yd', 'zepto*(yard)'), ('z*mi', 'zepto*(mile)'), ('z mi', 'zepto*(mile)'), ('z*gi', 'zepto*(gill)'), ('z gi', 'zepto*(gill)'), ('z*pt', 'zepto*(pint)'), ('z pt', 'zepto*(pint)'), ('y*cd', 'yocto*(candela)'), ('y cd', 'yocto*(candela)'), ('ymol', 'yocto*(mole)'), ('y*Bq', 'yocto*(becquerel)'), ('y Bq', 'yocto*(becquerel)'), ('y*Sv', 'yocto*(sievert)'), ('y Sv', 'yocto*(sievert)'), ('y*Pa', 'yocto*(pascal)'), ('y Pa', 'yocto*(pascal)'), ('y*Hz', 'yocto*(hertz)'), ('y Hz', 'yocto*(hertz)'), ('y*Wb', 'yocto*(weber)'), ('y Wb', 'yocto*(weber)'), ('y*lm', 'yocto*(lumen)'), ('y lm', 'yocto*(lumen)'), ('ykat', 'yocto*(katal)'), ('y*Gy', 'yocto*(gray)'), ('y Gy', 'yocto*(gray)'), ('y*lx', 'yocto*(lux)'), ('y lx', 'yocto*(lux)'), ('y*eV', 'yocto*(electronvolt)'), ('y eV', 'yocto*(electronvolt)'), ('y*sr', 'yocto*(steradian)'), ('y sr', 'yocto*(steradian)'), ('ymin', 'yocto*(minute)'), ('ydeg', 'yocto*(degree)'), ('y*Np', 'yocto*(neper)'), ('y Np', 'yocto*(neper)'), ('ygal', 'yocto*(gallon)'), ('y*qt', 'yocto*(quart)'), ('y qt', 'yocto*(quart)'), ('y*oz', 'yocto*(ounce)'), ('y oz', 'yocto*(ounce)'), ('y*lb', 'yocto*(pound)'), ('y lb', 'yocto*(pound)'), ('y*st', 'yocto*(stone)'), ('y st', 'yocto*(stone)'), ('y*in', 'yocto*(inch)'), ('y in', 'yocto*(inch)'), ('y*ft', 'yocto*(foot)'), ('y ft', 'yocto*(foot)'), ('y*yd', 'yocto*(yard)'), ('y yd', 'yocto*(yard)'), ('y*mi', 'yocto*(mile)'), ('y mi', 'yocto*(mile)'), ('y*gi', 'yocto*(gill)'), ('y gi', 'yocto*(gill)'), ('y*pt', 'yocto*(pint)'), ('y pt', 'yocto*(pint)'), ('P*cd', 'peta*(candela)'), ('P cd', 'peta*(candela)'), ('Pmol', 'peta*(mole)'), ('P*Bq', 'peta*(becquerel)'), ('P Bq', 'peta*(becquerel)'), ('P*Sv', 'peta*(sievert)'), ('P Sv', 'peta*(sievert)'), ('P*Pa', 'peta*(pascal)'), ('P Pa', 'peta*(pascal)'), ('P*Hz', 'peta*(hertz)'), ('P Hz', 'peta*(hertz)'), ('P*Wb', 'peta*(weber)'), ('P Wb', 'peta*(weber)'), ('P*lm', 'peta*(lumen)'), ('P lm', 'peta*(lumen)'), ('Pkat', 'peta*(katal)'), ('P*Gy', 'peta*(gray)'), ('P Gy', 'peta*(gray)'), ('P*lx', 'peta*(lux)'), ('P lx', 'peta*(lux)'), ('P*eV', 'peta*(electronvolt)'), ('P eV', 'peta*(electronvolt)'), ('P*sr', 'peta*(steradian)'), ('P sr', 'peta*(steradian)'), ('Pmin', 'peta*(minute)'), ('Pdeg', 'peta*(degree)'), ('P*Np', 'peta*(neper)'), ('P Np', 'peta*(neper)'), ('Pgal', 'peta*(gallon)'), ('P*qt', 'peta*(quart)'), ('P qt', 'peta*(quart)'), ('P*oz', 'peta*(ounce)'), ('P oz', 'peta*(ounce)'), ('P*lb', 'peta*(pound)'), ('P lb', 'peta*(pound)'), ('P*st', 'peta*(stone)'), ('P st', 'peta*(stone)'), ('P*in', 'peta*(inch)'), ('P in', 'peta*(inch)'), ('P*ft', 'peta*(foot)'), ('P ft', 'peta*(foot)'), ('P*yd', 'peta*(yard)'), ('P yd', 'peta*(yard)'), ('P*mi', 'peta*(mile)'), ('P mi', 'peta*(mile)'), ('P*gi', 'peta*(gill)'), ('P gi', 'peta*(gill)'), ('P*pt', 'peta*(pint)'), ('P pt', 'peta*(pint)'), ('T*cd', 'tera*(candela)'), ('T cd', 'tera*(candela)'), ('Tmol', 'tera*(mole)'), ('T*Bq', 'tera*(becquerel)'), ('T Bq', 'tera*(becquerel)'), ('T*Sv', 'tera*(sievert)'), ('T Sv', 'tera*(sievert)'), ('T*Pa', 'tera*(pascal)'), ('T Pa', 'tera*(pascal)'), ('T*Hz', 'tera*(hertz)'), ('T Hz', 'tera*(hertz)'), ('T*Wb', 'tera*(weber)'), ('T Wb', 'tera*(weber)'), ('T*lm', 'tera*(lumen)'), ('T lm', 'tera*(lumen)'), ('Tkat', 'tera*(katal)'), ('T*Gy', 'tera*(gray)'), ('T Gy', 'tera*(gray)'), ('T*lx', 'tera*(lux)'), ('T lx', 'tera*(lux)'), ('T*eV', 'tera*(electronvolt)'), ('T eV', 'tera*(electronvolt)'), ('T*sr', 'tera*(steradian)'), ('T sr', 'tera*(steradian)'), ('Tmin', 'tera*(minute)'), ('Tdeg', 'tera*(degree)'), ('T*Np', 'tera*(neper)'), ('T Np', 'tera*(neper)'), ('Tgal', 'tera*(gallon)'), ('T*qt', 'tera*(quart)'), ('T qt', 'tera*(quart)'), ('T*oz', 'tera*(ounce)'), ('T oz', 'tera*(ounce)'), ('T*lb', 'tera*(pound)'), ('T lb', 'tera*(pound)'), ('T*st', 'tera*(stone)'), ('T st', 'tera*(stone)'), ('T*in', 'tera*(inch)'), ('T in', 'tera*(inch)'), ('T*ft', 'tera*(foot)'), ('T ft', 'tera*(foot)'), ('T*yd', 'tera*(yard)'), ('T yd', 'tera*(yard)'), ('T*mi', 'tera*(mile)'), ('T mi', 'tera*(mile)'), ('T*gi', 'tera*(gill)'), ('T gi', 'tera*(gill)'), ('T*pt', 'tera*(pint)'), ('T pt', 'tera*(pint)'), ('G*cd', 'giga*(candela)'), ('G cd', 'giga*(candela)'), ('Gmol', 'giga*(mole)'), ('G*Bq', 'giga*(becquerel)'), ('G Bq', 'giga*(becquerel)'), ('G*Sv', 'giga*(sievert)'), ('G Sv', 'giga*(sievert)'), ('G*Pa', 'giga*(pascal)'), ('G Pa', 'giga*(pascal)'), ('G*Hz', 'giga*(hertz)'), ('G Hz', 'giga*(hertz)'), ('G*Wb', 'giga*(weber)'), ('G Wb', 'giga*(weber)'), ('G*lm', 'giga*(lumen)'), ('G lm', 'giga*(lumen)'), ('Gkat', 'giga*(katal)'), ('G*Gy', 'giga*(gray)'), ('G Gy', 'giga*(gray)'), ('G*lx', 'giga*(lux)'), ('G lx', 'giga*(lux)'), ('G*eV', 'giga*(electronvolt)'), ('G eV', 'giga*(electronvolt)'), ('G*sr', 'giga*(steradian)'), ('G sr', 'giga*(steradian)'), ('Gmin', 'giga*(minute)'), ('Gdeg', 'giga*(degree)'), ('G*Np', 'giga*(neper)'), ('G Np', 'giga*(neper)'), ('Ggal', 'giga*(gallon)'), ('G*qt', 'giga*(quart)'), ('G qt', 'giga*(quart)'), ('G*oz', 'giga*(ounce)'), ('G oz', 'giga*(ounce)'), ('G*lb', 'giga*(pound)'), ('G lb', 'giga*(pound)'), ('G*st', 'giga*(stone)'), ('G st', 'giga*(stone)'), ('G*in', 'giga*(inch)'), ('G in', 'giga*(inch)'), ('G*ft', 'giga*(foot)'), ('G ft', 'giga*(foot)'), ('G*yd', 'giga*(yard)'), ('G yd', 'giga*(yard)'), ('G*mi', 'giga*(mile)'), ('G mi', 'giga*(mile)'), ('G*gi', 'giga*(gill)'), ('G gi', 'giga*(gill)'), ('G*pt', 'giga*(pint)'), ('G pt', 'giga*(pint)'), ('M*cd', 'mega*(candela)'), ('M cd', 'mega*(candela)'), ('Mmol', 'mega*(mole)'), ('M*Bq', 'mega*(becquerel)'), ('M Bq', 'mega*(becquerel)'), ('M*Sv', 'mega*(sievert)'), ('M Sv', 'mega*(sievert)'), ('M*Pa', 'mega*(pascal)'), ('M Pa', 'mega*(pascal)'), ('M*Hz', 'mega*(hertz)'), ('M Hz', 'mega*(hertz)'), ('M*Wb', 'mega*(weber)'), ('M Wb', 'mega*(weber)'), ('M*lm', 'mega*(lumen)'), ('M lm', 'mega*(lumen)'), ('Mkat', 'mega*(katal)'), ('M*Gy', 'mega*(gray)'), ('M Gy', 'mega*(gray)'), ('M*lx', 'mega*(lux)'), ('M lx', 'mega*(lux)'), ('M*eV', 'mega*(electronvolt)'), ('M eV', 'mega*(electronvolt)'), ('M*sr', 'mega*(steradian)'), ('M sr', 'mega*(steradian)'), ('Mmin', 'mega*(minute)'), ('Mdeg', 'mega*(degree)'), ('M*Np', 'mega*(neper)'), ('M Np', 'mega*(neper)'), ('Mgal', 'mega*(gallon)'), ('M*qt', 'mega*(quart)'), ('M qt', 'mega*(quart)'), ('M*oz', 'mega*(ounce)'), ('M oz', 'mega*(ounce)'), ('M*lb', 'mega*(pound)'), ('M lb', 'mega*(pound)'), ('M*st', 'mega*(stone)'), ('M st', 'mega*(stone)'), ('M*in', 'mega*(inch)'), ('M in', 'mega*(inch)'), ('M*ft', 'mega*(foot)'), ('M ft', 'mega*(foot)'), ('M*yd', 'mega*(yard)'), ('M yd', 'mega*(yard)'), ('M*mi', 'mega*(mile)'), ('M mi', 'mega*(mile)'), ('M*gi', 'mega*(gill)'), ('M gi', 'mega*(gill)'), ('M*pt', 'mega*(pint)'), ('M pt', 'mega*(pint)'), ('k*cd', 'kilo*(candela)'), ('k cd', 'kilo*(candela)'), ('kmol', 'kilo*(mole)'), ('k*Bq', 'kilo*(becquerel)'), ('k Bq', 'kilo*(becquerel)'), ('k*Sv', 'kilo*(sievert)'), ('k Sv', 'kilo*(sievert)'), ('k*Pa', 'kilo*(pascal)'), ('k Pa', 'kilo*(pascal)'), ('k*Hz', 'kilo*(hertz)'), ('k Hz', 'kilo*(hertz)'), ('k*Wb', 'kilo*(weber)'), ('k Wb', 'kilo*(weber)'), ('k*lm', 'kilo*(lumen)'), ('k lm', 'kilo*(lumen)'), ('kkat', 'kilo*(katal)'), ('k*Gy', 'kilo*(gray)'), ('k Gy', 'kilo*(gray)'), ('k*lx', 'kilo*(lux)'), ('k lx', 'kilo*(lux)'), ('k*eV', 'kilo*(electronvolt)'), ('k eV', 'kilo*(electronvolt)'), ('k*sr', 'kilo*(steradian)'), ('k sr', 'kilo*(steradian)'), ('kmin', 'kilo*(minute)'), ('kdeg', 'kilo*(degree)'), ('k*Np', 'kilo*(neper)'), ('k Np', 'kilo*(neper)'), ('kgal', 'kilo*(gallon)'), ('k*qt', 'kilo*(quart)'), ('k qt', 'kilo*(quart)'), ('k*oz', 'kilo*(ounce)'), ('k oz', 'kilo*(ounce)'), ('k*lb', 'kilo*(pound)'), ('k lb', 'kilo*(pound)'), ('k*st', 'kilo*(stone)'), ('k st', 'kilo*(stone)'), ('k*in', 'kilo*(inch)'), ('k in', 'kilo*(inch)'), ('k*ft', 'kilo*(foot)'), ('k ft', 'kilo*(foot)'), ('k*yd', 'kilo*(yard)'), ('k yd', 'kilo*(yard)'), ('k*mi', 'kilo*(mile)'), ('k mi', 'kilo*(mile)'), ('k*gi', 'kilo*(gill)'), ('k gi', 'kilo*(gill)'), ('k*pt', 'kilo*(pint)'), ('k pt', 'kilo*(pint)'), ('dacd', 'deka*(candela)'), ('da*s', 'deka*(second)'), ('da s', 'deka*(second)'), ('da*A', 'deka*(ampere)'), ('da A', 'deka*(ampere)'), ('da*K', 'deka*(kelvin)'), ('da K', 'deka*(kelvin)'), ('da*m', 'deka*(metre)'), ('da m', 'deka*(metre)'), ('da*g', 'deka*(gram)'), ('da g', 'deka*(gram)'), ('daBq', 'deka*(becquerel)'), ('da*C', 'deka*(coulomb)'), ('da C', 'deka*(coulomb)'), ('da*S', 'deka*(siemens)'), ('da S', 'deka*(siemens)'), ('daSv', 'deka*(sievert)'), ('da*N', 'deka*(newton)'), ('da N', 'deka*(newton)'), ('daPa', 'deka*(pascal)'), ('daHz', 'deka*(hertz)'), ('da*J', 'deka*(joule)'), ('da J', 'deka*(joule)'), ('da*F', 'deka*(farad)'), ('da F', 'deka*(farad)'), ('daWb', 'deka*(weber)'), ('da*T', 'deka*(tesla)'), ('da T', 'deka*(tesla)'), ('da*H', 'deka*(henry)'), ('da H', 'deka*(henry)'), ('dalm', 'deka*(lumen)'), ('da*W', 'deka*(watt)'), ('da W', 'deka*(watt)'), ('da*V', 'deka*(volt)'), ('da V', 'deka*(volt)'), ('daGy', 'deka*(gray)'), ('da*O', 'deka*(ohm)'), ('da O', 'deka*(ohm)'), ('dalx', 'deka*(lux)'), ('da*u', 'deka*(atomicmassunit)'), ('da u', 'deka*(atomicmassunit)'), ('daeV', 'deka*(electronvolt)'), ('dasr', 'deka*(steradian)'), ('da*t', 'deka*(metricton)'), ('da t', 'deka*(metricton)'), ('da*Å', 'deka*(angstrom)'), ('da Å', 'deka*(angstrom)'), ('da*r', 'deka*(radian)'), ('da r', 'deka*(radian)'), ('da*L', 'deka*(liter)'), ('da L', 'deka*(liter)'), ('daNp', 'deka*(neper)'), ('da*h', 'deka*(hour)'), ('da h', 'deka*(hour)'), ('da*B', 'deka*(bel)'), ('da B', 'deka*(bel)'), ('daqt', 'deka*(quart)'), ('daoz', 'deka*(ounce)'), ('dalb', 'deka*(pound)'), ('dast', 'deka*(stone)'), ('dain', 'deka*(inch)'), ('daft', 'deka*(foot)'), ('dayd', 'deka*(yard)'), ('dami', 'deka*(mile)'), ('dagi', 'deka*(gill)'), ('dapt', 'deka*(pint)'), ('d*cd', 'deci*(candela)'), ('d cd', 'deci*(candela)'), ('dmol', 'deci*(mole)'), ('d*Bq', 'deci*(becquerel)'), ('d Bq', 'deci*(becquerel)'), ('d*Sv', 'deci*(sievert)'), ('d Sv', 'deci*(sievert)'), ('d*Pa', 'deci*(pascal)'), ('d Pa', 'deci*(pascal)'), ('d*Hz', 'deci*(hertz)'), ('d Hz', 'deci*(hertz)'), ('d*Wb', 'deci*(weber)'), ('d Wb', 'deci*(weber)'), ('d*lm', 'deci*(lumen)'), ('d lm', 'deci*(lumen)'), ('dkat', 'deci*(katal)'), ('d*Gy', 'deci*(gray)'), ('d Gy', 'deci*(gray)'), ('d*lx', 'deci*(lux)'), ('d lx', 'deci*(lux)'), ('d*eV', 'deci*(electronvolt)'), ('d eV', 'deci*(electronvolt)'), ('d*sr', 'deci*(steradian)'), ('d sr', 'deci*(steradian)'), ('dmin', 'deci*(minute)'), ('ddeg', 'deci*(degree)'), ('d*Np', 'deci*(neper)'), ('d Np', 'deci*(neper)'), ('dgal', 'deci*(gallon)'), ('d*qt', 'deci*(quart)'), ('d qt', 'deci*(quart)'), ('d*oz', 'deci*(ounce)'), ('d oz', 'deci*(ounce)'), ('d*lb', 'deci*(pound)'), ('d lb', 'deci*(pound)'), ('d*st', 'deci*(stone)'), ('d st', 'deci*(stone)'), ('d*in', 'deci*(inch)'), ('d in', 'deci*(inch)'), ('d*ft', 'deci*(foot)'), ('d ft', 'deci*(foot)'), ('d*yd', 'deci*(yard)'), ('d yd', 'deci*(yard)'), ('d*mi', 'deci*(mile)'), ('d mi', 'deci*(mile)'), ('d*gi', 'deci*(gill)'), ('d gi', 'deci*(gill)'), ('d*pt', 'deci*(pint)'), ('d pt', 'deci*(pint)'), ('n*cd', 'nano*(candela)'), ('n cd', 'nano*(candela)'), ('nmol', 'nano*(mole)'), ('n*Bq', 'nano*(becquerel)'), ('n Bq', 'nano*(becquerel)'), ('n*Sv', 'nano*(sievert)'), ('n Sv', 'nano*(sievert)'), ('n*Pa', 'nano*(pascal)'), ('n Pa', 'nano*(pascal)'), ('n*Hz', 'nano*(hertz)'), ('n Hz', 'nano*(hertz)'), ('n*Wb', 'nano*(weber)'), ('n Wb', 'nano*(weber)'), ('n*lm', 'nano*(lumen)'), ('n lm', 'nano*(lumen)'), ('nkat', 'nano*(katal)'), ('n*Gy', 'nano*(gray)'), ('n Gy', 'nano*(gray)'), ('n*lx', 'nano*(lux)'), ('n lx', 'nano*(lux)'), ('n*eV', 'nano*(electronvolt)'), ('n eV', 'nano*(electronvolt)'), ('n*sr', 'nano*(steradian)'), ('n sr', 'nano*(steradian)'), ('nmin', 'nano*(minute)'), ('ndeg', 'nano*(degree)'), ('n*Np', 'nano*(neper)'), ('n Np', 'nano*(neper)'), ('ngal', 'nano*(gallon)'), ('n*qt', 'nano*(quart)'), ('n qt', 'nano*(quart)'), ('n*oz', 'nano*(ounce)'), ('n oz', 'nano*(ounce)'), ('n*lb', 'nano*(pound)'), ('n lb', 'nano*(pound)'), ('n*st', 'nano*(stone)'), ('n st', 'nano*(stone)'), ('n*in', 'nano*(inch)'), ('n in', 'nano*(inch)'), ('n*ft', 'nano*(foot)'), ('n ft', 'nano*(foot)'), ('n*yd', 'nano*(yard)'), ('n yd', 'nano*(yard)'), ('n*mi', 'nano*(mile)'), ('n mi', 'nano*(mile)'), ('n*gi', 'nano*(gill)'), ('n gi', 'nano*(gill)'), ('n*pt', 'nano*(pint)'), ('n pt', 'nano*(pint)'), ('p*cd', 'pico*(candela)'), ('p cd', 'pico*(candela)'), ('pmol', 'pico*(mole)'), ('p*Bq', 'pico*(becquerel)'), ('p Bq', 'pico*(becquerel)'), ('p*Sv', 'pico*(sievert)'), ('p Sv', 'pico*(sievert)'), ('p*Pa', 'pico*(pascal)'), ('p Pa', 'pico*(pascal)'), ('p*Hz', 'pico*(hertz)'), ('p Hz', 'pico*(hertz)'), ('p*Wb', 'pico*(weber)'), ('p Wb', 'pico*(weber)'), ('p*lm', 'pico*(lumen)'), ('p lm', 'pico*(lumen)'), ('pkat', 'pico*(katal)'), ('p*Gy', 'pico*(gray)'), ('p Gy', 'pico*(gray)'), ('p*lx', 'pico*(lux)'), ('p lx', 'pico*(lux)'), ('p*eV', 'pico*(electronvolt)'), ('p eV', 'pico*(electronvolt)'), ('p*sr', 'pico*(steradian)'), ('p sr', 'pico*(steradian)'), ('pmin', 'pico*(minute)'), ('pdeg', 'pico*(degree)'), ('p*Np', 'pico*(neper)'), ('p Np', 'pico*(neper)'), ('pgal', 'pico*(gallon)'), ('p*qt', 'pico*(quart)'), ('p qt', 'pico*(quart)'), ('p*oz', 'pico*(ounce)'), ('p oz', 'pico*(ounce)'), ('p*lb', 'pico*(pound)'), ('p lb', 'pico*(pound)'), ('p*st', 'pico*(stone)'), ('p st', 'pico*(stone)'), ('p*in', 'pico*(inch)'), ('p in', 'pico*(inch)'), ('p*ft', 'pico*(foot)'), ('p ft', 'pico*(foot)'), ('p*yd', 'pico*(yard)'), ('p yd', 'pico*(yard)'), ('p*mi', 'pico*(mile)'), ('p mi', 'pico*(mile)'), ('p*gi', 'pico*(gill)'), ('p gi', 'pico*(gill)'), ('p*pt', 'pico*(pint)'), ('p pt', 'pico*(pint)'), ('a*cd', 'atto*(candela)'), ('a cd', 'atto*(candela)'), ('amol', 'atto*(mole)'), ('a*Bq', 'atto*(becquerel)'), ('a Bq', 'atto*(becquerel)'), ('a*Sv', 'atto*(sievert)'), ('a Sv', 'atto*(sievert)'), ('a*Pa', 'atto*(pascal)'), ('a Pa', 'atto*(pascal)'), ('a*Hz', 'atto*(hertz)'), ('a Hz', 'atto*(hertz)'), ('a*Wb', 'atto*(weber)'), ('a Wb', 'atto*(weber)'), ('a*lm', 'atto*(lumen)'), ('a lm', 'atto*(lumen)'), ('akat', 'atto*(katal)'), ('a*Gy', 'atto*(gray)'), ('a Gy', 'atto*(gray)'), ('a*lx', 'atto*(lux)'), ('a lx', 'atto*(lux)'), ('a*eV', 'atto*(electronvolt)'), ('a eV', 'atto*(electronvolt)'), ('a*sr', 'atto*(steradian)'), ('a sr', 'atto*(steradian)'), ('amin', 'atto*(minute)'), ('adeg', 'atto*(degree)'), ('a*Np', 'atto*(neper)'), ('a Np', 'atto*(neper)'), ('agal', 'atto*(gallon)'), ('a*qt', 'atto*(quart)'), ('a qt', 'atto*(quart)'), ('a*oz', 'atto*(ounce)'), ('a oz', 'atto*(ounce)'), ('a*lb', 'atto*(pound)'), ('a lb', 'atto*(pound)'), ('a*st', 'atto*(stone)'), ('a st', 'atto*(stone)'), ('a*in', 'atto*(inch)'), ('a in', 'atto*(inch)'), ('a*ft', 'atto*(foot)'), ('a ft', 'atto*(foot)'), ('a*yd', 'atto*(yard)'), ('a yd', 'atto*(yard)'), ('a*mi', 'atto*(mile)'), ('a mi', 'atto*(mile)'), ('a*gi', 'atto*(gill)'), ('a gi', 'atto*(gill)'), ('a*pt', 'atto*(pint)'), ('a pt', 'atto*(pint)'), ('E*cd', 'exa*(candela)'), ('E cd', 'exa*(candela)'), ('Emol', 'exa*(mole)'), ('E*Bq', 'exa*(becquerel)'), ('E Bq', 'exa*(becquerel)'), ('E*Sv', 'exa*(sievert)'), ('E Sv', 'exa*(sievert)'), ('E*Pa', 'exa*(pascal)'), ('E Pa', 'exa*(pascal)'), ('E*Hz', 'exa*(hertz)'), ('E Hz', 'exa*(hertz)'), ('E*Wb', 'exa*(weber)'), ('E Wb', 'exa*(weber)'), ('E*lm', 'exa*(lumen)'), ('E lm', 'exa*(lumen)'), ('Ekat', 'exa*(katal)'), ('E*Gy', 'exa*(gray)'), ('E Gy', 'exa*(gray)'), ('E*lx', 'exa*(lux)'), ('E lx', 'exa*(lux)'), ('E*eV', 'exa*(electronvolt)'), ('E eV', 'exa*(electronvolt)'), ('E*sr', 'exa*(steradian)'), ('E sr', 'exa*(steradian)'), ('Emin', 'exa*(minute)'), ('Edeg', 'exa*(degree)'), ('E*Np', 'exa*(neper)'), ('E Np', 'exa*(neper)'), ('Egal', 'exa*(gallon)'), ('E*qt', 'exa*(quart)'), ('E qt', 'exa*(quart)'), ('E*oz', 'exa*(ounce)'), ('E oz', 'exa*(ounce)'), ('E*lb', 'exa*(pound)'), ('E lb', 'exa*(pound)'), ('E*st', 'exa*(stone)'), ('E st', 'exa*(stone)'), ('E*in', 'exa*(inch)'), ('E in', 'exa*(inch)'), ('E*ft', 'exa*(foot)'), ('E ft', 'exa*(foot)'), ('E*yd', 'exa*(yard)'), ('E yd', 'exa*(yard)'), ('E*mi', 'exa*(mile)'), ('E mi', 'exa*(mile)'), ('E*gi', 'exa*(gill)'), ('E gi', 'exa*(gill)'), ('E*pt', 'exa*(pint)'), ('E pt', 'exa*(pint)'), ('min', 'minute'), ('Ycd', 'yotta*(candela)'), ('Y*s', 'yotta*(second)'), ('Y s', 'yotta*(second)'), ('Y*A', 'yotta*(ampere)'), ('Y A', 'yotta*(ampere)'), ('Y*K', 'yotta*(kelvin)'), ('Y K', 'yotta*(kelvin)'), ('Y*m', 'yotta*(metre)'), ('Y m', 'yotta*(metre)'), ('Y*g', 'yotta*(gram)'), ('Y g', 'yotta*(gram)'), ('YBq', 'yotta*(becquerel)'), ('Y*C', 'yotta*(coulomb)'), ('Y C', 'yotta*(coulomb)'), ('Y*S', 'yotta*(siemens)'), ('Y S', 'yotta*(siemens)'), ('YSv', 'yotta*(sievert)'), ('Y*N', 'yotta*(newton)'), ('Y N', 'yotta*(newton)'), ('YPa', 'yotta*(pascal)'), ('YHz', 'yotta*(hertz)'), ('Y*J', 'yotta*(joule)'), ('Y J', 'yotta*(joule)'), ('Y*F', 'yotta*(farad)'), ('Y F', 'yotta*(farad)'), ('YWb', 'yotta*(weber)'), ('Y*T', 'yotta*(tesla)'), ('Y T', 'yotta*(tesla)'), ('Y*H', 'yotta*(henry)'), ('Y H', 'yotta*(henry)'), ('Ylm', 'yotta*(lumen)'), ('Y*W', 'yotta*(watt)'), ('Y W', 'yotta*(watt)'), ('Y*V', 'yotta*(volt)'), ('Y V', 'yotta*(volt)'), ('YGy', 'yotta*(gray)'), ('Y*O', 'yotta*(ohm)'), ('Y O', 'yotta*(ohm)'), ('Ylx', 'yotta*(lux)'), ('Y*u', 'yotta*(atomicmassunit)'), ('Y u', 'yotta*(atomicmassunit)'), ('YeV', 'yotta*(electronvolt)'), ('Ysr', 'yotta*(steradian)'), ('Y*t', 'yotta*(metricton)'), ('Y t', 'yotta*(metricton)'), ('Y*Å', 'yotta*(angstrom)'), ('Y Å', 'yotta*(angstrom)'), ('Y*r', 'yotta*(radian)'), ('Y r', 'yotta*(radian)'), ('Y*L', 'yotta*(liter)'), ('Y L', 'yotta*(liter)'), ('YNp', 'yotta*(neper)'), ('Y*h', 'yotta*(hour)'), ('Y h', 'yotta*(hour)'), ('Y*B', 'yotta*(bel)'), ('Y B', 'yotta*(bel)'), ('Yqt', 'yotta*(quart)'), ('Yoz', 'yotta*(ounce)'), ('Ylb', 'yotta*(pound)'), ('Yst', 'yotta*(stone)'), ('Yin', 'yotta*(inch)'), ('Yft', 'yotta*(foot)'), ('Yyd', 'yotta*(yard)'), ('Ymi', 'yotta*(mile)'), ('Ygi', 'yotta*(gill)'), ('Ypt', 'yotta*(pint)'), ('Zcd', 'zetta*(candela)'), ('Z*s', 'zetta*(second)'), ('Z s', 'zetta*(second)'), ('Z*A', 'zetta*(ampere)'), ('Z A', 'zetta*(ampere)'), ('Z*K', 'zetta*(kelvin)'), ('Z K', 'zetta*(kelvin)'), ('Z*m', 'zetta*(metre)'), ('Z m', 'zetta*(metre)'), ('Z*g', 'zetta*(gram)'), ('Z g', 'zetta*(gram)'), ('ZBq', 'zetta*(becquerel)'), ('Z*C', 'zetta*(coulomb)'), ('Z C', 'zetta*(coulomb)'), ('Z*S', 'zetta*(siemens)'), ('Z S', 'zetta*(siemens)'), ('ZSv', 'zetta*(sievert)'), ('Z*N', 'zetta*(newton)'), ('Z N', 'zetta*(newton)'), ('ZPa', 'zetta*(pascal)'), ('ZHz', 'zetta*(hertz)'), ('Z*J', 'zetta*(joule)'), ('Z J', 'zetta*(joule)'), ('Z*F', 'zetta*(farad)'), ('Z F', 'zetta*(farad)'), ('ZWb', 'zetta*(weber)'), ('Z*T', 'zetta*(tesla)'), ('Z T', 'zetta*(tesla)'), ('Z*H', 'zetta*(henry)'), ('Z H', 'zetta*(henry)'), ('Zlm', 'zetta*(lumen)'), ('Z*W', 'zetta*(watt)'), ('Z W', 'zetta*(watt)'), ('Z*V', 'zetta*(volt)'), ('Z V', 'zetta*(volt)'), ('ZGy', 'zetta*(gray)'), ('Z*O', 'zetta*(ohm)'), ('Z O', 'zetta*(ohm)'), ('Zlx', 'zetta*(lux)'), ('Z*u', 'zetta*(atomicmassunit)'), ('Z u', 'zetta*(atomicmassunit)'), ('ZeV', 'zetta*(electronvolt)'), ('Zsr', 'zetta*(steradian)'), ('Z*t', 'zetta*(metricton)'), ('Z t', 'zetta*(metricton)'), ('Z*Å', 'zetta*(angstrom)'), ('Z Å', 'zetta*(angstrom)'), ('Z*r', 'zetta*(radian)'), ('Z r', 'zetta*(radian)'), ('Z*L', 'zetta*(liter)'), ('Z L', 'zetta*(liter)'), ('ZNp', 'zetta*(neper)'), ('Z*h', 'zetta*(hour)'), ('Z h', 'zetta*(hour)'), ('Z*B', 'zetta*(bel)'), ('Z B', 'zetta*(bel)'), ('Zqt', 'zetta*(quart)'), ('Zoz', 'zetta*(ounce)'), ('Zlb', 'zetta*(pound)'), ('Zst', 'zetta*(stone)'), ('Zin', 'zetta*(inch)'), ('Zft', 'zetta*(foot)'), ('Zyd', 'zetta*(yard)'), ('Zmi', 'zetta*(mile)'), ('Zgi', 'zetta*(gill)'), ('Zpt', 'zetta*(pint)'), ('hcd', 'hecto*(candela)'), ('h*s', 'hecto*(second)'), ('h s', 'hecto*(second)'), ('h*A', 'hecto*(ampere)'), ('h A', 'hecto*(ampere)'), ('h*K', 'hecto*(kelvin)'), ('h K', 'hecto*(kelvin)'), ('h*m', 'hecto*(metre)'), ('h m', 'hecto*(metre)'), ('h*g', 'hecto*(gram)'), ('h g', 'hecto*(gram)'), ('hBq', 'hecto*(becquerel)'), ('h*C', 'hecto*(coulomb)'), ('h C', 'hecto*(coulomb)'), ('h*S', 'hecto*(siemens)'), ('h S', 'hecto*(siemens)'), ('hSv', 'hecto*(sievert)'), ('h*N', 'hecto*(newton)'), ('h N', 'hecto*(newton)'), ('hPa', 'hecto*(pascal)'), ('hHz', 'hecto*(hertz)'), ('h*J', 'hecto*(joule)'), ('h J', 'hecto*(joule)'), ('h*F', 'hecto*(farad)'), ('h F', 'hecto*(farad)'), ('hWb', 'hecto*(weber)'), ('h*T', 'hecto*(tesla)'), ('h T', 'hecto*(tesla)'), ('h*H', 'hecto*(henry)'), ('h H', 'hecto*(henry)'), ('hlm', 'hecto*(lumen)'), ('h*W', 'hecto*(watt)'), ('h W', 'hecto*(watt)'), ('h*V', 'hecto*(volt)'), ('h V', 'hecto*(volt)'), ('hGy', 'hecto*(gray)'), ('h*O', 'hecto*(ohm)'), ('h O', 'hecto*(ohm)'), ('hlx', 'hecto*(lux)'), ('h*u', 'hecto*(atomicmassunit)'), ('h u', 'hecto*(atomicmassunit)'), ('heV', 'hecto*(electronvolt)'), ('hsr', 'hecto*(steradian)'), ('h*t', 'hecto*(metricton)'), ('h t', 'hecto*(metricton)'), ('h*Å', 'hecto*(angstrom)'), ('h Å', 'hecto*(angstrom)'), ('h*r', 'hecto*(radian)'), ('h r', 'hecto*(radian)'), ('h*L', 'hecto*(liter)'), ('h L', 'hecto*(liter)'), ('hNp', 'hecto*(neper)'), ('h*h', 'hecto*(hour)'), ('h h', 'hecto*(hour)'), ('h*B', 'hecto*(bel)'), ('h B', 'hecto*(bel)'), ('hqt', 'hecto*(quart)'), ('hoz', 'hecto*(ounce)'), ('hlb', 'hecto*(pound)'), ('hst', 'hecto*(stone)'), ('hin', 'hecto*(inch)'), ('hft', 'hecto*(foot)'), ('hyd', 'hecto*(yard)'), ('hmi', 'hecto*(mile)'), ('hgi', 'hecto*(gill)'), ('hpt', 'hecto*(pint)'), ('ccd', 'centi*(candela)'), ('c*s', 'centi*(second)'), ('c s', 'centi*(second)'), ('c*A', 'centi*(ampere)'), ('c A', 'centi*(ampere)'), ('c*K', 'centi*(kelvin)'), ('c K', 'centi*(kelvin)'), ('c*m', 'centi*(metre)'), ('c m', 'centi*(metre)'), ('c*g', 'centi*(gram)'), ('c g', 'centi*(gram)'), ('cBq', 'centi*(becquerel)'), ('c*C', 'centi*(coulomb)'), ('c C', 'centi*(coulomb)'), ('c*S', 'centi*(siemens)'), ('c S', 'centi*(siemens)'), ('cSv', 'centi*(sievert)'), ('c*N', 'centi*(newton)'), ('c N', 'centi*(newton)'), ('cPa', 'centi*(pascal)'), ('cHz', 'centi*(hertz)'), ('c*J', 'centi*(joule)'), ('c J', 'centi*(joule)'), ('c*F', 'centi*(farad)'), ('c F', 'centi*(farad)'), ('cWb', 'centi*(weber)'), ('c*T', 'centi*(tesla)'), ('c T', 'centi*(tesla)'), ('c*H', 'centi*(henry)'), ('c H', 'centi*(henry)'), ('clm', 'centi*(lumen)'), ('c*W', 'centi*(watt)'), ('c W', 'centi*(watt)'), ('c*V', 'centi*(volt)'), ('c V', 'centi*(volt)'), ('cGy', 'centi*(gray)'), ('c*O', 'centi*(ohm)'), ('c O', 'centi*(ohm)'), ('clx', 'centi*(lux)'), ('c*u', 'centi*(atomicmassunit)'), ('c u', 'centi*(atomicmassunit)'), ('ceV', 'centi*(electronvolt)'), ('csr', 'centi*(steradian)'), ('c*t', 'centi*(metricton)'), ('c t', 'centi*(metricton)'), ('c*Å', 'centi*(angstrom)'), ('c Å', 'centi*(angstrom)'), ('c*r', 'centi*(radian)'), ('c r', 'centi*(radian)'), ('c*L', 'centi*(liter)'), ('c L', 'centi*(liter)'), ('cNp', 'centi*(neper)'), ('c*h', 'centi*(hour)'), ('c h', 'centi*(hour)'), ('c*B', 'centi*(bel)'), ('c B', 'centi*(bel)'), ('cqt', 'centi*(quart)'), ('coz', 'centi*(ounce)'), ('clb', 'centi*(pound)'), ('cst', 'centi*(stone)'), ('cin', 'centi*(inch)'), ('cft', 'centi*(foot)'), ('cyd', 'centi*(yard)'), ('cmi', 'centi*(mile)'), ('cgi', 'centi*(gill)'), ('cpt', 'centi*(pint)'), ('mcd', 'milli*(candela)'), ('m*s', 'milli*(second)'), ('m s', 'milli*(second)'), ('m*A', 'milli*(ampere)'), ('m A', 'milli*(ampere)'), ('m*K', 'milli*(kelvin)'), ('m K', 'milli*(kelvin)'), ('m*m', 'milli*(metre)'), ('m m', 'milli*(metre)'), ('m*g', 'milli*(gram)'), ('m g', 'milli*(gram)'), ('mBq', 'milli*(becquerel)'), ('m*C', 'milli*(coulomb)'), ('m C', 'milli*(coulomb)'), ('m*S', 'milli*(siemens)'), ('m S', 'milli*(siemens)'), ('mSv', 'milli*(sievert)'), ('m*N', 'milli*(newton)'), ('m N', 'milli*(newton)'), ('mPa', 'milli*(pascal)'), ('mHz', 'milli*(hertz)'), ('m*J', 'milli*(joule)'), ('m J', 'milli*(joule)'), ('m*F', 'milli*(farad)'), ('m F', 'milli*(farad)'), ('mWb', 'milli*(weber)'), ('m*T', 'milli*(tesla)'), ('m T', 'milli*(tesla)'), ('m*H', 'milli*(henry)'), ('m H', 'milli*(henry)'), ('mlm', 'milli*(lumen)'), ('m*W', 'milli*(watt)'), ('m W', 'milli*(watt)'), ('m*V', 'milli*(volt)'), ('m V', 'milli*(volt)'), ('mGy', 'milli*(gray)'), ('m*O', 'milli*(ohm)'), ('m O', 'milli*(ohm)'), ('mlx', 'milli*(lux)'), ('m*u', 'milli*(atomicmassunit)'), ('m u', 'milli*(atomicmassunit)'), ('meV', 'milli*(electronvolt)'), ('msr', 'milli*(steradian)'), ('m*t', 'milli*(metricton)'), ('m t', 'milli*(metricton)'), ('m*Å', 'milli*(angstrom)'), ('m Å', 'milli*(angstrom)'), ('m*r', 'milli*(radian)'), ('m r', 'milli*(radian)'), ('m*L', 'milli*(liter)'), ('m L', 'milli*(liter)'), ('mNp', 'milli*(neper)'), ('m*h', 'milli*(hour)'), ('m h', 'milli*(hour)'), ('m*B', 'milli*(bel)'), ('m B', 'milli*(bel)'), ('mqt', 'milli*(quart)'), ('moz', 'milli*(ounce)'), ('mlb', 'milli*(pound)'), ('mst', 'milli*(stone)'), ('min', 'milli*(inch)'), ('mft', 'milli*(foot)'), ('myd', 'milli*(yard)'), ('mmi', 'milli*(mile)'), ('mgi', 'milli*(gill)'), ('mpt', 'milli*(pint)'), ('mus', 'micro*(second)'), ('muA', 'micro*(ampere)'), ('muK', 'micro*(kelvin)'), ('mum', 'micro*(metre)'), ('mug', 'micro*(gram)'), ('muC', 'micro*(coulomb)'), ('muS', 'micro*(siemens)'), ('muN', 'micro*(newton)'), ('muJ', 'micro*(joule)'), ('muF', 'micro*(farad)'), ('muT', 'micro*(tesla)'), ('muH', 'micro*(henry)'), ('muW', 'micro*(watt)'), ('muV', 'micro*(volt)'), ('muO', 'micro*(ohm)'), ('muu', 'micro*(atomicmassunit)'), ('mut', 'micro*(metricton)'), ('muÅ', 'micro*(angstrom)'), ('mur', 'micro*(radian)'), ('muL', 'micro*(liter)'), ('muh', 'micro*(hour)'), ('muB', 'micro*(bel)'), ('fcd', 'femto*(candela)'), ('f*s', 'femto*(second)'), ('f s', 'femto*(second)'), ('f*A', 'femto*(ampere)'), ('f A', 'femto*(ampere)'), ('f*K', 'femto*(kelvin)'), ('f K', 'femto*(kelvin)'), ('f*m', 'femto*(metre)'), ('f m', 'femto*(metre)'), ('f*g', 'femto*(gram)'), ('f g', 'femto*(gram)'), ('fBq', 'femto*(becquerel)'), ('f*C', 'femto*(coulomb)'), ('f C', 'femto*(coulomb)'), ('f*S', 'femto*(siemens)'), ('f S', 'femto*(siemens)'), ('fSv', 'femto*(sievert)'), ('f*N', 'femto*(newton)'), ('f N', 'femto*(newton)'), ('fPa', 'femto*(pascal)'), ('fHz', 'femto*(hertz)'), ('f*J', 'femto*(joule)'), ('f J', 'femto*(joule)'), ('f*F', 'femto*(farad)'), ('f F', 'femto*(farad)'), ('fWb', 'femto*(weber)'), ('f*T', 'femto*(tesla)'), ('f T', 'femto*(tesla)'), ('f*H', 'femto*(henry)'), ('f H', 'femto*(henry)'), ('flm', 'femto*(lumen)'), ('f*W', 'femto*(watt)'), ('f W', 'femto*(watt)'), ('f*V', 'femto*(volt)'), ('f V', 'femto*(volt)'), ('fGy', 'femto*(gray)'), ('f*O', 'femto*(ohm)'), ('f O', 'femto*(ohm)'), ('flx', 'femto*(lux)'), ('f*u', 'femto*(atomicmassunit)'), ('f u', 'femto*(atomicmassunit)'), ('feV', 'femto*(electronvolt)'), ('fsr', 'femto*(steradian)'), ('f*t', 'femto*(metricton)'), ('f t', 'femto*(metricton)'), ('f*Å', 'femto*(angstrom)'), ('f Å', 'femto*(angstrom)'), ('f*r', 'femto*(radian)'), ('f r', 'femto*(radian)'), ('f*L', 'femto*(liter)'), ('f L', 'femto*(liter)'), ('fNp', 'femto*(neper)'), ('f*h', 'femto*(hour)'), ('f h', 'femto*(hour)'), ('f*B', 'femto*(bel)'), ('f B', 'femto*(bel)'), ('fqt', 'femto*(quart)'), ('foz', 'femto*(ounce)'), ('flb', 'femto*(pound)'), ('fst', 'femto*(stone)'), ('fin', 'femto*(inch)'), ('fft', 'femto*(foot)'), ('fyd', 'femto*(yard)'), ('fmi', 'femto*(mile)'), ('fgi', 'femto*(gill)'), ('fpt', 'femto*(pint)'), ('zcd', 'zepto*(candela)'), ('z*s', 'zepto*(second)'), ('z s', 'zepto*(second)'), ('z*A', 'zepto*(ampere)'), ('z A', 'zepto*(ampere)'), ('z*K', 'zepto*(kelvin)'), ('z K', 'zepto*(kelvin)'), ('z*m', 'zepto*(metre)'), ('z m', 'zepto*(metre)'), ('z*g', 'zepto*(gram)'), ('z g', 'zepto*(gram)'), ('zBq', 'zepto*(becquerel)'), ('z*C', 'zepto*(coulomb)'), ('z C', 'zepto*(coulomb)'), ('z*S', 'zepto*(siemens)'), ('z S', 'zepto*(siemens)'), ('zSv', 'zepto*(sievert)'), ('z*N', 'zepto*(newton)'), ('z N', 'zepto*(newton)'), ('zPa', 'zepto*(pascal)'), ('zHz', 'zepto*(hertz)'), ('z*J', 'zepto*(joule)'), ('z J', 'zepto*(joule)'), ('z*F', 'zepto*(farad)'), ('z F', 'zepto*(farad)'), ('zWb', 'zepto*(weber)'), ('z*T', 'zepto*(tesla)'), ('z T', 'zepto*(tesla)'), ('z*H', 'zepto*(henry)'), ('z H', 'zepto*(henry)'), ('zlm', 'zepto*(lumen)'), ('z*W', 'zepto*(watt)'), ('z W', 'zepto*(watt)'), ('z*V', 'zepto*(volt)'), ('z V', 'zepto*(volt)'), ('zGy', 'zepto*(gray)'), ('z*O', 'zepto*(ohm)'), ('z O', 'zepto*(ohm)'), ('zlx', 'zepto*(lux)'), ('z*u', 'zepto*(atomicmassunit)'), ('z u', 'zepto*(atomicmassunit)'), ('zeV', 'zepto*(electronvolt)'), ('zsr', 'zepto*(steradian)'), ('z*t', 'zepto*(metricton)'), ('z t', 'zepto*(metricton)'), ('z*Å', 'zepto*(angstrom)'), ('z Å', 'zepto*(angstrom)'), ('z*r', 'zepto*(radian)'), ('z r', 'zepto*(radian)'), ('z*L', 'zepto*(liter)'), ('z L', 'zepto*(liter)'), ('zNp', 'zepto*(neper)'), ('z*h', 'zepto*(hour)'), ('z h', 'zepto*(hour)'), ('z*B', 'zepto*(bel)'), ('z B', 'zepto*(bel)'), ('zqt', 'zepto*(quart)'), ('zoz', 'zepto*(ounce)'), ('zlb', 'zepto*(pound)'), ('zst', 'zepto*(stone)'), ('zin', 'zepto*(inch)'), ('zft', 'zepto*(foot)'), ('zyd', 'zepto*(yard)'), ('zmi', 'zepto*(mile)'), ('zgi', 'zepto*(gill)'), ('zpt', 'zepto*(pint)'), ('ycd', 'yocto*(candela)'), ('y*s', 'yocto*(second)'), ('y s', 'yocto*(second)'), ('y*A', 'yocto*(ampere)'), ('y A', 'yocto*(ampere)'), ('y*K', 'yocto*(kelvin)'), ('y K', 'yocto*(kelvin)'), ('y*m', 'yocto*(metre)'), ('y m', 'yocto*(metre)'), ('y*g', 'yocto*(gram)'), ('y g', 'yocto*(gram)'), ('yBq', 'yocto*(becquerel)'), ('y*C', 'yocto*(coulomb)'), ('y C', 'yocto*(coulomb)'), ('y*S', 'yocto*(siemens)'), ('y S', 'yocto*(siemens)'), ('ySv', 'yocto*(sievert)'), ('y*N', 'yocto*(newton)'), ('y N', 'yocto*(newton)'), ('yPa', 'yocto*(pascal)'), ('yHz', 'yocto*(hertz)'), ('y*J', 'yocto*(joule)'), ('y J', 'yocto*(joule)'), ('y*F', 'yocto*(farad)'), ('y F', 'yocto*(farad)'), ('yWb', 'yocto*(weber)'), ('y*T', 'yocto*(tesla)'), ('y T', 'yocto*(tesla)'), ('y*H', 'yocto*(henry)'), ('y H', 'yocto*(henry)'), ('ylm', 'yocto*(lumen)'), ('y*W', 'yocto*(watt)'), ('y W', 'yocto*(watt)'), ('y*V', 'yocto*(volt)'), ('y V', 'yocto*(volt)'), ('yGy', 'yocto*(gray)'), ('y*O', 'yocto*(ohm)'), ('y O', 'yocto*(ohm)'), ('ylx', 'yocto*(lux)'), ('y*u', 'yocto*(atomicmassunit)'), ('y u', 'yocto*(atomicmassunit)'), ('yeV', 'yocto*(electronvolt)'), ('ysr', 'yocto*(steradian)'), ('y*t', 'yocto*(metricton)'), ('y t', 'yocto*(metricton)'), ('y*Å', 'yocto*(angstrom)'), ('y Å', 'yocto*(angstrom)'), ('y*r', 'yocto*(radian)'), ('y r', 'yocto*(radian)'), ('y*L', 'yocto*(liter)'), ('y L', 'yocto*(liter)'), ('yNp', 'yocto*(neper)'), ('y*h', 'yocto*(hour)'), ('y h', 'yocto*(hour)'), ('y*B', 'yocto*(bel)'), ('y B', 'yocto*(bel)'), ('yqt', 'yocto*(quart)'), ('yoz', 'yocto*(ounce)'), ('ylb', 'yocto*(pound)'), ('yst', 'yocto*(stone)'), ('yin', 'yocto*(inch)'), ('yft', 'yocto*(foot)'), ('yyd', 'yocto*(yard)'), ('ymi', 'yocto*(mile)'), ('ygi', 'yocto*(gill)'), ('ypt', 'yocto*(pint)'), ('Pcd', 'peta*(candela)'), ('P*s', 'peta*(second)'), ('P s', 'peta*(second)'), ('P*A', 'peta*(ampere)'), ('P A', 'peta*(ampere)'), ('P*K', 'peta*(kelvin)'), ('P K', 'peta*(kelvin)'), ('P*m', 'peta*(metre)'), ('P m', 'peta*(metre)'), ('P*g', 'peta*(gram)'), ('P g', 'peta*(gram)'), ('PBq', 'peta*(becquerel)'), ('P*C', 'peta*(coulomb)'), ('P C', 'peta*(coulomb)'), ('P*S', 'peta*(siemens)'), ('P S', 'peta*(siemens)'), ('PSv', 'peta*(sievert)'), ('P*N', 'peta*(newton)'), ('P N', 'peta*(newton)'), ('PPa', 'peta*(pascal)'), ('PHz', 'peta*(hertz)'), ('P*J', 'peta*(joule)'), ('P J', 'peta*(joule)'), ('P*F', 'peta*(farad)'), ('P F', 'peta*(farad)'), ('PWb', 'peta*(weber)'), ('P*T', 'peta*(tesla)'), ('P T', 'peta*(tesla)'), ('P*H', 'peta*(henry)'), ('P H', 'peta*(henry)'), ('Plm', 'peta*(lumen)'), ('P*W', 'peta*(watt)'), ('P W', 'peta*(watt)'), ('P*V', 'peta*(volt)'), ('P V', 'peta*(volt)'), ('PGy', 'peta*(gray)'), ('P*O', 'peta*(ohm)'), ('P O', 'peta*(ohm)'), ('Plx', 'peta*(lux)'), ('P*u', 'peta*(atomicmassunit)'), ('P u', 'peta*(atomicmassunit)'), ('PeV', 'peta*(electronvolt)'), ('Psr', 'peta*(steradian)'), ('P*t', 'peta*(metricton)'), ('P t', 'peta*(metricton)'), ('P*Å', 'peta*(angstrom)'), ('P Å', 'peta*(angstrom)'), ('P*r', 'peta*(radian)'), ('P r', 'peta*(radian)'), ('P*L', 'peta*(liter)'), ('P L', 'peta*(liter)'), ('PNp', 'peta*(neper)'), ('P*h', 'peta*(hour)'), ('P h', 'peta*(hour)'), ('P*B', 'peta*(bel)'), ('P B', 'peta*(bel)'), ('Pqt', 'peta*(quart)'), ('Poz', 'peta*(ounce)'), ('Plb', 'peta*(pound)'), ('Pst', 'peta*(stone)'), ('Pin', 'peta*(inch)'), ('Pft', 'peta*(foot)'), ('Pyd', 'peta*(yard)'), ('Pmi', 'peta*(mile)'), ('Pgi', 'peta*(gill)'), ('Ppt', 'peta*(pint)'), ('Tcd', 'tera*(candela)'), ('T*s', 'tera*(second)'), ('T s', 'tera*(second)'), ('T*A', 'tera*(ampere)'), ('T A', 'tera*(ampere)'), ('T*K', 'tera*(kelvin)'), ('T K', 'tera*(kelvin)'), ('T*m', 'tera*(metre)'), ('T m', 'tera*(metre)'), ('T*g', 'tera*(gram)'), ('T g', 'tera*(gram)'), ('TBq', 'tera*(becquerel)'), ('T*C', 'tera*(coulomb)'), ('T C', 'tera*(coulomb)'), ('T*S', 'tera*(siemens)'), ('T S', 'tera*(siemens)'), ('TSv', 'tera*(sievert)'), ('T*N', 'tera*(newton)'), ('T N', 'tera*(newton)'), ('TPa', 'tera*(pascal)'), ('THz', 'tera*(hertz)'), ('T*J', 'tera*(joule)'), ('T J', 'tera*(joule)'), ('T*F', 'tera*(farad)'), ('T F', 'tera*(farad)'), ('TWb', 'tera*(weber)'), ('T*T', 'tera*(tesla)'), ('T T', 'tera*(tesla)'), ('T*H', 'tera*(henry)'), ('T H', 'tera*(henry)'), ('Tlm', 'tera*(lumen)'), ('T*W', 'tera*(watt)'), ('T W', 'tera*(watt)'), ('T*V', 'tera*(volt)'), ('T V', 'tera*(volt)'), ('TGy', 'tera*(gray)'), ('T*O', 'tera*(ohm)'), ('T O', 'tera*(ohm)'), ('Tlx', 'tera*(lux)'), ('T*u', 'tera*(atomicmassunit)'), ('T u', 'tera*(atomicmassunit)'), ('TeV', 'tera*(electronvolt)'), ('Tsr', 'tera*(steradian)'), ('T*t', 'tera*(metricton)'), ('T t', 'tera*(metricton)'), ('T*Å', 'tera*(angstrom)'), ('T Å', 'tera*(angstrom)'), ('T*r', 'tera*(radian)'), ('T r', 'tera*(radian)'), ('T*L', 'tera*(liter)'), ('T L', 'tera*(liter)'), ('TNp', 'tera*(neper)'), ('T*h', 'tera*(hour)'), ('T h', 'tera*(hour)'), ('T*B', 'tera*(bel)'), ('T B', 'tera*(bel)'), ('Tqt', 'tera*(quart)'), ('Toz', 'tera*(ounce)'), ('Tlb', 'tera*(pound)'), ('Tst', 'tera*(stone)'), ('Tin', 'tera*(inch)'), ('Tft', 'tera*(foot)'), ('Tyd', 'tera*(yard)'), ('Tmi', 'tera*(mile)'), ('Tgi', 'tera*(gill)'), ('Tpt', 'tera*(pint)'), ('Gcd', 'giga*(candela)'), ('G*s', 'giga*(second)'), ('G s', 'giga*(second)'), ('G*A', 'giga*(ampere)'), ('G A', 'giga*(ampere)'), ('G*K', 'giga*(kelvin)'), ('G K', 'giga*(kelvin)'), ('G*m', 'giga*(metre)'), ('G m', 'giga*(metre)'), ('G*g', 'giga*(gram)'), ('G g', 'giga*(gram)'), ('GBq', 'giga*(becquerel)'), ('G*C', 'giga*(coulomb)'), ('G C', 'giga*(coulomb)'), ('G*S', 'giga*(siemens)'), ('G S', 'giga*(siemens)'), ('GSv', 'giga*(sievert)'), ('G*N', 'giga*(newton)'), ('G N', 'giga*(newton)'), ('GPa', 'giga*(pascal)'), ('GHz', 'giga*(hertz)'), ('G*J', 'giga*(joule)'), ('G J', 'giga*(joule)'), ('G*F', 'giga*(farad)'), ('G F', 'giga*(farad)'), ('GWb', 'giga*(weber)'), ('G*T', 'giga*(tesla)'), ('G T', 'giga*(tesla)'), ('G*H', 'giga*(henry)'), ('G H', 'giga*(henry)'), ('Glm', 'giga*(lumen)'), ('G*W', 'giga*(watt)'), ('G W', 'giga*(watt)'), ('G*V', 'giga*(volt)'), ('G V', 'giga*(volt)'), ('GGy', 'giga*(gray)'), ('G*O', 'giga*(ohm)'), ('G O', 'giga*(ohm)'), ('Glx', 'giga*(lux)'), ('G*u', 'giga*(atomicmassunit)'), ('G u', 'giga*(atomicmassunit)'), ('GeV', 'giga*(electronvolt)'), ('Gsr', 'giga*(steradian)'), ('G*t', 'giga*(metricton)'), ('G t', 'giga*(metricton)'), ('G*Å', 'giga*(angstrom)'), ('G Å', 'giga*(angstrom)'), ('G*r', 'giga*(radian)'), ('G r', 'giga*(radian)'), ('G*L', 'giga*(liter)'), ('G L', 'giga*(liter)'), ('GNp', 'giga*(neper)'), ('G*h', 'giga*(hour)'), ('G h', 'giga*(hour)'), ('G*B', 'giga*(bel)'), ('G B', 'giga*(bel)'), ('Gqt', 'giga*(quart)'), ('Goz', 'giga*(ounce)'), ('Glb', 'giga*(pound)'), ('Gst', 'giga*(stone)'), ('Gin', 'giga*(inch)'), ('Gft', 'giga*(foot)'), ('Gyd', 'giga*(yard)'), ('Gmi', 'giga*(mile)'), ('Ggi', 'giga*(gill)'), ('Gpt', 'giga*(pint)'), ('Mcd', 'mega*(candela)'), ('M*s', 'mega*(second)'), ('M s', 'mega*(second)'), ('M*A', 'mega*(ampere)'), ('M A', 'mega*(ampere)'), ('M*K', 'mega*(kelvin)'), ('M K', 'mega*(kelvin)'), ('M*m', 'mega*(metre)'), ('M m', 'mega*(metre)'), ('M*g', 'mega*(gram)'), ('M g', 'mega*(gram)'), ('MBq', 'mega*(becquerel)'), ('M*C', 'mega*(coulomb)'), ('M C', 'mega*(coulomb)'), ('M*S', 'mega*(siemens)'), ('M S', 'mega*(siemens)'), ('MSv', 'mega*(sievert)'), ('M*N', 'mega*(newton)'), ('M N', 'mega*(newton)'), ('MPa', 'mega*(pascal)'), ('MHz', 'mega*(hertz)'), ('M*J', 'mega*(joule)'), ('M J', 'mega*(joule)'), ('M*F', 'mega*(farad)'), ('M F', 'mega*(farad)'), ('MWb', 'mega*(weber)'), ('M*T', 'mega*(tesla)'), ('M T', 'mega*(tesla)'), ('M*H', 'mega*(henry)'), ('M H', 'mega*(henry)'), ('Mlm', 'mega*(lumen)'), ('M*W', 'mega*(watt)'), ('M W', 'mega*(watt)'), ('M*V', 'mega*(volt)'), ('M V', 'mega*(volt)'), ('MGy', 'mega*(gray)'), ('M*O', 'mega*(ohm)'), ('M O', 'mega*(ohm)'), ('Mlx', 'mega*(lux)'), ('M*u', 'mega*(atomicmassunit)'), ('M u', 'mega*(atomicmassunit)'), ('MeV', 'mega*(electronvolt)'), ('Msr', 'mega*(steradian)'), ('M*t', 'mega*(metricton)'), ('M t', 'mega*(metricton)'), ('M*Å', 'mega*(angstrom)'), ('M Å', 'mega*(angstrom)'), ('M*r', 'mega*(radian)'), ('M r', 'mega*(radian)'), ('M*L', 'mega*(liter)'), ('M L', 'mega*(liter)'), ('MNp', 'mega*(neper)'), ('M*h', 'mega*(hour)'), ('M h', 'mega*(hour)'), ('M*B', 'mega*(bel)'), ('M B', 'mega*(bel)'), ('Mqt', 'mega*(quart)'), ('Moz', 'mega*(ounce)'), ('Mlb', 'mega*(pound)'), ('Mst', 'mega*(stone)'), ('Min', 'mega*(inch)'), ('Mft', 'mega*(foot)'), ('Myd', 'mega*(yard)'), ('Mmi', 'mega*(mile)'), ('Mgi', 'mega*(gill)'), ('Mpt', 'mega*(pint)'), ('kcd', 'kilo*(candela)'), ('k*s', 'kilo*(second)'), ('k s', 'kilo*(second)'), ('k*A', 'kilo*(ampere)'), ('k A', 'kilo*(ampere)'), ('k*K', 'kilo*(kelvin)'), ('k K', 'kilo*(kelvin)'), ('k*m', 'kilo*(metre)'), ('k m', 'kilo*(metre)'), ('k*g', 'kilo*(gram)'), ('k g', 'kilo*(gram)'), ('kBq', 'kilo*(becquerel)'), ('k*C', 'kilo*(coulomb)'), ('k C', 'kilo*(coulomb)'), ('k*S', 'kilo*(siemens)'), ('k S', 'kilo*(siemens)'), ('kSv', 'kilo*(sievert)'), ('k*N', 'kilo*(newton)'), ('k N', 'kilo*(newton)'), ('kPa', 'kilo*(pascal)'), ('kHz', 'kilo*(hertz)'), ('k*J', 'kilo*(joule)'), ('k J', 'kilo*(joule)'), ('k*F', 'kilo*(farad)'), ('k F', 'kilo*(farad)'), ('kWb', 'kilo*(weber)'), ('k*T', 'kilo*(tesla)'), ('k T', 'kilo*(tesla)'), ('k*H', 'kilo*(henry)'), ('k H', 'kilo*(henry)'), ('klm', 'kilo*(lumen)'), ('k*W', 'kilo*(watt)'), ('k W', 'kilo*(watt)'), ('k*V', 'kilo*(volt)'), ('k V', 'kilo*(volt)'), ('kGy', 'kilo*(gray)'), ('k*O', 'kilo*(ohm)'), ('k O', 'kilo*(ohm)'), ('klx', 'kilo*(lux)'), ('k*u', 'kilo*(atomicmassunit)'), ('k u', 'kilo*(atomicmassunit)'), ('keV', 'kilo*(electronvolt)'), ('ksr', 'kilo*(steradian)'), ('k*t', 'kilo*(metricton)'), ('k t', 'kilo*(metricton)'), ('k*Å', 'kilo*(angstrom)'), ('k Å', 'kilo*(angstrom)'), ('k*r', 'kilo*(radian)'), ('k r', 'kilo*(radian)'), ('k*L', 'kilo*(liter)'), ('k L', 'kilo*(liter)'), ('kNp', 'kilo*(neper)'), ('k*h', 'kilo*(hour)'), ('k h', 'kilo*(hour)'), ('k*B', 'kilo*(bel)'), ('k B', 'kilo*(bel)'), ('kqt', 'kilo*(quart)'), ('koz', 'kilo*(ounce)'), ('klb', 'kilo*(pound)'), ('kst', 'kilo*(stone)'), ('kin', 'kilo*(inch)'), ('kft', 'kilo*(foot)'), ('kyd', 'kilo*(yard)'), ('kmi', 'kilo*(mile)'), ('kgi', 'kilo*(gill)'), ('kpt', 'kilo*(pint)'), ('das', 'deka*(second)'), ('daA', 'deka*(ampere)'), ('daK', 'deka*(kelvin)'), ('dam', 'deka*(metre)'), ('dag', 'deka*(gram)'), ('daC', 'deka*(coulomb)'), ('daS', 'deka*(siemens)'), ('daN', 'deka*(newton)'), ('daJ', 'deka*(joule)'), ('daF', 'deka*(farad)'), ('daT', 'deka*(tesla)'), ('daH', 'deka*(henry)'), ('daW', 'deka*(watt)'), ('daV', 'deka*(volt)'), ('daO', 'deka*(ohm)'), ('dau', 'deka*(atomicmassunit)'), ('dat', 'deka*(metricton)'), ('daÅ', 'deka*(angstrom)'), ('dar', 'deka*(radian)'), ('daL', 'deka*(liter)'), ('dah', 'deka*(hour)'), ('daB', 'deka*(bel)'), ('dcd', 'deci*(candela)'), ('d*s', 'deci*(second)'), ('d s', 'deci*(second)'), ('d*A', 'deci*(ampere)'), ('d A', 'deci*(ampere)'), ('d*K', 'deci*(kelvin)'), ('d K', 'deci*(kelvin)'), ('d*m', 'deci*(metre)'), ('d m', 'deci*(metre)'), ('d*g', 'deci*(gram)'), ('d g', 'deci*(gram)'), ('dBq', 'deci*(becquerel)'), ('d*C', 'deci*(coulomb)'), ('d C', 'deci*(coulomb)'), ('d*S', 'deci*(siemens)'), ('d S', 'deci*(siemens)'), ('dSv', 'deci*(sievert)'), ('d*N', 'deci*(newton)'), ('d N', 'deci*(newton)'), ('dPa', 'deci*(pascal)'), ('dHz', 'deci*(hertz)'), ('d*J', 'deci*(joule)'), ('d J', 'deci*(joule)'), ('d*F', 'deci*(farad)'), ('d F', 'deci*(farad)'), ('dWb', 'deci*(weber)'), ('d*T', 'deci*(tesla)'), ('d T', 'deci*(tesla)'), ('d*H', 'deci*(henry)'), ('d H', 'deci*(henry)'), ('dlm', 'deci*(lumen)'), ('d*W', 'deci*(watt)'), ('d W', 'deci*(watt)'), ('d*V', 'deci*(volt)'), ('d V', 'deci*(volt)'), ('dGy', 'deci*(gray)'), ('d*O', 'deci*(ohm)'), ('d O', 'deci*(ohm)'), ('dlx', 'deci*(lux)'), ('d*u', 'deci*(atomicmassunit)'), ('d u', 'deci*(atomicmassunit)'), ('deV', 'deci*(electronvolt)'), ('dsr', 'deci*(steradian)'), ('d*t', 'deci*(metricton)'), ('d t', 'deci*(metricton)'), ('d*Å', 'deci*(angstrom)'), ('d Å', 'deci*(angstrom)'), ('d*r', 'deci*(radian)'), ('d r', 'deci*(radian)'), ('d*L', 'deci*(liter)'), ('d L', 'deci*(liter)'), ('dNp', 'deci*(neper)'), ('d*h', 'deci*(hour)'), ('d h', 'deci*(hour)'), ('d*B', 'deci*(bel)'), ('d B', 'deci*(bel)'), ('dqt', 'deci*(quart)'), ('doz', 'deci*(ounce)'), ('dlb', 'deci*(pound)'), ('dst', 'deci*(stone)'), ('din', 'deci*(inch)'), ('dft', 'deci*(foot)'), ('dyd', 'deci*(yard)'), ('dmi', 'deci*(mile)'), ('dgi', 'deci*(gill)'), ('dpt', 'deci*(pint)'), ('ncd', 'nano*(candela)'), ('n*s', 'nano*(second)'), ('n s', 'nano*(second)'), ('n*A', 'nano*(ampere)'), ('n A', 'nano*(ampere)'), ('n*K', 'nano*(kelvin)'), ('n K', 'nano*(kelvin)'), ('n*m', 'nano*(metre)'), ('n m', 'nano*(metre)'), ('n*g', 'nano*(gram)'), ('n g', 'nano*(gram)'), ('nBq', 'nano*(becquerel)'), ('n*C', 'nano*(coulomb)'), ('n C', 'nano*(coulomb)'), ('n*S', 'nano*(siemens)'), ('n S', 'nano*(siemens)'), ('nSv', 'nano*(sievert)'), ('n*N', 'nano*(newton)'), ('n N', 'nano*(newton)'), ('nPa', 'nano*(pascal)'), ('nHz', 'nano*(hertz)'), ('n*J', 'nano*(joule)'), ('n J', 'nano*(joule)'), ('n*F', 'nano*(farad)'), ('n F', 'nano*(farad)'), ('nWb', 'nano*(weber)'), ('n*T', 'nano*(tesla)'), ('n T', 'nano*(tesla)'), ('n*H', 'nano*(henry)'), ('n H', 'nano*(henry)'), ('nlm', 'nano*(lumen)'), ('n*W', 'nano*(watt)'), ('n W', 'nano*(watt)'), ('n*V', 'nano*(volt)'), ('n V', 'nano*(volt)'), ('nGy', 'nano*(gray)'), ('n*O', 'nano*(ohm)'), ('n O', 'nano*(ohm)'), ('nlx', 'nano*(lux)'), ('n*u', 'nano*(atomicmassunit)'), ('n u', 'nano*(atomicmassunit)'), ('neV', 'nano*(electronvolt)'), ('nsr', 'nano*(steradian)'), ('n*t', 'nano*(metricton)'), ('n t', 'nano*(metricton)'), ('n*Å', 'nano*(angstrom)'), ('n Å', 'nano*(angstrom)'), ('n*r', 'nano*(radian)'), ('n r', 'nano*(radian)'), ('n*L', 'nano*(liter)'), ('n L', 'nano*(liter)'), ('nNp', 'nano*(neper)'), ('n*h', 'nano*(hour)'), ('n h', 'nano*(hour)'), ('n*B', 'nano*(bel)'), ('n B', 'nano*(bel)'), ('nqt', 'nano*(quart)'), ('noz', 'nano*(ounce)'), ('nlb', 'nano*(pound)'), ('nst', 'nano*(stone)'), ('nin', 'nano*(inch)'), ('nft', 'nano*(foot)'), ('nyd', 'nano*(yard)'), ('nmi', 'nano*(mile)'), ('ngi', 'nano*(gill)'), ('npt', 'nano*(pint)'), ('pcd', 'pico*(candela)'), ('p*s', 'pico*(second)'), ('p s', 'pico*(second)'), ('p*A', 'pico*(ampere)'), ('p A', 'pico*(ampere)'), ('p*K', 'pico*(kelvin)'), ('p K', 'pico*(kelvin)'), ('p*m', 'pico*(metre)'), ('p m', 'pico*(metre)'), ('p*g', 'pico*(gram)'), ('p g', 'pico*(gram)'), ('pBq', 'pico*(becquerel)'), ('p*C', 'pico*(coulomb)'), ('p C', 'pico*(coulomb)'), ('p*S', 'pico*(siemens)'), ('p S', 'pico*(siemens)'), ('pSv', 'pico*(sievert)'), ('p*N', 'pico*(newton)'), ('p N', 'pico*(newton)'), ('pPa', 'pico*(pascal)'), ('pHz', 'pico*(hertz)'), ('p*J', 'pico*(joule)'), ('p J', 'pico*(joule)'), ('p*F', 'pico*(farad)'), ('p F', 'pico*(farad)'), ('pWb', 'pico*(weber)'), ('p*T', 'pico*(tesla)'), ('p T', 'pico*(tesla)'), ('p*H', 'pico*(henry)'), ('p H', 'pico*(henry)'), ('plm', 'pico*(lumen)'), ('p*W', 'pico*(watt)'), ('p W', 'pico*(watt)'), ('p*V', 'pico*(volt)'), ('p V', 'pico*(volt)'), ('pGy', 'pico*(gray)'), ('p*O', 'pico*(ohm)'), ('p O', 'pico*(ohm)'), ('plx', 'pico*(lux)'), ('p*u', 'pico*(atomicmassunit)'), ('p u', 'pico*(atomicmassunit)'), ('peV', 'pico*(electronvolt)'), ('psr', 'pico*(steradian)'), ('p*t', 'pico*(metricton)'), ('p t', 'pico*(metricton)'), ('p*Å', 'pico*(angstrom)'), ('p Å', 'pico*(angstrom)'), ('p*r', 'pico*(radian)'), ('p r', 'pico*(radian)'), ('p*L', 'pico*(liter)'), ('p L', 'pico*(liter)'), ('pNp', 'pico*(neper)'), ('p*h', 'pico*(hour)'), ('p h', 'pico*(hour)'), ('p*B', 'pico*(bel)'), ('p B', 'pico*(bel)'), ('pqt', 'pico*(quart)'), ('poz', 'pico*(ounce)'), ('plb', 'pico*(pound)'), ('pst', 'pico*(stone)'), ('pin', 'pico*(inch)'), ('pft', 'pico*(foot)'), ('pyd', 'pico*(yard)'), ('pmi', 'pico*(mile)'), ('pgi', 'pico*(gill)'), ('ppt', 'pico*(pint)'), ('acd', 'atto*(candela)'), ('a*s', 'atto*(second)'), ('a s', 'atto*(second)'), ('a*A', 'atto*(ampere)'), ('a A', 'atto*(ampere)'), ('a*K', 'atto*(kelvin)'), ('a K', 'atto*(kelvin)'), ('a*m', 'atto*(metre)'), ('a m', 'atto*(metre)'), ('a*g', 'atto*(gram)'), ('a g', 'atto*(gram)'), ('aBq', 'atto*(becquerel)'), ('a*C', 'atto*(coulomb)'), ('a C', 'atto*(coulomb)'), ('a*S', 'atto*(siemens)'), ('a S', 'atto*(siemens)'), ('aSv', 'atto*(sievert)'), ('a*N', 'atto*(newton)'), ('a N', 'atto*(newton)'), ('aPa', 'atto*(pascal)'), ('aHz', 'atto*(hertz)'), ('a*J', 'atto*(joule)'), ('a J', 'atto*(joule)'), ('a*F', 'atto*(farad)'), ('a F', 'atto*(farad)'), ('aWb', 'atto*(weber)'), ('a*T', 'atto*(tesla)'), ('a T', 'atto*(tesla)'), ('a*H', 'atto*(henry)'), ('a H', 'atto*(henry)'), ('alm', 'atto*(lumen)'), ('a*W', 'atto*(watt)'), ('a W', 'atto*(watt)'), ('a*V', 'atto*(volt)'), ('a V', 'atto*(volt)'), ('aGy', 'atto*(gray)'), ('a*O', 'atto*(ohm)'), ('a O', 'atto*(ohm)'), ('alx', 'atto*(lux)'), ('a*u', 'atto*(atomicmassunit)'), ('a u', 'atto*(atomicmassunit)'), ('aeV', 'atto*(electronvolt)'), ('asr', 'atto*(steradian)'), ('a*t', 'atto*(metricton)'), ('a t', 'atto*(metricton)'), ('a*Å', 'atto*(angstrom)'), ('a Å', 'atto*(angstrom)'), ('a*r', 'atto*(radian)'), ('a r', 'atto*(radian)'), ('a*L', 'atto*(liter)'), ('a L', 'atto*(liter)'), ('aNp', 'atto*(neper)'), ('a*h', 'atto*(hour)'), ('a h', 'atto*(hour)'), ('a*B', 'atto*(bel)'), ('a B', 'atto*(bel)'), ('aqt', 'atto*(quart)'), ('aoz', 'atto*(ounce)'), ('alb', 'atto*(pound)'), ('ast', 'atto*(stone)'), ('ain', 'atto*(inch)'), ('aft', 'atto*(foot)'), ('ayd', 'atto*(yard)'), ('ami', 'atto*(mile)'), ('agi', 'atto*(gill)'), ('apt', 'atto*(pint)'), ('Ecd', 'exa*(candela)'), ('E*s', 'exa*(second)'), ('E s', 'exa*(second)'), ('E*A', 'exa*(ampere)'), ('E A', 'exa*(ampere)'), ('E*K', 'exa*(kelvin)'), ('E K', 'exa*(kelvin)'), ('E*m', 'exa*(metre)'), ('E m', 'exa*(metre)'), ('E*g', 'exa*(gram)'), ('E g', 'exa*(gram)'), ('EBq', 'exa*(becquerel)'), ('E*C', 'exa*(coulomb)'), ('E C', 'exa*(coulomb)'), ('E*S', 'exa*(siemens)'), ('E S', 'exa*(siemens)'), ('ESv', 'exa*(sievert)'), ('E*N', 'exa*(newton)'), ('E N', 'exa*(newton)'), ('EPa', 'exa*(pascal)'), ('EHz', 'exa*(hertz)'), ('E*J', 'exa*(joule)'), ('E J', 'exa*(joule)'), ('E*F', 'exa*(farad)'), ('E F', 'exa*(farad)'), ('EWb', 'exa*(weber)'), ('E*T', 'exa*(tesla)'), ('E T', 'exa*(tesla)'), ('E*H', 'exa*(henry)'), ('E H', 'exa*(henry)'), ('Elm', 'exa*(lumen)'), ('E*W', 'exa*(watt)'), ('E W', 'exa*(watt)'), ('E*V', 'exa*(volt)'), ('E V', 'exa*(volt)'), ('EGy', 'exa*(gray)'), ('E*O', 'exa*(ohm)'), ('E O', 'exa*(ohm)'), ('Elx', 'exa*(lux)'), ('E*u', 'exa*(atomicmassunit)'), ('E u', 'exa*(atomicmassunit)'), ('EeV', 'exa*(electronvolt)'), ('Esr', 'exa*(steradian)'), ('E*t', 'exa*(metricton)'), ('E t', 'exa*(metricton)'), ('E*Å', 'exa*(angstrom)'), ('E Å', 'exa*(angstrom)'), ('E*r', 'exa*(radian)'), ('E r', 'exa*(radian)'), ('E*L', 'exa*(liter)'), ('E L', 'exa*(liter)'), ('ENp', 'exa*(neper)'), ('E*h', 'exa*(hour)'), ('E h', 'exa*(hour)'), ('E*B', 'exa*(bel)'), ('E B', 'exa*(bel)'), ('Eqt', 'exa*(quart)'), ('Eoz', 'exa*(ounce)'), ('Elb', 'exa*(pound)'), ('Est', 'exa*(stone)'), ('Ein', 'exa*(inch)'), ('Eft', 'exa*(foot)'), ('Eyd', 'exa*(yard)'), ('Emi', 'exa*(mile)'), ('Egi', 'exa*(gill)'), ('Ept', 'exa*(pint)'), ('ft', 'foot'), ('pt', 'pint'), ('Ys', 'yotta*(second)'), ('YA', 'yotta*(ampere)'), ('YK', 'yotta*(kelvin)'), ('Ym', 'yotta*(metre)'), ('Yg', 'yotta*(gram)'), ('YC', 'yotta*(coulomb)'), ('YS', 'yotta*(siemens)'), ('YN', 'yotta*(newton)'), ('YJ', 'yotta*(joule)'), ('YF', 'yotta*(farad)'), ('YT', 'yotta*(tesla)'), ('YH', 'yotta*(henry)'), ('YW', 'yotta*(watt)'), ('YV', 'yotta*(volt)'), ('YO', 'yotta*(ohm)'), ('Yu', 'yotta*(atomicmassunit)'), ('Yt', 'yotta*(metricton)'), ('YÅ', 'yotta*(angstrom)'), ('Yr', 'yotta*(radian)'), ('YL', 'yotta*(liter)'), ('Yh', 'yotta*(hour)'), ('YB', 'yotta*(bel)'), ('Zs', 'zetta*(second)'), ('ZA', 'zetta*(ampere)'), ('ZK', 'zetta*(kelvin)'), ('Zm', 'zetta*(metre)'), ('Zg', 'zetta*(gram)'), ('ZC', 'zetta*(coulomb)'), ('ZS', 'zetta*(siemens)'), ('ZN', 'zetta*(newton)'), ('ZJ', 'zetta*(joule)'), ('ZF', 'zetta*(farad)'), ('ZT', 'zetta*(tesla)'), ('ZH', 'zetta*(henry)'), ('ZW', 'zetta*(watt)'), ('ZV', 'zetta*(volt)'), ('ZO', 'zetta*(ohm)'), ('Zu', 'zetta*(atomicmassunit)'), ('Zt', 'zetta*(metricton)'), ('ZÅ', 'zetta*(angstrom)'), ('Zr', 'zetta*(radian)'), ('ZL', 'zetta*(liter)'), ('Zh', 'zetta*(hour)'), ('ZB', 'zetta*(bel)'), ('hs', 'hecto*(second)'), ('hA', 'hecto*(ampere)'), ('hK', 'hecto*(kelvin)'), ('hm', 'hecto*(metre)'), ('hg', 'hecto*(gram)'), ('hC', 'hecto*(coulomb)'), ('hS', 'hecto*(siemens)'), ('hN', 'hecto*(newton)'), ('hJ', 'hecto*(joule)'), ('hF', 'hecto*(farad)'), ('hT', 'hecto*(tesla)'), ('hH', 'hecto*(henry)'), ('hW', 'hecto*(watt)'), ('hV', 'hecto*(volt)'), ('hO', 'hecto*(ohm)'), ('hu', 'hecto*(atomicmassunit)'), ('ht', 'hecto*(metricton)'), ('hÅ', 'hecto*(angstrom)'), ('hr', 'hecto*(radian)'), ('hL', 'hecto*(liter)'), ('hh', 'hecto*(hour)'), ('hB', 'hecto*(bel)'), ('cs', 'centi*(second)'), ('cA', 'centi*(ampere)'), ('cK', 'centi*(kelvin)'), ('cm', 'centi*(metre)'), ('cg', 'centi*(gram)'), ('cC', 'centi*(coulomb)'), ('cS', 'centi*(siemens)'), ('cN', 'centi*(newton)'), ('cJ', 'centi*(joule)'), ('cF', 'centi*(farad)'), ('cT', 'centi*(tesla)'), ('cH', 'centi*(henry)'), ('cW', 'centi*(watt)'), ('cV', 'centi*(volt)'), ('cO', 'centi*(ohm)'), ('cu', 'centi*(atomicmassunit)'), ('ct', 'centi*(metricton)'), ('cÅ', 'centi*(angstrom)'), ('cr', 'centi*(radian)'), ('cL', 'centi*(liter)'), ('ch', 'centi*(hour)'), ('cB', 'centi*(bel)'), ('ms', 'milli*(second)'), ('mA', 'milli*(ampere)'), ('mK', 'milli*(kelvin)'), ('mm', 'milli*(metre)'), ('mg', 'milli*(gram)'), ('mC', 'milli*(coulomb)'), ('mS', 'milli*(siemens)'), ('mN', 'milli*(newton)'), ('mJ', 'milli*(joule)'), ('mF', 'milli*(farad)'), ('mT', 'milli*(tesla)'), ('mH', 'milli*(henry)'), ('mW', 'milli*(watt)'), ('mV', 'milli*(volt)'), ('mO', 'milli*(ohm)'), ('mu', 'milli*(atomicmassunit)'), ('mt', 'milli*(metricton)'), ('mÅ', 'milli*(angstrom)'), ('mr', 'milli*(radian)'), ('mL', 'milli*(liter)'), ('mh', 'milli*(hour)'), ('mB', 'milli*(bel)'), ('fs', 'femto*(second)'), ('fA', 'femto*(ampere)'), ('fK', 'femto*(kelvin)'), ('fm', 'femto*(metre)'), ('fg', 'femto*(gram)'), ('fC', 'femto*(coulomb)'), ('fS', 'femto*(siemens)'), ('fN', 'femto*(newton)'), ('fJ', 'femto*(joule)'), ('fF', 'femto*(farad)'), ('fT', 'femto*(tesla)'), ('fH', 'femto*(henry)'), ('fW', 'femto*(watt)'), ('fV', 'femto*(volt)'), ('fO', 'femto*(ohm)'), ('fu', 'femto*(atomicmassunit)'), ('ft', 'femto*(metricton)'), ('fÅ', 'femto*(angstrom)'), ('fr', 'femto*(radian)'), ('fL', 'femto*(liter)'), ('fh', 'femto*(hour)'), ('fB', 'femto*(bel)'), ('zs', 'zepto*(second)'), ('zA', 'zepto*(ampere)'), ('zK', 'zepto*(kelvin)'), ('zm', 'zepto*(metre)'), ('zg', 'zepto*(gram)'), ('zC', 'zepto*(coulomb)'), ('zS', 'zepto*(siemens)'), ('zN', 'zepto*(newton)'), ('zJ', 'zepto*(joule)'), ('zF', 'zepto*(farad)'), ('zT', 'zepto*(tesla)'), ('zH', 'zepto*(henry)'), ('zW', 'zepto*(watt)'), ('zV', 'zepto*(volt)'), ('zO', 'zepto*(ohm)'), ('zu', 'zepto*(atomicmassunit)'), ('zt', 'zepto*(metricton)'), ('zÅ', 'zepto*(angstrom)'), ('zr', 'zepto*(radian)'), ('zL', 'zepto*(liter)'), ('zh', 'zepto*(hour)'), ('zB', 'zepto*(bel)'), ('ys', 'yocto*(second)'), ('yA', 'yocto*(ampere)'), ('yK', 'yocto*(kelvin)'), ('ym', 'yocto*(metre)'), ('yg', 'yocto*(gram)'), ('yC', 'yocto*(coulomb)'), ('yS', 'yocto*(siemens)'), ('yN', 'yocto*(newton)'), ('yJ', 'yocto*(joule)'), ('yF', 'yocto*(farad)'), ('yT', 'yocto*(tesla)'), ('yH', 'yocto*(henry)'), ('yW', 'yocto*(watt)'), ('yV', 'yocto*(volt)'), ('yO', 'yocto*(ohm)'), ('yu', 'yocto*(atomicmassunit)'), ('yt', 'yocto*(metricton)'), ('yÅ', 'yocto*(angstrom)'), ('yr', 'yocto*(radian)'), ('yL', 'yocto*(liter)'), ('yh', 'yocto*(hour)'), ('yB', 'yocto*(bel)'), ('Ps', 'peta*(second)'), ('PA', 'peta*(ampere)'), ('PK', 'peta*(kelvin)'), ('Pm', 'peta*(metre)'), ('Pg', 'peta*(gram)'), ('PC', 'peta*(coulomb)'), ('PS', 'peta*(siemens)'), ('PN', 'peta*(newton)'), ('PJ', 'peta*(joule)'), ('PF', 'peta*(farad)'), ('PT', 'peta*(tesla)'), ('PH', 'peta*(henry)'), ('PW', 'peta*(watt)'), ('PV', 'peta*(volt)'), ('PO', 'peta*(ohm)'), ('Pu', 'peta*(atomicmassunit)'), ('Pt', 'peta*(metricton)'), ('PÅ', 'peta*(angstrom)'), ('Pr', 'peta*(radian)'), ('PL', 'peta*(liter)'), ('Ph', 'peta*(hour)'), ('PB', 'peta*(bel)'), ('Ts', 'tera*(second)'), ('TA', 'tera*(ampere)'), ('TK', 'tera*(kelvin)'), ('Tm', 'tera*(metre)'), ('Tg', 'tera*(gram)'), ('TC', 'tera*(coulomb)'), ('TS', 'tera*(siemens)'), ('TN', 'tera*(newton)'), ('TJ', 'tera*(joule)'), ('TF', 'tera*(farad)'), ('TT', 'tera*(tesla)'), ('TH', 'tera*(henry)'), ('TW', 'tera*(watt)'), ('TV', 'tera*(volt)'), ('TO', 'tera*(ohm)'), ('Tu', 'tera*(atomicmassunit)'), ('Tt', 'tera*(metricton)'), ('TÅ', 'tera*(angstrom)'), ('Tr', 'tera*(radian)'), ('TL', 'tera*(liter)'), ('Th', 'tera*(hour)'), ('TB', 'tera*(bel)'), ('Gs', 'giga*(second)'), ('GA', 'giga*(ampere)'), ('GK', 'giga*(kelvin)'), ('Gm', 'giga*(metre)'), ('Gg', 'giga*(gram)'), ('GC', 'giga*(coulomb)'), ('GS', 'giga*(siemens)'), ('GN', 'giga*(newton)'), ('GJ', 'giga*(joule)'), ('GF', 'giga*(farad)'), ('GT', 'giga*(tesla)'), ('GH', 'giga*(henry)'), ('GW', 'giga*(watt)'), ('GV', 'giga*(volt)'), ('GO', 'giga*(ohm)'), ('Gu', 'giga*(atomicmassunit)'), ('Gt', 'giga*(metricton)'), ('GÅ', 'giga*(angstrom)'), ('Gr', 'giga*(radian)'), ('GL', 'giga*(liter)'), ('Gh', 'giga*(hour)'), ('GB', 'giga*(bel)'), ('Ms', 'mega*(second)'), ('MA', 'mega*(ampere)'), ('MK', 'mega*(kelvin)'), ('Mm', 'mega*(metre)'), ('Mg', 'mega*(gram)'), ('MC', 'mega*(coulomb)'), ('MS', 'mega*(siemens)'), ('MN', 'mega*(newton)'), ('MJ', 'mega*(joule)'), ('MF', 'mega*(farad)'), ('MT', 'mega*(tesla)'), ('MH', 'mega*(henry)'), ('MW', 'mega*(watt)'), ('MV', 'mega*(volt)'), ('MO', 'mega*(ohm)'), ('Mu', 'mega*(atomicmassunit)'), ('Mt', 'mega*(metricton)'), ('MÅ', 'mega*(angstrom)'), ('Mr', 'mega*(radian)'), ('ML', 'mega*(liter)'), ('Mh', 'mega*(hour)'), ('MB', 'mega*(bel)'), ('ks', 'kilo*(second)'), ('kA', 'kilo*(ampere)'), ('kK', 'kilo*(kelvin)'), ('km', 'kilo*(metre)'), ('kg', 'kilo*(gram)'), ('kC', 'kilo*(coulomb)'), ('kS', 'kilo*(siemens)'), ('kN', 'kilo*(newton)'), ('kJ', 'kilo*(joule)'), ('kF', 'kilo*(farad)'), ('kT', 'kilo*(tesla)'), ('kH', 'kilo*(henry)'), ('kW', 'kilo*(watt)'), ('kV', 'kilo*(volt)'), ('kO', 'kilo*(ohm)'), ('ku', 'kilo*(atomicmassunit)'), ('kt', 'kilo*(metricton)'), ('kÅ', 'kilo*(angstrom)'), ('kr', 'kilo*(radian)'), ('kL', 'kilo*(liter)'), ('kh', 'kilo*(hour)'), ('kB', 'kilo*(bel)'), ('ds', 'deci*(second)'), ('dA', 'deci*(ampere)'), ('dK', 'deci*(kelvin)'), ('dm', 'deci*(metre)'), ('dg', 'deci*(gram)'), ('dC', 'deci*(coulomb)'), ('dS', 'deci*(siemens)'), ('dN', 'deci*(newton)'), ('dJ', 'deci*(joule)'), ('dF', 'deci*(farad)'), ('dT', 'deci*(tesla)'), ('dH', 'deci*(henry)'), ('dW', 'deci*(watt)'), ('dV', 'deci*(volt)'), ('dO', 'deci*(ohm)'), ('du', 'deci*(atomicmassunit)'), ('dt', 'deci*(metricton)'), ('dÅ', 'deci*(angstrom)'), ('dr', 'deci*(radian)'), ('dL', 'deci*(liter)'), ('dh', 'deci*(hour)'), ('dB', 'deci*(bel)'), ('ns', 'nano*(second)'), ('nA', 'nano*(ampere)'), ('nK', 'nano*(kelvin)'), ('nm', 'nano*(metre)'), ('ng', 'nano*(gram)'), ('nC', 'nano*(coulomb)'), ('nS', 'nano*(siemens)'), ('nN', 'nano*(newton)'), ('nJ', 'nano*(joule)'), ('nF', 'nano*(farad)'), ('nT', 'nano*(tesla)'), ('nH', 'nano*(henry)'), ('nW', 'nano*(watt)'), ('nV', 'nano*(volt)'), ('nO', 'nano*(ohm)'), ('nu', 'nano*(atomicmassunit)'), ('nt', 'nano*(metricton)'), ('nÅ', 'nano*(angstrom)'), ('nr', 'nano*(radian)'), ('nL', 'nano*(liter)'), ('nh', 'nano*(hour)'), ('nB', 'nano*(bel)'), ('ps', 'pico*(second)'), ('pA', 'pico*(ampere)'), ('pK', 'pico*(kelvin)'), ('pm', 'pico*(metre)'), ('pg', 'pico*(gram)'), ('pC', 'pico*(coulomb)'), ('pS', 'pico*(siemens)'), ('pN', 'pico*(newton)'), ('pJ', 'pico*(joule)'), ('pF', 'pico*(farad)'), ('pT', 'pico*(tesla)'), ('pH', 'pico*(henry)'), ('pW', 'pico*(watt)'), ('pV', 'pico*(volt)'), ('pO', 'pico*(ohm)'), ('pu', 'pico*(atomicmassunit)'), ('pt', 'pico*(metricton)'), ('pÅ', 'pico*(angstrom)'), ('pr', 'pico*(radian)'), ('pL', 'pico*(liter)'), ('ph', 'pico*(hour)'), ('pB', 'pico*(bel)'), ('as', 'atto*(second)'), ('aA', 'atto*(ampere)'), ('aK', 'atto*(kelvin)'), ('am', 'atto*(metre)'), ('ag', 'atto*(gram)'), ('aC', 'atto*(coulomb)'), ('aS', 'atto*(siemens)'), ('aN', 'atto*(newton)'), ('aJ', 'atto*(joule)'), ('aF', 'atto*(farad)'), ('aT', 'atto*(tesla)'), ('aH', 'atto*(henry)'), ('aW', 'atto*(watt)'), ('aV', 'atto*(volt)'), ('aO', 'atto*(ohm)'), ('au', 'atto*(atomicmassunit)'), ('at', 'atto*(metricton)'), ('aÅ', 'atto*(angstrom)'), ('ar', 'atto*(radian)'), ('aL', 'atto*(liter)'), ('ah', 'atto*(hour)'), ('aB', 'atto*(bel)'), ('Es', 'exa*(second)'), ('EA', 'exa*(ampere)'), ('EK', 'exa*(kelvin)'), ('Em', 'exa*(metre)'), ('Eg', 'exa*(gram)'), ('EC', 'exa*(coulomb)'), ('ES', 'exa*(siemens)'), ('EN', 'exa*(newton)'), ('EJ', 'exa*(joule)'), ('EF', 'exa*(farad)'), ('ET', 'exa*(tesla)'), ('EH', 'exa*(henry)'), ('EW', 'exa*(watt)'), ('EV', 'exa*(volt)'), ('EO', 'exa*(ohm)'), ('Eu', 'exa*(atomicmassunit)'), ('Et', 'exa*(metricton)'), ('EÅ', 'exa*(angstrom)'), ('Er', 'exa*(radian)'), ('EL', 'exa*(liter)'), ('Eh', 'exa*(hour)'), ('EB', 'exa*(bel)'), ('fl oz', 'fluid ounce'), ('mol', 'mole'), ('kat', 'katal'), ('min', 'minute'), ('deg', 'degree'), ('gal', 'gallon'), ('cd', 'candela'), ('Bq', 'becquerel'), ('Sv', 'sievert'), ('Pa', 'pascal'), ('Hz', 'hertz'), ('Wb', 'weber'), ('lm', 'lumen'), ('Gy', 'gray'), ('lx', 'lux'), ('eV', 'electronvolt'), ('sr', 'steradian'), ('Np', 'neper'), ('qt', 'quart'), ('oz', 'ounce'), ('lb', 'pound'), ('st', 'stone'), ('in', 'inch'), ('ft', 'foot'), ('yd', 'yard'), ('mi', 'mile'), ('gi', 'gill'), ('pt', 'pint'), ('s', 'second'), ('A', 'ampere'), ('K', 'kelvin'), ('m', 'metre'), ('g', 'gram'), ('C', 'coulomb'), ('S', 'siemens'), ('N', 'newton'), ('J', 'joule'), ('F', 'farad'), ('T', 'tesla'), ('H', 'henry'), ('W', 'watt'), ('V', 'volt'), ('O', 'ohm'), ('u', 'atomicmassunit'), ('t', 'metricton'), ('Å', 'angstrom'), ('r', 'radian'), ('L', 'liter'), ('h', 'hour'), ('B', 'bel')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('becquerel', '(second**(-1))'), ('coulomb', '(second*ampere)'), ('siemens', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)'), ('sievert', '(metre**2*second**(-2))'), ('newton', '(metre*kilo*gram*second**(-2))'), ('pascal', '(metre**(-1)*kilogram*second**(-2))'), ('hertz', '(second**(-1))'), ('joule', '(metre**2*kilo*gram*second**(-2))'), ('farad', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)'), ('weber', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))'), ('tesla', '(kilo*gram*second**(-2)*ampere**(-1))'), ('henry', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))'), ('lumen', '(candela)'), ('katal', '(second**(-1)*mole)'), ('watt', '(metre**2*kilo*gram*second**(-3))'), ('volt', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))'), ('gray', '(metre**2*second**(-2))'), ('ohm', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))'), ('lux', '(metre**(-2)*candela)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('fluid ounce', '(28.4130625*milli*litre)'), ('gallon', '(4546.09*litre)'), ('quart', '(1.1365225*litre)'), ('ounce', '(28.349523125*gram)'), ('pound', '(0.45359237*kilo*gram)'), ('stone', '(6.35029318*kilo*gram)'), ('inch', '(0.0254*metre)'), ('foot', '(0.3048*metre)'), ('yard', '(0.9144*metre)'), ('mile', '(1609.344*metre)'), ('gill', '(142.0653125*milli*litre)'), ('pint', '(568.26125*milli*litre)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('astronomicalunit', '(149597870700*metre)'), ('atomicmassunit', '(1.66054*10**(-27)*kilo*gram)'), ('nauticalmile', '(1852*metre)'), ('electronvolt', '(1.60218*10**(-19)*joule)'), ('angleminute', '(pi/10800)'), ('anglesecond', '(pi/648000)'), ('steradian', '(1)'), ('metricton', '(10**3*kilo*gram)'), ('roentgen', '(2.58*10**(-4)*kelvin/(kilo*gram))'), ('angstrom', '(10**(-10)*metre)'), ('hectare', '(10**4*metre**2)'), ('radian', '(1)'), ('minute', '(60*second)'), ('degree', '(pi/180)'), ('curie', '(3.7*10**10*becquerel)'), ('liter', '(10**(-3)*metre**3)'), ('neper', '(1)'), ('knot', '((1852/3600)*metre/second)'), ('barn', '(10**(-28)*metre**2)'), ('hour', '(3600*second)'), ('day', '(86400*second)'), ('are', '(10**2*metre**2)'), ('bar', '(10**5*pascal)'), ('rad', '(10**(-2)*gray)'), ('rem', '(10**(-2)*sievert)'), ('bel', '((1/2)*log(10))')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('becquerel', '(second**(-1))'), ('coulomb', '(second*ampere)'), ('siemens', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)'), ('sievert', '(metre**2*second**(-2))'), ('newton', '(metre*kilo*gram*second**(-2))'), ('pascal', '(metre**(-1)*kilogram*second**(-2))'), ('hertz', '(second**(-1))'), ('joule', '(metre**2*kilo*gram*second**(-2))'), ('farad', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)'), ('weber', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))'), ('tesla', '(kilo*gram*second**(-2)*ampere**(-1))'), ('henry', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))'), ('lumen', '(candela)'), ('katal', '(second**(-1)*mole)'), ('watt', '(metre**2*kilo*gram*second**(-3))'), ('volt', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))'), ('gray', '(metre**2*second**(-2))'), ('ohm', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))'), ('lux', '(metre**(-2)*candela)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('yotta', '(10**24)'), ('zetta', '(10**21)'), ('hecto', '(10**2) '), ('centi', '(10**(-2)) '), ('milli', '(10**(-3)) '), ('micro', '(10**(-6)) '), ('femto', '(10**(-15))'), ('zepto', '(10**(-21))'), ('yocto', '(10**(-24))'), ('peta', '(10**15)'), ('tera', '(10**12)'), ('giga', '(10**9) '), ('mega', '(10**6) '), ('kilo', '(10**3) '), ('deka', '(10**1) '), ('deci', '(10**(-1)) '), ('nano', '(10**(-9)) '), ('pico', '(10**(-12))'), ('atto', '(10**(-18))'), ('exa', '(10**18)')], [('candela', 'luminous_intensity'), ('second', 'time'), ('ampere', 'electric_current'), ('kelvin', 'temperature'), ('metre', 'length'), ('gram', 'mass'), ('mole', 'amount_of_substance')]]
-convert_alternative_names_to_standard=[(('astronomicalunits', [' ', '*', '/']), 'astronomicalunit'), (('atomicmassunits', [' ', '*', '/']), 'atomicmassunit'), (('nauticalmiles', [' ', '*', '/']), 'nauticalmile'), (('electronvolts', [' ', '*', '/']), 'electronvolt'), (('fluid ounces', [' ', '*', '/']), 'fluid ounce'), (('becquerels', [' ', '*', '/']), 'becquerel'), (('Becquerels', [' ', '*', '/']), 'becquerel'), (('steradians', [' ', '*', '/']), 'steradian'), ('Becquerel', 'becquerel'), (('roentgens', [' ', '*', '/']), 'roentgen'), (('Roentgens', [' ', '*', '/']), 'roentgen'), (('angstroms', [' ', '*', '/']), 'angstrom'), (('Angstroms', [' ', '*', '/']), 'angstrom'), (('candelas', [' ', '*', '/']), 'candela'), (('Candelas', [' ', '*', '/']), 'candela'), (('coulombs', [' ', '*', '/']), 'coulomb'), (('Coulombs', [' ', '*', '/']), 'coulomb'), (('sieverts', [' ', '*', '/']), 'sievert'), (('Sieverts', [' ', '*', '/']), 'sievert'), ('Roentgen', 'roentgen'), ('Angstrom', 'angstrom'), ('Ångström', 'angstrom'), (('hectares', [' ', '*', '/']), 'hectare'), ('Candela', 'candela'), (('seconds', [' ', '*', '/']), 'second'), (('amperes', [' ', '*', '/']), 'ampere'), (('Amperes', [' ', '*', '/']), 'ampere'), (('kelvins', [' ', '*', '/']), 'kelvin'), (('Kelvins', [' ', '*', '/']), 'kelvin'), ('Coulomb', 'coulomb'), (('Siemens', [' ', '*', '/']), 'siemens'), ('Sievert', 'sievert'), (('newtons', [' ', '*', '/']), 'newton'), (('Newtons', [' ', '*', '/']), 'newton'), (('pascals', [' ', '*', '/']), 'pascal'), (('Pascals', [' ', '*', '/']), 'pascal'), ('Röntgen', 'roentgen'), (('radians', [' ', '*', '/']), 'radian'), (('minutes', [' ', '*', '/']), 'minute'), (('degrees', [' ', '*', '/']), 'degree'), (('gallons', [' ', '*', '/']), 'gallon'), ('Ampere', 'ampere'), ('Kelvin', 'kelvin'), (('metres', [' ', '*', '/']), 'metre'), (('meters', [' ', '*', '/']), 'metre'), ('Newton', 'newton'), ('Pascal', 'pascal'), (('joules', [' ', '*', '/']), 'joule'), (('Joules', [' ', '*', '/']), 'joule'), (('farads', [' ', '*', '/']), 'farad'), (('Farads', [' ', '*', '/']), 'farad'), (('webers', [' ', '*', '/']), 'weber'), (('Webers', [' ', '*', '/']), 'weber'), (('teslas', [' ', '*', '/']), 'tesla'), (('Teslas', [' ', '*', '/']), 'tesla'), (('henrys', [' ', '*', '/']), 'henry'), (('Henrys', [' ', '*', '/']), 'henry'), (('lumens', [' ', '*', '/']), 'lumen'), (('katals', [' ', '*', '/']), 'katal'), (('Katals', [' ', '*', '/']), 'katal'), (('tonnes', [' ', '*', '/']), 'metricton'), (('curies', [' ', '*', '/']), 'curie'), (('liters', [' ', '*', '/']), 'liter'), (('nepers', [' ', '*', '/']), 'neper'), (('Nepers', [' ', '*', '/']), 'neper'), (('quarts', [' ', '*', '/']), 'quart'), (('ounces', [' ', '*', '/']), 'ounce'), (('pounds', [' ', '*', '/']), 'pound'), (('inches', [' ', '*', '/']), 'inch'), ('meter', 'metre'), (('grams', [' ', '*', '/']), 'gram'), (('moles', [' ', '*', '/']), 'mole'), ('Joule', 'joule'), ('Farad', 'farad'), ('Weber', 'weber'), ('Tesla', 'tesla'), ('Henry', 'henry'), ('Katal', 'katal'), (('watts', [' ', '*', '/']), 'watt'), (('Watts', [' ', '*', '/']), 'watt'), (('volts', [' ', '*', '/']), 'volt'), (('Volts', [' ', '*', '/']), 'volt'), (('grays', [' ', '*', '/']), 'gray'), (('Grays', [' ', '*', '/']), 'gray'), (('tonne', [' ', '*', '/']), 'metricton'), ('Neper', 'neper'), (('knots', [' ', '*', '/']), 'knot'), (('barns', [' ', '*', '/']), 'barn'), (('hours', [' ', '*', '/']), 'hour'), (('yards', [' ', '*', '/']), 'yard'), (('miles', [' ', '*', '/']), 'mile'), (('gills', [' ', '*', '/']), 'gill'), (('pints', [' ', '*', '/']), 'pint'), ('Watt', 'watt'), ('Volt', 'volt'), ('Gray', 'gray'), (('ohms', [' ', '*', '/']), 'ohm'), (('Ohms', [' ', '*', '/']), 'ohm'), (('days', [' ', '*', '/']), 'day'), (('ares', [' ', '*', '/']), 'are'), (('bars', [' ', '*', '/']), 'bar'), (('rads', [' ', '*', '/']), 'rad'), (('rems', [' ', '*', '/']), 'rem'), (('bels', [' ', '*', '/']), 'bel'), (('Bels', [' ', '*', '/']), 'bel'), ('feet', 'foot'), ('Ohm', 'ohm'), ('Bel', 'bel')]
-convert_short_forms=[('amount_of_substance', 'amount_of_substance'), ('luminous_intensity', 'luminous_intensity'), ('astronomicalunit', 'astronomicalunit'), ('electric_current', 'electric_current'), ('atomicmassunit', 'atomicmassunit'), ('atomicmassunit', 'atomicmassunit'), ('electronvolt', 'electronvolt'), ('nauticalmile', 'nauticalmile'), ('electronvolt', 'electronvolt'), ('fluid ounce', 'fluid ounce'), ('angleminute', 'angleminute'), ('anglesecond', 'anglesecond'), ('fluid ounce', 'fluid ounce'), ('temperature', 'temperature'), ('becquerel', 'becquerel'), ('steradian', 'steradian'), ('metricton', 'metricton'), ('steradian', 'steradian'), ('metricton', 'metricton'), ('angstrom', 'angstrom'), ('roentgen', 'roentgen'), ('angstrom', 'angstrom'), ('candela', 'candela'), ('coulomb', 'coulomb'), ('siemens', 'siemens'), ('sievert', 'sievert'), ('hectare', 'hectare'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('newton', 'newton'), ('pascal', 'pascal'), ('radian', 'radian'), ('minute', 'minute'), ('degree', 'degree'), ('gallon', 'gallon'), ('radian', 'radian'), ('minute', 'minute'), ('degree', 'degree'), ('gallon', 'gallon'), ('length', 'length'), ('metre', 'metre'), ('hertz', 'hertz'), ('joule', 'joule'), ('farad', 'farad'), ('weber', 'weber'), ('tesla', 'tesla'), ('henry', 'henry'), ('lumen', 'lumen'), ('katal', 'katal'), ('liter', 'liter'), ('neper', 'neper'), ('quart', 'quart'), ('ounce', 'ounce'), ('pound', 'pound'), ('stone', 'stone'), ('curie', 'curie'), ('liter', 'liter'), ('neper', 'neper'), ('quart', 'quart'), ('ounce', 'ounce'), ('pound', 'pound'), ('stone', 'stone'), ('yotta', 'yotta'), ('zetta', 'zetta'), ('hecto', 'hecto'), ('centi', 'centi'), ('milli', 'milli'), ('micro', 'micro'), ('femto', 'femto'), ('zepto', 'zepto'), ('yocto', 'yocto'), ('gram', 'gram'), ('mole', 'mole'), ('watt', 'watt'), ('volt', 'volt'), ('gray', 'gray'), ('hour', 'hour'), ('inch', 'inch'), ('foot', 'foot'), ('yard', 'yard'), ('mile', 'mile'), ('gill', 'gill'), ('pint', 'pint'), ('knot', 'knot'), ('barn', 'barn'), ('hour', 'hour'), ('inch', 'inch'), ('foot', 'foot'), ('yard', 'yard'), ('mile', 'mile'), ('gill', 'gill'), ('pint', 'pint'), ('time', 'time'), ('mass', 'mass'), ('peta', 'peta'), ('tera', 'tera'), ('giga', 'giga'), ('mega', 'mega'), ('kilo', 'kilo'), ('deka', 'deka'), ('deci', 'deci'), ('nano', 'nano'), ('pico', 'pico'), ('atto', 'atto'), ('ohm', 'ohm'), ('lux', 'lux'), ('bel', 'bel'), ('day', 'day'), ('are', 'are'), ('bar', 'bar'), ('rad', 'rad'), ('rem', 'rem'), ('bel', 'bel'), ('exa', 'exa'), ('mu*fl oz', 'micro*(fluid ounce)'), ('mu fl oz', 'micro*(fluid ounce)'), ('da*fl oz', 'deka*(fluid ounce)'), ('da fl oz', 'deka*(fluid ounce)'), ('Y*fl oz', 'yotta*(fluid ounce)'), ('Y fl oz', 'yotta*(fluid ounce)'), ('Z*fl oz', 'zetta*(fluid ounce)'), ('Z fl oz', 'zetta*(fluid ounce)'), ('h*fl oz', 'hecto*(fluid ounce)'), ('h fl oz', 'hecto*(fluid ounce)'), ('c*fl oz', 'centi*(fluid ounce)'), ('c fl oz', 'centi*(fluid ounce)'), ('m*fl oz', 'milli*(fluid ounce)'), ('m fl oz', 'milli*(fluid ounce)'), ('mufl oz', 'micro*(fluid ounce)'), ('f*fl oz', 'femto*(fluid ounce)'), ('f fl oz', 'femto*(fluid ounce)'), ('z*fl oz', 'zepto*(fluid ounce)'), ('z fl oz', 'zepto*(fluid ounce)'), ('y*fl oz', 'yocto*(fluid ounce)'), ('y fl oz', 'yocto*(fluid ounce)'), ('P*fl oz', 'peta*(fluid ounce)'), ('P fl oz', 'peta*(fluid ounce)'), ('T*fl oz', 'tera*(fluid ounce)'), ('T fl oz', 'tera*(fluid ounce)'), ('G*fl oz', 'giga*(fluid ounce)'), ('G fl oz', 'giga*(fluid ounce)'), ('M*fl oz', 'mega*(fluid ounce)'), ('M fl oz', 'mega*(fluid ounce)'), ('k*fl oz', 'kilo*(fluid ounce)'), ('k fl oz', 'kilo*(fluid ounce)'), ('dafl oz', 'deka*(fluid ounce)'), ('d*fl oz', 'deci*(fluid ounce)'), ('d fl oz', 'deci*(fluid ounce)'), ('n*fl oz', 'nano*(fluid ounce)'), ('n fl oz', 'nano*(fluid ounce)'), ('p*fl oz', 'pico*(fluid ounce)'), ('p fl oz', 'pico*(fluid ounce)'), ('a*fl oz', 'atto*(fluid ounce)'), ('a fl oz', 'atto*(fluid ounce)'), ('E*fl oz', 'exa*(fluid ounce)'), ('E fl oz', 'exa*(fluid ounce)'), ('Yfl oz', 'yotta*(fluid ounce)'), ('Zfl oz', 'zetta*(fluid ounce)'), ('hfl oz', 'hecto*(fluid ounce)'), ('cfl oz', 'centi*(fluid ounce)'), ('mfl oz', 'milli*(fluid ounce)'), ('mu*mol', 'micro*(mole)'), ('mu mol', 'micro*(mole)'), ('mu*kat', 'micro*(katal)'), ('mu kat', 'micro*(katal)'), ('mu*min', 'micro*(minute)'), ('mu min', 'micro*(minute)'), ('mu*deg', 'micro*(degree)'), ('mu deg', 'micro*(degree)'), ('mu*gal', 'micro*(gallon)'), ('mu gal', 'micro*(gallon)'), ('ffl oz', 'femto*(fluid ounce)'), ('zfl oz', 'zepto*(fluid ounce)'), ('yfl oz', 'yocto*(fluid ounce)'), ('Pfl oz', 'peta*(fluid ounce)'), ('Tfl oz', 'tera*(fluid ounce)'), ('Gfl oz', 'giga*(fluid ounce)'), ('Mfl oz', 'mega*(fluid ounce)'), ('kfl oz', 'kilo*(fluid ounce)'), ('da*mol', 'deka*(mole)'), ('da mol', 'deka*(mole)'), ('da*kat', 'deka*(katal)'), ('da kat', 'deka*(katal)'), ('da*min', 'deka*(minute)'), ('da min', 'deka*(minute)'), ('da*deg', 'deka*(degree)'), ('da deg', 'deka*(degree)'), ('da*gal', 'deka*(gallon)'), ('da gal', 'deka*(gallon)'), ('dfl oz', 'deci*(fluid ounce)'), ('nfl oz', 'nano*(fluid ounce)'), ('pfl oz', 'pico*(fluid ounce)'), ('afl oz', 'atto*(fluid ounce)'), ('Efl oz', 'exa*(fluid ounce)'), ('Y*mol', 'yotta*(mole)'), ('Y mol', 'yotta*(mole)'), ('Y*kat', 'yotta*(katal)'), ('Y kat', 'yotta*(katal)'), ('Y*min', 'yotta*(minute)'), ('Y min', 'yotta*(minute)'), ('Y*deg', 'yotta*(degree)'), ('Y deg', 'yotta*(degree)'), ('Y*gal', 'yotta*(gallon)'), ('Y gal', 'yotta*(gallon)'), ('Z*mol', 'zetta*(mole)'), ('Z mol', 'zetta*(mole)'), ('Z*kat', 'zetta*(katal)'), ('Z kat', 'zetta*(katal)'), ('Z*min', 'zetta*(minute)'), ('Z min', 'zetta*(minute)'), ('Z*deg', 'zetta*(degree)'), ('Z deg', 'zetta*(degree)'), ('Z*gal', 'zetta*(gallon)'), ('Z gal', 'zetta*(gallon)'), ('h*mol', 'hecto*(mole)'), ('h mol', 'hecto*(mole)'), ('h*kat', 'hecto*(katal)'), ('h kat', 'hecto*(katal)'), ('h*min', 'hecto*(minute)'), ('h min', 'hecto*(minute)'), ('h*deg', 'hecto*(degree)'), ('h deg', 'hecto*(degree)'), ('h*gal', 'hecto*(gallon)'), ('h gal', 'hecto*(gallon)'), ('c*mol', 'centi*(mole)'), ('c mol', 'centi*(mole)'), ('c*kat', 'centi*(katal)'), ('c kat', 'centi*(katal)'), ('c*min', 'centi*(minute)'), ('c min', 'centi*(minute)'), ('c*deg', 'centi*(degree)'), ('c deg', 'centi*(degree)'), ('c*gal', 'centi*(gallon)'), ('c gal', 'centi*(gallon)'), ('m*mol', 'milli*(mole)'), ('m mol', 'milli*(mole)'), ('m*kat', 'milli*(katal)'), ('m kat', 'milli*(katal)'), ('m*min', 'milli*(minute)'), ('m min', 'milli*(minute)'), ('m*deg', 'milli*(degree)'), ('m deg', 'milli*(degree)'), ('m*gal', 'milli*(gallon)'), ('m gal', 'milli*(gallon)'), ('mu*cd', 'micro*(candela)'), ('mu cd', 'micro*(candela)'), ('mumol', 'micro*(mole)'), ('mu*Bq', 'micro*(becquerel)'), ('mu Bq', 'micro*(becquerel)'), ('mu*Sv', 'micro*(sievert)'), ('mu Sv', 'micro*(sievert)'), ('mu*Pa', 'micro*(pascal)'), ('mu Pa', 'micro*(pascal)'), ('mu*Hz', 'micro*(hertz)'), ('mu Hz', 'micro*(hertz)'), ('mu*Wb', 'micro*(weber)'), ('mu Wb', 'micro*(weber)'), ('mu*lm', 'micro*(lumen)'), ('mu lm', 'micro*(lumen)'), ('mukat', 'micro*(katal)'), ('mu*Gy', 'micro*(gray)'), ('mu Gy', 'micro*(gray)'), ('mu*lx', 'micro*(lux)'), ('mu lx', 'micro*(lux)'), ('mu*eV', 'micro*(electronvolt)'), ('mu eV', 'micro*(electronvolt)'), ('mu*sr', 'micro*(steradian)'), ('mu sr', 'micro*(steradian)'), ('mumin', 'micro*(minute)'), ('mudeg', 'micro*(degree)'), ('mu*Np', 'micro*(neper)'), ('mu Np', 'micro*(neper)'), ('mugal', 'micro*(gallon)'), ('mu*qt', 'micro*(quart)'), ('mu qt', 'micro*(quart)'), ('mu*oz', 'micro*(ounce)'), ('mu oz', 'micro*(ounce)'), ('mu*lb', 'micro*(pound)'), ('mu lb', 'micro*(pound)'), ('mu*st', 'micro*(stone)'), ('mu st', 'micro*(stone)'), ('mu*in', 'micro*(inch)'), ('mu in', 'micro*(inch)'), ('mu*ft', 'micro*(foot)'), ('mu ft', 'micro*(foot)'), ('mu*yd', 'micro*(yard)'), ('mu yd', 'micro*(yard)'), ('mu*mi', 'micro*(mile)'), ('mu mi', 'micro*(mile)'), ('mu*gi', 'micro*(gill)'), ('mu gi', 'micro*(gill)'), ('mu*pt', 'micro*(pint)'), ('mu pt', 'micro*(pint)'), ('f*mol', 'femto*(mole)'), ('f mol', 'femto*(mole)'), ('f*kat', 'femto*(katal)'), ('f kat', 'femto*(katal)'), ('f*min', 'femto*(minute)'), ('f min', 'femto*(minute)'), ('f*deg', 'femto*(degree)'), ('f deg', 'femto*(degree)'), ('f*gal', 'femto*(gallon)'), ('f gal', 'femto*(gallon)'), ('z*mol', 'zepto*(mole)'), ('z mol', 'zepto*(mole)'), ('z*kat', 'zepto*(katal)'), ('z kat', 'zepto*(katal)'), ('z*min', 'zepto*(minute)'), ('z min', 'zepto*(minute)'), ('z*deg', 'zepto*(degree)'), ('z deg', 'zepto*(degree)'), ('z*gal', 'zepto*(gallon)'), ('z gal', 'zepto*(gallon)'), ('y*mol', 'yocto*(mole)'), ('y mol', 'yocto*(mole)'), ('y*kat', 'yocto*(katal)'), ('y kat', 'yocto*(katal)'), ('y*min', 'yocto*(minute)'), ('y min', 'yocto*(minute)'), ('y*deg', 'yocto*(degree)'), ('y deg', 'yocto*(degree)'), ('y*gal', 'yocto*(gallon)'), ('y gal', 'yocto*(gallon)'), ('P*mol', 'peta*(mole)'), ('P mol', 'peta*(mole)'), ('P*kat', 'peta*(katal)'), ('P kat', 'peta*(katal)'), ('P*min', 'peta*(minute)'), ('P min', 'peta*(minute)'), ('P*deg', 'peta*(degree)'), ('P deg', 'peta*(degree)'), ('P*gal', 'peta*(gallon)'), ('P gal', 'peta*(gallon)'), ('T*mol', 'tera*(mole)'), ('T mol', 'tera*(mole)'), ('T*kat', 'tera*(katal)'), ('T kat', 'tera*(katal)'), ('T*min', 'tera*(minute)'), ('T min', 'tera*(minute)'), ('T*deg', 'tera*(degree)'), ('T deg', 'tera*(degree)'), ('T*gal', 'tera*(gallon)'), ('T gal', 'tera*(gallon)'), ('G*mol', 'giga*(mole)'), ('G mol', 'giga*(mole)'), ('G*kat', 'giga*(katal)'), ('G kat', 'giga*(katal)'), ('G*min', 'giga*(minute)'), ('G min', 'giga*(minute)'), ('G*deg', 'giga*(degree)'), ('G deg', 'giga*(degree)'), ('G*gal', 'giga*(gallon)'), ('G gal', 'giga*(gallon)'), ('M*mol', 'mega*(mole)'), ('M mol', 'mega*(mole)'), ('M*kat', 'mega*(katal)'), ('M kat', 'mega*(katal)'), ('M*min', 'mega*(minute)'), ('M min', 'mega*(minute)'), ('M*deg', 'mega*(degree)'), ('M deg', 'mega*(degree)'), ('M*gal', 'mega*(gallon)'), ('M gal', 'mega*(gallon)'), ('k*mol', 'kilo*(mole)'), ('k mol', 'kilo*(mole)'), ('k*kat', 'kilo*(katal)'), ('k kat', 'kilo*(katal)'), ('k*min', 'kilo*(minute)'), ('k min', 'kilo*(minute)'), ('k*deg', 'kilo*(degree)'), ('k deg', 'kilo*(degree)'), ('k*gal', 'kilo*(gallon)'), ('k gal', 'kilo*(gallon)'), ('da*cd', 'deka*(candela)'), ('da cd', 'deka*(candela)'), ('damol', 'deka*(mole)'), ('da*Bq', 'deka*(becquerel)'), ('da Bq', 'deka*(becquerel)'), ('da*Sv', 'deka*(sievert)'), ('da Sv', 'deka*(sievert)'), ('da*Pa', 'deka*(pascal)'), ('da Pa', 'deka*(pascal)'), ('da*Hz', 'deka*(hertz)'), ('da Hz', 'deka*(hertz)'), ('da*Wb', 'deka*(weber)'), ('da Wb', 'deka*(weber)'), ('da*lm', 'deka*(lumen)'), ('da lm', 'deka*(lumen)'), ('dakat', 'deka*(katal)'), ('da*Gy', 'deka*(gray)'), ('da Gy', 'deka*(gray)'), ('da*lx', 'deka*(lux)'), ('da lx', 'deka*(lux)'), ('da*eV', 'deka*(electronvolt)'), ('da eV', 'deka*(electronvolt)'), ('da*sr', 'deka*(steradian)'), ('da sr', 'deka*(steradian)'), ('damin', 'deka*(minute)'), ('dadeg', 'deka*(degree)'), ('da*Np', 'deka*(neper)'), ('da Np', 'deka*(neper)'), ('dagal', 'deka*(gallon)'), ('da*qt', 'deka*(quart)'), ('da qt', 'deka*(quart)'), ('da*oz', 'deka*(ounce)'), ('da oz', 'deka*(ounce)'), ('da*lb', 'deka*(pound)'), ('da lb', 'deka*(pound)'), ('da*st', 'deka*(stone)'), ('da st', 'deka*(stone)'), ('da*in', 'deka*(inch)'), ('da in', 'deka*(inch)'), ('da*ft', 'deka*(foot)'), ('da ft', 'deka*(foot)'), ('da*yd', 'deka*(yard)'), ('da yd', 'deka*(yard)'), ('da*mi', 'deka*(mile)'), ('da mi', 'deka*(mile)'), ('da*gi', 'deka*(gill)'), ('da gi', 'deka*(gill)'), ('da*pt', 'deka*(pint)'), ('da pt', 'deka*(pint)'), ('d*mol', 'deci*(mole)'), ('d mol', 'deci*(mole)'), ('d*kat', 'deci*(katal)'), ('d kat', 'deci*(katal)'), ('d*min', 'deci*(minute)'), ('d min', 'deci*(minute)'), ('d*deg', 'deci*(degree)'), ('d deg', 'deci*(degree)'), ('d*gal', 'deci*(gallon)'), ('d gal', 'deci*(gallon)'), ('n*mol', 'nano*(mole)'), ('n mol', 'nano*(mole)'), ('n*kat', 'nano*(katal)'), ('n kat', 'nano*(katal)'), ('n*min', 'nano*(minute)'), ('n min', 'nano*(minute)'), ('n*deg', 'nano*(degree)'), ('n deg', 'nano*(degree)'), ('n*gal', 'nano*(gallon)'), ('n gal', 'nano*(gallon)'), ('p*mol', 'pico*(mole)'), ('p mol', 'pico*(mole)'), ('p*kat', 'pico*(katal)'), ('p kat', 'pico*(katal)'), ('p*min', 'pico*(minute)'), ('p min', 'pico*(minute)'), ('p*deg', 'pico*(degree)'), ('p deg', 'pico*(degree)'), ('p*gal', 'pico*(gallon)'), ('p gal', 'pico*(gallon)'), ('a*mol', 'atto*(mole)'), ('a mol', 'atto*(mole)'), ('a*kat', 'atto*(katal)'), ('a kat', 'atto*(katal)'), ('a*min', 'atto*(minute)'), ('a min', 'atto*(minute)'), ('a*deg', 'atto*(degree)'), ('a deg', 'atto*(degree)'), ('a*gal', 'atto*(gallon)'), ('a gal', 'atto*(gallon)'), ('E*mol', 'exa*(mole)'), ('E mol', 'exa*(mole)'), ('E*kat', 'exa*(katal)'), ('E kat', 'exa*(katal)'), ('E*min', 'exa*(minute)'), ('E min', 'exa*(minute)'), ('E*deg', 'exa*(degree)'), ('E deg', 'exa*(degree)'), ('E*gal', 'exa*(gallon)'), ('E gal', 'exa*(gallon)'), ('Y*cd', 'yotta*(candela)'), ('Y cd', 'yotta*(candela)'), ('Ymol', 'yotta*(mole)'), ('Y*Bq', 'yotta*(becquerel)'), ('Y Bq', 'yotta*(becquerel)'), ('Y*Sv', 'yotta*(sievert)'), ('Y Sv', 'yotta*(sievert)'), ('Y*Pa', 'yotta*(pascal)'), ('Y Pa', 'yotta*(pascal)'), ('Y*Hz', 'yotta*(hertz)'), ('Y Hz', 'yotta*(hertz)'), ('Y*Wb', 'yotta*(weber)'), ('Y Wb', 'yotta*(weber)'), ('Y*lm', 'yotta*(lumen)'), ('Y lm', 'yotta*(lumen)'), ('Ykat', 'yotta*(katal)'), ('Y*Gy', 'yotta*(gray)'), ('Y Gy', 'yotta*(gray)'), ('Y*lx', 'yotta*(lux)'), ('Y lx', 'yotta*(lux)'), ('Y*eV', 'yotta*(electronvolt)'), ('Y eV', 'yotta*(electronvolt)'), ('Y*sr', 'yotta*(steradian)'), ('Y sr', 'yotta*(steradian)'), ('Ymin', 'yotta*(minute)'), ('Ydeg', 'yotta*(degree)'), ('Y*Np', 'yotta*(neper)'), ('Y Np', 'yotta*(neper)'), ('Ygal', 'yotta*(gallon)'), ('Y*qt', 'yotta*(quart)'), ('Y qt', 'yotta*(quart)'), ('Y*oz', 'yotta*(ounce)'), ('Y oz', 'yotta*(ounce)'), ('Y*lb', 'yotta*(pound)'), ('Y lb', 'yotta*(pound)'), ('Y*st', 'yotta*(stone)'), ('Y st', 'yotta*(stone)'), ('Y*in', 'yotta*(inch)'), ('Y in', 'yotta*(inch)'), ('Y*ft', 'yotta*(foot)'), ('Y ft', 'yotta*(foot)'), ('Y*yd', 'yotta*(yard)'), ('Y yd', 'yotta*(yard)'), ('Y*mi', 'yotta*(mile)'), ('Y mi', 'yotta*(mile)'), ('Y*gi', 'yotta*(gill)'), ('Y gi', 'yotta*(gill)'), ('Y*pt', 'yotta*(pint)'), ('Y pt', 'yotta*(pint)'), ('Z*cd', 'zetta*(candela)'), ('Z cd', 'zetta*(candela)'), ('Zmol', 'zetta*(mole)'), ('Z*Bq', 'zetta*(becquerel)'), ('Z Bq', 'zetta*(becquerel)'), ('Z*Sv', 'zetta*(sievert)'), ('Z Sv', 'zetta*(sievert)'), ('Z*Pa', 'zetta*(pascal)'), ('Z Pa', 'zetta*(pascal)'), ('Z*Hz', 'zetta*(hertz)'), ('Z Hz', 'zetta*(hertz)'), ('Z*Wb', 'zetta*(weber)'), ('Z Wb', 'zetta*(weber)'), ('Z*lm', 'zetta*(lumen)'), ('Z lm', 'zetta*(lumen)'), ('Zkat', 'zetta*(katal)'), ('Z*Gy', 'zetta*(gray)'), ('Z Gy', 'zetta*(gray)'), ('Z*lx', 'zetta*(lux)'), ('Z lx', 'zetta*(lux)'), ('Z*eV', 'zetta*(electronvolt)'), ('Z eV', 'zetta*(electronvolt)'), ('Z*sr', 'zetta*(steradian)'), ('Z sr', 'zetta*(steradian)'), ('Zmin', 'zetta*(minute)'), ('Zdeg', 'zetta*(degree)'), ('Z*Np', 'zetta*(neper)'), ('Z Np', 'zetta*(neper)'), ('Zgal', 'zetta*(gallon)'), ('Z*qt', 'zetta*(quart)'), ('Z qt', 'zetta*(quart)'), ('Z*oz', 'zetta*(ounce)'), ('Z oz', 'zetta*(ounce)'), ('Z*lb', 'zetta*(pound)'), ('Z lb', 'zetta*(pound)'), ('Z*st', 'zetta*(stone)'), ('Z st', 'zetta*(stone)'), ('Z*in', 'zetta*(inch)'), ('Z in', 'zetta*(inch)'), ('Z*ft', 'zetta*(foot)'), ('Z ft', 'zetta*(foot)'), ('Z*yd', 'zetta*(yard)'), ('Z yd', 'zetta*(yard)'), ('Z*mi', 'zetta*(mile)'), ('Z mi', 'zetta*(mile)'), ('Z*gi', 'zetta*(gill)'), ('Z gi', 'zetta*(gill)'), ('Z*pt', 'zetta*(pint)'), ('Z pt', 'zetta*(pint)'), ('h*cd', 'hecto*(candela)'), ('h cd', 'hecto*(candela)'), ('hmol', 'hecto*(mole)'), ('h*Bq', 'hecto*(becquerel)'), ('h Bq', 'hecto*(becquerel)'), ('h*Sv', 'hecto*(sievert)'), ('h Sv', 'hecto*(sievert)'), ('h*Pa', 'hecto*(pascal)'), ('h Pa', 'hecto*(pascal)'), ('h*Hz', 'hecto*(hertz)'), ('h Hz', 'hecto*(hertz)'), ('h*Wb', 'hecto*(weber)'), ('h Wb', 'hecto*(weber)'), ('h*lm', 'hecto*(lumen)'), ('h lm', 'hecto*(lumen)'), ('hkat', 'hecto*(katal)'), ('h*Gy', 'hecto*(gray)'), ('h Gy', 'hecto*(gray)'), ('h*lx', 'hecto*(lux)'), ('h lx', 'hecto*(lux)'), ('h*eV', 'hecto*(electronvolt)'), ('h eV', 'hecto*(electronvolt)'), ('h*sr', 'hecto*(steradian)'), ('h sr', 'hecto*(steradian)'), ('hmin', 'hecto*(minute)'), ('hdeg', 'hecto*(degree)'), ('h*Np', 'hecto*(neper)'), ('h Np', 'hecto*(neper)'), ('hgal', 'hecto*(gallon)'), ('h*qt', 'hecto*(quart)'), ('h qt', 'hecto*(quart)'), ('h*oz', 'hecto*(ounce)'), ('h oz', 'hecto*(ounce)'), ('h*lb', 'hecto*(pound)'), ('h lb', 'hecto*(pound)'), ('h*st', 'hecto*(stone)'), ('h st', 'hecto*(stone)'), ('h*in', 'hecto*(inch)'), ('h in', 'hecto*(inch)'), ('h*ft', 'hecto*(foot)'), ('h ft', 'hecto*(foot)'), ('h*yd', 'hecto*(yard)'), ('h yd', 'hecto*(yard)'), ('h*mi', 'hecto*(mile)'), ('h mi', 'hecto*(mile)'), ('h*gi', 'hecto*(gill)'), ('h gi', 'hecto*(gill)'), ('h*pt', 'hecto*(pint)'), ('h pt', 'hecto*(pint)'), ('c*cd', 'centi*(candela)'), ('c cd', 'centi*(candela)'), ('cmol', 'centi*(mole)'), ('c*Bq', 'centi*(becquerel)'), ('c Bq', 'centi*(becquerel)'), ('c*Sv', 'centi*(sievert)'), ('c Sv', 'centi*(sievert)'), ('c*Pa', 'centi*(pascal)'), ('c Pa', 'centi*(pascal)'), ('c*Hz', 'centi*(hertz)'), ('c Hz', 'centi*(hertz)'), ('c*Wb', 'centi*(weber)'), ('c Wb', 'centi*(weber)'), ('c*lm', 'centi*(lumen)'), ('c lm', 'centi*(lumen)'), ('ckat', 'centi*(katal)'), ('c*Gy', 'centi*(gray)'), ('c Gy', 'centi*(gray)'), ('c*lx', 'centi*(lux)'), ('c lx', 'centi*(lux)'), ('c*eV', 'centi*(electronvolt)'), ('c eV', 'centi*(electronvolt)'), ('c*sr', 'centi*(steradian)'), ('c sr', 'centi*(steradian)'), ('cmin', 'centi*(minute)'), ('cdeg', 'centi*(degree)'), ('c*Np', 'centi*(neper)'), ('c Np', 'centi*(neper)'), ('cgal', 'centi*(gallon)'), ('c*qt', 'centi*(quart)'), ('c qt', 'centi*(quart)'), ('c*oz', 'centi*(ounce)'), ('c oz', 'centi*(ounce)'), ('c*lb', 'centi*(pound)'), ('c lb', 'centi*(pound)'), ('c*st', 'centi*(stone)'), ('c st', 'centi*(stone)'), ('c*in', 'centi*(inch)'), ('c in', 'centi*(inch)'), ('c*ft', 'centi*(foot)'), ('c ft', 'centi*(foot)'), ('c*yd', 'centi*(yard)'), ('c yd', 'centi*(yard)'), ('c*mi', 'centi*(mile)'), ('c mi', 'centi*(mile)'), ('c*gi', 'centi*(gill)'), ('c gi', 'centi*(gill)'), ('c*pt', 'centi*(pint)'), ('c pt', 'centi*(pint)'), ('m*cd', 'milli*(candela)'), ('m cd', 'milli*(candela)'), ('mmol', 'milli*(mole)'), ('m*Bq', 'milli*(becquerel)'), ('m Bq', 'milli*(becquerel)'), ('m*Sv', 'milli*(sievert)'), ('m Sv', 'milli*(sievert)'), ('m*Pa', 'milli*(pascal)'), ('m Pa', 'milli*(pascal)'), ('m*Hz', 'milli*(hertz)'), ('m Hz', 'milli*(hertz)'), ('m*Wb', 'milli*(weber)'), ('m Wb', 'milli*(weber)'), ('m*lm', 'milli*(lumen)'), ('m lm', 'milli*(lumen)'), ('mkat', 'milli*(katal)'), ('m*Gy', 'milli*(gray)'), ('m Gy', 'milli*(gray)'), ('m*lx', 'milli*(lux)'), ('m lx', 'milli*(lux)'), ('m*eV', 'milli*(electronvolt)'), ('m eV', 'milli*(electronvolt)'), ('m*sr', 'milli*(steradian)'), ('m sr', 'milli*(steradian)'), ('mmin', 'milli*(minute)'), ('mdeg', 'milli*(degree)'), ('m*Np', 'milli*(neper)'), ('m Np', 'milli*(neper)'), ('mgal', 'milli*(gallon)'), ('m*qt', 'milli*(quart)'), ('m qt', 'milli*(quart)'), ('m*oz', 'milli*(ounce)'), ('m oz', 'milli*(ounce)'), ('m*lb', 'milli*(pound)'), ('m lb', 'milli*(pound)'), ('m*st', 'milli*(stone)'), ('m st', 'milli*(stone)'), ('m*in', 'milli*(inch)'), ('m in', 'milli*(inch)'), ('m*ft', 'milli*(foot)'), ('m ft', 'milli*(foot)'), ('m*yd', 'milli*(yard)'), ('m yd', 'milli*(yard)'), ('m*mi', 'milli*(mile)'), ('m mi', 'milli*(mile)'), ('m*gi', 'milli*(gill)'), ('m gi', 'milli*(gill)'), ('m*pt', 'milli*(pint)'), ('m pt', 'milli*(pint)'), ('mucd', 'micro*(candela)'), ('mu*s', 'micro*(second)'), ('mu s', 'micro*(second)'), ('mu*A', 'micro*(ampere)'), ('mu A', 'micro*(ampere)'), ('mu*K', 'micro*(kelvin)'), ('mu K', 'micro*(kelvin)'), ('mu*m', 'micro*(metre)'), ('mu m', 'micro*(metre)'), ('mu*g', 'micro*(gram)'), ('mu g', 'micro*(gram)'), ('muBq', 'micro*(becquerel)'), ('mu*C', 'micro*(coulomb)'), ('mu C', 'micro*(coulomb)'), ('mu*S', 'micro*(siemens)'), ('mu S', 'micro*(siemens)'), ('muSv', 'micro*(sievert)'), ('mu*N', 'micro*(newton)'), ('mu N', 'micro*(newton)'), ('muPa', 'micro*(pascal)'), ('muHz', 'micro*(hertz)'), ('mu*J', 'micro*(joule)'), ('mu J', 'micro*(joule)'), ('mu*F', 'micro*(farad)'), ('mu F', 'micro*(farad)'), ('muWb', 'micro*(weber)'), ('mu*T', 'micro*(tesla)'), ('mu T', 'micro*(tesla)'), ('mu*H', 'micro*(henry)'), ('mu H', 'micro*(henry)'), ('mulm', 'micro*(lumen)'), ('mu*W', 'micro*(watt)'), ('mu W', 'micro*(watt)'), ('mu*V', 'micro*(volt)'), ('mu V', 'micro*(volt)'), ('muGy', 'micro*(gray)'), ('mu*O', 'micro*(ohm)'), ('mu O', 'micro*(ohm)'), ('mulx', 'micro*(lux)'), ('mu*u', 'micro*(atomicmassunit)'), ('mu u', 'micro*(atomicmassunit)'), ('mueV', 'micro*(electronvolt)'), ('musr', 'micro*(steradian)'), ('mu*t', 'micro*(metricton)'), ('mu t', 'micro*(metricton)'), ('mu*Å', 'micro*(angstrom)'), ('mu Å', 'micro*(angstrom)'), ('mu*r', 'micro*(radian)'), ('mu r', 'micro*(radian)'), ('mu*L', 'micro*(liter)'), ('mu L', 'micro*(liter)'), ('muNp', 'micro*(neper)'), ('mu*h', 'micro*(hour)'), ('mu h', 'micro*(hour)'), ('mu*B', 'micro*(bel)'), ('mu B', 'micro*(bel)'), ('muqt', 'micro*(quart)'), ('muoz', 'micro*(ounce)'), ('mulb', 'micro*(pound)'), ('must', 'micro*(stone)'), ('muin', 'micro*(inch)'), ('muft', 'micro*(foot)'), ('muyd', 'micro*(yard)'), ('mumi', 'micro*(mile)'), ('mugi', 'micro*(gill)'), ('mupt', 'micro*(pint)'), ('f*cd', 'femto*(candela)'), ('f cd', 'femto*(candela)'), ('fmol', 'femto*(mole)'), ('f*Bq', 'femto*(becquerel)'), ('f Bq', 'femto*(becquerel)'), ('f*Sv', 'femto*(sievert)'), ('f Sv', 'femto*(sievert)'), ('f*Pa', 'femto*(pascal)'), ('f Pa', 'femto*(pascal)'), ('f*Hz', 'femto*(hertz)'), ('f Hz', 'femto*(hertz)'), ('f*Wb', 'femto*(weber)'), ('f Wb', 'femto*(weber)'), ('f*lm', 'femto*(lumen)'), ('f lm', 'femto*(lumen)'), ('fkat', 'femto*(katal)'), ('f*Gy', 'femto*(gray)'), ('f Gy', 'femto*(gray)'), ('f*lx', 'femto*(lux)'), ('f lx', 'femto*(lux)'), ('f*eV', 'femto*(electronvolt)'), ('f eV', 'femto*(electronvolt)'), ('f*sr', 'femto*(steradian)'), ('f sr', 'femto*(steradian)'), ('fmin', 'femto*(minute)'), ('fdeg', 'femto*(degree)'), ('f*Np', 'femto*(neper)'), ('f Np', 'femto*(neper)'), ('fgal', 'femto*(gallon)'), ('f*qt', 'femto*(quart)'), ('f qt', 'femto*(quart)'), ('f*oz', 'femto*(ounce)'), ('f oz', 'femto*(ounce)'), ('f*lb', 'femto*(pound)'), ('f lb', 'femto*(pound)'), ('f*st', 'femto*(stone)'), ('f st', 'femto*(stone)'), ('f*in', 'femto*(inch)'), ('f in', 'femto*(inch)'), ('f*ft', 'femto*(foot)'), ('f ft', 'femto*(foot)'), ('f*yd', 'femto*(yard)'), ('f yd', 'femto*(yard)'), ('f*mi', 'femto*(mile)'), ('f mi', 'femto*(mile)'), ('f*gi', 'femto*(gill)'), ('f gi', 'femto*(gill)'), ('f*pt', 'femto*(pint)'), ('f pt', 'femto*(pint)'), ('z*cd', 'zepto*(candela)'), ('z cd', 'zepto*(candela)'), ('zmol', 'zepto*(mole)'), ('z*Bq', 'zepto*(becquerel)'), ('z Bq', 'zepto*(becquerel)'), ('z*Sv', 'zepto*(sievert)'), ('z Sv', 'zepto*(sievert)'), ('z*Pa', 'zepto*(pascal)'), ('z Pa', 'zepto*(pascal)'), ('z*Hz', 'zepto*(hertz)'), ('z Hz', 'zepto*(hertz)'), ('z*Wb', 'zepto*(weber)'), ('z Wb', 'zepto*(weber)'), ('z*lm', 'zepto*(lumen)'), ('z lm', 'zepto*(lumen)'), ('zkat', 'zepto*(katal)'), ('z*Gy', 'zepto*(gray)'), ('z Gy', 'zepto*(gray)'), ('z*lx', 'zepto*(lux)'), ('z lx', 'zepto*(lux)'), ('z*eV', 'zepto*(electronvolt)'), ('z eV', 'zepto*(electronvolt)'), ('z*sr', 'zepto*(steradian)'), ('z sr', 'zepto*(steradian)'), ('zmin', 'zepto*(minute)'), ('zdeg', 'zepto*(degree)'), ('z*Np', 'zepto*(neper)'), ('z Np', 'zepto*(neper)'), ('zgal', 'zepto*(gallon)'), ('z*qt', 'zepto*(quart)'), ('z qt', 'zepto*(quart)'), ('z*oz', 'zepto*(ounce)'), ('z oz', 'zepto*(ounce)'), ('z*lb', 'zepto*(pound)'), ('z lb', 'zepto*(pound)'), ('z*st', 'zepto*(stone)'), ('z st', 'zepto*(stone)'), ('z*in', 'zepto*(inch)'), ('z in', 'zepto*(inch)'), ('z*ft', 'zepto*(foot)'), ('z ft', 'zepto*(foot)'), ('z*yd', 'zepto*(yard)'), ('z yd', 'zepto*(yard)'), ('z*mi', 'zepto*(mile)'), ('z mi', 'zepto*(mile)'), ('z*gi', 'zepto*(gill)'), ('z gi', 'zepto*(gill)'), ('z*pt', 'zepto*(pint)'), ('z pt', 'zepto*(pint)'), ('y*cd', 'yocto*(candela)'), ('y cd', 'yocto*(candela)'), ('ymol', 'yocto*(mole)'), ('y*Bq', 'yocto*(becquerel)'), ('y Bq', 'yocto*(becquerel)'), ('y*Sv', 'yocto*(sievert)'), ('y Sv', 'yocto*(sievert)'), ('y*Pa', 'yocto*(pascal)'), ('y Pa', 'yocto*(pascal)'), ('y*Hz', 'yocto*(hertz)'), ('y Hz', 'yocto*(hertz)'), ('y*Wb', 'yocto*(weber)'), ('y Wb', 'yocto*(weber)'), ('y*lm', 'yocto*(lumen)'), ('y lm', 'yocto*(lumen)'), ('ykat', 'yocto*(katal)'), ('y*Gy', 'yocto*(gray)'), ('y Gy', 'yocto*(gray)'), ('y*lx', 'yocto*(lux)'), ('y lx', 'yocto*(lux)'), ('y*eV', 'yocto*(electronvolt)'), ('y eV', 'yocto*(electronvolt)'), ('y*sr', 'yocto*(steradian)'), ('y sr', 'yocto*(steradian)'), ('ymin', 'yocto*(minute)'), ('ydeg', 'yocto*(degree)'), ('y*Np', 'yocto*(neper)'), ('y Np', 'yocto*(neper)'), ('ygal', 'yocto*(gallon)'), ('y*qt', 'yocto*(quart)'), ('y qt', 'yocto*(quart)'), ('y*oz', 'yocto*(ounce)'), ('y oz', 'yocto*(ounce)'), ('y*lb', 'yocto*(pound)'), ('y lb', 'yocto*(pound)'), ('y*st', 'yocto*(stone)'), ('y st', 'yocto*(stone)'), ('y*in', 'yocto*(inch)'), ('y in', 'yocto*(inch)'), ('y*ft', 'yocto*(foot)'), ('y ft', 'yocto*(foot)'), ('y*yd', 'yocto*(yard)'), ('y yd', 'yocto*(yard)'), ('y*mi', 'yocto*(mile)'), ('y mi', 'yocto*(mile)'), ('y*gi', 'yocto*(gill)'), ('y gi', 'yocto*(gill)'), ('y*pt', 'yocto*(pint)'), ('y pt', 'yocto*(pint)'), ('P*cd', 'peta*(candela)'), ('P cd', 'peta*(candela)'), ('Pmol', 'peta*(mole)'), ('P*Bq', 'peta*(becquerel)'), ('P Bq', 'peta*(becquerel)'), ('P*Sv', 'peta*(sievert)'), ('P Sv', 'peta*(sievert)'), ('P*Pa', 'peta*(pascal)'), ('P Pa', 'peta*(pascal)'), ('P*Hz', 'peta*(hertz)'), ('P Hz', 'peta*(hertz)'), ('P*Wb', 'peta*(weber)'), ('P Wb', 'peta*(weber)'), ('P*lm', 'peta*(lumen)'), ('P lm', 'peta*(lumen)'), ('Pkat', 'peta*(katal)'), ('P*Gy', 'peta*(gray)'), ('P Gy', 'peta*(gray)'), ('P*lx', 'peta*(lux)'), ('P lx', 'peta*(lux)'), ('P*eV', 'peta*(electronvolt)'), ('P eV', 'peta*(electronvolt)'), ('P*sr', 'peta*(steradian)'), ('P sr', 'peta*(steradian)'), ('Pmin', 'peta*(minute)'), ('Pdeg', 'peta*(degree)'), ('P*Np', 'peta*(neper)'), ('P Np', 'peta*(neper)'), ('Pgal', 'peta*(gallon)'), ('P*qt', 'peta*(quart)'), ('P qt', 'peta*(quart)'), ('P*oz', 'peta*(ounce)'), ('P oz', 'peta*(ounce)'), ('P*lb', 'peta*(pound)'), ('P lb', 'peta*(pound)'), ('P*st', 'peta*(stone)'), ('P st', 'peta*(stone)'), ('P*in', 'peta*(inch)'), ('P in', 'peta*(inch)'), ('P*ft', 'peta*(foot)'), ('P ft', 'peta*(foot)'), ('P*yd', 'peta*(yard)'), ('P yd', 'peta*(yard)'), ('P*mi', 'peta*(mile)'), ('P mi', 'peta*(mile)'), ('P*gi', 'peta*(gill)'), ('P gi', 'peta*(gill)'), ('P*pt', 'peta*(pint)'), ('P pt', 'peta*(pint)'), ('T*cd', 'tera*(candela)'), ('T cd', 'tera*(candela)'), ('Tmol', 'tera*(mole)'), ('T*Bq', 'tera*(becquerel)'), ('T Bq', 'tera*(becquerel)'), ('T*Sv', 'tera*(sievert)'), ('T Sv', 'tera*(sievert)'), ('T*Pa', 'tera*(pascal)'), ('T Pa', 'tera*(pascal)'), ('T*Hz', 'tera*(hertz)'), ('T Hz', 'tera*(hertz)'), ('T*Wb', 'tera*(weber)'), ('T Wb', 'tera*(weber)'), ('T*lm', 'tera*(lumen)'), ('T lm', 'tera*(lumen)'), ('Tkat', 'tera*(katal)'), ('T*Gy', 'tera*(gray)'), ('T Gy', 'tera*(gray)'), ('T*lx', 'tera*(lux)'), ('T lx', 'tera*(lux)'), ('T*eV', 'tera*(electronvolt)'), ('T eV', 'tera*(electronvolt)'), ('T*sr', 'tera*(steradian)'), ('T sr', 'tera*(steradian)'), ('Tmin', 'tera*(minute)'), ('Tdeg', 'tera*(degree)'), ('T*Np', 'tera*(neper)'), ('T Np', 'tera*(neper)'), ('Tgal', 'tera*(gallon)'), ('T*qt', 'tera*(quart)'), ('T qt', 'tera*(quart)'), ('T*oz', 'tera*(ounce)'), ('T oz', 'tera*(ounce)'), ('T*lb', 'tera*(pound)'), ('T lb', 'tera*(pound)'), ('T*st', 'tera*(stone)'), ('T st', 'tera*(stone)'), ('T*in', 'tera*(inch)'), ('T in', 'tera*(inch)'), ('T*ft', 'tera*(foot)'), ('T ft', 'tera*(foot)'), ('T*yd', 'tera*(yard)'), ('T yd', 'tera*(yard)'), ('T*mi', 'tera*(mile)'), ('T mi', 'tera*(mile)'), ('T*gi', 'tera*(gill)'), ('T gi', 'tera*(gill)'), ('T*pt', 'tera*(pint)'), ('T pt', 'tera*(pint)'), ('G*cd', 'giga*(candela)'), ('G cd', 'giga*(candela)'), ('Gmol', 'giga*(mole)'), ('G*Bq', 'giga*(becquerel)'), ('G Bq', 'giga*(becquerel)'), ('G*Sv', 'giga*(sievert)'), ('G Sv', 'giga*(sievert)'), ('G*Pa', 'giga*(pascal)'), ('G Pa', 'giga*(pascal)'), ('G*Hz', 'giga*(hertz)'), ('G Hz', 'giga*(hertz)'), ('G*Wb', 'giga*(weber)'), ('G Wb', 'giga*(weber)'), ('G*lm', 'giga*(lumen)'), ('G lm', 'giga*(lumen)'), ('Gkat', 'giga*(katal)'), ('G*Gy', 'giga*(gray)'), ('G Gy', 'giga*(gray)'), ('G*lx', 'giga*(lux)'), ('G lx', 'giga*(lux)'), ('G*eV', 'giga*(electronvolt)'), ('G eV', 'giga*(electronvolt)'), ('G*sr', 'giga*(steradian)'), ('G sr', 'giga*(steradian)'), ('Gmin', 'giga*(minute)'), ('Gdeg', 'giga*(degree)'), ('G*Np', 'giga*(neper)'), ('G Np', 'giga*(neper)'), ('Ggal', 'giga*(gallon)'), ('G*qt', 'giga*(quart)'), ('G qt', 'giga*(quart)'), ('G*oz', 'giga*(ounce)'), ('G oz', 'giga*(ounce)'), ('G*lb', 'giga*(pound)'), ('G lb', 'giga*(pound)'), ('G*st', 'giga*(stone)'), ('G st', 'giga*(stone)'), ('G*in', 'giga*(inch)'), ('G in', 'giga*(inch)'), ('G*ft', 'giga*(foot)'), ('G ft', 'giga*(foot)'), ('G*yd', 'giga*(yard)'), ('G yd', 'giga*(yard)'), ('G*mi', 'giga*(mile)'), ('G mi', 'giga*(mile)'), ('G*gi', 'giga*(gill)'), ('G gi', 'giga*(gill)'), ('G*pt', 'giga*(pint)'), ('G pt', 'giga*(pint)'), ('M*cd', 'mega*(candela)'), ('M cd', 'mega*(candela)'), ('Mmol', 'mega*(mole)'), ('M*Bq', 'mega*(becquerel)'), ('M Bq', 'mega*(becquerel)'), ('M*Sv', 'mega*(sievert)'), ('M Sv', 'mega*(sievert)'), ('M*Pa', 'mega*(pascal)'), ('M Pa', 'mega*(pascal)'), ('M*Hz', 'mega*(hertz)'), ('M Hz', 'mega*(hertz)'), ('M*Wb', 'mega*(weber)'), ('M Wb', 'mega*(weber)'), ('M*lm', 'mega*(lumen)'), ('M lm', 'mega*(lumen)'), ('Mkat', 'mega*(katal)'), ('M*Gy', 'mega*(gray)'), ('M Gy', 'mega*(gray)'), ('M*lx', 'mega*(lux)'), ('M lx', 'mega*(lux)'), ('M*eV', 'mega*(electronvolt)'), ('M eV', 'mega*(electronvolt)'), ('M*sr', 'mega*(steradian)'), ('M sr', 'mega*(steradian)'), ('Mmin', 'mega*(minute)'), ('Mdeg', 'mega*(degree)'), ('M*Np', 'mega*(neper)'), ('M Np', 'mega*(neper)'), ('Mgal', 'mega*(gallon)'), ('M*qt', 'mega*(quart)'), ('M qt', 'mega*(quart)'), ('M*oz', 'mega*(ounce)'), ('M oz', 'mega*(ounce)'), ('M*lb', 'mega*(pound)'), ('M lb', 'mega*(pound)'), ('M*st', 'mega*(stone)'), ('M st', 'mega*(stone)'), ('M*in', 'mega*(inch)'), ('M in', 'mega*(inch)'), ('M*ft', 'mega*(foot)'), ('M ft', 'mega*(foot)'), ('M*yd', 'mega*(yard)'), ('M yd', 'mega*(yard)'), ('M*mi', 'mega*(mile)'), ('M mi', 'mega*(mile)'), ('M*gi', 'mega*(gill)'), ('M gi', 'mega*(gill)'), ('M*pt', 'mega*(pint)'), ('M pt', 'mega*(pint)'), ('k*cd', 'kilo*(candela)'), ('k cd', 'kilo*(candela)'), ('kmol', 'kilo*(mole)'), ('k*Bq', 'kilo*(becquerel)'), ('k Bq', 'kilo*(becquerel)'), ('k*Sv', 'kilo*(sievert)'), ('k Sv', 'kilo*(sievert)'), ('k*Pa', 'kilo*(pascal)'), ('k Pa', 'kilo*(pascal)'), ('k*Hz', 'kilo*(hertz)'), ('k Hz', 'kilo*(hertz)'), ('k*Wb', 'kilo*(weber)'), ('k Wb', 'kilo*(weber)'), ('k*lm', 'kilo*(lumen)'), ('k lm', 'kilo*(lumen)'), ('kkat', 'kilo*(katal)'), ('k*Gy', 'kilo*(gray)'), ('k Gy', 'kilo*(gray)'), ('k*lx', 'kilo*(lux)'), ('k lx', 'kilo*(lux)'), ('k*eV', 'kilo*(electronvolt)'), ('k eV', 'kilo*(electronvolt)'), ('k*sr', 'kilo*(steradian)'), ('k sr', 'kilo*(steradian)'), ('kmin', 'kilo*(minute)'), ('kdeg', 'kilo*(degree)'), ('k*Np', 'kilo*(neper)'), ('k Np', 'kilo*(neper)'), ('kgal', 'kilo*(gallon)'), ('k*qt', 'kilo*(quart)'), ('k qt', 'kilo*(quart)'), ('k*oz', 'kilo*(ounce)'), ('k oz', 'kilo*(ounce)'), ('k*lb', 'kilo*(pound)'), ('k lb', 'kilo*(pound)'), ('k*st', 'kilo*(stone)'), ('k st', 'kilo*(stone)'), ('k*in', 'kilo*(inch)'), ('k in', 'kilo*(inch)'), ('k*ft', 'kilo*(foot)'), ('k ft', 'kilo*(foot)'), ('k*yd', 'kilo*(yard)'), ('k yd', 'kilo*(yard)'), ('k*mi', 'kilo*(mile)'), ('k mi', 'kilo*(mile)'), ('k*gi', 'kilo*(gill)'), ('k gi', 'kilo*(gill)'), ('k*pt', 'kilo*(pint)'), ('k pt', 'kilo*(pint)'), ('dacd', 'deka*(candela)'), ('da*s', 'deka*(second)'), ('da s', 'deka*(second)'), ('da*A', 'deka*(ampere)'), ('da A', 'deka*(ampere)'), ('da*K', 'deka*(kelvin)'), ('da K', 'deka*(kelvin)'), ('da*m', 'deka*(metre)'), ('da m', 'deka*(metre)'), ('da*g', 'deka*(gram)'), ('da g', 'deka*(gram)'), ('daBq', 'deka*(becquerel)'), ('da*C', 'deka*(coulomb)'), ('da C', 'deka*(coulomb)'), ('da*S', 'deka*(siemens)'), ('da S', 'deka*(siemens)'), ('daSv', 'deka*(sievert)'), ('da*N', 'deka*(newton)'), ('da N', 'deka*(newton)'), ('daPa', 'deka*(pascal)'), ('daHz', 'deka*(hertz)'), ('da*J', 'deka*(joule)'), ('da J', 'deka*(joule)'), ('da*F', 'deka*(farad)'), ('da F', 'deka*(farad)'), ('daWb', 'deka*(weber)'), ('da*T', 'deka*(tesla)'), ('da T', 'deka*(tesla)'), ('da*H', 'deka*(henry)'), ('da H', 'deka*(henry)'), ('dalm', 'deka*(lumen)'), ('da*W', 'deka*(watt)'), ('da W', 'deka*(watt)'), ('da*V', 'deka*(volt)'), ('da V', 'deka*(volt)'), ('daGy', 'deka*(gray)'), ('da*O', 'deka*(ohm)'), ('da O', 'deka*(ohm)'), ('dalx', 'deka*(lux)'), ('da*u', 'deka*(atomicmassunit)'), ('da u', 'deka*(atomicmassunit)'), ('daeV', 'deka*(electronvolt)'), ('dasr', 'deka*(steradian)'), ('da*t', 'deka*(metricton)'), ('da t', 'deka*(metricton)'), ('da*Å', 'deka*(angstrom)'), ('da Å', 'deka*(angstrom)'), ('da*r', 'deka*(radian)'), ('da r', 'deka*(radian)'), ('da*L', 'deka*(liter)'), ('da L', 'deka*(liter)'), ('daNp', 'deka*(neper)'), ('da*h', 'deka*(hour)'), ('da h', 'deka*(hour)'), ('da*B', 'deka*(bel)'), ('da B', 'deka*(bel)'), ('daqt', 'deka*(quart)'), ('daoz', 'deka*(ounce)'), ('dalb', 'deka*(pound)'), ('dast', 'deka*(stone)'), ('dain', 'deka*(inch)'), ('daft', 'deka*(foot)'), ('dayd', 'deka*(yard)'), ('dami', 'deka*(mile)'), ('dagi', 'deka*(gill)'), ('dapt', 'deka*(pint)'), ('d*cd', 'deci*(candela)'), ('d cd', 'deci*(candela)'), ('dmol', 'deci*(mole)'), ('d*Bq', 'deci*(becquerel)'), ('d Bq', 'deci*(becquerel)'), ('d*Sv', 'deci*(sievert)'), ('d Sv', 'deci*(sievert)'), ('d*Pa', 'deci*(pascal)'), ('d Pa', 'deci*(pascal)'), ('d*Hz', 'deci*(hertz)'), ('d Hz', 'deci*(hertz)'), ('d*Wb', 'deci*(weber)'), ('d Wb', 'deci*(weber)'), ('d*lm', 'deci*(lumen)'), ('d lm', 'deci*(lumen)'), ('dkat', 'deci*(katal)'), ('d*Gy', 'deci*(gray)'), ('d Gy', 'deci*(gray)'), ('d*lx', 'deci*(lux)'), ('d lx', 'deci*(lux)'), ('d*eV', 'deci*(electronvolt)'), ('d eV', 'deci*(electronvolt)'), ('d*sr', 'deci*(steradian)'), ('d sr', 'deci*(steradian)'), ('dmin', 'deci*(minute)'), ('ddeg', 'deci*(degree)'), ('d*Np', 'deci*(neper)'), ('d Np', 'deci*(neper)'), ('dgal', 'deci*(gallon)'), ('d*qt', 'deci*(quart)'), ('d qt', 'deci*(quart)'), ('d*oz', 'deci*(ounce)'), ('d oz', 'deci*(ounce)'), ('d*lb', 'deci*(pound)'), ('d lb', 'deci*(pound)'), ('d*st', 'deci*(stone)'), ('d st', 'deci*(stone)'), ('d*in', 'deci*(inch)'), ('d in', 'deci*(inch)'), ('d*ft', 'deci*(foot)'), ('d ft', 'deci*(foot)'), ('d*yd', 'deci*(yard)'), ('d yd', 'deci*(yard)'), ('d*mi', 'deci*(mile)'), ('d mi', 'deci*(mile)'), ('d*gi', 'deci*(gill)'), ('d gi', 'deci*(gill)'), ('d*pt', 'deci*(pint)'), ('d pt', 'deci*(pint)'), ('n*cd', 'nano*(candela)'), ('n cd', 'nano*(candela)'), ('nmol', 'nano*(mole)'), ('n*Bq', 'nano*(becquerel)'), ('n Bq', 'nano*(becquerel)'), ('n*Sv', 'nano*(sievert)'), ('n Sv', 'nano*(sievert)'), ('n*Pa', 'nano*(pascal)'), ('n Pa', 'nano*(pascal)'), ('n*Hz', 'nano*(hertz)'), ('n Hz', 'nano*(hertz)'), ('n*Wb', 'nano*(weber)'), ('n Wb', 'nano*(weber)'), ('n*lm', 'nano*(lumen)'), ('n lm', 'nano*(lumen)'), ('nkat', 'nano*(katal)'), ('n*Gy', 'nano*(gray)'), ('n Gy', 'nano*(gray)'), ('n*lx', 'nano*(lux)'), ('n lx', 'nano*(lux)'), ('n*eV', 'nano*(electronvolt)'), ('n eV', 'nano*(electronvolt)'), ('n*sr', 'nano*(steradian)'), ('n sr', 'nano*(steradian)'), ('nmin', 'nano*(minute)'), ('ndeg', 'nano*(degree)'), ('n*Np', 'nano*(neper)'), ('n Np', 'nano*(neper)'), ('ngal', 'nano*(gallon)'), ('n*qt', 'nano*(quart)'), ('n qt', 'nano*(quart)'), ('n*oz', 'nano*(ounce)'), ('n oz', 'nano*(ounce)'), ('n*lb', 'nano*(pound)'), ('n lb', 'nano*(pound)'), ('n*st', 'nano*(stone)'), ('n st', 'nano*(stone)'), ('n*in', 'nano*(inch)'), ('n in', 'nano*(inch)'), ('n*ft', 'nano*(foot)'), ('n ft', 'nano*(foot)'), ('n*yd', 'nano*(yard)'), ('n yd', 'nano*(yard)'), ('n*mi', 'nano*(mile)'), ('n mi', 'nano*(mile)'), ('n*gi', 'nano*(gill)'), ('n gi', 'nano*(gill)'), ('n*pt', 'nano*(pint)'), ('n pt', 'nano*(pint)'), ('p*cd', 'pico*(candela)'), ('p cd', 'pico*(candela)'), ('pmol', 'pico*(mole)'), ('p*Bq', 'pico*(becquerel)'), ('p Bq', 'pico*(becquerel)'), ('p*Sv', 'pico*(sievert)'), ('p Sv', 'pico*(sievert)'), ('p*Pa', 'pico*(pascal)'), ('p Pa', 'pico*(pascal)'), ('p*Hz', 'pico*(hertz)'), ('p Hz', 'pico*(hertz)'), ('p*Wb', 'pico*(weber)'), ('p Wb', 'pico*(weber)'), ('p*lm', 'pico*(lumen)'), ('p lm', 'pico*(lumen)'), ('pkat', 'pico*(katal)'), ('p*Gy', 'pico*(gray)'), ('p Gy', 'pico*(gray)'), ('p*lx', 'pico*(lux)'), ('p lx', 'pico*(lux)'), ('p*eV', 'pico*(electronvolt)'), ('p eV', 'pico*(electronvolt)'), ('p*sr', 'pico*(steradian)'), ('p sr', 'pico*(steradian)'), ('pmin', 'pico*(minute)'), ('pdeg', 'pico*(degree)'), ('p*Np', 'pico*(neper)'), ('p Np', 'pico*(neper)'), ('pgal', 'pico*(gallon)'), ('p*qt', 'pico*(quart)'), ('p qt', 'pico*(quart)'), ('p*oz', 'pico*(ounce)'), ('p oz', 'pico*(ounce)'), ('p*lb', 'pico*(pound)'), ('p lb', 'pico*(pound)'), ('p*st', 'pico*(stone)'), ('p st', 'pico*(stone)'), ('p*in', 'pico*(inch)'), ('p in', 'pico*(inch)'), ('p*ft', 'pico*(foot)'), ('p ft', 'pico*(foot)'), ('p*yd', 'pico*(yard)'), ('p yd', 'pico*(yard)'), ('p*mi', 'pico*(mile)'), ('p mi', 'pico*(mile)'), ('p*gi', 'pico*(gill)'), ('p gi', 'pico*(gill)'), ('p*pt', 'pico*(pint)'), ('p pt', 'pico*(pint)'), ('a*cd', 'atto*(candela)'), ('a cd', 'atto*(candela)'), ('amol', 'atto*(mole)'), ('a*Bq', 'atto*(becquerel)'), ('a Bq', 'atto*(becquerel)'), ('a*Sv', 'atto*(sievert)'), ('a Sv', 'atto*(sievert)'), ('a*Pa', 'atto*(pascal)'), ('a Pa', 'atto*(pascal)'), ('a*Hz', 'atto*(hertz)'), ('a Hz', 'atto*(hertz)'), ('a*Wb', 'atto*(weber)'), ('a Wb', 'atto*(weber)'), ('a*lm', 'atto*(lumen)'), ('a lm', 'atto*(lumen)'), ('akat', 'atto*(katal)'), ('a*Gy', 'atto*(gray)'), ('a Gy', 'atto*(gray)'), ('a*lx', 'atto*(lux)'), ('a lx', 'atto*(lux)'), ('a*eV', 'atto*(electronvolt)'), ('a eV', 'atto*(electronvolt)'), ('a*sr', 'atto*(steradian)'), ('a sr', 'atto*(steradian)'), ('amin', 'atto*(minute)'), ('adeg', 'atto*(degree)'), ('a*Np', 'atto*(neper)'), ('a Np', 'atto*(neper)'), ('agal', 'atto*(gallon)'), ('a*qt', 'atto*(quart)'), ('a qt', 'atto*(quart)'), ('a*oz', 'atto*(ounce)'), ('a oz', 'atto*(ounce)'), ('a*lb', 'atto*(pound)'), ('a lb', 'atto*(pound)'), ('a*st', 'atto*(stone)'), ('a st', 'atto*(stone)'), ('a*in', 'atto*(inch)'), ('a in', 'atto*(inch)'), ('a*ft', 'atto*(foot)'), ('a ft', 'atto*(foot)'), ('a*yd', 'atto*(yard)'), ('a yd', 'atto*(yard)'), ('a*mi', 'atto*(mile)'), ('a mi', 'atto*(mile)'), ('a*gi', 'atto*(gill)'), ('a gi', 'atto*(gill)'), ('a*pt', 'atto*(pint)'), ('a pt', 'atto*(pint)'), ('E*cd', 'exa*(candela)'), ('E cd', 'exa*(candela)'), ('Emol', 'exa*(mole)'), ('E*Bq', 'exa*(becquerel)'), ('E Bq', 'exa*(becquerel)'), ('E*Sv', 'exa*(sievert)'), ('E Sv', 'exa*(sievert)'), ('E*Pa', 'exa*(pascal)'), ('E Pa', 'exa*(pascal)'), ('E*Hz', 'exa*(hertz)'), ('E Hz', 'exa*(hertz)'), ('E*Wb', 'exa*(weber)'), ('E Wb', 'exa*(weber)'), ('E*lm', 'exa*(lumen)'), ('E lm', 'exa*(lumen)'), ('Ekat', 'exa*(katal)'), ('E*Gy', 'exa*(gray)'), ('E Gy', 'exa*(gray)'), ('E*lx', 'exa*(lux)'), ('E lx', 'exa*(lux)'), ('E*eV', 'exa*(electronvolt)'), ('E eV', 'exa*(electronvolt)'), ('E*sr', 'exa*(steradian)'), ('E sr', 'exa*(steradian)'), ('Emin', 'exa*(minute)'), ('Edeg', 'exa*(degree)'), ('E*Np', 'exa*(neper)'), ('E Np', 'exa*(neper)'), ('Egal', 'exa*(gallon)'), ('E*qt', 'exa*(quart)'), ('E qt', 'exa*(quart)'), ('E*oz', 'exa*(ounce)'), ('E oz', 'exa*(ounce)'), ('E*lb', 'exa*(pound)'), ('E lb', 'exa*(pound)'), ('E*st', 'exa*(stone)'), ('E st', 'exa*(stone)'), ('E*in', 'exa*(inch)'), ('E in', 'exa*(inch)'), ('E*ft', 'exa*(foot)'), ('E ft', 'exa*(foot)'), ('E*yd', 'exa*(yard)'), ('E yd', 'exa*(yard)'), ('E*mi', 'exa*(mile)'), ('E mi', 'exa*(mile)'), ('E*gi', 'exa*(gill)'), ('E gi', 'exa*(gill)'), ('E*pt', 'exa*(pint)'), ('E pt', 'exa*(pint)'), ('min', 'minute'), ('Ycd', 'yotta*(candela)'), ('Y*s', 'yotta*(second)'), ('Y s', 'yotta*(second)'), ('Y*A', 'yotta*(ampere)'), ('Y A', 'yotta*(ampere)'), ('Y*K', 'yotta*(kelvin)'), ('Y K', 'yotta*(kelvin)'), ('Y*m', 'yotta*(metre)'), ('Y m', 'yotta*(metre)'), ('Y*g', 'yotta*(gram)'), ('Y g', 'yotta*(gram)'), ('YBq', 'yotta*(becquerel)'), ('Y*C', 'yotta*(coulomb)'), ('Y C', 'yotta*(coulomb)'), ('Y*S', 'yotta*(siemens)'), ('Y S', 'yotta*(siemens)'), ('YSv', 'yotta*(sievert)'), ('Y*N', 'yotta*(newton)'), ('Y N', 'yotta*(newton)'), ('YPa', 'yotta*(pascal)'), ('YHz', 'yotta*(hertz)'), ('Y*J', 'yotta*(joule)'), ('Y J', 'yotta*(joule)'), ('Y*F', 'yotta*(farad)'), ('Y F', 'yotta*(farad)'), ('YWb', 'yotta*(weber)'), ('Y*T', 'yotta*(tesla)'), ('Y T', 'yotta*(tesla)'), ('Y*H', 'yotta*(henry)'), ('Y H', 'yotta*(henry)'), ('Ylm', 'yotta*(lumen)'), ('Y*W', 'yotta*(watt)'), ('Y W', 'yotta*(watt)'), ('Y*V', 'yotta*(volt)'), ('Y V', 'yotta*(volt)'), ('YGy', 'yotta*(gray)'), ('Y*O', 'yotta*(ohm)'), ('Y O', 'yotta*(ohm)'), ('Ylx', 'yotta*(lux)'), ('Y*u', 'yotta*(atomicmassunit)'), ('Y u', 'yotta*(atomicmassunit)'), ('YeV', 'yotta*(electronvolt)'), ('Ysr', 'yotta*(steradian)'), ('Y*t', 'yotta*(metricton)'), ('Y t', 'yotta*(metricton)'), ('Y*Å', 'yotta*(angstrom)'), ('Y Å', 'yotta*(angstrom)'), ('Y*r', 'yotta*(radian)'), ('Y r', 'yotta*(radian)'), ('Y*L', 'yotta*(liter)'), ('Y L', 'yotta*(liter)'), ('YNp', 'yotta*(neper)'), ('Y*h', 'yotta*(hour)'), ('Y h', 'yotta*(hour)'), ('Y*B', 'yotta*(bel)'), ('Y B', 'yotta*(bel)'), ('Yqt', 'yotta*(quart)'), ('Yoz', 'yotta*(ounce)'), ('Ylb', 'yotta*(pound)'), ('Yst', 'yotta*(stone)'), ('Yin', 'yotta*(inch)'), ('Yft', 'yotta*(foot)'), ('Yyd', 'yotta*(yard)'), ('Ymi', 'yotta*(mile)'), ('Ygi', 'yotta*(gill)'), ('Ypt', 'yotta*(pint)'), ('Zcd', 'zetta*(candela)'), ('Z*s', 'zetta*(second)'), ('Z s', 'zetta*(second)'), ('Z*A', 'zetta*(ampere)'), ('Z A', 'zetta*(ampere)'), ('Z*K', 'zetta*(kelvin)'), ('Z K', 'zetta*(kelvin)'), ('Z*m', 'zetta*(metre)'), ('Z m', 'zetta*(metre)'), ('Z*g', 'zetta*(gram)'), ('Z g', 'zetta*(gram)'), ('ZBq', 'zetta*(becquerel)'), ('Z*C', 'zetta*(coulomb)'), ('Z C', 'zetta*(coulomb)'), ('Z*S', 'zetta*(siemens)'), ('Z S', 'zetta*(siemens)'), ('ZSv', 'zetta*(sievert)'), ('Z*N', 'zetta*(newton)'), ('Z N', 'zetta*(newton)'), ('ZPa', 'zetta*(pascal)'), ('ZHz', 'zetta*(hertz)'), ('Z*J', 'zetta*(joule)'), ('Z J', 'zetta*(joule)'), ('Z*F', 'zetta*(farad)'), ('Z F', 'zetta*(farad)'), ('ZWb', 'zetta*(weber)'), ('Z*T', 'zetta*(tesla)'), ('Z T', 'zetta*(tesla)'), ('Z*H', 'zetta*(henry)'), ('Z H', 'zetta*(henry)'), ('Zlm', 'zetta*(lumen)'), ('Z*W', 'zetta*(watt)'), ('Z W', 'zetta*(watt)'), ('Z*V', 'zetta*(volt)'), ('Z V', 'zetta*(volt)'), ('ZGy', 'zetta*(gray)'), ('Z*O', 'zetta*(ohm)'), ('Z O', 'zetta*(ohm)'), ('Zlx', 'zetta*(lux)'), ('Z*u', 'zetta*(atomicmassunit)'), ('Z u', 'zetta*(atomicmassunit)'), ('ZeV', 'zetta*(electronvolt)'), ('Zsr', 'zetta*(steradian)'), ('Z*t', 'zetta*(metricton)'), ('Z t', 'zetta*(metricton)'), ('Z*Å', 'zetta*(angstrom)'), ('Z Å', 'zetta*(angstrom)'), ('Z*r', 'zetta*(radian)'), ('Z r', 'zetta*(radian)'), ('Z*L', 'zetta*(liter)'), ('Z L', 'zetta*(liter)'), ('ZNp', 'zetta*(neper)'), ('Z*h', 'zetta*(hour)'), ('Z h', 'zetta*(hour)'), ('Z*B', 'zetta*(bel)'), ('Z B', 'zetta*(bel)'), ('Zqt', 'zetta*(quart)'), ('Zoz', 'zetta*(ounce)'), ('Zlb', 'zetta*(pound)'), ('Zst', 'zetta*(stone)'), ('Zin', 'zetta*(inch)'), ('Zft', 'zetta*(foot)'), ('Zyd', 'zetta*(yard)'), ('Zmi', 'zetta*(mile)'), ('Zgi', 'zetta*(gill)'), ('Zpt', 'zetta*(pint)'), ('hcd', 'hecto*(candela)'), ('h*s', 'hecto*(second)'), ('h s', 'hecto*(second)'), ('h*A', 'hecto*(ampere)'), ('h A', 'hecto*(ampere)'), ('h*K', 'hecto*(kelvin)'), ('h K', 'hecto*(kelvin)'), ('h*m', 'hecto*(metre)'), ('h m', 'hecto*(metre)'), ('h*g', 'hecto*(gram)'), ('h g', 'hecto*(gram)'), ('hBq', 'hecto*(becquerel)'), ('h*C', 'hecto*(coulomb)'), ('h C', 'hecto*(coulomb)'), ('h*S', 'hecto*(siemens)'), ('h S', 'hecto*(siemens)'), ('hSv', 'hecto*(sievert)'), ('h*N', 'hecto*(newton)'), ('h N', 'hecto*(newton)'), ('hPa', 'hecto*(pascal)'), ('hHz', 'hecto*(hertz)'), ('h*J', 'hecto*(joule)'), ('h J', 'hecto*(joule)'), ('h*F', 'hecto*(farad)'), ('h F', 'hecto*(farad)'), ('hWb', 'hecto*(weber)'), ('h*T', 'hecto*(tesla)'), ('h T', 'hecto*(tesla)'), ('h*H', 'hecto*(henry)'), ('h H', 'hecto*(henry)'), ('hlm', 'hecto*(lumen)'), ('h*W', 'hecto*(watt)'), ('h W', 'hecto*(watt)'), ('h*V', 'hecto*(volt)'), ('h V', 'hecto*(volt)'), ('hGy', 'hecto*(gray)'), ('h*O', 'hecto*(ohm)'), ('h O', 'hecto*(ohm)'), ('hlx', 'hecto*(lux)'), ('h*u', 'hecto*(atomicmassunit)'), ('h u', 'hecto*(atomicmassunit)'), ('heV', 'hecto*(electronvolt)'), ('hsr', 'hecto*(steradian)'), ('h*t', 'hecto*(metricton)'), ('h t', 'hecto*(metricton)'), ('h*Å', 'hecto*(angstrom)'), ('h Å', 'hecto*(angstrom)'), ('h*r', 'hecto*(radian)'), ('h r', 'hecto*(radian)'), ('h*L', 'hecto*(liter)'), ('h L', 'hecto*(liter)'), ('hNp', 'hecto*(neper)'), ('h*h', 'hecto*(hour)'), ('h h', 'hecto*(hour)'), ('h*B', 'hecto*(bel)'), ('h B', 'hecto*(bel)'), ('hqt', 'hecto*(quart)'), ('hoz', 'hecto*(ounce)'), ('hlb', 'hecto*(pound)'), ('hst', 'hecto*(stone)'), ('hin', 'hecto*(inch)'), ('hft', 'hecto*(foot)'), ('hyd', 'hecto*(yard)'), ('hmi', 'hecto*(mile)'), ('hgi', 'hecto*(gill)'), ('hpt', 'hecto*(pint)'), ('ccd', 'centi*(candela)'), ('c*s', 'centi*(second)'), ('c s', 'centi*(second)'), ('c*A', 'centi*(ampere)'), ('c A', 'centi*(ampere)'), ('c*K', 'centi*(kelvin)'), ('c K', 'centi*(kelvin)'), ('c*m', 'centi*(metre)'), ('c m', 'centi*(metre)'), ('c*g', 'centi*(gram)'), ('c g', 'centi*(gram)'), ('cBq', 'centi*(becquerel)'), ('c*C', 'centi*(coulomb)'), ('c C', 'centi*(coulomb)'), ('c*S', 'centi*(siemens)'), ('c S', 'centi*(siemens)'), ('cSv', 'centi*(sievert)'), ('c*N', 'centi*(newton)'), ('c N', 'centi*(newton)'), ('cPa', 'centi*(pascal)'), ('cHz', 'centi*(hertz)'), ('c*J', 'centi*(joule)'), ('c J', 'centi*(joule)'), ('c*F', 'centi*(farad)'), ('c F', 'centi*(farad)'), ('cWb', 'centi*(weber)'), ('c*T', 'centi*(tesla)'), ('c T', 'centi*(tesla)'), ('c*H', 'centi*(henry)'), ('c H', 'centi*(henry)'), ('clm', 'centi*(lumen)'), ('c*W', 'centi*(watt)'), ('c W', 'centi*(watt)'), ('c*V', 'centi*(volt)'), ('c V', 'centi*(volt)'), ('cGy', 'centi*(gray)'), ('c*O', 'centi*(ohm)'), ('c O', 'centi*(ohm)'), ('clx', 'centi*(lux)'), ('c*u', 'centi*(atomicmassunit)'), ('c u', 'centi*(atomicmassunit)'), ('ceV', 'centi*(electronvolt)'), ('csr', 'centi*(steradian)'), ('c*t', 'centi*(metricton)'), ('c t', 'centi*(metricton)'), ('c*Å', 'centi*(angstrom)'), ('c Å', 'centi*(angstrom)'), ('c*r', 'centi*(radian)'), ('c r', 'centi*(radian)'), ('c*L', 'centi*(liter)'), ('c L', 'centi*(liter)'), ('cNp', 'centi*(neper)'), ('c*h', 'centi*(hour)'), ('c h', 'centi*(hour)'), ('c*B', 'centi*(bel)'), ('c B', 'centi*(bel)'), ('cqt', 'centi*(quart)'), ('coz', 'centi*(ounce)'), ('clb', 'centi*(pound)'), ('cst', 'centi*(stone)'), ('cin', 'centi*(inch)'), ('cft', 'centi*(foot)'), ('cyd', 'centi*(yard)'), ('cmi', 'centi*(mile)'), ('cgi', 'centi*(gill)'), ('cpt', 'centi*(pint)'), ('mcd', 'milli*(candela)'), ('m*s', 'milli*(second)'), ('m s', 'milli*(second)'), ('m*A', 'milli*(ampere)'), ('m A', 'milli*(ampere)'), ('m*K', 'milli*(kelvin)'), ('m K', 'milli*(kelvin)'), ('m*m', 'milli*(metre)'), ('m m', 'milli*(metre)'), ('m*g', 'milli*(gram)'), ('m g', 'milli*(gram)'), ('mBq', 'milli*(becquerel)'), ('m*C', 'milli*(coulomb)'), ('m C', 'milli*(coulomb)'), ('m*S', 'milli*(siemens)'), ('m S', 'milli*(siemens)'), ('mSv', 'milli*(sievert)'), ('m*N', 'milli*(newton)'), ('m N', 'milli*(newton)'), ('mPa', 'milli*(pascal)'), ('mHz', 'milli*(hertz)'), ('m*J', 'milli*(joule)'), ('m J', 'milli*(joule)'), ('m*F', 'milli*(farad)'), ('m F', 'milli*(farad)'), ('mWb', 'milli*(weber)'), ('m*T', 'milli*(tesla)'), ('m T', 'milli*(tesla)'), ('m*H', 'milli*(henry)'), ('m H', 'milli*(henry)'), ('mlm', 'milli*(lumen)'), ('m*W', 'milli*(watt)'), ('m W', 'milli*(watt)'), ('m*V', 'milli*(volt)'), ('m V', 'milli*(volt)'), ('mGy', 'milli*(gray)'), ('m*O', 'milli*(ohm)'), ('m O', 'milli*(ohm)'), ('mlx', 'milli*(lux)'), ('m*u', 'milli*(atomicmassunit)'), ('m u', 'milli*(atomicmassunit)'), ('meV', 'milli*(electronvolt)'), ('msr', 'milli*(steradian)'), ('m*t', 'milli*(metricton)'), ('m t', 'milli*(metricton)'), ('m*Å', 'milli*(angstrom)'), ('m Å', 'milli*(angstrom)'), ('m*r', 'milli*(radian)'), ('m r', 'milli*(radian)'), ('m*L', 'milli*(liter)'), ('m L', 'milli*(liter)'), ('mNp', 'milli*(neper)'), ('m*h', 'milli*(hour)'), ('m h', 'milli*(hour)'), ('m*B', 'milli*(bel)'), ('m B', 'milli*(bel)'), ('mqt', 'milli*(quart)'), ('moz', 'milli*(ounce)'), ('mlb', 'milli*(pound)'), ('mst', 'milli*(stone)'), ('min', 'milli*(inch)'), ('mft', 'milli*(foot)'), ('myd', 'milli*(yard)'), ('mmi', 'milli*(mile)'), ('mgi', 'milli*(gill)'), ('mpt', 'milli*(pint)'), ('mus', 'micro*(second)'), ('muA', 'micro*(ampere)'), ('muK', 'micro*(kelvin)'), ('mum', 'micro*(metre)'), ('mug', 'micro*(gram)'), ('muC', 'micro*(coulomb)'), ('muS', 'micro*(siemens)'), ('muN', 'micro*(newton)'), ('muJ', 'micro*(joule)'), ('muF', 'micro*(farad)'), ('muT', 'micro*(tesla)'), ('muH', 'micro*(henry)'), ('muW', 'micro*(watt)'), ('muV', 'micro*(volt)'), ('muO', 'micro*(ohm)'), ('muu', 'micro*(atomicmassunit)'), ('mut', 'micro*(metricton)'), ('muÅ', 'micro*(angstrom)'), ('mur', 'micro*(radian)'), ('muL', 'micro*(liter)'), ('muh', 'micro*(hour)'), ('muB', 'micro*(bel)'), ('fcd', 'femto*(candela)'), ('f*s', 'femto*(second)'), ('f s', 'femto*(second)'), ('f*A', 'femto*(ampere)'), ('f A', 'femto*(ampere)'), ('f*K', 'femto*(kelvin)'), ('f K', 'femto*(kelvin)'), ('f*m', 'femto*(metre)'), ('f m', 'femto*(metre)'), ('f*g', 'femto*(gram)'), ('f g', 'femto*(gram)'), ('fBq', 'femto*(becquerel)'), ('f*C', 'femto*(coulomb)'), ('f C', 'femto*(coulomb)'), ('f*S', 'femto*(siemens)'), ('f S', 'femto*(siemens)'), ('fSv', 'femto*(sievert)'), ('f*N', 'femto*(newton)'), ('f N', 'femto*(newton)'), ('fPa', 'femto*(pascal)'), ('fHz', 'femto*(hertz)'), ('f*J', 'femto*(joule)'), ('f J', 'femto*(joule)'), ('f*F', 'femto*(farad)'), ('f F', 'femto*(farad)'), ('fWb', 'femto*(weber)'), ('f*T', 'femto*(tesla)'), ('f T', 'femto*(tesla)'), ('f*H', 'femto*(henry)'), ('f H', 'femto*(henry)'), ('flm', 'femto*(lumen)'), ('f*W', 'femto*(watt)'), ('f W', 'femto*(watt)'), ('f*V', 'femto*(volt)'), ('f V', 'femto*(volt)'), ('fGy', 'femto*(gray)'), ('f*O', 'femto*(ohm)'), ('f O', 'femto*(ohm)'), ('flx', 'femto*(lux)'), ('f*u', 'femto*(atomicmassunit)'), ('f u', 'femto*(atomicmassunit)'), ('feV', 'femto*(electronvolt)'), ('fsr', 'femto*(steradian)'), ('f*t', 'femto*(metricton)'), ('f t', 'femto*(metricton)'), ('f*Å', 'femto*(angstrom)'), ('f Å', 'femto*(angstrom)'), ('f*r', 'femto*(radian)'), ('f r', 'femto*(radian)'), ('f*L', 'femto*(liter)'), ('f L', 'femto*(liter)'), ('fNp', 'femto*(neper)'), ('f*h', 'femto*(hour)'), ('f h', 'femto*(hour)'), ('f*B', 'femto*(bel)'), ('f B', 'femto*(bel)'), ('fqt', 'femto*(quart)'), ('foz', 'femto*(ounce)'), ('flb', 'femto*(pound)'), ('fst', 'femto*(stone)'), ('fin', 'femto*(inch)'), ('fft', 'femto*(foot)'), ('fyd', 'femto*(yard)'), ('fmi', 'femto*(mile)'), ('fgi', 'femto*(gill)'), ('fpt', 'femto*(pint)'), ('zcd', 'zepto*(candela)'), ('z*s', 'zepto*(second)'), ('z s', 'zepto*(second)'), ('z*A', 'zepto*(ampere)'), ('z A', 'zepto*(ampere)'), ('z*K', 'zepto*(kelvin)'), ('z K', 'zepto*(kelvin)'), ('z*m', 'zepto*(metre)'), ('z m', 'zepto*(metre)'), ('z*g', 'zepto*(gram)'), ('z g', 'zepto*(gram)'), ('zBq', 'zepto*(becquerel)'), ('z*C', 'zepto*(coulomb)'), ('z C', 'zepto*(coulomb)'), ('z*S', 'zepto*(siemens)'), ('z S', 'zepto*(siemens)'), ('zSv', 'zepto*(sievert)'), ('z*N', 'zepto*(newton)'), ('z N', 'zepto*(newton)'), ('zPa', 'zepto*(pascal)'), ('zHz', 'zepto*(hertz)'), ('z*J', 'zepto*(joule)'), ('z J', 'zepto*(joule)'), ('z*F', 'zepto*(farad)'), ('z F', 'zepto*(farad)'), ('zWb', 'zepto*(weber)'), ('z*T', 'zepto*(tesla)'), ('z T', 'zepto*(tesla)'), ('z*H', 'zepto*(henry)'), ('z H', 'zepto*(henry)'), ('zlm', 'zepto*(lumen)'), ('z*W', 'zepto*(watt)'), ('z W', 'zepto*(watt)'), ('z*V', 'zepto*(volt)'), ('z V', 'zepto*(volt)'), ('zGy', 'zepto*(gray)'), ('z*O', 'zepto*(ohm)'), ('z O', 'zepto*(ohm)'), ('zlx', 'zepto*(lux)'), ('z*u', 'zepto*(atomicmassunit)'), ('z u', 'zepto*(atomicmassunit)'), ('zeV', 'zepto*(electronvolt)'), ('zsr', 'zepto*(steradian)'), ('z*t', 'zepto*(metricton)'), ('z t', 'zepto*(metricton)'), ('z*Å', 'zepto*(angstrom)'), ('z Å', 'zepto*(angstrom)'), ('z*r', 'zepto*(radian)'), ('z r', 'zepto*(radian)'), ('z*L', 'zepto*(liter)'), ('z L', 'zepto*(liter)'), ('zNp', 'zepto*(neper)'), ('z*h', 'zepto*(hour)'), ('z h', 'zepto*(hour)'), ('z*B', 'zepto*(bel)'), ('z B', 'zepto*(bel)'), ('zqt', 'zepto*(quart)'), ('zoz', 'zepto*(ounce)'), ('zlb', 'zepto*(pound)'), ('zst', 'zepto*(stone)'), ('zin', 'zepto*(inch)'), ('zft', 'zepto*(foot)'), ('zyd', 'zepto*(yard)'), ('zmi', 'zepto*(mile)'), ('zgi', 'zepto*(gill)'), ('zpt', 'zepto*(pint)'), ('ycd', 'yocto*(candela)'), ('y*s', 'yocto*(second)'), ('y s', 'yocto*(second)'), ('y*A', 'yocto*(ampere)'), ('y A', 'yocto*(ampere)'), ('y*K', 'yocto*(kelvin)'), ('y K', 'yocto*(kelvin)'), ('y*m', 'yocto*(metre)'), ('y m', 'yocto*(metre)'), ('y*g', 'yocto*(gram)'), ('y g', 'yocto*(gram)'), ('yBq', 'yocto*(becquerel)'), ('y*C', 'yocto*(coulomb)'), ('y C', 'yocto*(coulomb)'), ('y*S', 'yocto*(siemens)'), ('y S', 'yocto*(siemens)'), ('ySv', 'yocto*(sievert)'), ('y*N', 'yocto*(newton)'), ('y N', 'yocto*(newton)'), ('yPa', 'yocto*(pascal)'), ('yHz', 'yocto*(hertz)'), ('y*J', 'yocto*(joule)'), ('y J', 'yocto*(joule)'), ('y*F', 'yocto*(farad)'), ('y F', 'yocto*(farad)'), ('yWb', 'yocto*(weber)'), ('y*T', 'yocto*(tesla)'), ('y T', 'yocto*(tesla)'), ('y*H', 'yocto*(henry)'), ('y H', 'yocto*(henry)'), ('ylm', 'yocto*(lumen)'), ('y*W', 'yocto*(watt)'), ('y W', 'yocto*(watt)'), ('y*V', 'yocto*(volt)'), ('y V', 'yocto*(volt)'), ('yGy', 'yocto*(gray)'), ('y*O', 'yocto*(ohm)'), ('y O', 'yocto*(ohm)'), ('ylx', 'yocto*(lux)'), ('y*u', 'yocto*(atomicmassunit)'), ('y u', 'yocto*(atomicmassunit)'), ('yeV', 'yocto*(electronvolt)'), ('ysr', 'yocto*(steradian)'), ('y*t', 'yocto*(metricton)'), ('y t', 'yocto*(metricton)'), ('y*Å', 'yocto*(angstrom)'), ('y Å', 'yocto*(angstrom)'), ('y*r', 'yocto*(radian)'), ('y r', 'yocto*(radian)'), ('y*L', 'yocto*(liter)'), ('y L', 'yocto*(liter)'), ('yNp', 'yocto*(neper)'), ('y*h', 'yocto*(hour)'), ('y h', 'yocto*(hour)'), ('y*B', 'yocto*(bel)'), ('y B', 'yocto*(bel)'), ('yqt', 'yocto*(quart)'), ('yoz', 'yocto*(ounce)'), ('ylb', 'yocto*(pound)'), ('yst', 'yocto*(stone)'), ('yin', 'yocto*(inch)'), ('yft', 'yocto*(foot)'), ('yyd', 'yocto*(yard)'), ('ymi', 'yocto*(mile)'), ('ygi', 'yocto*(gill)'), ('ypt', 'yocto*(pint)'), ('Pcd', 'peta*(candela)'), ('P*s', 'peta*(second)'), ('P s', 'peta*(second)'), ('P*A', 'peta*(ampere)'), ('P A', 'peta*(ampere)'), ('P*K', 'peta*(kelvin)'), ('P K', 'peta*(kelvin)'), ('P*m', 'peta*(metre)'), ('P m', 'peta*(metre)'), ('P*g', 'peta*(gram)'), ('P g', 'peta*(gram)'), ('PBq', 'peta*(becquerel)'), ('P*C', 'peta*(coulomb)'), ('P C', 'peta*(coulomb)'), ('P*S', 'peta*(siemens)'), ('P S', 'peta*(siemens)'), ('PSv', 'peta*(sievert)'), ('P*N', 'peta*(newton)'), ('P N', 'peta*(newton)'), ('PPa', 'peta*(pascal)'), ('PHz', 'peta*(hertz)'), ('P*J', 'peta*(joule)'), ('P J', 'peta*(joule)'), ('P*F', 'peta*(farad)'), ('P F', 'peta*(farad)'), ('PWb', 'peta*(weber)'), ('P*T', 'peta*(tesla)'), ('P T', 'peta*(tesla)'), ('P*H', 'peta*(henry)'), ('P H', 'peta*(henry)'), ('Plm', 'peta*(lumen)'), ('P*W', 'peta*(watt)'), ('P W', 'peta*(watt)'), ('P*V', 'peta*(volt)'), ('P V', 'peta*(volt)'), ('PGy', 'peta*(gray)'), ('P*O', 'peta*(ohm)'), ('P O', 'peta*(ohm)'), ('Plx', 'peta*(lux)'), ('P*u', 'peta*(atomicmassunit)'), ('P u', 'peta*(atomicmassunit)'), ('PeV', 'peta*(electronvolt)'), ('Psr', 'peta*(steradian)'), ('P*t', 'peta*(metricton)'), ('P t', 'peta*(metricton)'), ('P*Å', 'peta*(angstrom)'), ('P Å', 'peta*(angstrom)'), ('P*r', 'peta*(radian)'), ('P r', 'peta*(radian)'), ('P*L', 'peta*(liter)'), ('P L', 'peta*(liter)'), ('PNp', 'peta*(neper)'), ('P*h', 'peta*(hour)'), ('P h', 'peta*(hour)'), ('P*B', 'peta*(bel)'), ('P B', 'peta*(bel)'), ('Pqt', 'peta*(quart)'), ('Poz', 'peta*(ounce)'), ('Plb', 'peta*(pound)'), ('Pst', 'peta*(stone)'), ('Pin', 'peta*(inch)'), ('Pft', 'peta*(foot)'), ('Pyd', 'peta*(yard)'), ('Pmi', 'peta*(mile)'), ('Pgi', 'peta*(gill)'), ('Ppt', 'peta*(pint)'), ('Tcd', 'tera*(candela)'), ('T*s', 'tera*(second)'), ('T s', 'tera*(second)'), ('T*A', 'tera*(ampere)'), ('T A', 'tera*(ampere)'), ('T*K', 'tera*(kelvin)'), ('T K', 'tera*(kelvin)'), ('T*m', 'tera*(metre)'), ('T m', 'tera*(metre)'), ('T*g', 'tera*(gram)'), ('T g', 'tera*(gram)'), ('TBq', 'tera*(becquerel)'), ('T*C', 'tera*(coulomb)'), ('T C', 'tera*(coulomb)'), ('T*S', 'tera*(siemens)'), ('T S', 'tera*(siemens)'), ('TSv', 'tera*(sievert)'), ('T*N', 'tera*(newton)'), ('T N', 'tera*(newton)'), ('TPa', 'tera*(pascal)'), ('THz', 'tera*(hertz)'), ('T*J', 'tera*(joule)'), ('T J', 'tera*(joule)'), ('T*F', 'tera*(farad)'), ('T F', 'tera*(farad)'), ('TWb', 'tera*(weber)'), ('T*T', 'tera*(tesla)'), ('T T', 'tera*(tesla)'), ('T*H', 'tera*(henry)'), ('T H', 'tera*(henry)'), ('Tlm', 'tera*(lumen)'), ('T*W', 'tera*(watt)'), ('T W', 'tera*(watt)'), ('T*V', 'tera*(volt)'), ('T V', 'tera*(volt)'), ('TGy', 'tera*(gray)'), ('T*O', 'tera*(ohm)'), ('T O', 'tera*(ohm)'), ('Tlx', 'tera*(lux)'), ('T*u', 'tera*(atomicmassunit)'), ('T u', 'tera*(atomicmassunit)'), ('TeV', 'tera*(electronvolt)'), ('Tsr', 'tera*(steradian)'), ('T*t', 'tera*(metricton)'), ('T t', 'tera*(metricton)'), ('T*Å', 'tera*(angstrom)'), ('T Å', 'tera*(angstrom)'), ('T*r', 'tera*(radian)'), ('T r', 'tera*(radian)'), ('T*L', 'tera*(liter)'), ('T L', 'tera*(liter)'), ('TNp', 'tera*(neper)'), ('T*h', 'tera*(hour)'), ('T h', 'tera*(hour)'), ('T*B', 'tera*(bel)'), ('T B', 'tera*(bel)'), ('Tqt', 'tera*(quart)'), ('Toz', 'tera*(ounce)'), ('Tlb', 'tera*(pound)'), ('Tst', 'tera*(stone)'), ('Tin', 'tera*(inch)'), ('Tft', 'tera*(foot)'), ('Tyd', 'tera*(yard)'), ('Tmi', 'tera*(mile)'), ('Tgi', 'tera*(gill)'), ('Tpt', 'tera*(pint)'), ('Gcd', 'giga*(candela)'), ('G*s', 'giga*(second)'), ('G s', 'giga*(second)'), ('G*A', 'giga*(ampere)'), ('G A', 'giga*(ampere)'), ('G*K', 'giga*(kelvin)'), ('G K', 'giga*(kelvin)'), ('G*m', 'giga*(metre)'), ('G m', 'giga*(metre)'), ('G*g', 'giga*(gram)'), ('G g', 'giga*(gram)'), ('GBq', 'giga*(becquerel)'), ('G*C', 'giga*(coulomb)'), ('G C', 'giga*(coulomb)'), ('G*S', 'giga*(siemens)'), ('G S', 'giga*(siemens)'), ('GSv', 'giga*(sievert)'), ('G*N', 'giga*(newton)'), ('G N', 'giga*(newton)'), ('GPa', 'giga*(pascal)'), ('GHz', 'giga*(hertz)'), ('G*J', 'giga*(joule)'), ('G J', 'giga*(joule)'), ('G*F', 'giga*(farad)'), ('G F', 'giga*(farad)'), ('GWb', 'giga*(weber)'), ('G*T', 'giga*(tesla)'), ('G T', 'giga*(tesla)'), ('G*H', 'giga*(henry)'), ('G H', 'giga*(henry)'), ('Glm', 'giga*(lumen)'), ('G*W', 'giga*(watt)'), ('G W', 'giga*(watt)'), ('G*V', 'giga*(volt)'), ('G V', 'giga*(volt)'), ('GGy', 'giga*(gray)'), ('G*O', 'giga*(ohm)'), ('G O', 'giga*(ohm)'), ('Glx', 'giga*(lux)'), ('G*u', 'giga*(atomicmassunit)'), ('G u', 'giga*(atomicmassunit)'), ('GeV', 'giga*(electronvolt)'), ('Gsr', 'giga*(steradian)'), ('G*t', 'giga*(metricton)'), ('G t', 'giga*(metricton)'), ('G*Å', 'giga*(angstrom)'), ('G Å', 'giga*(angstrom)'), ('G*r', 'giga*(radian)'), ('G r', 'giga*(radian)'), ('G*L', 'giga*(liter)'), ('G L', 'giga*(liter)'), ('GNp', 'giga*(neper)'), ('G*h', 'giga*(hour)'), ('G h', 'giga*(hour)'), ('G*B', 'giga*(bel)'), ('G B', 'giga*(bel)'), ('Gqt', 'giga*(quart)'), ('Goz', 'giga*(ounce)'), ('Glb', 'giga*(pound)'), ('Gst', 'giga*(stone)'), ('Gin', 'giga*(inch)'), ('Gft', 'giga*(foot)'), ('Gyd', 'giga*(yard)'), ('Gmi', 'giga*(mile)'), ('Ggi', 'giga*(gill)'), ('Gpt', 'giga*(pint)'), ('Mcd', 'mega*(candela)'), ('M*s', 'mega*(second)'), ('M s', 'mega*(second)'), ('M*A', 'mega*(ampere)'), ('M A', 'mega*(ampere)'), ('M*K', 'mega*(kelvin)'), ('M K', 'mega*(kelvin)'), ('M*m', 'mega*(metre)'), ('M m', 'mega*(metre)'), ('M*g', 'mega*(gram)'), ('M g', 'mega*(gram)'), ('MBq', 'mega*(becquerel)'), ('M*C', 'mega*(coulomb)'), ('M C', 'mega*(coulomb)'), ('M*S', 'mega*(siemens)'), ('M S', 'mega*(siemens)'), ('MSv', 'mega*(sievert)'), ('M*N', 'mega*(newton)'), ('M N', 'mega*(newton)'), ('MPa', 'mega*(pascal)'), ('MHz', 'mega*(hertz)'), ('M*J', 'mega*(joule)'), ('M J', 'mega*(joule)'), ('M*F', 'mega*(farad)'), ('M F', 'mega*(farad)'), ('MWb', 'mega*(weber)'), ('M*T', 'mega*(tesla)'), ('M T', 'mega*(tesla)'), ('M*H', 'mega*(henry)'), ('M H', 'mega*(henry)'), ('Mlm', 'mega*(lumen)'), ('M*W', 'mega*(watt)'), ('M W', 'mega*(watt)'), ('M*V', 'mega*(volt)'), ('M V', 'mega*(volt)'), ('MGy', 'mega*(gray)'), ('M*O', 'mega*(ohm)'), ('M O', 'mega*(ohm)'), ('Mlx', 'mega*(lux)'), ('M*u', 'mega*(atomicmassunit)'), ('M u', 'mega*(atomicmassunit)'), ('MeV', 'mega*(electronvolt)'), ('Msr', 'mega*(steradian)'), ('M*t', 'mega*(metricton)'), ('M t', 'mega*(metricton)'), ('M*Å', 'mega*(angstrom)'), ('M Å', 'mega*(angstrom)'), ('M*r', 'mega*(radian)'), ('M r', 'mega*(radian)'), ('M*L', 'mega*(liter)'), ('M L', 'mega*(liter)'), ('MNp', 'mega*(neper)'), ('M*h', 'mega*(hour)'), ('M h', 'mega*(hour)'), ('M*B', 'mega*(bel)'), ('M B', 'mega*(bel)'), ('Mqt', 'mega*(quart)'), ('Moz', 'mega*(ounce)'), ('Mlb', 'mega*(pound)'), ('Mst', 'mega*(stone)'), ('Min', 'mega*(inch)'), ('Mft', 'mega*(foot)'), ('Myd', 'mega*(yard)'), ('Mmi', 'mega*(mile)'), ('Mgi', 'mega*(gill)'), ('Mpt', 'mega*(pint)'), ('kcd', 'kilo*(candela)'), ('k*s', 'kilo*(second)'), ('k s', 'kilo*(second)'), ('k*A', 'kilo*(ampere)'), ('k A', 'kilo*(ampere)'), ('k*K', 'kilo*(kelvin)'), ('k K', 'kilo*(kelvin)'), ('k*m', 'kilo*(metre)'), ('k m', 'kilo*(metre)'), ('k*g', 'kilo*(gram)'), ('k g', 'kilo*(gram)'), ('kBq', 'kilo*(becquerel)'), ('k*C', 'kilo*(coulomb)'), ('k C', 'kilo*(coulomb)'), ('k*S', 'kilo*(siemens)'), ('k S', 'kilo*(siemens)'), ('kSv', 'kilo*(sievert)'), ('k*N', 'kilo*(newton)'), ('k N', 'kilo*(newton)'), ('kPa', 'kilo*(pascal)'), ('kHz', 'kilo*(hertz)'), ('k*J', 'kilo*(joule)'), ('k J', 'kilo*(joule)'), ('k*F', 'kilo*(farad)'), ('k F', 'kilo*(farad)'), ('kWb', 'kilo*(weber)'), ('k*T', 'kilo*(tesla)'), ('k T', 'kilo*(tesla)'), ('k*H', 'kilo*(henry)'), ('k H', 'kilo*(henry)'), ('klm', 'kilo*(lumen)'), ('k*W', 'kilo*(watt)'), ('k W', 'kilo*(watt)'), ('k*V', 'kilo*(volt)'), ('k V', 'kilo*(volt)'), ('kGy', 'kilo*(gray)'), ('k*O', 'kilo*(ohm)'), ('k O', 'kilo*(ohm)'), ('klx', 'kilo*(lux)'), ('k*u', 'kilo*(atomicmassunit)'), ('k u', 'kilo*(atomicmassunit)'), ('keV', 'kilo*(electronvolt)'), ('ksr', 'kilo*(steradian)'), ('k*t', 'kilo*(metricton)'), ('k t', 'kilo*(metricton)'), ('k*Å', 'kilo*(angstrom)'), ('k Å', 'kilo*(angstrom)'), ('k*r', 'kilo*(radian)'), ('k r', 'kilo*(radian)'), ('k*L', 'kilo*(liter)'), ('k L', 'kilo*(liter)'), ('kNp', 'kilo*(neper)'), ('k*h', 'kilo*(hour)'), ('k h', 'kilo*(hour)'), ('k*B', 'kilo*(bel)'), ('k B', 'kilo*(bel)'), ('kqt', 'kilo*(quart)'), ('koz', 'kilo*(ounce)'), ('klb', 'kilo*(pound)'), ('kst', 'kilo*(stone)'), ('kin', 'kilo*(inch)'), ('kft', 'kilo*(foot)'), ('kyd', 'kilo*(yard)'), ('kmi', 'kilo*(mile)'), ('kgi', 'kilo*(gill)'), ('kpt', 'kilo*(pint)'), ('das', 'deka*(second)'), ('daA', 'deka*(ampere)'), ('daK', 'deka*(kelvin)'), ('dam', 'deka*(metre)'), ('dag', 'deka*(gram)'), ('daC', 'deka*(coulomb)'), ('daS', 'deka*(siemens)'), ('daN', 'deka*(newton)'), ('daJ', 'deka*(joule)'), ('daF', 'deka*(farad)'), ('daT', 'deka*(tesla)'), ('daH', 'deka*(henry)'), ('daW', 'deka*(watt)'), ('daV', 'deka*(volt)'), ('daO', 'deka*(ohm)'), ('dau', 'deka*(atomicmassunit)'), ('dat', 'deka*(metricton)'), ('daÅ', 'deka*(angstrom)'), ('dar', 'deka*(radian)'), ('daL', 'deka*(liter)'), ('dah', 'deka*(hour)'), ('daB', 'deka*(bel)'), ('dcd', 'deci*(candela)'), ('d*s', 'deci*(second)'), ('d s', 'deci*(second)'), ('d*A', 'deci*(ampere)'), ('d A', 'deci*(ampere)'), ('d*K', 'deci*(kelvin)'), ('d K', 'deci*(kelvin)'), ('d*m', 'deci*(metre)'), ('d m', 'deci*(metre)'), ('d*g', 'deci*(gram)'), ('d g', 'deci*(gram)'), ('dBq', 'deci*(becquerel)'), ('d*C', 'deci*(coulomb)'), ('d C', 'deci*(coulomb)'), ('d*S', 'deci*(siemens)'), ('d S', 'deci*(siemens)'), ('dSv', 'deci*(sievert)'), ('d*N', 'deci*(newton)'), ('d N', 'deci*(newton)'), ('dPa', 'deci*(pascal)'), ('dHz', 'deci*(hertz)'), ('d*J', 'deci*(joule)'), ('d J', 'deci*(joule)'), ('d*F', 'deci*(farad)'), ('d F', 'deci*(farad)'), ('dWb', 'deci*(weber)'), ('d*T', 'deci*(tesla)'), ('d T', 'deci*(tesla)'), ('d*H', 'deci*(henry)'), ('d H', 'deci*(henry)'), ('dlm', 'deci*(lumen)'), ('d*W', 'deci*(watt)'), ('d W', 'deci*(watt)'), ('d*V', 'deci*(volt)'), ('d V', 'deci*(volt)'), ('dGy', 'deci*(gray)'), ('d*O', 'deci*(ohm)'), ('d O', 'deci*(ohm)'), ('dlx', 'deci*(lux)'), ('d*u', 'deci*(atomicmassunit)'), ('d u', 'deci*(atomicmassunit)'), ('deV', 'deci*(electronvolt)'), ('dsr', 'deci*(steradian)'), ('d*t', 'deci*(metricton)'), ('d t', 'deci*(metricton)'), ('d*Å', 'deci*(angstrom)'), ('d Å', 'deci*(angstrom)'), ('d*r', 'deci*(radian)'), ('d r', 'deci*(radian)'), ('d*L', 'deci*(liter)'), ('d L', 'deci*(liter)'), ('dNp', 'deci*(neper)'), ('d*h', 'deci*(hour)'), ('d h', 'deci*(hour)'), ('d*B', 'deci*(bel)'), ('d B', 'deci*(bel)'), ('dqt', 'deci*(quart)'), ('doz', 'deci*(ounce)'), ('dlb', 'deci*(pound)'), ('dst', 'deci*(stone)'), ('din', 'deci*(inch)'), ('dft', 'deci*(foot)'), ('dyd', 'deci*(yard)'), ('dmi', 'deci*(mile)'), ('dgi', 'deci*(gill)'), ('dpt', 'deci*(pint)'), ('ncd', 'nano*(candela)'), ('n*s', 'nano*(second)'), ('n s', 'nano*(second)'), ('n*A', 'nano*(ampere)'), ('n A', 'nano*(ampere)'), ('n*K', 'nano*(kelvin)'), ('n K', 'nano*(kelvin)'), ('n*m', 'nano*(metre)'), ('n m', 'nano*(metre)'), ('n*g', 'nano*(gram)'), ('n g', 'nano*(gram)'), ('nBq', 'nano*(becquerel)'), ('n*C', 'nano*(coulomb)'), ('n C', 'nano*(coulomb)'), ('n*S', 'nano*(siemens)'), ('n S', 'nano*(siemens)'), ('nSv', 'nano*(sievert)'), ('n*N', 'nano*(newton)'), ('n N', 'nano*(newton)'), ('nPa', 'nano*(pascal)'), ('nHz', 'nano*(hertz)'), ('n*J', 'nano*(joule)'), ('n J', 'nano*(joule)'), ('n*F', 'nano*(farad)'), ('n F', 'nano*(farad)'), ('nWb', 'nano*(weber)'), ('n*T', 'nano*(tesla)'), ('n T', 'nano*(tesla)'), ('n*H', 'nano*(henry)'), ('n H', 'nano*(henry)'), ('nlm', 'nano*(lumen)'), ('n*W', 'nano*(watt)'), ('n W', 'nano*(watt)'), ('n*V', 'nano*(volt)'), ('n V', 'nano*(volt)'), ('nGy', 'nano*(gray)'), ('n*O', 'nano*(ohm)'), ('n O', 'nano*(ohm)'), ('nlx', 'nano*(lux)'), ('n*u', 'nano*(atomicmassunit)'), ('n u', 'nano*(atomicmassunit)'), ('neV', 'nano*(electronvolt)'), ('nsr', 'nano*(steradian)'), ('n*t', 'nano*(metricton)'), ('n t', 'nano*(metricton)'), ('n*Å', 'nano*(angstrom)'), ('n Å', 'nano*(angstrom)'), ('n*r', 'nano*(radian)'), ('n r', 'nano*(radian)'), ('n*L', 'nano*(liter)'), ('n L', 'nano*(liter)'), ('nNp', 'nano*(neper)'), ('n*h', 'nano*(hour)'), ('n h', 'nano*(hour)'), ('n*B', 'nano*(bel)'), ('n B', 'nano*(bel)'), ('nqt', 'nano*(quart)'), ('noz', 'nano*(ounce)'), ('nlb', 'nano*(pound)'), ('nst', 'nano*(stone)'), ('nin', 'nano*(inch)'), ('nft', 'nano*(foot)'), ('nyd', 'nano*(yard)'), ('nmi', 'nano*(mile)'), ('ngi', 'nano*(gill)'), ('npt', 'nano*(pint)'), ('pcd', 'pico*(candela)'), ('p*s', 'pico*(second)'), ('p s', 'pico*(second)'), ('p*A', 'pico*(ampere)'), ('p A', 'pico*(ampere)'), ('p*K', 'pico*(kelvin)'), ('p K', 'pico*(kelvin)'), ('p*m', 'pico*(metre)'), ('p m', 'pico*(metre)'), ('p*g', 'pico*(gram)'), ('p g', 'pico*(gram)'), ('pBq', 'pico*(becquerel)'), ('p*C', 'pico*(coulomb)'), ('p C', 'pico*(coulomb)'), ('p*S', 'pico*(siemens)'), ('p S', 'pico*(siemens)'), ('pSv', 'pico*(sievert)'), ('p*N', 'pico*(newton)'), ('p N', 'pico*(newton)'), ('pPa', 'pico*(pascal)'), ('pHz', 'pico*(hertz)'), ('p*J', 'pico*(joule)'), ('p J', 'pico*(joule)'), ('p*F', 'pico*(farad)'), ('p F', 'pico*(farad)'), ('pWb', 'pico*(weber)'), ('p*T', 'pico*(tesla)'), ('p T', 'pico*(tesla)'), ('p*H', 'pico*(henry)'), ('p H', 'pico*(henry)'), ('plm', 'pico*(lumen)'), ('p*W', 'pico*(watt)'), ('p W', 'pico*(watt)'), ('p*V', 'pico*(volt)'), ('p V', 'pico*(volt)'), ('pGy', 'pico*(gray)'), ('p*O', 'pico*(ohm)'), ('p O', 'pico*(ohm)'), ('plx', 'pico*(lux)'), ('p*u', 'pico*(atomicmassunit)'), ('p u', 'pico*(atomicmassunit)'), ('peV', 'pico*(electronvolt)'), ('psr', 'pico*(steradian)'), ('p*t', 'pico*(metricton)'), ('p t', 'pico*(metricton)'), ('p*Å', 'pico*(angstrom)'), ('p Å', 'pico*(angstrom)'), ('p*r', 'pico*(radian)'), ('p r', 'pico*(radian)'), ('p*L', 'pico*(liter)'), ('p L', 'pico*(liter)'), ('pNp', 'pico*(neper)'), ('p*h', 'pico*(hour)'), ('p h', 'pico*(hour)'), ('p*B', 'pico*(bel)'), ('p B', 'pico*(bel)'), ('pqt', 'pico*(quart)'), ('poz', 'pico*(ounce)'), ('plb', 'pico*(pound)'), ('pst', 'pico*(stone)'), ('pin', 'pico*(inch)'), ('pft', 'pico*(foot)'), ('pyd', 'pico*(yard)'), ('pmi', 'pico*(mile)'), ('pgi', 'pico*(gill)'), ('ppt', 'pico*(pint)'), ('acd', 'atto*(candela)'), ('a*s', 'atto*(second)'), ('a s', 'atto*(second)'), ('a*A', 'atto*(ampere)'), ('a A', 'atto*(ampere)'), ('a*K', 'atto*(kelvin)'), ('a K', 'atto*(kelvin)'), ('a*m', 'atto*(metre)'), ('a m', 'atto*(metre)'), ('a*g', 'atto*(gram)'), ('a g', 'atto*(gram)'), ('aBq', 'atto*(becquerel)'), ('a*C', 'atto*(coulomb)'), ('a C', 'atto*(coulomb)'), ('a*S', 'atto*(siemens)'), ('a S', 'atto*(siemens)'), ('aSv', 'atto*(sievert)'), ('a*N', 'atto*(newton)'), ('a N', 'atto*(newton)'), ('aPa', 'atto*(pascal)'), ('aHz', 'atto*(hertz)'), ('a*J', 'atto*(joule)'), ('a J', 'atto*(joule)'), ('a*F', 'atto*(farad)'), ('a F', 'atto*(farad)'), ('aWb', 'atto*(weber)'), ('a*T', 'atto*(tesla)'), ('a T', 'atto*(tesla)'), ('a*H', 'atto*(henry)'), ('a H', 'atto*(henry)'), ('alm', 'atto*(lumen)'), ('a*W', 'atto*(watt)'), ('a W', 'atto*(watt)'), ('a*V', 'atto*(volt)'), ('a V', 'atto*(volt)'), ('aGy', 'atto*(gray)'), ('a*O', 'atto*(ohm)'), ('a O', 'atto*(ohm)'), ('alx', 'atto*(lux)'), ('a*u', 'atto*(atomicmassunit)'), ('a u', 'atto*(atomicmassunit)'), ('aeV', 'atto*(electronvolt)'), ('asr', 'atto*(steradian)'), ('a*t', 'atto*(metricton)'), ('a t', 'atto*(metricton)'), ('a*Å', 'atto*(angstrom)'), ('a Å', 'atto*(angstrom)'), ('a*r', 'atto*(radian)'), ('a r', 'atto*(radian)'), ('a*L', 'atto*(liter)'), ('a L', 'atto*(liter)'), ('aNp', 'atto*(neper)'), ('a*h', 'atto*(hour)'), ('a h', 'atto*(hour)'), ('a*B', 'atto*(bel)'), ('a B', 'atto*(bel)'), ('aqt', 'atto*(quart)'), ('aoz', 'atto*(ounce)'), ('alb', 'atto*(pound)'), ('ast', 'atto*(stone)'), ('ain', 'atto*(inch)'), ('aft', 'atto*(foot)'), ('ayd', 'atto*(yard)'), ('ami', 'atto*(mile)'), ('agi', 'atto*(gill)'), ('apt', 'atto*(pint)'), ('Ecd', 'exa*(candela)'), ('E*s', 'exa*(second)'), ('E s', 'exa*(second)'), ('E*A', 'exa*(ampere)'), ('E A', 'exa*(ampere)'), ('E*K', 'exa*(kelvin)'), ('E K', 'exa*(kelvin)'), ('E*m', 'exa*(metre)'), ('E m', 'exa*(metre)'), ('E*g', 'exa*(gram)'), ('E g', 'exa*(gram)'), ('EBq', 'exa*(becquerel)'), ('E*C', 'exa*(coulomb)'), ('E C', 'exa*(coulomb)'), ('E*S', 'exa*(siemens)'), ('E S', 'exa*(siemens)'), ('ESv', 'exa*(sievert)'), ('E*N', 'exa*(newton)'), ('E N', 'exa*(newton)'), ('EPa', 'exa*(pascal)'), ('EHz', 'exa*(hertz)'), ('E*J', 'exa*(joule)'), ('E J', 'exa*(joule)'), ('E*F', 'exa*(farad)'), ('E F', 'exa*(farad)'), ('EWb', 'exa*(weber)'), ('E*T', 'exa*(tesla)'), ('E T', 'exa*(tesla)'), ('E*H', 'exa*(henry)'), ('E H', 'exa*(henry)'), ('Elm', 'exa*(lumen)'), ('E*W', 'exa*(watt)'), ('E W', 'exa*(watt)'), ('E*V', 'exa*(volt)'), ('E V', 'exa*(volt)'), ('EGy', 'exa*(gray)'), ('E*O', 'exa*(ohm)'), ('E O', 'exa*(ohm)'), ('Elx', 'exa*(lux)'), ('E*u', 'exa*(atomicmassunit)'), ('E u', 'exa*(atomicmassunit)'), ('EeV', 'exa*(electronvolt)'), ('Esr', 'exa*(steradian)'), ('E*t', 'exa*(metricton)'), ('E t', 'exa*(metricton)'), ('E*Å', 'exa*(angstrom)'), ('E Å', 'exa*(angstrom)'), ('E*r', 'exa*(radian)'), ('E r', 'exa*(radian)'), ('E*L', 'exa*(liter)'), ('E L', 'exa*(liter)'), ('ENp', 'exa*(neper)'), ('E*h', 'exa*(hour)'), ('E h', 'exa*(hour)'), ('E*B', 'exa*(bel)'), ('E B', 'exa*(bel)'), ('Eqt', 'exa*(quart)'), ('Eoz', 'exa*(ounce)'), ('Elb', 'exa*(pound)'), ('Est', 'exa*(stone)'), ('Ein', 'exa*(inch)'), ('Eft', 'exa*(foot)'), ('Eyd', 'exa*(yard)'), ('Emi', 'exa*(mile)'), ('Egi', 'exa*(gill)'), ('Ept', 'exa*(pint)'), ('ft', 'foot'), ('pt', 'pint'), ('Ys', 'yotta*(second)'), ('YA', 'yotta*(ampere)'), ('YK', 'yotta*(kelvin)'), ('Ym', 'yotta*(metre)'), ('Yg', 'yotta*(gram)'), ('YC', 'yotta*(coulomb)'), ('YS', 'yotta*(siemens)'), ('YN', 'yotta*(newton)'), ('YJ', 'yotta*(joule)'), ('YF', 'yotta*(farad)'), ('YT', 'yotta*(tesla)'), ('YH', 'yotta*(henry)'), ('YW', 'yotta*(watt)'), ('YV', 'yotta*(volt)'), ('YO', 'yotta*(ohm)'), ('Yu', 'yotta*(atomicmassunit)'), ('Yt', 'yotta*(metricton)'), ('YÅ', 'yotta*(angstrom)'), ('Yr', 'yotta*(radian)'), ('YL', 'yotta*(liter)'), ('Yh', 'yotta*(hour)'), ('YB', 'yotta*(bel)'), ('Zs', 'zetta*(second)'), ('ZA', 'zetta*(ampere)'), ('ZK', 'zetta*(kelvin)'), ('Zm', 'zetta*(metre)'), ('Zg', 'zetta*(gram)'), ('ZC', 'zetta*(coulomb)'), ('ZS', 'zetta*(siemens)'), ('ZN', 'zetta*(newton)'), ('ZJ', 'zetta*(joule)'), ('ZF', 'zetta*(farad)'), ('ZT', 'zetta*(tesla)'), ('ZH', 'zetta*(henry)'), ('ZW', 'zetta*(watt)'), ('ZV', 'zetta*(volt)'), ('ZO', 'zetta*(ohm)'), ('Zu', 'zetta*(atomicmassunit)'), ('Zt', 'zetta*(metricton)'), ('ZÅ', 'zetta*(angstrom)'), ('Zr', 'zetta*(radian)'), ('ZL', 'zetta*(liter)'), ('Zh', 'zetta*(hour)'), ('ZB', 'zetta*(bel)'), ('hs', 'hecto*(second)'), ('hA', 'hecto*(ampere)'), ('hK', 'hecto*(kelvin)'), ('hm', 'hecto*(metre)'), ('hg', 'hecto*(gram)'), ('hC', 'hecto*(coulomb)'), ('hS', 'hecto*(siemens)'), ('hN', 'hecto*(newton)'), ('hJ', 'hecto*(joule)'), ('hF', 'hecto*(farad)'), ('hT', 'hecto*(tesla)'), ('hH', 'hecto*(henry)'), ('hW', 'hecto*(watt)'), ('hV', 'hecto*(volt)'), ('hO', 'hecto*(ohm)'), ('hu', 'hecto*(atomicmassunit)'), ('ht', 'hecto*(metricton)'), ('hÅ', 'hecto*(angstrom)'), ('hr', 'hecto*(radian)'), ('hL', 'hecto*(liter)'), ('hh', 'hecto*(hour)'), ('hB', 'hecto*(bel)'), ('cs', 'centi*(second)'), ('cA', 'centi*(ampere)'), ('cK', 'centi*(kelvin)'), ('cm', 'centi*(metre)'), ('cg', 'centi*(gram)'), ('cC', 'centi*(coulomb)'), ('cS', 'centi*(siemens)'), ('cN', 'centi*(newton)'), ('cJ', 'centi*(joule)'), ('cF', 'centi*(farad)'), ('cT', 'centi*(tesla)'), ('cH', 'centi*(henry)'), ('cW', 'centi*(watt)'), ('cV', 'centi*(volt)'), ('cO', 'centi*(ohm)'), ('cu', 'centi*(atomicmassunit)'), ('ct', 'centi*(metricton)'), ('cÅ', 'centi*(angstrom)'), ('cr', 'centi*(radian)'), ('cL', 'centi*(liter)'), ('ch', 'centi*(hour)'), ('cB', 'centi*(bel)'), ('ms', 'milli*(second)'), ('mA', 'milli*(ampere)'), ('mK', 'milli*(kelvin)'), ('mm', 'milli*(metre)'), ('mg', 'milli*(gram)'), ('mC', 'milli*(coulomb)'), ('mS', 'milli*(siemens)'), ('mN', 'milli*(newton)'), ('mJ', 'milli*(joule)'), ('mF', 'milli*(farad)'), ('mT', 'milli*(tesla)'), ('mH', 'milli*(henry)'), ('mW', 'milli*(watt)'), ('mV', 'milli*(volt)'), ('mO', 'milli*(ohm)'), ('mu', 'milli*(atomicmassunit)'), ('mt', 'milli*(metricton)'), ('mÅ', 'milli*(angstrom)'), ('mr', 'milli*(radian)'), ('mL', 'milli*(liter)'), ('mh', 'milli*(hour)'), ('mB', 'milli*(bel)'), ('fs', 'femto*(second)'), ('fA', 'femto*(ampere)'), ('fK', 'femto*(kelvin)'), ('fm', 'femto*(metre)'), ('fg', 'femto*(gram)'), ('fC', 'femto*(coulomb)'), ('fS', 'femto*(siemens)'), ('fN', 'femto*(newton)'), ('fJ', 'femto*(joule)'), ('fF', 'femto*(farad)'), ('fT', 'femto*(tesla)'), ('fH', 'femto*(henry)'), ('fW', 'femto*(watt)'), ('fV', 'femto*(volt)'), ('fO', 'femto*(ohm)'), ('fu', 'femto*(atomicmassunit)'), ('ft', 'femto*(metricton)'), ('fÅ', 'femto*(angstrom)'), ('fr', 'femto*(radian)'), ('fL', 'femto*(liter)'), ('fh', 'femto*(hour)'), ('fB', 'femto*(bel)'), ('zs', 'zepto*(second)'), ('zA', 'zepto*(ampere)'), ('zK', 'zepto*(kelvin)'), ('zm', 'zepto*(metre)'), ('zg', 'zepto*(gram)'), ('zC', 'zepto*(coulomb)'), ('zS', 'zepto*(siemens)'), ('zN', 'zepto*(newton)'), ('zJ', 'zepto*(joule)'), ('zF', 'zepto*(farad)'), ('zT', 'zepto*(tesla)'), ('zH', 'zepto*(henry)'), ('zW', 'zepto*(watt)'), ('zV', 'zepto*(volt)'), ('zO', 'zepto*(ohm)'), ('zu', 'zepto*(atomicmassunit)'), ('zt', 'zepto*(metricton)'), ('zÅ', 'zepto*(angstrom)'), ('zr', 'zepto*(radian)'), ('zL', 'zepto*(liter)'), ('zh', 'zepto*(hour)'), ('zB', 'zepto*(bel)'), ('ys', 'yocto*(second)'), ('yA', 'yocto*(ampere)'), ('yK', 'yocto*(kelvin)'), ('ym', 'yocto*(metre)'), ('yg', 'yocto*(gram)'), ('yC', 'yocto*(coulomb)'), ('yS', 'yocto*(siemens)'), ('yN', 'yocto*(newton)'), ('yJ', 'yocto*(joule)'), ('yF', 'yocto*(farad)'), ('yT', 'yocto*(tesla)'), ('yH', 'yocto*(henry)'), ('yW', 'yocto*(watt)'), ('yV', 'yocto*(volt)'), ('yO', 'yocto*(ohm)'), ('yu', 'yocto*(atomicmassunit)'), ('yt', 'yocto*(metricton)'), ('yÅ', 'yocto*(angstrom)'), ('yr', 'yocto*(radian)'), ('yL', 'yocto*(liter)'), ('yh', 'yocto*(hour)'), ('yB', 'yocto*(bel)'), ('Ps', 'peta*(second)'), ('PA', 'peta*(ampere)'), ('PK', 'peta*(kelvin)'), ('Pm', 'peta*(metre)'), ('Pg', 'peta*(gram)'), ('PC', 'peta*(coulomb)'), ('PS', 'peta*(siemens)'), ('PN', 'peta*(newton)'), ('PJ', 'peta*(joule)'), ('PF', 'peta*(farad)'), ('PT', 'peta*(tesla)'), ('PH', 'peta*(henry)'), ('PW', 'peta*(watt)'), ('PV', 'peta*(volt)'), ('PO', 'peta*(ohm)'), ('Pu', 'peta*(atomicmassunit)'), ('Pt', 'peta*(metricton)'), ('PÅ', 'peta*(angstrom)'), ('Pr', 'peta*(radian)'), ('PL', 'peta*(liter)'), ('Ph', 'peta*(hour)'), ('PB', 'peta*(bel)'), ('Ts', 'tera*(second)'), ('TA', 'tera*(ampere)'), ('TK', 'tera*(kelvin)'), ('Tm', 'tera*(metre)'), ('Tg', 'tera*(gram)'), ('TC', 'tera*(coulomb)'), ('TS', 'tera*(siemens)'), ('TN', 'tera*(newton)'), ('TJ', 'tera*(joule)'), ('TF', 'tera*(farad)'), ('TT', 'tera*(tesla)'), ('TH', 'tera*(henry)'), ('TW', 'tera*(watt)'), ('TV', 'tera*(volt)'), ('TO', 'tera*(ohm)'), ('Tu', 'tera*(atomicmassunit)'), ('Tt', 'tera*(metricton)'), ('TÅ', 'tera*(angstrom)'), ('Tr', 'tera*(radian)'), ('TL', 'tera*(liter)'), ('Th', 'tera*(hour)'), ('TB', 'tera*(bel)'), ('Gs', 'giga*(second)'), ('GA', 'giga*(ampere)'), ('GK', 'giga*(kelvin)'), ('Gm', 'giga*(metre)'), ('Gg', 'giga*(gram)'), ('GC', 'giga*(coulomb)'), ('GS', 'giga*(siemens)'), ('GN', 'giga*(newton)'), ('GJ', 'giga*(joule)'), ('GF', 'giga*(farad)'), ('GT', 'giga*(tesla)'), ('GH', 'giga*(henry)'), ('GW', 'giga*(watt)'), ('GV', 'giga*(volt)'), ('GO', 'giga*(ohm)'), ('Gu', 'giga*(atomicmassunit)'), ('Gt', 'giga*(metricton)'), ('GÅ', 'giga*(angstrom)'), ('Gr', 'giga*(radian)'), ('GL', 'giga*(liter)'), ('Gh', 'giga*(hour)'), ('GB', 'giga*(bel)'), ('Ms', 'mega*(second)'), ('MA', 'mega*(ampere)'), ('MK', 'mega*(kelvin)'), ('Mm', 'mega*(metre)'), ('Mg', 'mega*(gram)'), ('MC', 'mega*(coulomb)'), ('MS', 'mega*(siemens)'), ('MN', 'mega*(newton)'), ('MJ', 'mega*(joule)'), ('MF', 'mega*(farad)'), ('MT', 'mega*(tesla)'), ('MH', 'mega*(henry)'), ('MW', 'mega*(watt)'), ('MV', 'mega*(volt)'), ('MO', 'mega*(ohm)'), ('Mu', 'mega*(atomicmassunit)'), ('Mt', 'mega*(metricton)'), ('MÅ', 'mega*(angstrom)'), ('Mr', 'mega*(radian)'), ('ML', 'mega*(liter)'), ('Mh', 'mega*(hour)'), ('MB', 'mega*(bel)'), ('ks', 'kilo*(second)'), ('kA', 'kilo*(ampere)'), ('kK', 'kilo*(kelvin)'), ('km', 'kilo*(metre)'), ('kg', 'kilo*(gram)'), ('kC', 'kilo*(coulomb)'), ('kS', 'kilo*(siemens)'), ('kN', 'kilo*(newton)'), ('kJ', 'kilo*(joule)'), ('kF', 'kilo*(farad)'), ('kT', 'kilo*(tesla)'), ('kH', 'kilo*(henry)'), ('kW', 'kilo*(watt)'), ('kV', 'kilo*(volt)'), ('kO', 'kilo*(ohm)'), ('ku', 'kilo*(atomicmassunit)'), ('kt', 'kilo*(metricton)'), ('kÅ', 'kilo*(angstrom)'), ('kr', 'kilo*(radian)'), ('kL', 'kilo*(liter)'), ('kh', 'kilo*(hour)'), ('kB', 'kilo*(bel)'), ('ds', 'deci*(second)'), ('dA', 'deci*(ampere)'), ('dK', 'deci*(kelvin)'), ('dm', 'deci*(metre)'), ('dg', 'deci*(gram)'), ('dC', 'deci*(coulomb)'), ('dS', 'deci*(siemens)'), ('dN', 'deci*(newton)'), ('dJ', 'deci*(joule)'), ('dF', 'deci*(farad)'), ('dT', 'deci*(tesla)'), ('dH', 'deci*(henry)'), ('dW', 'deci*(watt)'), ('dV', 'deci*(volt)'), ('dO', 'deci*(ohm)'), ('du', 'deci*(atomicmassunit)'), ('dt', 'deci*(metricton)'), ('dÅ', 'deci*(angstrom)'), ('dr', 'deci*(radian)'), ('dL', 'deci*(liter)'), ('dh', 'deci*(hour)'), ('dB', 'deci*(bel)'), ('ns', 'nano*(second)'), ('nA', 'nano*(ampere)'), ('nK', 'nano*(kelvin)'), ('nm', 'nano*(metre)'), ('ng', 'nano*(gram)'), ('nC', 'nano*(coulomb)'), ('nS', 'nano*(siemens)'), ('nN', 'nano*(newton)'), ('nJ', 'nano*(joule)'), ('nF', 'nano*(farad)'), ('nT', 'nano*(tesla)'), ('nH', 'nano*(henry)'), ('nW', 'nano*(watt)'), ('nV', 'nano*(volt)'), ('nO', 'nano*(ohm)'), ('nu', 'nano*(atomicmassunit)'), ('nt', 'nano*(metricton)'), ('nÅ', 'nano*(angstrom)'), ('nr', 'nano*(radian)'), ('nL', 'nano*(liter)'), ('nh', 'nano*(hour)'), ('nB', 'nano*(bel)'), ('ps', 'pico*(second)'), ('pA', 'pico*(ampere)'), ('pK', 'pico*(kelvin)'), ('pm', 'pico*(metre)'), ('pg', 'pico*(gram)'), ('pC', 'pico*(coulomb)'), ('pS', 'pico*(siemens)'), ('pN', 'pico*(newton)'), ('pJ', 'pico*(joule)'), ('pF', 'pico*(farad)'), ('pT', 'pico*(tesla)'), ('pH', 'pico*(henry)'), ('pW', 'pico*(watt)'), ('pV', 'pico*(volt)'), ('pO', 'pico*(ohm)'), ('pu', 'pico*(atomicmassunit)'), ('pt', 'pico*(metricton)'), ('pÅ', 'pico*(angstrom)'), ('pr', 'pico*(radian)'), ('pL', 'pico*(liter)'), ('ph', 'pico*(hour)'), ('pB', 'pico*(bel)'), ('as', 'atto*(second)'), ('aA', 'atto*(ampere)'), ('aK', 'atto*(kelvin)'), ('am', 'atto*(metre)'), ('ag', 'atto*(gram)'), ('aC', 'atto*(coulomb)'), ('aS', 'atto*(siemens)'), ('aN', 'atto*(newton)'), ('aJ', 'atto*(joule)'), ('aF', 'atto*(farad)'), ('aT', 'atto*(tesla)'), ('aH', 'atto*(henry)'), ('aW', 'atto*(watt)'), ('aV', 'atto*(volt)'), ('aO', 'atto*(ohm)'), ('au', 'atto*(atomicmassunit)'), ('at', 'atto*(metricton)'), ('aÅ', 'atto*(angstrom)'), ('ar', 'atto*(radian)'), ('aL', 'atto*(liter)'), ('ah', 'atto*(hour)'), ('aB', 'atto*(bel)'), ('Es', 'exa*(second)'), ('EA', 'exa*(ampere)'), ('EK', 'exa*(kelvin)'), ('Em', 'exa*(metre)'), ('Eg', 'exa*(gram)'), ('EC', 'exa*(coulomb)'), ('ES', 'exa*(siemens)'), ('EN', 'exa*(newton)'), ('EJ', 'exa*(joule)'), ('EF', 'exa*(farad)'), ('ET', 'exa*(tesla)'), ('EH', 'exa*(henry)'), ('EW', 'exa*(watt)'), ('EV', 'exa*(volt)'), ('EO', 'exa*(ohm)'), ('Eu', 'exa*(atomicmassunit)'), ('Et', 'exa*(metricton)'), ('EÅ', 'exa*(angstrom)'), ('Er', 'exa*(radian)'), ('EL', 'exa*(liter)'), ('Eh', 'exa*(hour)'), ('EB', 'exa*(bel)'), ('fl oz', 'fluid ounce'), ('mol', 'mole'), ('kat', 'katal'), ('min', 'minute'), ('deg', 'degree'), ('gal', 'gallon'), ('cd', 'candela'), ('Bq', 'becquerel'), ('Sv', 'sievert'), ('Pa', 'pascal'), ('Hz', 'hertz'), ('Wb', 'weber'), ('lm', 'lumen'), ('Gy', 'gray'), ('lx', 'lux'), ('eV', 'electronvolt'), ('sr', 'steradian'), ('Np', 'neper'), ('qt', 'quart'), ('oz', 'ounce'), ('lb', 'pound'), ('st', 'stone'), ('in', 'inch'), ('ft', 'foot'), ('yd', 'yard'), ('mi', 'mile'), ('gi', 'gill'), ('pt', 'pint'), ('s', 'second'), ('A', 'ampere'), ('K', 'kelvin'), ('m', 'metre'), ('g', 'gram'), ('C', 'coulomb'), ('S', 'siemens'), ('N', 'newton'), ('J', 'joule'), ('F', 'farad'), ('T', 'tesla'), ('H', 'henry'), ('W', 'watt'), ('V', 'volt'), ('O', 'ohm'), ('u', 'atomicmassunit'), ('t', 'metricton'), ('Å', 'angstrom'), ('r', 'radian'), ('L', 'liter'), ('h', 'hour'), ('B', 'bel')]
+convert_alternative_names_to_standard=[(('astronomicalunits', [' ', '*', '/']), 'astronomicalunit'), (('atomicmassunits', [' ', '*', '/']), 'atomicmassunit'), (('nauticalmiles', [' ', '*', '/']), 'nauticalmile'), (('electronvolts', [' ', '*', '/']), 'electronvolt'), (('fluid ounces', [' ', '*', '/']), 'fluid ounce'), (('becquerels', [' ', '*', '/']), 'becquerel'), (('Becquerels', [' ', '*', '/']), 'becquerel'), (('steradians', [' ', '*', '/']), 'steradian'), ('Becquerel', 'becquerel'), (('roentgens', [' ', '*', '/']), 'roentgen'), (('Roentgens', [' ', '*', '/']), 'roentgen'), (('angstroms', [' ', '*', '/']), 'angstrom'), (('Angstroms', [' ', '*', '/']), 'angstrom'), (('candelas', [' ', '*', '/']), 'candela'), (('Candelas', [' ', '*', '/']), 'candela'), (('coulombs', [' ', '*', '/']), 'coulomb'), (('Coulombs', [' ', '*', '/']), 'coulomb'), (('sieverts', [' ', '*', '/']), 'sievert'), (('Sieverts', [' ', '*', '/']), 'sievert'), ('Roentgen', 'roentgen'), ('Angstrom', 'angstrom'), ('Ångström', 'angstrom'), (('hectares', [' ', '*', '/']), 'hectare'), ('Candela', 'candela'), (('seconds', [' ', '*', '/']), 'second'), (('amperes', [' ', '*', '/']), 'ampere'), (('Amperes', [' ', '*', '/']), 'ampere'), (('kelvins', [' ', '*', '/']), 'kelvin'), (('Kelvins', [' ', '*', '/']), 'kelvin'), ('Coulomb', 'coulomb'), (('Siemens', [' ', '*', '/']), 'siemens'), ('Sievert', 'sievert'), (('newtons', [' ', '*', '/']), 'newton'), (('Newtons', [' ', '*', '/']), 'newton'), (('pascals', [' ', '*', '/']), 'pascal'), (('Pascals', [' ', '*', '/']), 'pascal'), ('Röntgen', 'roentgen'), (('radians', [' ', '*', '/']), 'radian'), (('minutes', [' ', '*', '/']), 'minute'), (('degrees', [' ', '*', '/']), 'degree'), (('gallons', [' ', '*', '/']), 'gallon'), ('Ampere', 'ampere'), ('Kelvin', 'kelvin'), (('metres', [' ', '*', '/']), 'metre'), (('meters', [' ', '*', '/']), 'metre'), ('Newton', 'newton'), ('Pascal', 'pascal'), (('joules', [' ', '*', '/']), 'joule'), (('Joules', [' ', '*', '/']), 'joule'), (('farads', [' ', '*', '/']), 'farad'), (('Farads', [' ', '*', '/']), 'farad'), (('webers', [' ', '*', '/']), 'weber'), (('Webers', [' ', '*', '/']), 'weber'), (('teslas', [' ', '*', '/']), 'tesla'), (('Teslas', [' ', '*', '/']), 'tesla'), (('henrys', [' ', '*', '/']), 'henry'), (('Henrys', [' ', '*', '/']), 'henry'), (('lumens', [' ', '*', '/']), 'lumen'), (('katals', [' ', '*', '/']), 'katal'), (('Katals', [' ', '*', '/']), 'katal'), (('tonnes', [' ', '*', '/']), 'metricton'), (('curies', [' ', '*', '/']), 'curie'), (('liters', [' ', '*', '/']), 'liter'), (('litres', [' ', '*', '/']), 'liter'), (('nepers', [' ', '*', '/']), 'neper'), (('Nepers', [' ', '*', '/']), 'neper'), (('quarts', [' ', '*', '/']), 'quart'), (('ounces', [' ', '*', '/']), 'ounce'), (('pounds', [' ', '*', '/']), 'pound'), (('inches', [' ', '*', '/']), 'inch'), ('meter', 'metre'), (('grams', [' ', '*', '/']), 'gram'), (('moles', [' ', '*', '/']), 'mole'), ('Joule', 'joule'), ('Farad', 'farad'), ('Weber', 'weber'), ('Tesla', 'tesla'), ('Henry', 'henry'), ('Katal', 'katal'), (('watts', [' ', '*', '/']), 'watt'), (('Watts', [' ', '*', '/']), 'watt'), (('volts', [' ', '*', '/']), 'volt'), (('Volts', [' ', '*', '/']), 'volt'), (('grays', [' ', '*', '/']), 'gray'), (('Grays', [' ', '*', '/']), 'gray'), (('tonne', [' ', '*', '/']), 'metricton'), ('litre', 'liter'), ('Neper', 'neper'), (('knots', [' ', '*', '/']), 'knot'), (('barns', [' ', '*', '/']), 'barn'), (('hours', [' ', '*', '/']), 'hour'), (('yards', [' ', '*', '/']), 'yard'), (('miles', [' ', '*', '/']), 'mile'), (('gills', [' ', '*', '/']), 'gill'), (('pints', [' ', '*', '/']), 'pint'), ('Watt', 'watt'), ('Volt', 'volt'), ('Gray', 'gray'), (('ohms', [' ', '*', '/']), 'ohm'), (('Ohms', [' ', '*', '/']), 'ohm'), (('days', [' ', '*', '/']), 'day'), (('ares', [' ', '*', '/']), 'are'), (('bars', [' ', '*', '/']), 'bar'), (('rads', [' ', '*', '/']), 'rad'), (('rems', [' ', '*', '/']), 'rem'), (('bels', [' ', '*', '/']), 'bel'), (('Bels', [' ', '*', '/']), 'bel'), ('feet', 'foot'), ('Ohm', 'ohm'), ('Bel', 'bel')]
 convert_to_SI_base_units=[[('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('becquerel', '(second**(-1))'), ('coulomb', '(second*ampere)'), ('siemens', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)'), ('sievert', '(metre**2*second**(-2))'), ('newton', '(metre*kilo*gram*second**(-2))'), ('pascal', '(metre**(-1)*kilogram*second**(-2))'), ('hertz', '(second**(-1))'), ('joule', '(metre**2*kilo*gram*second**(-2))'), ('farad', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)'), ('weber', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))'), ('tesla', '(kilo*gram*second**(-2)*ampere**(-1))'), ('henry', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))'), ('lumen', '(candela)'), ('katal', '(second**(-1)*mole)'), ('watt', '(metre**2*kilo*gram*second**(-3))'), ('volt', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))'), ('gray', '(metre**2*second**(-2))'), ('ohm', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))'), ('lux', '(metre**(-2)*candela)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('fluid ounce', '(28.4130625*milli*litre)'), ('gallon', '(4546.09*litre)'), ('quart', '(1.1365225*litre)'), ('ounce', '(28.349523125*gram)'), ('pound', '(0.45359237*kilo*gram)'), ('stone', '(6.35029318*kilo*gram)'), ('inch', '(0.0254*metre)'), ('foot', '(0.3048*metre)'), ('yard', '(0.9144*metre)'), ('mile', '(1609.344*metre)'), ('gill', '(142.0653125*milli*litre)'), ('pint', '(568.26125*milli*litre)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('astronomicalunit', '(149597870700*metre)'), ('atomicmassunit', '(1.66054*10**(-27)*kilo*gram)'), ('nauticalmile', '(1852*metre)'), ('electronvolt', '(1.60218*10**(-19)*joule)'), ('angleminute', '(pi/10800)'), ('anglesecond', '(pi/648000)'), ('steradian', '(1)'), ('metricton', '(10**3*kilo*gram)'), ('roentgen', '(2.58*10**(-4)*kelvin/(kilo*gram))'), ('angstrom', '(10**(-10)*metre)'), ('hectare', '(10**4*metre**2)'), ('radian', '(1)'), ('minute', '(60*second)'), ('degree', '(pi/180)'), ('curie', '(3.7*10**10*becquerel)'), ('liter', '(10**(-3)*metre**3)'), ('neper', '(1)'), ('knot', '((1852/3600)*metre/second)'), ('barn', '(10**(-28)*metre**2)'), ('hour', '(3600*second)'), ('day', '(86400*second)'), ('are', '(10**2*metre**2)'), ('bar', '(10**5*pascal)'), ('rad', '(10**(-2)*gray)'), ('rem', '(10**(-2)*sievert)'), ('bel', '((1/2)*log(10))')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('becquerel', '(second**(-1))'), ('coulomb', '(second*ampere)'), ('siemens', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)'), ('sievert', '(metre**2*second**(-2))'), ('newton', '(metre*kilo*gram*second**(-2))'), ('pascal', '(metre**(-1)*kilogram*second**(-2))'), ('hertz', '(second**(-1))'), ('joule', '(metre**2*kilo*gram*second**(-2))'), ('farad', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)'), ('weber', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))'), ('tesla', '(kilo*gram*second**(-2)*ampere**(-1))'), ('henry', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))'), ('lumen', '(candela)'), ('katal', '(second**(-1)*mole)'), ('watt', '(metre**2*kilo*gram*second**(-3))'), ('volt', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))'), ('gray', '(metre**2*second**(-2))'), ('ohm', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))'), ('lux', '(metre**(-2)*candela)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('yotta', '(10**24)'), ('zetta', '(10**21)'), ('hecto', '(10**2) '), ('centi', '(10**(-2)) '), ('milli', '(10**(-3)) '), ('micro', '(10**(-6)) '), ('femto', '(10**(-15))'), ('zepto', '(10**(-21))'), ('yocto', '(10**(-24))'), ('peta', '(10**15)'), ('tera', '(10**12)'), ('giga', '(10**9) '), ('mega', '(10**6) '), ('kilo', '(10**3) '), ('deka', '(10**1) '), ('deci', '(10**(-1)) '), ('nano', '(10**(-9)) '), ('pico', '(10**(-12))'), ('atto', '(10**(-18))'), ('exa', '(10**18)')]]
-convert_to_SI_base_units_short_form=[[('amount_of_substance', 'amount_of_substance'), ('luminous_intensity', 'luminous_intensity'), ('astronomicalunit', 'astronomicalunit'), ('electric_current', 'electric_current'), ('atomicmassunit', 'atomicmassunit'), ('atomicmassunit', 'atomicmassunit'), ('electronvolt', 'electronvolt'), ('nauticalmile', 'nauticalmile'), ('electronvolt', 'electronvolt'), ('fluid ounce', 'fluid ounce'), ('angleminute', 'angleminute'), ('anglesecond', 'anglesecond'), ('fluid ounce', 'fluid ounce'), ('temperature', 'temperature'), ('becquerel', 'becquerel'), ('steradian', 'steradian'), ('metricton', 'metricton'), ('steradian', 'steradian'), ('metricton', 'metricton'), ('angstrom', 'angstrom'), ('roentgen', 'roentgen'), ('angstrom', 'angstrom'), ('candela', 'candela'), ('coulomb', 'coulomb'), ('siemens', 'siemens'), ('sievert', 'sievert'), ('hectare', 'hectare'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('newton', 'newton'), ('pascal', 'pascal'), ('radian', 'radian'), ('minute', 'minute'), ('degree', 'degree'), ('gallon', 'gallon'), ('radian', 'radian'), ('minute', 'minute'), ('degree', 'degree'), ('gallon', 'gallon'), ('length', 'length'), ('metre', 'metre'), ('hertz', 'hertz'), ('joule', 'joule'), ('farad', 'farad'), ('weber', 'weber'), ('tesla', 'tesla'), ('henry', 'henry'), ('lumen', 'lumen'), ('katal', 'katal'), ('liter', 'liter'), ('neper', 'neper'), ('quart', 'quart'), ('ounce', 'ounce'), ('pound', 'pound'), ('stone', 'stone'), ('curie', 'curie'), ('liter', 'liter'), ('neper', 'neper'), ('quart', 'quart'), ('ounce', 'ounce'), ('pound', 'pound'), ('stone', 'stone'), ('yotta', 'yotta'), ('zetta', 'zetta'), ('hecto', 'hecto'), ('centi', 'centi'), ('milli', 'milli'), ('micro', 'micro'), ('femto', 'femto'), ('zepto', 'zepto'), ('yocto', 'yocto'), ('gram', 'gram'), ('mole', 'mole'), ('watt', 'watt'), ('volt', 'volt'), ('gray', 'gray'), ('hour', 'hour'), ('inch', 'inch'), ('foot', 'foot'), ('yard', 'yard'), ('mile', 'mile'), ('gill', 'gill'), ('pint', 'pint'), ('knot', 'knot'), ('barn', 'barn'), ('hour', 'hour'), ('inch', 'inch'), ('foot', 'foot'), ('yard', 'yard'), ('mile', 'mile'), ('gill', 'gill'), ('pint', 'pint'), ('time', 'time'), ('mass', 'mass'), ('peta', 'peta'), ('tera', 'tera'), ('giga', 'giga'), ('mega', 'mega'), ('kilo', 'kilo'), ('deka', 'deka'), ('deci', 'deci'), ('nano', 'nano'), ('pico', 'pico'), ('atto', 'atto'), ('ohm', 'ohm'), ('lux', 'lux'), ('bel', 'bel'), ('day', 'day'), ('are', 'are'), ('bar', 'bar'), ('rad', 'rad'), ('rem', 'rem'), ('bel', 'bel'), ('exa', 'exa'), ('mu*fl oz', 'micro*(fluid ounce)'), ('mu fl oz', 'micro*(fluid ounce)'), ('da*fl oz', 'deka*(fluid ounce)'), ('da fl oz', 'deka*(fluid ounce)'), ('Y*fl oz', 'yotta*(fluid ounce)'), ('Y fl oz', 'yotta*(fluid ounce)'), ('Z*fl oz', 'zetta*(fluid ounce)'), ('Z fl oz', 'zetta*(fluid ounce)'), ('h*fl oz', 'hecto*(fluid ounce)'), ('h fl oz', 'hecto*(fluid ounce)'), ('c*fl oz', 'centi*(fluid ounce)'), ('c fl oz', 'centi*(fluid ounce)'), ('m*fl oz', 'milli*(fluid ounce)'), ('m fl oz', 'milli*(fluid ounce)'), ('mufl oz', 'micro*(fluid ounce)'), ('f*fl oz', 'femto*(fluid ounce)'), ('f fl oz', 'femto*(fluid ounce)'), ('z*fl oz', 'zepto*(fluid ounce)'), ('z fl oz', 'zepto*(fluid ounce)'), ('y*fl oz', 'yocto*(fluid ounce)'), ('y fl oz', 'yocto*(fluid ounce)'), ('P*fl oz', 'peta*(fluid ounce)'), ('P fl oz', 'peta*(fluid ounce)'), ('T*fl oz', 'tera*(fluid ounce)'), ('T fl oz', 'tera*(fluid ounce)'), ('G*fl oz', 'giga*(fluid ounce)'), ('G fl oz', 'giga*(fluid ounce)'), ('M*fl oz', 'mega*(fluid ounce)'), ('M fl oz', 'mega*(fluid ounce)'), ('k*fl oz', 'kilo*(fluid ounce)'), ('k fl oz', 'kilo*(fluid ounce)'), ('dafl oz', 'deka*(fluid ounce)'), ('d*fl oz', 'deci*(fluid ounce)'), ('d fl oz', 'deci*(fluid ounce)'), ('n*fl oz', 'nano*(fluid ounce)'), ('n fl oz', 'nano*(fluid ounce)'), ('p*fl oz', 'pico*(fluid ounce)'), ('p fl oz', 'pico*(fluid ounce)'), ('a*fl oz', 'atto*(fluid ounce)'), ('a fl oz', 'atto*(fluid ounce)'), ('E*fl oz', 'exa*(fluid ounce)'), ('E fl oz', 'exa*(fluid ounce)'), ('Yfl oz', 'yotta*(fluid ounce)'), ('Zfl oz', 'zetta*(fluid ounce)'), ('hfl oz', 'hecto*(fluid ounce)'), ('cfl oz', 'centi*(fluid ounce)'), ('mfl oz', 'milli*(fluid ounce)'), ('mu*mol', 'micro*(mole)'), ('mu mol', 'micro*(mole)'), ('mu*kat', 'micro*(katal)'), ('mu kat', 'micro*(katal)'), ('mu*min', 'micro*(minute)'), ('mu min', 'micro*(minute)'), ('mu*deg', 'micro*(degree)'), ('mu deg', 'micro*(degree)'), ('mu*gal', 'micro*(gallon)'), ('mu gal', 'micro*(gallon)'), ('ffl oz', 'femto*(fluid ounce)'), ('zfl oz', 'zepto*(fluid ounce)'), ('yfl oz', 'yocto*(fluid ounce)'), ('Pfl oz', 'peta*(fluid ounce)'), ('Tfl oz', 'tera*(fluid ounce)'), ('Gfl oz', 'giga*(fluid ounce)'), ('Mfl oz', 'mega*(fluid ounce)'), ('kfl oz', 'kilo*(fluid ounce)'), ('da*mol', 'deka*(mole)'), ('da mol', 'deka*(mole)'), ('da*kat', 'deka*(katal)'), ('da kat', 'deka*(katal)'), ('da*min', 'deka*(minute)'), ('da min', 'deka*(minute)'), ('da*deg', 'deka*(degree)'), ('da deg', 'deka*(degree)'), ('da*gal', 'deka*(gallon)'), ('da gal', 'deka*(gallon)'), ('dfl oz', 'deci*(fluid ounce)'), ('nfl oz', 'nano*(fluid ounce)'), ('pfl oz', 'pico*(fluid ounce)'), ('afl oz', 'atto*(fluid ounce)'), ('Efl oz', 'exa*(fluid ounce)'), ('Y*mol', 'yotta*(mole)'), ('Y mol', 'yotta*(mole)'), ('Y*kat', 'yotta*(katal)'), ('Y kat', 'yotta*(katal)'), ('Y*min', 'yotta*(minute)'), ('Y min', 'yotta*(minute)'), ('Y*deg', 'yotta*(degree)'), ('Y deg', 'yotta*(degree)'), ('Y*gal', 'yotta*(gallon)'), ('Y gal', 'yotta*(gallon)'), ('Z*mol', 'zetta*(mole)'), ('Z mol', 'zetta*(mole)'), ('Z*kat', 'zetta*(katal)'), ('Z kat', 'zetta*(katal)'), ('Z*min', 'zetta*(minute)'), ('Z min', 'zetta*(minute)'), ('Z*deg', 'zetta*(degree)'), ('Z deg', 'zetta*(degree)'), ('Z*gal', 'zetta*(gallon)'), ('Z gal', 'zetta*(gallon)'), ('h*mol', 'hecto*(mole)'), ('h mol', 'hecto*(mole)'), ('h*kat', 'hecto*(katal)'), ('h kat', 'hecto*(katal)'), ('h*min', 'hecto*(minute)'), ('h min', 'hecto*(minute)'), ('h*deg', 'hecto*(degree)'), ('h deg', 'hecto*(degree)'), ('h*gal', 'hecto*(gallon)'), ('h gal', 'hecto*(gallon)'), ('c*mol', 'centi*(mole)'), ('c mol', 'centi*(mole)'), ('c*kat', 'centi*(katal)'), ('c kat', 'centi*(katal)'), ('c*min', 'centi*(minute)'), ('c min', 'centi*(minute)'), ('c*deg', 'centi*(degree)'), ('c deg', 'centi*(degree)'), ('c*gal', 'centi*(gallon)'), ('c gal', 'centi*(gallon)'), ('m*mol', 'milli*(mole)'), ('m mol', 'milli*(mole)'), ('m*kat', 'milli*(katal)'), ('m kat', 'milli*(katal)'), ('m*min', 'milli*(minute)'), ('m min', 'milli*(minute)'), ('m*deg', 'milli*(degree)'), ('m deg', 'milli*(degree)'), ('m*gal', 'milli*(gallon)'), ('m gal', 'milli*(gallon)'), ('mu*cd', 'micro*(candela)'), ('mu cd', 'micro*(candela)'), ('mumol', 'micro*(mole)'), ('mu*Bq', 'micro*(becquerel)'), ('mu Bq', 'micro*(becquerel)'), ('mu*Sv', 'micro*(sievert)'), ('mu Sv', 'micro*(sievert)'), ('mu*Pa', 'micro*(pascal)'), ('mu Pa', 'micro*(pascal)'), ('mu*Hz', 'micro*(hertz)'), ('mu Hz', 'micro*(hertz)'), ('mu*Wb', 'micro*(weber)'), ('mu Wb', 'micro*(weber)'), ('mu*lm', 'micro*(lumen)'), ('mu lm', 'micro*(lumen)'), ('mukat', 'micro*(katal)'), ('mu*Gy', 'micro*(gray)'), ('mu Gy', 'micro*(gray)'), ('mu*lx', 'micro*(lux)'), ('mu lx', 'micro*(lux)'), ('mu*eV', 'micro*(electronvolt)'), ('mu eV', 'micro*(electronvolt)'), ('mu*sr', 'micro*(steradian)'), ('mu sr', 'micro*(steradian)'), ('mumin', 'micro*(minute)'), ('mudeg', 'micro*(degree)'), ('mu*Np', 'micro*(neper)'), ('mu Np', 'micro*(neper)'), ('mugal', 'micro*(gallon)'), ('mu*qt', 'micro*(quart)'), ('mu qt', 'micro*(quart)'), ('mu*oz', 'micro*(ounce)'), ('mu oz', 'micro*(ounce)'), ('mu*lb', 'micro*(pound)'), ('mu lb', 'micro*(pound)'), ('mu*st', 'micro*(stone)'), ('mu st', 'micro*(stone)'), ('mu*in', 'micro*(inch)'), ('mu in', 'micro*(inch)'), ('mu*ft', 'micro*(foot)'), ('mu ft', 'micro*(foot)'), ('mu*yd', 'micro*(yard)'), ('mu yd', 'micro*(yard)'), ('mu*mi', 'micro*(mile)'), ('mu mi', 'micro*(mile)'), ('mu*gi', 'micro*(gill)'), ('mu gi', 'micro*(gill)'), ('mu*pt', 'micro*(pint)'), ('mu pt', 'micro*(pint)'), ('f*mol', 'femto*(mole)'), ('f mol', 'femto*(mole)'), ('f*kat', 'femto*(katal)'), ('f kat', 'femto*(katal)'), ('f*min', 'femto*(minute)'), ('f min', 'femto*(minute)'), ('f*deg', 'femto*(degree)'), ('f deg', 'femto*(degree)'), ('f*gal', 'femto*(gallon)'), ('f gal', 'femto*(gallon)'), ('z*mol', 'zepto*(mole)'), ('z mol', 'zepto*(mole)'), ('z*kat', 'zepto*(katal)'), ('z kat', 'zepto*(katal)'), ('z*min', 'zepto*(minute)'), ('z min', 'zepto*(minute)'), ('z*deg', 'zepto*(degree)'), ('z deg', 'zepto*(degree)'), ('z*gal', 'zepto*(gallon)'), ('z gal', 'zepto*(gallon)'), ('y*mol', 'yocto*(mole)'), ('y mol', 'yocto*(mole)'), ('y*kat', 'yocto*(katal)'), ('y kat', 'yocto*(katal)'), ('y*min', 'yocto*(minute)'), ('y min', 'yocto*(minute)'), ('y*deg', 'yocto*(degree)'), ('y deg', 'yocto*(degree)'), ('y*gal', 'yocto*(gallon)'), ('y gal', 'yocto*(gallon)'), ('P*mol', 'peta*(mole)'), ('P mol', 'peta*(mole)'), ('P*kat', 'peta*(katal)'), ('P kat', 'peta*(katal)'), ('P*min', 'peta*(minute)'), ('P min', 'peta*(minute)'), ('P*deg', 'peta*(degree)'), ('P deg', 'peta*(degree)'), ('P*gal', 'peta*(gallon)'), ('P gal', 'peta*(gallon)'), ('T*mol', 'tera*(mole)'), ('T mol', 'tera*(mole)'), ('T*kat', 'tera*(katal)'), ('T kat', 'tera*(katal)'), ('T*min', 'tera*(minute)'), ('T min', 'tera*(minute)'), ('T*deg', 'tera*(degree)'), ('T deg', 'tera*(degree)'), ('T*gal', 'tera*(gallon)'), ('T gal', 'tera*(gallon)'), ('G*mol', 'giga*(mole)'), ('G mol', 'giga*(mole)'), ('G*kat', 'giga*(katal)'), ('G kat', 'giga*(katal)'), ('G*min', 'giga*(minute)'), ('G min', 'giga*(minute)'), ('G*deg', 'giga*(degree)'), ('G deg', 'giga*(degree)'), ('G*gal', 'giga*(gallon)'), ('G gal', 'giga*(gallon)'), ('M*mol', 'mega*(mole)'), ('M mol', 'mega*(mole)'), ('M*kat', 'mega*(katal)'), ('M kat', 'mega*(katal)'), ('M*min', 'mega*(minute)'), ('M min', 'mega*(minute)'), ('M*deg', 'mega*(degree)'), ('M deg', 'mega*(degree)'), ('M*gal', 'mega*(gallon)'), ('M gal', 'mega*(gallon)'), ('k*mol', 'kilo*(mole)'), ('k mol', 'kilo*(mole)'), ('k*kat', 'kilo*(katal)'), ('k kat', 'kilo*(katal)'), ('k*min', 'kilo*(minute)'), ('k min', 'kilo*(minute)'), ('k*deg', 'kilo*(degree)'), ('k deg', 'kilo*(degree)'), ('k*gal', 'kilo*(gallon)'), ('k gal', 'kilo*(gallon)'), ('da*cd', 'deka*(candela)'), ('da cd', 'deka*(candela)'), ('damol', 'deka*(mole)'), ('da*Bq', 'deka*(becquerel)'), ('da Bq', 'deka*(becquerel)'), ('da*Sv', 'deka*(sievert)'), ('da Sv', 'deka*(sievert)'), ('da*Pa', 'deka*(pascal)'), ('da Pa', 'deka*(pascal)'), ('da*Hz', 'deka*(hertz)'), ('da Hz', 'deka*(hertz)'), ('da*Wb', 'deka*(weber)'), ('da Wb', 'deka*(weber)'), ('da*lm', 'deka*(lumen)'), ('da lm', 'deka*(lumen)'), ('dakat', 'deka*(katal)'), ('da*Gy', 'deka*(gray)'), ('da Gy', 'deka*(gray)'), ('da*lx', 'deka*(lux)'), ('da lx', 'deka*(lux)'), ('da*eV', 'deka*(electronvolt)'), ('da eV', 'deka*(electronvolt)'), ('da*sr', 'deka*(steradian)'), ('da sr', 'deka*(steradian)'), ('damin', 'deka*(minute)'), ('dadeg', 'deka*(degree)'), ('da*Np', 'deka*(neper)'), ('da Np', 'deka*(neper)'), ('dagal', 'deka*(gallon)'), ('da*qt', 'deka*(quart)'), ('da qt', 'deka*(quart)'), ('da*oz', 'deka*(ounce)'), ('da oz', 'deka*(ounce)'), ('da*lb', 'deka*(pound)'), ('da lb', 'deka*(pound)'), ('da*st', 'deka*(stone)'), ('da st', 'deka*(stone)'), ('da*in', 'deka*(inch)'), ('da in', 'deka*(inch)'), ('da*ft', 'deka*(foot)'), ('da ft', 'deka*(foot)'), ('da*yd', 'deka*(yard)'), ('da yd', 'deka*(yard)'), ('da*mi', 'deka*(mile)'), ('da mi', 'deka*(mile)'), ('da*gi', 'deka*(gill)'), ('da gi', 'deka*(gill)'), ('da*pt', 'deka*(pint)'), ('da pt', 'deka*(pint)'), ('d*mol', 'deci*(mole)'), ('d mol', 'deci*(mole)'), ('d*kat', 'deci*(katal)'), ('d kat', 'deci*(katal)'), ('d*min', 'deci*(minute)'), ('d min', 'deci*(minute)'), ('d*deg', 'deci*(degree)'), ('d deg', 'deci*(degree)'), ('d*gal', 'deci*(gallon)'), ('d gal', 'deci*(gallon)'), ('n*mol', 'nano*(mole)'), ('n mol', 'nano*(mole)'), ('n*kat', 'nano*(katal)'), ('n kat', 'nano*(katal)'), ('n*min', 'nano*(minute)'), ('n min', 'nano*(minute)'), ('n*deg', 'nano*(degree)'), ('n deg', 'nano*(degree)'), ('n*gal', 'nano*(gallon)'), ('n gal', 'nano*(gallon)'), ('p*mol', 'pico*(mole)'), ('p mol', 'pico*(mole)'), ('p*kat', 'pico*(katal)'), ('p kat', 'pico*(katal)'), ('p*min', 'pico*(minute)'), ('p min', 'pico*(minute)'), ('p*deg', 'pico*(degree)'), ('p deg', 'pico*(degree)'), ('p*gal', 'pico*(gallon)'), ('p gal', 'pico*(gallon)'), ('a*mol', 'atto*(mole)'), ('a mol', 'atto*(mole)'), ('a*kat', 'atto*(katal)'), ('a kat', 'atto*(katal)'), ('a*min', 'atto*(minute)'), ('a min', 'atto*(minute)'), ('a*deg', 'atto*(degree)'), ('a deg', 'atto*(degree)'), ('a*gal', 'atto*(gallon)'), ('a gal', 'atto*(gallon)'), ('E*mol', 'exa*(mole)'), ('E mol', 'exa*(mole)'), ('E*kat', 'exa*(katal)'), ('E kat', 'exa*(katal)'), ('E*min', 'exa*(minute)'), ('E min', 'exa*(minute)'), ('E*deg', 'exa*(degree)'), ('E deg', 'exa*(degree)'), ('E*gal', 'exa*(gallon)'), ('E gal', 'exa*(gallon)'), ('Y*cd', 'yotta*(candela)'), ('Y cd', 'yotta*(candela)'), ('Ymol', 'yotta*(mole)'), ('Y*Bq', 'yotta*(becquerel)'), ('Y Bq', 'yotta*(becquerel)'), ('Y*Sv', 'yotta*(sievert)'), ('Y Sv', 'yotta*(sievert)'), ('Y*Pa', 'yotta*(pascal)'), ('Y Pa', 'yotta*(pascal)'), ('Y*Hz', 'yotta*(hertz)'), ('Y Hz', 'yotta*(hertz)'), ('Y*Wb', 'yotta*(weber)'), ('Y Wb', 'yotta*(weber)'), ('Y*lm', 'yotta*(lumen)'), ('Y lm', 'yotta*(lumen)'), ('Ykat', 'yotta*(katal)'), ('Y*Gy', 'yotta*(gray)'), ('Y Gy', 'yotta*(gray)'), ('Y*lx', 'yotta*(lux)'), ('Y lx', 'yotta*(lux)'), ('Y*eV', 'yotta*(electronvolt)'), ('Y eV', 'yotta*(electronvolt)'), ('Y*sr', 'yotta*(steradian)'), ('Y sr', 'yotta*(steradian)'), ('Ymin', 'yotta*(minute)'), ('Ydeg', 'yotta*(degree)'), ('Y*Np', 'yotta*(neper)'), ('Y Np', 'yotta*(neper)'), ('Ygal', 'yotta*(gallon)'), ('Y*qt', 'yotta*(quart)'), ('Y qt', 'yotta*(quart)'), ('Y*oz', 'yotta*(ounce)'), ('Y oz', 'yotta*(ounce)'), ('Y*lb', 'yotta*(pound)'), ('Y lb', 'yotta*(pound)'), ('Y*st', 'yotta*(stone)'), ('Y st', 'yotta*(stone)'), ('Y*in', 'yotta*(inch)'), ('Y in', 'yotta*(inch)'), ('Y*ft', 'yotta*(foot)'), ('Y ft', 'yotta*(foot)'), ('Y*yd', 'yotta*(yard)'), ('Y yd', 'yotta*(yard)'), ('Y*mi', 'yotta*(mile)'), ('Y mi', 'yotta*(mile)'), ('Y*gi', 'yotta*(gill)'), ('Y gi', 'yotta*(gill)'), ('Y*pt', 'yotta*(pint)'), ('Y pt', 'yotta*(pint)'), ('Z*cd', 'zetta*(candela)'), ('Z cd', 'zetta*(candela)'), ('Zmol', 'zetta*(mole)'), ('Z*Bq', 'zetta*(becquerel)'), ('Z Bq', 'zetta*(becquerel)'), ('Z*Sv', 'zetta*(sievert)'), ('Z Sv', 'zetta*(sievert)'), ('Z*Pa', 'zetta*(pascal)'), ('Z Pa', 'zetta*(pascal)'), ('Z*Hz', 'zetta*(hertz)'), ('Z Hz', 'zetta*(hertz)'), ('Z*Wb', 'zetta*(weber)'), ('Z Wb', 'zetta*(weber)'), ('Z*lm', 'zetta*(lumen)'), ('Z lm', 'zetta*(lumen)'), ('Zkat', 'zetta*(katal)'), ('Z*Gy', 'zetta*(gray)'), ('Z Gy', 'zetta*(gray)'), ('Z*lx', 'zetta*(lux)'), ('Z lx', 'zetta*(lux)'), ('Z*eV', 'zetta*(electronvolt)'), ('Z eV', 'zetta*(electronvolt)'), ('Z*sr', 'zetta*(steradian)'), ('Z sr', 'zetta*(steradian)'), ('Zmin', 'zetta*(minute)'), ('Zdeg', 'zetta*(degree)'), ('Z*Np', 'zetta*(neper)'), ('Z Np', 'zetta*(neper)'), ('Zgal', 'zetta*(gallon)'), ('Z*qt', 'zetta*(quart)'), ('Z qt', 'zetta*(quart)'), ('Z*oz', 'zetta*(ounce)'), ('Z oz', 'zetta*(ounce)'), ('Z*lb', 'zetta*(pound)'), ('Z lb', 'zetta*(pound)'), ('Z*st', 'zetta*(stone)'), ('Z st', 'zetta*(stone)'), ('Z*in', 'zetta*(inch)'), ('Z in', 'zetta*(inch)'), ('Z*ft', 'zetta*(foot)'), ('Z ft', 'zetta*(foot)'), ('Z*yd', 'zetta*(yard)'), ('Z yd', 'zetta*(yard)'), ('Z*mi', 'zetta*(mile)'), ('Z mi', 'zetta*(mile)'), ('Z*gi', 'zetta*(gill)'), ('Z gi', 'zetta*(gill)'), ('Z*pt', 'zetta*(pint)'), ('Z pt', 'zetta*(pint)'), ('h*cd', 'hecto*(candela)'), ('h cd', 'hecto*(candela)'), ('hmol', 'hecto*(mole)'), ('h*Bq', 'hecto*(becquerel)'), ('h Bq', 'hecto*(becquerel)'), ('h*Sv', 'hecto*(sievert)'), ('h Sv', 'hecto*(sievert)'), ('h*Pa', 'hecto*(pascal)'), ('h Pa', 'hecto*(pascal)'), ('h*Hz', 'hecto*(hertz)'), ('h Hz', 'hecto*(hertz)'), ('h*Wb', 'hecto*(weber)'), ('h Wb', 'hecto*(weber)'), ('h*lm', 'hecto*(lumen)'), ('h lm', 'hecto*(lumen)'), ('hkat', 'hecto*(katal)'), ('h*Gy', 'hecto*(gray)'), ('h Gy', 'hecto*(gray)'), ('h*lx', 'hecto*(lux)'), ('h lx', 'hecto*(lux)'), ('h*eV', 'hecto*(electronvolt)'), ('h eV', 'hecto*(electronvolt)'), ('h*sr', 'hecto*(steradian)'), ('h sr', 'hecto*(steradian)'), ('hmin', 'hecto*(minute)'), ('hdeg', 'hecto*(degree)'), ('h*Np', 'hecto*(neper)'), ('h Np', 'hecto*(neper)'), ('hgal', 'hecto*(gallon)'), ('h*qt', 'hecto*(quart)'), ('h qt', 'hecto*(quart)'), ('h*oz', 'hecto*(ounce)'), ('h oz', 'hecto*(ounce)'), ('h*lb', 'hecto*(pound)'), ('h lb', 'hecto*(pound)'), ('h*st', 'hecto*(stone)'), ('h st', 'hecto*(stone)'), ('h*in', 'hecto*(inch)'), ('h in', 'hecto*(inch)'), ('h*ft', 'hecto*(foot)'), ('h ft', 'hecto*(foot)'), ('h*yd', 'hecto*(yard)'), ('h yd', 'hecto*(yard)'), ('h*mi', 'hecto*(mile)'), ('h mi', 'hecto*(mile)'), ('h*gi', 'hecto*(gill)'), ('h gi', 'hecto*(gill)'), ('h*pt', 'hecto*(pint)'), ('h pt', 'hecto*(pint)'), ('c*cd', 'centi*(candela)'), ('c cd', 'centi*(candela)'), ('cmol', 'centi*(mole)'), ('c*Bq', 'centi*(becquerel)'), ('c Bq', 'centi*(becquerel)'), ('c*Sv', 'centi*(sievert)'), ('c Sv', 'centi*(sievert)'), ('c*Pa', 'centi*(pascal)'), ('c Pa', 'centi*(pascal)'), ('c*Hz', 'centi*(hertz)'), ('c Hz', 'centi*(hertz)'), ('c*Wb', 'centi*(weber)'), ('c Wb', 'centi*(weber)'), ('c*lm', 'centi*(lumen)'), ('c lm', 'centi*(lumen)'), ('ckat', 'centi*(katal)'), ('c*Gy', 'centi*(gray)'), ('c Gy', 'centi*(gray)'), ('c*lx', 'centi*(lux)'), ('c lx', 'centi*(lux)'), ('c*eV', 'centi*(electronvolt)'), ('c eV', 'centi*(electronvolt)'), ('c*sr', 'centi*(steradian)'), ('c sr', 'centi*(steradian)'), ('cmin', 'centi*(minute)'), ('cdeg', 'centi*(degree)'), ('c*Np', 'centi*(neper)'), ('c Np', 'centi*(neper)'), ('cgal', 'centi*(gallon)'), ('c*qt', 'centi*(quart)'), ('c qt', 'centi*(quart)'), ('c*oz', 'centi*(ounce)'), ('c oz', 'centi*(ounce)'), ('c*lb', 'centi*(pound)'), ('c lb', 'centi*(pound)'), ('c*st', 'centi*(stone)'), ('c st', 'centi*(stone)'), ('c*in', 'centi*(inch)'), ('c in', 'centi*(inch)'), ('c*ft', 'centi*(foot)'), ('c ft', 'centi*(foot)'), ('c*yd', 'centi*(yard)'), ('c yd', 'centi*(yard)'), ('c*mi', 'centi*(mile)'), ('c mi', 'centi*(mile)'), ('c*gi', 'centi*(gill)'), ('c gi', 'centi*(gill)'), ('c*pt', 'centi*(pint)'), ('c pt', 'centi*(pint)'), ('m*cd', 'milli*(candela)'), ('m cd', 'milli*(candela)'), ('mmol', 'milli*(mole)'), ('m*Bq', 'milli*(becquerel)'), ('m Bq', 'milli*(becquerel)'), ('m*Sv', 'milli*(sievert)'), ('m Sv', 'milli*(sievert)'), ('m*Pa', 'milli*(pascal)'), ('m Pa', 'milli*(pascal)'), ('m*Hz', 'milli*(hertz)'), ('m Hz', 'milli*(hertz)'), ('m*Wb', 'milli*(weber)'), ('m Wb', 'milli*(weber)'), ('m*lm', 'milli*(lumen)'), ('m lm', 'milli*(lumen)'), ('mkat', 'milli*(katal)'), ('m*Gy', 'milli*(gray)'), ('m Gy', 'milli*(gray)'), ('m*lx', 'milli*(lux)'), ('m lx', 'milli*(lux)'), ('m*eV', 'milli*(electronvolt)'), ('m eV', 'milli*(electronvolt)'), ('m*sr', 'milli*(steradian)'), ('m sr', 'milli*(steradian)'), ('mmin', 'milli*(minute)'), ('mdeg', 'milli*(degree)'), ('m*Np', 'milli*(neper)'), ('m Np', 'milli*(neper)'), ('mgal', 'milli*(gallon)'), ('m*qt', 'milli*(quart)'), ('m qt', 'milli*(quart)'), ('m*oz', 'milli*(ounce)'), ('m oz', 'milli*(ounce)'), ('m*lb', 'milli*(pound)'), ('m lb', 'milli*(pound)'), ('m*st', 'milli*(stone)'), ('m st', 'milli*(stone)'), ('m*in', 'milli*(inch)'), ('m in', 'milli*(inch)'), ('m*ft', 'milli*(foot)'), ('m ft', 'milli*(foot)'), ('m*yd', 'milli*(yard)'), ('m yd', 'milli*(yard)'), ('m*mi', 'milli*(mile)'), ('m mi', 'milli*(mile)'), ('m*gi', 'milli*(gill)'), ('m gi', 'milli*(gill)'), ('m*pt', 'milli*(pint)'), ('m pt', 'milli*(pint)'), ('mucd', 'micro*(candela)'), ('mu*s', 'micro*(second)'), ('mu s', 'micro*(second)'), ('mu*A', 'micro*(ampere)'), ('mu A', 'micro*(ampere)'), ('mu*K', 'micro*(kelvin)'), ('mu K', 'micro*(kelvin)'), ('mu*m', 'micro*(metre)'), ('mu m', 'micro*(metre)'), ('mu*g', 'micro*(gram)'), ('mu g', 'micro*(gram)'), ('muBq', 'micro*(becquerel)'), ('mu*C', 'micro*(coulomb)'), ('mu C', 'micro*(coulomb)'), ('mu*S', 'micro*(siemens)'), ('mu S', 'micro*(siemens)'), ('muSv', 'micro*(sievert)'), ('mu*N', 'micro*(newton)'), ('mu N', 'micro*(newton)'), ('muPa', 'micro*(pascal)'), ('muHz', 'micro*(hertz)'), ('mu*J', 'micro*(joule)'), ('mu J', 'micro*(joule)'), ('mu*F', 'micro*(farad)'), ('mu F', 'micro*(farad)'), ('muWb', 'micro*(weber)'), ('mu*T', 'micro*(tesla)'), ('mu T', 'micro*(tesla)'), ('mu*H', 'micro*(henry)'), ('mu H', 'micro*(henry)'), ('mulm', 'micro*(lumen)'), ('mu*W', 'micro*(watt)'), ('mu W', 'micro*(watt)'), ('mu*V', 'micro*(volt)'), ('mu V', 'micro*(volt)'), ('muGy', 'micro*(gray)'), ('mu*O', 'micro*(ohm)'), ('mu O', 'micro*(ohm)'), ('mulx', 'micro*(lux)'), ('mu*u', 'micro*(atomicmassunit)'), ('mu u', 'micro*(atomicmassunit)'), ('mueV', 'micro*(electronvolt)'), ('musr', 'micro*(steradian)'), ('mu*t', 'micro*(metricton)'), ('mu t', 'micro*(metricton)'), ('mu*Å', 'micro*(angstrom)'), ('mu Å', 'micro*(angstrom)'), ('mu*r', 'micro*(radian)'), ('mu r', 'micro*(radian)'), ('mu*L', 'micro*(liter)'), ('mu L', 'micro*(liter)'), ('muNp', 'micro*(neper)'), ('mu*h', 'micro*(hour)'), ('mu h', 'micro*(hour)'), ('mu*B', 'micro*(bel)'), ('mu B', 'micro*(bel)'), ('muqt', 'micro*(quart)'), ('muoz', 'micro*(ounce)'), ('mulb', 'micro*(pound)'), ('must', 'micro*(stone)'), ('muin', 'micro*(inch)'), ('muft', 'micro*(foot)'), ('muyd', 'micro*(yard)'), ('mumi', 'micro*(mile)'), ('mugi', 'micro*(gill)'), ('mupt', 'micro*(pint)'), ('f*cd', 'femto*(candela)'), ('f cd', 'femto*(candela)'), ('fmol', 'femto*(mole)'), ('f*Bq', 'femto*(becquerel)'), ('f Bq', 'femto*(becquerel)'), ('f*Sv', 'femto*(sievert)'), ('f Sv', 'femto*(sievert)'), ('f*Pa', 'femto*(pascal)'), ('f Pa', 'femto*(pascal)'), ('f*Hz', 'femto*(hertz)'), ('f Hz', 'femto*(hertz)'), ('f*Wb', 'femto*(weber)'), ('f Wb', 'femto*(weber)'), ('f*lm', 'femto*(lumen)'), ('f lm', 'femto*(lumen)'), ('fkat', 'femto*(katal)'), ('f*Gy', 'femto*(gray)'), ('f Gy', 'femto*(gray)'), ('f*lx', 'femto*(lux)'), ('f lx', 'femto*(lux)'), ('f*eV', 'femto*(electronvolt)'), ('f eV', 'femto*(electronvolt)'), ('f*sr', 'femto*(steradian)'), ('f sr', 'femto*(steradian)'), ('fmin', 'femto*(minute)'), ('fdeg', 'femto*(degree)'), ('f*Np', 'femto*(neper)'), ('f Np', 'femto*(neper)'), ('fgal', 'femto*(gallon)'), ('f*qt', 'femto*(quart)'), ('f qt', 'femto*(quart)'), ('f*oz', 'femto*(ounce)'), ('f oz', 'femto*(ounce)'), ('f*lb', 'femto*(pound)'), ('f lb', 'femto*(pound)'), ('f*st', 'femto*(stone)'), ('f st', 'femto*(stone)'), ('f*in', 'femto*(inch)'), ('f in', 'femto*(inch)'), ('f*ft', 'femto*(foot)'), ('f ft', 'femto*(foot)'), ('f*yd', 'femto*(yard)'), ('f yd', 'femto*(yard)'), ('f*mi', 'femto*(mile)'), ('f mi', 'femto*(mile)'), ('f*gi', 'femto*(gill)'), ('f gi', 'femto*(gill)'), ('f*pt', 'femto*(pint)'), ('f pt', 'femto*(pint)'), ('z*cd', 'zepto*(candela)'), ('z cd', 'zepto*(candela)'), ('zmol', 'zepto*(mole)'), ('z*Bq', 'zepto*(becquerel)'), ('z Bq', 'zepto*(becquerel)'), ('z*Sv', 'zepto*(sievert)'), ('z Sv', 'zepto*(sievert)'), ('z*Pa', 'zepto*(pascal)'), ('z Pa', 'zepto*(pascal)'), ('z*Hz', 'zepto*(hertz)'), ('z Hz', 'zepto*(hertz)'), ('z*Wb', 'zepto*(weber)'), ('z Wb', 'zepto*(weber)'), ('z*lm', 'zepto*(lumen)'), ('z lm', 'zepto*(lumen)'), ('zkat', 'zepto*(katal)'), ('z*Gy', 'zepto*(gray)'), ('z Gy', 'zepto*(gray)'), ('z*lx', 'zepto*(lux)'), ('z lx', 'zepto*(lux)'), ('z*eV', 'zepto*(electronvolt)'), ('z eV', 'zepto*(electronvolt)'), ('z*sr', 'zepto*(steradian)'), ('z sr', 'zepto*(steradian)'), ('zmin', 'zepto*(minute)'), ('zdeg', 'zepto*(degree)'), ('z*Np', 'zepto*(neper)'), ('z Np', 'zepto*(neper)'), ('zgal', 'zepto*(gallon)'), ('z*qt', 'zepto*(quart)'), ('z qt', 'zepto*(quart)'), ('z*oz', 'zepto*(ounce)'), ('z oz', 'zepto*(ounce)'), ('z*lb', 'zepto*(pound)'), ('z lb', 'zepto*(pound)'), ('z*st', 'zepto*(stone)'), ('z st', 'zepto*(stone)'), ('z*in', 'zepto*(inch)'), ('z in', 'zepto*(inch)'), ('z*ft', 'zepto*(foot)'), ('z ft', 'zepto*(foot)'), ('z*yd', 'zepto*(yard)'), ('z yd', 'zepto*(yard)'), ('z*mi', 'zepto*(mile)'), ('z mi', 'zepto*(mile)'), ('z*gi', 'zepto*(gill)'), ('z gi', 'zepto*(gill)'), ('z*pt', 'zepto*(pint)'), ('z pt', 'zepto*(pint)'), ('y*cd', 'yocto*(candela)'), ('y cd', 'yocto*(candela)'), ('ymol', 'yocto*(mole)'), ('y*Bq', 'yocto*(becquerel)'), ('y Bq', 'yocto*(becquerel)'), ('y*Sv', 'yocto*(sievert)'), ('y Sv', 'yocto*(sievert)'), ('y*Pa', 'yocto*(pascal)'), ('y Pa', 'yocto*(pascal)'), ('y*Hz', 'yocto*(hertz)'), ('y Hz', 'yocto*(hertz)'), ('y*Wb', 'yocto*(weber)'), ('y Wb', 'yocto*(weber)'), ('y*lm', 'yocto*(lumen)'), ('y lm', 'yocto*(lumen)'), ('ykat', 'yocto*(katal)'), ('y*Gy', 'yocto*(gray)'), ('y Gy', 'yocto*(gray)'), ('y*lx', 'yocto*(lux)'), ('y lx', 'yocto*(lux)'), ('y*eV', 'yocto*(electronvolt)'), ('y eV', 'yocto*(electronvolt)'), ('y*sr', 'yocto*(steradian)'), ('y sr', 'yocto*(steradian)'), ('ymin', 'yocto*(minute)'), ('ydeg', 'yocto*(degree)'), ('y*Np', 'yocto*(neper)'), ('y Np', 'yocto*(neper)'), ('ygal', 'yocto*(gallon)'), ('y*qt', 'yocto*(quart)'), ('y qt', 'yocto*(quart)'), ('y*oz', 'yocto*(ounce)'), ('y oz', 'yocto*(ounce)'), ('y*lb', 'yocto*(pound)'), ('y lb', 'yocto*(pound)'), ('y*st', 'yocto*(stone)'), ('y st', 'yocto*(stone)'), ('y*in', 'yocto*(inch)'), ('y in', 'yocto*(inch)'), ('y*ft', 'yocto*(foot)'), ('y ft', 'yocto*(foot)'), ('y*yd', 'yocto*(yard)'), ('y yd', 'yocto*(yard)'), ('y*mi', 'yocto*(mile)'), ('y mi', 'yocto*(mile)'), ('y*gi', 'yocto*(gill)'), ('y gi', 'yocto*(gill)'), ('y*pt', 'yocto*(pint)'), ('y pt', 'yocto*(pint)'), ('P*cd', 'peta*(candela)'), ('P cd', 'peta*(candela)'), ('Pmol', 'peta*(mole)'), ('P*Bq', 'peta*(becquerel)'), ('P Bq', 'peta*(becquerel)'), ('P*Sv', 'peta*(sievert)'), ('P Sv', 'peta*(sievert)'), ('P*Pa', 'peta*(pascal)'), ('P Pa', 'peta*(pascal)'), ('P*Hz', 'peta*(hertz)'), ('P Hz', 'peta*(hertz)'), ('P*Wb', 'peta*(weber)'), ('P Wb', 'peta*(weber)'), ('P*lm', 'peta*(lumen)'), ('P lm', 'peta*(lumen)'), ('Pkat', 'peta*(katal)'), ('P*Gy', 'peta*(gray)'), ('P Gy', 'peta*(gray)'), ('P*lx', 'peta*(lux)'), ('P lx', 'peta*(lux)'), ('P*eV', 'peta*(electronvolt)'), ('P eV', 'peta*(electronvolt)'), ('P*sr', 'peta*(steradian)'), ('P sr', 'peta*(steradian)'), ('Pmin', 'peta*(minute)'), ('Pdeg', 'peta*(degree)'), ('P*Np', 'peta*(neper)'), ('P Np', 'peta*(neper)'), ('Pgal', 'peta*(gallon)'), ('P*qt', 'peta*(quart)'), ('P qt', 'peta*(quart)'), ('P*oz', 'peta*(ounce)'), ('P oz', 'peta*(ounce)'), ('P*lb', 'peta*(pound)'), ('P lb', 'peta*(pound)'), ('P*st', 'peta*(stone)'), ('P st', 'peta*(stone)'), ('P*in', 'peta*(inch)'), ('P in', 'peta*(inch)'), ('P*ft', 'peta*(foot)'), ('P ft', 'peta*(foot)'), ('P*yd', 'peta*(yard)'), ('P yd', 'peta*(yard)'), ('P*mi', 'peta*(mile)'), ('P mi', 'peta*(mile)'), ('P*gi', 'peta*(gill)'), ('P gi', 'peta*(gill)'), ('P*pt', 'peta*(pint)'), ('P pt', 'peta*(pint)'), ('T*cd', 'tera*(candela)'), ('T cd', 'tera*(candela)'), ('Tmol', 'tera*(mole)'), ('T*Bq', 'tera*(becquerel)'), ('T Bq', 'tera*(becquerel)'), ('T*Sv', 'tera*(sievert)'), ('T Sv', 'tera*(sievert)'), ('T*Pa', 'tera*(pascal)'), ('T Pa', 'tera*(pascal)'), ('T*Hz', 'tera*(hertz)'), ('T Hz', 'tera*(hertz)'), ('T*Wb', 'tera*(weber)'), ('T Wb', 'tera*(weber)'), ('T*lm', 'tera*(lumen)'), ('T lm', 'tera*(lumen)'), ('Tkat', 'tera*(katal)'), ('T*Gy', 'tera*(gray)'), ('T Gy', 'tera*(gray)'), ('T*lx', 'tera*(lux)'), ('T lx', 'tera*(lux)'), ('T*eV', 'tera*(electronvolt)'), ('T eV', 'tera*(electronvolt)'), ('T*sr', 'tera*(steradian)'), ('T sr', 'tera*(steradian)'), ('Tmin', 'tera*(minute)'), ('Tdeg', 'tera*(degree)'), ('T*Np', 'tera*(neper)'), ('T Np', 'tera*(neper)'), ('Tgal', 'tera*(gallon)'), ('T*qt', 'tera*(quart)'), ('T qt', 'tera*(quart)'), ('T*oz', 'tera*(ounce)'), ('T oz', 'tera*(ounce)'), ('T*lb', 'tera*(pound)'), ('T lb', 'tera*(pound)'), ('T*st', 'tera*(stone)'), ('T st', 'tera*(stone)'), ('T*in', 'tera*(inch)'), ('T in', 'tera*(inch)'), ('T*ft', 'tera*(foot)'), ('T ft', 'tera*(foot)'), ('T*yd', 'tera*(yard)'), ('T yd', 'tera*(yard)'), ('T*mi', 'tera*(mile)'), ('T mi', 'tera*(mile)'), ('T*gi', 'tera*(gill)'), ('T gi', 'tera*(gill)'), ('T*pt', 'tera*(pint)'), ('T pt', 'tera*(pint)'), ('G*cd', 'giga*(candela)'), ('G cd', 'giga*(candela)'), ('Gmol', 'giga*(mole)'), ('G*Bq', 'giga*(becquerel)'), ('G Bq', 'giga*(becquerel)'), ('G*Sv', 'giga*(sievert)'), ('G Sv', 'giga*(sievert)'), ('G*Pa', 'giga*(pascal)'), ('G Pa', 'giga*(pascal)'), ('G*Hz', 'giga*(hertz)'), ('G Hz', 'giga*(hertz)'), ('G*Wb', 'giga*(weber)'), ('G Wb', 'giga*(weber)'), ('G*lm', 'giga*(lumen)'), ('G lm', 'giga*(lumen)'), ('Gkat', 'giga*(katal)'), ('G*Gy', 'giga*(gray)'), ('G Gy', 'giga*(gray)'), ('G*lx', 'giga*(lux)'), ('G lx', 'giga*(lux)'), ('G*eV', 'giga*(electronvolt)'), ('G eV', 'giga*(electronvolt)'), ('G*sr', 'giga*(steradian)'), ('G sr', 'giga*(steradian)'), ('Gmin', 'giga*(minute)'), ('Gdeg', 'giga*(degree)'), ('G*Np', 'giga*(neper)'), ('G Np', 'giga*(neper)'), ('Ggal', 'giga*(gallon)'), ('G*qt', 'giga*(quart)'), ('G qt', 'giga*(quart)'), ('G*oz', 'giga*(ounce)'), ('G oz', 'giga*(ounce)'), ('G*lb', 'giga*(pound)'), ('G lb', 'giga*(pound)'), ('G*st', 'giga*(stone)'), ('G st', 'giga*(stone)'), ('G*in', 'giga*(inch)'), ('G in', 'giga*(inch)'), ('G*ft', 'giga*(foot)'), ('G ft', 'giga*(foot)'), ('G*yd', 'giga*(yard)'), ('G yd', 'giga*(yard)'), ('G*mi', 'giga*(mile)'), ('G mi', 'giga*(mile)'), ('G*gi', 'giga*(gill)'), ('G gi', 'giga*(gill)'), ('G*pt', 'giga*(pint)'), ('G pt', 'giga*(pint)'), ('M*cd', 'mega*(candela)'), ('M cd', 'mega*(candela)'), ('Mmol', 'mega*(mole)'), ('M*Bq', 'mega*(becquerel)'), ('M Bq', 'mega*(becquerel)'), ('M*Sv', 'mega*(sievert)'), ('M Sv', 'mega*(sievert)'), ('M*Pa', 'mega*(pascal)'), ('M Pa', 'mega*(pascal)'), ('M*Hz', 'mega*(hertz)'), ('M Hz', 'mega*(hertz)'), ('M*Wb', 'mega*(weber)'), ('M Wb', 'mega*(weber)'), ('M*lm', 'mega*(lumen)'), ('M lm', 'mega*(lumen)'), ('Mkat', 'mega*(katal)'), ('M*Gy', 'mega*(gray)'), ('M Gy', 'mega*(gray)'), ('M*lx', 'mega*(lux)'), ('M lx', 'mega*(lux)'), ('M*eV', 'mega*(electronvolt)'), ('M eV', 'mega*(electronvolt)'), ('M*sr', 'mega*(steradian)'), ('M sr', 'mega*(steradian)'), ('Mmin', 'mega*(minute)'), ('Mdeg', 'mega*(degree)'), ('M*Np', 'mega*(neper)'), ('M Np', 'mega*(neper)'), ('Mgal', 'mega*(gallon)'), ('M*qt', 'mega*(quart)'), ('M qt', 'mega*(quart)'), ('M*oz', 'mega*(ounce)'), ('M oz', 'mega*(ounce)'), ('M*lb', 'mega*(pound)'), ('M lb', 'mega*(pound)'), ('M*st', 'mega*(stone)'), ('M st', 'mega*(stone)'), ('M*in', 'mega*(inch)'), ('M in', 'mega*(inch)'), ('M*ft', 'mega*(foot)'), ('M ft', 'mega*(foot)'), ('M*yd', 'mega*(yard)'), ('M yd', 'mega*(yard)'), ('M*mi', 'mega*(mile)'), ('M mi', 'mega*(mile)'), ('M*gi', 'mega*(gill)'), ('M gi', 'mega*(gill)'), ('M*pt', 'mega*(pint)'), ('M pt', 'mega*(pint)'), ('k*cd', 'kilo*(candela)'), ('k cd', 'kilo*(candela)'), ('kmol', 'kilo*(mole)'), ('k*Bq', 'kilo*(becquerel)'), ('k Bq', 'kilo*(becquerel)'), ('k*Sv', 'kilo*(sievert)'), ('k Sv', 'kilo*(sievert)'), ('k*Pa', 'kilo*(pascal)'), ('k Pa', 'kilo*(pascal)'), ('k*Hz', 'kilo*(hertz)'), ('k Hz', 'kilo*(hertz)'), ('k*Wb', 'kilo*(weber)'), ('k Wb', 'kilo*(weber)'), ('k*lm', 'kilo*(lumen)'), ('k lm', 'kilo*(lumen)'), ('kkat', 'kilo*(katal)'), ('k*Gy', 'kilo*(gray)'), ('k Gy', 'kilo*(gray)'), ('k*lx', 'kilo*(lux)'), ('k lx', 'kilo*(lux)'), ('k*eV', 'kilo*(electronvolt)'), ('k eV', 'kilo*(electronvolt)'), ('k*sr', 'kilo*(steradian)'), ('k sr', 'kilo*(steradian)'), ('kmin', 'kilo*(minute)'), ('kdeg', 'kilo*(degree)'), ('k*Np', 'kilo*(neper)'), ('k Np', 'kilo*(neper)'), ('kgal', 'kilo*(gallon)'), ('k*qt', 'kilo*(quart)'), ('k qt', 'kilo*(quart)'), ('k*oz', 'kilo*(ounce)'), ('k oz', 'kilo*(ounce)'), ('k*lb', 'kilo*(pound)'), ('k lb', 'kilo*(pound)'), ('k*st', 'kilo*(stone)'), ('k st', 'kilo*(stone)'), ('k*in', 'kilo*(inch)'), ('k in', 'kilo*(inch)'), ('k*ft', 'kilo*(foot)'), ('k ft', 'kilo*(foot)'), ('k*yd', 'kilo*(yard)'), ('k yd', 'kilo*(yard)'), ('k*mi', 'kilo*(mile)'), ('k mi', 'kilo*(mile)'), ('k*gi', 'kilo*(gill)'), ('k gi', 'kilo*(gill)'), ('k*pt', 'kilo*(pint)'), ('k pt', 'kilo*(pint)'), ('dacd', 'deka*(candela)'), ('da*s', 'deka*(second)'), ('da s', 'deka*(second)'), ('da*A', 'deka*(ampere)'), ('da A', 'deka*(ampere)'), ('da*K', 'deka*(kelvin)'), ('da K', 'deka*(kelvin)'), ('da*m', 'deka*(metre)'), ('da m', 'deka*(metre)'), ('da*g', 'deka*(gram)'), ('da g', 'deka*(gram)'), ('daBq', 'deka*(becquerel)'), ('da*C', 'deka*(coulomb)'), ('da C', 'deka*(coulomb)'), ('da*S', 'deka*(siemens)'), ('da S', 'deka*(siemens)'), ('daSv', 'deka*(sievert)'), ('da*N', 'deka*(newton)'), ('da N', 'deka*(newton)'), ('daPa', 'deka*(pascal)'), ('daHz', 'deka*(hertz)'), ('da*J', 'deka*(joule)'), ('da J', 'deka*(joule)'), ('da*F', 'deka*(farad)'), ('da F', 'deka*(farad)'), ('daWb', 'deka*(weber)'), ('da*T', 'deka*(tesla)'), ('da T', 'deka*(tesla)'), ('da*H', 'deka*(henry)'), ('da H', 'deka*(henry)'), ('dalm', 'deka*(lumen)'), ('da*W', 'deka*(watt)'), ('da W', 'deka*(watt)'), ('da*V', 'deka*(volt)'), ('da V', 'deka*(volt)'), ('daGy', 'deka*(gray)'), ('da*O', 'deka*(ohm)'), ('da O', 'deka*(ohm)'), ('dalx', 'deka*(lux)'), ('da*u', 'deka*(atomicmassunit)'), ('da u', 'deka*(atomicmassunit)'), ('daeV', 'deka*(electronvolt)'), ('dasr', 'deka*(steradian)'), ('da*t', 'deka*(metricton)'), ('da t', 'deka*(metricton)'), ('da*Å', 'deka*(angstrom)'), ('da Å', 'deka*(angstrom)'), ('da*r', 'deka*(radian)'), ('da r', 'deka*(radian)'), ('da*L', 'deka*(liter)'), ('da L', 'deka*(liter)'), ('daNp', 'deka*(neper)'), ('da*h', 'deka*(hour)'), ('da h', 'deka*(hour)'), ('da*B', 'deka*(bel)'), ('da B', 'deka*(bel)'), ('daqt', 'deka*(quart)'), ('daoz', 'deka*(ounce)'), ('dalb', 'deka*(pound)'), ('dast', 'deka*(stone)'), ('dain', 'deka*(inch)'), ('daft', 'deka*(foot)'), ('dayd', 'deka*(yard)'), ('dami', 'deka*(mile)'), ('dagi', 'deka*(gill)'), ('dapt', 'deka*(pint)'), ('d*cd', 'deci*(candela)'), ('d cd', 'deci*(candela)'), ('dmol', 'deci*(mole)'), ('d*Bq', 'deci*(becquerel)'), ('d Bq', 'deci*(becquerel)'), ('d*Sv', 'deci*(sievert)'), ('d Sv', 'deci*(sievert)'), ('d*Pa', 'deci*(pascal)'), ('d Pa', 'deci*(pascal)'), ('d*Hz', 'deci*(hertz)'), ('d Hz', 'deci*(hertz)'), ('d*Wb', 'deci*(weber)'), ('d Wb', 'deci*(weber)'), ('d*lm', 'deci*(lumen)'), ('d lm', 'deci*(lumen)'), ('dkat', 'deci*(katal)'), ('d*Gy', 'deci*(gray)'), ('d Gy', 'deci*(gray)'), ('d*lx', 'deci*(lux)'), ('d lx', 'deci*(lux)'), ('d*eV', 'deci*(electronvolt)'), ('d eV', 'deci*(electronvolt)'), ('d*sr', 'deci*(steradian)'), ('d sr', 'deci*(steradian)'), ('dmin', 'deci*(minute)'), ('ddeg', 'deci*(degree)'), ('d*Np', 'deci*(neper)'), ('d Np', 'deci*(neper)'), ('dgal', 'deci*(gallon)'), ('d*qt', 'deci*(quart)'), ('d qt', 'deci*(quart)'), ('d*oz', 'deci*(ounce)'), ('d oz', 'deci*(ounce)'), ('d*lb', 'deci*(pound)'), ('d lb', 'deci*(pound)'), ('d*st', 'deci*(stone)'), ('d st', 'deci*(stone)'), ('d*in', 'deci*(inch)'), ('d in', 'deci*(inch)'), ('d*ft', 'deci*(foot)'), ('d ft', 'deci*(foot)'), ('d*yd', 'deci*(yard)'), ('d yd', 'deci*(yard)'), ('d*mi', 'deci*(mile)'), ('d mi', 'deci*(mile)'), ('d*gi', 'deci*(gill)'), ('d gi', 'deci*(gill)'), ('d*pt', 'deci*(pint)'), ('d pt', 'deci*(pint)'), ('n*cd', 'nano*(candela)'), ('n cd', 'nano*(candela)'), ('nmol', 'nano*(mole)'), ('n*Bq', 'nano*(becquerel)'), ('n Bq', 'nano*(becquerel)'), ('n*Sv', 'nano*(sievert)'), ('n Sv', 'nano*(sievert)'), ('n*Pa', 'nano*(pascal)'), ('n Pa', 'nano*(pascal)'), ('n*Hz', 'nano*(hertz)'), ('n Hz', 'nano*(hertz)'), ('n*Wb', 'nano*(weber)'), ('n Wb', 'nano*(weber)'), ('n*lm', 'nano*(lumen)'), ('n lm', 'nano*(lumen)'), ('nkat', 'nano*(katal)'), ('n*Gy', 'nano*(gray)'), ('n Gy', 'nano*(gray)'), ('n*lx', 'nano*(lux)'), ('n lx', 'nano*(lux)'), ('n*eV', 'nano*(electronvolt)'), ('n eV', 'nano*(electronvolt)'), ('n*sr', 'nano*(steradian)'), ('n sr', 'nano*(steradian)'), ('nmin', 'nano*(minute)'), ('ndeg', 'nano*(degree)'), ('n*Np', 'nano*(neper)'), ('n Np', 'nano*(neper)'), ('ngal', 'nano*(gallon)'), ('n*qt', 'nano*(quart)'), ('n qt', 'nano*(quart)'), ('n*oz', 'nano*(ounce)'), ('n oz', 'nano*(ounce)'), ('n*lb', 'nano*(pound)'), ('n lb', 'nano*(pound)'), ('n*st', 'nano*(stone)'), ('n st', 'nano*(stone)'), ('n*in', 'nano*(inch)'), ('n in', 'nano*(inch)'), ('n*ft', 'nano*(foot)'), ('n ft', 'nano*(foot)'), ('n*yd', 'nano*(yard)'), ('n yd', 'nano*(yard)'), ('n*mi', 'nano*(mile)'), ('n mi', 'nano*(mile)'), ('n*gi', 'nano*(gill)'), ('n gi', 'nano*(gill)'), ('n*pt', 'nano*(pint)'), ('n pt', 'nano*(pint)'), ('p*cd', 'pico*(candela)'), ('p cd', 'pico*(candela)'), ('pmol', 'pico*(mole)'), ('p*Bq', 'pico*(becquerel)'), ('p Bq', 'pico*(becquerel)'), ('p*Sv', 'pico*(sievert)'), ('p Sv', 'pico*(sievert)'), ('p*Pa', 'pico*(pascal)'), ('p Pa', 'pico*(pascal)'), ('p*Hz', 'pico*(hertz)'), ('p Hz', 'pico*(hertz)'), ('p*Wb', 'pico*(weber)'), ('p Wb', 'pico*(weber)'), ('p*lm', 'pico*(lumen)'), ('p lm', 'pico*(lumen)'), ('pkat', 'pico*(katal)'), ('p*Gy', 'pico*(gray)'), ('p Gy', 'pico*(gray)'), ('p*lx', 'pico*(lux)'), ('p lx', 'pico*(lux)'), ('p*eV', 'pico*(electronvolt)'), ('p eV', 'pico*(electronvolt)'), ('p*sr', 'pico*(steradian)'), ('p sr', 'pico*(steradian)'), ('pmin', 'pico*(minute)'), ('pdeg', 'pico*(degree)'), ('p*Np', 'pico*(neper)'), ('p Np', 'pico*(neper)'), ('pgal', 'pico*(gallon)'), ('p*qt', 'pico*(quart)'), ('p qt', 'pico*(quart)'), ('p*oz', 'pico*(ounce)'), ('p oz', 'pico*(ounce)'), ('p*lb', 'pico*(pound)'), ('p lb', 'pico*(pound)'), ('p*st', 'pico*(stone)'), ('p st', 'pico*(stone)'), ('p*in', 'pico*(inch)'), ('p in', 'pico*(inch)'), ('p*ft', 'pico*(foot)'), ('p ft', 'pico*(foot)'), ('p*yd', 'pico*(yard)'), ('p yd', 'pico*(yard)'), ('p*mi', 'pico*(mile)'), ('p mi', 'pico*(mile)'), ('p*gi', 'pico*(gill)'), ('p gi', 'pico*(gill)'), ('p*pt', 'pico*(pint)'), ('p pt', 'pico*(pint)'), ('a*cd', 'atto*(candela)'), ('a cd', 'atto*(candela)'), ('amol', 'atto*(mole)'), ('a*Bq', 'atto*(becquerel)'), ('a Bq', 'atto*(becquerel)'), ('a*Sv', 'atto*(sievert)'), ('a Sv', 'atto*(sievert)'), ('a*Pa', 'atto*(pascal)'), ('a Pa', 'atto*(pascal)'), ('a*Hz', 'atto*(hertz)'), ('a Hz', 'atto*(hertz)'), ('a*Wb', 'atto*(weber)'), ('a Wb', 'atto*(weber)'), ('a*lm', 'atto*(lumen)'), ('a lm', 'atto*(lumen)'), ('akat', 'atto*(katal)'), ('a*Gy', 'atto*(gray)'), ('a Gy', 'atto*(gray)'), ('a*lx', 'atto*(lux)'), ('a lx', 'atto*(lux)'), ('a*eV', 'atto*(electronvolt)'), ('a eV', 'atto*(electronvolt)'), ('a*sr', 'atto*(steradian)'), ('a sr', 'atto*(steradian)'), ('amin', 'atto*(minute)'), ('adeg', 'atto*(degree)'), ('a*Np', 'atto*(neper)'), ('a Np', 'atto*(neper)'), ('agal', 'atto*(gallon)'), ('a*qt', 'atto*(quart)'), ('a qt', 'atto*(quart)'), ('a*oz', 'atto*(ounce)'), ('a oz', 'atto*(ounce)'), ('a*lb', 'atto*(pound)'), ('a lb', 'atto*(pound)'), ('a*st', 'atto*(stone)'), ('a st', 'atto*(stone)'), ('a*in', 'atto*(inch)'), ('a in', 'atto*(inch)'), ('a*ft', 'atto*(foot)'), ('a ft', 'atto*(foot)'), ('a*yd', 'atto*(yard)'), ('a yd', 'atto*(yard)'), ('a*mi', 'atto*(mile)'), ('a mi', 'atto*(mile)'), ('a*gi', 'atto*(gill)'), ('a gi', 'atto*(gill)'), ('a*pt', 'atto*(pint)'), ('a pt', 'atto*(pint)'), ('E*cd', 'exa*(candela)'), ('E cd', 'exa*(candela)'), ('Emol', 'exa*(mole)'), ('E*Bq', 'exa*(becquerel)'), ('E Bq', 'exa*(becquerel)'), ('E*Sv', 'exa*(sievert)'), ('E Sv', 'exa*(sievert)'), ('E*Pa', 'exa*(pascal)'), ('E Pa', 'exa*(pascal)'), ('E*Hz', 'exa*(hertz)'), ('E Hz', 'exa*(hertz)'), ('E*Wb', 'exa*(weber)'), ('E Wb', 'exa*(weber)'), ('E*lm', 'exa*(lumen)'), ('E lm', 'exa*(lumen)'), ('Ekat', 'exa*(katal)'), ('E*Gy', 'exa*(gray)'), ('E Gy', 'exa*(gray)'), ('E*lx', 'exa*(lux)'), ('E lx', 'exa*(lux)'), ('E*eV', 'exa*(electronvolt)'), ('E eV', 'exa*(electronvolt)'), ('E*sr', 'exa*(steradian)'), ('E sr', 'exa*(steradian)'), ('Emin', 'exa*(minute)'), ('Edeg', 'exa*(degree)'), ('E*Np', 'exa*(neper)'), ('E Np', 'exa*(neper)'), ('Egal', 'exa*(gallon)'), ('E*qt', 'exa*(quart)'), ('E qt', 'exa*(quart)'), ('E*oz', 'exa*(ounce)'), ('E oz', 'exa*(ounce)'), ('E*lb', 'exa*(pound)'), ('E lb', 'exa*(pound)'), ('E*st', 'exa*(stone)'), ('E st', 'exa*(stone)'), ('E*in', 'exa*(inch)'), ('E in', 'exa*(inch)'), ('E*ft', 'exa*(foot)'), ('E ft', 'exa*(foot)'), ('E*yd', 'exa*(yard)'), ('E yd', 'exa*(yard)'), ('E*mi', 'exa*(mile)'), ('E mi', 'exa*(mile)'), ('E*gi', 'exa*(gill)'), ('E gi', 'exa*(gill)'), ('E*pt', 'exa*(pint)'), ('E pt', 'exa*(pint)'), ('min', 'minute'), ('Ycd', 'yotta*(candela)'), ('Y*s', 'yotta*(second)'), ('Y s', 'yotta*(second)'), ('Y*A', 'yotta*(ampere)'), ('Y A', 'yotta*(ampere)'), ('Y*K', 'yotta*(kelvin)'), ('Y K', 'yotta*(kelvin)'), ('Y*m', 'yotta*(metre)'), ('Y m', 'yotta*(metre)'), ('Y*g', 'yotta*(gram)'), ('Y g', 'yotta*(gram)'), ('YBq', 'yotta*(becquerel)'), ('Y*C', 'yotta*(coulomb)'), ('Y C', 'yotta*(coulomb)'), ('Y*S', 'yotta*(siemens)'), ('Y S', 'yotta*(siemens)'), ('YSv', 'yotta*(sievert)'), ('Y*N', 'yotta*(newton)'), ('Y N', 'yotta*(newton)'), ('YPa', 'yotta*(pascal)'), ('YHz', 'yotta*(hertz)'), ('Y*J', 'yotta*(joule)'), ('Y J', 'yotta*(joule)'), ('Y*F', 'yotta*(farad)'), ('Y F', 'yotta*(farad)'), ('YWb', 'yotta*(weber)'), ('Y*T', 'yotta*(tesla)'), ('Y T', 'yotta*(tesla)'), ('Y*H', 'yotta*(henry)'), ('Y H', 'yotta*(henry)'), ('Ylm', 'yotta*(lumen)'), ('Y*W', 'yotta*(watt)'), ('Y W', 'yotta*(watt)'), ('Y*V', 'yotta*(volt)'), ('Y V', 'yotta*(volt)'), ('YGy', 'yotta*(gray)'), ('Y*O', 'yotta*(ohm)'), ('Y O', 'yotta*(ohm)'), ('Ylx', 'yotta*(lux)'), ('Y*u', 'yotta*(atomicmassunit)'), ('Y u', 'yotta*(atomicmassunit)'), ('YeV', 'yotta*(electronvolt)'), ('Ysr', 'yotta*(steradian)'), ('Y*t', 'yotta*(metricton)'), ('Y t', 'yotta*(metricton)'), ('Y*Å', 'yotta*(angstrom)'), ('Y Å', 'yotta*(angstrom)'), ('Y*r', 'yotta*(radian)'), ('Y r', 'yotta*(radian)'), ('Y*L', 'yotta*(liter)'), ('Y L', 'yotta*(liter)'), ('YNp', 'yotta*(neper)'), ('Y*h', 'yotta*(hour)'), ('Y h', 'yotta*(hour)'), ('Y*B', 'yotta*(bel)'), ('Y B', 'yotta*(bel)'), ('Yqt', 'yotta*(quart)'), ('Yoz', 'yotta*(ounce)'), ('Ylb', 'yotta*(pound)'), ('Yst', 'yotta*(stone)'), ('Yin', 'yotta*(inch)'), ('Yft', 'yotta*(foot)'), ('Yyd', 'yotta*(yard)'), ('Ymi', 'yotta*(mile)'), ('Ygi', 'yotta*(gill)'), ('Ypt', 'yotta*(pint)'), ('Zcd', 'zetta*(candela)'), ('Z*s', 'zetta*(second)'), ('Z s', 'zetta*(second)'), ('Z*A', 'zetta*(ampere)'), ('Z A', 'zetta*(ampere)'), ('Z*K', 'zetta*(kelvin)'), ('Z K', 'zetta*(kelvin)'), ('Z*m', 'zetta*(metre)'), ('Z m', 'zetta*(metre)'), ('Z*g', 'zetta*(gram)'), ('Z g', 'zetta*(gram)'), ('ZBq', 'zetta*(becquerel)'), ('Z*C', 'zetta*(coulomb)'), ('Z C', 'zetta*(coulomb)'), ('Z*S', 'zetta*(siemens)'), ('Z S', 'zetta*(siemens)'), ('ZSv', 'zetta*(sievert)'), ('Z*N', 'zetta*(newton)'), ('Z N', 'zetta*(newton)'), ('ZPa', 'zetta*(pascal)'), ('ZHz', 'zetta*(hertz)'), ('Z*J', 'zetta*(joule)'), ('Z J', 'zetta*(joule)'), ('Z*F', 'zetta*(farad)'), ('Z F', 'zetta*(farad)'), ('ZWb', 'zetta*(weber)'), ('Z*T', 'zetta*(tesla)'), ('Z T', 'zetta*(tesla)'), ('Z*H', 'zetta*(henry)'), ('Z H', 'zetta*(henry)'), ('Zlm', 'zetta*(lumen)'), ('Z*W', 'zetta*(watt)'), ('Z W', 'zetta*(watt)'), ('Z*V', 'zetta*(volt)'), ('Z V', 'zetta*(volt)'), ('ZGy', 'zetta*(gray)'), ('Z*O', 'zetta*(ohm)'), ('Z O', 'zetta*(ohm)'), ('Zlx', 'zetta*(lux)'), ('Z*u', 'zetta*(atomicmassunit)'), ('Z u', 'zetta*(atomicmassunit)'), ('ZeV', 'zetta*(electronvolt)'), ('Zsr', 'zetta*(steradian)'), ('Z*t', 'zetta*(metricton)'), ('Z t', 'zetta*(metricton)'), ('Z*Å', 'zetta*(angstrom)'), ('Z Å', 'zetta*(angstrom)'), ('Z*r', 'zetta*(radian)'), ('Z r', 'zetta*(radian)'), ('Z*L', 'zetta*(liter)'), ('Z L', 'zetta*(liter)'), ('ZNp', 'zetta*(neper)'), ('Z*h', 'zetta*(hour)'), ('Z h', 'zetta*(hour)'), ('Z*B', 'zetta*(bel)'), ('Z B', 'zetta*(bel)'), ('Zqt', 'zetta*(quart)'), ('Zoz', 'zetta*(ounce)'), ('Zlb', 'zetta*(pound)'), ('Zst', 'zetta*(stone)'), ('Zin', 'zetta*(inch)'), ('Zft', 'zetta*(foot)'), ('Zyd', 'zetta*(yard)'), ('Zmi', 'zetta*(mile)'), ('Zgi', 'zetta*(gill)'), ('Zpt', 'zetta*(pint)'), ('hcd', 'hecto*(candela)'), ('h*s', 'hecto*(second)'), ('h s', 'hecto*(second)'), ('h*A', 'hecto*(ampere)'), ('h A', 'hecto*(ampere)'), ('h*K', 'hecto*(kelvin)'), ('h K', 'hecto*(kelvin)'), ('h*m', 'hecto*(metre)'), ('h m', 'hecto*(metre)'), ('h*g', 'hecto*(gram)'), ('h g', 'hecto*(gram)'), ('hBq', 'hecto*(becquerel)'), ('h*C', 'hecto*(coulomb)'), ('h C', 'hecto*(coulomb)'), ('h*S', 'hecto*(siemens)'), ('h S', 'hecto*(siemens)'), ('hSv', 'hecto*(sievert)'), ('h*N', 'hecto*(newton)'), ('h N', 'hecto*(newton)'), ('hPa', 'hecto*(pascal)'), ('hHz', 'hecto*(hertz)'), ('h*J', 'hecto*(joule)'), ('h J', 'hecto*(joule)'), ('h*F', 'hecto*(farad)'), ('h F', 'hecto*(farad)'), ('hWb', 'hecto*(weber)'), ('h*T', 'hecto*(tesla)'), ('h T', 'hecto*(tesla)'), ('h*H', 'hecto*(henry)'), ('h H', 'hecto*(henry)'), ('hlm', 'hecto*(lumen)'), ('h*W', 'hecto*(watt)'), ('h W', 'hecto*(watt)'), ('h*V', 'hecto*(volt)'), ('h V', 'hecto*(volt)'), ('hGy', 'hecto*(gray)'), ('h*O', 'hecto*(ohm)'), ('h O', 'hecto*(ohm)'), ('hlx', 'hecto*(lux)'), ('h*u', 'hecto*(atomicmassunit)'), ('h u', 'hecto*(atomicmassunit)'), ('heV', 'hecto*(electronvolt)'), ('hsr', 'hecto*(steradian)'), ('h*t', 'hecto*(metricton)'), ('h t', 'hecto*(metricton)'), ('h*Å', 'hecto*(angstrom)'), ('h Å', 'hecto*(angstrom)'), ('h*r', 'hecto*(radian)'), ('h r', 'hecto*(radian)'), ('h*L', 'hecto*(liter)'), ('h L', 'hecto*(liter)'), ('hNp', 'hecto*(neper)'), ('h*h', 'hecto*(hour)'), ('h h', 'hecto*(hour)'), ('h*B', 'hecto*(bel)'), ('h B', 'hecto*(bel)'), ('hqt', 'hecto*(quart)'), ('hoz', 'hecto*(ounce)'), ('hlb', 'hecto*(pound)'), ('hst', 'hecto*(stone)'), ('hin', 'hecto*(inch)'), ('hft', 'hecto*(foot)'), ('hyd', 'hecto*(yard)'), ('hmi', 'hecto*(mile)'), ('hgi', 'hecto*(gill)'), ('hpt', 'hecto*(pint)'), ('ccd', 'centi*(candela)'), ('c*s', 'centi*(second)'), ('c s', 'centi*(second)'), ('c*A', 'centi*(ampere)'), ('c A', 'centi*(ampere)'), ('c*K', 'centi*(kelvin)'), ('c K', 'centi*(kelvin)'), ('c*m', 'centi*(metre)'), ('c m', 'centi*(metre)'), ('c*g', 'centi*(gram)'), ('c g', 'centi*(gram)'), ('cBq', 'centi*(becquerel)'), ('c*C', 'centi*(coulomb)'), ('c C', 'centi*(coulomb)'), ('c*S', 'centi*(siemens)'), ('c S', 'centi*(siemens)'), ('cSv', 'centi*(sievert)'), ('c*N', 'centi*(newton)'), ('c N', 'centi*(newton)'), ('cPa', 'centi*(pascal)'), ('cHz', 'centi*(hertz)'), ('c*J', 'centi*(joule)'), ('c J', 'centi*(joule)'), ('c*F', 'centi*(farad)'), ('c F', 'centi*(farad)'), ('cWb', 'centi*(weber)'), ('c*T', 'centi*(tesla)'), ('c T', 'centi*(tesla)'), ('c*H', 'centi*(henry)'), ('c H', 'centi*(henry)'), ('clm', 'centi*(lumen)'), ('c*W', 'centi*(watt)'), ('c W', 'centi*(watt)'), ('c*V', 'centi*(volt)'), ('c V', 'centi*(volt)'), ('cGy', 'centi*(gray)'), ('c*O', 'centi*(ohm)'), ('c O', 'centi*(ohm)'), ('clx', 'centi*(lux)'), ('c*u', 'centi*(atomicmassunit)'), ('c u', 'centi*(atomicmassunit)'), ('ceV', 'centi*(electronvolt)'), ('csr', 'centi*(steradian)'), ('c*t', 'centi*(metricton)'), ('c t', 'centi*(metricton)'), ('c*Å', 'centi*(angstrom)'), ('c Å', 'centi*(angstrom)'), ('c*r', 'centi*(radian)'), ('c r', 'centi*(radian)'), ('c*L', 'centi*(liter)'), ('c L', 'centi*(liter)'), ('cNp', 'centi*(neper)'), ('c*h', 'centi*(hour)'), ('c h', 'centi*(hour)'), ('c*B', 'centi*(bel)'), ('c B', 'centi*(bel)'), ('cqt', 'centi*(quart)'), ('coz', 'centi*(ounce)'), ('clb', 'centi*(pound)'), ('cst', 'centi*(stone)'), ('cin', 'centi*(inch)'), ('cft', 'centi*(foot)'), ('cyd', 'centi*(yard)'), ('cmi', 'centi*(mile)'), ('cgi', 'centi*(gill)'), ('cpt', 'centi*(pint)'), ('mcd', 'milli*(candela)'), ('m*s', 'milli*(second)'), ('m s', 'milli*(second)'), ('m*A', 'milli*(ampere)'), ('m A', 'milli*(ampere)'), ('m*K', 'milli*(kelvin)'), ('m K', 'milli*(kelvin)'), ('m*m', 'milli*(metre)'), ('m m', 'milli*(metre)'), ('m*g', 'milli*(gram)'), ('m g', 'milli*(gram)'), ('mBq', 'milli*(becquerel)'), ('m*C', 'milli*(coulomb)'), ('m C', 'milli*(coulomb)'), ('m*S', 'milli*(siemens)'), ('m S', 'milli*(siemens)'), ('mSv', 'milli*(sievert)'), ('m*N', 'milli*(newton)'), ('m N', 'milli*(newton)'), ('mPa', 'milli*(pascal)'), ('mHz', 'milli*(hertz)'), ('m*J', 'milli*(joule)'), ('m J', 'milli*(joule)'), ('m*F', 'milli*(farad)'), ('m F', 'milli*(farad)'), ('mWb', 'milli*(weber)'), ('m*T', 'milli*(tesla)'), ('m T', 'milli*(tesla)'), ('m*H', 'milli*(henry)'), ('m H', 'milli*(henry)'), ('mlm', 'milli*(lumen)'), ('m*W', 'milli*(watt)'), ('m W', 'milli*(watt)'), ('m*V', 'milli*(volt)'), ('m V', 'milli*(volt)'), ('mGy', 'milli*(gray)'), ('m*O', 'milli*(ohm)'), ('m O', 'milli*(ohm)'), ('mlx', 'milli*(lux)'), ('m*u', 'milli*(atomicmassunit)'), ('m u', 'milli*(atomicmassunit)'), ('meV', 'milli*(electronvolt)'), ('msr', 'milli*(steradian)'), ('m*t', 'milli*(metricton)'), ('m t', 'milli*(metricton)'), ('m*Å', 'milli*(angstrom)'), ('m Å', 'milli*(angstrom)'), ('m*r', 'milli*(radian)'), ('m r', 'milli*(radian)'), ('m*L', 'milli*(liter)'), ('m L', 'milli*(liter)'), ('mNp', 'milli*(neper)'), ('m*h', 'milli*(hour)'), ('m h', 'milli*(hour)'), ('m*B', 'milli*(bel)'), ('m B', 'milli*(bel)'), ('mqt', 'milli*(quart)'), ('moz', 'milli*(ounce)'), ('mlb', 'milli*(pound)'), ('mst', 'milli*(stone)'), ('min', 'milli*(inch)'), ('mft', 'milli*(foot)'), ('myd', 'milli*(yard)'), ('mmi', 'milli*(mile)'), ('mgi', 'milli*(gill)'), ('mpt', 'milli*(pint)'), ('mus', 'micro*(second)'), ('muA', 'micro*(ampere)'), ('muK', 'micro*(kelvin)'), ('mum', 'micro*(metre)'), ('mug', 'micro*(gram)'), ('muC', 'micro*(coulomb)'), ('muS', 'micro*(siemens)'), ('muN', 'micro*(newton)'), ('muJ', 'micro*(joule)'), ('muF', 'micro*(farad)'), ('muT', 'micro*(tesla)'), ('muH', 'micro*(henry)'), ('muW', 'micro*(watt)'), ('muV', 'micro*(volt)'), ('muO', 'micro*(ohm)'), ('muu', 'micro*(atomicmassunit)'), ('mut', 'micro*(metricton)'), ('muÅ', 'micro*(angstrom)'), ('mur', 'micro*(radian)'), ('muL', 'micro*(liter)'), ('muh', 'micro*(hour)'), ('muB', 'micro*(bel)'), ('fcd', 'femto*(candela)'), ('f*s', 'femto*(second)'), ('f s', 'femto*(second)'), ('f*A', 'femto*(ampere)'), ('f A', 'femto*(ampere)'), ('f*K', 'femto*(kelvin)'), ('f K', 'femto*(kelvin)'), ('f*m', 'femto*(metre)'), ('f m', 'femto*(metre)'), ('f*g', 'femto*(gram)'), ('f g', 'femto*(gram)'), ('fBq', 'femto*(becquerel)'), ('f*C', 'femto*(coulomb)'), ('f C', 'femto*(coulomb)'), ('f*S', 'femto*(siemens)'), ('f S', 'femto*(siemens)'), ('fSv', 'femto*(sievert)'), ('f*N', 'femto*(newton)'), ('f N', 'femto*(newton)'), ('fPa', 'femto*(pascal)'), ('fHz', 'femto*(hertz)'), ('f*J', 'femto*(joule)'), ('f J', 'femto*(joule)'), ('f*F', 'femto*(farad)'), ('f F', 'femto*(farad)'), ('fWb', 'femto*(weber)'), ('f*T', 'femto*(tesla)'), ('f T', 'femto*(tesla)'), ('f*H', 'femto*(henry)'), ('f H', 'femto*(henry)'), ('flm', 'femto*(lumen)'), ('f*W', 'femto*(watt)'), ('f W', 'femto*(watt)'), ('f*V', 'femto*(volt)'), ('f V', 'femto*(volt)'), ('fGy', 'femto*(gray)'), ('f*O', 'femto*(ohm)'), ('f O', 'femto*(ohm)'), ('flx', 'femto*(lux)'), ('f*u', 'femto*(atomicmassunit)'), ('f u', 'femto*(atomicmassunit)'), ('feV', 'femto*(electronvolt)'), ('fsr', 'femto*(steradian)'), ('f*t', 'femto*(metricton)'), ('f t', 'femto*(metricton)'), ('f*Å', 'femto*(angstrom)'), ('f Å', 'femto*(angstrom)'), ('f*r', 'femto*(radian)'), ('f r', 'femto*(radian)'), ('f*L', 'femto*(liter)'), ('f L', 'femto*(liter)'), ('fNp', 'femto*(neper)'), ('f*h', 'femto*(hour)'), ('f h', 'femto*(hour)'), ('f*B', 'femto*(bel)'), ('f B', 'femto*(bel)'), ('fqt', 'femto*(quart)'), ('foz', 'femto*(ounce)'), ('flb', 'femto*(pound)'), ('fst', 'femto*(stone)'), ('fin', 'femto*(inch)'), ('fft', 'femto*(foot)'), ('fyd', 'femto*(yard)'), ('fmi', 'femto*(mile)'), ('fgi', 'femto*(gill)'), ('fpt', 'femto*(pint)'), ('zcd', 'zepto*(candela)'), ('z*s', 'zepto*(second)'), ('z s', 'zepto*(second)'), ('z*A', 'zepto*(ampere)'), ('z A', 'zepto*(ampere)'), ('z*K', 'zepto*(kelvin)'), ('z K', 'zepto*(kelvin)'), ('z*m', 'zepto*(metre)'), ('z m', 'zepto*(metre)'), ('z*g', 'zepto*(gram)'), ('z g', 'zepto*(gram)'), ('zBq', 'zepto*(becquerel)'), ('z*C', 'zepto*(coulomb)'), ('z C', 'zepto*(coulomb)'), ('z*S', 'zepto*(siemens)'), ('z S', 'zepto*(siemens)'), ('zSv', 'zepto*(sievert)'), ('z*N', 'zepto*(newton)'), ('z N', 'zepto*(newton)'), ('zPa', 'zepto*(pascal)'), ('zHz', 'zepto*(hertz)'), ('z*J', 'zepto*(joule)'), ('z J', 'zepto*(joule)'), ('z*F', 'zepto*(farad)'), ('z F', 'zepto*(farad)'), ('zWb', 'zepto*(weber)'), ('z*T', 'zepto*(tesla)'), ('z T', 'zepto*(tesla)'), ('z*H', 'zepto*(henry)'), ('z H', 'zepto*(henry)'), ('zlm', 'zepto*(lumen)'), ('z*W', 'zepto*(watt)'), ('z W', 'zepto*(watt)'), ('z*V', 'zepto*(volt)'), ('z V', 'zepto*(volt)'), ('zGy', 'zepto*(gray)'), ('z*O', 'zepto*(ohm)'), ('z O', 'zepto*(ohm)'), ('zlx', 'zepto*(lux)'), ('z*u', 'zepto*(atomicmassunit)'), ('z u', 'zepto*(atomicmassunit)'), ('zeV', 'zepto*(electronvolt)'), ('zsr', 'zepto*(steradian)'), ('z*t', 'zepto*(metricton)'), ('z t', 'zepto*(metricton)'), ('z*Å', 'zepto*(angstrom)'), ('z Å', 'zepto*(angstrom)'), ('z*r', 'zepto*(radian)'), ('z r', 'zepto*(radian)'), ('z*L', 'zepto*(liter)'), ('z L', 'zepto*(liter)'), ('zNp', 'zepto*(neper)'), ('z*h', 'zepto*(hour)'), ('z h', 'zepto*(hour)'), ('z*B', 'zepto*(bel)'), ('z B', 'zepto*(bel)'), ('zqt', 'zepto*(quart)'), ('zoz', 'zepto*(ounce)'), ('zlb', 'zepto*(pound)'), ('zst', 'zepto*(stone)'), ('zin', 'zepto*(inch)'), ('zft', 'zepto*(foot)'), ('zyd', 'zepto*(yard)'), ('zmi', 'zepto*(mile)'), ('zgi', 'zepto*(gill)'), ('zpt', 'zepto*(pint)'), ('ycd', 'yocto*(candela)'), ('y*s', 'yocto*(second)'), ('y s', 'yocto*(second)'), ('y*A', 'yocto*(ampere)'), ('y A', 'yocto*(ampere)'), ('y*K', 'yocto*(kelvin)'), ('y K', 'yocto*(kelvin)'), ('y*m', 'yocto*(metre)'), ('y m', 'yocto*(metre)'), ('y*g', 'yocto*(gram)'), ('y g', 'yocto*(gram)'), ('yBq', 'yocto*(becquerel)'), ('y*C', 'yocto*(coulomb)'), ('y C', 'yocto*(coulomb)'), ('y*S', 'yocto*(siemens)'), ('y S', 'yocto*(siemens)'), ('ySv', 'yocto*(sievert)'), ('y*N', 'yocto*(newton)'), ('y N', 'yocto*(newton)'), ('yPa', 'yocto*(pascal)'), ('yHz', 'yocto*(hertz)'), ('y*J', 'yocto*(joule)'), ('y J', 'yocto*(joule)'), ('y*F', 'yocto*(farad)'), ('y F', 'yocto*(farad)'), ('yWb', 'yocto*(weber)'), ('y*T', 'yocto*(tesla)'), ('y T', 'yocto*(tesla)'), ('y*H', 'yocto*(henry)'), ('y H', 'yocto*(henry)'), ('ylm', 'yocto*(lumen)'), ('y*W', 'yocto*(watt)'), ('y W', 'yocto*(watt)'), ('y*V', 'yocto*(volt)'), ('y V', 'yocto*(volt)'), ('yGy', 'yocto*(gray)'), ('y*O', 'yocto*(ohm)'), ('y O', 'yocto*(ohm)'), ('ylx', 'yocto*(lux)'), ('y*u', 'yocto*(atomicmassunit)'), ('y u', 'yocto*(atomicmassunit)'), ('yeV', 'yocto*(electronvolt)'), ('ysr', 'yocto*(steradian)'), ('y*t', 'yocto*(metricton)'), ('y t', 'yocto*(metricton)'), ('y*Å', 'yocto*(angstrom)'), ('y Å', 'yocto*(angstrom)'), ('y*r', 'yocto*(radian)'), ('y r', 'yocto*(radian)'), ('y*L', 'yocto*(liter)'), ('y L', 'yocto*(liter)'), ('yNp', 'yocto*(neper)'), ('y*h', 'yocto*(hour)'), ('y h', 'yocto*(hour)'), ('y*B', 'yocto*(bel)'), ('y B', 'yocto*(bel)'), ('yqt', 'yocto*(quart)'), ('yoz', 'yocto*(ounce)'), ('ylb', 'yocto*(pound)'), ('yst', 'yocto*(stone)'), ('yin', 'yocto*(inch)'), ('yft', 'yocto*(foot)'), ('yyd', 'yocto*(yard)'), ('ymi', 'yocto*(mile)'), ('ygi', 'yocto*(gill)'), ('ypt', 'yocto*(pint)'), ('Pcd', 'peta*(candela)'), ('P*s', 'peta*(second)'), ('P s', 'peta*(second)'), ('P*A', 'peta*(ampere)'), ('P A', 'peta*(ampere)'), ('P*K', 'peta*(kelvin)'), ('P K', 'peta*(kelvin)'), ('P*m', 'peta*(metre)'), ('P m', 'peta*(metre)'), ('P*g', 'peta*(gram)'), ('P g', 'peta*(gram)'), ('PBq', 'peta*(becquerel)'), ('P*C', 'peta*(coulomb)'), ('P C', 'peta*(coulomb)'), ('P*S', 'peta*(siemens)'), ('P S', 'peta*(siemens)'), ('PSv', 'peta*(sievert)'), ('P*N', 'peta*(newton)'), ('P N', 'peta*(newton)'), ('PPa', 'peta*(pascal)'), ('PHz', 'peta*(hertz)'), ('P*J', 'peta*(joule)'), ('P J', 'peta*(joule)'), ('P*F', 'peta*(farad)'), ('P F', 'peta*(farad)'), ('PWb', 'peta*(weber)'), ('P*T', 'peta*(tesla)'), ('P T', 'peta*(tesla)'), ('P*H', 'peta*(henry)'), ('P H', 'peta*(henry)'), ('Plm', 'peta*(lumen)'), ('P*W', 'peta*(watt)'), ('P W', 'peta*(watt)'), ('P*V', 'peta*(volt)'), ('P V', 'peta*(volt)'), ('PGy', 'peta*(gray)'), ('P*O', 'peta*(ohm)'), ('P O', 'peta*(ohm)'), ('Plx', 'peta*(lux)'), ('P*u', 'peta*(atomicmassunit)'), ('P u', 'peta*(atomicmassunit)'), ('PeV', 'peta*(electronvolt)'), ('Psr', 'peta*(steradian)'), ('P*t', 'peta*(metricton)'), ('P t', 'peta*(metricton)'), ('P*Å', 'peta*(angstrom)'), ('P Å', 'peta*(angstrom)'), ('P*r', 'peta*(radian)'), ('P r', 'peta*(radian)'), ('P*L', 'peta*(liter)'), ('P L', 'peta*(liter)'), ('PNp', 'peta*(neper)'), ('P*h', 'peta*(hour)'), ('P h', 'peta*(hour)'), ('P*B', 'peta*(bel)'), ('P B', 'peta*(bel)'), ('Pqt', 'peta*(quart)'), ('Poz', 'peta*(ounce)'), ('Plb', 'peta*(pound)'), ('Pst', 'peta*(stone)'), ('Pin', 'peta*(inch)'), ('Pft', 'peta*(foot)'), ('Pyd', 'peta*(yard)'), ('Pmi', 'peta*(mile)'), ('Pgi', 'peta*(gill)'), ('Ppt', 'peta*(pint)'), ('Tcd', 'tera*(candela)'), ('T*s', 'tera*(second)'), ('T s', 'tera*(second)'), ('T*A', 'tera*(ampere)'), ('T A', 'tera*(ampere)'), ('T*K', 'tera*(kelvin)'), ('T K', 'tera*(kelvin)'), ('T*m', 'tera*(metre)'), ('T m', 'tera*(metre)'), ('T*g', 'tera*(gram)'), ('T g', 'tera*(gram)'), ('TBq', 'tera*(becquerel)'), ('T*C', 'tera*(coulomb)'), ('T C', 'tera*(coulomb)'), ('T*S', 'tera*(siemens)'), ('T S', 'tera*(siemens)'), ('TSv', 'tera*(sievert)'), ('T*N', 'tera*(newton)'), ('T N', 'tera*(newton)'), ('TPa', 'tera*(pascal)'), ('THz', 'tera*(hertz)'), ('T*J', 'tera*(joule)'), ('T J', 'tera*(joule)'), ('T*F', 'tera*(farad)'), ('T F', 'tera*(farad)'), ('TWb', 'tera*(weber)'), ('T*T', 'tera*(tesla)'), ('T T', 'tera*(tesla)'), ('T*H', 'tera*(henry)'), ('T H', 'tera*(henry)'), ('Tlm', 'tera*(lumen)'), ('T*W', 'tera*(watt)'), ('T W', 'tera*(watt)'), ('T*V', 'tera*(volt)'), ('T V', 'tera*(volt)'), ('TGy', 'tera*(gray)'), ('T*O', 'tera*(ohm)'), ('T O', 'tera*(ohm)'), ('Tlx', 'tera*(lux)'), ('T*u', 'tera*(atomicmassunit)'), ('T u', 'tera*(atomicmassunit)'), ('TeV', 'tera*(electronvolt)'), ('Tsr', 'tera*(steradian)'), ('T*t', 'tera*(metricton)'), ('T t', 'tera*(metricton)'), ('T*Å', 'tera*(angstrom)'), ('T Å', 'tera*(angstrom)'), ('T*r', 'tera*(radian)'), ('T r', 'tera*(radian)'), ('T*L', 'tera*(liter)'), ('T L', 'tera*(liter)'), ('TNp', 'tera*(neper)'), ('T*h', 'tera*(hour)'), ('T h', 'tera*(hour)'), ('T*B', 'tera*(bel)'), ('T B', 'tera*(bel)'), ('Tqt', 'tera*(quart)'), ('Toz', 'tera*(ounce)'), ('Tlb', 'tera*(pound)'), ('Tst', 'tera*(stone)'), ('Tin', 'tera*(inch)'), ('Tft', 'tera*(foot)'), ('Tyd', 'tera*(yard)'), ('Tmi', 'tera*(mile)'), ('Tgi', 'tera*(gill)'), ('Tpt', 'tera*(pint)'), ('Gcd', 'giga*(candela)'), ('G*s', 'giga*(second)'), ('G s', 'giga*(second)'), ('G*A', 'giga*(ampere)'), ('G A', 'giga*(ampere)'), ('G*K', 'giga*(kelvin)'), ('G K', 'giga*(kelvin)'), ('G*m', 'giga*(metre)'), ('G m', 'giga*(metre)'), ('G*g', 'giga*(gram)'), ('G g', 'giga*(gram)'), ('GBq', 'giga*(becquerel)'), ('G*C', 'giga*(coulomb)'), ('G C', 'giga*(coulomb)'), ('G*S', 'giga*(siemens)'), ('G S', 'giga*(siemens)'), ('GSv', 'giga*(sievert)'), ('G*N', 'giga*(newton)'), ('G N', 'giga*(newton)'), ('GPa', 'giga*(pascal)'), ('GHz', 'giga*(hertz)'), ('G*J', 'giga*(joule)'), ('G J', 'giga*(joule)'), ('G*F', 'giga*(farad)'), ('G F', 'giga*(farad)'), ('GWb', 'giga*(weber)'), ('G*T', 'giga*(tesla)'), ('G T', 'giga*(tesla)'), ('G*H', 'giga*(henry)'), ('G H', 'giga*(henry)'), ('Glm', 'giga*(lumen)'), ('G*W', 'giga*(watt)'), ('G W', 'giga*(watt)'), ('G*V', 'giga*(volt)'), ('G V', 'giga*(volt)'), ('GGy', 'giga*(gray)'), ('G*O', 'giga*(ohm)'), ('G O', 'giga*(ohm)'), ('Glx', 'giga*(lux)'), ('G*u', 'giga*(atomicmassunit)'), ('G u', 'giga*(atomicmassunit)'), ('GeV', 'giga*(electronvolt)'), ('Gsr', 'giga*(steradian)'), ('G*t', 'giga*(metricton)'), ('G t', 'giga*(metricton)'), ('G*Å', 'giga*(angstrom)'), ('G Å', 'giga*(angstrom)'), ('G*r', 'giga*(radian)'), ('G r', 'giga*(radian)'), ('G*L', 'giga*(liter)'), ('G L', 'giga*(liter)'), ('GNp', 'giga*(neper)'), ('G*h', 'giga*(hour)'), ('G h', 'giga*(hour)'), ('G*B', 'giga*(bel)'), ('G B', 'giga*(bel)'), ('Gqt', 'giga*(quart)'), ('Goz', 'giga*(ounce)'), ('Glb', 'giga*(pound)'), ('Gst', 'giga*(stone)'), ('Gin', 'giga*(inch)'), ('Gft', 'giga*(foot)'), ('Gyd', 'giga*(yard)'), ('Gmi', 'giga*(mile)'), ('Ggi', 'giga*(gill)'), ('Gpt', 'giga*(pint)'), ('Mcd', 'mega*(candela)'), ('M*s', 'mega*(second)'), ('M s', 'mega*(second)'), ('M*A', 'mega*(ampere)'), ('M A', 'mega*(ampere)'), ('M*K', 'mega*(kelvin)'), ('M K', 'mega*(kelvin)'), ('M*m', 'mega*(metre)'), ('M m', 'mega*(metre)'), ('M*g', 'mega*(gram)'), ('M g', 'mega*(gram)'), ('MBq', 'mega*(becquerel)'), ('M*C', 'mega*(coulomb)'), ('M C', 'mega*(coulomb)'), ('M*S', 'mega*(siemens)'), ('M S', 'mega*(siemens)'), ('MSv', 'mega*(sievert)'), ('M*N', 'mega*(newton)'), ('M N', 'mega*(newton)'), ('MPa', 'mega*(pascal)'), ('MHz', 'mega*(hertz)'), ('M*J', 'mega*(joule)'), ('M J', 'mega*(joule)'), ('M*F', 'mega*(farad)'), ('M F', 'mega*(farad)'), ('MWb', 'mega*(weber)'), ('M*T', 'mega*(tesla)'), ('M T', 'mega*(tesla)'), ('M*H', 'mega*(henry)'), ('M H', 'mega*(henry)'), ('Mlm', 'mega*(lumen)'), ('M*W', 'mega*(watt)'), ('M W', 'mega*(watt)'), ('M*V', 'mega*(volt)'), ('M V', 'mega*(volt)'), ('MGy', 'mega*(gray)'), ('M*O', 'mega*(ohm)'), ('M O', 'mega*(ohm)'), ('Mlx', 'mega*(lux)'), ('M*u', 'mega*(atomicmassunit)'), ('M u', 'mega*(atomicmassunit)'), ('MeV', 'mega*(electronvolt)'), ('Msr', 'mega*(steradian)'), ('M*t', 'mega*(metricton)'), ('M t', 'mega*(metricton)'), ('M*Å', 'mega*(angstrom)'), ('M Å', 'mega*(angstrom)'), ('M*r', 'mega*(radian)'), ('M r', 'mega*(radian)'), ('M*L', 'mega*(liter)'), ('M L', 'mega*(liter)'), ('MNp', 'mega*(neper)'), ('M*h', 'mega*(hour)'), ('M h', 'mega*(hour)'), ('M*B', 'mega*(bel)'), ('M B', 'mega*(bel)'), ('Mqt', 'mega*(quart)'), ('Moz', 'mega*(ounce)'), ('Mlb', 'mega*(pound)'), ('Mst', 'mega*(stone)'), ('Min', 'mega*(inch)'), ('Mft', 'mega*(foot)'), ('Myd', 'mega*(yard)'), ('Mmi', 'mega*(mile)'), ('Mgi', 'mega*(gill)'), ('Mpt', 'mega*(pint)'), ('kcd', 'kilo*(candela)'), ('k*s', 'kilo*(second)'), ('k s', 'kilo*(second)'), ('k*A', 'kilo*(ampere)'), ('k A', 'kilo*(ampere)'), ('k*K', 'kilo*(kelvin)'), ('k K', 'kilo*(kelvin)'), ('k*m', 'kilo*(metre)'), ('k m', 'kilo*(metre)'), ('k*g', 'kilo*(gram)'), ('k g', 'kilo*(gram)'), ('kBq', 'kilo*(becquerel)'), ('k*C', 'kilo*(coulomb)'), ('k C', 'kilo*(coulomb)'), ('k*S', 'kilo*(siemens)'), ('k S', 'kilo*(siemens)'), ('kSv', 'kilo*(sievert)'), ('k*N', 'kilo*(newton)'), ('k N', 'kilo*(newton)'), ('kPa', 'kilo*(pascal)'), ('kHz', 'kilo*(hertz)'), ('k*J', 'kilo*(joule)'), ('k J', 'kilo*(joule)'), ('k*F', 'kilo*(farad)'), ('k F', 'kilo*(farad)'), ('kWb', 'kilo*(weber)'), ('k*T', 'kilo*(tesla)'), ('k T', 'kilo*(tesla)'), ('k*H', 'kilo*(henry)'), ('k H', 'kilo*(henry)'), ('klm', 'kilo*(lumen)'), ('k*W', 'kilo*(watt)'), ('k W', 'kilo*(watt)'), ('k*V', 'kilo*(volt)'), ('k V', 'kilo*(volt)'), ('kGy', 'kilo*(gray)'), ('k*O', 'kilo*(ohm)'), ('k O', 'kilo*(ohm)'), ('klx', 'kilo*(lux)'), ('k*u', 'kilo*(atomicmassunit)'), ('k u', 'kilo*(atomicmassunit)'), ('keV', 'kilo*(electronvolt)'), ('ksr', 'kilo*(steradian)'), ('k*t', 'kilo*(metricton)'), ('k t', 'kilo*(metricton)'), ('k*Å', 'kilo*(angstrom)'), ('k Å', 'kilo*(angstrom)'), ('k*r', 'kilo*(radian)'), ('k r', 'kilo*(radian)'), ('k*L', 'kilo*(liter)'), ('k L', 'kilo*(liter)'), ('kNp', 'kilo*(neper)'), ('k*h', 'kilo*(hour)'), ('k h', 'kilo*(hour)'), ('k*B', 'kilo*(bel)'), ('k B', 'kilo*(bel)'), ('kqt', 'kilo*(quart)'), ('koz', 'kilo*(ounce)'), ('klb', 'kilo*(pound)'), ('kst', 'kilo*(stone)'), ('kin', 'kilo*(inch)'), ('kft', 'kilo*(foot)'), ('kyd', 'kilo*(yard)'), ('kmi', 'kilo*(mile)'), ('kgi', 'kilo*(gill)'), ('kpt', 'kilo*(pint)'), ('das', 'deka*(second)'), ('daA', 'deka*(ampere)'), ('daK', 'deka*(kelvin)'), ('dam', 'deka*(metre)'), ('dag', 'deka*(gram)'), ('daC', 'deka*(coulomb)'), ('daS', 'deka*(siemens)'), ('daN', 'deka*(newton)'), ('daJ', 'deka*(joule)'), ('daF', 'deka*(farad)'), ('daT', 'deka*(tesla)'), ('daH', 'deka*(henry)'), ('daW', 'deka*(watt)'), ('daV', 'deka*(volt)'), ('daO', 'deka*(ohm)'), ('dau', 'deka*(atomicmassunit)'), ('dat', 'deka*(metricton)'), ('daÅ', 'deka*(angstrom)'), ('dar', 'deka*(radian)'), ('daL', 'deka*(liter)'), ('dah', 'deka*(hour)'), ('daB', 'deka*(bel)'), ('dcd', 'deci*(candela)'), ('d*s', 'deci*(second)'), ('d s', 'deci*(second)'), ('d*A', 'deci*(ampere)'), ('d A', 'deci*(ampere)'), ('d*K', 'deci*(kelvin)'), ('d K', 'deci*(kelvin)'), ('d*m', 'deci*(metre)'), ('d m', 'deci*(metre)'), ('d*g', 'deci*(gram)'), ('d g', 'deci*(gram)'), ('dBq', 'deci*(becquerel)'), ('d*C', 'deci*(coulomb)'), ('d C', 'deci*(coulomb)'), ('d*S', 'deci*(siemens)'), ('d S', 'deci*(siemens)'), ('dSv', 'deci*(sievert)'), ('d*N', 'deci*(newton)'), ('d N', 'deci*(newton)'), ('dPa', 'deci*(pascal)'), ('dHz', 'deci*(hertz)'), ('d*J', 'deci*(joule)'), ('d J', 'deci*(joule)'), ('d*F', 'deci*(farad)'), ('d F', 'deci*(farad)'), ('dWb', 'deci*(weber)'), ('d*T', 'deci*(tesla)'), ('d T', 'deci*(tesla)'), ('d*H', 'deci*(henry)'), ('d H', 'deci*(henry)'), ('dlm', 'deci*(lumen)'), ('d*W', 'deci*(watt)'), ('d W', 'deci*(watt)'), ('d*V', 'deci*(volt)'), ('d V', 'deci*(volt)'), ('dGy', 'deci*(gray)'), ('d*O', 'deci*(ohm)'), ('d O', 'deci*(ohm)'), ('dlx', 'deci*(lux)'), ('d*u', 'deci*(atomicmassunit)'), ('d u', 'deci*(atomicmassunit)'), ('deV', 'deci*(electronvolt)'), ('dsr', 'deci*(steradian)'), ('d*t', 'deci*(metricton)'), ('d t', 'deci*(metricton)'), ('d*Å', 'deci*(angstrom)'), ('d Å', 'deci*(angstrom)'), ('d*r', 'deci*(radian)'), ('d r', 'deci*(radian)'), ('d*L', 'deci*(liter)'), ('d L', 'deci*(liter)'), ('dNp', 'deci*(neper)'), ('d*h', 'deci*(hour)'), ('d h', 'deci*(hour)'), ('d*B', 'deci*(bel)'), ('d B', 'deci*(bel)'), ('dqt', 'deci*(quart)'), ('doz', 'deci*(ounce)'), ('dlb', 'deci*(pound)'), ('dst', 'deci*(stone)'), ('din', 'deci*(inch)'), ('dft', 'deci*(foot)'), ('dyd', 'deci*(yard)'), ('dmi', 'deci*(mile)'), ('dgi', 'deci*(gill)'), ('dpt', 'deci*(pint)'), ('ncd', 'nano*(candela)'), ('n*s', 'nano*(second)'), ('n s', 'nano*(second)'), ('n*A', 'nano*(ampere)'), ('n A', 'nano*(ampere)'), ('n*K', 'nano*(kelvin)'), ('n K', 'nano*(kelvin)'), ('n*m', 'nano*(metre)'), ('n m', 'nano*(metre)'), ('n*g', 'nano*(gram)'), ('n g', 'nano*(gram)'), ('nBq', 'nano*(becquerel)'), ('n*C', 'nano*(coulomb)'), ('n C', 'nano*(coulomb)'), ('n*S', 'nano*(siemens)'), ('n S', 'nano*(siemens)'), ('nSv', 'nano*(sievert)'), ('n*N', 'nano*(newton)'), ('n N', 'nano*(newton)'), ('nPa', 'nano*(pascal)'), ('nHz', 'nano*(hertz)'), ('n*J', 'nano*(joule)'), ('n J', 'nano*(joule)'), ('n*F', 'nano*(farad)'), ('n F', 'nano*(farad)'), ('nWb', 'nano*(weber)'), ('n*T', 'nano*(tesla)'), ('n T', 'nano*(tesla)'), ('n*H', 'nano*(henry)'), ('n H', 'nano*(henry)'), ('nlm', 'nano*(lumen)'), ('n*W', 'nano*(watt)'), ('n W', 'nano*(watt)'), ('n*V', 'nano*(volt)'), ('n V', 'nano*(volt)'), ('nGy', 'nano*(gray)'), ('n*O', 'nano*(ohm)'), ('n O', 'nano*(ohm)'), ('nlx', 'nano*(lux)'), ('n*u', 'nano*(atomicmassunit)'), ('n u', 'nano*(atomicmassunit)'), ('neV', 'nano*(electronvolt)'), ('nsr', 'nano*(steradian)'), ('n*t', 'nano*(metricton)'), ('n t', 'nano*(metricton)'), ('n*Å', 'nano*(angstrom)'), ('n Å', 'nano*(angstrom)'), ('n*r', 'nano*(radian)'), ('n r', 'nano*(radian)'), ('n*L', 'nano*(liter)'), ('n L', 'nano*(liter)'), ('nNp', 'nano*(neper)'), ('n*h', 'nano*(hour)'), ('n h', 'nano*(hour)'), ('n*B', 'nano*(bel)'), ('n B', 'nano*(bel)'), ('nqt', 'nano*(quart)'), ('noz', 'nano*(ounce)'), ('nlb', 'nano*(pound)'), ('nst', 'nano*(stone)'), ('nin', 'nano*(inch)'), ('nft', 'nano*(foot)'), ('nyd', 'nano*(yard)'), ('nmi', 'nano*(mile)'), ('ngi', 'nano*(gill)'), ('npt', 'nano*(pint)'), ('pcd', 'pico*(candela)'), ('p*s', 'pico*(second)'), ('p s', 'pico*(second)'), ('p*A', 'pico*(ampere)'), ('p A', 'pico*(ampere)'), ('p*K', 'pico*(kelvin)'), ('p K', 'pico*(kelvin)'), ('p*m', 'pico*(metre)'), ('p m', 'pico*(metre)'), ('p*g', 'pico*(gram)'), ('p g', 'pico*(gram)'), ('pBq', 'pico*(becquerel)'), ('p*C', 'pico*(coulomb)'), ('p C', 'pico*(coulomb)'), ('p*S', 'pico*(siemens)'), ('p S', 'pico*(siemens)'), ('pSv', 'pico*(sievert)'), ('p*N', 'pico*(newton)'), ('p N', 'pico*(newton)'), ('pPa', 'pico*(pascal)'), ('pHz', 'pico*(hertz)'), ('p*J', 'pico*(joule)'), ('p J', 'pico*(joule)'), ('p*F', 'pico*(farad)'), ('p F', 'pico*(farad)'), ('pWb', 'pico*(weber)'), ('p*T', 'pico*(tesla)'), ('p T', 'pico*(tesla)'), ('p*H', 'pico*(henry)'), ('p H', 'pico*(henry)'), ('plm', 'pico*(lumen)'), ('p*W', 'pico*(watt)'), ('p W', 'pico*(watt)'), ('p*V', 'pico*(volt)'), ('p V', 'pico*(volt)'), ('pGy', 'pico*(gray)'), ('p*O', 'pico*(ohm)'), ('p O', 'pico*(ohm)'), ('plx', 'pico*(lux)'), ('p*u', 'pico*(atomicmassunit)'), ('p u', 'pico*(atomicmassunit)'), ('peV', 'pico*(electronvolt)'), ('psr', 'pico*(steradian)'), ('p*t', 'pico*(metricton)'), ('p t', 'pico*(metricton)'), ('p*Å', 'pico*(angstrom)'), ('p Å', 'pico*(angstrom)'), ('p*r', 'pico*(radian)'), ('p r', 'pico*(radian)'), ('p*L', 'pico*(liter)'), ('p L', 'pico*(liter)'), ('pNp', 'pico*(neper)'), ('p*h', 'pico*(hour)'), ('p h', 'pico*(hour)'), ('p*B', 'pico*(bel)'), ('p B', 'pico*(bel)'), ('pqt', 'pico*(quart)'), ('poz', 'pico*(ounce)'), ('plb', 'pico*(pound)'), ('pst', 'pico*(stone)'), ('pin', 'pico*(inch)'), ('pft', 'pico*(foot)'), ('pyd', 'pico*(yard)'), ('pmi', 'pico*(mile)'), ('pgi', 'pico*(gill)'), ('ppt', 'pico*(pint)'), ('acd', 'atto*(candela)'), ('a*s', 'atto*(second)'), ('a s', 'atto*(second)'), ('a*A', 'atto*(ampere)'), ('a A', 'atto*(ampere)'), ('a*K', 'atto*(kelvin)'), ('a K', 'atto*(kelvin)'), ('a*m', 'atto*(metre)'), ('a m', 'atto*(metre)'), ('a*g', 'atto*(gram)'), ('a g', 'atto*(gram)'), ('aBq', 'atto*(becquerel)'), ('a*C', 'atto*(coulomb)'), ('a C', 'atto*(coulomb)'), ('a*S', 'atto*(siemens)'), ('a S', 'atto*(siemens)'), ('aSv', 'atto*(sievert)'), ('a*N', 'atto*(newton)'), ('a N', 'atto*(newton)'), ('aPa', 'atto*(pascal)'), ('aHz', 'atto*(hertz)'), ('a*J', 'atto*(joule)'), ('a J', 'atto*(joule)'), ('a*F', 'atto*(farad)'), ('a F', 'atto*(farad)'), ('aWb', 'atto*(weber)'), ('a*T', 'atto*(tesla)'), ('a T', 'atto*(tesla)'), ('a*H', 'atto*(henry)'), ('a H', 'atto*(henry)'), ('alm', 'atto*(lumen)'), ('a*W', 'atto*(watt)'), ('a W', 'atto*(watt)'), ('a*V', 'atto*(volt)'), ('a V', 'atto*(volt)'), ('aGy', 'atto*(gray)'), ('a*O', 'atto*(ohm)'), ('a O', 'atto*(ohm)'), ('alx', 'atto*(lux)'), ('a*u', 'atto*(atomicmassunit)'), ('a u', 'atto*(atomicmassunit)'), ('aeV', 'atto*(electronvolt)'), ('asr', 'atto*(steradian)'), ('a*t', 'atto*(metricton)'), ('a t', 'atto*(metricton)'), ('a*Å', 'atto*(angstrom)'), ('a Å', 'atto*(angstrom)'), ('a*r', 'atto*(radian)'), ('a r', 'atto*(radian)'), ('a*L', 'atto*(liter)'), ('a L', 'atto*(liter)'), ('aNp', 'atto*(neper)'), ('a*h', 'atto*(hour)'), ('a h', 'atto*(hour)'), ('a*B', 'atto*(bel)'), ('a B', 'atto*(bel)'), ('aqt', 'atto*(quart)'), ('aoz', 'atto*(ounce)'), ('alb', 'atto*(pound)'), ('ast', 'atto*(stone)'), ('ain', 'atto*(inch)'), ('aft', 'atto*(foot)'), ('ayd', 'atto*(yard)'), ('ami', 'atto*(mile)'), ('agi', 'atto*(gill)'), ('apt', 'atto*(pint)'), ('Ecd', 'exa*(candela)'), ('E*s', 'exa*(second)'), ('E s', 'exa*(second)'), ('E*A', 'exa*(ampere)'), ('E A', 'exa*(ampere)'), ('E*K', 'exa*(kelvin)'), ('E K', 'exa*(kelvin)'), ('E*m', 'exa*(metre)'), ('E m', 'exa*(metre)'), ('E*g', 'exa*(gram)'), ('E g', 'exa*(gram)'), ('EBq', 'exa*(becquerel)'), ('E*C', 'exa*(coulomb)'), ('E C', 'exa*(coulomb)'), ('E*S', 'exa*(siemens)'), ('E S', 'exa*(siemens)'), ('ESv', 'exa*(sievert)'), ('E*N', 'exa*(newton)'), ('E N', 'exa*(newton)'), ('EPa', 'exa*(pascal)'), ('EHz', 'exa*(hertz)'), ('E*J', 'exa*(joule)'), ('E J', 'exa*(joule)'), ('E*F', 'exa*(farad)'), ('E F', 'exa*(farad)'), ('EWb', 'exa*(weber)'), ('E*T', 'exa*(tesla)'), ('E T', 'exa*(tesla)'), ('E*H', 'exa*(henry)'), ('E H', 'exa*(henry)'), ('Elm', 'exa*(lumen)'), ('E*W', 'exa*(watt)'), ('E W', 'exa*(watt)'), ('E*V', 'exa*(volt)'), ('E V', 'exa*(volt)'), ('EGy', 'exa*(gray)'), ('E*O', 'exa*(ohm)'), ('E O', 'exa*(ohm)'), ('Elx', 'exa*(lux)'), ('E*u', 'exa*(atomicmassunit)'), ('E u', 'exa*(atomicmassunit)'), ('EeV', 'exa*(electronvolt)'), ('Esr', 'exa*(steradian)'), ('E*t', 'exa*(metricton)'), ('E t', 'exa*(metricton)'), ('E*Å', 'exa*(angstrom)'), ('E Å', 'exa*(angstrom)'), ('E*r', 'exa*(radian)'), ('E r', 'exa*(radian)'), ('E*L', 'exa*(liter)'), ('E L', 'exa*(liter)'), ('ENp', 'exa*(neper)'), ('E*h', 'exa*(hour)'), ('E h', 'exa*(hour)'), ('E*B', 'exa*(bel)'), ('E B', 'exa*(bel)'), ('Eqt', 'exa*(quart)'), ('Eoz', 'exa*(ounce)'), ('Elb', 'exa*(pound)'), ('Est', 'exa*(stone)'), ('Ein', 'exa*(inch)'), ('Eft', 'exa*(foot)'), ('Eyd', 'exa*(yard)'), ('Emi', 'exa*(mile)'), ('Egi', 'exa*(gill)'), ('Ept', 'exa*(pint)'), ('ft', 'foot'), ('pt', 'pint'), ('Ys', 'yotta*(second)'), ('YA', 'yotta*(ampere)'), ('YK', 'yotta*(kelvin)'), ('Ym', 'yotta*(metre)'), ('Yg', 'yotta*(gram)'), ('YC', 'yotta*(coulomb)'), ('YS', 'yotta*(siemens)'), ('YN', 'yotta*(newton)'), ('YJ', 'yotta*(joule)'), ('YF', 'yotta*(farad)'), ('YT', 'yotta*(tesla)'), ('YH', 'yotta*(henry)'), ('YW', 'yotta*(watt)'), ('YV', 'yotta*(volt)'), ('YO', 'yotta*(ohm)'), ('Yu', 'yotta*(atomicmassunit)'), ('Yt', 'yotta*(metricton)'), ('YÅ', 'yotta*(angstrom)'), ('Yr', 'yotta*(radian)'), ('YL', 'yotta*(liter)'), ('Yh', 'yotta*(hour)'), ('YB', 'yotta*(bel)'), ('Zs', 'zetta*(second)'), ('ZA', 'zetta*(ampere)'), ('ZK', 'zetta*(kelvin)'), ('Zm', 'zetta*(metre)'), ('Zg', 'zetta*(gram)'), ('ZC', 'zetta*(coulomb)'), ('ZS', 'zetta*(siemens)'), ('ZN', 'zetta*(newton)'), ('ZJ', 'zetta*(joule)'), ('ZF', 'zetta*(farad)'), ('ZT', 'zetta*(tesla)'), ('ZH', 'zetta*(henry)'), ('ZW', 'zetta*(watt)'), ('ZV', 'zetta*(volt)'), ('ZO', 'zetta*(ohm)'), ('Zu', 'zetta*(atomicmassunit)'), ('Zt', 'zetta*(metricton)'), ('ZÅ', 'zetta*(angstrom)'), ('Zr', 'zetta*(radian)'), ('ZL', 'zetta*(liter)'), ('Zh', 'zetta*(hour)'), ('ZB', 'zetta*(bel)'), ('hs', 'hecto*(second)'), ('hA', 'hecto*(ampere)'), ('hK', 'hecto*(kelvin)'), ('hm', 'hecto*(metre)'), ('hg', 'hecto*(gram)'), ('hC', 'hecto*(coulomb)'), ('hS', 'hecto*(siemens)'), ('hN', 'hecto*(newton)'), ('hJ', 'hecto*(joule)'), ('hF', 'hecto*(farad)'), ('hT', 'hecto*(tesla)'), ('hH', 'hecto*(henry)'), ('hW', 'hecto*(watt)'), ('hV', 'hecto*(volt)'), ('hO', 'hecto*(ohm)'), ('hu', 'hecto*(atomicmassunit)'), ('ht', 'hecto*(metricton)'), ('hÅ', 'hecto*(angstrom)'), ('hr', 'hecto*(radian)'), ('hL', 'hecto*(liter)'), ('hh', 'hecto*(hour)'), ('hB', 'hecto*(bel)'), ('cs', 'centi*(second)'), ('cA', 'centi*(ampere)'), ('cK', 'centi*(kelvin)'), ('cm', 'centi*(metre)'), ('cg', 'centi*(gram)'), ('cC', 'centi*(coulomb)'), ('cS', 'centi*(siemens)'), ('cN', 'centi*(newton)'), ('cJ', 'centi*(joule)'), ('cF', 'centi*(farad)'), ('cT', 'centi*(tesla)'), ('cH', 'centi*(henry)'), ('cW', 'centi*(watt)'), ('cV', 'centi*(volt)'), ('cO', 'centi*(ohm)'), ('cu', 'centi*(atomicmassunit)'), ('ct', 'centi*(metricton)'), ('cÅ', 'centi*(angstrom)'), ('cr', 'centi*(radian)'), ('cL', 'centi*(liter)'), ('ch', 'centi*(hour)'), ('cB', 'centi*(bel)'), ('ms', 'milli*(second)'), ('mA', 'milli*(ampere)'), ('mK', 'milli*(kelvin)'), ('mm', 'milli*(metre)'), ('mg', 'milli*(gram)'), ('mC', 'milli*(coulomb)'), ('mS', 'milli*(siemens)'), ('mN', 'milli*(newton)'), ('mJ', 'milli*(joule)'), ('mF', 'milli*(farad)'), ('mT', 'milli*(tesla)'), ('mH', 'milli*(henry)'), ('mW', 'milli*(watt)'), ('mV', 'milli*(volt)'), ('mO', 'milli*(ohm)'), ('mu', 'milli*(atomicmassunit)'), ('mt', 'milli*(metricton)'), ('mÅ', 'milli*(angstrom)'), ('mr', 'milli*(radian)'), ('mL', 'milli*(liter)'), ('mh', 'milli*(hour)'), ('mB', 'milli*(bel)'), ('fs', 'femto*(second)'), ('fA', 'femto*(ampere)'), ('fK', 'femto*(kelvin)'), ('fm', 'femto*(metre)'), ('fg', 'femto*(gram)'), ('fC', 'femto*(coulomb)'), ('fS', 'femto*(siemens)'), ('fN', 'femto*(newton)'), ('fJ', 'femto*(joule)'), ('fF', 'femto*(farad)'), ('fT', 'femto*(tesla)'), ('fH', 'femto*(henry)'), ('fW', 'femto*(watt)'), ('fV', 'femto*(volt)'), ('fO', 'femto*(ohm)'), ('fu', 'femto*(atomicmassunit)'), ('ft', 'femto*(metricton)'), ('fÅ', 'femto*(angstrom)'), ('fr', 'femto*(radian)'), ('fL', 'femto*(liter)'), ('fh', 'femto*(hour)'), ('fB', 'femto*(bel)'), ('zs', 'zepto*(second)'), ('zA', 'zepto*(ampere)'), ('zK', 'zepto*(kelvin)'), ('zm', 'zepto*(metre)'), ('zg', 'zepto*(gram)'), ('zC', 'zepto*(coulomb)'), ('zS', 'zepto*(siemens)'), ('zN', 'zepto*(newton)'), ('zJ', 'zepto*(joule)'), ('zF', 'zepto*(farad)'), ('zT', 'zepto*(tesla)'), ('zH', 'zepto*(henry)'), ('zW', 'zepto*(watt)'), ('zV', 'zepto*(volt)'), ('zO', 'zepto*(ohm)'), ('zu', 'zepto*(atomicmassunit)'), ('zt', 'zepto*(metricton)'), ('zÅ', 'zepto*(angstrom)'), ('zr', 'zepto*(radian)'), ('zL', 'zepto*(liter)'), ('zh', 'zepto*(hour)'), ('zB', 'zepto*(bel)'), ('ys', 'yocto*(second)'), ('yA', 'yocto*(ampere)'), ('yK', 'yocto*(kelvin)'), ('ym', 'yocto*(metre)'), ('yg', 'yocto*(gram)'), ('yC', 'yocto*(coulomb)'), ('yS', 'yocto*(siemens)'), ('yN', 'yocto*(newton)'), ('yJ', 'yocto*(joule)'), ('yF', 'yocto*(farad)'), ('yT', 'yocto*(tesla)'), ('yH', 'yocto*(henry)'), ('yW', 'yocto*(watt)'), ('yV', 'yocto*(volt)'), ('yO', 'yocto*(ohm)'), ('yu', 'yocto*(atomicmassunit)'), ('yt', 'yocto*(metricton)'), ('yÅ', 'yocto*(angstrom)'), ('yr', 'yocto*(radian)'), ('yL', 'yocto*(liter)'), ('yh', 'yocto*(hour)'), ('yB', 'yocto*(bel)'), ('Ps', 'peta*(second)'), ('PA', 'peta*(ampere)'), ('PK', 'peta*(kelvin)'), ('Pm', 'peta*(metre)'), ('Pg', 'peta*(gram)'), ('PC', 'peta*(coulomb)'), ('PS', 'peta*(siemens)'), ('PN', 'peta*(newton)'), ('PJ', 'peta*(joule)'), ('PF', 'peta*(farad)'), ('PT', 'peta*(tesla)'), ('PH', 'peta*(henry)'), ('PW', 'peta*(watt)'), ('PV', 'peta*(volt)'), ('PO', 'peta*(ohm)'), ('Pu', 'peta*(atomicmassunit)'), ('Pt', 'peta*(metricton)'), ('PÅ', 'peta*(angstrom)'), ('Pr', 'peta*(radian)'), ('PL', 'peta*(liter)'), ('Ph', 'peta*(hour)'), ('PB', 'peta*(bel)'), ('Ts', 'tera*(second)'), ('TA', 'tera*(ampere)'), ('TK', 'tera*(kelvin)'), ('Tm', 'tera*(metre)'), ('Tg', 'tera*(gram)'), ('TC', 'tera*(coulomb)'), ('TS', 'tera*(siemens)'), ('TN', 'tera*(newton)'), ('TJ', 'tera*(joule)'), ('TF', 'tera*(farad)'), ('TT', 'tera*(tesla)'), ('TH', 'tera*(henry)'), ('TW', 'tera*(watt)'), ('TV', 'tera*(volt)'), ('TO', 'tera*(ohm)'), ('Tu', 'tera*(atomicmassunit)'), ('Tt', 'tera*(metricton)'), ('TÅ', 'tera*(angstrom)'), ('Tr', 'tera*(radian)'), ('TL', 'tera*(liter)'), ('Th', 'tera*(hour)'), ('TB', 'tera*(bel)'), ('Gs', 'giga*(second)'), ('GA', 'giga*(ampere)'), ('GK', 'giga*(kelvin)'), ('Gm', 'giga*(metre)'), ('Gg', 'giga*(gram)'), ('GC', 'giga*(coulomb)'), ('GS', 'giga*(siemens)'), ('GN', 'giga*(newton)'), ('GJ', 'giga*(joule)'), ('GF', 'giga*(farad)'), ('GT', 'giga*(tesla)'), ('GH', 'giga*(henry)'), ('GW', 'giga*(watt)'), ('GV', 'giga*(volt)'), ('GO', 'giga*(ohm)'), ('Gu', 'giga*(atomicmassunit)'), ('Gt', 'giga*(metricton)'), ('GÅ', 'giga*(angstrom)'), ('Gr', 'giga*(radian)'), ('GL', 'giga*(liter)'), ('Gh', 'giga*(hour)'), ('GB', 'giga*(bel)'), ('Ms', 'mega*(second)'), ('MA', 'mega*(ampere)'), ('MK', 'mega*(kelvin)'), ('Mm', 'mega*(metre)'), ('Mg', 'mega*(gram)'), ('MC', 'mega*(coulomb)'), ('MS', 'mega*(siemens)'), ('MN', 'mega*(newton)'), ('MJ', 'mega*(joule)'), ('MF', 'mega*(farad)'), ('MT', 'mega*(tesla)'), ('MH', 'mega*(henry)'), ('MW', 'mega*(watt)'), ('MV', 'mega*(volt)'), ('MO', 'mega*(ohm)'), ('Mu', 'mega*(atomicmassunit)'), ('Mt', 'mega*(metricton)'), ('MÅ', 'mega*(angstrom)'), ('Mr', 'mega*(radian)'), ('ML', 'mega*(liter)'), ('Mh', 'mega*(hour)'), ('MB', 'mega*(bel)'), ('ks', 'kilo*(second)'), ('kA', 'kilo*(ampere)'), ('kK', 'kilo*(kelvin)'), ('km', 'kilo*(metre)'), ('kg', 'kilo*(gram)'), ('kC', 'kilo*(coulomb)'), ('kS', 'kilo*(siemens)'), ('kN', 'kilo*(newton)'), ('kJ', 'kilo*(joule)'), ('kF', 'kilo*(farad)'), ('kT', 'kilo*(tesla)'), ('kH', 'kilo*(henry)'), ('kW', 'kilo*(watt)'), ('kV', 'kilo*(volt)'), ('kO', 'kilo*(ohm)'), ('ku', 'kilo*(atomicmassunit)'), ('kt', 'kilo*(metricton)'), ('kÅ', 'kilo*(angstrom)'), ('kr', 'kilo*(radian)'), ('kL', 'kilo*(liter)'), ('kh', 'kilo*(hour)'), ('kB', 'kilo*(bel)'), ('ds', 'deci*(second)'), ('dA', 'deci*(ampere)'), ('dK', 'deci*(kelvin)'), ('dm', 'deci*(metre)'), ('dg', 'deci*(gram)'), ('dC', 'deci*(coulomb)'), ('dS', 'deci*(siemens)'), ('dN', 'deci*(newton)'), ('dJ', 'deci*(joule)'), ('dF', 'deci*(farad)'), ('dT', 'deci*(tesla)'), ('dH', 'deci*(henry)'), ('dW', 'deci*(watt)'), ('dV', 'deci*(volt)'), ('dO', 'deci*(ohm)'), ('du', 'deci*(atomicmassunit)'), ('dt', 'deci*(metricton)'), ('dÅ', 'deci*(angstrom)'), ('dr', 'deci*(radian)'), ('dL', 'deci*(liter)'), ('dh', 'deci*(hour)'), ('dB', 'deci*(bel)'), ('ns', 'nano*(second)'), ('nA', 'nano*(ampere)'), ('nK', 'nano*(kelvin)'), ('nm', 'nano*(metre)'), ('ng', 'nano*(gram)'), ('nC', 'nano*(coulomb)'), ('nS', 'nano*(siemens)'), ('nN', 'nano*(newton)'), ('nJ', 'nano*(joule)'), ('nF', 'nano*(farad)'), ('nT', 'nano*(tesla)'), ('nH', 'nano*(henry)'), ('nW', 'nano*(watt)'), ('nV', 'nano*(volt)'), ('nO', 'nano*(ohm)'), ('nu', 'nano*(atomicmassunit)'), ('nt', 'nano*(metricton)'), ('nÅ', 'nano*(angstrom)'), ('nr', 'nano*(radian)'), ('nL', 'nano*(liter)'), ('nh', 'nano*(hour)'), ('nB', 'nano*(bel)'), ('ps', 'pico*(second)'), ('pA', 'pico*(ampere)'), ('pK', 'pico*(kelvin)'), ('pm', 'pico*(metre)'), ('pg', 'pico*(gram)'), ('pC', 'pico*(coulomb)'), ('pS', 'pico*(siemens)'), ('pN', 'pico*(newton)'), ('pJ', 'pico*(joule)'), ('pF', 'pico*(farad)'), ('pT', 'pico*(tesla)'), ('pH', 'pico*(henry)'), ('pW', 'pico*(watt)'), ('pV', 'pico*(volt)'), ('pO', 'pico*(ohm)'), ('pu', 'pico*(atomicmassunit)'), ('pt', 'pico*(metricton)'), ('pÅ', 'pico*(angstrom)'), ('pr', 'pico*(radian)'), ('pL', 'pico*(liter)'), ('ph', 'pico*(hour)'), ('pB', 'pico*(bel)'), ('as', 'atto*(second)'), ('aA', 'atto*(ampere)'), ('aK', 'atto*(kelvin)'), ('am', 'atto*(metre)'), ('ag', 'atto*(gram)'), ('aC', 'atto*(coulomb)'), ('aS', 'atto*(siemens)'), ('aN', 'atto*(newton)'), ('aJ', 'atto*(joule)'), ('aF', 'atto*(farad)'), ('aT', 'atto*(tesla)'), ('aH', 'atto*(henry)'), ('aW', 'atto*(watt)'), ('aV', 'atto*(volt)'), ('aO', 'atto*(ohm)'), ('au', 'atto*(atomicmassunit)'), ('at', 'atto*(metricton)'), ('aÅ', 'atto*(angstrom)'), ('ar', 'atto*(radian)'), ('aL', 'atto*(liter)'), ('ah', 'atto*(hour)'), ('aB', 'atto*(bel)'), ('Es', 'exa*(second)'), ('EA', 'exa*(ampere)'), ('EK', 'exa*(kelvin)'), ('Em', 'exa*(metre)'), ('Eg', 'exa*(gram)'), ('EC', 'exa*(coulomb)'), ('ES', 'exa*(siemens)'), ('EN', 'exa*(newton)'), ('EJ', 'exa*(joule)'), ('EF', 'exa*(farad)'), ('ET', 'exa*(tesla)'), ('EH', 'exa*(henry)'), ('EW', 'exa*(watt)'), ('EV', 'exa*(volt)'), ('EO', 'exa*(ohm)'), ('Eu', 'exa*(atomicmassunit)'), ('Et', 'exa*(metricton)'), ('EÅ', 'exa*(angstrom)'), ('Er', 'exa*(radian)'), ('EL', 'exa*(liter)'), ('Eh', 'exa*(hour)'), ('EB', 'exa*(bel)'), ('fl oz', 'fluid ounce'), ('mol', 'mole'), ('kat', 'katal'), ('min', 'minute'), ('deg', 'degree'), ('gal', 'gallon'), ('cd', 'candela'), ('Bq', 'becquerel'), ('Sv', 'sievert'), ('Pa', 'pascal'), ('Hz', 'hertz'), ('Wb', 'weber'), ('lm', 'lumen'), ('Gy', 'gray'), ('lx', 'lux'), ('eV', 'electronvolt'), ('sr', 'steradian'), ('Np', 'neper'), ('qt', 'quart'), ('oz', 'ounce'), ('lb', 'pound'), ('st', 'stone'), ('in', 'inch'), ('ft', 'foot'), ('yd', 'yard'), ('mi', 'mile'), ('gi', 'gill'), ('pt', 'pint'), ('s', 'second'), ('A', 'ampere'), ('K', 'kelvin'), ('m', 'metre'), ('g', 'gram'), ('C', 'coulomb'), ('S', 'siemens'), ('N', 'newton'), ('J', 'joule'), ('F', 'farad'), ('T', 'tesla'), ('H', 'henry'), ('W', 'watt'), ('V', 'volt'), ('O', 'ohm'), ('u', 'atomicmassunit'), ('t', 'metricton'), ('Å', 'angstrom'), ('r', 'radian'), ('L', 'liter'), ('h', 'hour'), ('B', 'bel')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('becquerel', '(second**(-1))'), ('coulomb', '(second*ampere)'), ('siemens', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)'), ('sievert', '(metre**2*second**(-2))'), ('newton', '(metre*kilo*gram*second**(-2))'), ('pascal', '(metre**(-1)*kilogram*second**(-2))'), ('hertz', '(second**(-1))'), ('joule', '(metre**2*kilo*gram*second**(-2))'), ('farad', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)'), ('weber', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))'), ('tesla', '(kilo*gram*second**(-2)*ampere**(-1))'), ('henry', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))'), ('lumen', '(candela)'), ('katal', '(second**(-1)*mole)'), ('watt', '(metre**2*kilo*gram*second**(-3))'), ('volt', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))'), ('gray', '(metre**2*second**(-2))'), ('ohm', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))'), ('lux', '(metre**(-2)*candela)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('fluid ounce', '(28.4130625*milli*litre)'), ('gallon', '(4546.09*litre)'), ('quart', '(1.1365225*litre)'), ('ounce', '(28.349523125*gram)'), ('pound', '(0.45359237*kilo*gram)'), ('stone', '(6.35029318*kilo*gram)'), ('inch', '(0.0254*metre)'), ('foot', '(0.3048*metre)'), ('yard', '(0.9144*metre)'), ('mile', '(1609.344*metre)'), ('gill', '(142.0653125*milli*litre)'), ('pint', '(568.26125*milli*litre)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('astronomicalunit', '(149597870700*metre)'), ('atomicmassunit', '(1.66054*10**(-27)*kilo*gram)'), ('nauticalmile', '(1852*metre)'), ('electronvolt', '(1.60218*10**(-19)*joule)'), ('angleminute', '(pi/10800)'), ('anglesecond', '(pi/648000)'), ('steradian', '(1)'), ('metricton', '(10**3*kilo*gram)'), ('roentgen', '(2.58*10**(-4)*kelvin/(kilo*gram))'), ('angstrom', '(10**(-10)*metre)'), ('hectare', '(10**4*metre**2)'), ('radian', '(1)'), ('minute', '(60*second)'), ('degree', '(pi/180)'), ('curie', '(3.7*10**10*becquerel)'), ('liter', '(10**(-3)*metre**3)'), ('neper', '(1)'), ('knot', '((1852/3600)*metre/second)'), ('barn', '(10**(-28)*metre**2)'), ('hour', '(3600*second)'), ('day', '(86400*second)'), ('are', '(10**2*metre**2)'), ('bar', '(10**5*pascal)'), ('rad', '(10**(-2)*gray)'), ('rem', '(10**(-2)*sievert)'), ('bel', '((1/2)*log(10))')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('becquerel', '(second**(-1))'), ('coulomb', '(second*ampere)'), ('siemens', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)'), ('sievert', '(metre**2*second**(-2))'), ('newton', '(metre*kilo*gram*second**(-2))'), ('pascal', '(metre**(-1)*kilogram*second**(-2))'), ('hertz', '(second**(-1))'), ('joule', '(metre**2*kilo*gram*second**(-2))'), ('farad', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)'), ('weber', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))'), ('tesla', '(kilo*gram*second**(-2)*ampere**(-1))'), ('henry', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))'), ('lumen', '(candela)'), ('katal', '(second**(-1)*mole)'), ('watt', '(metre**2*kilo*gram*second**(-3))'), ('volt', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))'), ('gray', '(metre**2*second**(-2))'), ('ohm', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))'), ('lux', '(metre**(-2)*candela)')], [('candela', 'candela'), ('second', 'second'), ('ampere', 'ampere'), ('kelvin', 'kelvin'), ('metre', 'metre'), ('gram', 'gram'), ('mole', 'mole'), ('yotta', '(10**24)'), ('zetta', '(10**21)'), ('hecto', '(10**2) '), ('centi', '(10**(-2)) '), ('milli', '(10**(-3)) '), ('micro', '(10**(-6)) '), ('femto', '(10**(-15))'), ('zepto', '(10**(-21))'), ('yocto', '(10**(-24))'), ('peta', '(10**15)'), ('tera', '(10**12)'), ('giga', '(10**9) '), ('mega', '(10**6) '), ('kilo', '(10**3) '), ('deka', '(10**1) '), ('deci', '(10**(-1)) '), ('nano', '(10**(-9)) '), ('pico', '(10**(-12))'), ('atto', '(10**(-18))'), ('exa', '(10**18)')]]
 list_of_SI_base_unit_dimensions=[('candela', 'cd', 'luminous_intensity', [('candelas', [' ', '*', '/']), 'Candela', ('Candelas', [' ', '*', '/'])]), ('second', 's', 'time', [('seconds', [' ', '*', '/'])]), ('ampere', 'A', 'electric_current', [('amperes', [' ', '*', '/']), 'Ampere', ('Amperes', [' ', '*', '/'])]), ('kelvin', 'K', 'temperature', [('kelvins', [' ', '*', '/']), 'Kelvin', ('Kelvins', [' ', '*', '/'])]), ('metre', 'm', 'length', [('metres', [' ', '*', '/']), 'meter', ('meters', [' ', '*', '/'])]), ('gram', 'g', 'mass', [('grams', [' ', '*', '/'])]), ('mole', 'mol', 'amount_of_substance', [('moles', [' ', '*', '/'])])]
 list_of_SI_prefixes=[('yotta', 'Y', '(10**24)'), ('zetta', 'Z', '(10**21)'), ('hecto', 'h', '(10**2) '), ('centi', 'c', '(10**(-2)) '), ('milli', 'm', '(10**(-3)) '), ('micro', 'mu', '(10**(-6)) '), ('femto', 'f', '(10**(-15))'), ('zepto', 'z', '(10**(-21))'), ('yocto', 'y', '(10**(-24))'), ('peta', 'P', '(10**15)'), ('tera', 'T', '(10**12)'), ('giga', 'G', '(10**9) '), ('mega', 'M', '(10**6) '), ('kilo', 'k', '(10**3) '), ('deka', 'da', '(10**1) '), ('deci', 'd', '(10**(-1)) '), ('nano', 'n', '(10**(-9)) '), ('pico', 'p', '(10**(-12))'), ('atto', 'a', '(10**(-18))'), ('exa', 'E', '(10**18)')]
-list_of_common_units_in_SI=[('astronomicalunit', 'au', '(149597870700*metre)', [('astronomicalunits', [' ', '*', '/'])]), ('atomicmassunit', 'u', '(1.66054*10**(-27)*kilo*gram)', [('atomicmassunits', [' ', '*', '/'])]), ('nauticalmile', 'nmi', '(1852*metre)', [('nauticalmiles', [' ', '*', '/'])]), ('electronvolt', 'eV', '(1.60218*10**(-19)*joule)', [('electronvolts', [' ', '*', '/'])]), ('angleminute', "'", '(pi/10800)', []), ('anglesecond', '"', '(pi/648000)', []), ('steradian', 'sr', '(1)', [('steradians', [' ', '*', '/'])]), ('metricton', 't', '(10**3*kilo*gram)', [('tonne', [' ', '*', '/']), ('tonnes', [' ', '*', '/'])]), ('roentgen', 'R', '(2.58*10**(-4)*kelvin/(kilo*gram))', [('roentgens', [' ', '*', '/']), 'Roentgen', ('Roentgens', [' ', '*', '/']), 'Röntgen']), ('angstrom', 'Å', '(10**(-10)*metre)', [('angstroms', [' ', '*', '/']), 'Angstrom', ('Angstroms', [' ', '*', '/']), 'Ångström']), ('hectare', 'ha', '(10**4*metre**2)', [('hectares', [' ', '*', '/'])]), ('radian', 'r', '(1)', [('radians', [' ', '*', '/'])]), ('minute', 'min', '(60*second)', [('minutes', [' ', '*', '/'])]), ('degree', 'deg', '(pi/180)', [('degrees', [' ', '*', '/'])]), ('curie', 'Ci', '(3.7*10**10*becquerel)', [('curies', [' ', '*', '/'])]), ('liter', 'L', '(10**(-3)*metre**3)', [('liters', [' ', '*', '/'])]), ('neper', 'Np', '(1)', [('nepers', [' ', '*', '/']), 'Neper', ('Nepers', [' ', '*', '/'])]), ('knot', 'kn', '((1852/3600)*metre/second)', [('knots', [' ', '*', '/'])]), ('barn', 'b', '(10**(-28)*metre**2)', [('barns', [' ', '*', '/'])]), ('hour', 'h', '(3600*second)', [('hours', [' ', '*', '/'])]), ('day', 'd', '(86400*second)', [('days', [' ', '*', '/'])]), ('are', 'a', '(10**2*metre**2)', [('ares', [' ', '*', '/'])]), ('bar', 'bar', '(10**5*pascal)', [('bars', [' ', '*', '/'])]), ('rad', 'rad', '(10**(-2)*gray)', [('rads', [' ', '*', '/'])]), ('rem', 'rem', '(10**(-2)*sievert)', [('rems', [' ', '*', '/'])]), ('bel', 'B', '((1/2)*log(10))', [('bels', [' ', '*', '/']), 'Bel', ('Bels', [' ', '*', '/'])])]
+list_of_common_units_in_SI=[('astronomicalunit', 'au', '(149597870700*metre)', [('astronomicalunits', [' ', '*', '/'])]), ('atomicmassunit', 'u', '(1.66054*10**(-27)*kilo*gram)', [('atomicmassunits', [' ', '*', '/'])]), ('nauticalmile', 'nmi', '(1852*metre)', [('nauticalmiles', [' ', '*', '/'])]), ('electronvolt', 'eV', '(1.60218*10**(-19)*joule)', [('electronvolts', [' ', '*', '/'])]), ('angleminute', "'", '(pi/10800)', []), ('anglesecond', '"', '(pi/648000)', []), ('steradian', 'sr', '(1)', [('steradians', [' ', '*', '/'])]), ('metricton', 't', '(10**3*kilo*gram)', [('tonne', [' ', '*', '/']), ('tonnes', [' ', '*', '/'])]), ('roentgen', 'R', '(2.58*10**(-4)*kelvin/(kilo*gram))', [('roentgens', [' ', '*', '/']), 'Roentgen', ('Roentgens', [' ', '*', '/']), 'Röntgen']), ('angstrom', 'Å', '(10**(-10)*metre)', [('angstroms', [' ', '*', '/']), 'Angstrom', ('Angstroms', [' ', '*', '/']), 'Ångström']), ('hectare', 'ha', '(10**4*metre**2)', [('hectares', [' ', '*', '/'])]), ('radian', 'r', '(1)', [('radians', [' ', '*', '/'])]), ('minute', 'min', '(60*second)', [('minutes', [' ', '*', '/'])]), ('degree', 'deg', '(pi/180)', [('degrees', [' ', '*', '/'])]), ('curie', 'Ci', '(3.7*10**10*becquerel)', [('curies', [' ', '*', '/'])]), ('liter', 'L', '(10**(-3)*metre**3)', [('liters', [' ', '*', '/']), 'litre', ('litres', [' ', '*', '/'])]), ('neper', 'Np', '(1)', [('nepers', [' ', '*', '/']), 'Neper', ('Nepers', [' ', '*', '/'])]), ('knot', 'kn', '((1852/3600)*metre/second)', [('knots', [' ', '*', '/'])]), ('barn', 'b', '(10**(-28)*metre**2)', [('barns', [' ', '*', '/'])]), ('hour', 'h', '(3600*second)', [('hours', [' ', '*', '/'])]), ('day', 'd', '(86400*second)', [('days', [' ', '*', '/'])]), ('are', 'a', '(10**2*metre**2)', [('ares', [' ', '*', '/'])]), ('bar', 'bar', '(10**5*pascal)', [('bars', [' ', '*', '/'])]), ('rad', 'rad', '(10**(-2)*gray)', [('rads', [' ', '*', '/'])]), ('rem', 'rem', '(10**(-2)*sievert)', [('rems', [' ', '*', '/'])]), ('bel', 'B', '((1/2)*log(10))', [('bels', [' ', '*', '/']), 'Bel', ('Bels', [' ', '*', '/'])])]
 list_of_derived_SI_units_in_SI_base_units=[('becquerel', 'Bq', '(second**(-1))', [('becquerels', [' ', '*', '/']), 'Becquerel', ('Becquerels', [' ', '*', '/'])]), ('coulomb', 'C', '(second*ampere)', [('coulombs', [' ', '*', '/']), 'Coulomb', ('Coulombs', [' ', '*', '/'])]), ('siemens', 'S', '(metre**(-2)*kilo*gram**(-1)*second**3*ampere**2)', [('Siemens', [' ', '*', '/'])]), ('sievert', 'Sv', '(metre**2*second**(-2))', [('sieverts', [' ', '*', '/']), 'Sievert', ('Sieverts', [' ', '*', '/'])]), ('newton', 'N', '(metre*kilo*gram*second**(-2))', [('newtons', [' ', '*', '/']), 'Newton', ('Newtons', [' ', '*', '/'])]), ('pascal', 'Pa', '(metre**(-1)*kilogram*second**(-2))', [('pascals', [' ', '*', '/']), 'Pascal', ('Pascals', [' ', '*', '/'])]), ('hertz', 'Hz', '(second**(-1))', []), ('joule', 'J', '(metre**2*kilo*gram*second**(-2))', [('joules', [' ', '*', '/']), 'Joule', ('Joules', [' ', '*', '/'])]), ('farad', 'F', '(metre**(-2)*(kilo*gram)**(-1)*second**4*ampere**2)', [('farads', [' ', '*', '/']), 'Farad', ('Farads', [' ', '*', '/'])]), ('weber', 'Wb', '(metre**2*kilo*gram*second**(-2)*ampere**(-1))', [('webers', [' ', '*', '/']), 'Weber', ('Webers', [' ', '*', '/'])]), ('tesla', 'T', '(kilo*gram*second**(-2)*ampere**(-1))', [('teslas', [' ', '*', '/']), 'Tesla', ('Teslas', [' ', '*', '/'])]), ('henry', 'H', '(metre**2*kilo*gram*second**(-2)*ampere**(-2))', [('henrys', [' ', '*', '/']), 'Henry', ('Henrys', [' ', '*', '/'])]), ('lumen', 'lm', '(candela)', [('lumens', [' ', '*', '/'])]), ('katal', 'kat', '(second**(-1)*mole)', [('katals', [' ', '*', '/']), 'Katal', ('Katals', [' ', '*', '/'])]), ('watt', 'W', '(metre**2*kilo*gram*second**(-3))', [('watts', [' ', '*', '/']), 'Watt', ('Watts', [' ', '*', '/'])]), ('volt', 'V', '(metre**2*kilo*gram*second**(-3)*ampere**(-1))', [('volts', [' ', '*', '/']), 'Volt', ('Volts', [' ', '*', '/'])]), ('gray', 'Gy', '(metre**2*second**(-2))', [('grays', [' ', '*', '/']), 'Gray', ('Grays', [' ', '*', '/'])]), ('ohm', 'O', '(metre**2*kilo*gram*second**(-3)*ampere**(-2))', [('ohms', [' ', '*', '/']), 'Ohm', ('Ohms', [' ', '*', '/'])]), ('lux', 'lx', '(metre**(-2)*candela)', [])]
 list_of_imperial_units=[('fluid ounce', 'fl oz', '(28.4130625*milli*litre)', [('fluid ounces', [' ', '*', '/'])]), ('gallon', 'gal', '(4546.09*litre)', [('gallons', [' ', '*', '/'])]), ('quart', 'qt', '(1.1365225*litre)', [('quarts', [' ', '*', '/'])]), ('ounce', 'oz', '(28.349523125*gram)', [('ounces', [' ', '*', '/'])]), ('pound', 'lb', '(0.45359237*kilo*gram)', [('pounds', [' ', '*', '/'])]), ('stone', 'st', '(6.35029318*kilo*gram)', []), ('inch', 'in', '(0.0254*metre)', [('inches', [' ', '*', '/'])]), ('foot', 'ft', '(0.3048*metre)', ['feet']), ('yard', 'yd', '(0.9144*metre)', [('yards', [' ', '*', '/'])]), ('mile', 'mi', '(1609.344*metre)', [('miles', [' ', '*', '/'])]), ('gill', 'gi', '(142.0653125*milli*litre)', [('gills', [' ', '*', '/'])]), ('pint', 'pt', '(568.26125*milli*litre)', [('pints', [' ', '*', '/'])])]
-list_of_very_common_units_in_SI=[('atomicmassunit', 'u', '(1.66054*10**(-27)*kilo*gram)', [('atomicmassunits', [' ', '*', '/'])]), ('electronvolt', 'eV', '(1.60218*10**(-19)*joule)', [('electronvolts', [' ', '*', '/'])]), ('steradian', 'sr', '(1)', [('steradians', [' ', '*', '/'])]), ('metricton', 't', '(10**3*kilo*gram)', [('tonne', [' ', '*', '/']), ('tonnes', [' ', '*', '/'])]), ('angstrom', 'Å', '(10**(-10)*metre)', [('angstroms', [' ', '*', '/']), 'Angstrom', ('Angstroms', [' ', '*', '/']), 'Ångström']), ('radian', 'r', '(1)', [('radians', [' ', '*', '/'])]), ('minute', 'min', '(60*second)', [('minutes', [' ', '*', '/'])]), ('degree', 'deg', '(pi/180)', [('degrees', [' ', '*', '/'])]), ('liter', 'L', '(10**(-3)*metre**3)', [('liters', [' ', '*', '/'])]), ('neper', 'Np', '(1)', [('nepers', [' ', '*', '/']), 'Neper', ('Nepers', [' ', '*', '/'])]), ('hour', 'h', '(3600*second)', [('hours', [' ', '*', '/'])]), ('bel', 'B', '((1/2)*log(10))', [('bels', [' ', '*', '/']), 'Bel', ('Bels', [' ', '*', '/'])])]
+list_of_very_common_units_in_SI=[('atomicmassunit', 'u', '(1.66054*10**(-27)*kilo*gram)', [('atomicmassunits', [' ', '*', '/'])]), ('electronvolt', 'eV', '(1.60218*10**(-19)*joule)', [('electronvolts', [' ', '*', '/'])]), ('steradian', 'sr', '(1)', [('steradians', [' ', '*', '/'])]), ('metricton', 't', '(10**3*kilo*gram)', [('tonne', [' ', '*', '/']), ('tonnes', [' ', '*', '/'])]), ('angstrom', 'Å', '(10**(-10)*metre)', [('angstroms', [' ', '*', '/']), 'Angstrom', ('Angstroms', [' ', '*', '/']), 'Ångström']), ('radian', 'r', '(1)', [('radians', [' ', '*', '/'])]), ('minute', 'min', '(60*second)', [('minutes', [' ', '*', '/'])]), ('degree', 'deg', '(pi/180)', [('degrees', [' ', '*', '/'])]), ('liter', 'L', '(10**(-3)*metre**3)', [('liters', [' ', '*', '/']), 'litre', ('litres', [' ', '*', '/'])]), ('neper', 'Np', '(1)', [('nepers', [' ', '*', '/']), 'Neper', ('Nepers', [' ', '*', '/'])]), ('hour', 'h', '(3600*second)', [('hours', [' ', '*', '/'])]), ('bel', 'B', '((1/2)*log(10))', [('bels', [' ', '*', '/']), 'Bel', ('Bels', [' ', '*', '/'])])]
 names_of_all_units_and_dimensions=('yotta', 'zetta', 'hecto', 'centi', 'milli', 'micro', 'femto', 'zepto', 'yocto', 'peta', 'tera', 'giga', 'mega', 'kilo', 'deka', 'deci', 'nano', 'pico', 'atto', 'exa', 'candela', 'second', 'ampere', 'kelvin', 'metre', 'gram', 'mole', 'luminous_intensity', 'time', 'electric_current', 'temperature', 'length', 'mass', 'amount_of_substance', 'astronomicalunit', 'atomicmassunit', 'nauticalmile', 'electronvolt', 'angleminute', 'anglesecond', 'steradian', 'metricton', 'roentgen', 'angstrom', 'hectare', 'radian', 'minute', 'degree', 'curie', 'liter', 'neper', 'knot', 'barn', 'hour', 'day', 'are', 'bar', 'rad', 'rem', 'bel', 'fluid ounce', 'gallon', 'quart', 'ounce', 'pound', 'stone', 'inch', 'foot', 'yard', 'mile', 'gill', 'pint')
 names_of_prefixes_units_and_dimensions=('yotta', 'zetta', 'hecto', 'centi', 'milli', 'micro', 'femto', 'zepto', 'yocto', 'peta', 'tera', 'giga', 'mega', 'kilo', 'deka', 'deci', 'nano', 'pico', 'atto', 'exa', 'candela', 'second', 'ampere', 'kelvin', 'metre', 'gram', 'mole', 'luminous_intensity', 'time', 'electric_current', 'temperature', 'length', 'mass', 'amount_of_substance', 'becquerel', 'coulomb', 'siemens', 'sievert', 'newton', 'pascal', 'hertz', 'joule', 'farad', 'weber', 'tesla', 'henry', 'lumen', 'katal', 'watt', 'volt', 'gray', 'ohm', 'lux', 'astronomicalunit', 'atomicmassunit', 'nauticalmile', 'electronvolt', 'angleminute', 'anglesecond', 'steradian', 'metricton', 'roentgen', 'angstrom', 'hectare', 'radian', 'minute', 'degree', 'curie', 'liter', 'neper', 'knot', 'barn', 'hour', 'day', 'are', 'bar', 'rad', 'rem', 'bel', 'fluid ounce', 'gallon', 'quart', 'ounce', 'pound', 'stone', 'inch', 'foot', 'yard', 'mile', 'gill', 'pint')
+short_form_prefix_index={'Y': '1000000000000000000000000', 'Z': '1000000000000000000000', 'h': '100', 'c': '1/100', 'm': '1/1000', 'mu': '1/1000000', 'f': '1/1000000000000000', 'z': '1/1000000000000000000000', 'y': '1/1000000000000000000000000', 'P': '1000000000000000', 'T': '1000000000000', 'G': '1000000000', 'M': '1000000', 'k': '1000', 'da': '10', 'd': '1/10', 'n': '1/1000000000', 'p': '1/1000000000000', 'a': '1/1000000000000000000', 'E': '1000000000000000000'}
+short_form_unit_index={'cd': ('1', (1, 0, 0, 0, 0, 0, 0)), 's': ('1', (0, 1, 0, 0, 0, 0, 0)), 'A': ('1', (0, 0, 1, 0, 0, 0, 0)), 'K': ('1', (0, 0, 0, 1, 0, 0, 0)), 'm': ('1', (0, 0, 0, 0, 1, 0, 0)), 'g': ('1', (0, 0, 0, 0, 0, 1, 0)), 'mol': ('1', (0, 0, 0, 0, 0, 0, 1)), 'Bq': ('1', (0, -1, 0, 0, 0, 0, 0)), 'C': ('1', (0, 1, 1, 0, 0, 0, 0)), 'S': ('1000', (0, 3, 2, 0, -2, -1, 0)), 'Sv': ('1', (0, -2, 0, 0, 2, 0, 0)), 'N': ('1000', (0, -2, 0, 0, 1, 1, 0)), 'Pa': ('1000', (0, -2, 0, 0, -1, 1, 0)), 'Hz': ('1', (0, -1, 0, 0, 0, 0, 0)), 'J': ('1000', (0, -2, 0, 0, 2, 1, 0)), 'F': ('1/1000', (0, 4, 2, 0, -2, -1, 0)), 'Wb': ('1000', (0, -2, -1, 0, 2, 1, 0)), 'T': ('1000', (0, -2, -1, 0, 0, 1, 0)), 'H': ('1000', (0, -2, -2, 0, 2, 1, 0)), 'lm': ('1', (1, 0, 0, 0, 0, 0, 0)), 'kat': ('1', (0, -1, 0, 0, 0, 0, 1)), 'W': ('1000', (0, -3, 0, 0, 2, 1, 0)), 'V': ('1000', (0, -3, -1, 0, 2, 1, 0)), 'Gy': ('1', (0, -2, 0, 0, 2, 0, 0)), 'O': ('1000', (0, -3, -2, 0, 2, 1, 0)), 'lx': ('1', (1, 0, 0, 0, -2, 0, 0)), 'u': ('83027/50000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'eV': ('80109/500000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'sr': ('1', (0, 0, 0, 0, 0, 0, 0)), 't': ('1000000', (0, 0, 0, 0, 0, 1, 0)), 'Å': ('1/10000000000', (0, 0, 0, 0, 1, 0, 0)), 'r': ('1', (0, 0, 0, 0, 0, 0, 0)), 'min': ('60', (0, 1, 0, 0, 0, 0, 0)), 'deg': ('pi/180', (0, 0, 0, 0, 0, 0, 0)), 'L': ('1/1000', (0, 0, 0, 0, 3, 0, 0)), 'Np': ('1', (0, 0, 0, 0, 0, 0, 0)), 'h': ('3600', (0, 1, 0, 0, 0, 0, 0)), 'B': ('log(10)/2', (0, 0, 0, 0, 0, 0, 0)), 'fl oz': ('454609/16000000000', (0, 0, 0, 0, 3, 0, 0)), 'gal': ('454609/100000', (0, 0, 0, 0, 3, 0, 0)), 'qt': ('454609/400000000', (0, 0, 0, 0, 3, 0, 0)), 'oz': ('45359237/1600000', (0, 0, 0, 0, 0, 1, 0)), 'lb': ('45359237/100000', (0, 0, 0, 0, 0, 1, 0)), 'st': ('317514659/50000', (0, 0, 0, 0, 0, 1, 0)), 'in': ('127/5000', (0, 0, 0, 0, 1, 0, 0)), 'ft': ('381/1250', (0, 0, 0, 0, 1, 0, 0)), 'yd': ('1143/1250', (0, 0, 0, 0, 1, 0, 0)), 'mi': ('201168/125', (0, 0, 0, 0, 1, 0, 0)), 'gi': ('454609/3200000000', (0, 0, 0, 0, 3, 0, 0)), 'pt': ('454609/800000000', (0, 0, 0, 0, 3, 0, 0))}
+unit_index={'candela': ('1', (1, 0, 0, 0, 0, 0, 0)), 'second': ('1', (0, 1, 0, 0, 0, 0, 0)), 'ampere': ('1', (0, 0, 1, 0, 0, 0, 0)), 'kelvin': ('1', (0, 0, 0, 1, 0, 0, 0)), 'metre': ('1', (0, 0, 0, 0, 1, 0, 0)), 'gram': ('1', (0, 0, 0, 0, 0, 1, 0)), 'mole': ('1', (0, 0, 0, 0, 0, 0, 1)), 'becquerel': ('1', (0, -1, 0, 0, 0, 0, 0)), 'coulomb': ('1', (0, 1, 1, 0, 0, 0, 0)), 'siemens': ('1000', (0, 3, 2, 0, -2, -1, 0)), 'sievert': ('1', (0, -2, 0, 0, 2, 0, 0)), 'newton': ('1000', (0, -2, 0, 0, 1, 1, 0)), 'pascal': ('1000', (0, -2, 0, 0, -1, 1, 0)), 'hertz': ('1', (0, -1, 0, 0, 0, 0, 0)), 'joule': ('1000', (0, -2, 0, 0, 2, 1, 0)), 'farad': ('1/1000', (0, 4, 2, 0, -2, -1, 0)), 'weber': ('1000', (0, -2, -1, 0, 2, 1, 0)), 'tesla': ('1000', (0, -2, -1, 0, 0, 1, 0)), 'henry': ('1000', (0, -2, -2, 0, 2, 1, 0)), 'lumen': ('1', (1, 0, 0, 0, 0, 0, 0)), 'katal': ('1', (0, -1, 0, 0, 0, 0, 1)), 'watt': ('1000', (0, -3, 0, 0, 2, 1, 0)), 'volt': ('1000', (0, -3, -1, 0, 2, 1, 0)), 'gray': ('1', (0, -2, 0, 0, 2, 0, 0)), 'ohm': ('1000', (0, -3, -2, 0, 2, 1, 0)), 'lux': ('1', (1, 0, 0, 0, -2, 0, 0)), 'astronomicalunit': ('149597870700', (0, 0, 0, 0, 1, 0, 0)), 'atomicmassunit': ('83027/50000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nauticalmile': ('1852', (0, 0, 0, 0, 1, 0, 0)), 'electronvolt': ('80109/500000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'angleminute': ('pi/10800', (0, 0, 0, 0, 0, 0, 0)), 'anglesecond': ('pi/648000', (0, 0, 0, 0, 0, 0, 0)), 'steradian': ('1', (0, 0, 0, 0, 0, 0, 0)), 'metricton': ('1000000', (0, 0, 0, 0, 0, 1, 0)), 'roentgen': ('129/500000000', (0, 0, 0, 1, 0, -1, 0)), 'angstrom': ('1/10000000000', (0, 0, 0, 0, 1, 0, 0)), 'hectare': ('10000', (0, 0, 0, 0, 2, 0, 0)), 'radian': ('1', (0, 0, 0, 0, 0, 0, 0)), 'minute': ('60', (0, 1, 0, 0, 0, 0, 0)), 'degree': ('pi/180', (0, 0, 0, 0, 0, 0, 0)), 'curie': ('37000000000', (0, -1, 0, 0, 0, 0, 0)), 'liter': ('1/1000', (0, 0, 0, 0, 3, 0, 0)), 'neper': ('1', (0, 0, 0, 0, 0, 0, 0)), 'knot': ('463/900', (0, -1, 0, 0, 1, 0, 0)), 'barn': ('1/10000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'hour': ('3600', (0, 1, 0, 0, 0, 0, 0)), 'day': ('86400', (0, 1, 0, 0, 0, 0, 0)), 'are': ('100', (0, 0, 0, 0, 2, 0, 0)), 'bar': ('100000000', (0, -2, 0, 0, -1, 1, 0)), 'rad': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'rem': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'bel': ('log(10)/2', (0, 0, 0, 0, 0, 0, 0)), 'fluid ounce': ('454609/16000000000', (0, 0, 0, 0, 3, 0, 0)), 'gallon': ('454609/100000', (0, 0, 0, 0, 3, 0, 0)), 'quart': ('454609/400000000', (0, 0, 0, 0, 3, 0, 0)), 'ounce': ('45359237/1600000', (0, 0, 0, 0, 0, 1, 0)), 'pound': ('45359237/100000', (0, 0, 0, 0, 0, 1, 0)), 'stone': ('317514659/50000', (0, 0, 0, 0, 0, 1, 0)), 'inch': ('127/5000', (0, 0, 0, 0, 1, 0, 0)), 'foot': ('381/1250', (0, 0, 0, 0, 1, 0, 0)), 'yard': ('1143/1250', (0, 0, 0, 0, 1, 0, 0)), 'mile': ('201168/125', (0, 0, 0, 0, 1, 0, 0)), 'gill': ('454609/3200000000', (0, 0, 0, 0, 3, 0, 0)), 'pint': ('454609/800000000', (0, 0, 0, 0, 3, 0, 0)), 'candelas': ('1', (1, 0, 0, 0, 0, 0, 0)), 'Candela': ('1', (1, 0, 0, 0, 0, 0, 0)), 'Candelas': ('1', (1, 0, 0, 0, 0, 0, 0)), 'seconds': ('1', (0, 1, 0, 0, 0, 0, 0)), 'amperes': ('1', (0, 0, 1, 0, 0, 0, 0)), 'Ampere': ('1', (0, 0, 1, 0, 0, 0, 0)), 'Amperes': ('1', (0, 0, 1, 0, 0, 0, 0)), 'kelvins': ('1', (0, 0, 0, 1, 0, 0, 0)), 'Kelvin': ('1', (0, 0, 0, 1, 0, 0, 0)), 'Kelvins': ('1', (0, 0, 0, 1, 0, 0, 0)), 'metres': ('1', (0, 0, 0, 0, 1, 0, 0)), 'meter': ('1', (0, 0, 0, 0, 1, 0, 0)), 'meters': ('1', (0, 0, 0, 0, 1, 0, 0)), 'grams': ('1', (0, 0, 0, 0, 0, 1, 0)), 'moles': ('1', (0, 0, 0, 0, 0, 0, 1)), 'becquerels': ('1', (0, -1, 0, 0, 0, 0, 0)), 'Becquerel': ('1', (0, -1, 0, 0, 0, 0, 0)), 'Becquerels': ('1', (0, -1, 0, 0, 0, 0, 0)), 'coulombs': ('1', (0, 1, 1, 0, 0, 0, 0)), 'Coulomb': ('1', (0, 1, 1, 0, 0, 0, 0)), 'Coulombs': ('1', (0, 1, 1, 0, 0, 0, 0)), 'Siemens': ('1000', (0, 3, 2, 0, -2, -1, 0)), 'sieverts': ('1', (0, -2, 0, 0, 2, 0, 0)), 'Sievert': ('1', (0, -2, 0, 0, 2, 0, 0)), 'Sieverts': ('1', (0, -2, 0, 0, 2, 0, 0)), 'newtons': ('1000', (0, -2, 0, 0, 1, 1, 0)), 'Newton': ('1000', (0, -2, 0, 0, 1, 1, 0)), 'Newtons': ('1000', (0, -2, 0, 0, 1, 1, 0)), 'pascals': ('1000', (0, -2, 0, 0, -1, 1, 0)), 'Pascal': ('1000', (0, -2, 0, 0, -1, 1, 0)), 'Pascals': ('1000', (0, -2, 0, 0, -1, 1, 0)), 'joules': ('1000', (0, -2, 0, 0, 2, 1, 0)), 'Joule': ('1000', (0, -2, 0, 0, 2, 1, 0)), 'Joules': ('1000', (0, -2, 0, 0, 2, 1, 0)), 'farads': ('1/1000', (0, 4, 2, 0, -2, -1, 0)), 'Farad': ('1/1000', (0, 4, 2, 0, -2, -1, 0)), 'Farads': ('1/1000', (0, 4, 2, 0, -2, -1, 0)), 'webers': ('1000', (0, -2, -1, 0, 2, 1, 0)), 'Weber': ('1000', (0, -2, -1, 0, 2, 1, 0)), 'Webers': ('1000', (0, -2, -1, 0, 2, 1, 0)), 'teslas': ('1000', (0, -2, -1, 0, 0, 1, 0)), 'Tesla': ('1000', (0, -2, -1, 0, 0, 1, 0)), 'Teslas': ('1000', (0, -2, -1, 0, 0, 1, 0)), 'henrys': ('1000', (0, -2, -2, 0, 2, 1, 0)), 'Henry': ('1000', (0, -2, -2, 0, 2, 1, 0)), 'Henrys': ('1000', (0, -2, -2, 0, 2, 1, 0)), 'lumens': ('1', (1, 0, 0, 0, 0, 0, 0)), 'katals': ('1', (0, -1, 0, 0, 0, 0, 1)), 'Katal': ('1', (0, -1, 0, 0, 0, 0, 1)), 'Katals': ('1', (0, -1, 0, 0, 0, 0, 1)), 'watts': ('1000', (0, -3, 0, 0, 2, 1, 0)), 'Watt': ('1000', (0, -3, 0, 0, 2, 1, 0)), 'Watts': ('1000', (0, -3, 0, 0, 2, 1, 0)), 'volts': ('1000', (0, -3, -1, 0, 2, 1, 0)), 'Volt': ('1000', (0, -3, -1, 0, 2, 1, 0)), 'Volts': ('1000', (0, -3, -1, 0, 2, 1, 0)), 'grays': ('1', (0, -2, 0, 0, 2, 0, 0)), 'Gray': ('1', (0, -2, 0, 0, 2, 0, 0)), 'Grays': ('1', (0, -2, 0, 0, 2, 0, 0)), 'ohms': ('1000', (0, -3, -2, 0, 2, 1, 0)), 'Ohm': ('1000', (0, -3, -2, 0, 2, 1, 0)), 'Ohms': ('1000', (0, -3, -2, 0, 2, 1, 0)), 'astronomicalunits': ('149597870700', (0, 0, 0, 0, 1, 0, 0)), 'atomicmassunits': ('83027/50000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nauticalmiles': ('1852', (0, 0, 0, 0, 1, 0, 0)), 'electronvolts': ('80109/500000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'steradians': ('1', (0, 0, 0, 0, 0, 0, 0)), 'tonne': ('1000000', (0, 0, 0, 0, 0, 1, 0)), 'tonnes': ('1000000', (0, 0, 0, 0, 0, 1, 0)), 'roentgens': ('129/500000000', (0, 0, 0, 1, 0, -1, 0)), 'Roentgen': ('129/500000000', (0, 0, 0, 1, 0, -1, 0)), 'Roentgens': ('129/500000000', (0, 0, 0, 1, 0, -1, 0)), 'Röntgen': ('129/500000000', (0, 0, 0, 1, 0, -1, 0)), 'angstroms': ('1/10000000000', (0, 0, 0, 0, 1, 0, 0)), 'Angstrom': ('1/10000000000', (0, 0, 0, 0, 1, 0, 0)), 'Angstroms': ('1/10000000000', (0, 0, 0, 0, 1, 0, 0)), 'Ångström': ('1/10000000000', (0, 0, 0, 0, 1, 0, 0)), 'hectares': ('10000', (0, 0, 0, 0, 2, 0, 0)), 'radians': ('1', (0, 0, 0, 0, 0, 0, 0)), 'minutes': ('60', (0, 1, 0, 0, 0, 0, 0)), 'degrees': ('pi/180', (0, 0, 0, 0, 0, 0, 0)), 'curies': ('37000000000', (0, -1, 0, 0, 0, 0, 0)), 'liters': ('1/1000', (0, 0, 0, 0, 3, 0, 0)), 'litre': ('1/1000', (0, 0, 0, 0, 3, 0, 0)), 'litres': ('1/1000', (0, 0, 0, 0, 3, 0, 0)), 'nepers': ('1', (0, 0, 0, 0, 0, 0, 0)), 'Neper': ('1', (0, 0, 0, 0, 0, 0, 0)), 'Nepers': ('1', (0, 0, 0, 0, 0, 0, 0)), 'knots': ('463/900', (0, -1, 0, 0, 1, 0, 0)), 'barns': ('1/10000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'hours': ('3600', (0, 1, 0, 0, 0, 0, 0)), 'days': ('86400', (0, 1, 0, 0, 0, 0, 0)), 'ares': ('100', (0, 0, 0, 0, 2, 0, 0)), 'bars': ('100000000', (0, -2, 0, 0, -1, 1, 0)), 'rads': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'rems': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'bels': ('log(10)/2', (0, 0, 0, 0, 0, 0, 0)), 'Bel': ('log(10)/2', (0, 0, 0, 0, 0, 0, 0)), 'Bels': ('log(10)/2', (0, 0, 0, 0, 0, 0, 0)), 'fluid ounces': ('454609/16000000000', (0, 0, 0, 0, 3, 0, 0)), 'gallons': ('454609/100000', (0, 0, 0, 0, 3, 0, 0)), 'quarts': ('454609/400000000', (0, 0, 0, 0, 3, 0, 0)), 'ounces': ('45359237/1600000', (0, 0, 0, 0, 0, 1, 0)), 'pounds': ('45359237/100000', (0, 0, 0, 0, 0, 1, 0)), 'inches': ('127/5000', (0, 0, 0, 0, 1, 0, 0)), 'feet': ('381/1250', (0, 0, 0, 0, 1, 0, 0)), 'yards': ('1143/1250', (0, 0, 0, 0, 1, 0, 0)), 'miles': ('201168/125', (0, 0, 0, 0, 1, 0, 0)), 'gills': ('454609/3200000000', (0, 0, 0, 0, 3, 0, 0)), 'pints': ('454609/800000000', (0, 0, 0, 0, 3, 0, 0)), 'yotta': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zetta': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'hecto': ('100', (0, 0, 0, 0, 0, 0, 0)), 'centi': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'milli': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'micro': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'femto': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zepto': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yocto': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'peta': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'tera': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'giga': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'mega': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'kilo': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'deka': ('10', (0, 0, 0, 0, 0, 0, 0)), 'deci': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'nano': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'pico': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'atto': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'exa': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottacandela': ('1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yottasecond': ('1000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yottaampere': ('1000000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'yottakelvin': ('1000000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'yottametre': ('1000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottagram': ('1000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottamole': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'yottabecquerel': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yottacoulomb': ('1000000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'yottasiemens': ('1000000000000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'yottasievert': ('1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottanewton': ('1000000000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'yottapascal': ('1000000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yottahertz': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yottajoule': ('1000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yottafarad': ('1000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'yottaweber': ('1000000000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'yottatesla': ('1000000000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'yottahenry': ('1000000000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'yottalumen': ('1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yottakatal': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'yottawatt': ('1000000000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'yottavolt': ('1000000000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'yottagray': ('1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottaohm': ('1000000000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'yottalux': ('1000000000000000000000000', (1, 0, 0, 0, -2, 0, 0)), 'yottaastronomicalunit': ('149597870700000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottaatomicmassunit': ('83027/50000', (0, 0, 0, 0, 0, 1, 0)), 'yottanauticalmile': ('1852000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottaelectronvolt': ('160218000', (0, -2, 0, 0, 2, 1, 0)), 'yottaangleminute': ('2500000000000000000000*pi/27', (0, 0, 0, 0, 0, 0, 0)), 'yottaanglesecond': ('125000000000000000000*pi/81', (0, 0, 0, 0, 0, 0, 0)), 'yottasteradian': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottametricton': ('1000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottaroentgen': ('258000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yottaangstrom': ('100000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottahectare': ('10000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yottaradian': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottaminute': ('60000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yottadegree': ('50000000000000000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'yottacurie': ('37000000000000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yottaliter': ('1000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottaneper': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottaknot': ('4630000000000000000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'yottabarn': ('1/10000', (0, 0, 0, 0, 2, 0, 0)), 'yottahour': ('3600000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yottaday': ('86400000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yottaare': ('100000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yottabar': ('100000000000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yottarad': ('10000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottarem': ('10000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottabel': ('500000000000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'yottagallon': ('4546090000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottaquart': ('1136522500000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottaounce': ('28349523125000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottapound': ('453592370000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottastone': ('6350293180000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottainch': ('25400000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottafoot': ('304800000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottayard': ('914400000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottamile': ('1609344000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottagill': ('142065312500000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottapint': ('568261250000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottacandelas': ('1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yottaCandela': ('1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yottaCandelas': ('1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yottaseconds': ('1000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yottaamperes': ('1000000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'yottaAmpere': ('1000000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'yottaAmperes': ('1000000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'yottakelvins': ('1000000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'yottaKelvin': ('1000000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'yottaKelvins': ('1000000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'yottametres': ('1000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottameter': ('1000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottameters': ('1000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottagrams': ('1000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottamoles': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'yottabecquerels': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yottaBecquerel': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yottaBecquerels': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yottacoulombs': ('1000000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'yottaCoulomb': ('1000000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'yottaCoulombs': ('1000000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'yottaSiemens': ('1000000000000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'yottasieverts': ('1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottaSievert': ('1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottaSieverts': ('1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottanewtons': ('1000000000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'yottaNewton': ('1000000000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'yottaNewtons': ('1000000000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'yottapascals': ('1000000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yottaPascal': ('1000000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yottaPascals': ('1000000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yottajoules': ('1000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yottaJoule': ('1000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yottaJoules': ('1000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yottafarads': ('1000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'yottaFarad': ('1000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'yottaFarads': ('1000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'yottawebers': ('1000000000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'yottaWeber': ('1000000000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'yottaWebers': ('1000000000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'yottateslas': ('1000000000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'yottaTesla': ('1000000000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'yottaTeslas': ('1000000000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'yottahenrys': ('1000000000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'yottaHenry': ('1000000000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'yottaHenrys': ('1000000000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'yottalumens': ('1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yottakatals': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'yottaKatal': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'yottaKatals': ('1000000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'yottawatts': ('1000000000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'yottaWatt': ('1000000000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'yottaWatts': ('1000000000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'yottavolts': ('1000000000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'yottaVolt': ('1000000000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'yottaVolts': ('1000000000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'yottagrays': ('1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottaGray': ('1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottaGrays': ('1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottaohms': ('1000000000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'yottaOhm': ('1000000000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'yottaOhms': ('1000000000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'yottaastronomicalunits': ('149597870700000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottaatomicmassunits': ('83027/50000', (0, 0, 0, 0, 0, 1, 0)), 'yottanauticalmiles': ('1852000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottaelectronvolts': ('160218000', (0, -2, 0, 0, 2, 1, 0)), 'yottasteradians': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottatonne': ('1000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottatonnes': ('1000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottaroentgens': ('258000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yottaRoentgen': ('258000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yottaRoentgens': ('258000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yottaRöntgen': ('258000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yottaangstroms': ('100000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottaAngstrom': ('100000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottaAngstroms': ('100000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottaÅngström': ('100000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottahectares': ('10000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yottaradians': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottaminutes': ('60000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yottadegrees': ('50000000000000000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'yottacuries': ('37000000000000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yottaliters': ('1000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottalitre': ('1000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottalitres': ('1000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottanepers': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottaNeper': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottaNepers': ('1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yottaknots': ('4630000000000000000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'yottabarns': ('1/10000', (0, 0, 0, 0, 2, 0, 0)), 'yottahours': ('3600000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yottadays': ('86400000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yottaares': ('100000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yottabars': ('100000000000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yottarads': ('10000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottarems': ('10000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yottabels': ('500000000000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'yottaBel': ('500000000000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'yottaBels': ('500000000000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'yottagallons': ('4546090000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottaquarts': ('1136522500000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottaounces': ('28349523125000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottapounds': ('453592370000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yottainches': ('25400000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottafeet': ('304800000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottayards': ('914400000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottamiles': ('1609344000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yottagills': ('142065312500000000000', (0, 0, 0, 0, 3, 0, 0)), 'yottapints': ('568261250000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettacandela': ('1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zettasecond': ('1000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zettaampere': ('1000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'zettakelvin': ('1000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'zettametre': ('1000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettagram': ('1000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettamole': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'zettabecquerel': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zettacoulomb': ('1000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'zettasiemens': ('1000000000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'zettasievert': ('1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettanewton': ('1000000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'zettapascal': ('1000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zettahertz': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zettajoule': ('1000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zettafarad': ('1000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'zettaweber': ('1000000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'zettatesla': ('1000000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'zettahenry': ('1000000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'zettalumen': ('1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zettakatal': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'zettawatt': ('1000000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'zettavolt': ('1000000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'zettagray': ('1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettaohm': ('1000000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'zettalux': ('1000000000000000000000', (1, 0, 0, 0, -2, 0, 0)), 'zettaastronomicalunit': ('149597870700000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettaatomicmassunit': ('83027/50000000', (0, 0, 0, 0, 0, 1, 0)), 'zettanauticalmile': ('1852000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettaelectronvolt': ('160218', (0, -2, 0, 0, 2, 1, 0)), 'zettaangleminute': ('2500000000000000000*pi/27', (0, 0, 0, 0, 0, 0, 0)), 'zettaanglesecond': ('125000000000000000*pi/81', (0, 0, 0, 0, 0, 0, 0)), 'zettasteradian': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zettametricton': ('1000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettaroentgen': ('258000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zettaangstrom': ('100000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettahectare': ('10000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zettaradian': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zettaminute': ('60000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zettadegree': ('50000000000000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'zettacurie': ('37000000000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zettaliter': ('1000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettaneper': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zettaknot': ('4630000000000000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'zettabarn': ('1/10000000', (0, 0, 0, 0, 2, 0, 0)), 'zettahour': ('3600000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zettaday': ('86400000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zettaare': ('100000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zettabar': ('100000000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zettarad': ('10000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettarem': ('10000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettabel': ('500000000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'zettagallon': ('4546090000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettaquart': ('1136522500000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettaounce': ('28349523125000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettapound': ('453592370000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettastone': ('6350293180000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettainch': ('25400000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettafoot': ('304800000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettayard': ('914400000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettamile': ('1609344000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettagill': ('142065312500000000', (0, 0, 0, 0, 3, 0, 0)), 'zettapint': ('568261250000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettacandelas': ('1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zettaCandela': ('1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zettaCandelas': ('1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zettaseconds': ('1000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zettaamperes': ('1000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'zettaAmpere': ('1000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'zettaAmperes': ('1000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'zettakelvins': ('1000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'zettaKelvin': ('1000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'zettaKelvins': ('1000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'zettametres': ('1000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettameter': ('1000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettameters': ('1000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettagrams': ('1000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettamoles': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'zettabecquerels': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zettaBecquerel': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zettaBecquerels': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zettacoulombs': ('1000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'zettaCoulomb': ('1000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'zettaCoulombs': ('1000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'zettaSiemens': ('1000000000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'zettasieverts': ('1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettaSievert': ('1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettaSieverts': ('1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettanewtons': ('1000000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'zettaNewton': ('1000000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'zettaNewtons': ('1000000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'zettapascals': ('1000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zettaPascal': ('1000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zettaPascals': ('1000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zettajoules': ('1000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zettaJoule': ('1000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zettaJoules': ('1000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zettafarads': ('1000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'zettaFarad': ('1000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'zettaFarads': ('1000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'zettawebers': ('1000000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'zettaWeber': ('1000000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'zettaWebers': ('1000000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'zettateslas': ('1000000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'zettaTesla': ('1000000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'zettaTeslas': ('1000000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'zettahenrys': ('1000000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'zettaHenry': ('1000000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'zettaHenrys': ('1000000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'zettalumens': ('1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zettakatals': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'zettaKatal': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'zettaKatals': ('1000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'zettawatts': ('1000000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'zettaWatt': ('1000000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'zettaWatts': ('1000000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'zettavolts': ('1000000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'zettaVolt': ('1000000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'zettaVolts': ('1000000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'zettagrays': ('1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettaGray': ('1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettaGrays': ('1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettaohms': ('1000000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'zettaOhm': ('1000000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'zettaOhms': ('1000000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'zettaastronomicalunits': ('149597870700000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettaatomicmassunits': ('83027/50000000', (0, 0, 0, 0, 0, 1, 0)), 'zettanauticalmiles': ('1852000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettaelectronvolts': ('160218', (0, -2, 0, 0, 2, 1, 0)), 'zettasteradians': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zettatonne': ('1000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettatonnes': ('1000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettaroentgens': ('258000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zettaRoentgen': ('258000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zettaRoentgens': ('258000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zettaRöntgen': ('258000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zettaangstroms': ('100000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettaAngstrom': ('100000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettaAngstroms': ('100000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettaÅngström': ('100000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettahectares': ('10000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zettaradians': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zettaminutes': ('60000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zettadegrees': ('50000000000000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'zettacuries': ('37000000000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zettaliters': ('1000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettalitre': ('1000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettalitres': ('1000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettanepers': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zettaNeper': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zettaNepers': ('1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zettaknots': ('4630000000000000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'zettabarns': ('1/10000000', (0, 0, 0, 0, 2, 0, 0)), 'zettahours': ('3600000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zettadays': ('86400000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zettaares': ('100000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zettabars': ('100000000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zettarads': ('10000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettarems': ('10000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zettabels': ('500000000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'zettaBel': ('500000000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'zettaBels': ('500000000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'zettagallons': ('4546090000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettaquarts': ('1136522500000000000', (0, 0, 0, 0, 3, 0, 0)), 'zettaounces': ('28349523125000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettapounds': ('453592370000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zettainches': ('25400000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettafeet': ('304800000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettayards': ('914400000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettamiles': ('1609344000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zettagills': ('142065312500000000', (0, 0, 0, 0, 3, 0, 0)), 'zettapints': ('568261250000000000', (0, 0, 0, 0, 3, 0, 0)), 'hectocandela': ('100', (1, 0, 0, 0, 0, 0, 0)), 'hectosecond': ('100', (0, 1, 0, 0, 0, 0, 0)), 'hectoampere': ('100', (0, 0, 1, 0, 0, 0, 0)), 'hectokelvin': ('100', (0, 0, 0, 1, 0, 0, 0)), 'hectometre': ('100', (0, 0, 0, 0, 1, 0, 0)), 'hectogram': ('100', (0, 0, 0, 0, 0, 1, 0)), 'hectomole': ('100', (0, 0, 0, 0, 0, 0, 1)), 'hectobecquerel': ('100', (0, -1, 0, 0, 0, 0, 0)), 'hectocoulomb': ('100', (0, 1, 1, 0, 0, 0, 0)), 'hectosiemens': ('100000', (0, 3, 2, 0, -2, -1, 0)), 'hectosievert': ('100', (0, -2, 0, 0, 2, 0, 0)), 'hectonewton': ('100000', (0, -2, 0, 0, 1, 1, 0)), 'hectopascal': ('100000', (0, -2, 0, 0, -1, 1, 0)), 'hectohertz': ('100', (0, -1, 0, 0, 0, 0, 0)), 'hectojoule': ('100000', (0, -2, 0, 0, 2, 1, 0)), 'hectofarad': ('1/10', (0, 4, 2, 0, -2, -1, 0)), 'hectoweber': ('100000', (0, -2, -1, 0, 2, 1, 0)), 'hectotesla': ('100000', (0, -2, -1, 0, 0, 1, 0)), 'hectohenry': ('100000', (0, -2, -2, 0, 2, 1, 0)), 'hectolumen': ('100', (1, 0, 0, 0, 0, 0, 0)), 'hectokatal': ('100', (0, -1, 0, 0, 0, 0, 1)), 'hectowatt': ('100000', (0, -3, 0, 0, 2, 1, 0)), 'hectovolt': ('100000', (0, -3, -1, 0, 2, 1, 0)), 'hectogray': ('100', (0, -2, 0, 0, 2, 0, 0)), 'hectoohm': ('100000', (0, -3, -2, 0, 2, 1, 0)), 'hectolux': ('100', (1, 0, 0, 0, -2, 0, 0)), 'hectoastronomicalunit': ('14959787070000', (0, 0, 0, 0, 1, 0, 0)), 'hectoatomicmassunit': ('83027/500000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'hectonauticalmile': ('185200', (0, 0, 0, 0, 1, 0, 0)), 'hectoelectronvolt': ('80109/5000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'hectoangleminute': ('pi/108', (0, 0, 0, 0, 0, 0, 0)), 'hectoanglesecond': ('pi/6480', (0, 0, 0, 0, 0, 0, 0)), 'hectosteradian': ('100', (0, 0, 0, 0, 0, 0, 0)), 'hectometricton': ('100000000', (0, 0, 0, 0, 0, 1, 0)), 'hectoroentgen': ('129/5000000', (0, 0, 0, 1, 0, -1, 0)), 'hectoangstrom': ('1/100000000', (0, 0, 0, 0, 1, 0, 0)), 'hectohectare': ('1000000', (0, 0, 0, 0, 2, 0, 0)), 'hectoradian': ('100', (0, 0, 0, 0, 0, 0, 0)), 'hectominute': ('6000', (0, 1, 0, 0, 0, 0, 0)), 'hectodegree': ('5*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'hectocurie': ('3700000000000', (0, -1, 0, 0, 0, 0, 0)), 'hectoliter': ('1/10', (0, 0, 0, 0, 3, 0, 0)), 'hectoneper': ('100', (0, 0, 0, 0, 0, 0, 0)), 'hectoknot': ('463/9', (0, -1, 0, 0, 1, 0, 0)), 'hectobarn': ('1/100000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'hectohour': ('360000', (0, 1, 0, 0, 0, 0, 0)), 'hectoday': ('8640000', (0, 1, 0, 0, 0, 0, 0)), 'hectoare': ('10000', (0, 0, 0, 0, 2, 0, 0)), 'hectobar': ('10000000000', (0, -2, 0, 0, -1, 1, 0)), 'hectorad': ('1', (0, -2, 0, 0, 2, 0, 0)), 'hectorem': ('1', (0, -2, 0, 0, 2, 0, 0)), 'hectobel': ('50*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'hectogallon': ('454609/1000', (0, 0, 0, 0, 3, 0, 0)), 'hectoquart': ('454609/4000000', (0, 0, 0, 0, 3, 0, 0)), 'hectoounce': ('45359237/16000', (0, 0, 0, 0, 0, 1, 0)), 'hectopound': ('45359237/1000', (0, 0, 0, 0, 0, 1, 0)), 'hectostone': ('317514659/500', (0, 0, 0, 0, 0, 1, 0)), 'hectoinch': ('127/50', (0, 0, 0, 0, 1, 0, 0)), 'hectofoot': ('762/25', (0, 0, 0, 0, 1, 0, 0)), 'hectoyard': ('2286/25', (0, 0, 0, 0, 1, 0, 0)), 'hectomile': ('804672/5', (0, 0, 0, 0, 1, 0, 0)), 'hectogill': ('454609/32000000', (0, 0, 0, 0, 3, 0, 0)), 'hectopint': ('454609/8000000', (0, 0, 0, 0, 3, 0, 0)), 'hectocandelas': ('100', (1, 0, 0, 0, 0, 0, 0)), 'hectoCandela': ('100', (1, 0, 0, 0, 0, 0, 0)), 'hectoCandelas': ('100', (1, 0, 0, 0, 0, 0, 0)), 'hectoseconds': ('100', (0, 1, 0, 0, 0, 0, 0)), 'hectoamperes': ('100', (0, 0, 1, 0, 0, 0, 0)), 'hectoAmpere': ('100', (0, 0, 1, 0, 0, 0, 0)), 'hectoAmperes': ('100', (0, 0, 1, 0, 0, 0, 0)), 'hectokelvins': ('100', (0, 0, 0, 1, 0, 0, 0)), 'hectoKelvin': ('100', (0, 0, 0, 1, 0, 0, 0)), 'hectoKelvins': ('100', (0, 0, 0, 1, 0, 0, 0)), 'hectometres': ('100', (0, 0, 0, 0, 1, 0, 0)), 'hectometer': ('100', (0, 0, 0, 0, 1, 0, 0)), 'hectometers': ('100', (0, 0, 0, 0, 1, 0, 0)), 'hectograms': ('100', (0, 0, 0, 0, 0, 1, 0)), 'hectomoles': ('100', (0, 0, 0, 0, 0, 0, 1)), 'hectobecquerels': ('100', (0, -1, 0, 0, 0, 0, 0)), 'hectoBecquerel': ('100', (0, -1, 0, 0, 0, 0, 0)), 'hectoBecquerels': ('100', (0, -1, 0, 0, 0, 0, 0)), 'hectocoulombs': ('100', (0, 1, 1, 0, 0, 0, 0)), 'hectoCoulomb': ('100', (0, 1, 1, 0, 0, 0, 0)), 'hectoCoulombs': ('100', (0, 1, 1, 0, 0, 0, 0)), 'hectoSiemens': ('100000', (0, 3, 2, 0, -2, -1, 0)), 'hectosieverts': ('100', (0, -2, 0, 0, 2, 0, 0)), 'hectoSievert': ('100', (0, -2, 0, 0, 2, 0, 0)), 'hectoSieverts': ('100', (0, -2, 0, 0, 2, 0, 0)), 'hectonewtons': ('100000', (0, -2, 0, 0, 1, 1, 0)), 'hectoNewton': ('100000', (0, -2, 0, 0, 1, 1, 0)), 'hectoNewtons': ('100000', (0, -2, 0, 0, 1, 1, 0)), 'hectopascals': ('100000', (0, -2, 0, 0, -1, 1, 0)), 'hectoPascal': ('100000', (0, -2, 0, 0, -1, 1, 0)), 'hectoPascals': ('100000', (0, -2, 0, 0, -1, 1, 0)), 'hectojoules': ('100000', (0, -2, 0, 0, 2, 1, 0)), 'hectoJoule': ('100000', (0, -2, 0, 0, 2, 1, 0)), 'hectoJoules': ('100000', (0, -2, 0, 0, 2, 1, 0)), 'hectofarads': ('1/10', (0, 4, 2, 0, -2, -1, 0)), 'hectoFarad': ('1/10', (0, 4, 2, 0, -2, -1, 0)), 'hectoFarads': ('1/10', (0, 4, 2, 0, -2, -1, 0)), 'hectowebers': ('100000', (0, -2, -1, 0, 2, 1, 0)), 'hectoWeber': ('100000', (0, -2, -1, 0, 2, 1, 0)), 'hectoWebers': ('100000', (0, -2, -1, 0, 2, 1, 0)), 'hectoteslas': ('100000', (0, -2, -1, 0, 0, 1, 0)), 'hectoTesla': ('100000', (0, -2, -1, 0, 0, 1, 0)), 'hectoTeslas': ('100000', (0, -2, -1, 0, 0, 1, 0)), 'hectohenrys': ('100000', (0, -2, -2, 0, 2, 1, 0)), 'hectoHenry': ('100000', (0, -2, -2, 0, 2, 1, 0)), 'hectoHenrys': ('100000', (0, -2, -2, 0, 2, 1, 0)), 'hectolumens': ('100', (1, 0, 0, 0, 0, 0, 0)), 'hectokatals': ('100', (0, -1, 0, 0, 0, 0, 1)), 'hectoKatal': ('100', (0, -1, 0, 0, 0, 0, 1)), 'hectoKatals': ('100', (0, -1, 0, 0, 0, 0, 1)), 'hectowatts': ('100000', (0, -3, 0, 0, 2, 1, 0)), 'hectoWatt': ('100000', (0, -3, 0, 0, 2, 1, 0)), 'hectoWatts': ('100000', (0, -3, 0, 0, 2, 1, 0)), 'hectovolts': ('100000', (0, -3, -1, 0, 2, 1, 0)), 'hectoVolt': ('100000', (0, -3, -1, 0, 2, 1, 0)), 'hectoVolts': ('100000', (0, -3, -1, 0, 2, 1, 0)), 'hectograys': ('100', (0, -2, 0, 0, 2, 0, 0)), 'hectoGray': ('100', (0, -2, 0, 0, 2, 0, 0)), 'hectoGrays': ('100', (0, -2, 0, 0, 2, 0, 0)), 'hectoohms': ('100000', (0, -3, -2, 0, 2, 1, 0)), 'hectoOhm': ('100000', (0, -3, -2, 0, 2, 1, 0)), 'hectoOhms': ('100000', (0, -3, -2, 0, 2, 1, 0)), 'hectoastronomicalunits': ('14959787070000', (0, 0, 0, 0, 1, 0, 0)), 'hectoatomicmassunits': ('83027/500000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'hectonauticalmiles': ('185200', (0, 0, 0, 0, 1, 0, 0)), 'hectoelectronvolts': ('80109/5000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'hectosteradians': ('100', (0, 0, 0, 0, 0, 0, 0)), 'hectotonne': ('100000000', (0, 0, 0, 0, 0, 1, 0)), 'hectotonnes': ('100000000', (0, 0, 0, 0, 0, 1, 0)), 'hectoroentgens': ('129/5000000', (0, 0, 0, 1, 0, -1, 0)), 'hectoRoentgen': ('129/5000000', (0, 0, 0, 1, 0, -1, 0)), 'hectoRoentgens': ('129/5000000', (0, 0, 0, 1, 0, -1, 0)), 'hectoRöntgen': ('129/5000000', (0, 0, 0, 1, 0, -1, 0)), 'hectoangstroms': ('1/100000000', (0, 0, 0, 0, 1, 0, 0)), 'hectoAngstrom': ('1/100000000', (0, 0, 0, 0, 1, 0, 0)), 'hectoAngstroms': ('1/100000000', (0, 0, 0, 0, 1, 0, 0)), 'hectoÅngström': ('1/100000000', (0, 0, 0, 0, 1, 0, 0)), 'hectohectares': ('1000000', (0, 0, 0, 0, 2, 0, 0)), 'hectoradians': ('100', (0, 0, 0, 0, 0, 0, 0)), 'hectominutes': ('6000', (0, 1, 0, 0, 0, 0, 0)), 'hectodegrees': ('5*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'hectocuries': ('3700000000000', (0, -1, 0, 0, 0, 0, 0)), 'hectoliters': ('1/10', (0, 0, 0, 0, 3, 0, 0)), 'hectolitre': ('1/10', (0, 0, 0, 0, 3, 0, 0)), 'hectolitres': ('1/10', (0, 0, 0, 0, 3, 0, 0)), 'hectonepers': ('100', (0, 0, 0, 0, 0, 0, 0)), 'hectoNeper': ('100', (0, 0, 0, 0, 0, 0, 0)), 'hectoNepers': ('100', (0, 0, 0, 0, 0, 0, 0)), 'hectoknots': ('463/9', (0, -1, 0, 0, 1, 0, 0)), 'hectobarns': ('1/100000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'hectohours': ('360000', (0, 1, 0, 0, 0, 0, 0)), 'hectodays': ('8640000', (0, 1, 0, 0, 0, 0, 0)), 'hectoares': ('10000', (0, 0, 0, 0, 2, 0, 0)), 'hectobars': ('10000000000', (0, -2, 0, 0, -1, 1, 0)), 'hectorads': ('1', (0, -2, 0, 0, 2, 0, 0)), 'hectorems': ('1', (0, -2, 0, 0, 2, 0, 0)), 'hectobels': ('50*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'hectoBel': ('50*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'hectoBels': ('50*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'hectogallons': ('454609/1000', (0, 0, 0, 0, 3, 0, 0)), 'hectoquarts': ('454609/4000000', (0, 0, 0, 0, 3, 0, 0)), 'hectoounces': ('45359237/16000', (0, 0, 0, 0, 0, 1, 0)), 'hectopounds': ('45359237/1000', (0, 0, 0, 0, 0, 1, 0)), 'hectoinches': ('127/50', (0, 0, 0, 0, 1, 0, 0)), 'hectofeet': ('762/25', (0, 0, 0, 0, 1, 0, 0)), 'hectoyards': ('2286/25', (0, 0, 0, 0, 1, 0, 0)), 'hectomiles': ('804672/5', (0, 0, 0, 0, 1, 0, 0)), 'hectogills': ('454609/32000000', (0, 0, 0, 0, 3, 0, 0)), 'hectopints': ('454609/8000000', (0, 0, 0, 0, 3, 0, 0)), 'centicandela': ('1/100', (1, 0, 0, 0, 0, 0, 0)), 'centisecond': ('1/100', (0, 1, 0, 0, 0, 0, 0)), 'centiampere': ('1/100', (0, 0, 1, 0, 0, 0, 0)), 'centikelvin': ('1/100', (0, 0, 0, 1, 0, 0, 0)), 'centimetre': ('1/100', (0, 0, 0, 0, 1, 0, 0)), 'centigram': ('1/100', (0, 0, 0, 0, 0, 1, 0)), 'centimole': ('1/100', (0, 0, 0, 0, 0, 0, 1)), 'centibecquerel': ('1/100', (0, -1, 0, 0, 0, 0, 0)), 'centicoulomb': ('1/100', (0, 1, 1, 0, 0, 0, 0)), 'centisiemens': ('10', (0, 3, 2, 0, -2, -1, 0)), 'centisievert': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'centinewton': ('10', (0, -2, 0, 0, 1, 1, 0)), 'centipascal': ('10', (0, -2, 0, 0, -1, 1, 0)), 'centihertz': ('1/100', (0, -1, 0, 0, 0, 0, 0)), 'centijoule': ('10', (0, -2, 0, 0, 2, 1, 0)), 'centifarad': ('1/100000', (0, 4, 2, 0, -2, -1, 0)), 'centiweber': ('10', (0, -2, -1, 0, 2, 1, 0)), 'centitesla': ('10', (0, -2, -1, 0, 0, 1, 0)), 'centihenry': ('10', (0, -2, -2, 0, 2, 1, 0)), 'centilumen': ('1/100', (1, 0, 0, 0, 0, 0, 0)), 'centikatal': ('1/100', (0, -1, 0, 0, 0, 0, 1)), 'centiwatt': ('10', (0, -3, 0, 0, 2, 1, 0)), 'centivolt': ('10', (0, -3, -1, 0, 2, 1, 0)), 'centigray': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'centiohm': ('10', (0, -3, -2, 0, 2, 1, 0)), 'centilux': ('1/100', (1, 0, 0, 0, -2, 0, 0)), 'centiastronomicalunit': ('1495978707', (0, 0, 0, 0, 1, 0, 0)), 'centiatomicmassunit': ('83027/5000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'centinauticalmile': ('463/25', (0, 0, 0, 0, 1, 0, 0)), 'centielectronvolt': ('80109/50000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'centiangleminute': ('pi/1080000', (0, 0, 0, 0, 0, 0, 0)), 'centianglesecond': ('pi/64800000', (0, 0, 0, 0, 0, 0, 0)), 'centisteradian': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'centimetricton': ('10000', (0, 0, 0, 0, 0, 1, 0)), 'centiroentgen': ('129/50000000000', (0, 0, 0, 1, 0, -1, 0)), 'centiangstrom': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'centihectare': ('100', (0, 0, 0, 0, 2, 0, 0)), 'centiradian': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'centiminute': ('3/5', (0, 1, 0, 0, 0, 0, 0)), 'centidegree': ('pi/18000', (0, 0, 0, 0, 0, 0, 0)), 'centicurie': ('370000000', (0, -1, 0, 0, 0, 0, 0)), 'centiliter': ('1/100000', (0, 0, 0, 0, 3, 0, 0)), 'centineper': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'centiknot': ('463/90000', (0, -1, 0, 0, 1, 0, 0)), 'centibarn': ('1/1000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'centihour': ('36', (0, 1, 0, 0, 0, 0, 0)), 'centiday': ('864', (0, 1, 0, 0, 0, 0, 0)), 'centiare': ('1', (0, 0, 0, 0, 2, 0, 0)), 'centibar': ('1000000', (0, -2, 0, 0, -1, 1, 0)), 'centirad': ('1/10000', (0, -2, 0, 0, 2, 0, 0)), 'centirem': ('1/10000', (0, -2, 0, 0, 2, 0, 0)), 'centibel': ('log(10)/200', (0, 0, 0, 0, 0, 0, 0)), 'centigallon': ('454609/10000000', (0, 0, 0, 0, 3, 0, 0)), 'centiquart': ('454609/40000000000', (0, 0, 0, 0, 3, 0, 0)), 'centiounce': ('45359237/160000000', (0, 0, 0, 0, 0, 1, 0)), 'centipound': ('45359237/10000000', (0, 0, 0, 0, 0, 1, 0)), 'centistone': ('317514659/5000000', (0, 0, 0, 0, 0, 1, 0)), 'centiinch': ('127/500000', (0, 0, 0, 0, 1, 0, 0)), 'centifoot': ('381/125000', (0, 0, 0, 0, 1, 0, 0)), 'centiyard': ('1143/125000', (0, 0, 0, 0, 1, 0, 0)), 'centimile': ('50292/3125', (0, 0, 0, 0, 1, 0, 0)), 'centigill': ('454609/320000000000', (0, 0, 0, 0, 3, 0, 0)), 'centipint': ('454609/80000000000', (0, 0, 0, 0, 3, 0, 0)), 'centicandelas': ('1/100', (1, 0, 0, 0, 0, 0, 0)), 'centiCandela': ('1/100', (1, 0, 0, 0, 0, 0, 0)), 'centiCandelas': ('1/100', (1, 0, 0, 0, 0, 0, 0)), 'centiseconds': ('1/100', (0, 1, 0, 0, 0, 0, 0)), 'centiamperes': ('1/100', (0, 0, 1, 0, 0, 0, 0)), 'centiAmpere': ('1/100', (0, 0, 1, 0, 0, 0, 0)), 'centiAmperes': ('1/100', (0, 0, 1, 0, 0, 0, 0)), 'centikelvins': ('1/100', (0, 0, 0, 1, 0, 0, 0)), 'centiKelvin': ('1/100', (0, 0, 0, 1, 0, 0, 0)), 'centiKelvins': ('1/100', (0, 0, 0, 1, 0, 0, 0)), 'centimetres': ('1/100', (0, 0, 0, 0, 1, 0, 0)), 'centimeter': ('1/100', (0, 0, 0, 0, 1, 0, 0)), 'centimeters': ('1/100', (0, 0, 0, 0, 1, 0, 0)), 'centigrams': ('1/100', (0, 0, 0, 0, 0, 1, 0)), 'centimoles': ('1/100', (0, 0, 0, 0, 0, 0, 1)), 'centibecquerels': ('1/100', (0, -1, 0, 0, 0, 0, 0)), 'centiBecquerel': ('1/100', (0, -1, 0, 0, 0, 0, 0)), 'centiBecquerels': ('1/100', (0, -1, 0, 0, 0, 0, 0)), 'centicoulombs': ('1/100', (0, 1, 1, 0, 0, 0, 0)), 'centiCoulomb': ('1/100', (0, 1, 1, 0, 0, 0, 0)), 'centiCoulombs': ('1/100', (0, 1, 1, 0, 0, 0, 0)), 'centiSiemens': ('10', (0, 3, 2, 0, -2, -1, 0)), 'centisieverts': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'centiSievert': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'centiSieverts': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'centinewtons': ('10', (0, -2, 0, 0, 1, 1, 0)), 'centiNewton': ('10', (0, -2, 0, 0, 1, 1, 0)), 'centiNewtons': ('10', (0, -2, 0, 0, 1, 1, 0)), 'centipascals': ('10', (0, -2, 0, 0, -1, 1, 0)), 'centiPascal': ('10', (0, -2, 0, 0, -1, 1, 0)), 'centiPascals': ('10', (0, -2, 0, 0, -1, 1, 0)), 'centijoules': ('10', (0, -2, 0, 0, 2, 1, 0)), 'centiJoule': ('10', (0, -2, 0, 0, 2, 1, 0)), 'centiJoules': ('10', (0, -2, 0, 0, 2, 1, 0)), 'centifarads': ('1/100000', (0, 4, 2, 0, -2, -1, 0)), 'centiFarad': ('1/100000', (0, 4, 2, 0, -2, -1, 0)), 'centiFarads': ('1/100000', (0, 4, 2, 0, -2, -1, 0)), 'centiwebers': ('10', (0, -2, -1, 0, 2, 1, 0)), 'centiWeber': ('10', (0, -2, -1, 0, 2, 1, 0)), 'centiWebers': ('10', (0, -2, -1, 0, 2, 1, 0)), 'centiteslas': ('10', (0, -2, -1, 0, 0, 1, 0)), 'centiTesla': ('10', (0, -2, -1, 0, 0, 1, 0)), 'centiTeslas': ('10', (0, -2, -1, 0, 0, 1, 0)), 'centihenrys': ('10', (0, -2, -2, 0, 2, 1, 0)), 'centiHenry': ('10', (0, -2, -2, 0, 2, 1, 0)), 'centiHenrys': ('10', (0, -2, -2, 0, 2, 1, 0)), 'centilumens': ('1/100', (1, 0, 0, 0, 0, 0, 0)), 'centikatals': ('1/100', (0, -1, 0, 0, 0, 0, 1)), 'centiKatal': ('1/100', (0, -1, 0, 0, 0, 0, 1)), 'centiKatals': ('1/100', (0, -1, 0, 0, 0, 0, 1)), 'centiwatts': ('10', (0, -3, 0, 0, 2, 1, 0)), 'centiWatt': ('10', (0, -3, 0, 0, 2, 1, 0)), 'centiWatts': ('10', (0, -3, 0, 0, 2, 1, 0)), 'centivolts': ('10', (0, -3, -1, 0, 2, 1, 0)), 'centiVolt': ('10', (0, -3, -1, 0, 2, 1, 0)), 'centiVolts': ('10', (0, -3, -1, 0, 2, 1, 0)), 'centigrays': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'centiGray': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'centiGrays': ('1/100', (0, -2, 0, 0, 2, 0, 0)), 'centiohms': ('10', (0, -3, -2, 0, 2, 1, 0)), 'centiOhm': ('10', (0, -3, -2, 0, 2, 1, 0)), 'centiOhms': ('10', (0, -3, -2, 0, 2, 1, 0)), 'centiastronomicalunits': ('1495978707', (0, 0, 0, 0, 1, 0, 0)), 'centiatomicmassunits': ('83027/5000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'centinauticalmiles': ('463/25', (0, 0, 0, 0, 1, 0, 0)), 'centielectronvolts': ('80109/50000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'centisteradians': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'centitonne': ('10000', (0, 0, 0, 0, 0, 1, 0)), 'centitonnes': ('10000', (0, 0, 0, 0, 0, 1, 0)), 'centiroentgens': ('129/50000000000', (0, 0, 0, 1, 0, -1, 0)), 'centiRoentgen': ('129/50000000000', (0, 0, 0, 1, 0, -1, 0)), 'centiRoentgens': ('129/50000000000', (0, 0, 0, 1, 0, -1, 0)), 'centiRöntgen': ('129/50000000000', (0, 0, 0, 1, 0, -1, 0)), 'centiangstroms': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'centiAngstrom': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'centiAngstroms': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'centiÅngström': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'centihectares': ('100', (0, 0, 0, 0, 2, 0, 0)), 'centiradians': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'centiminutes': ('3/5', (0, 1, 0, 0, 0, 0, 0)), 'centidegrees': ('pi/18000', (0, 0, 0, 0, 0, 0, 0)), 'centicuries': ('370000000', (0, -1, 0, 0, 0, 0, 0)), 'centiliters': ('1/100000', (0, 0, 0, 0, 3, 0, 0)), 'centilitre': ('1/100000', (0, 0, 0, 0, 3, 0, 0)), 'centilitres': ('1/100000', (0, 0, 0, 0, 3, 0, 0)), 'centinepers': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'centiNeper': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'centiNepers': ('1/100', (0, 0, 0, 0, 0, 0, 0)), 'centiknots': ('463/90000', (0, -1, 0, 0, 1, 0, 0)), 'centibarns': ('1/1000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'centihours': ('36', (0, 1, 0, 0, 0, 0, 0)), 'centidays': ('864', (0, 1, 0, 0, 0, 0, 0)), 'centiares': ('1', (0, 0, 0, 0, 2, 0, 0)), 'centibars': ('1000000', (0, -2, 0, 0, -1, 1, 0)), 'centirads': ('1/10000', (0, -2, 0, 0, 2, 0, 0)), 'centirems': ('1/10000', (0, -2, 0, 0, 2, 0, 0)), 'centibels': ('log(10)/200', (0, 0, 0, 0, 0, 0, 0)), 'centiBel': ('log(10)/200', (0, 0, 0, 0, 0, 0, 0)), 'centiBels': ('log(10)/200', (0, 0, 0, 0, 0, 0, 0)), 'centigallons': ('454609/10000000', (0, 0, 0, 0, 3, 0, 0)), 'centiquarts': ('454609/40000000000', (0, 0, 0, 0, 3, 0, 0)), 'centiounces': ('45359237/160000000', (0, 0, 0, 0, 0, 1, 0)), 'centipounds': ('45359237/10000000', (0, 0, 0, 0, 0, 1, 0)), 'centiinches': ('127/500000', (0, 0, 0, 0, 1, 0, 0)), 'centifeet': ('381/125000', (0, 0, 0, 0, 1, 0, 0)), 'centiyards': ('1143/125000', (0, 0, 0, 0, 1, 0, 0)), 'centimiles': ('50292/3125', (0, 0, 0, 0, 1, 0, 0)), 'centigills': ('454609/320000000000', (0, 0, 0, 0, 3, 0, 0)), 'centipints': ('454609/80000000000', (0, 0, 0, 0, 3, 0, 0)), 'millicandela': ('1/1000', (1, 0, 0, 0, 0, 0, 0)), 'millisecond': ('1/1000', (0, 1, 0, 0, 0, 0, 0)), 'milliampere': ('1/1000', (0, 0, 1, 0, 0, 0, 0)), 'millikelvin': ('1/1000', (0, 0, 0, 1, 0, 0, 0)), 'millimetre': ('1/1000', (0, 0, 0, 0, 1, 0, 0)), 'milligram': ('1/1000', (0, 0, 0, 0, 0, 1, 0)), 'millimole': ('1/1000', (0, 0, 0, 0, 0, 0, 1)), 'millibecquerel': ('1/1000', (0, -1, 0, 0, 0, 0, 0)), 'millicoulomb': ('1/1000', (0, 1, 1, 0, 0, 0, 0)), 'millisiemens': ('1', (0, 3, 2, 0, -2, -1, 0)), 'millisievert': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'millinewton': ('1', (0, -2, 0, 0, 1, 1, 0)), 'millipascal': ('1', (0, -2, 0, 0, -1, 1, 0)), 'millihertz': ('1/1000', (0, -1, 0, 0, 0, 0, 0)), 'millijoule': ('1', (0, -2, 0, 0, 2, 1, 0)), 'millifarad': ('1/1000000', (0, 4, 2, 0, -2, -1, 0)), 'milliweber': ('1', (0, -2, -1, 0, 2, 1, 0)), 'millitesla': ('1', (0, -2, -1, 0, 0, 1, 0)), 'millihenry': ('1', (0, -2, -2, 0, 2, 1, 0)), 'millilumen': ('1/1000', (1, 0, 0, 0, 0, 0, 0)), 'millikatal': ('1/1000', (0, -1, 0, 0, 0, 0, 1)), 'milliwatt': ('1', (0, -3, 0, 0, 2, 1, 0)), 'millivolt': ('1', (0, -3, -1, 0, 2, 1, 0)), 'milligray': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'milliohm': ('1', (0, -3, -2, 0, 2, 1, 0)), 'millilux': ('1/1000', (1, 0, 0, 0, -2, 0, 0)), 'milliastronomicalunit': ('1495978707/10', (0, 0, 0, 0, 1, 0, 0)), 'milliatomicmassunit': ('83027/50000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'millinauticalmile': ('463/250', (0, 0, 0, 0, 1, 0, 0)), 'millielectronvolt': ('80109/500000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'milliangleminute': ('pi/10800000', (0, 0, 0, 0, 0, 0, 0)), 'millianglesecond': ('pi/648000000', (0, 0, 0, 0, 0, 0, 0)), 'millisteradian': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'millimetricton': ('1000', (0, 0, 0, 0, 0, 1, 0)), 'milliroentgen': ('129/500000000000', (0, 0, 0, 1, 0, -1, 0)), 'milliangstrom': ('1/10000000000000', (0, 0, 0, 0, 1, 0, 0)), 'millihectare': ('10', (0, 0, 0, 0, 2, 0, 0)), 'milliradian': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'milliminute': ('3/50', (0, 1, 0, 0, 0, 0, 0)), 'millidegree': ('pi/180000', (0, 0, 0, 0, 0, 0, 0)), 'millicurie': ('37000000', (0, -1, 0, 0, 0, 0, 0)), 'milliliter': ('1/1000000', (0, 0, 0, 0, 3, 0, 0)), 'millineper': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'milliknot': ('463/900000', (0, -1, 0, 0, 1, 0, 0)), 'millibarn': ('1/10000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'millihour': ('18/5', (0, 1, 0, 0, 0, 0, 0)), 'milliday': ('432/5', (0, 1, 0, 0, 0, 0, 0)), 'milliare': ('1/10', (0, 0, 0, 0, 2, 0, 0)), 'millibar': ('100000', (0, -2, 0, 0, -1, 1, 0)), 'millirad': ('1/100000', (0, -2, 0, 0, 2, 0, 0)), 'millirem': ('1/100000', (0, -2, 0, 0, 2, 0, 0)), 'millibel': ('log(10)/2000', (0, 0, 0, 0, 0, 0, 0)), 'milligallon': ('454609/100000000', (0, 0, 0, 0, 3, 0, 0)), 'milliquart': ('454609/400000000000', (0, 0, 0, 0, 3, 0, 0)), 'milliounce': ('45359237/1600000000', (0, 0, 0, 0, 0, 1, 0)), 'millipound': ('45359237/100000000', (0, 0, 0, 0, 0, 1, 0)), 'millistone': ('317514659/50000000', (0, 0, 0, 0, 0, 1, 0)), 'milliinch': ('127/5000000', (0, 0, 0, 0, 1, 0, 0)), 'millifoot': ('381/1250000', (0, 0, 0, 0, 1, 0, 0)), 'milliyard': ('1143/1250000', (0, 0, 0, 0, 1, 0, 0)), 'millimile': ('25146/15625', (0, 0, 0, 0, 1, 0, 0)), 'milligill': ('454609/3200000000000', (0, 0, 0, 0, 3, 0, 0)), 'millipint': ('454609/800000000000', (0, 0, 0, 0, 3, 0, 0)), 'millicandelas': ('1/1000', (1, 0, 0, 0, 0, 0, 0)), 'milliCandela': ('1/1000', (1, 0, 0, 0, 0, 0, 0)), 'milliCandelas': ('1/1000', (1, 0, 0, 0, 0, 0, 0)), 'milliseconds': ('1/1000', (0, 1, 0, 0, 0, 0, 0)), 'milliamperes': ('1/1000', (0, 0, 1, 0, 0, 0, 0)), 'milliAmpere': ('1/1000', (0, 0, 1, 0, 0, 0, 0)), 'milliAmperes': ('1/1000', (0, 0, 1, 0, 0, 0, 0)), 'millikelvins': ('1/1000', (0, 0, 0, 1, 0, 0, 0)), 'milliKelvin': ('1/1000', (0, 0, 0, 1, 0, 0, 0)), 'milliKelvins': ('1/1000', (0, 0, 0, 1, 0, 0, 0)), 'millimetres': ('1/1000', (0, 0, 0, 0, 1, 0, 0)), 'millimeter': ('1/1000', (0, 0, 0, 0, 1, 0, 0)), 'millimeters': ('1/1000', (0, 0, 0, 0, 1, 0, 0)), 'milligrams': ('1/1000', (0, 0, 0, 0, 0, 1, 0)), 'millimoles': ('1/1000', (0, 0, 0, 0, 0, 0, 1)), 'millibecquerels': ('1/1000', (0, -1, 0, 0, 0, 0, 0)), 'milliBecquerel': ('1/1000', (0, -1, 0, 0, 0, 0, 0)), 'milliBecquerels': ('1/1000', (0, -1, 0, 0, 0, 0, 0)), 'millicoulombs': ('1/1000', (0, 1, 1, 0, 0, 0, 0)), 'milliCoulomb': ('1/1000', (0, 1, 1, 0, 0, 0, 0)), 'milliCoulombs': ('1/1000', (0, 1, 1, 0, 0, 0, 0)), 'milliSiemens': ('1', (0, 3, 2, 0, -2, -1, 0)), 'millisieverts': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'milliSievert': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'milliSieverts': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'millinewtons': ('1', (0, -2, 0, 0, 1, 1, 0)), 'milliNewton': ('1', (0, -2, 0, 0, 1, 1, 0)), 'milliNewtons': ('1', (0, -2, 0, 0, 1, 1, 0)), 'millipascals': ('1', (0, -2, 0, 0, -1, 1, 0)), 'milliPascal': ('1', (0, -2, 0, 0, -1, 1, 0)), 'milliPascals': ('1', (0, -2, 0, 0, -1, 1, 0)), 'millijoules': ('1', (0, -2, 0, 0, 2, 1, 0)), 'milliJoule': ('1', (0, -2, 0, 0, 2, 1, 0)), 'milliJoules': ('1', (0, -2, 0, 0, 2, 1, 0)), 'millifarads': ('1/1000000', (0, 4, 2, 0, -2, -1, 0)), 'milliFarad': ('1/1000000', (0, 4, 2, 0, -2, -1, 0)), 'milliFarads': ('1/1000000', (0, 4, 2, 0, -2, -1, 0)), 'milliwebers': ('1', (0, -2, -1, 0, 2, 1, 0)), 'milliWeber': ('1', (0, -2, -1, 0, 2, 1, 0)), 'milliWebers': ('1', (0, -2, -1, 0, 2, 1, 0)), 'milliteslas': ('1', (0, -2, -1, 0, 0, 1, 0)), 'milliTesla': ('1', (0, -2, -1, 0, 0, 1, 0)), 'milliTeslas': ('1', (0, -2, -1, 0, 0, 1, 0)), 'millihenrys': ('1', (0, -2, -2, 0, 2, 1, 0)), 'milliHenry': ('1', (0, -2, -2, 0, 2, 1, 0)), 'milliHenrys': ('1', (0, -2, -2, 0, 2, 1, 0)), 'millilumens': ('1/1000', (1, 0, 0, 0, 0, 0, 0)), 'millikatals': ('1/1000', (0, -1, 0, 0, 0, 0, 1)), 'milliKatal': ('1/1000', (0, -1, 0, 0, 0, 0, 1)), 'milliKatals': ('1/1000', (0, -1, 0, 0, 0, 0, 1)), 'milliwatts': ('1', (0, -3, 0, 0, 2, 1, 0)), 'milliWatt': ('1', (0, -3, 0, 0, 2, 1, 0)), 'milliWatts': ('1', (0, -3, 0, 0, 2, 1, 0)), 'millivolts': ('1', (0, -3, -1, 0, 2, 1, 0)), 'milliVolt': ('1', (0, -3, -1, 0, 2, 1, 0)), 'milliVolts': ('1', (0, -3, -1, 0, 2, 1, 0)), 'milligrays': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'milliGray': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'milliGrays': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'milliohms': ('1', (0, -3, -2, 0, 2, 1, 0)), 'milliOhm': ('1', (0, -3, -2, 0, 2, 1, 0)), 'milliOhms': ('1', (0, -3, -2, 0, 2, 1, 0)), 'milliastronomicalunits': ('1495978707/10', (0, 0, 0, 0, 1, 0, 0)), 'milliatomicmassunits': ('83027/50000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'millinauticalmiles': ('463/250', (0, 0, 0, 0, 1, 0, 0)), 'millielectronvolts': ('80109/500000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'millisteradians': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'millitonne': ('1000', (0, 0, 0, 0, 0, 1, 0)), 'millitonnes': ('1000', (0, 0, 0, 0, 0, 1, 0)), 'milliroentgens': ('129/500000000000', (0, 0, 0, 1, 0, -1, 0)), 'milliRoentgen': ('129/500000000000', (0, 0, 0, 1, 0, -1, 0)), 'milliRoentgens': ('129/500000000000', (0, 0, 0, 1, 0, -1, 0)), 'milliRöntgen': ('129/500000000000', (0, 0, 0, 1, 0, -1, 0)), 'milliangstroms': ('1/10000000000000', (0, 0, 0, 0, 1, 0, 0)), 'milliAngstrom': ('1/10000000000000', (0, 0, 0, 0, 1, 0, 0)), 'milliAngstroms': ('1/10000000000000', (0, 0, 0, 0, 1, 0, 0)), 'milliÅngström': ('1/10000000000000', (0, 0, 0, 0, 1, 0, 0)), 'millihectares': ('10', (0, 0, 0, 0, 2, 0, 0)), 'milliradians': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'milliminutes': ('3/50', (0, 1, 0, 0, 0, 0, 0)), 'millidegrees': ('pi/180000', (0, 0, 0, 0, 0, 0, 0)), 'millicuries': ('37000000', (0, -1, 0, 0, 0, 0, 0)), 'milliliters': ('1/1000000', (0, 0, 0, 0, 3, 0, 0)), 'millilitre': ('1/1000000', (0, 0, 0, 0, 3, 0, 0)), 'millilitres': ('1/1000000', (0, 0, 0, 0, 3, 0, 0)), 'millinepers': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'milliNeper': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'milliNepers': ('1/1000', (0, 0, 0, 0, 0, 0, 0)), 'milliknots': ('463/900000', (0, -1, 0, 0, 1, 0, 0)), 'millibarns': ('1/10000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'millihours': ('18/5', (0, 1, 0, 0, 0, 0, 0)), 'millidays': ('432/5', (0, 1, 0, 0, 0, 0, 0)), 'milliares': ('1/10', (0, 0, 0, 0, 2, 0, 0)), 'millibars': ('100000', (0, -2, 0, 0, -1, 1, 0)), 'millirads': ('1/100000', (0, -2, 0, 0, 2, 0, 0)), 'millirems': ('1/100000', (0, -2, 0, 0, 2, 0, 0)), 'millibels': ('log(10)/2000', (0, 0, 0, 0, 0, 0, 0)), 'milliBel': ('log(10)/2000', (0, 0, 0, 0, 0, 0, 0)), 'milliBels': ('log(10)/2000', (0, 0, 0, 0, 0, 0, 0)), 'milligallons': ('454609/100000000', (0, 0, 0, 0, 3, 0, 0)), 'milliquarts': ('454609/400000000000', (0, 0, 0, 0, 3, 0, 0)), 'milliounces': ('45359237/1600000000', (0, 0, 0, 0, 0, 1, 0)), 'millipounds': ('45359237/100000000', (0, 0, 0, 0, 0, 1, 0)), 'milliinches': ('127/5000000', (0, 0, 0, 0, 1, 0, 0)), 'millifeet': ('381/1250000', (0, 0, 0, 0, 1, 0, 0)), 'milliyards': ('1143/1250000', (0, 0, 0, 0, 1, 0, 0)), 'millimiles': ('25146/15625', (0, 0, 0, 0, 1, 0, 0)), 'milligills': ('454609/3200000000000', (0, 0, 0, 0, 3, 0, 0)), 'millipints': ('454609/800000000000', (0, 0, 0, 0, 3, 0, 0)), 'microcandela': ('1/1000000', (1, 0, 0, 0, 0, 0, 0)), 'microsecond': ('1/1000000', (0, 1, 0, 0, 0, 0, 0)), 'microampere': ('1/1000000', (0, 0, 1, 0, 0, 0, 0)), 'microkelvin': ('1/1000000', (0, 0, 0, 1, 0, 0, 0)), 'micrometre': ('1/1000000', (0, 0, 0, 0, 1, 0, 0)), 'microgram': ('1/1000000', (0, 0, 0, 0, 0, 1, 0)), 'micromole': ('1/1000000', (0, 0, 0, 0, 0, 0, 1)), 'microbecquerel': ('1/1000000', (0, -1, 0, 0, 0, 0, 0)), 'microcoulomb': ('1/1000000', (0, 1, 1, 0, 0, 0, 0)), 'microsiemens': ('1/1000', (0, 3, 2, 0, -2, -1, 0)), 'microsievert': ('1/1000000', (0, -2, 0, 0, 2, 0, 0)), 'micronewton': ('1/1000', (0, -2, 0, 0, 1, 1, 0)), 'micropascal': ('1/1000', (0, -2, 0, 0, -1, 1, 0)), 'microhertz': ('1/1000000', (0, -1, 0, 0, 0, 0, 0)), 'microjoule': ('1/1000', (0, -2, 0, 0, 2, 1, 0)), 'microfarad': ('1/1000000000', (0, 4, 2, 0, -2, -1, 0)), 'microweber': ('1/1000', (0, -2, -1, 0, 2, 1, 0)), 'microtesla': ('1/1000', (0, -2, -1, 0, 0, 1, 0)), 'microhenry': ('1/1000', (0, -2, -2, 0, 2, 1, 0)), 'microlumen': ('1/1000000', (1, 0, 0, 0, 0, 0, 0)), 'microkatal': ('1/1000000', (0, -1, 0, 0, 0, 0, 1)), 'microwatt': ('1/1000', (0, -3, 0, 0, 2, 1, 0)), 'microvolt': ('1/1000', (0, -3, -1, 0, 2, 1, 0)), 'microgray': ('1/1000000', (0, -2, 0, 0, 2, 0, 0)), 'microohm': ('1/1000', (0, -3, -2, 0, 2, 1, 0)), 'microlux': ('1/1000000', (1, 0, 0, 0, -2, 0, 0)), 'microastronomicalunit': ('1495978707/10000', (0, 0, 0, 0, 1, 0, 0)), 'microatomicmassunit': ('83027/50000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'micronauticalmile': ('463/250000', (0, 0, 0, 0, 1, 0, 0)), 'microelectronvolt': ('80109/500000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'microangleminute': ('pi/10800000000', (0, 0, 0, 0, 0, 0, 0)), 'microanglesecond': ('pi/648000000000', (0, 0, 0, 0, 0, 0, 0)), 'microsteradian': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'micrometricton': ('1', (0, 0, 0, 0, 0, 1, 0)), 'microroentgen': ('129/500000000000000', (0, 0, 0, 1, 0, -1, 0)), 'microangstrom': ('1/10000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'microhectare': ('1/100', (0, 0, 0, 0, 2, 0, 0)), 'microradian': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'microminute': ('3/50000', (0, 1, 0, 0, 0, 0, 0)), 'microdegree': ('pi/180000000', (0, 0, 0, 0, 0, 0, 0)), 'microcurie': ('37000', (0, -1, 0, 0, 0, 0, 0)), 'microliter': ('1/1000000000', (0, 0, 0, 0, 3, 0, 0)), 'microneper': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'microknot': ('463/900000000', (0, -1, 0, 0, 1, 0, 0)), 'microbarn': ('1/10000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'microhour': ('9/2500', (0, 1, 0, 0, 0, 0, 0)), 'microday': ('54/625', (0, 1, 0, 0, 0, 0, 0)), 'microare': ('1/10000', (0, 0, 0, 0, 2, 0, 0)), 'microbar': ('100', (0, -2, 0, 0, -1, 1, 0)), 'microrad': ('1/100000000', (0, -2, 0, 0, 2, 0, 0)), 'microrem': ('1/100000000', (0, -2, 0, 0, 2, 0, 0)), 'microbel': ('log(10)/2000000', (0, 0, 0, 0, 0, 0, 0)), 'microgallon': ('454609/100000000000', (0, 0, 0, 0, 3, 0, 0)), 'microquart': ('454609/400000000000000', (0, 0, 0, 0, 3, 0, 0)), 'microounce': ('45359237/1600000000000', (0, 0, 0, 0, 0, 1, 0)), 'micropound': ('45359237/100000000000', (0, 0, 0, 0, 0, 1, 0)), 'microstone': ('317514659/50000000000', (0, 0, 0, 0, 0, 1, 0)), 'microinch': ('127/5000000000', (0, 0, 0, 0, 1, 0, 0)), 'microfoot': ('381/1250000000', (0, 0, 0, 0, 1, 0, 0)), 'microyard': ('1143/1250000000', (0, 0, 0, 0, 1, 0, 0)), 'micromile': ('12573/7812500', (0, 0, 0, 0, 1, 0, 0)), 'microgill': ('454609/3200000000000000', (0, 0, 0, 0, 3, 0, 0)), 'micropint': ('454609/800000000000000', (0, 0, 0, 0, 3, 0, 0)), 'microcandelas': ('1/1000000', (1, 0, 0, 0, 0, 0, 0)), 'microCandela': ('1/1000000', (1, 0, 0, 0, 0, 0, 0)), 'microCandelas': ('1/1000000', (1, 0, 0, 0, 0, 0, 0)), 'microseconds': ('1/1000000', (0, 1, 0, 0, 0, 0, 0)), 'microamperes': ('1/1000000', (0, 0, 1, 0, 0, 0, 0)), 'microAmpere': ('1/1000000', (0, 0, 1, 0, 0, 0, 0)), 'microAmperes': ('1/1000000', (0, 0, 1, 0, 0, 0, 0)), 'microkelvins': ('1/1000000', (0, 0, 0, 1, 0, 0, 0)), 'microKelvin': ('1/1000000', (0, 0, 0, 1, 0, 0, 0)), 'microKelvins': ('1/1000000', (0, 0, 0, 1, 0, 0, 0)), 'micrometres': ('1/1000000', (0, 0, 0, 0, 1, 0, 0)), 'micrometer': ('1/1000000', (0, 0, 0, 0, 1, 0, 0)), 'micrometers': ('1/1000000', (0, 0, 0, 0, 1, 0, 0)), 'micrograms': ('1/1000000', (0, 0, 0, 0, 0, 1, 0)), 'micromoles': ('1/1000000', (0, 0, 0, 0, 0, 0, 1)), 'microbecquerels': ('1/1000000', (0, -1, 0, 0, 0, 0, 0)), 'microBecquerel': ('1/1000000', (0, -1, 0, 0, 0, 0, 0)), 'microBecquerels': ('1/1000000', (0, -1, 0, 0, 0, 0, 0)), 'microcoulombs': ('1/1000000', (0, 1, 1, 0, 0, 0, 0)), 'microCoulomb': ('1/1000000', (0, 1, 1, 0, 0, 0, 0)), 'microCoulombs': ('1/1000000', (0, 1, 1, 0, 0, 0, 0)), 'microSiemens': ('1/1000', (0, 3, 2, 0, -2, -1, 0)), 'microsieverts': ('1/1000000', (0, -2, 0, 0, 2, 0, 0)), 'microSievert': ('1/1000000', (0, -2, 0, 0, 2, 0, 0)), 'microSieverts': ('1/1000000', (0, -2, 0, 0, 2, 0, 0)), 'micronewtons': ('1/1000', (0, -2, 0, 0, 1, 1, 0)), 'microNewton': ('1/1000', (0, -2, 0, 0, 1, 1, 0)), 'microNewtons': ('1/1000', (0, -2, 0, 0, 1, 1, 0)), 'micropascals': ('1/1000', (0, -2, 0, 0, -1, 1, 0)), 'microPascal': ('1/1000', (0, -2, 0, 0, -1, 1, 0)), 'microPascals': ('1/1000', (0, -2, 0, 0, -1, 1, 0)), 'microjoules': ('1/1000', (0, -2, 0, 0, 2, 1, 0)), 'microJoule': ('1/1000', (0, -2, 0, 0, 2, 1, 0)), 'microJoules': ('1/1000', (0, -2, 0, 0, 2, 1, 0)), 'microfarads': ('1/1000000000', (0, 4, 2, 0, -2, -1, 0)), 'microFarad': ('1/1000000000', (0, 4, 2, 0, -2, -1, 0)), 'microFarads': ('1/1000000000', (0, 4, 2, 0, -2, -1, 0)), 'microwebers': ('1/1000', (0, -2, -1, 0, 2, 1, 0)), 'microWeber': ('1/1000', (0, -2, -1, 0, 2, 1, 0)), 'microWebers': ('1/1000', (0, -2, -1, 0, 2, 1, 0)), 'microteslas': ('1/1000', (0, -2, -1, 0, 0, 1, 0)), 'microTesla': ('1/1000', (0, -2, -1, 0, 0, 1, 0)), 'microTeslas': ('1/1000', (0, -2, -1, 0, 0, 1, 0)), 'microhenrys': ('1/1000', (0, -2, -2, 0, 2, 1, 0)), 'microHenry': ('1/1000', (0, -2, -2, 0, 2, 1, 0)), 'microHenrys': ('1/1000', (0, -2, -2, 0, 2, 1, 0)), 'microlumens': ('1/1000000', (1, 0, 0, 0, 0, 0, 0)), 'microkatals': ('1/1000000', (0, -1, 0, 0, 0, 0, 1)), 'microKatal': ('1/1000000', (0, -1, 0, 0, 0, 0, 1)), 'microKatals': ('1/1000000', (0, -1, 0, 0, 0, 0, 1)), 'microwatts': ('1/1000', (0, -3, 0, 0, 2, 1, 0)), 'microWatt': ('1/1000', (0, -3, 0, 0, 2, 1, 0)), 'microWatts': ('1/1000', (0, -3, 0, 0, 2, 1, 0)), 'microvolts': ('1/1000', (0, -3, -1, 0, 2, 1, 0)), 'microVolt': ('1/1000', (0, -3, -1, 0, 2, 1, 0)), 'microVolts': ('1/1000', (0, -3, -1, 0, 2, 1, 0)), 'micrograys': ('1/1000000', (0, -2, 0, 0, 2, 0, 0)), 'microGray': ('1/1000000', (0, -2, 0, 0, 2, 0, 0)), 'microGrays': ('1/1000000', (0, -2, 0, 0, 2, 0, 0)), 'microohms': ('1/1000', (0, -3, -2, 0, 2, 1, 0)), 'microOhm': ('1/1000', (0, -3, -2, 0, 2, 1, 0)), 'microOhms': ('1/1000', (0, -3, -2, 0, 2, 1, 0)), 'microastronomicalunits': ('1495978707/10000', (0, 0, 0, 0, 1, 0, 0)), 'microatomicmassunits': ('83027/50000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'micronauticalmiles': ('463/250000', (0, 0, 0, 0, 1, 0, 0)), 'microelectronvolts': ('80109/500000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'microsteradians': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'microtonne': ('1', (0, 0, 0, 0, 0, 1, 0)), 'microtonnes': ('1', (0, 0, 0, 0, 0, 1, 0)), 'microroentgens': ('129/500000000000000', (0, 0, 0, 1, 0, -1, 0)), 'microRoentgen': ('129/500000000000000', (0, 0, 0, 1, 0, -1, 0)), 'microRoentgens': ('129/500000000000000', (0, 0, 0, 1, 0, -1, 0)), 'microRöntgen': ('129/500000000000000', (0, 0, 0, 1, 0, -1, 0)), 'microangstroms': ('1/10000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'microAngstrom': ('1/10000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'microAngstroms': ('1/10000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'microÅngström': ('1/10000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'microhectares': ('1/100', (0, 0, 0, 0, 2, 0, 0)), 'microradians': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'microminutes': ('3/50000', (0, 1, 0, 0, 0, 0, 0)), 'microdegrees': ('pi/180000000', (0, 0, 0, 0, 0, 0, 0)), 'microcuries': ('37000', (0, -1, 0, 0, 0, 0, 0)), 'microliters': ('1/1000000000', (0, 0, 0, 0, 3, 0, 0)), 'microlitre': ('1/1000000000', (0, 0, 0, 0, 3, 0, 0)), 'microlitres': ('1/1000000000', (0, 0, 0, 0, 3, 0, 0)), 'micronepers': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'microNeper': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'microNepers': ('1/1000000', (0, 0, 0, 0, 0, 0, 0)), 'microknots': ('463/900000000', (0, -1, 0, 0, 1, 0, 0)), 'microbarns': ('1/10000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'microhours': ('9/2500', (0, 1, 0, 0, 0, 0, 0)), 'microdays': ('54/625', (0, 1, 0, 0, 0, 0, 0)), 'microares': ('1/10000', (0, 0, 0, 0, 2, 0, 0)), 'microbars': ('100', (0, -2, 0, 0, -1, 1, 0)), 'microrads': ('1/100000000', (0, -2, 0, 0, 2, 0, 0)), 'microrems': ('1/100000000', (0, -2, 0, 0, 2, 0, 0)), 'microbels': ('log(10)/2000000', (0, 0, 0, 0, 0, 0, 0)), 'microBel': ('log(10)/2000000', (0, 0, 0, 0, 0, 0, 0)), 'microBels': ('log(10)/2000000', (0, 0, 0, 0, 0, 0, 0)), 'microgallons': ('454609/100000000000', (0, 0, 0, 0, 3, 0, 0)), 'microquarts': ('454609/400000000000000', (0, 0, 0, 0, 3, 0, 0)), 'microounces': ('45359237/1600000000000', (0, 0, 0, 0, 0, 1, 0)), 'micropounds': ('45359237/100000000000', (0, 0, 0, 0, 0, 1, 0)), 'microinches': ('127/5000000000', (0, 0, 0, 0, 1, 0, 0)), 'microfeet': ('381/1250000000', (0, 0, 0, 0, 1, 0, 0)), 'microyards': ('1143/1250000000', (0, 0, 0, 0, 1, 0, 0)), 'micromiles': ('12573/7812500', (0, 0, 0, 0, 1, 0, 0)), 'microgills': ('454609/3200000000000000', (0, 0, 0, 0, 3, 0, 0)), 'micropints': ('454609/800000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtocandela': ('1/1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'femtosecond': ('1/1000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'femtoampere': ('1/1000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'femtokelvin': ('1/1000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'femtometre': ('1/1000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtogram': ('1/1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtomole': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'femtobecquerel': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'femtocoulomb': ('1/1000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'femtosiemens': ('1/1000000000000', (0, 3, 2, 0, -2, -1, 0)), 'femtosievert': ('1/1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtonewton': ('1/1000000000000', (0, -2, 0, 0, 1, 1, 0)), 'femtopascal': ('1/1000000000000', (0, -2, 0, 0, -1, 1, 0)), 'femtohertz': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'femtojoule': ('1/1000000000000', (0, -2, 0, 0, 2, 1, 0)), 'femtofarad': ('1/1000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'femtoweber': ('1/1000000000000', (0, -2, -1, 0, 2, 1, 0)), 'femtotesla': ('1/1000000000000', (0, -2, -1, 0, 0, 1, 0)), 'femtohenry': ('1/1000000000000', (0, -2, -2, 0, 2, 1, 0)), 'femtolumen': ('1/1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'femtokatal': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'femtowatt': ('1/1000000000000', (0, -3, 0, 0, 2, 1, 0)), 'femtovolt': ('1/1000000000000', (0, -3, -1, 0, 2, 1, 0)), 'femtogray': ('1/1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtoohm': ('1/1000000000000', (0, -3, -2, 0, 2, 1, 0)), 'femtolux': ('1/1000000000000000', (1, 0, 0, 0, -2, 0, 0)), 'femtoastronomicalunit': ('1495978707/10000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoatomicmassunit': ('83027/50000000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtonauticalmile': ('463/250000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoelectronvolt': ('80109/500000000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'femtoangleminute': ('pi/10800000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtoanglesecond': ('pi/648000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtosteradian': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtometricton': ('1/1000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtoroentgen': ('129/500000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'femtoangstrom': ('1/10000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtohectare': ('1/100000000000', (0, 0, 0, 0, 2, 0, 0)), 'femtoradian': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtominute': ('3/50000000000000', (0, 1, 0, 0, 0, 0, 0)), 'femtodegree': ('pi/180000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtocurie': ('37/1000000', (0, -1, 0, 0, 0, 0, 0)), 'femtoliter': ('1/1000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtoneper': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtoknot': ('463/900000000000000000', (0, -1, 0, 0, 1, 0, 0)), 'femtobarn': ('1/10000000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'femtohour': ('9/2500000000000', (0, 1, 0, 0, 0, 0, 0)), 'femtoday': ('27/312500000000', (0, 1, 0, 0, 0, 0, 0)), 'femtoare': ('1/10000000000000', (0, 0, 0, 0, 2, 0, 0)), 'femtobar': ('1/10000000', (0, -2, 0, 0, -1, 1, 0)), 'femtorad': ('1/100000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtorem': ('1/100000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtobel': ('log(10)/2000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtogallon': ('454609/100000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtoquart': ('454609/400000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtoounce': ('45359237/1600000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtopound': ('45359237/100000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtostone': ('317514659/50000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtoinch': ('127/5000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtofoot': ('381/1250000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoyard': ('1143/1250000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtomile': ('12573/7812500000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtogill': ('454609/3200000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtopint': ('454609/800000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtocandelas': ('1/1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'femtoCandela': ('1/1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'femtoCandelas': ('1/1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'femtoseconds': ('1/1000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'femtoamperes': ('1/1000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'femtoAmpere': ('1/1000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'femtoAmperes': ('1/1000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'femtokelvins': ('1/1000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'femtoKelvin': ('1/1000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'femtoKelvins': ('1/1000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'femtometres': ('1/1000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtometer': ('1/1000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtometers': ('1/1000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtograms': ('1/1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtomoles': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'femtobecquerels': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'femtoBecquerel': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'femtoBecquerels': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'femtocoulombs': ('1/1000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'femtoCoulomb': ('1/1000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'femtoCoulombs': ('1/1000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'femtoSiemens': ('1/1000000000000', (0, 3, 2, 0, -2, -1, 0)), 'femtosieverts': ('1/1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtoSievert': ('1/1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtoSieverts': ('1/1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtonewtons': ('1/1000000000000', (0, -2, 0, 0, 1, 1, 0)), 'femtoNewton': ('1/1000000000000', (0, -2, 0, 0, 1, 1, 0)), 'femtoNewtons': ('1/1000000000000', (0, -2, 0, 0, 1, 1, 0)), 'femtopascals': ('1/1000000000000', (0, -2, 0, 0, -1, 1, 0)), 'femtoPascal': ('1/1000000000000', (0, -2, 0, 0, -1, 1, 0)), 'femtoPascals': ('1/1000000000000', (0, -2, 0, 0, -1, 1, 0)), 'femtojoules': ('1/1000000000000', (0, -2, 0, 0, 2, 1, 0)), 'femtoJoule': ('1/1000000000000', (0, -2, 0, 0, 2, 1, 0)), 'femtoJoules': ('1/1000000000000', (0, -2, 0, 0, 2, 1, 0)), 'femtofarads': ('1/1000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'femtoFarad': ('1/1000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'femtoFarads': ('1/1000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'femtowebers': ('1/1000000000000', (0, -2, -1, 0, 2, 1, 0)), 'femtoWeber': ('1/1000000000000', (0, -2, -1, 0, 2, 1, 0)), 'femtoWebers': ('1/1000000000000', (0, -2, -1, 0, 2, 1, 0)), 'femtoteslas': ('1/1000000000000', (0, -2, -1, 0, 0, 1, 0)), 'femtoTesla': ('1/1000000000000', (0, -2, -1, 0, 0, 1, 0)), 'femtoTeslas': ('1/1000000000000', (0, -2, -1, 0, 0, 1, 0)), 'femtohenrys': ('1/1000000000000', (0, -2, -2, 0, 2, 1, 0)), 'femtoHenry': ('1/1000000000000', (0, -2, -2, 0, 2, 1, 0)), 'femtoHenrys': ('1/1000000000000', (0, -2, -2, 0, 2, 1, 0)), 'femtolumens': ('1/1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'femtokatals': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'femtoKatal': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'femtoKatals': ('1/1000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'femtowatts': ('1/1000000000000', (0, -3, 0, 0, 2, 1, 0)), 'femtoWatt': ('1/1000000000000', (0, -3, 0, 0, 2, 1, 0)), 'femtoWatts': ('1/1000000000000', (0, -3, 0, 0, 2, 1, 0)), 'femtovolts': ('1/1000000000000', (0, -3, -1, 0, 2, 1, 0)), 'femtoVolt': ('1/1000000000000', (0, -3, -1, 0, 2, 1, 0)), 'femtoVolts': ('1/1000000000000', (0, -3, -1, 0, 2, 1, 0)), 'femtograys': ('1/1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtoGray': ('1/1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtoGrays': ('1/1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtoohms': ('1/1000000000000', (0, -3, -2, 0, 2, 1, 0)), 'femtoOhm': ('1/1000000000000', (0, -3, -2, 0, 2, 1, 0)), 'femtoOhms': ('1/1000000000000', (0, -3, -2, 0, 2, 1, 0)), 'femtoastronomicalunits': ('1495978707/10000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoatomicmassunits': ('83027/50000000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtonauticalmiles': ('463/250000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoelectronvolts': ('80109/500000000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'femtosteradians': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtotonne': ('1/1000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtotonnes': ('1/1000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtoroentgens': ('129/500000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'femtoRoentgen': ('129/500000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'femtoRoentgens': ('129/500000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'femtoRöntgen': ('129/500000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'femtoangstroms': ('1/10000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoAngstrom': ('1/10000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoAngstroms': ('1/10000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoÅngström': ('1/10000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtohectares': ('1/100000000000', (0, 0, 0, 0, 2, 0, 0)), 'femtoradians': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtominutes': ('3/50000000000000', (0, 1, 0, 0, 0, 0, 0)), 'femtodegrees': ('pi/180000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtocuries': ('37/1000000', (0, -1, 0, 0, 0, 0, 0)), 'femtoliters': ('1/1000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtolitre': ('1/1000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtolitres': ('1/1000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtonepers': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtoNeper': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtoNepers': ('1/1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtoknots': ('463/900000000000000000', (0, -1, 0, 0, 1, 0, 0)), 'femtobarns': ('1/10000000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'femtohours': ('9/2500000000000', (0, 1, 0, 0, 0, 0, 0)), 'femtodays': ('27/312500000000', (0, 1, 0, 0, 0, 0, 0)), 'femtoares': ('1/10000000000000', (0, 0, 0, 0, 2, 0, 0)), 'femtobars': ('1/10000000', (0, -2, 0, 0, -1, 1, 0)), 'femtorads': ('1/100000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtorems': ('1/100000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'femtobels': ('log(10)/2000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtoBel': ('log(10)/2000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtoBels': ('log(10)/2000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'femtogallons': ('454609/100000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtoquarts': ('454609/400000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtoounces': ('45359237/1600000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtopounds': ('45359237/100000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'femtoinches': ('127/5000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtofeet': ('381/1250000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtoyards': ('1143/1250000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtomiles': ('12573/7812500000000000', (0, 0, 0, 0, 1, 0, 0)), 'femtogills': ('454609/3200000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'femtopints': ('454609/800000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptocandela': ('1/1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zeptosecond': ('1/1000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zeptoampere': ('1/1000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'zeptokelvin': ('1/1000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'zeptometre': ('1/1000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptogram': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptomole': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'zeptobecquerel': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zeptocoulomb': ('1/1000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'zeptosiemens': ('1/1000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'zeptosievert': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptonewton': ('1/1000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'zeptopascal': ('1/1000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zeptohertz': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zeptojoule': ('1/1000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zeptofarad': ('1/1000000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'zeptoweber': ('1/1000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'zeptotesla': ('1/1000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'zeptohenry': ('1/1000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'zeptolumen': ('1/1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zeptokatal': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'zeptowatt': ('1/1000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'zeptovolt': ('1/1000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'zeptogray': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptoohm': ('1/1000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'zeptolux': ('1/1000000000000000000000', (1, 0, 0, 0, -2, 0, 0)), 'zeptoastronomicalunit': ('1495978707/10000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoatomicmassunit': ('83027/50000000000000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptonauticalmile': ('463/250000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoelectronvolt': ('80109/500000000000000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zeptoangleminute': ('pi/10800000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptoanglesecond': ('pi/648000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptosteradian': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptometricton': ('1/1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptoroentgen': ('129/500000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zeptoangstrom': ('1/10000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptohectare': ('1/100000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zeptoradian': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptominute': ('3/50000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zeptodegree': ('pi/180000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptocurie': ('37/1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zeptoliter': ('1/1000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptoneper': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptoknot': ('463/900000000000000000000000', (0, -1, 0, 0, 1, 0, 0)), 'zeptobarn': ('1/10000000000000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zeptohour': ('9/2500000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zeptoday': ('27/312500000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zeptoare': ('1/10000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zeptobar': ('1/10000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zeptorad': ('1/100000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptorem': ('1/100000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptobel': ('log(10)/2000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptogallon': ('454609/100000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptoquart': ('454609/400000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptoounce': ('45359237/1600000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptopound': ('45359237/100000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptostone': ('317514659/50000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptoinch': ('127/5000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptofoot': ('381/1250000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoyard': ('1143/1250000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptomile': ('12573/7812500000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptogill': ('454609/3200000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptopint': ('454609/800000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptocandelas': ('1/1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zeptoCandela': ('1/1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zeptoCandelas': ('1/1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zeptoseconds': ('1/1000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zeptoamperes': ('1/1000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'zeptoAmpere': ('1/1000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'zeptoAmperes': ('1/1000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'zeptokelvins': ('1/1000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'zeptoKelvin': ('1/1000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'zeptoKelvins': ('1/1000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'zeptometres': ('1/1000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptometer': ('1/1000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptometers': ('1/1000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptograms': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptomoles': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'zeptobecquerels': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zeptoBecquerel': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zeptoBecquerels': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zeptocoulombs': ('1/1000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'zeptoCoulomb': ('1/1000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'zeptoCoulombs': ('1/1000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'zeptoSiemens': ('1/1000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'zeptosieverts': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptoSievert': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptoSieverts': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptonewtons': ('1/1000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'zeptoNewton': ('1/1000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'zeptoNewtons': ('1/1000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'zeptopascals': ('1/1000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zeptoPascal': ('1/1000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zeptoPascals': ('1/1000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zeptojoules': ('1/1000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zeptoJoule': ('1/1000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zeptoJoules': ('1/1000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zeptofarads': ('1/1000000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'zeptoFarad': ('1/1000000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'zeptoFarads': ('1/1000000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'zeptowebers': ('1/1000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'zeptoWeber': ('1/1000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'zeptoWebers': ('1/1000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'zeptoteslas': ('1/1000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'zeptoTesla': ('1/1000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'zeptoTeslas': ('1/1000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'zeptohenrys': ('1/1000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'zeptoHenry': ('1/1000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'zeptoHenrys': ('1/1000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'zeptolumens': ('1/1000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'zeptokatals': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'zeptoKatal': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'zeptoKatals': ('1/1000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'zeptowatts': ('1/1000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'zeptoWatt': ('1/1000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'zeptoWatts': ('1/1000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'zeptovolts': ('1/1000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'zeptoVolt': ('1/1000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'zeptoVolts': ('1/1000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'zeptograys': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptoGray': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptoGrays': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptoohms': ('1/1000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'zeptoOhm': ('1/1000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'zeptoOhms': ('1/1000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'zeptoastronomicalunits': ('1495978707/10000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoatomicmassunits': ('83027/50000000000000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptonauticalmiles': ('463/250000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoelectronvolts': ('80109/500000000000000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'zeptosteradians': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptotonne': ('1/1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptotonnes': ('1/1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptoroentgens': ('129/500000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zeptoRoentgen': ('129/500000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zeptoRoentgens': ('129/500000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zeptoRöntgen': ('129/500000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'zeptoangstroms': ('1/10000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoAngstrom': ('1/10000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoAngstroms': ('1/10000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoÅngström': ('1/10000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptohectares': ('1/100000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zeptoradians': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptominutes': ('3/50000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zeptodegrees': ('pi/180000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptocuries': ('37/1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'zeptoliters': ('1/1000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptolitre': ('1/1000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptolitres': ('1/1000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptonepers': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptoNeper': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptoNepers': ('1/1000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptoknots': ('463/900000000000000000000000', (0, -1, 0, 0, 1, 0, 0)), 'zeptobarns': ('1/10000000000000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zeptohours': ('9/2500000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zeptodays': ('27/312500000000000000', (0, 1, 0, 0, 0, 0, 0)), 'zeptoares': ('1/10000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'zeptobars': ('1/10000000000000', (0, -2, 0, 0, -1, 1, 0)), 'zeptorads': ('1/100000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptorems': ('1/100000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'zeptobels': ('log(10)/2000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptoBel': ('log(10)/2000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptoBels': ('log(10)/2000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'zeptogallons': ('454609/100000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptoquarts': ('454609/400000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptoounces': ('45359237/1600000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptopounds': ('45359237/100000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'zeptoinches': ('127/5000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptofeet': ('381/1250000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptoyards': ('1143/1250000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptomiles': ('12573/7812500000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'zeptogills': ('454609/3200000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'zeptopints': ('454609/800000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctocandela': ('1/1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yoctosecond': ('1/1000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yoctoampere': ('1/1000000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'yoctokelvin': ('1/1000000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'yoctometre': ('1/1000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctogram': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctomole': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'yoctobecquerel': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yoctocoulomb': ('1/1000000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'yoctosiemens': ('1/1000000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'yoctosievert': ('1/1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctonewton': ('1/1000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'yoctopascal': ('1/1000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yoctohertz': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yoctojoule': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yoctofarad': ('1/1000000000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'yoctoweber': ('1/1000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'yoctotesla': ('1/1000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'yoctohenry': ('1/1000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'yoctolumen': ('1/1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yoctokatal': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'yoctowatt': ('1/1000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'yoctovolt': ('1/1000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'yoctogray': ('1/1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctoohm': ('1/1000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'yoctolux': ('1/1000000000000000000000000', (1, 0, 0, 0, -2, 0, 0)), 'yoctoastronomicalunit': ('1495978707/10000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoatomicmassunit': ('83027/50000000000000000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctonauticalmile': ('463/250000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoelectronvolt': ('80109/500000000000000000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yoctoangleminute': ('pi/10800000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctoanglesecond': ('pi/648000000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctosteradian': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctometricton': ('1/1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctoroentgen': ('129/500000000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yoctoangstrom': ('1/10000000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctohectare': ('1/100000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yoctoradian': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctominute': ('3/50000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yoctodegree': ('pi/180000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctocurie': ('37/1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yoctoliter': ('1/1000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctoneper': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctoknot': ('463/900000000000000000000000000', (0, -1, 0, 0, 1, 0, 0)), 'yoctobarn': ('1/10000000000000000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yoctohour': ('9/2500000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yoctoday': ('27/312500000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yoctoare': ('1/10000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yoctobar': ('1/10000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yoctorad': ('1/100000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctorem': ('1/100000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctobel': ('log(10)/2000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctogallon': ('454609/100000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctoquart': ('454609/400000000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctoounce': ('45359237/1600000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctopound': ('45359237/100000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctostone': ('317514659/50000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctoinch': ('127/5000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctofoot': ('381/1250000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoyard': ('1143/1250000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctomile': ('12573/7812500000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctogill': ('454609/3200000000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctopint': ('454609/800000000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctocandelas': ('1/1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yoctoCandela': ('1/1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yoctoCandelas': ('1/1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yoctoseconds': ('1/1000000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yoctoamperes': ('1/1000000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'yoctoAmpere': ('1/1000000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'yoctoAmperes': ('1/1000000000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'yoctokelvins': ('1/1000000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'yoctoKelvin': ('1/1000000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'yoctoKelvins': ('1/1000000000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'yoctometres': ('1/1000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctometer': ('1/1000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctometers': ('1/1000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctograms': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctomoles': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'yoctobecquerels': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yoctoBecquerel': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yoctoBecquerels': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yoctocoulombs': ('1/1000000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'yoctoCoulomb': ('1/1000000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'yoctoCoulombs': ('1/1000000000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'yoctoSiemens': ('1/1000000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'yoctosieverts': ('1/1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctoSievert': ('1/1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctoSieverts': ('1/1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctonewtons': ('1/1000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'yoctoNewton': ('1/1000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'yoctoNewtons': ('1/1000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'yoctopascals': ('1/1000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yoctoPascal': ('1/1000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yoctoPascals': ('1/1000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yoctojoules': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yoctoJoule': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yoctoJoules': ('1/1000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yoctofarads': ('1/1000000000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'yoctoFarad': ('1/1000000000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'yoctoFarads': ('1/1000000000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'yoctowebers': ('1/1000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'yoctoWeber': ('1/1000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'yoctoWebers': ('1/1000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'yoctoteslas': ('1/1000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'yoctoTesla': ('1/1000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'yoctoTeslas': ('1/1000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'yoctohenrys': ('1/1000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'yoctoHenry': ('1/1000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'yoctoHenrys': ('1/1000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'yoctolumens': ('1/1000000000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'yoctokatals': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'yoctoKatal': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'yoctoKatals': ('1/1000000000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'yoctowatts': ('1/1000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'yoctoWatt': ('1/1000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'yoctoWatts': ('1/1000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'yoctovolts': ('1/1000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'yoctoVolt': ('1/1000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'yoctoVolts': ('1/1000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'yoctograys': ('1/1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctoGray': ('1/1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctoGrays': ('1/1000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctoohms': ('1/1000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'yoctoOhm': ('1/1000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'yoctoOhms': ('1/1000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'yoctoastronomicalunits': ('1495978707/10000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoatomicmassunits': ('83027/50000000000000000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctonauticalmiles': ('463/250000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoelectronvolts': ('80109/500000000000000000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'yoctosteradians': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctotonne': ('1/1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctotonnes': ('1/1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctoroentgens': ('129/500000000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yoctoRoentgen': ('129/500000000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yoctoRoentgens': ('129/500000000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yoctoRöntgen': ('129/500000000000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'yoctoangstroms': ('1/10000000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoAngstrom': ('1/10000000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoAngstroms': ('1/10000000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoÅngström': ('1/10000000000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctohectares': ('1/100000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yoctoradians': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctominutes': ('3/50000000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yoctodegrees': ('pi/180000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctocuries': ('37/1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'yoctoliters': ('1/1000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctolitre': ('1/1000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctolitres': ('1/1000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctonepers': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctoNeper': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctoNepers': ('1/1000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctoknots': ('463/900000000000000000000000000', (0, -1, 0, 0, 1, 0, 0)), 'yoctobarns': ('1/10000000000000000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yoctohours': ('9/2500000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yoctodays': ('27/312500000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'yoctoares': ('1/10000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'yoctobars': ('1/10000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'yoctorads': ('1/100000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctorems': ('1/100000000000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'yoctobels': ('log(10)/2000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctoBel': ('log(10)/2000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctoBels': ('log(10)/2000000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'yoctogallons': ('454609/100000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctoquarts': ('454609/400000000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctoounces': ('45359237/1600000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctopounds': ('45359237/100000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'yoctoinches': ('127/5000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctofeet': ('381/1250000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctoyards': ('1143/1250000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctomiles': ('12573/7812500000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'yoctogills': ('454609/3200000000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'yoctopints': ('454609/800000000000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'petacandela': ('1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'petasecond': ('1000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'petaampere': ('1000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'petakelvin': ('1000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'petametre': ('1000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petagram': ('1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'petamole': ('1000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'petabecquerel': ('1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'petacoulomb': ('1000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'petasiemens': ('1000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'petasievert': ('1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petanewton': ('1000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'petapascal': ('1000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'petahertz': ('1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'petajoule': ('1000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'petafarad': ('1000000000000', (0, 4, 2, 0, -2, -1, 0)), 'petaweber': ('1000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'petatesla': ('1000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'petahenry': ('1000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'petalumen': ('1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'petakatal': ('1000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'petawatt': ('1000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'petavolt': ('1000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'petagray': ('1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petaohm': ('1000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'petalux': ('1000000000000000', (1, 0, 0, 0, -2, 0, 0)), 'petaastronomicalunit': ('149597870700000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petaatomicmassunit': ('83027/50000000000000', (0, 0, 0, 0, 0, 1, 0)), 'petanauticalmile': ('1852000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petaelectronvolt': ('80109/500000', (0, -2, 0, 0, 2, 1, 0)), 'petaangleminute': ('2500000000000*pi/27', (0, 0, 0, 0, 0, 0, 0)), 'petaanglesecond': ('125000000000*pi/81', (0, 0, 0, 0, 0, 0, 0)), 'petasteradian': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'petametricton': ('1000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'petaroentgen': ('258000000', (0, 0, 0, 1, 0, -1, 0)), 'petaangstrom': ('100000', (0, 0, 0, 0, 1, 0, 0)), 'petahectare': ('10000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'petaradian': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'petaminute': ('60000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'petadegree': ('50000000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'petacurie': ('37000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'petaliter': ('1000000000000', (0, 0, 0, 0, 3, 0, 0)), 'petaneper': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'petaknot': ('4630000000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'petabarn': ('1/10000000000000', (0, 0, 0, 0, 2, 0, 0)), 'petahour': ('3600000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'petaday': ('86400000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'petaare': ('100000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'petabar': ('100000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'petarad': ('10000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petarem': ('10000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petabel': ('500000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'petagallon': ('4546090000000000', (0, 0, 0, 0, 3, 0, 0)), 'petaquart': ('1136522500000', (0, 0, 0, 0, 3, 0, 0)), 'petaounce': ('28349523125000000', (0, 0, 0, 0, 0, 1, 0)), 'petapound': ('453592370000000000', (0, 0, 0, 0, 0, 1, 0)), 'petastone': ('6350293180000000000', (0, 0, 0, 0, 0, 1, 0)), 'petainch': ('25400000000000', (0, 0, 0, 0, 1, 0, 0)), 'petafoot': ('304800000000000', (0, 0, 0, 0, 1, 0, 0)), 'petayard': ('914400000000000', (0, 0, 0, 0, 1, 0, 0)), 'petamile': ('1609344000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petagill': ('142065312500', (0, 0, 0, 0, 3, 0, 0)), 'petapint': ('568261250000', (0, 0, 0, 0, 3, 0, 0)), 'petacandelas': ('1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'petaCandela': ('1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'petaCandelas': ('1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'petaseconds': ('1000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'petaamperes': ('1000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'petaAmpere': ('1000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'petaAmperes': ('1000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'petakelvins': ('1000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'petaKelvin': ('1000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'petaKelvins': ('1000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'petametres': ('1000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petameter': ('1000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petameters': ('1000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petagrams': ('1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'petamoles': ('1000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'petabecquerels': ('1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'petaBecquerel': ('1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'petaBecquerels': ('1000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'petacoulombs': ('1000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'petaCoulomb': ('1000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'petaCoulombs': ('1000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'petaSiemens': ('1000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'petasieverts': ('1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petaSievert': ('1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petaSieverts': ('1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petanewtons': ('1000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'petaNewton': ('1000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'petaNewtons': ('1000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'petapascals': ('1000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'petaPascal': ('1000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'petaPascals': ('1000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'petajoules': ('1000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'petaJoule': ('1000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'petaJoules': ('1000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'petafarads': ('1000000000000', (0, 4, 2, 0, -2, -1, 0)), 'petaFarad': ('1000000000000', (0, 4, 2, 0, -2, -1, 0)), 'petaFarads': ('1000000000000', (0, 4, 2, 0, -2, -1, 0)), 'petawebers': ('1000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'petaWeber': ('1000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'petaWebers': ('1000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'petateslas': ('1000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'petaTesla': ('1000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'petaTeslas': ('1000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'petahenrys': ('1000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'petaHenry': ('1000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'petaHenrys': ('1000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'petalumens': ('1000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'petakatals': ('1000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'petaKatal': ('1000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'petaKatals': ('1000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'petawatts': ('1000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'petaWatt': ('1000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'petaWatts': ('1000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'petavolts': ('1000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'petaVolt': ('1000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'petaVolts': ('1000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'petagrays': ('1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petaGray': ('1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petaGrays': ('1000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petaohms': ('1000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'petaOhm': ('1000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'petaOhms': ('1000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'petaastronomicalunits': ('149597870700000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petaatomicmassunits': ('83027/50000000000000', (0, 0, 0, 0, 0, 1, 0)), 'petanauticalmiles': ('1852000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petaelectronvolts': ('80109/500000', (0, -2, 0, 0, 2, 1, 0)), 'petasteradians': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'petatonne': ('1000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'petatonnes': ('1000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'petaroentgens': ('258000000', (0, 0, 0, 1, 0, -1, 0)), 'petaRoentgen': ('258000000', (0, 0, 0, 1, 0, -1, 0)), 'petaRoentgens': ('258000000', (0, 0, 0, 1, 0, -1, 0)), 'petaRöntgen': ('258000000', (0, 0, 0, 1, 0, -1, 0)), 'petaangstroms': ('100000', (0, 0, 0, 0, 1, 0, 0)), 'petaAngstrom': ('100000', (0, 0, 0, 0, 1, 0, 0)), 'petaAngstroms': ('100000', (0, 0, 0, 0, 1, 0, 0)), 'petaÅngström': ('100000', (0, 0, 0, 0, 1, 0, 0)), 'petahectares': ('10000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'petaradians': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'petaminutes': ('60000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'petadegrees': ('50000000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'petacuries': ('37000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'petaliters': ('1000000000000', (0, 0, 0, 0, 3, 0, 0)), 'petalitre': ('1000000000000', (0, 0, 0, 0, 3, 0, 0)), 'petalitres': ('1000000000000', (0, 0, 0, 0, 3, 0, 0)), 'petanepers': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'petaNeper': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'petaNepers': ('1000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'petaknots': ('4630000000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'petabarns': ('1/10000000000000', (0, 0, 0, 0, 2, 0, 0)), 'petahours': ('3600000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'petadays': ('86400000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'petaares': ('100000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'petabars': ('100000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'petarads': ('10000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petarems': ('10000000000000', (0, -2, 0, 0, 2, 0, 0)), 'petabels': ('500000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'petaBel': ('500000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'petaBels': ('500000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'petagallons': ('4546090000000000', (0, 0, 0, 0, 3, 0, 0)), 'petaquarts': ('1136522500000', (0, 0, 0, 0, 3, 0, 0)), 'petaounces': ('28349523125000000', (0, 0, 0, 0, 0, 1, 0)), 'petapounds': ('453592370000000000', (0, 0, 0, 0, 0, 1, 0)), 'petainches': ('25400000000000', (0, 0, 0, 0, 1, 0, 0)), 'petafeet': ('304800000000000', (0, 0, 0, 0, 1, 0, 0)), 'petayards': ('914400000000000', (0, 0, 0, 0, 1, 0, 0)), 'petamiles': ('1609344000000000000', (0, 0, 0, 0, 1, 0, 0)), 'petagills': ('142065312500', (0, 0, 0, 0, 3, 0, 0)), 'petapints': ('568261250000', (0, 0, 0, 0, 3, 0, 0)), 'teracandela': ('1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'terasecond': ('1000000000000', (0, 1, 0, 0, 0, 0, 0)), 'teraampere': ('1000000000000', (0, 0, 1, 0, 0, 0, 0)), 'terakelvin': ('1000000000000', (0, 0, 0, 1, 0, 0, 0)), 'terametre': ('1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'teragram': ('1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'teramole': ('1000000000000', (0, 0, 0, 0, 0, 0, 1)), 'terabecquerel': ('1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'teracoulomb': ('1000000000000', (0, 1, 1, 0, 0, 0, 0)), 'terasiemens': ('1000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'terasievert': ('1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'teranewton': ('1000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'terapascal': ('1000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'terahertz': ('1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'terajoule': ('1000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'terafarad': ('1000000000', (0, 4, 2, 0, -2, -1, 0)), 'teraweber': ('1000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'teratesla': ('1000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'terahenry': ('1000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'teralumen': ('1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'terakatal': ('1000000000000', (0, -1, 0, 0, 0, 0, 1)), 'terawatt': ('1000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'teravolt': ('1000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'teragray': ('1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'teraohm': ('1000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'teralux': ('1000000000000', (1, 0, 0, 0, -2, 0, 0)), 'teraastronomicalunit': ('149597870700000000000000', (0, 0, 0, 0, 1, 0, 0)), 'teraatomicmassunit': ('83027/50000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'teranauticalmile': ('1852000000000000', (0, 0, 0, 0, 1, 0, 0)), 'teraelectronvolt': ('80109/500000000', (0, -2, 0, 0, 2, 1, 0)), 'teraangleminute': ('2500000000*pi/27', (0, 0, 0, 0, 0, 0, 0)), 'teraanglesecond': ('125000000*pi/81', (0, 0, 0, 0, 0, 0, 0)), 'terasteradian': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'terametricton': ('1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'teraroentgen': ('258000', (0, 0, 0, 1, 0, -1, 0)), 'teraangstrom': ('100', (0, 0, 0, 0, 1, 0, 0)), 'terahectare': ('10000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'teraradian': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'teraminute': ('60000000000000', (0, 1, 0, 0, 0, 0, 0)), 'teradegree': ('50000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'teracurie': ('37000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'teraliter': ('1000000000', (0, 0, 0, 0, 3, 0, 0)), 'teraneper': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'teraknot': ('4630000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'terabarn': ('1/10000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'terahour': ('3600000000000000', (0, 1, 0, 0, 0, 0, 0)), 'teraday': ('86400000000000000', (0, 1, 0, 0, 0, 0, 0)), 'teraare': ('100000000000000', (0, 0, 0, 0, 2, 0, 0)), 'terabar': ('100000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'terarad': ('10000000000', (0, -2, 0, 0, 2, 0, 0)), 'terarem': ('10000000000', (0, -2, 0, 0, 2, 0, 0)), 'terabel': ('500000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'teragallon': ('4546090000000', (0, 0, 0, 0, 3, 0, 0)), 'teraquart': ('1136522500', (0, 0, 0, 0, 3, 0, 0)), 'teraounce': ('28349523125000', (0, 0, 0, 0, 0, 1, 0)), 'terapound': ('453592370000000', (0, 0, 0, 0, 0, 1, 0)), 'terastone': ('6350293180000000', (0, 0, 0, 0, 0, 1, 0)), 'terainch': ('25400000000', (0, 0, 0, 0, 1, 0, 0)), 'terafoot': ('304800000000', (0, 0, 0, 0, 1, 0, 0)), 'terayard': ('914400000000', (0, 0, 0, 0, 1, 0, 0)), 'teramile': ('1609344000000000', (0, 0, 0, 0, 1, 0, 0)), 'teragill': ('284130625/2', (0, 0, 0, 0, 3, 0, 0)), 'terapint': ('568261250', (0, 0, 0, 0, 3, 0, 0)), 'teracandelas': ('1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'teraCandela': ('1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'teraCandelas': ('1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'teraseconds': ('1000000000000', (0, 1, 0, 0, 0, 0, 0)), 'teraamperes': ('1000000000000', (0, 0, 1, 0, 0, 0, 0)), 'teraAmpere': ('1000000000000', (0, 0, 1, 0, 0, 0, 0)), 'teraAmperes': ('1000000000000', (0, 0, 1, 0, 0, 0, 0)), 'terakelvins': ('1000000000000', (0, 0, 0, 1, 0, 0, 0)), 'teraKelvin': ('1000000000000', (0, 0, 0, 1, 0, 0, 0)), 'teraKelvins': ('1000000000000', (0, 0, 0, 1, 0, 0, 0)), 'terametres': ('1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'terameter': ('1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'terameters': ('1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'teragrams': ('1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'teramoles': ('1000000000000', (0, 0, 0, 0, 0, 0, 1)), 'terabecquerels': ('1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'teraBecquerel': ('1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'teraBecquerels': ('1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'teracoulombs': ('1000000000000', (0, 1, 1, 0, 0, 0, 0)), 'teraCoulomb': ('1000000000000', (0, 1, 1, 0, 0, 0, 0)), 'teraCoulombs': ('1000000000000', (0, 1, 1, 0, 0, 0, 0)), 'teraSiemens': ('1000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'terasieverts': ('1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'teraSievert': ('1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'teraSieverts': ('1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'teranewtons': ('1000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'teraNewton': ('1000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'teraNewtons': ('1000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'terapascals': ('1000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'teraPascal': ('1000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'teraPascals': ('1000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'terajoules': ('1000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'teraJoule': ('1000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'teraJoules': ('1000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'terafarads': ('1000000000', (0, 4, 2, 0, -2, -1, 0)), 'teraFarad': ('1000000000', (0, 4, 2, 0, -2, -1, 0)), 'teraFarads': ('1000000000', (0, 4, 2, 0, -2, -1, 0)), 'terawebers': ('1000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'teraWeber': ('1000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'teraWebers': ('1000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'terateslas': ('1000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'teraTesla': ('1000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'teraTeslas': ('1000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'terahenrys': ('1000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'teraHenry': ('1000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'teraHenrys': ('1000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'teralumens': ('1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'terakatals': ('1000000000000', (0, -1, 0, 0, 0, 0, 1)), 'teraKatal': ('1000000000000', (0, -1, 0, 0, 0, 0, 1)), 'teraKatals': ('1000000000000', (0, -1, 0, 0, 0, 0, 1)), 'terawatts': ('1000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'teraWatt': ('1000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'teraWatts': ('1000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'teravolts': ('1000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'teraVolt': ('1000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'teraVolts': ('1000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'teragrays': ('1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'teraGray': ('1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'teraGrays': ('1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'teraohms': ('1000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'teraOhm': ('1000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'teraOhms': ('1000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'teraastronomicalunits': ('149597870700000000000000', (0, 0, 0, 0, 1, 0, 0)), 'teraatomicmassunits': ('83027/50000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'teranauticalmiles': ('1852000000000000', (0, 0, 0, 0, 1, 0, 0)), 'teraelectronvolts': ('80109/500000000', (0, -2, 0, 0, 2, 1, 0)), 'terasteradians': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'teratonne': ('1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'teratonnes': ('1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'teraroentgens': ('258000', (0, 0, 0, 1, 0, -1, 0)), 'teraRoentgen': ('258000', (0, 0, 0, 1, 0, -1, 0)), 'teraRoentgens': ('258000', (0, 0, 0, 1, 0, -1, 0)), 'teraRöntgen': ('258000', (0, 0, 0, 1, 0, -1, 0)), 'teraangstroms': ('100', (0, 0, 0, 0, 1, 0, 0)), 'teraAngstrom': ('100', (0, 0, 0, 0, 1, 0, 0)), 'teraAngstroms': ('100', (0, 0, 0, 0, 1, 0, 0)), 'teraÅngström': ('100', (0, 0, 0, 0, 1, 0, 0)), 'terahectares': ('10000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'teraradians': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'teraminutes': ('60000000000000', (0, 1, 0, 0, 0, 0, 0)), 'teradegrees': ('50000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'teracuries': ('37000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'teraliters': ('1000000000', (0, 0, 0, 0, 3, 0, 0)), 'teralitre': ('1000000000', (0, 0, 0, 0, 3, 0, 0)), 'teralitres': ('1000000000', (0, 0, 0, 0, 3, 0, 0)), 'teranepers': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'teraNeper': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'teraNepers': ('1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'teraknots': ('4630000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'terabarns': ('1/10000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'terahours': ('3600000000000000', (0, 1, 0, 0, 0, 0, 0)), 'teradays': ('86400000000000000', (0, 1, 0, 0, 0, 0, 0)), 'teraares': ('100000000000000', (0, 0, 0, 0, 2, 0, 0)), 'terabars': ('100000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'terarads': ('10000000000', (0, -2, 0, 0, 2, 0, 0)), 'terarems': ('10000000000', (0, -2, 0, 0, 2, 0, 0)), 'terabels': ('500000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'teraBel': ('500000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'teraBels': ('500000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'teragallons': ('4546090000000', (0, 0, 0, 0, 3, 0, 0)), 'teraquarts': ('1136522500', (0, 0, 0, 0, 3, 0, 0)), 'teraounces': ('28349523125000', (0, 0, 0, 0, 0, 1, 0)), 'terapounds': ('453592370000000', (0, 0, 0, 0, 0, 1, 0)), 'terainches': ('25400000000', (0, 0, 0, 0, 1, 0, 0)), 'terafeet': ('304800000000', (0, 0, 0, 0, 1, 0, 0)), 'terayards': ('914400000000', (0, 0, 0, 0, 1, 0, 0)), 'teramiles': ('1609344000000000', (0, 0, 0, 0, 1, 0, 0)), 'teragills': ('284130625/2', (0, 0, 0, 0, 3, 0, 0)), 'terapints': ('568261250', (0, 0, 0, 0, 3, 0, 0)), 'gigacandela': ('1000000000', (1, 0, 0, 0, 0, 0, 0)), 'gigasecond': ('1000000000', (0, 1, 0, 0, 0, 0, 0)), 'gigaampere': ('1000000000', (0, 0, 1, 0, 0, 0, 0)), 'gigakelvin': ('1000000000', (0, 0, 0, 1, 0, 0, 0)), 'gigametre': ('1000000000', (0, 0, 0, 0, 1, 0, 0)), 'gigagram': ('1000000000', (0, 0, 0, 0, 0, 1, 0)), 'gigamole': ('1000000000', (0, 0, 0, 0, 0, 0, 1)), 'gigabecquerel': ('1000000000', (0, -1, 0, 0, 0, 0, 0)), 'gigacoulomb': ('1000000000', (0, 1, 1, 0, 0, 0, 0)), 'gigasiemens': ('1000000000000', (0, 3, 2, 0, -2, -1, 0)), 'gigasievert': ('1000000000', (0, -2, 0, 0, 2, 0, 0)), 'giganewton': ('1000000000000', (0, -2, 0, 0, 1, 1, 0)), 'gigapascal': ('1000000000000', (0, -2, 0, 0, -1, 1, 0)), 'gigahertz': ('1000000000', (0, -1, 0, 0, 0, 0, 0)), 'gigajoule': ('1000000000000', (0, -2, 0, 0, 2, 1, 0)), 'gigafarad': ('1000000', (0, 4, 2, 0, -2, -1, 0)), 'gigaweber': ('1000000000000', (0, -2, -1, 0, 2, 1, 0)), 'gigatesla': ('1000000000000', (0, -2, -1, 0, 0, 1, 0)), 'gigahenry': ('1000000000000', (0, -2, -2, 0, 2, 1, 0)), 'gigalumen': ('1000000000', (1, 0, 0, 0, 0, 0, 0)), 'gigakatal': ('1000000000', (0, -1, 0, 0, 0, 0, 1)), 'gigawatt': ('1000000000000', (0, -3, 0, 0, 2, 1, 0)), 'gigavolt': ('1000000000000', (0, -3, -1, 0, 2, 1, 0)), 'gigagray': ('1000000000', (0, -2, 0, 0, 2, 0, 0)), 'gigaohm': ('1000000000000', (0, -3, -2, 0, 2, 1, 0)), 'gigalux': ('1000000000', (1, 0, 0, 0, -2, 0, 0)), 'gigaastronomicalunit': ('149597870700000000000', (0, 0, 0, 0, 1, 0, 0)), 'gigaatomicmassunit': ('83027/50000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'giganauticalmile': ('1852000000000', (0, 0, 0, 0, 1, 0, 0)), 'gigaelectronvolt': ('80109/500000000000', (0, -2, 0, 0, 2, 1, 0)), 'gigaangleminute': ('2500000*pi/27', (0, 0, 0, 0, 0, 0, 0)), 'gigaanglesecond': ('125000*pi/81', (0, 0, 0, 0, 0, 0, 0)), 'gigasteradian': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'gigametricton': ('1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'gigaroentgen': ('258', (0, 0, 0, 1, 0, -1, 0)), 'gigaangstrom': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'gigahectare': ('10000000000000', (0, 0, 0, 0, 2, 0, 0)), 'gigaradian': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'gigaminute': ('60000000000', (0, 1, 0, 0, 0, 0, 0)), 'gigadegree': ('50000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'gigacurie': ('37000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'gigaliter': ('1000000', (0, 0, 0, 0, 3, 0, 0)), 'giganeper': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'gigaknot': ('4630000000/9', (0, -1, 0, 0, 1, 0, 0)), 'gigabarn': ('1/10000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'gigahour': ('3600000000000', (0, 1, 0, 0, 0, 0, 0)), 'gigaday': ('86400000000000', (0, 1, 0, 0, 0, 0, 0)), 'gigaare': ('100000000000', (0, 0, 0, 0, 2, 0, 0)), 'gigabar': ('100000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'gigarad': ('10000000', (0, -2, 0, 0, 2, 0, 0)), 'gigarem': ('10000000', (0, -2, 0, 0, 2, 0, 0)), 'gigabel': ('500000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'gigagallon': ('4546090000', (0, 0, 0, 0, 3, 0, 0)), 'gigaquart': ('2273045/2', (0, 0, 0, 0, 3, 0, 0)), 'gigaounce': ('28349523125', (0, 0, 0, 0, 0, 1, 0)), 'gigapound': ('453592370000', (0, 0, 0, 0, 0, 1, 0)), 'gigastone': ('6350293180000', (0, 0, 0, 0, 0, 1, 0)), 'gigainch': ('25400000', (0, 0, 0, 0, 1, 0, 0)), 'gigafoot': ('304800000', (0, 0, 0, 0, 1, 0, 0)), 'gigayard': ('914400000', (0, 0, 0, 0, 1, 0, 0)), 'gigamile': ('1609344000000', (0, 0, 0, 0, 1, 0, 0)), 'gigagill': ('2273045/16', (0, 0, 0, 0, 3, 0, 0)), 'gigapint': ('2273045/4', (0, 0, 0, 0, 3, 0, 0)), 'gigacandelas': ('1000000000', (1, 0, 0, 0, 0, 0, 0)), 'gigaCandela': ('1000000000', (1, 0, 0, 0, 0, 0, 0)), 'gigaCandelas': ('1000000000', (1, 0, 0, 0, 0, 0, 0)), 'gigaseconds': ('1000000000', (0, 1, 0, 0, 0, 0, 0)), 'gigaamperes': ('1000000000', (0, 0, 1, 0, 0, 0, 0)), 'gigaAmpere': ('1000000000', (0, 0, 1, 0, 0, 0, 0)), 'gigaAmperes': ('1000000000', (0, 0, 1, 0, 0, 0, 0)), 'gigakelvins': ('1000000000', (0, 0, 0, 1, 0, 0, 0)), 'gigaKelvin': ('1000000000', (0, 0, 0, 1, 0, 0, 0)), 'gigaKelvins': ('1000000000', (0, 0, 0, 1, 0, 0, 0)), 'gigametres': ('1000000000', (0, 0, 0, 0, 1, 0, 0)), 'gigameter': ('1000000000', (0, 0, 0, 0, 1, 0, 0)), 'gigameters': ('1000000000', (0, 0, 0, 0, 1, 0, 0)), 'gigagrams': ('1000000000', (0, 0, 0, 0, 0, 1, 0)), 'gigamoles': ('1000000000', (0, 0, 0, 0, 0, 0, 1)), 'gigabecquerels': ('1000000000', (0, -1, 0, 0, 0, 0, 0)), 'gigaBecquerel': ('1000000000', (0, -1, 0, 0, 0, 0, 0)), 'gigaBecquerels': ('1000000000', (0, -1, 0, 0, 0, 0, 0)), 'gigacoulombs': ('1000000000', (0, 1, 1, 0, 0, 0, 0)), 'gigaCoulomb': ('1000000000', (0, 1, 1, 0, 0, 0, 0)), 'gigaCoulombs': ('1000000000', (0, 1, 1, 0, 0, 0, 0)), 'gigaSiemens': ('1000000000000', (0, 3, 2, 0, -2, -1, 0)), 'gigasieverts': ('1000000000', (0, -2, 0, 0, 2, 0, 0)), 'gigaSievert': ('1000000000', (0, -2, 0, 0, 2, 0, 0)), 'gigaSieverts': ('1000000000', (0, -2, 0, 0, 2, 0, 0)), 'giganewtons': ('1000000000000', (0, -2, 0, 0, 1, 1, 0)), 'gigaNewton': ('1000000000000', (0, -2, 0, 0, 1, 1, 0)), 'gigaNewtons': ('1000000000000', (0, -2, 0, 0, 1, 1, 0)), 'gigapascals': ('1000000000000', (0, -2, 0, 0, -1, 1, 0)), 'gigaPascal': ('1000000000000', (0, -2, 0, 0, -1, 1, 0)), 'gigaPascals': ('1000000000000', (0, -2, 0, 0, -1, 1, 0)), 'gigajoules': ('1000000000000', (0, -2, 0, 0, 2, 1, 0)), 'gigaJoule': ('1000000000000', (0, -2, 0, 0, 2, 1, 0)), 'gigaJoules': ('1000000000000', (0, -2, 0, 0, 2, 1, 0)), 'gigafarads': ('1000000', (0, 4, 2, 0, -2, -1, 0)), 'gigaFarad': ('1000000', (0, 4, 2, 0, -2, -1, 0)), 'gigaFarads': ('1000000', (0, 4, 2, 0, -2, -1, 0)), 'gigawebers': ('1000000000000', (0, -2, -1, 0, 2, 1, 0)), 'gigaWeber': ('1000000000000', (0, -2, -1, 0, 2, 1, 0)), 'gigaWebers': ('1000000000000', (0, -2, -1, 0, 2, 1, 0)), 'gigateslas': ('1000000000000', (0, -2, -1, 0, 0, 1, 0)), 'gigaTesla': ('1000000000000', (0, -2, -1, 0, 0, 1, 0)), 'gigaTeslas': ('1000000000000', (0, -2, -1, 0, 0, 1, 0)), 'gigahenrys': ('1000000000000', (0, -2, -2, 0, 2, 1, 0)), 'gigaHenry': ('1000000000000', (0, -2, -2, 0, 2, 1, 0)), 'gigaHenrys': ('1000000000000', (0, -2, -2, 0, 2, 1, 0)), 'gigalumens': ('1000000000', (1, 0, 0, 0, 0, 0, 0)), 'gigakatals': ('1000000000', (0, -1, 0, 0, 0, 0, 1)), 'gigaKatal': ('1000000000', (0, -1, 0, 0, 0, 0, 1)), 'gigaKatals': ('1000000000', (0, -1, 0, 0, 0, 0, 1)), 'gigawatts': ('1000000000000', (0, -3, 0, 0, 2, 1, 0)), 'gigaWatt': ('1000000000000', (0, -3, 0, 0, 2, 1, 0)), 'gigaWatts': ('1000000000000', (0, -3, 0, 0, 2, 1, 0)), 'gigavolts': ('1000000000000', (0, -3, -1, 0, 2, 1, 0)), 'gigaVolt': ('1000000000000', (0, -3, -1, 0, 2, 1, 0)), 'gigaVolts': ('1000000000000', (0, -3, -1, 0, 2, 1, 0)), 'gigagrays': ('1000000000', (0, -2, 0, 0, 2, 0, 0)), 'gigaGray': ('1000000000', (0, -2, 0, 0, 2, 0, 0)), 'gigaGrays': ('1000000000', (0, -2, 0, 0, 2, 0, 0)), 'gigaohms': ('1000000000000', (0, -3, -2, 0, 2, 1, 0)), 'gigaOhm': ('1000000000000', (0, -3, -2, 0, 2, 1, 0)), 'gigaOhms': ('1000000000000', (0, -3, -2, 0, 2, 1, 0)), 'gigaastronomicalunits': ('149597870700000000000', (0, 0, 0, 0, 1, 0, 0)), 'gigaatomicmassunits': ('83027/50000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'giganauticalmiles': ('1852000000000', (0, 0, 0, 0, 1, 0, 0)), 'gigaelectronvolts': ('80109/500000000000', (0, -2, 0, 0, 2, 1, 0)), 'gigasteradians': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'gigatonne': ('1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'gigatonnes': ('1000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'gigaroentgens': ('258', (0, 0, 0, 1, 0, -1, 0)), 'gigaRoentgen': ('258', (0, 0, 0, 1, 0, -1, 0)), 'gigaRoentgens': ('258', (0, 0, 0, 1, 0, -1, 0)), 'gigaRöntgen': ('258', (0, 0, 0, 1, 0, -1, 0)), 'gigaangstroms': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'gigaAngstrom': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'gigaAngstroms': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'gigaÅngström': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'gigahectares': ('10000000000000', (0, 0, 0, 0, 2, 0, 0)), 'gigaradians': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'gigaminutes': ('60000000000', (0, 1, 0, 0, 0, 0, 0)), 'gigadegrees': ('50000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'gigacuries': ('37000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'gigaliters': ('1000000', (0, 0, 0, 0, 3, 0, 0)), 'gigalitre': ('1000000', (0, 0, 0, 0, 3, 0, 0)), 'gigalitres': ('1000000', (0, 0, 0, 0, 3, 0, 0)), 'giganepers': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'gigaNeper': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'gigaNepers': ('1000000000', (0, 0, 0, 0, 0, 0, 0)), 'gigaknots': ('4630000000/9', (0, -1, 0, 0, 1, 0, 0)), 'gigabarns': ('1/10000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'gigahours': ('3600000000000', (0, 1, 0, 0, 0, 0, 0)), 'gigadays': ('86400000000000', (0, 1, 0, 0, 0, 0, 0)), 'gigaares': ('100000000000', (0, 0, 0, 0, 2, 0, 0)), 'gigabars': ('100000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'gigarads': ('10000000', (0, -2, 0, 0, 2, 0, 0)), 'gigarems': ('10000000', (0, -2, 0, 0, 2, 0, 0)), 'gigabels': ('500000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'gigaBel': ('500000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'gigaBels': ('500000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'gigagallons': ('4546090000', (0, 0, 0, 0, 3, 0, 0)), 'gigaquarts': ('2273045/2', (0, 0, 0, 0, 3, 0, 0)), 'gigaounces': ('28349523125', (0, 0, 0, 0, 0, 1, 0)), 'gigapounds': ('453592370000', (0, 0, 0, 0, 0, 1, 0)), 'gigainches': ('25400000', (0, 0, 0, 0, 1, 0, 0)), 'gigafeet': ('304800000', (0, 0, 0, 0, 1, 0, 0)), 'gigayards': ('914400000', (0, 0, 0, 0, 1, 0, 0)), 'gigamiles': ('1609344000000', (0, 0, 0, 0, 1, 0, 0)), 'gigagills': ('2273045/16', (0, 0, 0, 0, 3, 0, 0)), 'gigapints': ('2273045/4', (0, 0, 0, 0, 3, 0, 0)), 'megacandela': ('1000000', (1, 0, 0, 0, 0, 0, 0)), 'megasecond': ('1000000', (0, 1, 0, 0, 0, 0, 0)), 'megaampere': ('1000000', (0, 0, 1, 0, 0, 0, 0)), 'megakelvin': ('1000000', (0, 0, 0, 1, 0, 0, 0)), 'megametre': ('1000000', (0, 0, 0, 0, 1, 0, 0)), 'megagram': ('1000000', (0, 0, 0, 0, 0, 1, 0)), 'megamole': ('1000000', (0, 0, 0, 0, 0, 0, 1)), 'megabecquerel': ('1000000', (0, -1, 0, 0, 0, 0, 0)), 'megacoulomb': ('1000000', (0, 1, 1, 0, 0, 0, 0)), 'megasiemens': ('1000000000', (0, 3, 2, 0, -2, -1, 0)), 'megasievert': ('1000000', (0, -2, 0, 0, 2, 0, 0)), 'meganewton': ('1000000000', (0, -2, 0, 0, 1, 1, 0)), 'megapascal': ('1000000000', (0, -2, 0, 0, -1, 1, 0)), 'megahertz': ('1000000', (0, -1, 0, 0, 0, 0, 0)), 'megajoule': ('1000000000', (0, -2, 0, 0, 2, 1, 0)), 'megafarad': ('1000', (0, 4, 2, 0, -2, -1, 0)), 'megaweber': ('1000000000', (0, -2, -1, 0, 2, 1, 0)), 'megatesla': ('1000000000', (0, -2, -1, 0, 0, 1, 0)), 'megahenry': ('1000000000', (0, -2, -2, 0, 2, 1, 0)), 'megalumen': ('1000000', (1, 0, 0, 0, 0, 0, 0)), 'megakatal': ('1000000', (0, -1, 0, 0, 0, 0, 1)), 'megawatt': ('1000000000', (0, -3, 0, 0, 2, 1, 0)), 'megavolt': ('1000000000', (0, -3, -1, 0, 2, 1, 0)), 'megagray': ('1000000', (0, -2, 0, 0, 2, 0, 0)), 'megaohm': ('1000000000', (0, -3, -2, 0, 2, 1, 0)), 'megalux': ('1000000', (1, 0, 0, 0, -2, 0, 0)), 'megaastronomicalunit': ('149597870700000000', (0, 0, 0, 0, 1, 0, 0)), 'megaatomicmassunit': ('83027/50000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'meganauticalmile': ('1852000000', (0, 0, 0, 0, 1, 0, 0)), 'megaelectronvolt': ('80109/500000000000000', (0, -2, 0, 0, 2, 1, 0)), 'megaangleminute': ('2500*pi/27', (0, 0, 0, 0, 0, 0, 0)), 'megaanglesecond': ('125*pi/81', (0, 0, 0, 0, 0, 0, 0)), 'megasteradian': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'megametricton': ('1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'megaroentgen': ('129/500', (0, 0, 0, 1, 0, -1, 0)), 'megaangstrom': ('1/10000', (0, 0, 0, 0, 1, 0, 0)), 'megahectare': ('10000000000', (0, 0, 0, 0, 2, 0, 0)), 'megaradian': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'megaminute': ('60000000', (0, 1, 0, 0, 0, 0, 0)), 'megadegree': ('50000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'megacurie': ('37000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'megaliter': ('1000', (0, 0, 0, 0, 3, 0, 0)), 'meganeper': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'megaknot': ('4630000/9', (0, -1, 0, 0, 1, 0, 0)), 'megabarn': ('1/10000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'megahour': ('3600000000', (0, 1, 0, 0, 0, 0, 0)), 'megaday': ('86400000000', (0, 1, 0, 0, 0, 0, 0)), 'megaare': ('100000000', (0, 0, 0, 0, 2, 0, 0)), 'megabar': ('100000000000000', (0, -2, 0, 0, -1, 1, 0)), 'megarad': ('10000', (0, -2, 0, 0, 2, 0, 0)), 'megarem': ('10000', (0, -2, 0, 0, 2, 0, 0)), 'megabel': ('500000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'megagallon': ('4546090', (0, 0, 0, 0, 3, 0, 0)), 'megaquart': ('454609/400', (0, 0, 0, 0, 3, 0, 0)), 'megaounce': ('226796185/8', (0, 0, 0, 0, 0, 1, 0)), 'megapound': ('453592370', (0, 0, 0, 0, 0, 1, 0)), 'megastone': ('6350293180', (0, 0, 0, 0, 0, 1, 0)), 'megainch': ('25400', (0, 0, 0, 0, 1, 0, 0)), 'megafoot': ('304800', (0, 0, 0, 0, 1, 0, 0)), 'megayard': ('914400', (0, 0, 0, 0, 1, 0, 0)), 'megamile': ('1609344000', (0, 0, 0, 0, 1, 0, 0)), 'megagill': ('454609/3200', (0, 0, 0, 0, 3, 0, 0)), 'megapint': ('454609/800', (0, 0, 0, 0, 3, 0, 0)), 'megacandelas': ('1000000', (1, 0, 0, 0, 0, 0, 0)), 'megaCandela': ('1000000', (1, 0, 0, 0, 0, 0, 0)), 'megaCandelas': ('1000000', (1, 0, 0, 0, 0, 0, 0)), 'megaseconds': ('1000000', (0, 1, 0, 0, 0, 0, 0)), 'megaamperes': ('1000000', (0, 0, 1, 0, 0, 0, 0)), 'megaAmpere': ('1000000', (0, 0, 1, 0, 0, 0, 0)), 'megaAmperes': ('1000000', (0, 0, 1, 0, 0, 0, 0)), 'megakelvins': ('1000000', (0, 0, 0, 1, 0, 0, 0)), 'megaKelvin': ('1000000', (0, 0, 0, 1, 0, 0, 0)), 'megaKelvins': ('1000000', (0, 0, 0, 1, 0, 0, 0)), 'megametres': ('1000000', (0, 0, 0, 0, 1, 0, 0)), 'megameter': ('1000000', (0, 0, 0, 0, 1, 0, 0)), 'megameters': ('1000000', (0, 0, 0, 0, 1, 0, 0)), 'megagrams': ('1000000', (0, 0, 0, 0, 0, 1, 0)), 'megamoles': ('1000000', (0, 0, 0, 0, 0, 0, 1)), 'megabecquerels': ('1000000', (0, -1, 0, 0, 0, 0, 0)), 'megaBecquerel': ('1000000', (0, -1, 0, 0, 0, 0, 0)), 'megaBecquerels': ('1000000', (0, -1, 0, 0, 0, 0, 0)), 'megacoulombs': ('1000000', (0, 1, 1, 0, 0, 0, 0)), 'megaCoulomb': ('1000000', (0, 1, 1, 0, 0, 0, 0)), 'megaCoulombs': ('1000000', (0, 1, 1, 0, 0, 0, 0)), 'megaSiemens': ('1000000000', (0, 3, 2, 0, -2, -1, 0)), 'megasieverts': ('1000000', (0, -2, 0, 0, 2, 0, 0)), 'megaSievert': ('1000000', (0, -2, 0, 0, 2, 0, 0)), 'megaSieverts': ('1000000', (0, -2, 0, 0, 2, 0, 0)), 'meganewtons': ('1000000000', (0, -2, 0, 0, 1, 1, 0)), 'megaNewton': ('1000000000', (0, -2, 0, 0, 1, 1, 0)), 'megaNewtons': ('1000000000', (0, -2, 0, 0, 1, 1, 0)), 'megapascals': ('1000000000', (0, -2, 0, 0, -1, 1, 0)), 'megaPascal': ('1000000000', (0, -2, 0, 0, -1, 1, 0)), 'megaPascals': ('1000000000', (0, -2, 0, 0, -1, 1, 0)), 'megajoules': ('1000000000', (0, -2, 0, 0, 2, 1, 0)), 'megaJoule': ('1000000000', (0, -2, 0, 0, 2, 1, 0)), 'megaJoules': ('1000000000', (0, -2, 0, 0, 2, 1, 0)), 'megafarads': ('1000', (0, 4, 2, 0, -2, -1, 0)), 'megaFarad': ('1000', (0, 4, 2, 0, -2, -1, 0)), 'megaFarads': ('1000', (0, 4, 2, 0, -2, -1, 0)), 'megawebers': ('1000000000', (0, -2, -1, 0, 2, 1, 0)), 'megaWeber': ('1000000000', (0, -2, -1, 0, 2, 1, 0)), 'megaWebers': ('1000000000', (0, -2, -1, 0, 2, 1, 0)), 'megateslas': ('1000000000', (0, -2, -1, 0, 0, 1, 0)), 'megaTesla': ('1000000000', (0, -2, -1, 0, 0, 1, 0)), 'megaTeslas': ('1000000000', (0, -2, -1, 0, 0, 1, 0)), 'megahenrys': ('1000000000', (0, -2, -2, 0, 2, 1, 0)), 'megaHenry': ('1000000000', (0, -2, -2, 0, 2, 1, 0)), 'megaHenrys': ('1000000000', (0, -2, -2, 0, 2, 1, 0)), 'megalumens': ('1000000', (1, 0, 0, 0, 0, 0, 0)), 'megakatals': ('1000000', (0, -1, 0, 0, 0, 0, 1)), 'megaKatal': ('1000000', (0, -1, 0, 0, 0, 0, 1)), 'megaKatals': ('1000000', (0, -1, 0, 0, 0, 0, 1)), 'megawatts': ('1000000000', (0, -3, 0, 0, 2, 1, 0)), 'megaWatt': ('1000000000', (0, -3, 0, 0, 2, 1, 0)), 'megaWatts': ('1000000000', (0, -3, 0, 0, 2, 1, 0)), 'megavolts': ('1000000000', (0, -3, -1, 0, 2, 1, 0)), 'megaVolt': ('1000000000', (0, -3, -1, 0, 2, 1, 0)), 'megaVolts': ('1000000000', (0, -3, -1, 0, 2, 1, 0)), 'megagrays': ('1000000', (0, -2, 0, 0, 2, 0, 0)), 'megaGray': ('1000000', (0, -2, 0, 0, 2, 0, 0)), 'megaGrays': ('1000000', (0, -2, 0, 0, 2, 0, 0)), 'megaohms': ('1000000000', (0, -3, -2, 0, 2, 1, 0)), 'megaOhm': ('1000000000', (0, -3, -2, 0, 2, 1, 0)), 'megaOhms': ('1000000000', (0, -3, -2, 0, 2, 1, 0)), 'megaastronomicalunits': ('149597870700000000', (0, 0, 0, 0, 1, 0, 0)), 'megaatomicmassunits': ('83027/50000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'meganauticalmiles': ('1852000000', (0, 0, 0, 0, 1, 0, 0)), 'megaelectronvolts': ('80109/500000000000000', (0, -2, 0, 0, 2, 1, 0)), 'megasteradians': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'megatonne': ('1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'megatonnes': ('1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'megaroentgens': ('129/500', (0, 0, 0, 1, 0, -1, 0)), 'megaRoentgen': ('129/500', (0, 0, 0, 1, 0, -1, 0)), 'megaRoentgens': ('129/500', (0, 0, 0, 1, 0, -1, 0)), 'megaRöntgen': ('129/500', (0, 0, 0, 1, 0, -1, 0)), 'megaangstroms': ('1/10000', (0, 0, 0, 0, 1, 0, 0)), 'megaAngstrom': ('1/10000', (0, 0, 0, 0, 1, 0, 0)), 'megaAngstroms': ('1/10000', (0, 0, 0, 0, 1, 0, 0)), 'megaÅngström': ('1/10000', (0, 0, 0, 0, 1, 0, 0)), 'megahectares': ('10000000000', (0, 0, 0, 0, 2, 0, 0)), 'megaradians': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'megaminutes': ('60000000', (0, 1, 0, 0, 0, 0, 0)), 'megadegrees': ('50000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'megacuries': ('37000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'megaliters': ('1000', (0, 0, 0, 0, 3, 0, 0)), 'megalitre': ('1000', (0, 0, 0, 0, 3, 0, 0)), 'megalitres': ('1000', (0, 0, 0, 0, 3, 0, 0)), 'meganepers': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'megaNeper': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'megaNepers': ('1000000', (0, 0, 0, 0, 0, 0, 0)), 'megaknots': ('4630000/9', (0, -1, 0, 0, 1, 0, 0)), 'megabarns': ('1/10000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'megahours': ('3600000000', (0, 1, 0, 0, 0, 0, 0)), 'megadays': ('86400000000', (0, 1, 0, 0, 0, 0, 0)), 'megaares': ('100000000', (0, 0, 0, 0, 2, 0, 0)), 'megabars': ('100000000000000', (0, -2, 0, 0, -1, 1, 0)), 'megarads': ('10000', (0, -2, 0, 0, 2, 0, 0)), 'megarems': ('10000', (0, -2, 0, 0, 2, 0, 0)), 'megabels': ('500000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'megaBel': ('500000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'megaBels': ('500000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'megagallons': ('4546090', (0, 0, 0, 0, 3, 0, 0)), 'megaquarts': ('454609/400', (0, 0, 0, 0, 3, 0, 0)), 'megaounces': ('226796185/8', (0, 0, 0, 0, 0, 1, 0)), 'megapounds': ('453592370', (0, 0, 0, 0, 0, 1, 0)), 'megainches': ('25400', (0, 0, 0, 0, 1, 0, 0)), 'megafeet': ('304800', (0, 0, 0, 0, 1, 0, 0)), 'megayards': ('914400', (0, 0, 0, 0, 1, 0, 0)), 'megamiles': ('1609344000', (0, 0, 0, 0, 1, 0, 0)), 'megagills': ('454609/3200', (0, 0, 0, 0, 3, 0, 0)), 'megapints': ('454609/800', (0, 0, 0, 0, 3, 0, 0)), 'kilocandela': ('1000', (1, 0, 0, 0, 0, 0, 0)), 'kilosecond': ('1000', (0, 1, 0, 0, 0, 0, 0)), 'kiloampere': ('1000', (0, 0, 1, 0, 0, 0, 0)), 'kilokelvin': ('1000', (0, 0, 0, 1, 0, 0, 0)), 'kilometre': ('1000', (0, 0, 0, 0, 1, 0, 0)), 'kilogram': ('1000', (0, 0, 0, 0, 0, 1, 0)), 'kilomole': ('1000', (0, 0, 0, 0, 0, 0, 1)), 'kilobecquerel': ('1000', (0, -1, 0, 0, 0, 0, 0)), 'kilocoulomb': ('1000', (0, 1, 1, 0, 0, 0, 0)), 'kilosiemens': ('1000000', (0, 3, 2, 0, -2, -1, 0)), 'kilosievert': ('1000', (0, -2, 0, 0, 2, 0, 0)), 'kilonewton': ('1000000', (0, -2, 0, 0, 1, 1, 0)), 'kilopascal': ('1000000', (0, -2, 0, 0, -1, 1, 0)), 'kilohertz': ('1000', (0, -1, 0, 0, 0, 0, 0)), 'kilojoule': ('1000000', (0, -2, 0, 0, 2, 1, 0)), 'kilofarad': ('1', (0, 4, 2, 0, -2, -1, 0)), 'kiloweber': ('1000000', (0, -2, -1, 0, 2, 1, 0)), 'kilotesla': ('1000000', (0, -2, -1, 0, 0, 1, 0)), 'kilohenry': ('1000000', (0, -2, -2, 0, 2, 1, 0)), 'kilolumen': ('1000', (1, 0, 0, 0, 0, 0, 0)), 'kilokatal': ('1000', (0, -1, 0, 0, 0, 0, 1)), 'kilowatt': ('1000000', (0, -3, 0, 0, 2, 1, 0)), 'kilovolt': ('1000000', (0, -3, -1, 0, 2, 1, 0)), 'kilogray': ('1000', (0, -2, 0, 0, 2, 0, 0)), 'kiloohm': ('1000000', (0, -3, -2, 0, 2, 1, 0)), 'kilolux': ('1000', (1, 0, 0, 0, -2, 0, 0)), 'kiloastronomicalunit': ('149597870700000', (0, 0, 0, 0, 1, 0, 0)), 'kiloatomicmassunit': ('83027/50000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'kilonauticalmile': ('1852000', (0, 0, 0, 0, 1, 0, 0)), 'kiloelectronvolt': ('80109/500000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'kiloangleminute': ('5*pi/54', (0, 0, 0, 0, 0, 0, 0)), 'kiloanglesecond': ('pi/648', (0, 0, 0, 0, 0, 0, 0)), 'kilosteradian': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'kilometricton': ('1000000000', (0, 0, 0, 0, 0, 1, 0)), 'kiloroentgen': ('129/500000', (0, 0, 0, 1, 0, -1, 0)), 'kiloangstrom': ('1/10000000', (0, 0, 0, 0, 1, 0, 0)), 'kilohectare': ('10000000', (0, 0, 0, 0, 2, 0, 0)), 'kiloradian': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'kilominute': ('60000', (0, 1, 0, 0, 0, 0, 0)), 'kilodegree': ('50*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'kilocurie': ('37000000000000', (0, -1, 0, 0, 0, 0, 0)), 'kiloliter': ('1', (0, 0, 0, 0, 3, 0, 0)), 'kiloneper': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'kiloknot': ('4630/9', (0, -1, 0, 0, 1, 0, 0)), 'kilobarn': ('1/10000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'kilohour': ('3600000', (0, 1, 0, 0, 0, 0, 0)), 'kiloday': ('86400000', (0, 1, 0, 0, 0, 0, 0)), 'kiloare': ('100000', (0, 0, 0, 0, 2, 0, 0)), 'kilobar': ('100000000000', (0, -2, 0, 0, -1, 1, 0)), 'kilorad': ('10', (0, -2, 0, 0, 2, 0, 0)), 'kilorem': ('10', (0, -2, 0, 0, 2, 0, 0)), 'kilobel': ('500*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'kilogallon': ('454609/100', (0, 0, 0, 0, 3, 0, 0)), 'kiloquart': ('454609/400000', (0, 0, 0, 0, 3, 0, 0)), 'kiloounce': ('45359237/1600', (0, 0, 0, 0, 0, 1, 0)), 'kilopound': ('45359237/100', (0, 0, 0, 0, 0, 1, 0)), 'kilostone': ('317514659/50', (0, 0, 0, 0, 0, 1, 0)), 'kiloinch': ('127/5', (0, 0, 0, 0, 1, 0, 0)), 'kilofoot': ('1524/5', (0, 0, 0, 0, 1, 0, 0)), 'kiloyard': ('4572/5', (0, 0, 0, 0, 1, 0, 0)), 'kilomile': ('1609344', (0, 0, 0, 0, 1, 0, 0)), 'kilogill': ('454609/3200000', (0, 0, 0, 0, 3, 0, 0)), 'kilopint': ('454609/800000', (0, 0, 0, 0, 3, 0, 0)), 'kilocandelas': ('1000', (1, 0, 0, 0, 0, 0, 0)), 'kiloCandela': ('1000', (1, 0, 0, 0, 0, 0, 0)), 'kiloCandelas': ('1000', (1, 0, 0, 0, 0, 0, 0)), 'kiloseconds': ('1000', (0, 1, 0, 0, 0, 0, 0)), 'kiloamperes': ('1000', (0, 0, 1, 0, 0, 0, 0)), 'kiloAmpere': ('1000', (0, 0, 1, 0, 0, 0, 0)), 'kiloAmperes': ('1000', (0, 0, 1, 0, 0, 0, 0)), 'kilokelvins': ('1000', (0, 0, 0, 1, 0, 0, 0)), 'kiloKelvin': ('1000', (0, 0, 0, 1, 0, 0, 0)), 'kiloKelvins': ('1000', (0, 0, 0, 1, 0, 0, 0)), 'kilometres': ('1000', (0, 0, 0, 0, 1, 0, 0)), 'kilometer': ('1000', (0, 0, 0, 0, 1, 0, 0)), 'kilometers': ('1000', (0, 0, 0, 0, 1, 0, 0)), 'kilograms': ('1000', (0, 0, 0, 0, 0, 1, 0)), 'kilomoles': ('1000', (0, 0, 0, 0, 0, 0, 1)), 'kilobecquerels': ('1000', (0, -1, 0, 0, 0, 0, 0)), 'kiloBecquerel': ('1000', (0, -1, 0, 0, 0, 0, 0)), 'kiloBecquerels': ('1000', (0, -1, 0, 0, 0, 0, 0)), 'kilocoulombs': ('1000', (0, 1, 1, 0, 0, 0, 0)), 'kiloCoulomb': ('1000', (0, 1, 1, 0, 0, 0, 0)), 'kiloCoulombs': ('1000', (0, 1, 1, 0, 0, 0, 0)), 'kiloSiemens': ('1000000', (0, 3, 2, 0, -2, -1, 0)), 'kilosieverts': ('1000', (0, -2, 0, 0, 2, 0, 0)), 'kiloSievert': ('1000', (0, -2, 0, 0, 2, 0, 0)), 'kiloSieverts': ('1000', (0, -2, 0, 0, 2, 0, 0)), 'kilonewtons': ('1000000', (0, -2, 0, 0, 1, 1, 0)), 'kiloNewton': ('1000000', (0, -2, 0, 0, 1, 1, 0)), 'kiloNewtons': ('1000000', (0, -2, 0, 0, 1, 1, 0)), 'kilopascals': ('1000000', (0, -2, 0, 0, -1, 1, 0)), 'kiloPascal': ('1000000', (0, -2, 0, 0, -1, 1, 0)), 'kiloPascals': ('1000000', (0, -2, 0, 0, -1, 1, 0)), 'kilojoules': ('1000000', (0, -2, 0, 0, 2, 1, 0)), 'kiloJoule': ('1000000', (0, -2, 0, 0, 2, 1, 0)), 'kiloJoules': ('1000000', (0, -2, 0, 0, 2, 1, 0)), 'kilofarads': ('1', (0, 4, 2, 0, -2, -1, 0)), 'kiloFarad': ('1', (0, 4, 2, 0, -2, -1, 0)), 'kiloFarads': ('1', (0, 4, 2, 0, -2, -1, 0)), 'kilowebers': ('1000000', (0, -2, -1, 0, 2, 1, 0)), 'kiloWeber': ('1000000', (0, -2, -1, 0, 2, 1, 0)), 'kiloWebers': ('1000000', (0, -2, -1, 0, 2, 1, 0)), 'kiloteslas': ('1000000', (0, -2, -1, 0, 0, 1, 0)), 'kiloTesla': ('1000000', (0, -2, -1, 0, 0, 1, 0)), 'kiloTeslas': ('1000000', (0, -2, -1, 0, 0, 1, 0)), 'kilohenrys': ('1000000', (0, -2, -2, 0, 2, 1, 0)), 'kiloHenry': ('1000000', (0, -2, -2, 0, 2, 1, 0)), 'kiloHenrys': ('1000000', (0, -2, -2, 0, 2, 1, 0)), 'kilolumens': ('1000', (1, 0, 0, 0, 0, 0, 0)), 'kilokatals': ('1000', (0, -1, 0, 0, 0, 0, 1)), 'kiloKatal': ('1000', (0, -1, 0, 0, 0, 0, 1)), 'kiloKatals': ('1000', (0, -1, 0, 0, 0, 0, 1)), 'kilowatts': ('1000000', (0, -3, 0, 0, 2, 1, 0)), 'kiloWatt': ('1000000', (0, -3, 0, 0, 2, 1, 0)), 'kiloWatts': ('1000000', (0, -3, 0, 0, 2, 1, 0)), 'kilovolts': ('1000000', (0, -3, -1, 0, 2, 1, 0)), 'kiloVolt': ('1000000', (0, -3, -1, 0, 2, 1, 0)), 'kiloVolts': ('1000000', (0, -3, -1, 0, 2, 1, 0)), 'kilograys': ('1000', (0, -2, 0, 0, 2, 0, 0)), 'kiloGray': ('1000', (0, -2, 0, 0, 2, 0, 0)), 'kiloGrays': ('1000', (0, -2, 0, 0, 2, 0, 0)), 'kiloohms': ('1000000', (0, -3, -2, 0, 2, 1, 0)), 'kiloOhm': ('1000000', (0, -3, -2, 0, 2, 1, 0)), 'kiloOhms': ('1000000', (0, -3, -2, 0, 2, 1, 0)), 'kiloastronomicalunits': ('149597870700000', (0, 0, 0, 0, 1, 0, 0)), 'kiloatomicmassunits': ('83027/50000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'kilonauticalmiles': ('1852000', (0, 0, 0, 0, 1, 0, 0)), 'kiloelectronvolts': ('80109/500000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'kilosteradians': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'kilotonne': ('1000000000', (0, 0, 0, 0, 0, 1, 0)), 'kilotonnes': ('1000000000', (0, 0, 0, 0, 0, 1, 0)), 'kiloroentgens': ('129/500000', (0, 0, 0, 1, 0, -1, 0)), 'kiloRoentgen': ('129/500000', (0, 0, 0, 1, 0, -1, 0)), 'kiloRoentgens': ('129/500000', (0, 0, 0, 1, 0, -1, 0)), 'kiloRöntgen': ('129/500000', (0, 0, 0, 1, 0, -1, 0)), 'kiloangstroms': ('1/10000000', (0, 0, 0, 0, 1, 0, 0)), 'kiloAngstrom': ('1/10000000', (0, 0, 0, 0, 1, 0, 0)), 'kiloAngstroms': ('1/10000000', (0, 0, 0, 0, 1, 0, 0)), 'kiloÅngström': ('1/10000000', (0, 0, 0, 0, 1, 0, 0)), 'kilohectares': ('10000000', (0, 0, 0, 0, 2, 0, 0)), 'kiloradians': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'kilominutes': ('60000', (0, 1, 0, 0, 0, 0, 0)), 'kilodegrees': ('50*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'kilocuries': ('37000000000000', (0, -1, 0, 0, 0, 0, 0)), 'kiloliters': ('1', (0, 0, 0, 0, 3, 0, 0)), 'kilolitre': ('1', (0, 0, 0, 0, 3, 0, 0)), 'kilolitres': ('1', (0, 0, 0, 0, 3, 0, 0)), 'kilonepers': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'kiloNeper': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'kiloNepers': ('1000', (0, 0, 0, 0, 0, 0, 0)), 'kiloknots': ('4630/9', (0, -1, 0, 0, 1, 0, 0)), 'kilobarns': ('1/10000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'kilohours': ('3600000', (0, 1, 0, 0, 0, 0, 0)), 'kilodays': ('86400000', (0, 1, 0, 0, 0, 0, 0)), 'kiloares': ('100000', (0, 0, 0, 0, 2, 0, 0)), 'kilobars': ('100000000000', (0, -2, 0, 0, -1, 1, 0)), 'kilorads': ('10', (0, -2, 0, 0, 2, 0, 0)), 'kilorems': ('10', (0, -2, 0, 0, 2, 0, 0)), 'kilobels': ('500*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'kiloBel': ('500*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'kiloBels': ('500*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'kilogallons': ('454609/100', (0, 0, 0, 0, 3, 0, 0)), 'kiloquarts': ('454609/400000', (0, 0, 0, 0, 3, 0, 0)), 'kiloounces': ('45359237/1600', (0, 0, 0, 0, 0, 1, 0)), 'kilopounds': ('45359237/100', (0, 0, 0, 0, 0, 1, 0)), 'kiloinches': ('127/5', (0, 0, 0, 0, 1, 0, 0)), 'kilofeet': ('1524/5', (0, 0, 0, 0, 1, 0, 0)), 'kiloyards': ('4572/5', (0, 0, 0, 0, 1, 0, 0)), 'kilomiles': ('1609344', (0, 0, 0, 0, 1, 0, 0)), 'kilogills': ('454609/3200000', (0, 0, 0, 0, 3, 0, 0)), 'kilopints': ('454609/800000', (0, 0, 0, 0, 3, 0, 0)), 'dekacandela': ('10', (1, 0, 0, 0, 0, 0, 0)), 'dekasecond': ('10', (0, 1, 0, 0, 0, 0, 0)), 'dekaampere': ('10', (0, 0, 1, 0, 0, 0, 0)), 'dekakelvin': ('10', (0, 0, 0, 1, 0, 0, 0)), 'dekametre': ('10', (0, 0, 0, 0, 1, 0, 0)), 'dekagram': ('10', (0, 0, 0, 0, 0, 1, 0)), 'dekamole': ('10', (0, 0, 0, 0, 0, 0, 1)), 'dekabecquerel': ('10', (0, -1, 0, 0, 0, 0, 0)), 'dekacoulomb': ('10', (0, 1, 1, 0, 0, 0, 0)), 'dekasiemens': ('10000', (0, 3, 2, 0, -2, -1, 0)), 'dekasievert': ('10', (0, -2, 0, 0, 2, 0, 0)), 'dekanewton': ('10000', (0, -2, 0, 0, 1, 1, 0)), 'dekapascal': ('10000', (0, -2, 0, 0, -1, 1, 0)), 'dekahertz': ('10', (0, -1, 0, 0, 0, 0, 0)), 'dekajoule': ('10000', (0, -2, 0, 0, 2, 1, 0)), 'dekafarad': ('1/100', (0, 4, 2, 0, -2, -1, 0)), 'dekaweber': ('10000', (0, -2, -1, 0, 2, 1, 0)), 'dekatesla': ('10000', (0, -2, -1, 0, 0, 1, 0)), 'dekahenry': ('10000', (0, -2, -2, 0, 2, 1, 0)), 'dekalumen': ('10', (1, 0, 0, 0, 0, 0, 0)), 'dekakatal': ('10', (0, -1, 0, 0, 0, 0, 1)), 'dekawatt': ('10000', (0, -3, 0, 0, 2, 1, 0)), 'dekavolt': ('10000', (0, -3, -1, 0, 2, 1, 0)), 'dekagray': ('10', (0, -2, 0, 0, 2, 0, 0)), 'dekaohm': ('10000', (0, -3, -2, 0, 2, 1, 0)), 'dekalux': ('10', (1, 0, 0, 0, -2, 0, 0)), 'dekaastronomicalunit': ('1495978707000', (0, 0, 0, 0, 1, 0, 0)), 'dekaatomicmassunit': ('83027/5000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'dekanauticalmile': ('18520', (0, 0, 0, 0, 1, 0, 0)), 'dekaelectronvolt': ('80109/50000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'dekaangleminute': ('pi/1080', (0, 0, 0, 0, 0, 0, 0)), 'dekaanglesecond': ('pi/64800', (0, 0, 0, 0, 0, 0, 0)), 'dekasteradian': ('10', (0, 0, 0, 0, 0, 0, 0)), 'dekametricton': ('10000000', (0, 0, 0, 0, 0, 1, 0)), 'dekaroentgen': ('129/50000000', (0, 0, 0, 1, 0, -1, 0)), 'dekaangstrom': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'dekahectare': ('100000', (0, 0, 0, 0, 2, 0, 0)), 'dekaradian': ('10', (0, 0, 0, 0, 0, 0, 0)), 'dekaminute': ('600', (0, 1, 0, 0, 0, 0, 0)), 'dekadegree': ('pi/18', (0, 0, 0, 0, 0, 0, 0)), 'dekacurie': ('370000000000', (0, -1, 0, 0, 0, 0, 0)), 'dekaliter': ('1/100', (0, 0, 0, 0, 3, 0, 0)), 'dekaneper': ('10', (0, 0, 0, 0, 0, 0, 0)), 'dekaknot': ('463/90', (0, -1, 0, 0, 1, 0, 0)), 'dekabarn': ('1/1000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'dekahour': ('36000', (0, 1, 0, 0, 0, 0, 0)), 'dekaday': ('864000', (0, 1, 0, 0, 0, 0, 0)), 'dekaare': ('1000', (0, 0, 0, 0, 2, 0, 0)), 'dekabar': ('1000000000', (0, -2, 0, 0, -1, 1, 0)), 'dekarad': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'dekarem': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'dekabel': ('5*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'dekagallon': ('454609/10000', (0, 0, 0, 0, 3, 0, 0)), 'dekaquart': ('454609/40000000', (0, 0, 0, 0, 3, 0, 0)), 'dekaounce': ('45359237/160000', (0, 0, 0, 0, 0, 1, 0)), 'dekapound': ('45359237/10000', (0, 0, 0, 0, 0, 1, 0)), 'dekastone': ('317514659/5000', (0, 0, 0, 0, 0, 1, 0)), 'dekainch': ('127/500', (0, 0, 0, 0, 1, 0, 0)), 'dekafoot': ('381/125', (0, 0, 0, 0, 1, 0, 0)), 'dekayard': ('1143/125', (0, 0, 0, 0, 1, 0, 0)), 'dekamile': ('402336/25', (0, 0, 0, 0, 1, 0, 0)), 'dekagill': ('454609/320000000', (0, 0, 0, 0, 3, 0, 0)), 'dekapint': ('454609/80000000', (0, 0, 0, 0, 3, 0, 0)), 'dekacandelas': ('10', (1, 0, 0, 0, 0, 0, 0)), 'dekaCandela': ('10', (1, 0, 0, 0, 0, 0, 0)), 'dekaCandelas': ('10', (1, 0, 0, 0, 0, 0, 0)), 'dekaseconds': ('10', (0, 1, 0, 0, 0, 0, 0)), 'dekaamperes': ('10', (0, 0, 1, 0, 0, 0, 0)), 'dekaAmpere': ('10', (0, 0, 1, 0, 0, 0, 0)), 'dekaAmperes': ('10', (0, 0, 1, 0, 0, 0, 0)), 'dekakelvins': ('10', (0, 0, 0, 1, 0, 0, 0)), 'dekaKelvin': ('10', (0, 0, 0, 1, 0, 0, 0)), 'dekaKelvins': ('10', (0, 0, 0, 1, 0, 0, 0)), 'dekametres': ('10', (0, 0, 0, 0, 1, 0, 0)), 'dekameter': ('10', (0, 0, 0, 0, 1, 0, 0)), 'dekameters': ('10', (0, 0, 0, 0, 1, 0, 0)), 'dekagrams': ('10', (0, 0, 0, 0, 0, 1, 0)), 'dekamoles': ('10', (0, 0, 0, 0, 0, 0, 1)), 'dekabecquerels': ('10', (0, -1, 0, 0, 0, 0, 0)), 'dekaBecquerel': ('10', (0, -1, 0, 0, 0, 0, 0)), 'dekaBecquerels': ('10', (0, -1, 0, 0, 0, 0, 0)), 'dekacoulombs': ('10', (0, 1, 1, 0, 0, 0, 0)), 'dekaCoulomb': ('10', (0, 1, 1, 0, 0, 0, 0)), 'dekaCoulombs': ('10', (0, 1, 1, 0, 0, 0, 0)), 'dekaSiemens': ('10000', (0, 3, 2, 0, -2, -1, 0)), 'dekasieverts': ('10', (0, -2, 0, 0, 2, 0, 0)), 'dekaSievert': ('10', (0, -2, 0, 0, 2, 0, 0)), 'dekaSieverts': ('10', (0, -2, 0, 0, 2, 0, 0)), 'dekanewtons': ('10000', (0, -2, 0, 0, 1, 1, 0)), 'dekaNewton': ('10000', (0, -2, 0, 0, 1, 1, 0)), 'dekaNewtons': ('10000', (0, -2, 0, 0, 1, 1, 0)), 'dekapascals': ('10000', (0, -2, 0, 0, -1, 1, 0)), 'dekaPascal': ('10000', (0, -2, 0, 0, -1, 1, 0)), 'dekaPascals': ('10000', (0, -2, 0, 0, -1, 1, 0)), 'dekajoules': ('10000', (0, -2, 0, 0, 2, 1, 0)), 'dekaJoule': ('10000', (0, -2, 0, 0, 2, 1, 0)), 'dekaJoules': ('10000', (0, -2, 0, 0, 2, 1, 0)), 'dekafarads': ('1/100', (0, 4, 2, 0, -2, -1, 0)), 'dekaFarad': ('1/100', (0, 4, 2, 0, -2, -1, 0)), 'dekaFarads': ('1/100', (0, 4, 2, 0, -2, -1, 0)), 'dekawebers': ('10000', (0, -2, -1, 0, 2, 1, 0)), 'dekaWeber': ('10000', (0, -2, -1, 0, 2, 1, 0)), 'dekaWebers': ('10000', (0, -2, -1, 0, 2, 1, 0)), 'dekateslas': ('10000', (0, -2, -1, 0, 0, 1, 0)), 'dekaTesla': ('10000', (0, -2, -1, 0, 0, 1, 0)), 'dekaTeslas': ('10000', (0, -2, -1, 0, 0, 1, 0)), 'dekahenrys': ('10000', (0, -2, -2, 0, 2, 1, 0)), 'dekaHenry': ('10000', (0, -2, -2, 0, 2, 1, 0)), 'dekaHenrys': ('10000', (0, -2, -2, 0, 2, 1, 0)), 'dekalumens': ('10', (1, 0, 0, 0, 0, 0, 0)), 'dekakatals': ('10', (0, -1, 0, 0, 0, 0, 1)), 'dekaKatal': ('10', (0, -1, 0, 0, 0, 0, 1)), 'dekaKatals': ('10', (0, -1, 0, 0, 0, 0, 1)), 'dekawatts': ('10000', (0, -3, 0, 0, 2, 1, 0)), 'dekaWatt': ('10000', (0, -3, 0, 0, 2, 1, 0)), 'dekaWatts': ('10000', (0, -3, 0, 0, 2, 1, 0)), 'dekavolts': ('10000', (0, -3, -1, 0, 2, 1, 0)), 'dekaVolt': ('10000', (0, -3, -1, 0, 2, 1, 0)), 'dekaVolts': ('10000', (0, -3, -1, 0, 2, 1, 0)), 'dekagrays': ('10', (0, -2, 0, 0, 2, 0, 0)), 'dekaGray': ('10', (0, -2, 0, 0, 2, 0, 0)), 'dekaGrays': ('10', (0, -2, 0, 0, 2, 0, 0)), 'dekaohms': ('10000', (0, -3, -2, 0, 2, 1, 0)), 'dekaOhm': ('10000', (0, -3, -2, 0, 2, 1, 0)), 'dekaOhms': ('10000', (0, -3, -2, 0, 2, 1, 0)), 'dekaastronomicalunits': ('1495978707000', (0, 0, 0, 0, 1, 0, 0)), 'dekaatomicmassunits': ('83027/5000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'dekanauticalmiles': ('18520', (0, 0, 0, 0, 1, 0, 0)), 'dekaelectronvolts': ('80109/50000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'dekasteradians': ('10', (0, 0, 0, 0, 0, 0, 0)), 'dekatonne': ('10000000', (0, 0, 0, 0, 0, 1, 0)), 'dekatonnes': ('10000000', (0, 0, 0, 0, 0, 1, 0)), 'dekaroentgens': ('129/50000000', (0, 0, 0, 1, 0, -1, 0)), 'dekaRoentgen': ('129/50000000', (0, 0, 0, 1, 0, -1, 0)), 'dekaRoentgens': ('129/50000000', (0, 0, 0, 1, 0, -1, 0)), 'dekaRöntgen': ('129/50000000', (0, 0, 0, 1, 0, -1, 0)), 'dekaangstroms': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'dekaAngstrom': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'dekaAngstroms': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'dekaÅngström': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'dekahectares': ('100000', (0, 0, 0, 0, 2, 0, 0)), 'dekaradians': ('10', (0, 0, 0, 0, 0, 0, 0)), 'dekaminutes': ('600', (0, 1, 0, 0, 0, 0, 0)), 'dekadegrees': ('pi/18', (0, 0, 0, 0, 0, 0, 0)), 'dekacuries': ('370000000000', (0, -1, 0, 0, 0, 0, 0)), 'dekaliters': ('1/100', (0, 0, 0, 0, 3, 0, 0)), 'dekalitre': ('1/100', (0, 0, 0, 0, 3, 0, 0)), 'dekalitres': ('1/100', (0, 0, 0, 0, 3, 0, 0)), 'dekanepers': ('10', (0, 0, 0, 0, 0, 0, 0)), 'dekaNeper': ('10', (0, 0, 0, 0, 0, 0, 0)), 'dekaNepers': ('10', (0, 0, 0, 0, 0, 0, 0)), 'dekaknots': ('463/90', (0, -1, 0, 0, 1, 0, 0)), 'dekabarns': ('1/1000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'dekahours': ('36000', (0, 1, 0, 0, 0, 0, 0)), 'dekadays': ('864000', (0, 1, 0, 0, 0, 0, 0)), 'dekaares': ('1000', (0, 0, 0, 0, 2, 0, 0)), 'dekabars': ('1000000000', (0, -2, 0, 0, -1, 1, 0)), 'dekarads': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'dekarems': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'dekabels': ('5*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'dekaBel': ('5*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'dekaBels': ('5*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'dekagallons': ('454609/10000', (0, 0, 0, 0, 3, 0, 0)), 'dekaquarts': ('454609/40000000', (0, 0, 0, 0, 3, 0, 0)), 'dekaounces': ('45359237/160000', (0, 0, 0, 0, 0, 1, 0)), 'dekapounds': ('45359237/10000', (0, 0, 0, 0, 0, 1, 0)), 'dekainches': ('127/500', (0, 0, 0, 0, 1, 0, 0)), 'dekafeet': ('381/125', (0, 0, 0, 0, 1, 0, 0)), 'dekayards': ('1143/125', (0, 0, 0, 0, 1, 0, 0)), 'dekamiles': ('402336/25', (0, 0, 0, 0, 1, 0, 0)), 'dekagills': ('454609/320000000', (0, 0, 0, 0, 3, 0, 0)), 'dekapints': ('454609/80000000', (0, 0, 0, 0, 3, 0, 0)), 'decicandela': ('1/10', (1, 0, 0, 0, 0, 0, 0)), 'decisecond': ('1/10', (0, 1, 0, 0, 0, 0, 0)), 'deciampere': ('1/10', (0, 0, 1, 0, 0, 0, 0)), 'decikelvin': ('1/10', (0, 0, 0, 1, 0, 0, 0)), 'decimetre': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'decigram': ('1/10', (0, 0, 0, 0, 0, 1, 0)), 'decimole': ('1/10', (0, 0, 0, 0, 0, 0, 1)), 'decibecquerel': ('1/10', (0, -1, 0, 0, 0, 0, 0)), 'decicoulomb': ('1/10', (0, 1, 1, 0, 0, 0, 0)), 'decisiemens': ('100', (0, 3, 2, 0, -2, -1, 0)), 'decisievert': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'decinewton': ('100', (0, -2, 0, 0, 1, 1, 0)), 'decipascal': ('100', (0, -2, 0, 0, -1, 1, 0)), 'decihertz': ('1/10', (0, -1, 0, 0, 0, 0, 0)), 'decijoule': ('100', (0, -2, 0, 0, 2, 1, 0)), 'decifarad': ('1/10000', (0, 4, 2, 0, -2, -1, 0)), 'deciweber': ('100', (0, -2, -1, 0, 2, 1, 0)), 'decitesla': ('100', (0, -2, -1, 0, 0, 1, 0)), 'decihenry': ('100', (0, -2, -2, 0, 2, 1, 0)), 'decilumen': ('1/10', (1, 0, 0, 0, 0, 0, 0)), 'decikatal': ('1/10', (0, -1, 0, 0, 0, 0, 1)), 'deciwatt': ('100', (0, -3, 0, 0, 2, 1, 0)), 'decivolt': ('100', (0, -3, -1, 0, 2, 1, 0)), 'decigray': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'deciohm': ('100', (0, -3, -2, 0, 2, 1, 0)), 'decilux': ('1/10', (1, 0, 0, 0, -2, 0, 0)), 'deciastronomicalunit': ('14959787070', (0, 0, 0, 0, 1, 0, 0)), 'deciatomicmassunit': ('83027/500000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'decinauticalmile': ('926/5', (0, 0, 0, 0, 1, 0, 0)), 'decielectronvolt': ('80109/5000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'deciangleminute': ('pi/108000', (0, 0, 0, 0, 0, 0, 0)), 'decianglesecond': ('pi/6480000', (0, 0, 0, 0, 0, 0, 0)), 'decisteradian': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'decimetricton': ('100000', (0, 0, 0, 0, 0, 1, 0)), 'deciroentgen': ('129/5000000000', (0, 0, 0, 1, 0, -1, 0)), 'deciangstrom': ('1/100000000000', (0, 0, 0, 0, 1, 0, 0)), 'decihectare': ('1000', (0, 0, 0, 0, 2, 0, 0)), 'deciradian': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'deciminute': ('6', (0, 1, 0, 0, 0, 0, 0)), 'decidegree': ('pi/1800', (0, 0, 0, 0, 0, 0, 0)), 'decicurie': ('3700000000', (0, -1, 0, 0, 0, 0, 0)), 'deciliter': ('1/10000', (0, 0, 0, 0, 3, 0, 0)), 'decineper': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'deciknot': ('463/9000', (0, -1, 0, 0, 1, 0, 0)), 'decibarn': ('1/100000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'decihour': ('360', (0, 1, 0, 0, 0, 0, 0)), 'deciday': ('8640', (0, 1, 0, 0, 0, 0, 0)), 'deciare': ('10', (0, 0, 0, 0, 2, 0, 0)), 'decibar': ('10000000', (0, -2, 0, 0, -1, 1, 0)), 'decirad': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'decirem': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'decibel': ('log(10)/20', (0, 0, 0, 0, 0, 0, 0)), 'decigallon': ('454609/1000000', (0, 0, 0, 0, 3, 0, 0)), 'deciquart': ('454609/4000000000', (0, 0, 0, 0, 3, 0, 0)), 'deciounce': ('45359237/16000000', (0, 0, 0, 0, 0, 1, 0)), 'decipound': ('45359237/1000000', (0, 0, 0, 0, 0, 1, 0)), 'decistone': ('317514659/500000', (0, 0, 0, 0, 0, 1, 0)), 'deciinch': ('127/50000', (0, 0, 0, 0, 1, 0, 0)), 'decifoot': ('381/12500', (0, 0, 0, 0, 1, 0, 0)), 'deciyard': ('1143/12500', (0, 0, 0, 0, 1, 0, 0)), 'decimile': ('100584/625', (0, 0, 0, 0, 1, 0, 0)), 'decigill': ('454609/32000000000', (0, 0, 0, 0, 3, 0, 0)), 'decipint': ('454609/8000000000', (0, 0, 0, 0, 3, 0, 0)), 'decicandelas': ('1/10', (1, 0, 0, 0, 0, 0, 0)), 'deciCandela': ('1/10', (1, 0, 0, 0, 0, 0, 0)), 'deciCandelas': ('1/10', (1, 0, 0, 0, 0, 0, 0)), 'deciseconds': ('1/10', (0, 1, 0, 0, 0, 0, 0)), 'deciamperes': ('1/10', (0, 0, 1, 0, 0, 0, 0)), 'deciAmpere': ('1/10', (0, 0, 1, 0, 0, 0, 0)), 'deciAmperes': ('1/10', (0, 0, 1, 0, 0, 0, 0)), 'decikelvins': ('1/10', (0, 0, 0, 1, 0, 0, 0)), 'deciKelvin': ('1/10', (0, 0, 0, 1, 0, 0, 0)), 'deciKelvins': ('1/10', (0, 0, 0, 1, 0, 0, 0)), 'decimetres': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'decimeter': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'decimeters': ('1/10', (0, 0, 0, 0, 1, 0, 0)), 'decigrams': ('1/10', (0, 0, 0, 0, 0, 1, 0)), 'decimoles': ('1/10', (0, 0, 0, 0, 0, 0, 1)), 'decibecquerels': ('1/10', (0, -1, 0, 0, 0, 0, 0)), 'deciBecquerel': ('1/10', (0, -1, 0, 0, 0, 0, 0)), 'deciBecquerels': ('1/10', (0, -1, 0, 0, 0, 0, 0)), 'decicoulombs': ('1/10', (0, 1, 1, 0, 0, 0, 0)), 'deciCoulomb': ('1/10', (0, 1, 1, 0, 0, 0, 0)), 'deciCoulombs': ('1/10', (0, 1, 1, 0, 0, 0, 0)), 'deciSiemens': ('100', (0, 3, 2, 0, -2, -1, 0)), 'decisieverts': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'deciSievert': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'deciSieverts': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'decinewtons': ('100', (0, -2, 0, 0, 1, 1, 0)), 'deciNewton': ('100', (0, -2, 0, 0, 1, 1, 0)), 'deciNewtons': ('100', (0, -2, 0, 0, 1, 1, 0)), 'decipascals': ('100', (0, -2, 0, 0, -1, 1, 0)), 'deciPascal': ('100', (0, -2, 0, 0, -1, 1, 0)), 'deciPascals': ('100', (0, -2, 0, 0, -1, 1, 0)), 'decijoules': ('100', (0, -2, 0, 0, 2, 1, 0)), 'deciJoule': ('100', (0, -2, 0, 0, 2, 1, 0)), 'deciJoules': ('100', (0, -2, 0, 0, 2, 1, 0)), 'decifarads': ('1/10000', (0, 4, 2, 0, -2, -1, 0)), 'deciFarad': ('1/10000', (0, 4, 2, 0, -2, -1, 0)), 'deciFarads': ('1/10000', (0, 4, 2, 0, -2, -1, 0)), 'deciwebers': ('100', (0, -2, -1, 0, 2, 1, 0)), 'deciWeber': ('100', (0, -2, -1, 0, 2, 1, 0)), 'deciWebers': ('100', (0, -2, -1, 0, 2, 1, 0)), 'deciteslas': ('100', (0, -2, -1, 0, 0, 1, 0)), 'deciTesla': ('100', (0, -2, -1, 0, 0, 1, 0)), 'deciTeslas': ('100', (0, -2, -1, 0, 0, 1, 0)), 'decihenrys': ('100', (0, -2, -2, 0, 2, 1, 0)), 'deciHenry': ('100', (0, -2, -2, 0, 2, 1, 0)), 'deciHenrys': ('100', (0, -2, -2, 0, 2, 1, 0)), 'decilumens': ('1/10', (1, 0, 0, 0, 0, 0, 0)), 'decikatals': ('1/10', (0, -1, 0, 0, 0, 0, 1)), 'deciKatal': ('1/10', (0, -1, 0, 0, 0, 0, 1)), 'deciKatals': ('1/10', (0, -1, 0, 0, 0, 0, 1)), 'deciwatts': ('100', (0, -3, 0, 0, 2, 1, 0)), 'deciWatt': ('100', (0, -3, 0, 0, 2, 1, 0)), 'deciWatts': ('100', (0, -3, 0, 0, 2, 1, 0)), 'decivolts': ('100', (0, -3, -1, 0, 2, 1, 0)), 'deciVolt': ('100', (0, -3, -1, 0, 2, 1, 0)), 'deciVolts': ('100', (0, -3, -1, 0, 2, 1, 0)), 'decigrays': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'deciGray': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'deciGrays': ('1/10', (0, -2, 0, 0, 2, 0, 0)), 'deciohms': ('100', (0, -3, -2, 0, 2, 1, 0)), 'deciOhm': ('100', (0, -3, -2, 0, 2, 1, 0)), 'deciOhms': ('100', (0, -3, -2, 0, 2, 1, 0)), 'deciastronomicalunits': ('14959787070', (0, 0, 0, 0, 1, 0, 0)), 'deciatomicmassunits': ('83027/500000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'decinauticalmiles': ('926/5', (0, 0, 0, 0, 1, 0, 0)), 'decielectronvolts': ('80109/5000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'decisteradians': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'decitonne': ('100000', (0, 0, 0, 0, 0, 1, 0)), 'decitonnes': ('100000', (0, 0, 0, 0, 0, 1, 0)), 'deciroentgens': ('129/5000000000', (0, 0, 0, 1, 0, -1, 0)), 'deciRoentgen': ('129/5000000000', (0, 0, 0, 1, 0, -1, 0)), 'deciRoentgens': ('129/5000000000', (0, 0, 0, 1, 0, -1, 0)), 'deciRöntgen': ('129/5000000000', (0, 0, 0, 1, 0, -1, 0)), 'deciangstroms': ('1/100000000000', (0, 0, 0, 0, 1, 0, 0)), 'deciAngstrom': ('1/100000000000', (0, 0, 0, 0, 1, 0, 0)), 'deciAngstroms': ('1/100000000000', (0, 0, 0, 0, 1, 0, 0)), 'deciÅngström': ('1/100000000000', (0, 0, 0, 0, 1, 0, 0)), 'decihectares': ('1000', (0, 0, 0, 0, 2, 0, 0)), 'deciradians': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'deciminutes': ('6', (0, 1, 0, 0, 0, 0, 0)), 'decidegrees': ('pi/1800', (0, 0, 0, 0, 0, 0, 0)), 'decicuries': ('3700000000', (0, -1, 0, 0, 0, 0, 0)), 'deciliters': ('1/10000', (0, 0, 0, 0, 3, 0, 0)), 'decilitre': ('1/10000', (0, 0, 0, 0, 3, 0, 0)), 'decilitres': ('1/10000', (0, 0, 0, 0, 3, 0, 0)), 'decinepers': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'deciNeper': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'deciNepers': ('1/10', (0, 0, 0, 0, 0, 0, 0)), 'deciknots': ('463/9000', (0, -1, 0, 0, 1, 0, 0)), 'decibarns': ('1/100000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'decihours': ('360', (0, 1, 0, 0, 0, 0, 0)), 'decidays': ('8640', (0, 1, 0, 0, 0, 0, 0)), 'deciares': ('10', (0, 0, 0, 0, 2, 0, 0)), 'decibars': ('10000000', (0, -2, 0, 0, -1, 1, 0)), 'decirads': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'decirems': ('1/1000', (0, -2, 0, 0, 2, 0, 0)), 'decibels': ('log(10)/20', (0, 0, 0, 0, 0, 0, 0)), 'deciBel': ('log(10)/20', (0, 0, 0, 0, 0, 0, 0)), 'deciBels': ('log(10)/20', (0, 0, 0, 0, 0, 0, 0)), 'decigallons': ('454609/1000000', (0, 0, 0, 0, 3, 0, 0)), 'deciquarts': ('454609/4000000000', (0, 0, 0, 0, 3, 0, 0)), 'deciounces': ('45359237/16000000', (0, 0, 0, 0, 0, 1, 0)), 'decipounds': ('45359237/1000000', (0, 0, 0, 0, 0, 1, 0)), 'deciinches': ('127/50000', (0, 0, 0, 0, 1, 0, 0)), 'decifeet': ('381/12500', (0, 0, 0, 0, 1, 0, 0)), 'deciyards': ('1143/12500', (0, 0, 0, 0, 1, 0, 0)), 'decimiles': ('100584/625', (0, 0, 0, 0, 1, 0, 0)), 'decigills': ('454609/32000000000', (0, 0, 0, 0, 3, 0, 0)), 'decipints': ('454609/8000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanocandela': ('1/1000000000', (1, 0, 0, 0, 0, 0, 0)), 'nanosecond': ('1/1000000000', (0, 1, 0, 0, 0, 0, 0)), 'nanoampere': ('1/1000000000', (0, 0, 1, 0, 0, 0, 0)), 'nanokelvin': ('1/1000000000', (0, 0, 0, 1, 0, 0, 0)), 'nanometre': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanogram': ('1/1000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanomole': ('1/1000000000', (0, 0, 0, 0, 0, 0, 1)), 'nanobecquerel': ('1/1000000000', (0, -1, 0, 0, 0, 0, 0)), 'nanocoulomb': ('1/1000000000', (0, 1, 1, 0, 0, 0, 0)), 'nanosiemens': ('1/1000000', (0, 3, 2, 0, -2, -1, 0)), 'nanosievert': ('1/1000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanonewton': ('1/1000000', (0, -2, 0, 0, 1, 1, 0)), 'nanopascal': ('1/1000000', (0, -2, 0, 0, -1, 1, 0)), 'nanohertz': ('1/1000000000', (0, -1, 0, 0, 0, 0, 0)), 'nanojoule': ('1/1000000', (0, -2, 0, 0, 2, 1, 0)), 'nanofarad': ('1/1000000000000', (0, 4, 2, 0, -2, -1, 0)), 'nanoweber': ('1/1000000', (0, -2, -1, 0, 2, 1, 0)), 'nanotesla': ('1/1000000', (0, -2, -1, 0, 0, 1, 0)), 'nanohenry': ('1/1000000', (0, -2, -2, 0, 2, 1, 0)), 'nanolumen': ('1/1000000000', (1, 0, 0, 0, 0, 0, 0)), 'nanokatal': ('1/1000000000', (0, -1, 0, 0, 0, 0, 1)), 'nanowatt': ('1/1000000', (0, -3, 0, 0, 2, 1, 0)), 'nanovolt': ('1/1000000', (0, -3, -1, 0, 2, 1, 0)), 'nanogray': ('1/1000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanoohm': ('1/1000000', (0, -3, -2, 0, 2, 1, 0)), 'nanolux': ('1/1000000000', (1, 0, 0, 0, -2, 0, 0)), 'nanoastronomicalunit': ('1495978707/10000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoatomicmassunit': ('83027/50000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanonauticalmile': ('463/250000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoelectronvolt': ('80109/500000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'nanoangleminute': ('pi/10800000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanoanglesecond': ('pi/648000000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanosteradian': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanometricton': ('1/1000', (0, 0, 0, 0, 0, 1, 0)), 'nanoroentgen': ('129/500000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'nanoangstrom': ('1/10000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanohectare': ('1/100000', (0, 0, 0, 0, 2, 0, 0)), 'nanoradian': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanominute': ('3/50000000', (0, 1, 0, 0, 0, 0, 0)), 'nanodegree': ('pi/180000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanocurie': ('37', (0, -1, 0, 0, 0, 0, 0)), 'nanoliter': ('1/1000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanoneper': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanoknot': ('463/900000000000', (0, -1, 0, 0, 1, 0, 0)), 'nanobarn': ('1/10000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'nanohour': ('9/2500000', (0, 1, 0, 0, 0, 0, 0)), 'nanoday': ('27/312500', (0, 1, 0, 0, 0, 0, 0)), 'nanoare': ('1/10000000', (0, 0, 0, 0, 2, 0, 0)), 'nanobar': ('1/10', (0, -2, 0, 0, -1, 1, 0)), 'nanorad': ('1/100000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanorem': ('1/100000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanobel': ('log(10)/2000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanogallon': ('454609/100000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanoquart': ('454609/400000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanoounce': ('45359237/1600000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanopound': ('45359237/100000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanostone': ('317514659/50000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanoinch': ('127/5000000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanofoot': ('381/1250000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoyard': ('1143/1250000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanomile': ('12573/7812500000', (0, 0, 0, 0, 1, 0, 0)), 'nanogill': ('454609/3200000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanopint': ('454609/800000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanocandelas': ('1/1000000000', (1, 0, 0, 0, 0, 0, 0)), 'nanoCandela': ('1/1000000000', (1, 0, 0, 0, 0, 0, 0)), 'nanoCandelas': ('1/1000000000', (1, 0, 0, 0, 0, 0, 0)), 'nanoseconds': ('1/1000000000', (0, 1, 0, 0, 0, 0, 0)), 'nanoamperes': ('1/1000000000', (0, 0, 1, 0, 0, 0, 0)), 'nanoAmpere': ('1/1000000000', (0, 0, 1, 0, 0, 0, 0)), 'nanoAmperes': ('1/1000000000', (0, 0, 1, 0, 0, 0, 0)), 'nanokelvins': ('1/1000000000', (0, 0, 0, 1, 0, 0, 0)), 'nanoKelvin': ('1/1000000000', (0, 0, 0, 1, 0, 0, 0)), 'nanoKelvins': ('1/1000000000', (0, 0, 0, 1, 0, 0, 0)), 'nanometres': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanometer': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanometers': ('1/1000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanograms': ('1/1000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanomoles': ('1/1000000000', (0, 0, 0, 0, 0, 0, 1)), 'nanobecquerels': ('1/1000000000', (0, -1, 0, 0, 0, 0, 0)), 'nanoBecquerel': ('1/1000000000', (0, -1, 0, 0, 0, 0, 0)), 'nanoBecquerels': ('1/1000000000', (0, -1, 0, 0, 0, 0, 0)), 'nanocoulombs': ('1/1000000000', (0, 1, 1, 0, 0, 0, 0)), 'nanoCoulomb': ('1/1000000000', (0, 1, 1, 0, 0, 0, 0)), 'nanoCoulombs': ('1/1000000000', (0, 1, 1, 0, 0, 0, 0)), 'nanoSiemens': ('1/1000000', (0, 3, 2, 0, -2, -1, 0)), 'nanosieverts': ('1/1000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanoSievert': ('1/1000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanoSieverts': ('1/1000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanonewtons': ('1/1000000', (0, -2, 0, 0, 1, 1, 0)), 'nanoNewton': ('1/1000000', (0, -2, 0, 0, 1, 1, 0)), 'nanoNewtons': ('1/1000000', (0, -2, 0, 0, 1, 1, 0)), 'nanopascals': ('1/1000000', (0, -2, 0, 0, -1, 1, 0)), 'nanoPascal': ('1/1000000', (0, -2, 0, 0, -1, 1, 0)), 'nanoPascals': ('1/1000000', (0, -2, 0, 0, -1, 1, 0)), 'nanojoules': ('1/1000000', (0, -2, 0, 0, 2, 1, 0)), 'nanoJoule': ('1/1000000', (0, -2, 0, 0, 2, 1, 0)), 'nanoJoules': ('1/1000000', (0, -2, 0, 0, 2, 1, 0)), 'nanofarads': ('1/1000000000000', (0, 4, 2, 0, -2, -1, 0)), 'nanoFarad': ('1/1000000000000', (0, 4, 2, 0, -2, -1, 0)), 'nanoFarads': ('1/1000000000000', (0, 4, 2, 0, -2, -1, 0)), 'nanowebers': ('1/1000000', (0, -2, -1, 0, 2, 1, 0)), 'nanoWeber': ('1/1000000', (0, -2, -1, 0, 2, 1, 0)), 'nanoWebers': ('1/1000000', (0, -2, -1, 0, 2, 1, 0)), 'nanoteslas': ('1/1000000', (0, -2, -1, 0, 0, 1, 0)), 'nanoTesla': ('1/1000000', (0, -2, -1, 0, 0, 1, 0)), 'nanoTeslas': ('1/1000000', (0, -2, -1, 0, 0, 1, 0)), 'nanohenrys': ('1/1000000', (0, -2, -2, 0, 2, 1, 0)), 'nanoHenry': ('1/1000000', (0, -2, -2, 0, 2, 1, 0)), 'nanoHenrys': ('1/1000000', (0, -2, -2, 0, 2, 1, 0)), 'nanolumens': ('1/1000000000', (1, 0, 0, 0, 0, 0, 0)), 'nanokatals': ('1/1000000000', (0, -1, 0, 0, 0, 0, 1)), 'nanoKatal': ('1/1000000000', (0, -1, 0, 0, 0, 0, 1)), 'nanoKatals': ('1/1000000000', (0, -1, 0, 0, 0, 0, 1)), 'nanowatts': ('1/1000000', (0, -3, 0, 0, 2, 1, 0)), 'nanoWatt': ('1/1000000', (0, -3, 0, 0, 2, 1, 0)), 'nanoWatts': ('1/1000000', (0, -3, 0, 0, 2, 1, 0)), 'nanovolts': ('1/1000000', (0, -3, -1, 0, 2, 1, 0)), 'nanoVolt': ('1/1000000', (0, -3, -1, 0, 2, 1, 0)), 'nanoVolts': ('1/1000000', (0, -3, -1, 0, 2, 1, 0)), 'nanograys': ('1/1000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanoGray': ('1/1000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanoGrays': ('1/1000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanoohms': ('1/1000000', (0, -3, -2, 0, 2, 1, 0)), 'nanoOhm': ('1/1000000', (0, -3, -2, 0, 2, 1, 0)), 'nanoOhms': ('1/1000000', (0, -3, -2, 0, 2, 1, 0)), 'nanoastronomicalunits': ('1495978707/10000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoatomicmassunits': ('83027/50000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanonauticalmiles': ('463/250000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoelectronvolts': ('80109/500000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'nanosteradians': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanotonne': ('1/1000', (0, 0, 0, 0, 0, 1, 0)), 'nanotonnes': ('1/1000', (0, 0, 0, 0, 0, 1, 0)), 'nanoroentgens': ('129/500000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'nanoRoentgen': ('129/500000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'nanoRoentgens': ('129/500000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'nanoRöntgen': ('129/500000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'nanoangstroms': ('1/10000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoAngstrom': ('1/10000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoAngstroms': ('1/10000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoÅngström': ('1/10000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanohectares': ('1/100000', (0, 0, 0, 0, 2, 0, 0)), 'nanoradians': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanominutes': ('3/50000000', (0, 1, 0, 0, 0, 0, 0)), 'nanodegrees': ('pi/180000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanocuries': ('37', (0, -1, 0, 0, 0, 0, 0)), 'nanoliters': ('1/1000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanolitre': ('1/1000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanolitres': ('1/1000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanonepers': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanoNeper': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanoNepers': ('1/1000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanoknots': ('463/900000000000', (0, -1, 0, 0, 1, 0, 0)), 'nanobarns': ('1/10000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'nanohours': ('9/2500000', (0, 1, 0, 0, 0, 0, 0)), 'nanodays': ('27/312500', (0, 1, 0, 0, 0, 0, 0)), 'nanoares': ('1/10000000', (0, 0, 0, 0, 2, 0, 0)), 'nanobars': ('1/10', (0, -2, 0, 0, -1, 1, 0)), 'nanorads': ('1/100000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanorems': ('1/100000000000', (0, -2, 0, 0, 2, 0, 0)), 'nanobels': ('log(10)/2000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanoBel': ('log(10)/2000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanoBels': ('log(10)/2000000000', (0, 0, 0, 0, 0, 0, 0)), 'nanogallons': ('454609/100000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanoquarts': ('454609/400000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanoounces': ('45359237/1600000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanopounds': ('45359237/100000000000000', (0, 0, 0, 0, 0, 1, 0)), 'nanoinches': ('127/5000000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanofeet': ('381/1250000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanoyards': ('1143/1250000000000', (0, 0, 0, 0, 1, 0, 0)), 'nanomiles': ('12573/7812500000', (0, 0, 0, 0, 1, 0, 0)), 'nanogills': ('454609/3200000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'nanopints': ('454609/800000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picocandela': ('1/1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'picosecond': ('1/1000000000000', (0, 1, 0, 0, 0, 0, 0)), 'picoampere': ('1/1000000000000', (0, 0, 1, 0, 0, 0, 0)), 'picokelvin': ('1/1000000000000', (0, 0, 0, 1, 0, 0, 0)), 'picometre': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picogram': ('1/1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'picomole': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 1)), 'picobecquerel': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'picocoulomb': ('1/1000000000000', (0, 1, 1, 0, 0, 0, 0)), 'picosiemens': ('1/1000000000', (0, 3, 2, 0, -2, -1, 0)), 'picosievert': ('1/1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'piconewton': ('1/1000000000', (0, -2, 0, 0, 1, 1, 0)), 'picopascal': ('1/1000000000', (0, -2, 0, 0, -1, 1, 0)), 'picohertz': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'picojoule': ('1/1000000000', (0, -2, 0, 0, 2, 1, 0)), 'picofarad': ('1/1000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'picoweber': ('1/1000000000', (0, -2, -1, 0, 2, 1, 0)), 'picotesla': ('1/1000000000', (0, -2, -1, 0, 0, 1, 0)), 'picohenry': ('1/1000000000', (0, -2, -2, 0, 2, 1, 0)), 'picolumen': ('1/1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'picokatal': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 1)), 'picowatt': ('1/1000000000', (0, -3, 0, 0, 2, 1, 0)), 'picovolt': ('1/1000000000', (0, -3, -1, 0, 2, 1, 0)), 'picogray': ('1/1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picoohm': ('1/1000000000', (0, -3, -2, 0, 2, 1, 0)), 'picolux': ('1/1000000000000', (1, 0, 0, 0, -2, 0, 0)), 'picoastronomicalunit': ('1495978707/10000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoatomicmassunit': ('83027/50000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'piconauticalmile': ('463/250000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoelectronvolt': ('80109/500000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'picoangleminute': ('pi/10800000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picoanglesecond': ('pi/648000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picosteradian': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picometricton': ('1/1000000', (0, 0, 0, 0, 0, 1, 0)), 'picoroentgen': ('129/500000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'picoangstrom': ('1/10000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picohectare': ('1/100000000', (0, 0, 0, 0, 2, 0, 0)), 'picoradian': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picominute': ('3/50000000000', (0, 1, 0, 0, 0, 0, 0)), 'picodegree': ('pi/180000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picocurie': ('37/1000', (0, -1, 0, 0, 0, 0, 0)), 'picoliter': ('1/1000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'piconeper': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picoknot': ('463/900000000000000', (0, -1, 0, 0, 1, 0, 0)), 'picobarn': ('1/10000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'picohour': ('9/2500000000', (0, 1, 0, 0, 0, 0, 0)), 'picoday': ('27/312500000', (0, 1, 0, 0, 0, 0, 0)), 'picoare': ('1/10000000000', (0, 0, 0, 0, 2, 0, 0)), 'picobar': ('1/10000', (0, -2, 0, 0, -1, 1, 0)), 'picorad': ('1/100000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picorem': ('1/100000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picobel': ('log(10)/2000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picogallon': ('454609/100000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picoquart': ('454609/400000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picoounce': ('45359237/1600000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'picopound': ('45359237/100000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'picostone': ('317514659/50000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'picoinch': ('127/5000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picofoot': ('381/1250000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoyard': ('1143/1250000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picomile': ('12573/7812500000000', (0, 0, 0, 0, 1, 0, 0)), 'picogill': ('454609/3200000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picopint': ('454609/800000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picocandelas': ('1/1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'picoCandela': ('1/1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'picoCandelas': ('1/1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'picoseconds': ('1/1000000000000', (0, 1, 0, 0, 0, 0, 0)), 'picoamperes': ('1/1000000000000', (0, 0, 1, 0, 0, 0, 0)), 'picoAmpere': ('1/1000000000000', (0, 0, 1, 0, 0, 0, 0)), 'picoAmperes': ('1/1000000000000', (0, 0, 1, 0, 0, 0, 0)), 'picokelvins': ('1/1000000000000', (0, 0, 0, 1, 0, 0, 0)), 'picoKelvin': ('1/1000000000000', (0, 0, 0, 1, 0, 0, 0)), 'picoKelvins': ('1/1000000000000', (0, 0, 0, 1, 0, 0, 0)), 'picometres': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picometer': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picometers': ('1/1000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picograms': ('1/1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'picomoles': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 1)), 'picobecquerels': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'picoBecquerel': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'picoBecquerels': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 0)), 'picocoulombs': ('1/1000000000000', (0, 1, 1, 0, 0, 0, 0)), 'picoCoulomb': ('1/1000000000000', (0, 1, 1, 0, 0, 0, 0)), 'picoCoulombs': ('1/1000000000000', (0, 1, 1, 0, 0, 0, 0)), 'picoSiemens': ('1/1000000000', (0, 3, 2, 0, -2, -1, 0)), 'picosieverts': ('1/1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picoSievert': ('1/1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picoSieverts': ('1/1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'piconewtons': ('1/1000000000', (0, -2, 0, 0, 1, 1, 0)), 'picoNewton': ('1/1000000000', (0, -2, 0, 0, 1, 1, 0)), 'picoNewtons': ('1/1000000000', (0, -2, 0, 0, 1, 1, 0)), 'picopascals': ('1/1000000000', (0, -2, 0, 0, -1, 1, 0)), 'picoPascal': ('1/1000000000', (0, -2, 0, 0, -1, 1, 0)), 'picoPascals': ('1/1000000000', (0, -2, 0, 0, -1, 1, 0)), 'picojoules': ('1/1000000000', (0, -2, 0, 0, 2, 1, 0)), 'picoJoule': ('1/1000000000', (0, -2, 0, 0, 2, 1, 0)), 'picoJoules': ('1/1000000000', (0, -2, 0, 0, 2, 1, 0)), 'picofarads': ('1/1000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'picoFarad': ('1/1000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'picoFarads': ('1/1000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'picowebers': ('1/1000000000', (0, -2, -1, 0, 2, 1, 0)), 'picoWeber': ('1/1000000000', (0, -2, -1, 0, 2, 1, 0)), 'picoWebers': ('1/1000000000', (0, -2, -1, 0, 2, 1, 0)), 'picoteslas': ('1/1000000000', (0, -2, -1, 0, 0, 1, 0)), 'picoTesla': ('1/1000000000', (0, -2, -1, 0, 0, 1, 0)), 'picoTeslas': ('1/1000000000', (0, -2, -1, 0, 0, 1, 0)), 'picohenrys': ('1/1000000000', (0, -2, -2, 0, 2, 1, 0)), 'picoHenry': ('1/1000000000', (0, -2, -2, 0, 2, 1, 0)), 'picoHenrys': ('1/1000000000', (0, -2, -2, 0, 2, 1, 0)), 'picolumens': ('1/1000000000000', (1, 0, 0, 0, 0, 0, 0)), 'picokatals': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 1)), 'picoKatal': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 1)), 'picoKatals': ('1/1000000000000', (0, -1, 0, 0, 0, 0, 1)), 'picowatts': ('1/1000000000', (0, -3, 0, 0, 2, 1, 0)), 'picoWatt': ('1/1000000000', (0, -3, 0, 0, 2, 1, 0)), 'picoWatts': ('1/1000000000', (0, -3, 0, 0, 2, 1, 0)), 'picovolts': ('1/1000000000', (0, -3, -1, 0, 2, 1, 0)), 'picoVolt': ('1/1000000000', (0, -3, -1, 0, 2, 1, 0)), 'picoVolts': ('1/1000000000', (0, -3, -1, 0, 2, 1, 0)), 'picograys': ('1/1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picoGray': ('1/1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picoGrays': ('1/1000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picoohms': ('1/1000000000', (0, -3, -2, 0, 2, 1, 0)), 'picoOhm': ('1/1000000000', (0, -3, -2, 0, 2, 1, 0)), 'picoOhms': ('1/1000000000', (0, -3, -2, 0, 2, 1, 0)), 'picoastronomicalunits': ('1495978707/10000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoatomicmassunits': ('83027/50000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'piconauticalmiles': ('463/250000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoelectronvolts': ('80109/500000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'picosteradians': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picotonne': ('1/1000000', (0, 0, 0, 0, 0, 1, 0)), 'picotonnes': ('1/1000000', (0, 0, 0, 0, 0, 1, 0)), 'picoroentgens': ('129/500000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'picoRoentgen': ('129/500000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'picoRoentgens': ('129/500000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'picoRöntgen': ('129/500000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'picoangstroms': ('1/10000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoAngstrom': ('1/10000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoAngstroms': ('1/10000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoÅngström': ('1/10000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picohectares': ('1/100000000', (0, 0, 0, 0, 2, 0, 0)), 'picoradians': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picominutes': ('3/50000000000', (0, 1, 0, 0, 0, 0, 0)), 'picodegrees': ('pi/180000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picocuries': ('37/1000', (0, -1, 0, 0, 0, 0, 0)), 'picoliters': ('1/1000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picolitre': ('1/1000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picolitres': ('1/1000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'piconepers': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picoNeper': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picoNepers': ('1/1000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picoknots': ('463/900000000000000', (0, -1, 0, 0, 1, 0, 0)), 'picobarns': ('1/10000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'picohours': ('9/2500000000', (0, 1, 0, 0, 0, 0, 0)), 'picodays': ('27/312500000', (0, 1, 0, 0, 0, 0, 0)), 'picoares': ('1/10000000000', (0, 0, 0, 0, 2, 0, 0)), 'picobars': ('1/10000', (0, -2, 0, 0, -1, 1, 0)), 'picorads': ('1/100000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picorems': ('1/100000000000000', (0, -2, 0, 0, 2, 0, 0)), 'picobels': ('log(10)/2000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picoBel': ('log(10)/2000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picoBels': ('log(10)/2000000000000', (0, 0, 0, 0, 0, 0, 0)), 'picogallons': ('454609/100000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picoquarts': ('454609/400000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picoounces': ('45359237/1600000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'picopounds': ('45359237/100000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'picoinches': ('127/5000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picofeet': ('381/1250000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picoyards': ('1143/1250000000000000', (0, 0, 0, 0, 1, 0, 0)), 'picomiles': ('12573/7812500000000', (0, 0, 0, 0, 1, 0, 0)), 'picogills': ('454609/3200000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'picopints': ('454609/800000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attocandela': ('1/1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'attosecond': ('1/1000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'attoampere': ('1/1000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'attokelvin': ('1/1000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'attometre': ('1/1000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attogram': ('1/1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attomole': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'attobecquerel': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'attocoulomb': ('1/1000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'attosiemens': ('1/1000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'attosievert': ('1/1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attonewton': ('1/1000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'attopascal': ('1/1000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'attohertz': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'attojoule': ('1/1000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'attofarad': ('1/1000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'attoweber': ('1/1000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'attotesla': ('1/1000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'attohenry': ('1/1000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'attolumen': ('1/1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'attokatal': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'attowatt': ('1/1000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'attovolt': ('1/1000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'attogray': ('1/1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attoohm': ('1/1000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'attolux': ('1/1000000000000000000', (1, 0, 0, 0, -2, 0, 0)), 'attoastronomicalunit': ('1495978707/10000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoatomicmassunit': ('83027/50000000000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attonauticalmile': ('463/250000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoelectronvolt': ('80109/500000000000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'attoangleminute': ('pi/10800000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attoanglesecond': ('pi/648000000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attosteradian': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attometricton': ('1/1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attoroentgen': ('129/500000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'attoangstrom': ('1/10000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attohectare': ('1/100000000000000', (0, 0, 0, 0, 2, 0, 0)), 'attoradian': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attominute': ('3/50000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'attodegree': ('pi/180000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attocurie': ('37/1000000000', (0, -1, 0, 0, 0, 0, 0)), 'attoliter': ('1/1000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attoneper': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attoknot': ('463/900000000000000000000', (0, -1, 0, 0, 1, 0, 0)), 'attobarn': ('1/10000000000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'attohour': ('9/2500000000000000', (0, 1, 0, 0, 0, 0, 0)), 'attoday': ('27/312500000000000', (0, 1, 0, 0, 0, 0, 0)), 'attoare': ('1/10000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'attobar': ('1/10000000000', (0, -2, 0, 0, -1, 1, 0)), 'attorad': ('1/100000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attorem': ('1/100000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attobel': ('log(10)/2000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attogallon': ('454609/100000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attoquart': ('454609/400000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attoounce': ('45359237/1600000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attopound': ('45359237/100000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attostone': ('317514659/50000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attoinch': ('127/5000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attofoot': ('381/1250000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoyard': ('1143/1250000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attomile': ('12573/7812500000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attogill': ('454609/3200000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attopint': ('454609/800000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attocandelas': ('1/1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'attoCandela': ('1/1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'attoCandelas': ('1/1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'attoseconds': ('1/1000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'attoamperes': ('1/1000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'attoAmpere': ('1/1000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'attoAmperes': ('1/1000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'attokelvins': ('1/1000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'attoKelvin': ('1/1000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'attoKelvins': ('1/1000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'attometres': ('1/1000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attometer': ('1/1000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attometers': ('1/1000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attograms': ('1/1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attomoles': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'attobecquerels': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'attoBecquerel': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'attoBecquerels': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'attocoulombs': ('1/1000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'attoCoulomb': ('1/1000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'attoCoulombs': ('1/1000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'attoSiemens': ('1/1000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'attosieverts': ('1/1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attoSievert': ('1/1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attoSieverts': ('1/1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attonewtons': ('1/1000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'attoNewton': ('1/1000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'attoNewtons': ('1/1000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'attopascals': ('1/1000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'attoPascal': ('1/1000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'attoPascals': ('1/1000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'attojoules': ('1/1000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'attoJoule': ('1/1000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'attoJoules': ('1/1000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'attofarads': ('1/1000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'attoFarad': ('1/1000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'attoFarads': ('1/1000000000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'attowebers': ('1/1000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'attoWeber': ('1/1000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'attoWebers': ('1/1000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'attoteslas': ('1/1000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'attoTesla': ('1/1000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'attoTeslas': ('1/1000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'attohenrys': ('1/1000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'attoHenry': ('1/1000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'attoHenrys': ('1/1000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'attolumens': ('1/1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'attokatals': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'attoKatal': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'attoKatals': ('1/1000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'attowatts': ('1/1000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'attoWatt': ('1/1000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'attoWatts': ('1/1000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'attovolts': ('1/1000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'attoVolt': ('1/1000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'attoVolts': ('1/1000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'attograys': ('1/1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attoGray': ('1/1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attoGrays': ('1/1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attoohms': ('1/1000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'attoOhm': ('1/1000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'attoOhms': ('1/1000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'attoastronomicalunits': ('1495978707/10000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoatomicmassunits': ('83027/50000000000000000000000000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attonauticalmiles': ('463/250000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoelectronvolts': ('80109/500000000000000000000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'attosteradians': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attotonne': ('1/1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attotonnes': ('1/1000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attoroentgens': ('129/500000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'attoRoentgen': ('129/500000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'attoRoentgens': ('129/500000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'attoRöntgen': ('129/500000000000000000000000000', (0, 0, 0, 1, 0, -1, 0)), 'attoangstroms': ('1/10000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoAngstrom': ('1/10000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoAngstroms': ('1/10000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoÅngström': ('1/10000000000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attohectares': ('1/100000000000000', (0, 0, 0, 0, 2, 0, 0)), 'attoradians': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attominutes': ('3/50000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'attodegrees': ('pi/180000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attocuries': ('37/1000000000', (0, -1, 0, 0, 0, 0, 0)), 'attoliters': ('1/1000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attolitre': ('1/1000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attolitres': ('1/1000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attonepers': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attoNeper': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attoNepers': ('1/1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attoknots': ('463/900000000000000000000', (0, -1, 0, 0, 1, 0, 0)), 'attobarns': ('1/10000000000000000000000000000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'attohours': ('9/2500000000000000', (0, 1, 0, 0, 0, 0, 0)), 'attodays': ('27/312500000000000', (0, 1, 0, 0, 0, 0, 0)), 'attoares': ('1/10000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'attobars': ('1/10000000000', (0, -2, 0, 0, -1, 1, 0)), 'attorads': ('1/100000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attorems': ('1/100000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'attobels': ('log(10)/2000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attoBel': ('log(10)/2000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attoBels': ('log(10)/2000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'attogallons': ('454609/100000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attoquarts': ('454609/400000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attoounces': ('45359237/1600000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attopounds': ('45359237/100000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'attoinches': ('127/5000000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attofeet': ('381/1250000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attoyards': ('1143/1250000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attomiles': ('12573/7812500000000000000', (0, 0, 0, 0, 1, 0, 0)), 'attogills': ('454609/3200000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'attopints': ('454609/800000000000000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'exacandela': ('1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'exasecond': ('1000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'exaampere': ('1000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'exakelvin': ('1000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'exametre': ('1000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exagram': ('1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'examole': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'exabecquerel': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'exacoulomb': ('1000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'exasiemens': ('1000000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'exasievert': ('1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exanewton': ('1000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'exapascal': ('1000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'exahertz': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'exajoule': ('1000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'exafarad': ('1000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'exaweber': ('1000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'exatesla': ('1000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'exahenry': ('1000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'exalumen': ('1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'exakatal': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'exawatt': ('1000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'exavolt': ('1000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'exagray': ('1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exaohm': ('1000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'exalux': ('1000000000000000000', (1, 0, 0, 0, -2, 0, 0)), 'exaastronomicalunit': ('149597870700000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exaatomicmassunit': ('83027/50000000000', (0, 0, 0, 0, 0, 1, 0)), 'exanauticalmile': ('1852000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exaelectronvolt': ('80109/500', (0, -2, 0, 0, 2, 1, 0)), 'exaangleminute': ('2500000000000000*pi/27', (0, 0, 0, 0, 0, 0, 0)), 'exaanglesecond': ('125000000000000*pi/81', (0, 0, 0, 0, 0, 0, 0)), 'exasteradian': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'exametricton': ('1000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'exaroentgen': ('258000000000', (0, 0, 0, 1, 0, -1, 0)), 'exaangstrom': ('100000000', (0, 0, 0, 0, 1, 0, 0)), 'exahectare': ('10000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'exaradian': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'examinute': ('60000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'exadegree': ('50000000000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'exacurie': ('37000000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'exaliter': ('1000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'exaneper': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'exaknot': ('4630000000000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'exabarn': ('1/10000000000', (0, 0, 0, 0, 2, 0, 0)), 'exahour': ('3600000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'exaday': ('86400000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'exaare': ('100000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'exabar': ('100000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'exarad': ('10000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exarem': ('10000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exabel': ('500000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'exagallon': ('4546090000000000000', (0, 0, 0, 0, 3, 0, 0)), 'exaquart': ('1136522500000000', (0, 0, 0, 0, 3, 0, 0)), 'exaounce': ('28349523125000000000', (0, 0, 0, 0, 0, 1, 0)), 'exapound': ('453592370000000000000', (0, 0, 0, 0, 0, 1, 0)), 'exastone': ('6350293180000000000000', (0, 0, 0, 0, 0, 1, 0)), 'exainch': ('25400000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exafoot': ('304800000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exayard': ('914400000000000000', (0, 0, 0, 0, 1, 0, 0)), 'examile': ('1609344000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exagill': ('142065312500000', (0, 0, 0, 0, 3, 0, 0)), 'exapint': ('568261250000000', (0, 0, 0, 0, 3, 0, 0)), 'exacandelas': ('1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'exaCandela': ('1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'exaCandelas': ('1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'exaseconds': ('1000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'exaamperes': ('1000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'exaAmpere': ('1000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'exaAmperes': ('1000000000000000000', (0, 0, 1, 0, 0, 0, 0)), 'exakelvins': ('1000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'exaKelvin': ('1000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'exaKelvins': ('1000000000000000000', (0, 0, 0, 1, 0, 0, 0)), 'exametres': ('1000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exameter': ('1000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exameters': ('1000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exagrams': ('1000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'examoles': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 1)), 'exabecquerels': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'exaBecquerel': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'exaBecquerels': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'exacoulombs': ('1000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'exaCoulomb': ('1000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'exaCoulombs': ('1000000000000000000', (0, 1, 1, 0, 0, 0, 0)), 'exaSiemens': ('1000000000000000000000', (0, 3, 2, 0, -2, -1, 0)), 'exasieverts': ('1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exaSievert': ('1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exaSieverts': ('1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exanewtons': ('1000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'exaNewton': ('1000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'exaNewtons': ('1000000000000000000000', (0, -2, 0, 0, 1, 1, 0)), 'exapascals': ('1000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'exaPascal': ('1000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'exaPascals': ('1000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'exajoules': ('1000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'exaJoule': ('1000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'exaJoules': ('1000000000000000000000', (0, -2, 0, 0, 2, 1, 0)), 'exafarads': ('1000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'exaFarad': ('1000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'exaFarads': ('1000000000000000', (0, 4, 2, 0, -2, -1, 0)), 'exawebers': ('1000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'exaWeber': ('1000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'exaWebers': ('1000000000000000000000', (0, -2, -1, 0, 2, 1, 0)), 'exateslas': ('1000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'exaTesla': ('1000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'exaTeslas': ('1000000000000000000000', (0, -2, -1, 0, 0, 1, 0)), 'exahenrys': ('1000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'exaHenry': ('1000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'exaHenrys': ('1000000000000000000000', (0, -2, -2, 0, 2, 1, 0)), 'exalumens': ('1000000000000000000', (1, 0, 0, 0, 0, 0, 0)), 'exakatals': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'exaKatal': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'exaKatals': ('1000000000000000000', (0, -1, 0, 0, 0, 0, 1)), 'exawatts': ('1000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'exaWatt': ('1000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'exaWatts': ('1000000000000000000000', (0, -3, 0, 0, 2, 1, 0)), 'exavolts': ('1000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'exaVolt': ('1000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'exaVolts': ('1000000000000000000000', (0, -3, -1, 0, 2, 1, 0)), 'exagrays': ('1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exaGray': ('1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exaGrays': ('1000000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exaohms': ('1000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'exaOhm': ('1000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'exaOhms': ('1000000000000000000000', (0, -3, -2, 0, 2, 1, 0)), 'exaastronomicalunits': ('149597870700000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exaatomicmassunits': ('83027/50000000000', (0, 0, 0, 0, 0, 1, 0)), 'exanauticalmiles': ('1852000000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exaelectronvolts': ('80109/500', (0, -2, 0, 0, 2, 1, 0)), 'exasteradians': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'exatonne': ('1000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'exatonnes': ('1000000000000000000000000', (0, 0, 0, 0, 0, 1, 0)), 'exaroentgens': ('258000000000', (0, 0, 0, 1, 0, -1, 0)), 'exaRoentgen': ('258000000000', (0, 0, 0, 1, 0, -1, 0)), 'exaRoentgens': ('258000000000', (0, 0, 0, 1, 0, -1, 0)), 'exaRöntgen': ('258000000000', (0, 0, 0, 1, 0, -1, 0)), 'exaangstroms': ('100000000', (0, 0, 0, 0, 1, 0, 0)), 'exaAngstrom': ('100000000', (0, 0, 0, 0, 1, 0, 0)), 'exaAngstroms': ('100000000', (0, 0, 0, 0, 1, 0, 0)), 'exaÅngström': ('100000000', (0, 0, 0, 0, 1, 0, 0)), 'exahectares': ('10000000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'exaradians': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'examinutes': ('60000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'exadegrees': ('50000000000000000*pi/9', (0, 0, 0, 0, 0, 0, 0)), 'exacuries': ('37000000000000000000000000000', (0, -1, 0, 0, 0, 0, 0)), 'exaliters': ('1000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'exalitre': ('1000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'exalitres': ('1000000000000000', (0, 0, 0, 0, 3, 0, 0)), 'exanepers': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'exaNeper': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'exaNepers': ('1000000000000000000', (0, 0, 0, 0, 0, 0, 0)), 'exaknots': ('4630000000000000000/9', (0, -1, 0, 0, 1, 0, 0)), 'exabarns': ('1/10000000000', (0, 0, 0, 0, 2, 0, 0)), 'exahours': ('3600000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'exadays': ('86400000000000000000000', (0, 1, 0, 0, 0, 0, 0)), 'exaares': ('100000000000000000000', (0, 0, 0, 0, 2, 0, 0)), 'exabars': ('100000000000000000000000000', (0, -2, 0, 0, -1, 1, 0)), 'exarads': ('10000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exarems': ('10000000000000000', (0, -2, 0, 0, 2, 0, 0)), 'exabels': ('500000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'exaBel': ('500000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'exaBels': ('500000000000000000*log(10)', (0, 0, 0, 0, 0, 0, 0)), 'exagallons': ('4546090000000000000', (0, 0, 0, 0, 3, 0, 0)), 'exaquarts': ('1136522500000000', (0, 0, 0, 0, 3, 0, 0)), 'exaounces': ('28349523125000000000', (0, 0, 0, 0, 0, 1, 0)), 'exapounds': ('453592370000000000000', (0, 0, 0, 0, 0, 1, 0)), 'exainches': ('25400000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exafeet': ('304800000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exayards': ('914400000000000000', (0, 0, 0, 0, 1, 0, 0)), 'examiles': ('1609344000000000000000', (0, 0, 0, 0, 1, 0, 0)), 'exagills': ('142065312500000', (0, 0, 0, 0, 3, 0, 0)), 'exapints': ('568261250000000', (0, 0, 0, 0, 3, 0, 0))}
@@ -1,5 +1,10 @@
+import os
+import pickle
+import re
 from functools import cmp_to_key
 
+from .buckingham_pi_utilities import names_of_dimensions
+
 # Remarks:
 #   only K, no other temperature scales included
 #   angles measures, bel an neper are all treated as identical dimensionless units
@@ -95,7 +100,7 @@ def list_of_very_common_units_in_SI():
         ('minute',            'min', '(60*second)',                   preop('minutes')),
         ('hour',              'h',   '(3600*second)',                 preop('hours')),
         ('degree',            'deg', '(pi/180)',                      preop('degrees')),
-        ('liter',             'L',   '(10**(-3)*metre**3)',           preop('liters')),
+        ('liter',             'L',   '(10**(-3)*metre**3)',           preop('liters')+['litre']+preop('litres')),
         ('metricton',         't',   '(10**3*kilo*gram)',             preop('tonne')+preop('tonnes')),
         ('neper',             'Np',  '(1)',                           preop('nepers')+['Neper']+preop('Nepers')),
         ('bel',               'B',   '((1/2)*log(10))',               preop('bels')+['Bel']+preop('Bels')),
@@ -170,7 +175,6 @@ def names_of_all_units_and_dimensions():
 
 def convert_short_forms():
     compare = lambda x,y: len(y[0])-len(x[0]) if (len(y[0])-len(x[0])) != 0 else x[1].count('*')-y[1].count('*')
-    print(compare(('min', 'minute'),('min', 'milli*(inch)')))
     units = list_of_SI_base_unit_dimensions()\
            +list_of_derived_SI_units_in_SI_base_units()\
            +list_of_very_common_units_in_SI()\
@@ -223,4 +227,193 @@ def convert_alternative_names_to_standard():
         for alternative in alternatives:
             convert_to_standard.append((alternative,standard))
     convert_to_standard.sort(key=lambda x: -max(len(x[0]),len(x[0][0])))
-    return convert_to_standard
\ No newline at end of file
+    return convert_to_standard
+
+def alternative_names(unit):
+    return [x[0] if isinstance(x, tuple) else x for x in unit[3]]
+
+def unit_definitions():
+    """
+    Returns a dictionary from the name of each prefix and unit, including alternative
+    names, to the string that defines it. SI base units are defined by their dimension.
+    """
+    definitions = {}
+    for prefix in list_of_SI_prefixes():
+        definitions[prefix[0]] = prefix[2].strip()
+    units = list_of_SI_base_unit_dimensions()\
+           +list_of_derived_SI_units_in_SI_base_units()\
+           +list_of_common_units_in_SI()\
+           +list_of_imperial_units()
+    for unit in units:
+        definitions[unit[0]] = unit[2]
+    for unit in units:
+        for alternative in alternative_names(unit):
+            definitions.setdefault(alternative, unit[0])
+    return definitions
+
+def resolve_unit(name, definitions, resolved):
+    """
+    Returns a sympy expression for the given prefix or unit name written as a
+    constant times a product of powers of dimensions, or None if the name is
+    neither defined nor a prefix followed by a defined unit.
+    """
+    from sympy import Symbol, Float, Rational
+    from sympy.parsing.sympy_parser import parse_expr
+    if name in resolved:
+        return resolved[name]
+    if name in names_of_dimensions:
+        return Symbol(name)
+    if name in definitions and definitions[name] in definitions:
+        # Alternative name
+        value = resolve_unit(definitions[name], definitions, resolved)
+    elif name in definitions:
+        definition = definitions[name]
+        local_dict = {}
+        for identifier in re.findall(r"[^\W\d]\w*", definition):
+            value = resolve_unit(identifier, definitions, resolved)
+            if value is not None:
+                local_dict[identifier] = value
+        value = parse_expr(definition, local_dict=local_dict)
+        value = value.xreplace({x: Rational(str(x)) for x in value.atoms(Float)})
+    else:
+        value = None
+        prefixes = [x[0] for x in list_of_SI_prefixes()]
+        for prefix in prefixes:
+            unit = name[len(prefix):]
+            if name.startswith(prefix) and unit in definitions and unit not in prefixes:
+                value = resolve_unit(prefix, definitions, resolved)*resolve_unit(unit, definitions, resolved)
+                break
+    resolved[name] = value
+    return value
+
+def scale_and_dimension(expression):
+    """
+    Splits an expression from resolve_unit into an exact scale factor and a tuple
+    with the exponent of each dimension in the same order as names_of_dimensions.
+    """
+    from sympy import Symbol
+    dimension_symbols = [Symbol(name) for name in names_of_dimensions]
+    scale, dimension = expression.as_independent(*dimension_symbols, as_Add=False)
+    powers = {base: exponent for (base, exponent) in dimension.as_powers_dict().items() if base != 1}
+    if not set(powers.keys()).issubset(dimension_symbols) or not all(e.is_Integer for e in powers.values()):
+        raise ValueError(f"{expression} is not a product of a constant and powers of dimensions")
+    return (scale, tuple(int(powers.get(symbol, 0)) for symbol in dimension_symbols))
+
+def compile_unit_index(units, prefixes, standalone_prefixes=False):
+    """
+    Input:
+        units               : list of pairs (key, name) where name is defined in unit_definitions
+        prefixes            : list of pairs (key, name) where name is the name of a prefix
+        standalone_prefixes : if True the prefix keys are also in the index on their own
+    Output:
+        Dictionary from each unit key, and each prefix key followed by a unit key, to a pair
+        with the exact scale factor of the unit, written as a string that sympy can
+        parse, and the exponents of the dimensions in the order of names_of_dimensions.
+        Units take precedence over a prefix followed by a unit, and earlier pairs over
+        later pairs. Keys with spaces are not combined with prefixes.
+    """
+    definitions = unit_definitions()
+    resolved = {}
+    split = {}
+    for (key, name) in units+prefixes:
+        if name not in split:
+            split[name] = scale_and_dimension(resolve_unit(name, definitions, resolved))
+    index = {}
+    for (key, name) in units+(prefixes if standalone_prefixes else []):
+        index.setdefault(key, (str(split[name][0]), split[name][1]))
+    for (prefix_key, prefix_name) in prefixes:
+        for (key, name) in units:
+            if " " not in key:
+                index.setdefault(prefix_key+key, (str(split[prefix_name][0]*split[name][0]), split[name][1]))
+    return index
+
+def unit_index():
+    """
+    Index of the name of each prefix, unit and alternative unit name, and each prefix
+    followed by a unit or alternative unit name, see compile_unit_index.
+    This is the index used to convert the units in quantities to dimensions.
+    """
+    definitions = unit_definitions()
+    prefixes = [(x[0], x[0]) for x in list_of_SI_prefixes()]
+    units = [(name, name) for name in definitions.keys() if name not in dict(prefixes)]
+    return compile_unit_index(units, prefixes, standalone_prefixes=True)
+
+def short_form_unit_index():
+    """
+    Index of the short form symbol of each unit whose short form is allowed, see
+    convert_short_forms and compile_unit_index. Prefixed short forms, e.g. km, are
+    not in the index, they are resolved at lookup time with short_form_prefix_index,
+    see resolve_short_form in unit_tables.py.
+    """
+    units = list_of_SI_base_unit_dimensions()\
+           +list_of_derived_SI_units_in_SI_base_units()\
+           +list_of_very_common_units_in_SI()\
+           +list_of_imperial_units()
+    return compile_unit_index([(x[1], x[0]) for x in units], [])
+
+def short_form_prefix_index():
+    """
+    Returns a dictionary from the short form symbol of each SI prefix to its
+    exact scale factor, written as a string that sympy can parse.
+    """
+    definitions = unit_definitions()
+    resolved = {}
+    return {x[1]: str(resolve_unit(x[0], definitions, resolved)) for x in list_of_SI_prefixes()}
+
+# Tables that are written to the generated files by write_static_unit_conversion_arrays
+# Substitution tables for short forms, i.e. convert_short_forms and the tables that
+# use it, are not written since they enumerate every prefix and unit combination,
+# short forms are resolved with short_form_unit_index and short_form_prefix_index.
+static_unit_conversion_arrays = [
+    convert_SI_base_units_to_dimensions,
+    convert_alternative_names_to_standard,
+    convert_to_SI_base_units,
+    list_of_SI_base_unit_dimensions,
+    list_of_SI_prefixes,
+    list_of_common_units_in_SI,
+    list_of_derived_SI_units_in_SI_base_units,
+    list_of_imperial_units,
+    list_of_very_common_units_in_SI,
+    names_of_all_units_and_dimensions,
+    names_of_prefixes_units_and_dimensions,
+    short_form_prefix_index,
+    short_form_unit_index,
+    unit_index,
+]
+
+def share_strings(data, shared=None):
+    """
+    Replaces equal strings in nested lists, tuples and dictionaries with the same
+    object, pickle then only stores each distinct string once.
+    """
+    if shared is None:
+        shared = {}
+    if isinstance(data, str):
+        return shared.setdefault(data, data)
+    if isinstance(data, dict):
+        return {share_strings(key, shared): share_strings(value, shared) for (key, value) in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(share_strings(x, shared) for x in data)
+    return data
+
+def write_static_unit_conversion_arrays(directory=None):
+    """
+    Writes the unit conversion tables to static_unit_conversion_arrays.py, which is kept
+    as a human readable reference, and to static_unit_conversion_arrays.pickle, which is
+    what is loaded (lazily) at runtime, see unit_tables.py.
+    """
+    if directory is None:
+        directory = os.path.dirname(os.path.abspath(__file__))
+    shared_strings = {}
+    tables = {table.__name__: share_strings(table(), shared_strings) for table in static_unit_conversion_arrays}
+    lines = ["# This is a generated file, do not edit. Changes to the unit conversion system should be done in unit_system_conversion.py"]
+    for name in sorted(tables.keys()):
+        lines.append(name+"="+repr(tables[name]))
+    with open(os.path.join(directory, "static_unit_conversion_arrays.py"), "w", encoding="utf-8") as file:
+        file.write("\n".join(lines)+"\n")
+    # Each table is pickled separately so that only the tables that are used are unpickled
+    with open(os.path.join(directory, "static_unit_conversion_arrays.pickle"), "wb") as file:
+        pickle.dump({name: pickle.dumps(table, protocol=4) for (name, table) in tables.items()}, file, protocol=4)
+
+if __name__ == "__main__":
+    write_static_unit_conversion_arrays()
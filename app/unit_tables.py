@@ -0,0 +1,159 @@
+import os
+import pickle
+import re
+from functools import lru_cache
+
+from .buckingham_pi_utilities import names_of_dimensions
+
+# The tables are generated by unit_system_conversions.py, which also writes
+# static_unit_conversion_arrays.py as a human readable copy of the same data.
+unit_tables_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static_unit_conversion_arrays.pickle")
+
+
+@lru_cache(maxsize=None)
+def load_pickled_unit_tables():
+    '''
+    Returns a dictionary from the name of each unit conversion table to the
+    table in pickled form. The file is read from disk the first time this
+    function is called, so tasks that do not use units never pay for loading it.
+    '''
+    with open(unit_tables_path, "rb") as file:
+        return pickle.load(file)
+
+
+@lru_cache(maxsize=None)
+def get_unit_table(name):
+    '''
+    Returns the unit conversion table with the given name, e.g.
+    `get_unit_table("unit_index")`. Each table is only unpickled when it is
+    first used, so the tables that are not used at runtime are never unpickled.
+    '''
+    return pickle.loads(load_pickled_unit_tables()[name])
+
+
+def load_unit_tables():
+    '''
+    Returns a dictionary with all unit conversion tables.
+    '''
+    return {name: get_unit_table(name) for name in load_pickled_unit_tables()}
+
+
+# Names in dimension strings, see `convert_units_to_dimensions`
+unit_name_re = re.compile(r"[^\W\d]\w*")
+
+
+@lru_cache(maxsize=None)
+def get_unit_index():
+    '''
+    Returns the dictionary from unit names (with and without prefixes) to scale
+    factors and dimension exponents, see `unit_index` in unit_system_conversions.py.
+    '''
+    return get_unit_table("unit_index")
+
+
+@lru_cache(maxsize=None)
+def get_short_form_prefix_trie():
+    '''
+    Returns a trie of the short forms of the SI prefixes, where each node is a
+    dictionary from characters to nodes and the node where a prefix ends has
+    the scale factor of the prefix under the key None.
+    '''
+    trie = {}
+    for (prefix, scale) in get_unit_table("short_form_prefix_index").items():
+        node = trie
+        for character in prefix:
+            node = node.setdefault(character, {})
+        node[None] = scale
+    return trie
+
+
+@lru_cache(maxsize=1024)
+def resolve_short_form(symbol):
+    '''
+    Input:
+        symbol : short form of a unit, possibly with a prefix, e.g. "km"
+    Output:
+        Pair with the scale factor, a string that sympy can parse, and the
+        dimension exponents of the unit, or None if the symbol is not known.
+    Remarks:
+        A unit symbol takes precedence over a prefix followed by a unit symbol,
+        e.g. "min" is minute and not milli-inch. Otherwise the longest prefix
+        that is followed by a unit symbol is used, e.g. "dam" is dekametre.
+    '''
+    units = get_unit_table("short_form_unit_index")
+    if symbol in units:
+        return units[symbol]
+    node = get_short_form_prefix_trie()
+    prefixes = []
+    for (position, character) in enumerate(symbol):
+        node = node.get(character, None)
+        if node is None:
+            break
+        if None in node:
+            prefixes.append((position+1, node[None]))
+    for (end, prefix_scale) in reversed(prefixes):
+        unit = units.get(symbol[end:], None)
+        if unit is not None:
+            scale, exponents = unit
+            if scale != "1":
+                prefix_scale = "("+prefix_scale+")*("+scale+")"
+            return (prefix_scale, exponents)
+    return None
+
+
+@lru_cache(maxsize=None)
+def dimension_string(scale, exponents):
+    '''
+    Returns the string that a unit with the given scale factor and dimension
+    exponents is replaced by, i.e. the scale factor times the dimension in
+    parentheses, e.g. "((1000)*length)".
+    '''
+    factors = [] if scale == "1" else ["("+scale+")"]
+    for (dimension, exponent) in zip(names_of_dimensions, exponents):
+        if exponent == 1:
+            factors.append(dimension)
+        elif exponent != 0:
+            factors.append(f"{dimension}**({exponent})")
+    if len(factors) == 0:
+        factors.append("1")
+    return "("+"*".join(factors)+")"
+
+
+def convert_units_to_dimensions(string, short_forms=False):
+    '''
+    Input:
+        string      : string with a dimension that can contain units, e.g. "kilometre/hour"
+        short_forms : if True short forms of units, e.g. "km", are also converted
+    Output:
+        The string with each unit name that is in the unit index replaced by its
+        scale factor and dimension, e.g. "((1000)*length)/((3600)*time)".
+    Remarks:
+        Each name is looked up once in the index, names of two words separated by
+        a space, e.g. "fluid ounce", are tried before single words. Names that are
+        not in the index, e.g. dimensions, are left as they are. Short forms are
+        only used for names that are not in the index, see `resolve_short_form`.
+    '''
+    index = get_unit_index()
+    matches = list(unit_name_re.finditer(string))
+    converted = []
+    position = 0
+    k = 0
+    while k < len(matches):
+        start, end = matches[k].span()
+        name = matches[k].group()
+        if k+1 < len(matches) and matches[k+1].start() == end+1 and string[end] == " ":
+            two_words = name+" "+matches[k+1].group()
+            if two_words in index or (short_forms and resolve_short_form(two_words) is not None):
+                name = two_words
+                end = matches[k+1].end()
+                k += 1
+        unit = index.get(name, None)
+        if unit is None and short_forms:
+            unit = resolve_short_form(name)
+        if unit is not None:
+            converted.append(string[position:start])
+            converted.append(dimension_string(*unit))
+            position = end
+        k += 1
+    converted.append(string[position:])
+    return "".join(converted)
@@ -0,0 +1,69 @@
+"""
+Compares grading a cohort of responses with `evaluate_batch` against calling
+`evaluation_function` once per response, both with a cold compiled task
+cache for every call (the cost before tasks were cached) and with a warm one.
+
+Run from the repository root with:
+    python -m benchmarks.batch_benchmark
+"""
+import random
+import time
+
+from app.evaluation import evaluation_function, evaluate_batch, compiled_task_cache
+
+params = {
+    "strict_syntax": False,
+    "quantities": "('F', '(newton)') ('U', '(metre/second)') ('rho', '(kilogram/(metre**3))') ('D', '(metre)') ('omega', '(second**(-1))')",
+    "symbols": {
+        "F": {"latex": r"\(F\)", "aliases": []},
+        "U": {"latex": r"\(U\)", "aliases": []},
+        "rho": {"latex": r"\(\rho\)", "aliases": []},
+        "D": {"latex": r"\(D\)", "aliases": []},
+        "omega": {"latex": r"\(\omega\)", "aliases": []},
+    },
+}
+answer = "-"
+
+distinct_responses = [
+    "U/(omega*D), F/(rho*D**4*omega**2)",
+    "U/(omega*D), F/(rho*D**2*U**2)",
+    "omega*D/U, rho*D**2*U**2/F",
+    "U/(omega D), F/(rho D^4 omega^2)",
+    "U/(omega*D), F/(rho*D**4*omega)",
+    "F/(rho*D**4*omega**2)",
+    "U/(omega*D)+F/(rho*D**4*omega**2)",
+    "2*U/(omega*D), 3*F/(rho*D**4*omega**2)",
+    "(U/(omega*D))**2, F/(rho*D**4*omega**2)",
+    "U/(omega*D), F/(rho*D**4*omega**2)+1",
+]
+
+
+def time_per_response(grade, responses):
+    start = time.perf_counter()
+    grade(responses)
+    return (time.perf_counter()-start)/len(responses)
+
+
+def loop_cold(responses):
+    for response in responses:
+        compiled_task_cache.clear()
+        evaluation_function(response, answer, params)
+
+
+def loop_warm(responses):
+    for response in responses:
+        evaluation_function(response, answer, params)
+
+
+def batch(responses):
+    compiled_task_cache.clear()
+    evaluate_batch(responses, answer, params)
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    cohort = [random.choice(distinct_responses) for _ in range(200)]
+    assert evaluate_batch(cohort, answer, params) == [evaluation_function(r, answer, params) for r in cohort]
+    print(f"{len(cohort)} responses, {len(set(cohort))} distinct")
+    for name, grade in [("loop, cold task cache", loop_cold), ("loop, warm task cache", loop_warm), ("evaluate_batch", batch)]:
+        print(f"    {name:22s} {1e3*time_per_response(grade, cohort):8.2f} ms/response")
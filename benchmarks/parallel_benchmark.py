@@ -0,0 +1,58 @@
+"""
+Measures the throughput of `grade_in_parallel` for a regrade batch with a few
+tasks and many responses per task, for 1 up to the number of CPUs worker
+processes, compared with grading the batch in this process.
+
+Run from the repository root with:
+    python -m benchmarks.parallel_benchmark [number of responses]
+"""
+import os
+import random
+import sys
+import time
+
+from app.evaluation import evaluation_function
+from app.parallel_grading import grade_in_parallel
+
+from benchmarks.batch_benchmark import params, distinct_responses
+
+tasks = [
+    ("-", params),
+    ("U/(omega*D), F/(rho*D**4*omega**2)", params),
+    ("-", {**params, "strict_syntax": True}),
+]
+
+
+def create_submissions(number_of_submissions):
+    submissions = []
+    for _ in range(number_of_submissions):
+        answer, task_params = random.choice(tasks)
+        submissions.append((random.choice(distinct_responses), answer, task_params))
+    return submissions
+
+
+def grade_in_process(submissions):
+    results = []
+    for (response, answer, task_params) in submissions:
+        try:
+            results.append(evaluation_function(response, answer, task_params))
+        except Exception as e:
+            results.append({"error": {"message": str(e)}})
+    return results
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    number_of_submissions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    submissions = create_submissions(number_of_submissions)
+    print(f"{number_of_submissions} responses to {len(tasks)} tasks, {os.cpu_count()} CPUs")
+    start = time.perf_counter()
+    expected = grade_in_process(submissions)
+    baseline = time.perf_counter()-start
+    print(f"{'in process':>12} {number_of_submissions/baseline:10.0f} responses/s")
+    for processes in range(1, (os.cpu_count() or 1)+1):
+        start = time.perf_counter()
+        results = grade_in_parallel(submissions, processes=processes)
+        elapsed = time.perf_counter()-start
+        assert results == expected
+        print(f"{processes:>3} workers {number_of_submissions/elapsed:10.0f} responses/s {baseline/elapsed:6.2f}x")
@@ -0,0 +1,66 @@
+"""
+Compares the fraction-free rank computation in `matrix_utilities` with sympy's
+`Matrix.rank` on rank deficient matrices with small rational entries, like
+the exponent matrices used in `determine_validity`.
+
+Run from the repository root with:
+    python -m benchmarks.rank_benchmark
+"""
+import random
+import signal
+import timeit
+
+from sympy import Matrix, Rational
+
+from app.matrix_utilities import bareiss_rank, integer_rows, matrix_rank, cached_bareiss_rank
+
+# Sympy gets very slow for the larger matrices, give up timing it after this many seconds
+sympy_time_limit = 30
+
+
+class SympyTimeout(BaseException):
+    # Not an Exception subclass since sympy catches and ignores those in places
+    pass
+
+
+def raise_timeout(signum, frame):
+    raise SympyTimeout()
+
+
+def random_exponent_matrix(size):
+    rank = max(1, size-size//3)
+    basis = [[Rational(random.randint(-4, 4), random.choice([1, 1, 1, 2, 3])) for _ in range(size)] for _ in range(rank)]
+    rows = []
+    for _ in range(size):
+        coefficients = [random.randint(-2, 2) for _ in basis]
+        rows.append([sum(c*b[j] for (c, b) in zip(coefficients, basis)) for j in range(size)])
+    return Matrix(rows)
+
+
+def time_sympy_rank(matrix, number):
+    signal.signal(signal.SIGALRM, raise_timeout)
+    signal.alarm(sympy_time_limit)
+    try:
+        assert matrix.rank() == matrix_rank(matrix)
+        return timeit.timeit(matrix.rank, number=number)/number
+    except SympyTimeout:
+        return None
+    finally:
+        signal.alarm(0)
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"{'size':>6} {'sympy':>12} {'bareiss':>12} {'memoized':>12} {'speedup':>9}")
+    for size in [3, 5, 10, 15, 20, 25, 30]:
+        matrix = random_exponent_matrix(size)
+        number = max(1, 100//size)
+        sympy_time = time_sympy_rank(matrix, number)
+        bareiss_time = timeit.timeit(lambda: bareiss_rank(integer_rows(matrix.tolist())), number=number)/number
+        cached_bareiss_rank.cache_clear()
+        memoized_time = timeit.timeit(lambda: matrix_rank(matrix), number=number)/number
+        if sympy_time is None:
+            sympy_column, speedup_column = f"> {sympy_time_limit} s", "-"
+        else:
+            sympy_column, speedup_column = f"{1e6*sympy_time:10.1f}us", f"{sympy_time/bareiss_time:8.1f}x"
+        print(f"{size:>4}x{size:<2}{sympy_column:>12} {1e6*bareiss_time:10.1f}us {1e6*memoized_time:10.1f}us {speedup_column:>9}")
@@ -0,0 +1,87 @@
+"""
+Measures cold start cost: the time taken by `import app.evaluation` and the
+resident memory of the process afterwards, each in a fresh interpreter.
+
+"eager unit tables" also imports static_unit_conversion_arrays.py, which is
+what `import app.evaluation` did before the unit tables were loaded lazily.
+"  + load latex parser" imports latex2sympy2, which is only done for tasks with
+`is_latex` set (and which `import app.evaluation` used to do unconditionally).
+
+The second table splits the import time by top level package, using the self
+times reported by `python -X importtime`.
+The first argument sets the number of repeats (default 5).
+Run from the repository root with:
+    python -m benchmarks.startup_benchmark
+"""
+import statistics
+import subprocess
+import sys
+
+scenarios = {
+    "import app.evaluation": "import app.evaluation",
+    "  + load unit tables": "import app.evaluation; app.unit_tables.get_unit_index()",
+    "  + load latex parser": "import app.evaluation; app.preview.load_latex_parser()",
+    "eager unit tables": "import app.evaluation; import app.static_unit_conversion_arrays",
+}
+
+breakdown_statement = "import app.evaluation; app.preview.load_latex_parser()"
+
+measurement = """
+import resource, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter()-start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(statement, repeats):
+    times, memory = [], []
+    for _ in range(repeats):
+        # -B: do not use cached bytecode, as on a fresh container
+        output = subprocess.run(
+            [sys.executable, "-B", "-c", measurement.format(statement=statement)],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        times.append(float(output[0]))
+        memory.append(int(output[1]))
+    return statistics.median(times), statistics.median(memory)
+
+
+def import_times_by_package(statement):
+    # Each line of -X importtime output is "import time: self | cumulative | name",
+    # summing self times gives the time spent in each package excluding its dependencies
+    output = subprocess.run(
+        [sys.executable, "-B", "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    ).stderr
+    totals = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        totals[package] = totals.get(package, 0)+int(self_time)
+    return totals
+
+
+def median_import_times_by_package(statement, repeats):
+    runs = [import_times_by_package(statement) for _ in range(repeats)]
+    packages = set().union(*runs)
+    return {package: statistics.median(run.get(package, 0) for run in runs) for package in packages}
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'scenario':28s} {'time':>10s} {'max RSS':>10s}")
+    for name, statement in scenarios.items():
+        elapsed, memory = measure(statement, repeats)
+        print(f"{name:28s} {1e3*elapsed:8.1f}ms {memory/1024:8.1f}MB")
+    print()
+    print(f"import time by package for: {breakdown_statement}")
+    totals = median_import_times_by_package(breakdown_statement, repeats)
+    dependencies = ["sympy", "mpmath", "latex2sympy2", "antlr4", "app"]
+    other = sum(time for (package, time) in totals.items() if package not in dependencies)
+    for package in dependencies:
+        print(f"{package:28s} {totals.get(package, 0)/1e3:8.1f}ms")
+    print(f"{'other (standard library)':28s} {other/1e3:8.1f}ms")
@@ -0,0 +1,98 @@
+"""
+Compares the compiled substitution matcher in `expression_utilities` with the
+original character-by-character implementation of `substitute` on the unit
+conversion tables, and both with looking up each name in the unit index with
+`convert_units_to_dimensions`.
+
+Run from the repository root with:
+    python -m benchmarks.substitution_benchmark
+"""
+import timeit
+
+from app.expression_utilities import substitute, compile_substitutions, SubstitutionMatcher
+from app.unit_tables import convert_units_to_dimensions
+from app.unit_system_conversions import convert_SI_base_units_to_dimensions, convert_SI_base_units_to_dimensions_short_form
+
+
+def legacy_substitute(string, substitutions):
+    # Implementation of `substitute` before substitutions were compiled
+    new_string = []
+    index = 0
+    string_buffer = ""
+    while index < len(string):
+        matched_start = False
+        for k, pair in enumerate(substitutions):
+            if isinstance(pair[0], tuple):
+                match = False
+                for look_ahead in pair[0][1]:
+                    if string.startswith(pair[0][0]+look_ahead, index):
+                        match = True
+                        break
+                substitution_length = len(pair[0][0])
+            else:
+                match = string.startswith(pair[0], index)
+                substitution_length = len(pair[0])
+            if match:
+                matched_start = True
+                if len(string_buffer) > 0:
+                    new_string.append(string_buffer)
+                    string_buffer = ""
+                new_string.append(k)
+                index += substitution_length
+                break
+        if not matched_start:
+            string_buffer += string[index]
+            index += 1
+    if len(string_buffer) > 0:
+        new_string.append(string_buffer)
+    for k, elem in enumerate(new_string):
+        if isinstance(elem, int):
+            new_string[k] = substitutions[elem][1]
+    return "".join(new_string)
+
+
+quantity_dimensions = [
+    "(gram*metre*second**(-2))",
+    "(metre/second)",
+    "(kilogram/(metre**3))",
+    "(newton*metre)",
+    "(pascal*second)",
+    "(joule/(kelvin*mole))",
+    "(watt/(metre*kelvin))",
+    "(volt*ampere*hour)",
+    "(mile/hour)",
+    "(kN*m/s**2)",
+]
+
+
+def run_passes(tables, apply):
+    for dimension in quantity_dimensions:
+        for table in tables:
+            dimension = apply(dimension, table)
+
+
+def benchmark(name, tables, number=200):
+    compiled_tables = [compile_substitutions(table) for table in tables]
+    for dimension in quantity_dimensions:
+        legacy, compiled = dimension, dimension
+        for table, compiled_table in zip(tables, compiled_tables):
+            legacy = legacy_substitute(legacy, table)
+            compiled = substitute(compiled, compiled_table)
+        assert legacy == compiled, (dimension, legacy, compiled)
+    legacy_time = timeit.timeit(lambda: run_passes(tables, legacy_substitute), number=number)
+    compiled_time = timeit.timeit(lambda: run_passes(compiled_tables, substitute), number=number)
+    compile_time = timeit.timeit(lambda: [SubstitutionMatcher(table) for table in tables], number=10)/10
+    entries = sum(len(table) for table in tables)
+    print(f"{name} ({len(tables)} passes, {entries} entries)")
+    print(f"    legacy:   {1e6*legacy_time/(number*len(quantity_dimensions)):10.1f} us/quantity")
+    print(f"    compiled: {1e6*compiled_time/(number*len(quantity_dimensions)):10.1f} us/quantity")
+    print(f"    speedup:  {legacy_time/compiled_time:10.1f}x")
+    print(f"    one-off compilation: {1e3*compile_time:.2f} ms")
+
+
+if __name__ == "__main__":
+    for (table, number) in [(convert_SI_base_units_to_dimensions, 200), (convert_SI_base_units_to_dimensions_short_form, 20)]:
+        benchmark(table.__name__, table(), number=number)
+    index_time = timeit.timeit(lambda: [convert_units_to_dimensions(dimension, short_forms=True) for dimension in quantity_dimensions], number=200)
+    print("unit index with short forms (1 pass)")
+    print(f"    lookup:   {1e6*index_time/(200*len(quantity_dimensions)):10.1f} us/quantity")